@@ -0,0 +1,1004 @@
+import hashlib
+import itertools
+import json
+import sqlite3
+import struct
+import time
+import TypesVersion
+
+DEFAULT_FILENAME = 'db/types.sqlite'
+
+def version_string(tool):
+    return "%s (%s)\nversion %s\nCopyright (C) %s  %s" % (
+        tool,
+        TypesVersion.DESCRIPTION, TypesVersion.VERSION,
+        TypesVersion.YEAR, TypesVersion.AUTHOR
+    )
+
+# Several tools may use the same database at the same time; a tool
+# that finds the database locked waits for at most BUSY_TIMEOUT seconds.
+# The C tools use the same limit.
+
+BUSY_TIMEOUT = 10 * 60
+
+def open_db(filename=DEFAULT_FILENAME):
+    conn = sqlite3.connect(filename, timeout=BUSY_TIMEOUT)
+    conn.execute('''PRAGMA foreign_keys = ON''')
+    return conn
+
+# In WAL mode, readers do not block the writer and the writer does not
+# block readers; writers still take turns. The mode is stored in the
+# database file, and it cannot be changed inside a transaction.
+
+def is_wal(conn):
+    r = conn.execute('''PRAGMA journal_mode''')
+    return list(r)[0][0].lower() == 'wal'
+
+def set_wal(conn, wal):
+    conn.commit()
+    mode = 'WAL' if wal else 'DELETE'
+    r = conn.execute('''PRAGMA journal_mode = %s''' % mode)
+    if list(r)[0][0].upper() != mode:
+        raise sqlite3.OperationalError('could not set journal mode %s' % mode)
+
+def table_is_empty(conn, table):
+    r = conn.execute('SELECT COUNT(0) FROM %s' % table)
+    n = [ i[0] for i in r ][0]
+    return n == 0
+
+RESULT_VIEWS = '''
+
+        CREATE VIEW IF NOT EXISTS view_result AS
+        SELECT dataset.corpuscode AS corpuscode,
+            dataset.datasetcode AS datasetcode,
+            collection.collectioncode AS collectioncode,
+            COALESCE(yw.wordcount, hw.wordcount, tw.wordcount) AS wordcount,
+            COALESCE(yt.tokencount, ht.tokencount, tw.tokencount) AS tokencount,
+            COALESCE(yw.typecount, yt.typecount) AS typecount,
+            COALESCE(hw.hapaxcount, ht.hapaxcount) AS hapaxcount
+        FROM dataset JOIN collection USING (corpuscode)
+        LEFT JOIN view_result_type_word AS yw USING (datasetcode, collectioncode, corpuscode)
+        LEFT JOIN view_result_type_token AS yt USING (datasetcode, collectioncode, corpuscode)
+        LEFT JOIN view_result_hapax_word AS hw USING (datasetcode, collectioncode, corpuscode)
+        LEFT JOIN view_result_hapax_token AS ht USING (datasetcode, collectioncode, corpuscode)
+        LEFT JOIN view_result_token_word AS tw USING (datasetcode, collectioncode, corpuscode)
+        ORDER BY corpuscode, datasetcode, collectioncode;
+
+        CREATE VIEW IF NOT EXISTS view_missing_curve AS
+        SELECT corpuscode, datasetcode, statcode, level, side
+        FROM dataset
+        JOIN defaultlevel
+        JOIN defaultstat
+        JOIN (SELECT 'lower' AS side UNION SELECT 'upper' AS side)
+        EXCEPT
+        SELECT corpuscode, datasetcode, statcode, level, side
+        FROM result_curve;
+
+        CREATE VIEW IF NOT EXISTS view_missing_p AS
+        SELECT corpuscode, datasetcode, collectioncode, statcode
+        FROM dataset
+        JOIN collection USING (corpuscode)
+        JOIN defaultstat
+        EXCEPT
+        SELECT corpuscode, datasetcode, collectioncode, statcode
+        FROM result_p;
+
+'''
+
+# With summary tables, view_result and the missing-work views read
+# tables that triggers keep up to date, instead of joining all data
+# sets, collections and statistics on each query; see SUMMARY_TABLES.
+
+SUMMARY_VIEWS = '''
+
+        CREATE VIEW IF NOT EXISTS view_result AS
+        SELECT corpuscode, datasetcode, collectioncode,
+            wordcount, tokencount, typecount, hapaxcount
+        FROM summary_result
+        ORDER BY corpuscode, datasetcode, collectioncode;
+
+        CREATE VIEW IF NOT EXISTS view_missing_curve AS
+        SELECT corpuscode, datasetcode, statcode, level, side
+        FROM summary_missing_curve;
+
+        CREATE VIEW IF NOT EXISTS view_missing_p AS
+        SELECT corpuscode, datasetcode, collectioncode, statcode
+        FROM summary_missing_p;
+
+'''
+
+# If summary, packed or grids is None, the database keeps its summary
+# tables, the layout of its curve points or its curve grids as it is.
+
+def create_if_needed(conn, summary=None, packed=None, grids=None):
+    current_packed = has_packed_curves(conn)
+    if packed is None:
+        packed = current_packed
+    drop_cell_grids(conn)
+    current_grids = has_curve_grids(conn)
+    if grids is None:
+        grids = current_grids
+    current = has_summary(conn)
+    if summary is None:
+        summary = current
+    if summary != current:
+        drop_summary(conn)
+    conn.executescript('''
+
+        CREATE TABLE IF NOT EXISTS label (
+            labelcode TEXT NOT NULL PRIMARY KEY,
+            labeltext TEXT NOT NULL
+        );
+
+        INSERT OR IGNORE INTO label (labelcode, labeltext) VALUES ('type', 'types');
+        INSERT OR IGNORE INTO label (labelcode, labeltext) VALUES ('hapax', 'hapaxes');
+        INSERT OR IGNORE INTO label (labelcode, labeltext) VALUES ('token', 'tokens');
+        INSERT OR IGNORE INTO label (labelcode, labeltext) VALUES ('word', 'running words');
+
+        CREATE TABLE IF NOT EXISTS stat (
+            statcode TEXT NOT NULL PRIMARY KEY,
+            y TEXT NOT NULL REFERENCES label(labelcode),
+            x TEXT NOT NULL REFERENCES label(labelcode)
+        );
+
+        INSERT OR IGNORE INTO stat (statcode, y, x) VALUES ('type-word',   'type',  'word');
+        INSERT OR IGNORE INTO stat (statcode, y, x) VALUES ('type-token',  'type',  'token');
+        INSERT OR IGNORE INTO stat (statcode, y, x) VALUES ('hapax-word',  'hapax', 'word');
+        INSERT OR IGNORE INTO stat (statcode, y, x) VALUES ('hapax-token', 'hapax', 'token');
+        INSERT OR IGNORE INTO stat (statcode, y, x) VALUES ('token-word',  'token', 'word');
+
+        CREATE TABLE IF NOT EXISTS defaultstat (
+            statcode TEXT NOT NULL PRIMARY KEY REFERENCES stat(statcode)
+        );
+
+        CREATE TABLE IF NOT EXISTS defaultlevel (
+            level REAL NOT NULL PRIMARY KEY
+        );
+
+        CREATE TABLE IF NOT EXISTS corpus (
+            corpuscode TEXT NOT NULL PRIMARY KEY,
+            description TEXT
+        );
+
+        CREATE TABLE IF NOT EXISTS dataset (
+            corpuscode TEXT NOT NULL REFERENCES corpus(corpuscode),
+            datasetcode TEXT NOT NULL,
+            description TEXT,
+            PRIMARY KEY (corpuscode, datasetcode)
+        );
+
+        CREATE TABLE IF NOT EXISTS sample (
+            corpuscode TEXT NOT NULL REFERENCES corpus(corpuscode),
+            samplecode TEXT NOT NULL,
+            wordcount INTEGER NOT NULL,
+            description TEXT,
+            link TEXT,
+            PRIMARY KEY (corpuscode, samplecode)
+        );
+
+        CREATE TABLE IF NOT EXISTS collection (
+            corpuscode TEXT NOT NULL REFERENCES corpus(corpuscode),
+            collectioncode TEXT NOT NULL,
+            groupcode TEXT,
+            description TEXT,
+            PRIMARY KEY (corpuscode, collectioncode)
+        );
+
+        CREATE TABLE IF NOT EXISTS sample_collection (
+            corpuscode TEXT NOT NULL,
+            samplecode TEXT NOT NULL,
+            collectioncode TEXT NOT NULL,
+            PRIMARY KEY (corpuscode, samplecode, collectioncode),
+            FOREIGN KEY (corpuscode, samplecode) REFERENCES sample(corpuscode, samplecode),
+            FOREIGN KEY (corpuscode, collectioncode) REFERENCES collection(corpuscode, collectioncode)
+        );
+
+        CREATE TABLE IF NOT EXISTS token (
+            corpuscode TEXT NOT NULL,
+            samplecode TEXT NOT NULL,
+            datasetcode TEXT NOT NULL,
+            tokencode TEXT NOT NULL,
+            tokencount INTEGER NOT NULL,
+            PRIMARY KEY (corpuscode, samplecode, datasetcode, tokencode),
+            FOREIGN KEY (corpuscode, datasetcode) REFERENCES dataset(corpuscode, datasetcode),
+            FOREIGN KEY (corpuscode, samplecode) REFERENCES sample(corpuscode, samplecode)
+        );
+
+        CREATE TABLE IF NOT EXISTS tokeninfo (
+            corpuscode TEXT NOT NULL,
+            datasetcode TEXT NOT NULL,
+            tokencode TEXT NOT NULL,
+            shortlabel TEXT,
+            longlabel TEXT,
+            PRIMARY KEY (corpuscode, datasetcode, tokencode),
+            FOREIGN KEY (corpuscode, datasetcode) REFERENCES dataset(corpuscode, datasetcode)
+        );
+
+        CREATE TABLE IF NOT EXISTS context (
+            corpuscode TEXT NOT NULL,
+            samplecode TEXT NOT NULL,
+            datasetcode TEXT NOT NULL,
+            tokencode TEXT NOT NULL,
+            before TEXT,
+            word TEXT,
+            after TEXT,
+            link TEXT,
+            FOREIGN KEY (corpuscode, datasetcode) REFERENCES dataset(corpuscode, datasetcode),
+            FOREIGN KEY (corpuscode, samplecode) REFERENCES sample(corpuscode, samplecode)
+        );
+
+        CREATE INDEX IF NOT EXISTS context_idx
+        ON context (corpuscode, samplecode, datasetcode, tokencode);
+
+        CREATE TABLE IF NOT EXISTS log (
+            id INTEGER PRIMARY KEY NOT NULL,
+            corpuscode TEXT NOT NULL,
+            datasetcode TEXT NOT NULL,
+            timestamp TEXT,
+            description TEXT,
+            FOREIGN KEY (corpuscode, datasetcode) REFERENCES dataset(corpuscode, datasetcode)
+        );
+
+        CREATE TABLE IF NOT EXISTS result_p (
+            id INTEGER PRIMARY KEY NOT NULL,
+            corpuscode TEXT NOT NULL,
+            datasetcode TEXT NOT NULL,
+            collectioncode TEXT NOT NULL,
+            statcode TEXT NOT NULL REFERENCES stat(statcode),
+            x INTEGER NOT NULL,
+            y INTEGER NOT NULL,
+            total INTEGER NOT NULL,
+            below INTEGER NOT NULL,
+            above INTEGER NOT NULL,
+            logid INTEGER NOT NULL REFERENCES log(id),
+            UNIQUE (corpuscode, datasetcode, collectioncode, statcode),
+            FOREIGN KEY (corpuscode, datasetcode) REFERENCES dataset(corpuscode, datasetcode),
+            FOREIGN KEY (corpuscode, collectioncode) REFERENCES collection(corpuscode, collectioncode)
+        );
+
+        CREATE TABLE IF NOT EXISTS result_q (
+            i INTEGER PRIMARY KEY NOT NULL,
+            n INTEGER NOT NULL,
+            corpuscode TEXT NOT NULL,
+            datasetcode TEXT NOT NULL,
+            collectioncode TEXT NOT NULL,
+            statcode TEXT NOT NULL REFERENCES stat(statcode),
+            side TEXT NOT NULL,
+            p REAL,
+            q REAL,
+            UNIQUE (corpuscode, datasetcode, collectioncode, statcode, side),
+            FOREIGN KEY (corpuscode, datasetcode) REFERENCES dataset(corpuscode, datasetcode),
+            FOREIGN KEY (corpuscode, collectioncode) REFERENCES collection(corpuscode, collectioncode)
+        );
+
+        CREATE TABLE IF NOT EXISTS result_q_pending (
+            p REAL
+        );
+
+        CREATE TABLE IF NOT EXISTS result_curve (
+            id INTEGER PRIMARY KEY NOT NULL,
+            corpuscode TEXT NOT NULL,
+            datasetcode TEXT NOT NULL,
+            statcode TEXT NOT NULL REFERENCES stat(statcode),
+            level REAL NOT NULL,
+            side TEXT NOT NULL,
+            xslots INTEGER NOT NULL,
+            yslots INTEGER NOT NULL,
+            iterations INTEGER NOT NULL,
+            logid INTEGER NOT NULL REFERENCES log(id),
+            UNIQUE (corpuscode, datasetcode, statcode, level, side),
+            FOREIGN KEY (corpuscode, datasetcode) REFERENCES dataset(corpuscode, datasetcode)
+        );
+
+        CREATE TABLE IF NOT EXISTS input_digest (
+            corpuscode TEXT NOT NULL,
+            datasetcode TEXT NOT NULL,
+            statcode TEXT NOT NULL REFERENCES stat(statcode),
+            kind TEXT NOT NULL,
+            digest TEXT NOT NULL,
+            input TEXT,
+            dirty INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (corpuscode, datasetcode, statcode, kind),
+            FOREIGN KEY (corpuscode, datasetcode) REFERENCES dataset(corpuscode, datasetcode)
+        );
+
+        CREATE INDEX IF NOT EXISTS log_dataset_idx
+        ON log (corpuscode, datasetcode);
+
+        CREATE INDEX IF NOT EXISTS result_p_log_idx
+        ON result_p (logid);
+
+        CREATE INDEX IF NOT EXISTS result_curve_log_idx
+        ON result_curve (logid);
+
+        CREATE VIEW IF NOT EXISTS view_corpus AS
+        SELECT corpuscode, COUNT(0) AS samplecount
+        FROM sample
+        GROUP BY corpuscode;
+
+        CREATE VIEW IF NOT EXISTS view_result_type_word AS
+        SELECT corpuscode, datasetcode, collectioncode, y AS typecount, x AS wordcount
+        FROM result_p
+        WHERE statcode = 'type-word'
+        ORDER BY corpuscode, datasetcode, collectioncode;
+
+        CREATE VIEW IF NOT EXISTS view_result_type_token AS
+        SELECT corpuscode, datasetcode, collectioncode, y AS typecount, x AS tokencount
+        FROM result_p
+        WHERE statcode = 'type-token'
+        ORDER BY corpuscode, datasetcode, collectioncode;
+
+        CREATE VIEW IF NOT EXISTS view_result_hapax_word AS
+        SELECT corpuscode, datasetcode, collectioncode, y AS hapaxcount, x AS wordcount
+        FROM result_p
+        WHERE statcode = 'hapax-word'
+        ORDER BY corpuscode, datasetcode, collectioncode;
+
+        CREATE VIEW IF NOT EXISTS view_result_hapax_token AS
+        SELECT corpuscode, datasetcode, collectioncode, y AS hapaxcount, x AS tokencount
+        FROM result_p
+        WHERE statcode = 'hapax-token'
+        ORDER BY corpuscode, datasetcode, collectioncode;
+
+        CREATE VIEW IF NOT EXISTS view_result_token_word AS
+        SELECT corpuscode, datasetcode, collectioncode, y AS tokencount, x AS wordcount
+        FROM result_p
+        WHERE statcode = 'token-word'
+        ORDER BY corpuscode, datasetcode, collectioncode;
+
+    ''')
+    if (table_is_empty(conn, 'defaultstat')):
+        conn.executescript('''
+            INSERT OR IGNORE INTO defaultstat (statcode) VALUES ('type-word');
+            INSERT OR IGNORE INTO defaultstat (statcode) VALUES ('type-token');
+        ''')
+    if (table_is_empty(conn, 'defaultlevel')):
+        conn.executescript('''
+            INSERT OR IGNORE INTO defaultlevel (level) VALUES (0.0001);
+            INSERT OR IGNORE INTO defaultlevel (level) VALUES (0.001);
+            INSERT OR IGNORE INTO defaultlevel (level) VALUES (0.01);
+            INSERT OR IGNORE INTO defaultlevel (level) VALUES (0.1);
+        ''')
+    create_input_triggers(conn)
+    create_result_triggers(conn)
+    if packed:
+        if not current_packed:
+            pack_curves(conn)
+        conn.executescript(PACKED_CURVES)
+    elif current_packed:
+        unpack_curves(conn)
+    else:
+        conn.executescript(CURVE_POINTS)
+    if grids:
+        conn.executescript(CURVE_GRIDS)
+    elif current_grids:
+        conn.execute('DROP TABLE result_curve_grid')
+    if summary:
+        create_summary(conn)
+        conn.executescript(SUMMARY_VIEWS)
+    else:
+        conn.executescript(RESULT_VIEWS)
+
+# Each row of input_digest also keeps the digest of the input data
+# alone; the triggers mark the rows of a data set dirty whenever its
+# input data changes, so that the data has to be hashed again only
+# for the data sets that are dirty. Columns input and dirty were added
+# later; in rows of older databases, input is NULL.
+
+TRIGGER_EVENTS = [
+    ('insert', 'INSERT', ['NEW']),
+    ('delete', 'DELETE', ['OLD']),
+    ('update', 'UPDATE', ['OLD', 'NEW']),
+]
+
+INPUT_SOURCES = [
+    ('sample', ('corpuscode',)),
+    ('collection', ('corpuscode',)),
+    ('sample_collection', ('corpuscode',)),
+    ('token', ('corpuscode', 'datasetcode')),
+]
+
+def create_input_triggers(conn):
+    columns = [ i[1] for i in conn.execute('PRAGMA table_info(input_digest)') ]
+    if 'input' not in columns:
+        conn.execute('ALTER TABLE input_digest ADD COLUMN input TEXT')
+    if 'dirty' not in columns:
+        conn.execute('ALTER TABLE input_digest ADD COLUMN dirty INTEGER NOT NULL DEFAULT 0')
+    for source, key in INPUT_SOURCES:
+        for event, what, rows in TRIGGER_EVENTS:
+            body = ''.join('''
+                UPDATE input_digest SET dirty = 1 WHERE %s AND dirty = 0;
+            ''' % ' AND '.join('%s = %s.%s' % (c, row, c) for c in key) for row in rows)
+            conn.execute('''
+                CREATE TRIGGER IF NOT EXISTS input_%s_%s
+                AFTER %s ON %s
+                BEGIN %s END
+            ''' % (source, event, what, source, body))
+
+def drop_views(conn):
+    conn.executescript('''
+        DROP VIEW IF EXISTS view_result;
+        DROP VIEW IF EXISTS view_result_type_word;
+        DROP VIEW IF EXISTS view_result_type_token;
+        DROP VIEW IF EXISTS view_result_hapax_word;
+        DROP VIEW IF EXISTS view_result_hapax_token;
+        DROP VIEW IF EXISTS view_result_token_word;
+        DROP VIEW IF EXISTS view_missing_p;
+        DROP VIEW IF EXISTS view_missing_curve;
+        DROP VIEW IF EXISTS view_collection_dataset_full;
+        DROP VIEW IF EXISTS view_collection_dataset;
+        DROP VIEW IF EXISTS view_collection;
+        DROP VIEW IF EXISTS view_dataset_full;
+        DROP VIEW IF EXISTS view_dataset;
+        DROP VIEW IF EXISTS view_corpus;
+        DROP VIEW IF EXISTS view_q;
+        DROP VIEW IF EXISTS view_p2;
+        DROP VIEW IF EXISTS view_p;
+    ''')
+
+# Summary tables are materialised copies of view_result and of the
+# missing-work views. Each table is given as its columns, a query
+# that computes its contents, and its indexes; the query is also
+# used to recompute the part of the table that a change of a row in
+# one of the SUMMARY_SOURCES affects, and the indexes make it cheap
+# to find the parts that a change of a collection affects.
+
+SUMMARY_TABLES = [
+    ('summary_result', '''
+        corpuscode TEXT NOT NULL,
+        datasetcode TEXT NOT NULL,
+        collectioncode TEXT NOT NULL,
+        wordcount INTEGER,
+        tokencount INTEGER,
+        typecount INTEGER,
+        hapaxcount INTEGER,
+        PRIMARY KEY (corpuscode, datasetcode, collectioncode)
+    ''', '''
+        SELECT d.corpuscode AS corpuscode,
+            d.datasetcode AS datasetcode,
+            c.collectioncode AS collectioncode,
+            COALESCE(yw.x, hw.x, tw.x) AS wordcount,
+            COALESCE(yt.x, ht.x, tw.y) AS tokencount,
+            COALESCE(yw.y, yt.y) AS typecount,
+            COALESCE(hw.y, ht.y) AS hapaxcount
+        FROM dataset AS d
+        JOIN collection AS c ON c.corpuscode = d.corpuscode
+        LEFT JOIN result_p AS yw ON yw.corpuscode = d.corpuscode AND yw.datasetcode = d.datasetcode
+            AND yw.collectioncode = c.collectioncode AND yw.statcode = 'type-word'
+        LEFT JOIN result_p AS yt ON yt.corpuscode = d.corpuscode AND yt.datasetcode = d.datasetcode
+            AND yt.collectioncode = c.collectioncode AND yt.statcode = 'type-token'
+        LEFT JOIN result_p AS hw ON hw.corpuscode = d.corpuscode AND hw.datasetcode = d.datasetcode
+            AND hw.collectioncode = c.collectioncode AND hw.statcode = 'hapax-word'
+        LEFT JOIN result_p AS ht ON ht.corpuscode = d.corpuscode AND ht.datasetcode = d.datasetcode
+            AND ht.collectioncode = c.collectioncode AND ht.statcode = 'hapax-token'
+        LEFT JOIN result_p AS tw ON tw.corpuscode = d.corpuscode AND tw.datasetcode = d.datasetcode
+            AND tw.collectioncode = c.collectioncode AND tw.statcode = 'token-word'
+    ''', [
+        ('summary_result_collection_idx', 'corpuscode, collectioncode'),
+    ]),
+    ('summary_missing_curve', '''
+        corpuscode TEXT NOT NULL,
+        datasetcode TEXT NOT NULL,
+        statcode TEXT NOT NULL,
+        level REAL NOT NULL,
+        side TEXT NOT NULL,
+        PRIMARY KEY (corpuscode, datasetcode, statcode, level, side)
+    ''', '''
+        SELECT d.corpuscode AS corpuscode,
+            d.datasetcode AS datasetcode,
+            s.statcode AS statcode,
+            l.level AS level,
+            t.side AS side
+        FROM dataset AS d
+        JOIN defaultlevel AS l
+        JOIN defaultstat AS s
+        JOIN (SELECT 'lower' AS side UNION SELECT 'upper' AS side) AS t
+        WHERE NOT EXISTS (
+            SELECT 1 FROM result_curve AS r
+            WHERE r.corpuscode = d.corpuscode AND r.datasetcode = d.datasetcode
+            AND r.statcode = s.statcode AND r.level = l.level AND r.side = t.side
+        )
+    ''', []),
+    ('summary_missing_p', '''
+        corpuscode TEXT NOT NULL,
+        datasetcode TEXT NOT NULL,
+        collectioncode TEXT NOT NULL,
+        statcode TEXT NOT NULL,
+        PRIMARY KEY (corpuscode, datasetcode, collectioncode, statcode)
+    ''', '''
+        SELECT d.corpuscode AS corpuscode,
+            d.datasetcode AS datasetcode,
+            c.collectioncode AS collectioncode,
+            s.statcode AS statcode
+        FROM dataset AS d
+        JOIN collection AS c ON c.corpuscode = d.corpuscode
+        JOIN defaultstat AS s
+        WHERE NOT EXISTS (
+            SELECT 1 FROM result_p AS r
+            WHERE r.corpuscode = d.corpuscode AND r.datasetcode = d.datasetcode
+            AND r.collectioncode = c.collectioncode AND r.statcode = s.statcode
+        )
+    ''', [
+        ('summary_missing_p_collection_idx', 'corpuscode, collectioncode'),
+    ]),
+]
+
+# For each table that the summary tables depend on: which summary
+# tables a change of a row affects, and the columns that identify
+# the affected part of the summary table.
+
+SUMMARY_SOURCES = [
+    ('dataset', [
+        ('summary_result', ('corpuscode', 'datasetcode')),
+        ('summary_missing_curve', ('corpuscode', 'datasetcode')),
+        ('summary_missing_p', ('corpuscode', 'datasetcode')),
+    ]),
+    ('collection', [
+        ('summary_result', ('corpuscode', 'collectioncode')),
+        ('summary_missing_p', ('corpuscode', 'collectioncode')),
+    ]),
+    ('defaultstat', [
+        ('summary_missing_curve', ('statcode',)),
+        ('summary_missing_p', ('statcode',)),
+    ]),
+    ('defaultlevel', [
+        ('summary_missing_curve', ('level',)),
+    ]),
+    ('result_p', [
+        ('summary_result', ('corpuscode', 'datasetcode', 'collectioncode')),
+        ('summary_missing_p', ('corpuscode', 'datasetcode', 'collectioncode', 'statcode')),
+    ]),
+    ('result_curve', [
+        ('summary_missing_curve', ('corpuscode', 'datasetcode', 'statcode', 'level', 'side')),
+    ]),
+]
+
+def has_summary(conn):
+    r = conn.execute('''
+        SELECT COUNT(0) FROM sqlite_master
+        WHERE type = 'table' AND name = 'summary_result'
+    ''')
+    return list(r)[0][0] > 0
+
+def summary_update(table, columns, row):
+    query = [ t[2] for t in SUMMARY_TABLES if t[0] == table ][0]
+    where = ' AND '.join('%s = %s.%s' % (c, row, c) for c in columns)
+    return '''
+        DELETE FROM %s WHERE %s;
+        INSERT INTO %s SELECT * FROM (%s) WHERE %s;
+    ''' % (table, where, table, query, where)
+
+def create_summary(conn):
+    new = not has_summary(conn)
+    for table, columns, query, indexes in SUMMARY_TABLES:
+        conn.execute('CREATE TABLE IF NOT EXISTS %s (%s) WITHOUT ROWID' % (table, columns))
+        for index, key in indexes:
+            conn.execute('CREATE INDEX IF NOT EXISTS %s ON %s (%s)' % (index, table, key))
+    for source, targets in SUMMARY_SOURCES:
+        for event, what, rows in TRIGGER_EVENTS:
+            body = ''.join(
+                summary_update(table, columns, row)
+                for row in rows for table, columns in targets
+            )
+            conn.execute('''
+                CREATE TRIGGER IF NOT EXISTS summary_%s_%s
+                AFTER %s ON %s
+                BEGIN %s END
+            ''' % (source, event, what, source, body))
+    if new:
+        refresh_summary(conn)
+
+def refresh_summary(conn):
+    if not has_summary(conn):
+        return
+    for table, columns, query, indexes in SUMMARY_TABLES:
+        conn.execute('DELETE FROM %s' % table)
+        conn.execute('INSERT INTO %s %s' % (table, query))
+
+def drop_summary(conn):
+    conn.executescript('''
+        DROP VIEW IF EXISTS view_result;
+        DROP VIEW IF EXISTS view_missing_p;
+        DROP VIEW IF EXISTS view_missing_curve;
+    ''')
+    for source, targets in SUMMARY_SOURCES:
+        for event, what, rows in TRIGGER_EVENTS:
+            conn.execute('DROP TRIGGER IF EXISTS summary_%s_%s' % (source, event))
+    for table, columns, query, indexes in SUMMARY_TABLES:
+        conn.execute('DROP TABLE IF EXISTS %s' % table)
+
+CURVE_POINTS = '''
+
+        CREATE TABLE IF NOT EXISTS result_curve_point (
+            curveid INTEGER NOT NULL REFERENCES result_curve(id),
+            x INTEGER NOT NULL,
+            y INTEGER NOT NULL,
+            PRIMARY KEY (curveid, x)
+        );
+
+'''
+
+# With packed curves, the points of each curve are one row of
+# result_curve_data: the deltas of the x coordinates followed by the
+# deltas of the y coordinates, as 32-bit little-endian integers, which
+# is also the encoding of "types-web --compact". result_curve_point is
+# then a view that unpacks the points; deleting any point of a curve
+# through the view deletes all points of the curve. The coordinates are
+# unsigned 32-bit values, like in types-comp, and the deltas are taken
+# modulo 2^32; hence a delta is never out of range, even if it is the
+# first coordinate itself or a y coordinate goes down.
+
+def unpack_uint32(h, offset):
+    digits = [
+        "(INSTR('0123456789ABCDEF', SUBSTR(%s, %d, 1)) - 1)" % (h, offset + i + 1)
+        for i in range(8)
+    ]
+    value = ' + '.join(
+        '(%s * 16 + %s) * %d' % (digits[2*i], digits[2*i+1], 256 ** i)
+        for i in range(4)
+    )
+    return '(%s)' % value
+
+CURVE_DATA = '''
+
+        CREATE TABLE IF NOT EXISTS result_curve_data (
+            curveid INTEGER PRIMARY KEY NOT NULL REFERENCES result_curve(id),
+            points BLOB NOT NULL
+        );
+
+'''
+
+PACKED_CURVES = '''
+
+        CREATE VIEW IF NOT EXISTS result_curve_point AS
+        WITH RECURSIVE seq(i) AS (
+            SELECT 0
+            UNION ALL
+            SELECT i + 1 FROM seq
+            WHERE i + 1 < (SELECT MAX(LENGTH(points)) / 8 FROM result_curve_data)
+        ),
+        delta(curveid, i, hx, hy) AS (
+            SELECT curveid, i,
+                HEX(SUBSTR(points, 4 * i + 1, 4)),
+                HEX(SUBSTR(points, 4 * (LENGTH(points) / 8 + i) + 1, 4))
+            FROM result_curve_data
+            JOIN seq ON i < LENGTH(points) / 8
+        )
+        SELECT curveid,
+            SUM(%s) OVER w %% 4294967296 AS x,
+            SUM(%s) OVER w %% 4294967296 AS y
+        FROM delta
+        WINDOW w AS (PARTITION BY curveid ORDER BY i);
+
+        CREATE TRIGGER IF NOT EXISTS result_curve_point_delete
+        INSTEAD OF DELETE ON result_curve_point
+        BEGIN
+            DELETE FROM result_curve_data WHERE curveid = OLD.curveid;
+        END;
+
+''' % (unpack_uint32('hx', 0), unpack_uint32('hy', 0))
+
+def pack_curve(points):
+    x = [ p[0] for p in points ]
+    y = [ p[1] for p in points ]
+    for v in x + y:
+        if not 0 <= v < 2 ** 32:
+            raise ValueError('curve coordinate %d is out of range' % v)
+    deltas = [ (b - a) % 2 ** 32 for a, b in zip([0] + x, x) ] + [ (b - a) % 2 ** 32 for a, b in zip([0] + y, y) ]
+    return struct.pack('<%dI' % len(deltas), *deltas)
+
+def unpack_curve(blob):
+    deltas = struct.unpack('<%dI' % (len(blob) // 4), blob)
+    n = len(deltas) // 2
+    x = [ v % 2 ** 32 for v in itertools.accumulate(deltas[:n]) ]
+    y = [ v % 2 ** 32 for v in itertools.accumulate(deltas[n:]) ]
+    return list(zip(x, y))
+
+def has_packed_curves(conn):
+    r = conn.execute('''
+        SELECT COUNT(0) FROM sqlite_master
+        WHERE type = 'table' AND name = 'result_curve_data'
+    ''')
+    return list(r)[0][0] > 0
+
+def pack_curves(conn):
+    conn.execute(CURVE_DATA)
+    r = conn.execute('''
+        SELECT COUNT(0) FROM sqlite_master
+        WHERE type = 'table' AND name = 'result_curve_point'
+    ''')
+    if list(r)[0][0] == 0:
+        return
+    r = conn.execute('SELECT curveid, x, y FROM result_curve_point ORDER BY curveid, x')
+    conn.executemany(
+        'INSERT INTO result_curve_data (curveid, points) VALUES (?, ?)',
+        (
+            (curveid, pack_curve([ (x, y) for c, x, y in rows ]))
+            for curveid, rows in itertools.groupby(r, lambda row: row[0])
+        )
+    )
+    conn.execute('DROP TABLE result_curve_point')
+
+def unpack_curves(conn):
+    conn.execute('DROP VIEW IF EXISTS result_curve_point')
+    conn.execute(CURVE_POINTS)
+    r = conn.execute('SELECT curveid, points FROM result_curve_data ORDER BY curveid')
+    conn.executemany(
+        'INSERT INTO result_curve_point (curveid, x, y) VALUES (?, ?, ?)',
+        (
+            (curveid, x, y)
+            for curveid, points in r
+            for x, y in unpack_curve(points)
+        )
+    )
+    conn.execute('DROP TABLE result_curve_data')
+
+# With curve grids, types-store also keeps the grid from which it
+# computed the curves of each statistic, so that curves for new levels
+# can be derived later without new permutations. Each grid is one
+# blob; see types-store. Grids are large, and they are only kept if
+# the database was set up with "types-db-init --curve-grids".
+
+CURVE_GRIDS = '''
+
+        CREATE TABLE IF NOT EXISTS result_curve_grid (
+            id INTEGER PRIMARY KEY NOT NULL,
+            corpuscode TEXT NOT NULL,
+            datasetcode TEXT NOT NULL,
+            statcode TEXT NOT NULL REFERENCES stat(statcode),
+            xslots INTEGER NOT NULL,
+            yslots INTEGER NOT NULL,
+            iterations INTEGER NOT NULL,
+            cells BLOB NOT NULL,
+            logid INTEGER NOT NULL REFERENCES log(id),
+            UNIQUE (corpuscode, datasetcode, statcode),
+            FOREIGN KEY (corpuscode, datasetcode) REFERENCES dataset(corpuscode, datasetcode)
+        );
+
+'''
+
+def has_curve_grids(conn):
+    r = conn.execute('''
+        SELECT COUNT(0) FROM sqlite_master
+        WHERE type = 'table' AND name = 'result_curve_grid'
+    ''')
+    return list(r)[0][0] > 0
+
+# Earlier versions stored every grid, one row of result_curve_cell
+# per cell. The grids can be recalculated, and they are dropped.
+
+def drop_cell_grids(conn):
+    r = conn.execute('''
+        SELECT COUNT(0) FROM sqlite_master
+        WHERE type = 'table' AND name = 'result_curve_cell'
+    ''')
+    if list(r)[0][0] > 0:
+        conn.execute('DROP TABLE result_curve_cell')
+        conn.execute('DROP TABLE IF EXISTS result_curve_grid')
+
+def delete_corpus(conn, corpuscode):
+    points = 'result_curve_data' if has_packed_curves(conn) else 'result_curve_point'
+    conn.execute('DELETE FROM %s WHERE curveid IN (SELECT id FROM result_curve WHERE corpuscode = ?)' % points, (corpuscode,))
+    conn.execute('DELETE FROM result_curve WHERE corpuscode = ?', (corpuscode,))
+    if has_curve_grids(conn):
+        conn.execute('DELETE FROM result_curve_grid WHERE corpuscode = ?', (corpuscode,))
+    conn.execute('DELETE FROM result_q WHERE corpuscode = ?', (corpuscode,))
+    conn.execute('DELETE FROM result_p WHERE corpuscode = ?', (corpuscode,))
+    conn.execute('DELETE FROM input_digest WHERE corpuscode = ?', (corpuscode,))
+    conn.execute('DELETE FROM log WHERE corpuscode = ?', (corpuscode,))
+    conn.execute('DELETE FROM token WHERE corpuscode = ?', (corpuscode,))
+    conn.execute('DELETE FROM sample_collection WHERE corpuscode = ?', (corpuscode,))
+    conn.execute('DELETE FROM collection WHERE corpuscode = ?', (corpuscode,))
+    conn.execute('DELETE FROM sample WHERE corpuscode = ?', (corpuscode,))
+    conn.execute('DELETE FROM dataset WHERE corpuscode = ?', (corpuscode,))
+    conn.execute('DELETE FROM corpus WHERE corpuscode = ?', (corpuscode,))
+
+def create_corpus(conn, corpuscode, description):
+    conn.execute(
+        'INSERT INTO corpus (corpuscode, description) VALUES (?, ?)',
+        ( corpuscode, description )
+    )
+
+def delete_collection(conn, corpuscode, collectioncode):
+    conn.execute('DELETE FROM result_p WHERE corpuscode = ? AND collectioncode = ?', (corpuscode, collectioncode))
+    conn.execute('DELETE FROM sample_collection WHERE corpuscode = ? AND collectioncode = ?', (corpuscode, collectioncode))
+    conn.execute('DELETE FROM collection WHERE corpuscode = ? AND collectioncode = ?', (corpuscode, collectioncode))
+
+def create_collection(conn, corpuscode, groupcode, collectioncode, description):
+    conn.execute(
+        'INSERT INTO collection (corpuscode, groupcode, collectioncode, description) VALUES (?, ?, ?, ?)',
+        (corpuscode, groupcode, collectioncode, description)
+    )
+
+BULK_TABLES = [
+    ('corpus', 'corpora', ('corpuscode', 'description')),
+    ('dataset', 'datasets', ('corpuscode', 'datasetcode', 'description')),
+    ('sample', 'samples', ('corpuscode', 'samplecode', 'wordcount', 'description', 'link')),
+    ('collection', 'collections', ('corpuscode', 'collectioncode', 'groupcode', 'description')),
+    ('sample_collection', 'sample_collections', ('corpuscode', 'samplecode', 'collectioncode')),
+    ('token', 'tokens', ('corpuscode', 'samplecode', 'datasetcode', 'tokencode', 'tokencount')),
+    ('tokeninfo', 'tokeninfo', ('corpuscode', 'datasetcode', 'tokencode', 'shortlabel', 'longlabel')),
+    ('context', 'contexts', ('corpuscode', 'samplecode', 'datasetcode', 'tokencode', 'before', 'word', 'after', 'link')),
+]
+
+BULK_BATCH = 100000
+BULK_CACHE_KB = 256 * 1024
+
+# Each keyword argument of bulk_load is an iterable of tuples, with
+# the columns in the order of BULK_TABLES; tables are filled in that
+# order so that foreign keys are satisfied. Each batch of rows is
+# committed separately. If contexts are loaded, context_idx is dropped
+# first and rebuilt at the end.
+
+def bulk_load(conn, batch=BULK_BATCH, log=None, **rows):
+    for name in rows:
+        if name not in [ t[1] for t in BULK_TABLES ]:
+            raise TypeError('bulk_load: unknown table %s' % name)
+    conn.commit()
+    journal_mode = list(conn.execute('PRAGMA journal_mode'))[0][0]
+    synchronous = list(conn.execute('PRAGMA synchronous'))[0][0]
+    cache_size = list(conn.execute('PRAGMA cache_size'))[0][0]
+    conn.execute('PRAGMA journal_mode = WAL')
+    conn.execute('PRAGMA synchronous = OFF')
+    conn.execute('PRAGMA cache_size = %d' % -BULK_CACHE_KB)
+    counts = dict()
+    contexts = 'contexts' in rows
+    try:
+        if contexts:
+            conn.execute('DROP INDEX IF EXISTS context_idx')
+        for table, name, columns in BULK_TABLES:
+            if name not in rows:
+                continue
+            sql = 'INSERT INTO %s (%s) VALUES (%s)' % (
+                table, ', '.join(columns), ', '.join('?' for c in columns)
+            )
+            start = time.time()
+            n = 0
+            it = iter(rows[name])
+            while True:
+                chunk = list(itertools.islice(it, batch))
+                if len(chunk) == 0:
+                    break
+                conn.execute('BEGIN')
+                conn.executemany(sql, chunk)
+                conn.commit()
+                n += len(chunk)
+            counts[table] = n
+            if log is not None:
+                elapsed = time.time() - start
+                log('%s: %d rows, %.1f s, %.0f rows/s' % (
+                    table, n, elapsed, n / elapsed if elapsed > 0 else 0
+                ))
+    finally:
+        conn.rollback()
+        if contexts:
+            start = time.time()
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS context_idx
+                ON context (corpuscode, samplecode, datasetcode, tokencode)
+            ''')
+            conn.commit()
+            if log is not None:
+                log('context_idx: %.1f s' % (time.time() - start))
+        conn.execute('PRAGMA cache_size = %d' % cache_size)
+        conn.execute('PRAGMA synchronous = %d' % synchronous)
+        conn.execute('PRAGMA journal_mode = %s' % journal_mode)
+    return counts
+
+def input_digest(conn, corpuscode, datasetcode):
+    h = hashlib.sha1()
+    queries = [
+        ('''
+            SELECT samplecode, wordcount FROM sample
+            WHERE corpuscode = ? ORDER BY samplecode
+        ''', (corpuscode,)),
+        ('''
+            SELECT collectioncode FROM collection
+            WHERE corpuscode = ? ORDER BY collectioncode
+        ''', (corpuscode,)),
+        ('''
+            SELECT samplecode, collectioncode FROM sample_collection
+            WHERE corpuscode = ? ORDER BY samplecode, collectioncode
+        ''', (corpuscode,)),
+        ('''
+            SELECT samplecode, tokencode, tokencount FROM token
+            WHERE corpuscode = ? AND datasetcode = ? ORDER BY samplecode, tokencode
+        ''', (corpuscode, datasetcode)),
+    ]
+    for sql, params in queries:
+        for row in conn.execute(sql, params):
+            h.update(json.dumps(row).encode('ascii'))
+        h.update(b'\n')
+    return h.hexdigest()
+
+# The q values rank the p values of all results in the database, with
+# ties broken by the key; result_q keeps the results in rank order, so
+# that i is the rank. The triggers on result_p record the p values
+# that are added to or removed from result_p in result_q_pending. The
+# results that rank before all of these p values keep their ranks,
+# and only the suffix of result_q from the first pending p value on is
+# rebuilt. However, n is the total number of p values, so if results
+# are added or removed, q changes in every row; this is an update in
+# place. With full, result_q is rebuilt from scratch.
+
+RESULT_Q_SOURCE = '''
+    SELECT corpuscode, datasetcode, collectioncode, statcode,
+        'below' AS side, CAST(below AS REAL)/CAST(total AS REAL) AS p
+    FROM result_p
+    UNION ALL
+    SELECT corpuscode, datasetcode, collectioncode, statcode,
+        'above' AS side, CAST(above AS REAL)/CAST(total AS REAL) AS p
+    FROM result_p
+'''
+
+def create_result_triggers(conn):
+    for event, what, rows in TRIGGER_EVENTS:
+        body = ''.join('''
+            INSERT INTO result_q_pending (p) VALUES
+                (CAST(%s.below AS REAL)/CAST(%s.total AS REAL)),
+                (CAST(%s.above AS REAL)/CAST(%s.total AS REAL));
+        ''' % (row, row, row, row) for row in rows)
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS result_q_%s
+            AFTER %s ON result_p
+            BEGIN %s END
+        ''' % (event, what, body))
+
+def first_changed_rank(conn, n):
+    r = conn.execute('SELECT COUNT(0), MIN(p), MAX(p IS NULL) FROM result_q_pending')
+    pending, pmin, hasnull = list(r)[0]
+    r = conn.execute('SELECT COUNT(0) FROM result_q')
+    nq = list(r)[0][0]
+    if hasnull or (pending == 0 and nq != n):
+        return 1
+    if pending == 0:
+        return None
+    r = conn.execute('''
+        SELECT COALESCE(
+            (SELECT MIN(i) FROM result_q WHERE p >= ?),
+            (SELECT COALESCE(MAX(i), 0) + 1 FROM result_q)
+        )
+    ''', (pmin,))
+    first = list(r)[0][0]
+    # Deleting all rows is much faster than deleting most of them.
+    return first if 2 * first > nq else 1
+
+def refresh_result(conn, full=False):
+    r = conn.execute('SELECT 2 * COUNT(0) FROM result_p')
+    n = list(r)[0][0]
+    first = 1 if full else first_changed_rank(conn, n)
+    if first is not None:
+        where = ''
+        params = [n]
+        if first > 1:
+            r = conn.execute('''
+                SELECT p, corpuscode, datasetcode, collectioncode, statcode, side
+                FROM result_q WHERE i = ?
+            ''', (first - 1,))
+            last = list(r)[0]
+            if last[0] is None:
+                first = 1
+            else:
+                where = '''
+                    WHERE p > ? OR (p = ? AND (corpuscode, datasetcode, collectioncode, statcode, side) > (?, ?, ?, ?, ?))
+                '''
+                params += [last[0]] + list(last)
+        if first > 1:
+            conn.execute('DELETE FROM result_q WHERE i >= ?', (first,))
+        else:
+            conn.execute('DELETE FROM result_q')
+        # Without an explicit i, each new row gets the rowid after the
+        # largest one in the table, which is the next rank.
+        conn.execute('''
+            INSERT INTO result_q (n, corpuscode, datasetcode, collectioncode, statcode, side, p)
+            SELECT ?, corpuscode, datasetcode, collectioncode, statcode, side, p
+            FROM (%s) %s
+            ORDER BY p, corpuscode, datasetcode, collectioncode, statcode, side
+        ''' % (RESULT_Q_SOURCE, where), params)
+    else:
+        first = n + 1
+    conn.execute('''
+        UPDATE result_q SET n = ?, q = p / (CAST(i AS REAL)/CAST(? AS REAL))
+        WHERE i >= ? OR n <> ?
+    ''', (n, n, first, n))
+    conn.execute('DELETE FROM result_q_pending')
@@ -0,0 +1,4 @@
+DESCRIPTION = "Type and hapax accumulation curves"
+AUTHOR = "Jukka Suomela"
+VERSION = "2022-12-19"
+YEAR = "2022"
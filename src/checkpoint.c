@@ -0,0 +1,161 @@
+#include "checkpoint.h"
+#include "config.h"
+#include "malloc.h"
+#include "random.h"
+#include <assert.h>
+#include <signal.h>
+#include <stdlib.h>
+#include <string.h>
+
+#define NHEADER (11 + NYX)
+
+char *
+get_checkpoint_filename(const input_t * restrict pinput, unsigned cls, unsigned alg)
+{
+    assert(pinput->checkpoint != NULL);
+    size_t n = strlen(pinput->checkpoint) + 20;
+    char *filename;
+    MYMALLOC(filename, char, n);
+    snprintf(filename, n, "%s-%c%u", pinput->checkpoint, cls == CLASS_PERMTEST ? 'p' : 'c', alg + 1);
+    return filename;
+}
+
+static void
+get_header(const input_t * restrict pinput,
+           unsigned cls,
+           unsigned alg,
+           const yxbool_t * restrict outputs,
+           const yx_t * restrict elements,
+           unsigned * restrict header)
+{
+    unsigned permtest = 0;
+    unsigned curves = 0;
+    for (unsigned i = 0; i < NYX; i++) {
+        permtest |= (pinput->permtest.yx[i] ? 1u : 0u) << i;
+        curves |= (pinput->curves.yx[i] ? 1u : 0u) << i;
+    }
+    unsigned j = 0;
+    header[j++] = CHECKPOINT_MAGIC;
+    header[j++] = cls;
+    header[j++] = alg;
+    header[j++] = pinput->iterations;
+    header[j++] = pinput->streams;
+    header[j++] = pinput->processes;
+    header[j++] = pinput->id;
+    header[j++] = permtest;
+    header[j++] = curves;
+    header[j++] = pinput->types.nrow;
+    header[j++] = pinput->types.ncol;
+    for (unsigned i = 0; i < NYX; i++) {
+        header[j++] = outputs->yx[i] ? elements->yx[i] : 0;
+    }
+    assert(j == NHEADER);
+}
+
+bool
+read_checkpoint(const input_t * restrict pinput,
+                const char * restrict filename,
+                unsigned cls,
+                unsigned alg,
+                const yxbool_t * restrict outputs,
+                const yx_t * restrict elements,
+                unsigned * restrict pto,
+                yxstat_t * restrict pyxstat)
+{
+    myfile_t f = MYFILE_NULL;
+    f.filename = filename;
+    f.file = fopen(filename, "r");
+    if (f.file == NULL) {
+        return false;
+    }
+
+    unsigned expected[NHEADER];
+    unsigned header[NHEADER];
+    get_header(pinput, cls, alg, outputs, elements, expected);
+    size_t n = fread(header, sizeof(unsigned), NHEADER, f.file);
+    if (n != NHEADER || memcmp(header, expected, sizeof(header)) != 0) {
+        myinfo("%s: checkpoint does not match, ignored", filename);
+        myclose(&f);
+        return false;
+    }
+
+    unsigned gen_from = get_generator(pinput->streams, pinput->processes, pinput->id);
+    unsigned gen_to = get_generator(pinput->streams, pinput->processes, pinput->id + 1);
+    unsigned to = myfread_uint(&f);
+    if (to <= gen_from || to > gen_to) {
+        myerror("%s: invalid checkpoint", filename);
+    }
+
+    yxstat_t *p = alloc_stat(outputs, elements);
+    for (unsigned i = 0; i < NYX; i++) {
+        if (p->yx[i]) {
+            read_stat_compressed(&f, p->yx[i], elements->yx[i]);
+        }
+    }
+    if (getc(f.file) != EOF) {
+        myerror("%s: invalid checkpoint", filename);
+    }
+    myclose(&f);
+
+    *pto = to;
+    *pyxstat = *p;
+    free(p);
+    return true;
+}
+
+// The file is replaced atomically, so that an interruption never
+// leaves a partial checkpoint behind.
+
+void
+write_checkpoint(const input_t * restrict pinput,
+                 const char * restrict filename,
+                 unsigned cls,
+                 unsigned alg,
+                 const yxbool_t * restrict outputs,
+                 const yx_t * restrict elements,
+                 unsigned to,
+                 const yxstat_t * restrict pyxstat)
+{
+    size_t n = strlen(filename) + 5;
+    char *tmp;
+    MYMALLOC(tmp, char, n);
+    snprintf(tmp, n, "%s.tmp", filename);
+
+    unsigned header[NHEADER];
+    get_header(pinput, cls, alg, outputs, elements, header);
+    myfile_t f = myopen(tmp, true);
+    myfwrite(&f, header, sizeof(unsigned), NHEADER);
+    myfwrite_uint(&f, to);
+    for (unsigned i = 0; i < NYX; i++) {
+        if (outputs->yx[i]) {
+            write_stat_compressed(&f, pyxstat->yx[i], elements->yx[i]);
+        }
+    }
+    myclose(&f);
+    if (rename(tmp, filename)) {
+        myerror("%s: rename: %s", tmp, strerror(errno));
+    }
+    free(tmp);
+}
+
+static volatile sig_atomic_t interrupted = 0;
+
+static void
+interrupt_handler(int sig)
+{
+    interrupted = 1;
+    signal(sig, interrupt_handler);
+}
+
+void
+catch_interrupts(void)
+{
+    signal(SIGINT, interrupt_handler);
+    signal(SIGTERM, interrupt_handler);
+}
+
+bool
+is_interrupted(void)
+{
+    return interrupted;
+}
@@ -0,0 +1,47 @@
+#ifndef TYPES_CHECKPOINT_H
+#define TYPES_CHECKPOINT_H
+
+#include "input.h"
+#include "stat.h"
+
+// A checkpoint file holds the sum of the results of generator parts
+// gen_from .. to-1 for one algorithm; gen_from is the first part of
+// this process. There is one file for each algorithm, named after the
+// --checkpoint prefix, the class, and the index of the algorithm.
+
+char *
+get_checkpoint_filename(const input_t * restrict pinput, unsigned cls, unsigned alg);
+
+// Returns false if there is no checkpoint file, or if it was
+// written with different parameters or input.
+
+bool
+read_checkpoint(const input_t * restrict pinput,
+                const char * restrict filename,
+                unsigned cls,
+                unsigned alg,
+                const yxbool_t * restrict outputs,
+                const yx_t * restrict elements,
+                unsigned * restrict pto,
+                yxstat_t * restrict pyxstat);
+
+void
+write_checkpoint(const input_t * restrict pinput,
+                 const char * restrict filename,
+                 unsigned cls,
+                 unsigned alg,
+                 const yxbool_t * restrict outputs,
+                 const yx_t * restrict elements,
+                 unsigned to,
+                 const yxstat_t * restrict pyxstat);
+
+// After catch_interrupts, SIGINT and SIGTERM only set a flag, and
+// the process saves a checkpoint and stops after the current chunk.
+
+void
+catch_interrupts(void);
+
+bool
+is_interrupted(void);
+
+#endif
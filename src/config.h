@@ -5,14 +5,44 @@
 
 #define SPARSITY_HEURISTIC 50.0
 
-//// Number of parallel generators
+//// Adaptive permutation testing: generator parts in the first round
+//// (each further round doubles the number of parts done), and the
+//// probability that a p-value is put on the wrong side of the level,
+//// over all rounds together; round r gets ADAPTIVE_ERROR / 2^r
+
+#define ADAPTIVE_FIRST_ROUND 16
+#define ADAPTIVE_ERROR 1e-6
+
+//// Checkpoints: the minimum number of seconds between saving
+//// checkpoints; chunks start with one generator part per thread and
+//// double in size while a chunk takes less than half of this
+
+#define CHECKPOINT_INTERVAL 60
+
+//// Minimum CPU time for timing each variant with --calibrate
+
+#define CALIBRATION_SECONDS 0.2
+
+//// Default number of parallel generator streams in the rng state
+//// file; types-rng can generate any number of streams
 
 #define NGEN 2000
 
 //// File formats
 
 #define INPUT_MAGIC  0xEEE118E9u
+#define INPUT_MAGIC2 0xEEE118EAu
 #define OUTPUT_MAGIC 0x591E8AC1u
+#define CHECKPOINT_MAGIC 0xC4EC9017u
+#define RNG_STATE_MAGIC 0x5EED5EEDu
+
+//// Input files of version 2: number of unsigned values in the header,
+//// and each section is padded to a multiple of this many values, so
+//// that the sections can be used in place when the file is mapped
+
+#define INPUT_HEADER 16
+#define INPUT_ALIGNMENT 16
+#define INPUT_ALIGN(n) (((size_t)(n) + INPUT_ALIGNMENT - 1) / INPUT_ALIGNMENT * INPUT_ALIGNMENT)
 
 //// Each tool has to define this
 
@@ -1,4 +1,5 @@
 #include "curves.h"
+#include "malloc.h"
 #include "util.h"
 #include <stdlib.h>
 
@@ -46,12 +47,24 @@ set_slot_scale(unsigned max,
     assert(get_slot_up(tm1,     *scale) == *slots - 1);
 }
 
+static void
+setup_xthreshold(grid_t * restrict pgrid, unsigned x)
+{
+    const unsigned n = pgrid->xslots.x[x];
+    MYMALLOC(pgrid->xthreshold[x], unsigned, n + 1);
+    for (unsigned i = 0; i <= n; i++) {
+        pgrid->xthreshold[x][i] = get_threshold(i, pgrid->xscale.x[x]);
+    }
+}
+
 void
 setup_grid(const input_t * restrict pinput, const plan_t * restrict pplan, grid_t * restrict pgrid)
 {
     set_slot_scale(pinput->xmax.x[XTOKEN], pinput->xres, &pgrid->xscale.x[XTOKEN], &pgrid->xslots.x[XTOKEN]);
+    setup_xthreshold(pgrid, XTOKEN);
     if (pplan->requirements & WITH_WORD_COUNT) {
         set_slot_scale(pinput->xmax.x[XWORD], pinput->xres, &pgrid->xscale.x[XWORD], &pgrid->xslots.x[XWORD]);
+        setup_xthreshold(pgrid, XWORD);
     }
     for (unsigned y = 0; y < NY; y++) {
         set_slot_scale(pinput->ymax.y[y], pinput->yres, &pgrid->yscale.y[y], &pgrid->yslots.y[y]);
@@ -60,3 +73,14 @@ setup_grid(const input_t * restrict pinput, const plan_t * restrict pplan, grid_
         pgrid->elements.yx[i] = uint_multiply(pgrid->yslots.y[YX[i].y], pgrid->xslots.x[YX[i].x], INT_MAX);
     }
 }
+
+void
+free_grid(grid_t * restrict pgrid)
+{
+    for (unsigned x = 0; x < NX; x++) {
+        if (pgrid->xthreshold[x] != NULL) {
+            free(pgrid->xthreshold[x]);
+            pgrid->xthreshold[x] = NULL;
+        }
+    }
+}
@@ -30,15 +30,20 @@ typedef struct {
     xd_t xscale;
     yd_t yscale;
     yx_t elements;  // <= INT_MAX
+    // xthreshold[x][i] = get_threshold(i, xscale.x[x]) for i = 0, ..., xslots.x[x]
+    unsigned *xthreshold[NX];
 } grid_t;
 
-#define GRID_NULL { X_NULL, Y_NULL, XD_NULL, YD_NULL, YX_NULL }
+#define GRID_NULL { X_NULL, Y_NULL, XD_NULL, YD_NULL, YX_NULL, { FOREACH_X(NULL) } }
 
 extern const grid_t GRID_NULL_C;
 
 void
 setup_grid(const input_t * restrict pinput, const plan_t * restrict pplan, grid_t * restrict pgrid);
 
+void
+free_grid(grid_t * restrict pgrid);
+
 void
 set_slot_scale(unsigned max,
                unsigned res,
@@ -91,10 +96,14 @@ get_yslot_up(const grid_t * restrict pgrid, unsigned y, unsigned i)
     return get_slot_up(i, pgrid->yscale.y[y]);
 }
 
+// The curve kernels look up x thresholds once for each slot,
+// hence they are tabulated.
+
 inline static unsigned
 get_xthreshold(const grid_t * restrict pgrid, unsigned x, unsigned i)
 {
-    return get_threshold(i, pgrid->xscale.x[x]);
+    assert(i <= pgrid->xslots.x[x]);
+    return pgrid->xthreshold[x][i];
 }
 
 inline static unsigned
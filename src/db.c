@@ -24,6 +24,14 @@ static db_cache_t db_cache = { NULL, NULL };
 
 static bool atexit_registered = false;
 
+/*
+    Other processes may hold a lock on the database, e.g. types-store
+    processes that run in parallel; wait for them instead of failing.
+    Writers should start their transactions with BEGIN IMMEDIATE, so
+    that they wait for the lock before reading anything.
+*/
+#define DB_BUSY_TIMEOUT_MS (10 * 60 * 1000)
+
 _Noreturn static void
 db_error_stmt_exit(sqlite3_stmt * restrict stmt)
 {
@@ -142,6 +150,16 @@ db_bind_double(sqlite3_stmt * restrict stmt, const char * restrict sql, int inde
     return index + 1;
 }
 
+static unsigned
+db_bind_blob(sqlite3_stmt * restrict stmt, const char * restrict sql, int index, const void * restrict data, int size)
+{
+    if (sqlite3_bind_blob(stmt, index, data, size, SQLITE_STATIC)) {
+        myerror_noexit("%s -- statement: '%s', parameter %d: blob of %d bytes", sqlite3_errmsg(db), sql, index, size);
+        db_error_stmt_exit(stmt);
+    }
+    return index + 1;
+}
+
 static unsigned
 db_bind_recurse(
     sqlite3_stmt * restrict stmt,
@@ -172,6 +190,9 @@ db_bind_recurse(
         case DB_PARAM_DOUBLE:
             index = db_bind_double(stmt, sql, index, param[i].value.v_double);
             break;
+        case DB_PARAM_BLOB:
+            index = db_bind_blob(stmt, sql, index, param[i].value.v_blob.data, param[i].value.v_blob.size);
+            break;
         case DB_PARAM_LAST:
         default:
             assert(false);
@@ -303,6 +324,58 @@ db_storearray(
     db_step_done(stmt, sql);
 }
 
+void
+db_storeblob(
+    myfile_t * restrict f,
+    const char * restrict sql,
+    const db_param_t * restrict param
+)
+{
+    sqlite3_stmt *stmt = db_prepare(sql, param);
+    db_step_row(stmt, sql, 1);
+    const void *data = sqlite3_column_blob(stmt, 0);
+    int size = sqlite3_column_bytes(stmt, 0);
+    if (size > 0) {
+        myfwrite(f, data, 1, size);
+    }
+    db_step_done(stmt, sql);
+}
+
+void
+db_loadarray(
+    unsigned * restrict data,
+    unsigned nrow,
+    unsigned ncol,
+    const char * restrict sql,
+    const db_param_t * restrict param
+)
+{
+    sqlite3_stmt *stmt = db_prepare(sql, param);
+    for (unsigned i = 0; i < nrow; i++) {
+        db_step_row(stmt, sql, ncol);
+        for (unsigned j = 0; j < ncol; j++) {
+            data[(size_t)i * ncol + j] = db_column_uint(stmt, sql, j);
+        }
+    }
+    db_step_done(stmt, sql);
+}
+
+void
+db_loadarray_double(
+    double * restrict data,
+    unsigned nrow,
+    const char * restrict sql,
+    const db_param_t * restrict param
+)
+{
+    sqlite3_stmt *stmt = db_prepare(sql, param);
+    for (unsigned i = 0; i < nrow; i++) {
+        db_step_row(stmt, sql, 1);
+        data[i] = sqlite3_column_double(stmt, 0);
+    }
+    db_step_done(stmt, sql);
+}
+
 void db_close(void)
 {
     if (db_cache.stmt) {
@@ -335,6 +408,9 @@ db_open(const char * restrict filename, bool readwrite)
     if (sqlite3_open_v2(filename, &db, readwrite ? SQLITE_OPEN_READWRITE : SQLITE_OPEN_READONLY, NULL)) {
         db_error_filename(filename);
     }
+    if (sqlite3_busy_timeout(db, DB_BUSY_TIMEOUT_MS)) {
+        db_error_filename(filename);
+    }
     db_exec("PRAGMA foreign_keys = ON", NOBIND);
 }
 
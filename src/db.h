@@ -11,6 +11,7 @@ typedef enum {
     DB_PARAM_STRING,
     DB_PARAM_INT,
     DB_PARAM_DOUBLE,
+    DB_PARAM_BLOB,
 } db_param_type;
 
 typedef struct db_param db_param_t;
@@ -22,6 +23,10 @@ struct db_param {
         const char * v_string;
         int64_t v_int;
         double v_double;
+        struct {
+            const void * data;
+            int size;
+        } v_blob;
     } value;
 };
 
@@ -30,6 +35,7 @@ struct db_param {
 #define STRING(v)  (db_param_t){ .type = DB_PARAM_STRING,  .value.v_string = v  }
 #define INT(v)     (db_param_t){ .type = DB_PARAM_INT,     .value.v_int = v     }
 #define DOUBLE(v)  (db_param_t){ .type = DB_PARAM_DOUBLE,  .value.v_double = v  }
+#define BLOB(v, n) (db_param_t){ .type = DB_PARAM_BLOB,    .value.v_blob = { v, n } }
 
 #define NOBIND    (db_param_t[]){ LAST }
 #define BIND(...) (db_param_t[]){ __VA_ARGS__, LAST }
@@ -70,6 +76,30 @@ db_storearray(
     const db_param_t * restrict param
 );
 
+void
+db_storeblob(
+    myfile_t * restrict f,
+    const char * restrict sql,
+    const db_param_t * restrict param
+);
+
+void
+db_loadarray(
+    unsigned * restrict data,
+    unsigned nrow,
+    unsigned ncol,
+    const char * restrict sql,
+    const db_param_t * restrict param
+);
+
+void
+db_loadarray_double(
+    double * restrict data,
+    unsigned nrow,
+    const char * restrict sql,
+    const db_param_t * restrict param
+);
+
 int64_t
 db_last_insert_rowid(void);
 
@@ -1,5 +1,6 @@
 #include "driver.h"
 #include "calculate.h"
+#include "checkpoint.h"
 #include "collections.h"
 #include "config.h"
 #include "jump.h"
@@ -8,12 +9,18 @@
 #include "random.h"
 #include "read.h"
 #include "util.h"
+#include <ctype.h>
+#include <math.h>
+#include <string.h>
+#include <time.h>
 
 // -------- Input --------
 
 void
-process_input(input_t * restrict pinput, const plan_t * restrict pplan)
+process_input(input_t * restrict pinput, plan_t * restrict pplan)
 {
+    read_raw_input_header(pinput, pplan);
+    plan_memory(pinput, pplan);
     read_raw_input(pinput, pplan);
     postprocess_type_word_count(pinput, pplan);
     postprocess_collections(pinput, pplan);
@@ -102,13 +109,14 @@ calculate_permtest_parallel(const input_t * restrict pinput,
                             const collection_t * restrict pcoll,
                             yxstat_t **ppyxstat_head,
                             const alg_t * restrict alg,
-                            const algv_t * restrict algv)
+                            const algv_t * restrict algv,
+                            unsigned gen_from,
+                            unsigned gen_to,
+                            unsigned threads)
 {
     unsigned result_count = 0;
-    unsigned gen_from = get_generator(pinput->processes, pinput->id);
-    unsigned gen_to = get_generator(pinput->processes, pinput->id + 1);
 
-    #pragma omp parallel
+    #pragma omp parallel num_threads(threads)
     {
         yxstat_t *pyxstat = alloc_stat_uniform(&alg->outputs, pinput->collections.ncol);
         #pragma omp critical
@@ -131,84 +139,287 @@ calculate_permtest(const input_t * restrict pinput,
                    const rng_state_t * restrict rng_state_init,
                    const collection_t * restrict pcoll,
                    const alg_t * restrict alg,
-                   const algv_t * restrict algv)
+                   const algv_t * restrict algv,
+                   unsigned gen_from,
+                   unsigned gen_to,
+                   unsigned threads)
 {
     yxstat_t *yxstat_head = NULL;
-    unsigned result_count = calculate_permtest_parallel(pinput, rng_state_init, pcoll, &yxstat_head, alg, algv);
+    unsigned result_count = calculate_permtest_parallel(pinput, rng_state_init, pcoll, &yxstat_head, alg, algv, gen_from, gen_to, threads);
     return merge_all(&yxstat_head, result_count);
 }
 
+// -------- Curves --------
+
+// Each thread counts in narrow accumulators of its own and adds them
+// to the shared total from time to time (see stat.h); the grids are
+// large, and this keeps the per-thread memory small.
+
 static void
-print_permtest(input_t * restrict pinput,
-               const collection_t * restrict pcoll,
-               const yxstat_t * restrict pyxstat)
+calculate_curves_parallel(const input_t * restrict pinput,
+                          const rng_state_t * restrict rng_state_init,
+                          const grid_t * restrict pgrid,
+                          yxstat_t * restrict pyxstat,
+                          const alg_t * restrict alg,
+                          const algv_t * restrict algv,
+                          unsigned gen_from,
+                          unsigned gen_to,
+                          unsigned threads)
 {
-    for (unsigned i = 0; i < NYX; i++) {
-        print_permtest_one(pinput, pcoll, pyxstat->yx[i], i);
+    #pragma omp parallel num_threads(threads)
+    {
+        accum_t *paccum = alloc_accum(&alg->outputs, &pgrid->elements, pyxstat);
+        #pragma omp for nowait
+        for (unsigned part = gen_from; part < gen_to; part++) {
+            algv->calculate_curves(pinput, rng_state_init, pgrid, paccum, part);
+        }
+        free_accum(paccum);
     }
 }
 
-static void
-calculate_and_print_permtest(input_t * restrict pinput,
-                             const rng_state_t * restrict rng_state_init,
-                             const alg_t * restrict alg,
-                             const algv_t * restrict algv)
+static yxstat_t
+calculate_curves(const input_t * restrict pinput,
+                 const rng_state_t * restrict rng_state_init,
+                 const grid_t * restrict pgrid,
+                 const alg_t * restrict alg,
+                 const algv_t * restrict algv,
+                 unsigned gen_from,
+                 unsigned gen_to,
+                 unsigned threads)
 {
-    collection_t * restrict pcoll;
-    MYMALLOCZ(pcoll, collection_t, pinput->collections.ncol, COLLECTION_NULL_C);
-    summarise_collections(pinput, pcoll, algv);
-    yxstat_t yxstat = calculate_permtest(pinput, rng_state_init, pcoll, alg, algv);
-    print_permtest(pinput, pcoll, &yxstat);
-    free_stat(&yxstat);
-    free(pcoll);
-    if (pinput->progress) {
-        fprintf(stderr, "P");
+    yxstat_t *pyxstat = alloc_stat(&alg->outputs, &pgrid->elements);
+    calculate_curves_parallel(pinput, rng_state_init, pgrid, pyxstat, alg, algv, gen_from, gen_to, threads);
+    yxstat_t yxstat = *pyxstat;
+    free(pyxstat);
+    return yxstat;
+}
+
+// -------- Adaptive permutation testing --------
+
+// Relative entropy of Bernoulli(q) with respect to Bernoulli(p).
+
+static double
+kl_bernoulli(double q, double p)
+{
+    double d = 0.0;
+    if (q > 0.0) {
+        d += q * log(q / p);
+    }
+    if (q < 1.0) {
+        d += (1.0 - q) * log((1.0 - q) / (1.0 - p));
     }
+    return d;
 }
 
+// Chernoff bound: if the true p-value were on the other side of
+// the level, the probability of observing count/iterations would be
+// at most exp(-iterations * kl_bernoulli(count/iterations, level)).
 
-// -------- Curves --------
+static bool
+is_decided(unsigned count, unsigned iterations, double level, double error)
+{
+    double q = (double)count / (double)iterations;
+    return iterations * kl_bernoulli(q, level) >= -log(error);
+}
+
+// The p-values are tested again after each round, and each test may
+// go wrong. Round r (1, 2, ...) gets the error ADAPTIVE_ERROR / 2^r,
+// so that the errors of all rounds add up to at most ADAPTIVE_ERROR.
+// The round follows from the number of parts done: the first round
+// has ADAPTIVE_FIRST_ROUND parts, and each round doubles the total.
 
 static unsigned
-calculate_curves_parallel(const input_t * restrict pinput,
-                          const rng_state_t * restrict rng_state_init,
-                          const grid_t * restrict pgrid, 
-                          yxstat_t **ppyxstat_head,
-                          const alg_t * restrict alg,
-                          const algv_t * restrict algv)
+adaptive_round(unsigned parts)
 {
-    unsigned result_count = 0;
-    unsigned gen_from = get_generator(pinput->processes, pinput->id);
-    unsigned gen_to = get_generator(pinput->processes, pinput->id + 1);
+    unsigned round = 1;
+    while (round < 32 && ((unsigned)ADAPTIVE_FIRST_ROUND << (round - 1)) < parts) {
+        round++;
+    }
+    return round;
+}
 
-    #pragma omp parallel
-    {
-        yxstat_t *pyxstat = alloc_stat(&alg->outputs, &pgrid->elements);
-        #pragma omp critical
-        {
-            pyxstat->next = *ppyxstat_head;
-            *ppyxstat_head = pyxstat;
-            result_count++;
+static bool
+all_decided(const input_t * restrict pinput,
+            const yxstat_t * restrict pyxstat,
+            unsigned iterations,
+            unsigned parts)
+{
+    if (iterations == 0) {
+        return false;
+    }
+    double error = ldexp(ADAPTIVE_ERROR, -(int)adaptive_round(parts));
+    for (unsigned i = 0; i < NYX; i++) {
+        if (pyxstat->yx[i] == NULL || !pinput->permtest.yx[i]) {
+            continue;
         }
-        #pragma omp for nowait
-        for (unsigned part = gen_from; part < gen_to; part++) {
-            algv->calculate_curves(pinput, rng_state_init, pgrid, pyxstat, part);
+        for (unsigned c = 0; c < pinput->collections.ncol; c++) {
+            const stat_t *s = pyxstat->yx[i] + c;
+            if (!is_decided(s->lower, iterations, pinput->adaptive, error)) {
+                return false;
+            }
+            if (!is_decided(s->upper, iterations, pinput->adaptive, error)) {
+                return false;
+            }
         }
     }
+    return true;
+}
 
-    return result_count;
+// -------- Chunks and checkpoints --------
+
+// The generator parts of this process are calculated in chunks.
+// Normally there is only one chunk. With --adaptive, each chunk of
+// permutation testing doubles the number of parts done so far, and
+// we stop as soon as all p-values are decided. With --checkpoint,
+// the first chunk has one part per thread, and the size doubles as
+// long as a chunk takes less than half of CHECKPOINT_INTERVAL; each
+// chunk is a parallel region of its own, and this keeps the chunks
+// few and all threads busy. The sum of the results so far is saved
+// every CHECKPOINT_INTERVAL seconds and at the end, and the parts
+// that an earlier checkpoint covers are skipped. The results are
+// sums over the parts, so they do not depend on the chunks.
+
+static unsigned
+next_chunk(const input_t * restrict pinput,
+           unsigned cls,
+           unsigned gen_from,
+           unsigned gen_to,
+           unsigned from,
+           unsigned chunk)
+{
+    unsigned size = gen_to - from;
+    if (cls == CLASS_PERMTEST && pinput->adaptive > 0.0) {
+        size = MAX(ADAPTIVE_FIRST_ROUND, from - gen_from);
+    } else if (pinput->checkpoint != NULL) {
+        size = chunk;
+    }
+    return MIN(from + size, gen_to);
 }
 
 static yxstat_t
-calculate_curves(const input_t * restrict pinput,
+calculate_chunks(const input_t * restrict pinput,
                  const rng_state_t * restrict rng_state_init,
+                 const collection_t * restrict pcoll,
                  const grid_t * restrict pgrid,
+                 unsigned cls,
                  const alg_t * restrict alg,
-                 const algv_t * restrict algv)
+                 const algv_t * restrict algv,
+                 unsigned threads,
+                 unsigned * restrict piterations)
 {
-    yxstat_t *yxstat_head = NULL;
-    unsigned result_count = calculate_curves_parallel(pinput, rng_state_init, pgrid, &yxstat_head, alg, algv);
-    return merge_all(&yxstat_head, result_count);
+    unsigned gen_from = get_generator(pinput->streams, pinput->processes, pinput->id);
+    unsigned gen_to = get_generator(pinput->streams, pinput->processes, pinput->id + 1);
+    unsigned first = get_iteration(pinput->streams, pinput->iterations, gen_from);
+    yx_t elements = YX_NULL;
+    for (unsigned i = 0; i < NYX; i++) {
+        elements.yx[i] = cls == CLASS_PERMTEST ? pinput->collections.ncol : pgrid->elements.yx[i];
+    }
+
+    yxstat_t yxstat = YXSTAT_NULL;
+    unsigned from = gen_from;
+    unsigned saved = gen_from;
+    char *checkpoint = NULL;
+    if (pinput->checkpoint != NULL) {
+        checkpoint = get_checkpoint_filename(pinput, cls, alg - ALG);
+        if (read_checkpoint(pinput, checkpoint, cls, alg - ALG, &alg->outputs, &elements, &from, &yxstat)) {
+            saved = from;
+        }
+    }
+    time_t saved_time = time(NULL);
+    unsigned chunk = MAX(threads, 1);
+
+    while (from < gen_to) {
+        if (cls == CLASS_PERMTEST && pinput->adaptive > 0.0 && from > gen_from) {
+            if (all_decided(pinput, &yxstat, get_iteration(pinput->streams, pinput->iterations, from) - first, from - gen_from)) {
+                break;
+            }
+        }
+        if (checkpoint != NULL && is_interrupted()) {
+            if (saved < from) {
+                write_checkpoint(pinput, checkpoint, cls, alg - ALG, &alg->outputs, &elements, from, &yxstat);
+            }
+            myerror("interrupted, progress saved in %s", checkpoint);
+        }
+        time_t chunk_time = time(NULL);
+        unsigned to = next_chunk(pinput, cls, gen_from, gen_to, from, chunk);
+        yxstat_t more;
+        if (cls == CLASS_PERMTEST) {
+            more = calculate_permtest(pinput, rng_state_init, pcoll, alg, algv, from, to, threads);
+        } else {
+            more = calculate_curves(pinput, rng_state_init, pgrid, alg, algv, from, to, threads);
+        }
+        if (from == gen_from) {
+            yxstat = more;
+        } else {
+            merge_stat(&yxstat, &more);
+            free_stat(&more);
+        }
+        from = to;
+        if (difftime(time(NULL), chunk_time) < CHECKPOINT_INTERVAL / 2 && chunk <= gen_to - gen_from) {
+            chunk *= 2;
+        }
+        if (checkpoint != NULL && difftime(time(NULL), saved_time) >= CHECKPOINT_INTERVAL) {
+            write_checkpoint(pinput, checkpoint, cls, alg - ALG, &alg->outputs, &elements, from, &yxstat);
+            saved = from;
+            saved_time = time(NULL);
+        }
+    }
+
+    if (checkpoint != NULL) {
+        if (saved < from) {
+            write_checkpoint(pinput, checkpoint, cls, alg - ALG, &alg->outputs, &elements, from, &yxstat);
+        }
+        free(checkpoint);
+    }
+    *piterations = from == gen_to ? pinput->iterations : get_iteration(pinput->streams, pinput->iterations, from) - first;
+    return yxstat;
+}
+
+static void
+remove_checkpoints(const input_t * restrict pinput, const plan_t * restrict pplan)
+{
+    for (unsigned i = 0; i < NALG; i++) {
+        for (unsigned cls = CLASS_CURVES; cls <= CLASS_PERMTEST; cls++) {
+            if (cls == CLASS_PERMTEST ? pplan->palg[i] : pplan->calg[i]) {
+                char *checkpoint = get_checkpoint_filename(pinput, cls, i);
+                remove(checkpoint);
+                free(checkpoint);
+            }
+        }
+    }
+}
+
+// -------- Output --------
+
+static void
+print_permtest(input_t * restrict pinput,
+               const collection_t * restrict pcoll,
+               const yxstat_t * restrict pyxstat,
+               unsigned iterations)
+{
+    for (unsigned i = 0; i < NYX; i++) {
+        print_permtest_one(pinput, pcoll, pyxstat->yx[i], i, iterations);
+    }
+}
+
+static void
+calculate_and_print_permtest(input_t * restrict pinput,
+                             const rng_state_t * restrict rng_state_init,
+                             const alg_t * restrict alg,
+                             const algv_t * restrict algv,
+                             unsigned threads)
+{
+    collection_t * restrict pcoll;
+    MYMALLOCZ(pcoll, collection_t, pinput->collections.ncol, COLLECTION_NULL_C);
+    summarise_collections(pinput, pcoll, algv);
+    unsigned iterations;
+    yxstat_t yxstat = calculate_chunks(pinput, rng_state_init, pcoll, NULL, CLASS_PERMTEST, alg, algv, threads, &iterations);
+    print_permtest(pinput, pcoll, &yxstat, iterations);
+    free_stat(&yxstat);
+    free(pcoll);
+    if (pinput->progress) {
+        fprintf(stderr, "P");
+    }
 }
 
 static void
@@ -224,9 +435,11 @@ calculate_and_print_curves(input_t * restrict pinput,
                            const rng_state_t * restrict rng_state_init,
                            const grid_t * restrict pgrid,
                            const alg_t * restrict alg,
-                           const algv_t * restrict algv)
+                           const algv_t * restrict algv,
+                           unsigned threads)
 {
-    yxstat_t yxstat = calculate_curves(pinput, rng_state_init, pgrid, alg, algv);
+    unsigned iterations;
+    yxstat_t yxstat = calculate_chunks(pinput, rng_state_init, NULL, pgrid, CLASS_CURVES, alg, algv, threads, &iterations);
     print_curves(pinput, pgrid, &yxstat);
     free_stat(&yxstat);
     if (pinput->progress) {
@@ -234,32 +447,144 @@ calculate_and_print_curves(input_t * restrict pinput,
     }
 }
 
-// -------- Driver --------
+// -------- Calibration --------
+
+// Runs generator parts one by one in this thread, with all
+// algorithms of the plan. If *pparts is zero, runs parts until
+// CALIBRATION_SECONDS of CPU time have been used and stores the
+// number of parts in *pparts; otherwise runs exactly *pparts parts.
+// Returns the CPU time used.
+
+static double
+calibrate_one(const input_t * restrict pinput,
+              const plan_t * restrict pplan,
+              const rng_state_t * restrict rng_state_init,
+              const grid_t * restrict pgrid,
+              const algv_t * restrict algv,
+              unsigned * restrict pparts)
+{
+    unsigned gen_from = get_generator(pinput->streams, pinput->processes, pinput->id);
+    unsigned gen_to = get_generator(pinput->streams, pinput->processes, pinput->id + 1);
+
+    collection_t *pcoll[NALG];
+    yxstat_t *ppstat[NALG];
+    yxstat_t *pcstat[NALG];
+    accum_t *pcaccum[NALG];
+    for (unsigned i = 0; i < NALG; i++) {
+        pcoll[i] = NULL;
+        ppstat[i] = NULL;
+        pcstat[i] = NULL;
+        pcaccum[i] = NULL;
+        if (pplan->palg[i]) {
+            MYMALLOCZ(pcoll[i], collection_t, pinput->collections.ncol, COLLECTION_NULL_C);
+            summarise_collections(pinput, pcoll[i], algv + i);
+            ppstat[i] = alloc_stat_uniform(&ALG[i].outputs, pinput->collections.ncol);
+        }
+        if (pplan->calg[i]) {
+            pcstat[i] = alloc_stat(&ALG[i].outputs, &pgrid->elements);
+            pcaccum[i] = alloc_accum(&ALG[i].outputs, &pgrid->elements, pcstat[i]);
+        }
+    }
+
+    unsigned parts = 0;
+    clock_t start = clock();
+    double elapsed = 0.0;
+    for (unsigned part = gen_from; part < gen_to; part++) {
+        if (*pparts > 0 ? parts == *pparts : elapsed >= CALIBRATION_SECONDS) {
+            break;
+        }
+        for (unsigned i = 0; i < NALG; i++) {
+            if (pplan->palg[i]) {
+                algv[i].calculate_permtest(pinput, rng_state_init, pcoll[i], ppstat[i], part);
+            }
+            if (pplan->calg[i]) {
+                algv[i].calculate_curves(pinput, rng_state_init, pgrid, pcaccum[i], part);
+            }
+        }
+        parts++;
+        elapsed = (double)(clock() - start) / CLOCKS_PER_SEC;
+    }
+    *pparts = parts;
+
+    for (unsigned i = 0; i < NALG; i++) {
+        if (pcoll[i]) {
+            free(pcoll[i]);
+        }
+        if (ppstat[i]) {
+            free_stat(ppstat[i]);
+            free(ppstat[i]);
+        }
+        if (pcstat[i]) {
+            free_accum(pcaccum[i]);
+            free_stat(pcstat[i]);
+            free(pcstat[i]);
+        }
+    }
+    return elapsed;
+}
 
 void
-execute_all(input_t * restrict pinput, const plan_t * restrict pplan)
+calibrate_all(input_t * restrict pinput, const plan_t * restrict pplan)
 {
-    rng_state_t *rng_state_init = rng_state_read(&pinput->rng_state_file);
+    rng_state_t *rng_state_init = rng_state_read(&pinput->rng_state_file, &pinput->streams);
     myclose(&pinput->rng_state_file);
 
+    grid_t grid = GRID_NULL;
+    if (pplan->requirements & WITH_CURVES) {
+        setup_grid(pinput, pplan, &grid);
+    }
+
+    unsigned parts = 0;
+    double dense = calibrate_one(pinput, pplan, rng_state_init, &grid, ALG_DENSE, &parts);
+    double sparse = calibrate_one(pinput, pplan, rng_state_init, &grid, ALG_SPARSE, &parts);
+    if (parts == 0) {
+        myerror("nothing to calibrate");
+    }
+    printf("%s %g %g\n", sparse < dense ? "sparse" : "dense", dense / parts, sparse / parts);
+    free_grid(&grid);
+
+    if (rng_state_init != NULL) {
+        free(rng_state_init);
+    }
+}
+
+// -------- Driver --------
+
+static void
+execute_plan(input_t * restrict pinput,
+             plan_t * restrict pplan,
+             const rng_state_t * restrict rng_state_init)
+{
+    if (pinput->processes > pinput->streams) {
+        myerror("--processes %u is larger than the number of generator streams (%u); generate more streams with types-rng",
+                pinput->processes, pinput->streams);
+    }
+
+    grid_t grid = GRID_NULL;
+    if (pplan->requirements & WITH_CURVES) {
+        setup_grid(pinput, pplan, &grid);
+    }
+
     print_head(pinput);
 
     const algv_t * restrict algv = pinput->sparse ? ALG_SPARSE : ALG_DENSE;
 
+    if (pinput->checkpoint != NULL) {
+        catch_interrupts();
+    }
+
     if (pplan->requirements & WITH_PERMTEST) {
         for (unsigned i = 0; i < NALG; i++) {
             if (pplan->palg[i]) {
-                calculate_and_print_permtest(pinput, rng_state_init, ALG + i, algv + i);
+                calculate_and_print_permtest(pinput, rng_state_init, ALG + i, algv + i, pplan->pthreads);
             }
         }
     }
 
     if (pplan->requirements & WITH_CURVES) {
-        grid_t grid = GRID_NULL;
-        setup_grid(pinput, pplan, &grid);
         for (unsigned i = 0; i < NALG; i++) {
             if (pplan->calg[i]) {
-                calculate_and_print_curves(pinput, rng_state_init, &grid, ALG + i, algv + i);
+                calculate_and_print_curves(pinput, rng_state_init, &grid, ALG + i, algv + i, pplan->cthreads);
             }
         }
     }
@@ -268,6 +593,98 @@ execute_all(input_t * restrict pinput, const plan_t * restrict pplan)
     myfwrite_uint(&pinput->raw_output_file, CLASS_NONE);
     myclose(&pinput->raw_output_file);
 
+    if (pinput->checkpoint != NULL) {
+        remove_checkpoints(pinput, pplan);
+    }
+    free_grid(&grid);
+}
+
+void
+execute_all(input_t * restrict pinput, plan_t * restrict pplan)
+{
+    rng_state_t *rng_state_init = rng_state_read(&pinput->rng_state_file, &pinput->streams);
+    myclose(&pinput->rng_state_file);
+
+    execute_plan(pinput, pplan, rng_state_init);
+
+    if (rng_state_init != NULL) {
+        free(rng_state_init);
+    }
+}
+
+// -------- Server --------
+
+// Reads one line of any length; returns false at end of input.
+
+static bool
+read_line(FILE * restrict f, char ** restrict pline, size_t * restrict psize)
+{
+    size_t len = 0;
+    while (true) {
+        if (*psize - len < 2) {
+            *psize = *psize ? 2 * *psize : 256;
+            *pline = myrealloc(*pline, sizeof(char), *psize);
+        }
+        if (fgets(*pline + len, (int)(*psize - len), f) == NULL) {
+            if (ferror(f)) {
+                myerror("stdin: read error");
+            }
+            return len > 0;
+        }
+        len += strlen(*pline + len);
+        if ((*pline)[len - 1] == '\n') {
+            return true;
+        }
+    }
+}
+
+static bool
+is_blank(const char * restrict s)
+{
+    for (; *s; s++) {
+        if (!isspace((unsigned char)*s)) {
+            return false;
+        }
+    }
+    return true;
+}
+
+// The input is prepared once so that it meets the requirements of
+// all algorithms; each request is then an independent calculation
+// with its own plan.
+
+void
+serve_all(input_t * restrict pinput)
+{
+    plan_t plan;
+    plan.requirements = WITH_CURVES | WITH_PERMTEST | WITH_COLLECTIONS;
+    for (unsigned i = 0; i < NALG; i++) {
+        plan.calg[i] = false;
+        plan.palg[i] = false;
+        plan.requirements |= ALG[i].requirements;
+    }
+    process_input(pinput, &plan);
+
+    rng_state_t *rng_state_init = rng_state_read(&pinput->rng_state_file, &pinput->streams);
+    myclose(&pinput->rng_state_file);
+
+    char *line = NULL;
+    size_t size = 0;
+    while (read_line(stdin, &line, &size) && !is_blank(line)) {
+        input_t request;
+        parse_request(&request, pinput, line);
+        const char *filename = request.raw_output_file.filename;
+        plan_t request_plan;
+        execution_plan(&request, &request_plan);
+        plan_memory(&request, &request_plan);
+        execute_plan(&request, &request_plan, rng_state_init);
+        printf("done %s\n", filename);
+        fflush(stdout);
+    }
+
+    if (line != NULL) {
+        free(line);
+    }
     if (rng_state_init != NULL) {
         free(rng_state_init);
     }
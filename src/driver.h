@@ -5,9 +5,15 @@
 #include "plan.h"
 
 void
-process_input(input_t * restrict pinput, const plan_t * restrict pplan);
+process_input(input_t * restrict pinput, plan_t * restrict pplan);
 
 void
-execute_all(input_t * restrict pinput, const plan_t * restrict pplan);
+execute_all(input_t * restrict pinput, plan_t * restrict pplan);
+
+void
+serve_all(input_t * restrict pinput);
+
+void
+calibrate_all(input_t * restrict pinput, const plan_t * restrict pplan);
 
 #endif
@@ -1,8 +1,10 @@
 #include <assert.h>
+#include <ctype.h>
 #include <errno.h>
 #include <math.h>
 #include <stdlib.h>
 #include <string.h>
+#include <sys/mman.h>
 #include "config.h"
 #include "input.h"
 #include "malloc.h"
@@ -13,9 +15,13 @@ const word_token_t WORD_TOKEN_NULL_C = WORD_TOKEN_NULL;
 const input_t INPUT_NULL_C = {
     MYFILE_NULL, MYFILE_NULL, MYFILE_NULL,
     YXBOOL_NULL, YXBOOL_NULL,
-    0, 0, 0, 0, 0,
-    false, false, false,
+    0, 0, 0, 0, 0, 0,
+    0.0, NULL,
+    false, false, false, false, false, false,
+    0, 0, 0, 0, 0, 0,
     MATRIX_NULL, MATRIX_NULL, ARRAY_NULL,
+    NULL, 0, false,
+    0,
     NULL,
     X_NULL, Y_NULL
 };
@@ -53,17 +59,37 @@ usage(void)
         "  --p-hapax-word           Calculate hapax/word statistics.\n"
         "  --p-hapax-token          Calculate hapax/token statistics.\n"
         "  --p-token-word           Calculate token/word statistics.\n"
+        "  --adaptive LEVEL         Stop early once all p-values are known to be\n"
+        "                           below or above LEVEL; --iterations is the\n"
+        "                           maximum.\n"
         "\n"
         "Other options:\n"
-        "  --processes N            Total number of parallel processes.\n"
+        "  --processes N            Total number of parallel processes; at most\n"
+        "                           the number of streams in the rng state.\n"
         "  --id ID                  Identifier of this process (1..N).\n"
         "  --progress               Print progress information to stderr.\n"
+        "  --verbose                Print the expected peak memory usage to\n"
+        "                           stderr.\n"
+        "  --max-memory MB          Use fewer threads if needed to keep the\n"
+        "                           memory usage below MB megabytes, and print\n"
+        "                           the expected peak memory usage to stderr.\n"
+        "  --checkpoint PREFIX      Save progress regularly in files PREFIX-*,\n"
+        "                           and continue from them if they exist.\n"
         "  --sparse                 Optimise for sparse inputs.\n"
         "  --dense                  Optimise for dense inputs.\n"
+        "  --calibrate              Time both variants on a small part of the\n"
+        "                           work, print the faster one, and exit.\n"
+        "  --server                 Read the input once, then read requests from\n"
+        "                           stdin, one per line (see below).\n"
         "  --help                   This help.\n"
         "  --version                Version and copyright information.\n"
         "\n"
         "In all file names, \"-\" can be used to denote stdin/stdout.\n"
+        "\n"
+        "In the server mode, each request is a line with the options of one\n"
+        "calculation, e.g. \"--iterations 1000 --p-type-word --raw-output FILE\";\n"
+        "the server answers with a line \"done FILE\" once FILE is complete.\n"
+        "An empty line or end of input stops the server.\n"
         "\n",
         TOOL);
 }
@@ -121,6 +147,51 @@ pcl_uint(int argc,
     }
 }
 
+static double
+get_double(const char * restrict context, const char * restrict s)
+{
+    if (*s == '\0') {
+        myerror("%s: expected a number, got an empty string: %s", context, s);
+    }
+    char *pend;
+    errno = 0;
+    double v = strtod(s, &pend);
+    if (*pend != '\0') {
+        myerror("%s: not a valid number: %s", context, s);
+    }
+    if (errno == ERANGE) {
+        myerror("%s: number out of range: %s", context, s);
+    }
+    return v;
+}
+
+static bool
+pcl_double(int argc,
+           char **argv,
+           int * restrict pi,
+           const char * restrict option,
+           double * restrict target)
+{
+    assert(*pi < argc);
+    if (strcmp(argv[*pi], option) == 0) {
+        (*pi)++;
+        if (*target > 0.0) {
+            myerror("%s specified twice", option);
+        }
+        if (*pi == argc) {
+            myerror("%s expects an argument", option);
+        }
+        *target = get_double(option, argv[*pi]);
+        (*pi)++;
+        if (!(*target > 0.0 && *target < 1.0)) {
+            myerror("%s: the argument must be between 0 and 1", option);
+        }
+        return true;
+    } else {
+        return false;
+    }
+}
+
 static bool
 pcl_file(int argc,
          char **argv,
@@ -151,6 +222,30 @@ pcl_file(int argc,
     }
 }
 
+static bool
+pcl_string(int argc,
+           char **argv,
+           int * restrict pi,
+           const char * restrict option,
+           const char ** restrict target)
+{
+    assert(*pi < argc);
+    if (strcmp(argv[*pi], option) == 0) {
+        (*pi)++;
+        if (*target != NULL) {
+            myerror("%s specified twice", option);
+        }
+        if (*pi == argc) {
+            myerror("%s expects an argument", option);
+        }
+        *target = argv[*pi];
+        (*pi)++;
+        return true;
+    } else {
+        return false;
+    }
+}
+
 static bool
 pcl_bool(int argc,
          char **argv,
@@ -171,15 +266,9 @@ pcl_bool(int argc,
     }
 }
 
-void
-parse_command_line(input_t * restrict pinput, int argc, char **argv)
+static void
+parse_options(input_t * restrict pinput, int argc, char **argv, int i)
 {
-    if (argc == 1) {
-        usage();
-        exit(EXIT_SUCCESS);
-    }
-
-    int i = 1;
     while (i < argc) {
         if (strcmp(argv[i], "--help") == 0 || strcmp(argv[i], "-h") == 0) {
             usage();
@@ -194,12 +283,18 @@ parse_command_line(input_t * restrict pinput, int argc, char **argv)
         } else if (pcl_uint(argc, argv, &i, "--y",             &pinput->yres, 2)) {
         } else if (pcl_uint(argc, argv, &i, "--processes",     &pinput->processes, 1)) {
         } else if (pcl_uint(argc, argv, &i, "--id",            &pinput->id, 1)) {
+        } else if (pcl_uint(argc, argv, &i, "--max-memory",    &pinput->max_memory, 1)) {
+        } else if (pcl_double(argc, argv, &i, "--adaptive",    &pinput->adaptive)) {
         } else if (pcl_file(argc, argv, &i, "--rng-state-file",&pinput->rng_state_file, false)) {
         } else if (pcl_file(argc, argv, &i, "--raw-input",     &pinput->raw_input_file, false)) {
         } else if (pcl_file(argc, argv, &i, "--raw-output",    &pinput->raw_output_file, true)) {
         } else if (pcl_bool(argc, argv, &i, "--progress",      &pinput->progress)) {
+        } else if (pcl_bool(argc, argv, &i, "--verbose",       &pinput->verbose)) {
+        } else if (pcl_string(argc, argv, &i, "--checkpoint",  &pinput->checkpoint)) {
         } else if (pcl_bool(argc, argv, &i, "--sparse",        &pinput->sparse)) {
         } else if (pcl_bool(argc, argv, &i, "--dense",         &pinput->dense)) {
+        } else if (pcl_bool(argc, argv, &i, "--calibrate",     &pinput->calibrate)) {
+        } else if (pcl_bool(argc, argv, &i, "--server",        &pinput->server)) {
         } else {
             bool done = false;
             for (unsigned j = 0; j < NYX; j++) {
@@ -217,7 +312,27 @@ parse_command_line(input_t * restrict pinput, int argc, char **argv)
             }
         }
     }
+}
 
+// Options that describe one calculation; in the server mode they
+// are given in each request.
+
+static bool
+has_calculation_options(const input_t * restrict pinput)
+{
+    for (unsigned j = 0; j < NYX; j++) {
+        if (pinput->curves.yx[j] || pinput->permtest.yx[j]) {
+            return true;
+        }
+    }
+    return pinput->iterations > 0 || pinput->xres > 0 || pinput->yres > 0
+        || pinput->processes > 0 || pinput->id > 0 || pinput->adaptive > 0.0
+        || pinput->checkpoint != NULL || is_open(&pinput->raw_output_file);
+}
+
+static void
+check_calculation_options(input_t * restrict pinput)
+{
     if (pinput->processes == 0 && pinput->id > 0) {
         myerror("--id required if --processes specified");
     }
@@ -234,18 +349,94 @@ parse_command_line(input_t * restrict pinput, int argc, char **argv)
     if (pinput->iterations == 0) {
         myerror("--iterations required");
     }
+    if (!is_open(&pinput->raw_output_file) && !pinput->calibrate) {
+        myerror("--raw-output required");
+    }
+    if (is_open(&pinput->raw_output_file) && pinput->calibrate) {
+        myerror("cannot specify both --raw-output and --calibrate");
+    }
+    if (pinput->adaptive > 0.0 && pinput->processes > 1) {
+        myerror("cannot specify both --adaptive and --processes");
+    }
+}
+
+void
+parse_command_line(input_t * restrict pinput, int argc, char **argv)
+{
+    if (argc == 1) {
+        usage();
+        exit(EXIT_SUCCESS);
+    }
+
+    parse_options(pinput, argc, argv, 1);
+
+    if (pinput->server) {
+        if (has_calculation_options(pinput)) {
+            myerror("with --server, give --iterations, --raw-output, and the other options of each calculation in the requests");
+        }
+        if (pinput->calibrate) {
+            myerror("cannot specify both --server and --calibrate");
+        }
+    } else {
+        check_calculation_options(pinput);
+    }
     if (!is_open(&pinput->rng_state_file)) {
         myerror("--rng-state-file required");
     }
     if (!is_open(&pinput->raw_input_file)) {
         myerror("--raw-input required");
     }
-    if (!is_open(&pinput->raw_output_file)) {
-        myerror("--raw-output required");
-    }
     if (pinput->sparse && pinput->dense) {
         myerror("cannot specify both --sparse and --dense");
     }
+    if (pinput->calibrate && (pinput->sparse || pinput->dense)) {
+        myerror("cannot specify --calibrate together with --sparse or --dense");
+    }
+}
+
+// The request shares the data of the server; only the calculation
+// options are parsed from the line, which is modified.
+
+void
+parse_request(input_t * restrict prequest, const input_t * restrict pserver, char * restrict line)
+{
+    *prequest = *pserver;
+
+    unsigned n = 0;
+    for (char *p = line; *p; ) {
+        while (*p && isspace((unsigned char)*p)) {
+            p++;
+        }
+        if (*p) {
+            n++;
+        }
+        while (*p && !isspace((unsigned char)*p)) {
+            p++;
+        }
+    }
+    char *argv[n + 1];
+    int argc = 0;
+    for (char *p = strtok(line, " \t\r\n"); p != NULL; p = strtok(NULL, " \t\r\n")) {
+        argv[argc++] = p;
+    }
+    argv[argc] = NULL;
+
+    parse_options(prequest, argc, argv, 0);
+    if (prequest->server != pserver->server
+        || prequest->sparse != pserver->sparse
+        || prequest->dense != pserver->dense
+        || prequest->calibrate != pserver->calibrate
+        || prequest->progress != pserver->progress
+        || prequest->verbose != pserver->verbose
+        || prequest->max_memory != pserver->max_memory
+        || is_open(&prequest->rng_state_file)
+        || is_open(&prequest->raw_input_file)) {
+        myerror("request: only the options of a calculation can be given in a request");
+    }
+    if (prequest->raw_output_file.standard_stream) {
+        myerror("request: --raw-output has to be a file");
+    }
+    check_calculation_options(prequest);
 }
 
 void
@@ -254,6 +445,13 @@ free_input(const input_t * restrict pinput)
     free_matrix(&pinput->types);
     free_matrix(&pinput->collections);
     free_array(&pinput->word_count);
+    if (pinput->raw_input_data) {
+        if (pinput->raw_input_mapped) {
+            munmap(pinput->raw_input_data, pinput->raw_input_size);
+        } else {
+            free(pinput->raw_input_data);
+        }
+    }
     if (pinput->samples_word_token) {
         free(pinput->samples_word_token);
     }
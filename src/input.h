@@ -33,10 +33,25 @@ typedef struct {
     unsigned yres;            // WITH_CURVES
     unsigned processes;
     unsigned id;
+    unsigned max_memory;      // megabytes, 0 = no limit
+    double adaptive;
+    const char *checkpoint;
 
     bool progress;
+    bool verbose;
     bool dense;
     bool sparse;
+    bool calibrate;
+    bool server;
+
+    //// From the header of the input file
+
+    unsigned raw_input_magic;
+    unsigned nsample;
+    unsigned ncoll;
+    unsigned ntype;
+    unsigned nsamplecoll;
+    unsigned nsampletype;
 
     //// From the input files
 
@@ -44,6 +59,14 @@ typedef struct {
     matrix_t collections;     // WITH_COLLECTIONS
     array_t word_count;       // WITH_WORD_COUNT
 
+    unsigned *raw_input_data; // input files of version 2
+    size_t raw_input_size;
+    bool raw_input_mapped;
+
+    //// From the rng state file
+
+    unsigned streams;
+
     //// Derived values
 
     word_token_t * restrict samples_word_token;     // WITH_INTERLEAVING
@@ -58,6 +81,9 @@ extern const input_t INPUT_NULL_C;
 void
 parse_command_line(input_t * restrict pinput, int argc, char **argv);
 
+void
+parse_request(input_t * restrict prequest, const input_t * restrict pserver, char * restrict line);
+
 void
 free_input(const input_t * restrict pinput);
 
@@ -88,6 +88,41 @@ myopen(const char * restrict filename, bool write)
     return f;
 }
 
+// Temporary files are removed automatically when they are closed.
+
+myfile_t
+mytmpfile(void)
+{
+    myfile_t f = MYFILE_NULL;
+    f.filename = "(temporary file)";
+    errno = 0;
+    f.file = tmpfile();
+    if (f.file == NULL) {
+        myioerror(&f, errno, "tmpfile");
+    }
+    return f;
+}
+
+size_t
+mytell(const myfile_t * restrict f)
+{
+    errno = 0;
+    long pos = ftell(f->file);
+    if (pos < 0) {
+        myioerror(f, errno, "tell");
+    }
+    return (size_t)pos;
+}
+
+void
+myrewind(const myfile_t * restrict f)
+{
+    errno = 0;
+    if (fflush(f->file) || fseek(f->file, 0, SEEK_SET)) {
+        myioerror(f, errno, "seek");
+    }
+}
+
 void
 myclose(myfile_t * restrict f)
 {
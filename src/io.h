@@ -41,6 +41,15 @@ myopen_stdout(void);
 myfile_t
 myopen(const char * restrict filename, bool write);
 
+myfile_t
+mytmpfile(void);
+
+size_t
+mytell(const myfile_t * restrict f);
+
+void
+myrewind(const myfile_t * restrict f);
+
 void
 myclose(myfile_t * restrict f);
 
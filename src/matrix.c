@@ -82,6 +82,31 @@ init_sparse_matrix(matrix_t * restrict matrix)
     matrix->sparse_start[matrix->nrow] = k;
 }
 
+void
+init_dense_from_sparse(matrix_t * restrict matrix)
+{
+    assert(matrix->sparse_incidence && matrix->sparse_start);
+    for (unsigned i = 0; i < matrix->nrow; i++) {
+        for (unsigned k = matrix->sparse_start[i]; k < matrix->sparse_start[i + 1]; k++) {
+            unsigned j = matrix->sparse_incidence[k] >> 1;
+            bool at_least_2 = matrix->sparse_incidence[k] & 1;
+            size_t pos = matrix_pos(matrix, i, j);
+            vector_t mask = get_lsb_bit(j);
+            if (matrix->b) {
+                assert((matrix->b[pos] & mask) == 0);
+                matrix->b[pos] |= mask;
+            }
+            if (matrix->zom) {
+                assert((matrix->zom[pos].at_least_1 & mask) == 0);
+                matrix->zom[pos].at_least_1 |= mask;
+                if (at_least_2) {
+                    matrix->zom[pos].at_least_2 |= mask;
+                }
+            }
+        }
+    }
+}
+
 void
 free_matrix(const matrix_t * restrict matrix)
 {
@@ -94,6 +119,9 @@ free_matrix(const matrix_t * restrict matrix)
     if (matrix->zom) {
         free(matrix->zom);
     }
+    if (matrix->sparse_shared) {
+        return;
+    }
     if (matrix->sparse_incidence) {
         free(matrix->sparse_incidence);
     }
@@ -21,9 +21,13 @@ typedef struct {
     // Array sparse_start is safe to over-index by 1.
     unsigned * restrict sparse_incidence;
     unsigned * restrict sparse_start;
+
+    // True if the sparse representation belongs to the raw input data
+    // (e.g. a memory-mapped input file) and must not be freed here.
+    bool sparse_shared;
 } matrix_t;
 
-#define MATRIX_NULL { 0, 0, 0, 0, 0, NULL, NULL, NULL, NULL, NULL }
+#define MATRIX_NULL { 0, 0, 0, 0, 0, NULL, NULL, NULL, NULL, NULL, false }
 extern const matrix_t MATRIX_NULL_C;
 
 inline static size_t
@@ -47,6 +51,9 @@ matrix_set(matrix_t * restrict matrix, unsigned i, unsigned j, unsigned v);
 void
 init_sparse_matrix(matrix_t * restrict matrix);
 
+void
+init_dense_from_sparse(matrix_t * restrict matrix);
+
 void
 free_matrix(const matrix_t * restrict matrix);
 
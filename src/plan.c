@@ -1,5 +1,12 @@
 #include "plan.h"
 #include "calculate.h"
+#include "collections.h"
+#include "config.h"
+#include "stat.h"
+#include "util.h"
+#include "vector.h"
+#include <limits.h>
+#include <math.h>
 #include <stdio.h>
 #include <stdlib.h>
 
@@ -39,6 +46,8 @@ execution_plan(const input_t * restrict pinput, plan_t * restrict pplan)
     pplan->requirements = 0;
     pplan->requirements |= execution_plan_one(&pinput->curves,   pplan->calg, WITH_CURVES);
     pplan->requirements |= execution_plan_one(&pinput->permtest, pplan->palg, WITH_PERMTEST | WITH_COLLECTIONS);
+    pplan->pthreads = get_max_threads();
+    pplan->cthreads = get_max_threads();
 
     if (pplan->requirements & WITH_CURVES) {
         if (pinput->xres == 0) {
@@ -49,3 +58,155 @@ execution_plan(const input_t * restrict pinput, plan_t * restrict pplan)
         }
     }
 }
+
+// -------- Memory --------
+
+// Each thread sums its results in an accumulator of its own. In
+// permutation testing, the calculation in chunks (see driver.c) keeps
+// one more for the total. In curves, the accumulators have narrow
+// counters, and there are two totals: one for the chunk and one for
+// all chunks. A mapped input file is not counted, as it is in the
+// page cache.
+//
+// The estimate is made from the header of the input file, before the
+// input is loaded, and it follows the choices of read.c. The slots
+// of the grids follow set_slot_scale() in curves.c; if the header does
+// not give the totals, the full resolution is assumed.
+
+#define MEGABYTE (1024.0 * 1024.0)
+
+static size_t
+input_memory(const input_t * restrict pinput, const plan_t * restrict pplan)
+{
+    size_t nsample = pinput->nsample;
+    bool v1 = pinput->raw_input_magic == INPUT_MAGIC;
+    bool matrix = pplan->requirements & (WITH_MATRIX_BINARY | WITH_MATRIX_ZOM);
+    bool dense = matrix && (v1 || pinput->dense || pinput->calibrate);
+    bool sparse = matrix && (pinput->sparse || pinput->calibrate);
+
+    size_t per_vector = 0;
+    if (dense && (pplan->requirements & WITH_MATRIX_BINARY)) {
+        per_vector += sizeof(vector_t);
+    }
+    if (dense && (pplan->requirements & WITH_MATRIX_ZOM)) {
+        per_vector += sizeof(zom_t);
+    }
+    size_t total = nsample * number_of_vectors(pinput->ntype) * per_vector;
+    total += nsample * number_of_vectors(pinput->ncoll) * sizeof(vector_t);
+    total += 2 * nsample * sizeof(unsigned);
+    if ((pplan->requirements & WITH_WORD_COUNT) && (pplan->requirements & WITH_INTERLEAVING)) {
+        total += nsample * sizeof(word_token_t);
+    }
+    if (v1) {
+        if (sparse) {
+            total += (nsample + 1 + pinput->nsampletype) * sizeof(unsigned);
+        }
+    } else if (!pinput->raw_input_mapped) {
+        total += pinput->raw_input_size;
+    }
+    return total;
+}
+
+static unsigned
+estimate_slots(unsigned max, unsigned res)
+{
+    return max == 0 || max + 1 > res ? res : max + 1;
+}
+
+static void
+estimate_grid(const input_t * restrict pinput, const plan_t * restrict pplan, yx_t * restrict elements)
+{
+    *elements = (yx_t)YX_NULL;
+    if (!(pplan->requirements & WITH_CURVES)) {
+        return;
+    }
+    x_t xslots = X_NULL;
+    y_t yslots = Y_NULL;
+    xslots.x[XTOKEN] = estimate_slots(pinput->xmax.x[XTOKEN], pinput->xres);
+    if (pplan->requirements & WITH_WORD_COUNT) {
+        xslots.x[XWORD] = estimate_slots(pinput->xmax.x[XWORD], pinput->xres);
+    }
+    for (unsigned y = 0; y < NY; y++) {
+        yslots.y[y] = estimate_slots(pinput->ymax.y[y], pinput->yres);
+    }
+    for (unsigned i = 0; i < NYX; i++) {
+        elements->yx[i] = uint_multiply(yslots.y[YX[i].y], xslots.x[YX[i].x], INT_MAX);
+    }
+}
+
+static size_t
+accumulator_memory(const bool * restrict alg, const yx_t * restrict elements, size_t size)
+{
+    size_t max = 0;
+    for (unsigned i = 0; i < NALG; i++) {
+        if (alg[i]) {
+            size_t total = 0;
+            for (unsigned j = 0; j < NYX; j++) {
+                if (ALG[i].outputs.yx[j]) {
+                    total += (size_t)elements->yx[j] * size;
+                }
+            }
+            max = MAX(max, total);
+        }
+    }
+    return max;
+}
+
+static void
+fit_threads(const input_t * restrict pinput, const char * restrict what,
+            size_t fixed, size_t accumulator, unsigned * restrict pthreads)
+{
+    if (pinput->max_memory == 0 || accumulator == 0) {
+        return;
+    }
+    double budget = pinput->max_memory * MEGABYTE;
+    double minimum = (double)fixed + accumulator;
+    if (minimum > budget) {
+        myerror("--max-memory: %s needs at least %.0f MB", what, ceil(minimum / MEGABYTE));
+    }
+    unsigned threads = (unsigned)((budget - fixed) / accumulator);
+    *pthreads = MIN(*pthreads, threads);
+}
+
+static void
+report_memory(const char * restrict what, size_t fixed, size_t accumulator,
+              unsigned threads, unsigned max_threads)
+{
+    if (accumulator > 0) {
+        myinfo("%s: expected peak memory %.1f MB with %u of %u threads",
+               what, (fixed + (double)threads * accumulator) / MEGABYTE, threads, max_threads);
+    }
+}
+
+void
+plan_memory(const input_t * restrict pinput, plan_t * restrict pplan)
+{
+    size_t input = input_memory(pinput, pplan);
+    yx_t elements;
+    estimate_grid(pinput, pplan, &elements);
+    yx_t pelements = YX_NULL;
+    for (unsigned i = 0; i < NYX; i++) {
+        pelements.yx[i] = pinput->ncoll;
+    }
+    size_t pstat = accumulator_memory(pplan->palg, &pelements, sizeof(stat_t));
+    size_t pfixed = input + (size_t)pinput->ncoll * sizeof(collection_t) + pstat;
+    size_t cstat = accumulator_memory(pplan->calg, &elements, sizeof(stat_16_t));
+    size_t cfixed = input + 2 * accumulator_memory(pplan->calg, &elements, sizeof(stat_t));
+
+    if (pinput->max_memory > 0 && input > pinput->max_memory * MEGABYTE) {
+        myerror("--max-memory: the input needs at least %.0f MB", ceil(input / MEGABYTE));
+    }
+    unsigned threads = get_max_threads();
+    pplan->pthreads = threads;
+    pplan->cthreads = threads;
+    fit_threads(pinput, "permutation testing", pfixed, pstat, &pplan->pthreads);
+    fit_threads(pinput, "curves", cfixed, cstat, &pplan->cthreads);
+
+    if (pinput->max_memory > 0 || pinput->verbose) {
+        if (pstat == 0 && cstat == 0) {
+            myinfo("input: expected memory %.1f MB", input / MEGABYTE);
+        }
+        report_memory("permutation testing", pfixed, pstat, pplan->pthreads, threads);
+        report_memory("curves", cfixed, cstat, pplan->cthreads, threads);
+    }
+}
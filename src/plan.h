@@ -16,9 +16,14 @@ typedef struct {
     bool calg[NALG];
     bool palg[NALG];
     unsigned requirements;
+    unsigned pthreads;      // parallel accumulators for permutation testing
+    unsigned cthreads;      // parallel accumulators for curves
 } plan_t;
 
 void
 execution_plan(const input_t * restrict pinput, plan_t * restrict pplan);
 
+void
+plan_memory(const input_t * restrict pinput, plan_t * restrict pplan);
+
 #endif
@@ -2,60 +2,6 @@
 #include "config.h"
 #include "util.h"
 
-static void
-write_stat_compressed(myfile_t * restrict f, const stat_t * restrict pstat, size_t n)
-{
-    unsigned zerocount = 0;
-    for (size_t i = 0; i < n; i++) {
-        const stat_t s = pstat[i];
-        unsigned max = MAX(s.lower, s.upper);
-        if (max == 0) {
-            zerocount++;
-            if (zerocount == STAT_ZEROCOUNT_MAX) {
-                myfwrite_uchar(f, zerocount);
-                zerocount = 0;
-            }
-        } else {
-            if (zerocount) {
-                myfwrite_uchar(f, zerocount);
-                zerocount = 0;
-            }
-            if (max < (1<<2)) {
-                unsigned v = 0;
-                v |= s.lower;
-                v <<= 2;
-                v |= s.upper;
-                v |= STAT_2_MASK;
-                myfwrite_uchar(f, v);
-            } else if (max < (1<<4)) {
-                unsigned v = 0;
-                v |= s.lower;
-                v <<= 4;
-                v |= s.upper;
-                myfwrite_uchar(f, STAT_4);
-                myfwrite_uchar(f, v);
-            } else if (max < (1<<8)) {
-                stat_8_t ss = { s.lower, s.upper };
-                myfwrite_uchar(f, STAT_8);
-                myfwrite(f, &ss, sizeof(ss), 1);
-            } else if (max < (1<<16)) {
-                stat_16_t ss = { s.lower, s.upper };
-                myfwrite_uchar(f, STAT_16);
-                myfwrite(f, &ss, sizeof(ss), 1);
-            } else {
-                stat_32_t ss = { s.lower, s.upper };
-                myfwrite_uchar(f, STAT_32);
-                myfwrite(f, &ss, sizeof(ss), 1);
-            }
-        }
-    }
-    if (zerocount) {
-        myfwrite_uchar(f, zerocount);
-        zerocount = 0;
-    }
-    myfwrite_uchar(f, STAT_END);
-}
-
 #define F (&pinput->raw_output_file)
 
 void
@@ -72,7 +18,8 @@ void
 print_permtest_one(input_t * restrict pinput,
                    const collection_t * restrict pcoll,
                    const stat_t * restrict pstat,
-                   unsigned yx)
+                   unsigned yx,
+                   unsigned iterations)
 {
     if (pstat == NULL) {
         return;
@@ -90,7 +37,7 @@ print_permtest_one(input_t * restrict pinput,
 
     myfwrite_uint(F, CLASS_PERMTEST);
     myfwrite_uint(F, yx);
-    myfwrite_uint(F, pinput->iterations);
+    myfwrite_uint(F, iterations);
     myfwrite_uint(F, pinput->collections.ncol);
 
     // Summary
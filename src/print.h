@@ -13,7 +13,8 @@ void
 print_permtest_one(input_t * restrict pinput,
                    const collection_t * restrict pcoll,
                    const stat_t * restrict pstat,
-                   unsigned yx);
+                   unsigned yx,
+                   unsigned iterations);
 
 void
 print_curves_one(input_t * restrict pinput,
@@ -3,34 +3,75 @@
 #include "io.h"
 #include "malloc.h"
 #include "util.h"
+#include <errno.h>
 #include <stdlib.h>
 #include <stdio.h>
+#include <sys/stat.h>
+
+// Older versions of types-rng wrote exactly NGEN states without a
+// header; such a file is recognised by its size, as long as it can be
+// read again from the start.
+
+static bool
+is_headerless(myfile_t * restrict f)
+{
+    struct stat st;
+    if (f->standard_stream || fstat(fileno(f->file), &st) != 0 || !S_ISREG(st.st_mode)) {
+        return false;
+    }
+    if ((size_t)st.st_size != (size_t)NGEN * sizeof(rng_state_t)) {
+        return false;
+    }
+    if (fseek(f->file, 0, SEEK_SET) != 0) {
+        myioerror(f, errno, "fseek");
+    }
+    return true;
+}
 
 rng_state_t *
-rng_state_read(myfile_t * restrict f)
+rng_state_read(myfile_t * restrict f, unsigned * restrict pstreams)
 {
     rng_state_t *rng_state_init;
     assert(is_open(f));
-    MYFREAD_MALLOC(f, rng_state_init, rng_state_t, NGEN);
+    unsigned magic = myfread_uint(f);
+    if (magic != RNG_STATE_MAGIC) {
+        if (is_headerless(f)) {
+            MYFREAD_MALLOC(f, rng_state_init, rng_state_t, NGEN);
+            myfread_zero_exact(f);
+            *pstreams = NGEN;
+            return rng_state_init;
+        }
+        myerror("%s: wrong file format, expected file type %X, got file type %X; "
+                "if the file was made by an older version, run types-rng to generate it again",
+                f->filename, RNG_STATE_MAGIC, magic);
+    }
+    unsigned streams = myfread_uint(f);
+    if (streams == 0) {
+        myerror("%s: invalid rng state: no generator streams", f->filename);
+    }
+    MYFREAD_MALLOC(f, rng_state_init, rng_state_t, streams);
     myfread_zero_exact(f);
+    *pstreams = streams;
     return rng_state_init;
 }
 
 void
-rng_state_write(myfile_t * restrict f, const rng_state_t * restrict rng_state)
+rng_state_write(myfile_t * restrict f, const rng_state_t * restrict rng_state, unsigned streams)
 {
-    myfwrite(f, rng_state, sizeof(rng_state_t), NGEN);
+    myfwrite_uint(f, RNG_STATE_MAGIC);
+    myfwrite_uint(f, streams);
+    myfwrite(f, rng_state, sizeof(rng_state_t), streams);
 }
 
 unsigned
-get_generator(unsigned processes, unsigned id)
+get_generator(unsigned streams, unsigned processes, unsigned id)
 {
     assert(id >= 1);
-    return split(NGEN, processes, id-1);
+    return split(streams, processes, id-1);
 }
 
 unsigned
-get_iteration(unsigned iterations, unsigned part)
+get_iteration(unsigned streams, unsigned iterations, unsigned part)
 {
-    return split(iterations, NGEN, part);
+    return split(iterations, streams, part);
 }
@@ -45,11 +45,16 @@ my_clz(unsigned n)
 
 typedef sfmt_t rng_state_t;
 
+// An rng state file holds the initial states of a number of
+// generator streams; stream i+1 starts 10^60 steps after stream i,
+// so the first streams of a larger file are the same as the streams
+// of a smaller file.
+
 rng_state_t *
-rng_state_read(myfile_t * restrict f);
+rng_state_read(myfile_t * restrict f, unsigned * restrict pstreams);
 
 void
-rng_state_write(myfile_t * restrict f, const rng_state_t * restrict rng_state);
+rng_state_write(myfile_t * restrict f, const rng_state_t * restrict rng_state, unsigned streams);
 
 
 // Return a random unsigned integer between 0 and n-1.
@@ -75,19 +80,19 @@ myrand_n(rng_state_t * restrict rng_state, unsigned n)
 }
 
 // If
-//   i = get_iteration(processes, id)
-//   j = get_iteration(processes, id+1),
-// then process id uses RNGs i..j
+//   i = get_generator(streams, processes, id)
+//   j = get_generator(streams, processes, id+1),
+// then process id uses RNGs i..j-1
 
 unsigned
-get_generator(unsigned processes, unsigned id);
+get_generator(unsigned streams, unsigned processes, unsigned id);
 
 // If
-//   a = get_iteration(iterations, i)
-//   b = get_iteration(iterations, i+1),
+//   a = get_iteration(streams, iterations, i)
+//   b = get_iteration(streams, iterations, i+1),
 // then we will use RNG i for iterations in the range [a,b).
 
 unsigned
-get_iteration(unsigned iterations, unsigned part);
+get_iteration(unsigned streams, unsigned iterations, unsigned part);
 
 #endif
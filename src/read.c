@@ -5,70 +5,158 @@
 #include "malloc.h"
 #include "matrix.h"
 #include <assert.h>
+#include <limits.h>
+#include <stdlib.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+
+static void
+choose_kernel(input_t * restrict pinput, unsigned nrow, unsigned ncol, unsigned nnonzero)
+{
+    double dense_size = (double)nrow * (double)ncol;
+    double sparse_size = (double)nrow + (double)nnonzero;
+    double ratio = dense_size / sparse_size;
+    if (!pinput->dense && !pinput->sparse) {
+        if (ratio > SPARSITY_HEURISTIC) {
+            pinput->sparse = true;
+        } else {
+            pinput->dense = true;
+        }
+    }
+}
 
 static void
 sparsify(input_t * restrict pinput, const plan_t * restrict pplan)
 {
     if (pplan->requirements & (WITH_MATRIX_BINARY | WITH_MATRIX_ZOM)) {
-        double dense_size = (double)pinput->types.nrow * (double)pinput->types.ncol;
-        double sparse_size = (double)pinput->types.nrow + (double)pinput->types.nnonzero;
-        double ratio = dense_size / sparse_size;
-        if (!pinput->dense && !pinput->sparse) {
-            if (ratio > SPARSITY_HEURISTIC) {
-                pinput->sparse = true;
-            } else {
-                pinput->dense = true;
-            }
-        }
-        if (pinput->sparse) {
+        if (pinput->sparse || pinput->calibrate) {
             init_sparse_matrix(&pinput->types);
         }
     }
 }
 
-void
-read_raw_input(input_t * restrict pinput, const plan_t * restrict pplan)
+#define F (&pinput->raw_input_file)
+
+// Version 2: the header has room for 16 values; an input file written by
+// an older types-query has zeros in place of the totals.
+
+enum {
+    SECTION_WORD_COUNT,
+    SECTION_SAMPLECOLL,
+    SECTION_ROWSUM,
+    SECTION_START,
+    SECTION_INCIDENCE,
+    SECTION_END,
+    NSECTION
+};
+
+static void
+get_sections(const input_t * restrict pinput, size_t * restrict pos)
 {
+    pos[SECTION_WORD_COUNT] = INPUT_HEADER;
+    pos[SECTION_SAMPLECOLL] = pos[SECTION_WORD_COUNT] + INPUT_ALIGN(pinput->nsample);
+    pos[SECTION_ROWSUM]     = pos[SECTION_SAMPLECOLL] + INPUT_ALIGN((size_t)pinput->nsamplecoll * 2);
+    pos[SECTION_START]      = pos[SECTION_ROWSUM] + INPUT_ALIGN(pinput->nsample);
+    pos[SECTION_INCIDENCE]  = pos[SECTION_START] + INPUT_ALIGN((size_t)pinput->nsample + 1);
+    pos[SECTION_END]        = pos[SECTION_INCIDENCE] + INPUT_ALIGN(pinput->nsampletype);
+}
 
-#define F (&pinput->raw_input_file)
+static void
+read_header_v2(input_t * restrict pinput)
+{
+    unsigned header[INPUT_HEADER];
+    myfread(F, header + 1, sizeof(unsigned), INPUT_HEADER - 1);
+    pinput->nsample     = header[1];
+    pinput->ncoll       = header[2];
+    pinput->ntype       = header[3];
+    pinput->nsamplecoll = header[4];
+    pinput->nsampletype = header[5];
+    pinput->xmax.x[XTOKEN] = header[6];
+    pinput->ymax.y[YTOKEN] = header[6];
+    pinput->xmax.x[XWORD]  = header[7];
+
+    size_t pos[NSECTION];
+    get_sections(pinput, pos);
+    pinput->raw_input_size = pos[SECTION_END] * sizeof(unsigned);
+    struct stat st;
+    pinput->raw_input_mapped = !F->standard_stream
+        && fstat(fileno(F->file), &st) == 0 && S_ISREG(st.st_mode);
+}
 
+// The sizes are known before anything else is read, and
+// the memory usage can be estimated from them; see plan.c.
+
+void
+read_raw_input_header(input_t * restrict pinput, const plan_t * restrict pplan)
+{
     assert(is_open(F));
 
     unsigned magic = myfread_uint(F);
-    if (magic != INPUT_MAGIC) {
-        if (magic == OUTPUT_MAGIC) {
-            myerror("%s: wrong file format, this is an output file, not an input file", (F)->filename);
-        } else {
-            myerror("%s: wrong file format, expected file type %X, got file type %X", (F)->filename, INPUT_MAGIC, magic);
-        }
+    if (magic == INPUT_MAGIC) {
+        pinput->nsample     = myfread_uint(F);
+        pinput->ncoll       = myfread_uint(F);
+        pinput->ntype       = myfread_uint(F);
+        pinput->nsamplecoll = myfread_uint(F);
+        pinput->nsampletype = myfread_uint(F);
+    } else if (magic == INPUT_MAGIC2) {
+        read_header_v2(pinput);
+    } else if (magic == OUTPUT_MAGIC) {
+        myerror("%s: wrong file format, this is an output file, not an input file", (F)->filename);
+    } else {
+        myerror("%s: wrong file format, expected file type %X or %X, got file type %X",
+                (F)->filename, INPUT_MAGIC2, INPUT_MAGIC, magic);
     }
+    pinput->raw_input_magic = magic;
 
-    unsigned nsample     = myfread_uint(F);
-    unsigned ncoll       = myfread_uint(F);
-    unsigned ntype       = myfread_uint(F);
-    unsigned nsamplecoll = myfread_uint(F);
-    unsigned nsampletype = myfread_uint(F);
-
-    assert(nsample > 0);
-    assert(ncoll > 0);
-    assert(ntype > 0);
-    assert(nsamplecoll > 0);
-    assert(nsampletype > 0);
+    assert(pinput->nsample > 0);
+    assert(pinput->ncoll > 0);
+    assert(pinput->ntype > 0);
+    assert(pinput->nsamplecoll > 0);
+    assert(pinput->nsampletype > 0);
 
-    pinput->word_count = init_array(nsample);
-    for (unsigned i = 0; i < nsample; i++) {
-        unsigned v =  myfread_uint(F);
-        array_set(&pinput->word_count, i, v);
+    if (pplan->requirements & (WITH_MATRIX_BINARY | WITH_MATRIX_ZOM)) {
+        choose_kernel(pinput, pinput->nsample, pinput->ntype, pinput->nsampletype);
     }
+    pinput->ymax.y[YTYPE]  = pinput->ntype;
+    pinput->ymax.y[YHAPAX] = pinput->ntype;
+}
 
+static void
+read_collections(input_t * restrict pinput, unsigned nsample, unsigned ncoll,
+                 unsigned nsamplecoll, const unsigned * restrict samplecoll)
+{
     pinput->collections = init_matrix(nsample, ncoll, true, false, false);
     for (unsigned i = 0; i < nsamplecoll; i++) {
-        unsigned sampleid = myfread_uint(F);
-        unsigned collid   = myfread_uint(F);
+        unsigned sampleid = samplecoll[2*i];
+        unsigned collid   = samplecoll[2*i + 1];
         assert(0 < sampleid && sampleid <= nsample);
         assert(0 < collid && collid <= ncoll);
         matrix_set(&pinput->collections, sampleid - 1, collid - 1, 1);
     }
+}
+
+// Version 1: a stream of sample-collection and sample-type pairs.
+
+static void
+read_raw_input_v1(input_t * restrict pinput, const plan_t * restrict pplan)
+{
+    unsigned nsample     = pinput->nsample;
+    unsigned ncoll       = pinput->ncoll;
+    unsigned ntype       = pinput->ntype;
+    unsigned nsamplecoll = pinput->nsamplecoll;
+    unsigned nsampletype = pinput->nsampletype;
+
+    pinput->word_count = init_array(nsample);
+    for (unsigned i = 0; i < nsample; i++) {
+        unsigned v =  myfread_uint(F);
+        array_set(&pinput->word_count, i, v);
+    }
+
+    unsigned *samplecoll;
+    MYMALLOC2(samplecoll, unsigned, nsamplecoll, 2);
+    myfread(F, samplecoll, sizeof(unsigned), (size_t)nsamplecoll * 2);
+    read_collections(pinput, nsample, ncoll, nsamplecoll, samplecoll);
+    free(samplecoll);
 
     pinput->types = init_matrix(
         nsample, ntype,
@@ -86,20 +174,125 @@ read_raw_input(input_t * restrict pinput, const plan_t * restrict pplan)
         matrix_set(&pinput->types, sampleid - 1, typeid - 1, v);
     }
     myfread_zero_exact(F);
+
+    sparsify(pinput, pplan);
+}
+
+// Version 2: aligned sections, with the sample-type pairs already in
+// the sparse representation. A regular file is mapped to memory, and
+// the sparse representation is used in place; hence all processes
+// that read the same file share the same copy of it.
+
+static void
+load_raw_input(input_t * restrict pinput)
+{
+    size_t n = pinput->raw_input_size / sizeof(unsigned);
+    if (pinput->raw_input_mapped) {
+        struct stat st;
+        if (fstat(fileno(F->file), &st) != 0) {
+            myioerror(F, errno, "fstat");
+        }
+        if ((size_t)st.st_size != pinput->raw_input_size) {
+            myerror("%s: wrong file size, expected %zu bytes, got %zu bytes",
+                    F->filename, pinput->raw_input_size, (size_t)st.st_size);
+        }
+        void *p = mmap(NULL, pinput->raw_input_size, PROT_READ, MAP_SHARED, fileno(F->file), 0);
+        if (p == MAP_FAILED) {
+            myioerror(F, errno, "mmap");
+        }
+        pinput->raw_input_data = p;
+    } else {
+        MYMALLOCZ(pinput->raw_input_data, unsigned, n, 0);
+        myfread(F, pinput->raw_input_data + INPUT_HEADER, sizeof(unsigned), n - INPUT_HEADER);
+        myfread_zero_exact(F);
+    }
+}
+
+static void
+read_raw_input_v2(input_t * restrict pinput, const plan_t * restrict pplan)
+{
+    unsigned nsample     = pinput->nsample;
+    unsigned ncoll       = pinput->ncoll;
+    unsigned ntype       = pinput->ntype;
+    unsigned nsamplecoll = pinput->nsamplecoll;
+    unsigned nsampletype = pinput->nsampletype;
+
+    size_t pos[NSECTION];
+    get_sections(pinput, pos);
+    size_t word_count_pos = pos[SECTION_WORD_COUNT];
+    size_t samplecoll_pos = pos[SECTION_SAMPLECOLL];
+    size_t rowsum_pos     = pos[SECTION_ROWSUM];
+    size_t start_pos      = pos[SECTION_START];
+    size_t incidence_pos  = pos[SECTION_INCIDENCE];
+    load_raw_input(pinput);
+    const unsigned * restrict data = pinput->raw_input_data;
+
+    pinput->word_count = init_array(nsample);
+    for (unsigned i = 0; i < nsample; i++) {
+        array_set(&pinput->word_count, i, data[word_count_pos + i]);
+    }
+
+    read_collections(pinput, nsample, ncoll, nsamplecoll, data + samplecoll_pos);
+
+    bool matrix = pplan->requirements & (WITH_MATRIX_BINARY | WITH_MATRIX_ZOM);
+    bool dense = matrix && (pinput->dense || pinput->calibrate);
+    pinput->types = init_matrix(
+        nsample, ntype,
+        dense && (pplan->requirements & WITH_MATRIX_BINARY),
+        dense && (pplan->requirements & WITH_MATRIX_ZOM),
+        true
+    );
+    matrix_t * restrict types = &pinput->types;
+    types->nnonzero = nsampletype;
+    for (unsigned i = 0; i < nsample; i++) {
+        unsigned v = data[rowsum_pos + i];
+        if (types->sum + v < types->sum) {
+            myerror("overflow: the sum of elements exceeds %u", UINT_MAX);
+        }
+        types->sum += v;
+        types->rowsum[i] = v;
+    }
+    types->sparse_start = pinput->raw_input_data + start_pos;
+    types->sparse_incidence = pinput->raw_input_data + incidence_pos;
+    types->sparse_shared = true;
+
+    assert(types->sparse_start[0] == 0);
+    assert(types->sparse_start[nsample] == nsampletype);
+    for (unsigned i = 0; i < nsample; i++) {
+        assert(types->sparse_start[i] <= types->sparse_start[i + 1]);
+    }
+    for (unsigned k = 0; k < nsampletype; k++) {
+        assert((types->sparse_incidence[k] >> 1) < ntype);
+    }
+
+    if (types->b || types->zom) {
+        init_dense_from_sparse(types);
+    }
+}
+
+void
+read_raw_input(input_t * restrict pinput, const plan_t * restrict pplan)
+{
+    if (pinput->raw_input_magic == INPUT_MAGIC) {
+        read_raw_input_v1(pinput, pplan);
+    } else {
+        read_raw_input_v2(pinput, pplan);
+    }
     myclose_if_needed(F);
 
+    if ((pinput->xmax.x[XTOKEN] != 0 && pinput->xmax.x[XTOKEN] != pinput->types.sum)
+        || (pinput->xmax.x[XWORD] != 0 && pinput->xmax.x[XWORD] != pinput->word_count.sum)) {
+        myerror("%s: wrong file format, the totals in the header do not match the data", (F)->filename);
+    }
     pinput->xmax.x[XTOKEN] = pinput->types.sum;
     pinput->ymax.y[YTYPE]  = pinput->types.ncol;
     pinput->ymax.y[YHAPAX] = pinput->types.ncol;
     pinput->ymax.y[YTOKEN] = pinput->types.sum;
     pinput->xmax.x[XWORD]  = pinput->word_count.sum;
-
-    sparsify(pinput, pplan);
+}
 
 #undef F
 
-}
-
 void
 postprocess_type_word_count(input_t * restrict pinput, const plan_t * restrict pplan)
 {
@@ -4,6 +4,9 @@
 #include "input.h"
 #include "plan.h"
 
+void
+read_raw_input_header(input_t * restrict pinput, const plan_t * restrict pplan);
+
 void
 read_raw_input(input_t * restrict pinput, const plan_t * restrict pplan);
 
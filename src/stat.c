@@ -1,7 +1,10 @@
 #include "stat.h"
 
 #include "malloc.h"
+#include "util.h"
+#include <assert.h>
 #include <stdlib.h>
+#include <string.h>
 
 const stat_t STAT_NULL_C = STAT_NULL;
 const yxstat_t YXSTAT_NULL_C = YXSTAT_NULL;
@@ -43,3 +46,170 @@ free_stat(const yxstat_t * restrict pyxstat)
         }
     }
 }
+
+accum_t *
+alloc_accum(const yxbool_t * restrict create, const yx_t * restrict elements, yxstat_t * restrict total)
+{
+    accum_t * restrict paccum;
+    MYMALLOC(paccum, accum_t, 1);
+    paccum->pending = 0;
+    paccum->total = total;
+    for (unsigned i = 0; i < NYX; i++) {
+        paccum->yx[i] = NULL;
+        paccum->elements.yx[i] = 0;
+        if (create->yx[i]) {
+            assert(total->yx[i] != NULL && total->elements.yx[i] == elements->yx[i]);
+            paccum->elements.yx[i] = elements->yx[i];
+            MYMALLOC(paccum->yx[i], stat_16_t, elements->yx[i]);
+            memset(paccum->yx[i], 0, elements->yx[i] * sizeof(stat_16_t));
+        }
+    }
+    return paccum;
+}
+
+void
+flush_accum(accum_t * restrict paccum)
+{
+    if (paccum->pending == 0) {
+        return;
+    }
+    #pragma omp critical(flush_accum)
+    {
+        for (unsigned i = 0; i < NYX; i++) {
+            if (paccum->yx[i]) {
+                stat_t * restrict target = paccum->total->yx[i];
+                const stat_16_t * restrict source = paccum->yx[i];
+                for (unsigned j = 0; j < paccum->elements.yx[i]; j++) {
+                    target[j].lower += source[j].lower;
+                    target[j].upper += source[j].upper;
+                }
+            }
+        }
+    }
+    for (unsigned i = 0; i < NYX; i++) {
+        if (paccum->yx[i]) {
+            memset(paccum->yx[i], 0, paccum->elements.yx[i] * sizeof(stat_16_t));
+        }
+    }
+    paccum->pending = 0;
+}
+
+void
+free_accum(accum_t * restrict paccum)
+{
+    flush_accum(paccum);
+    for (unsigned i = 0; i < NYX; i++) {
+        if (paccum->yx[i]) {
+            free(paccum->yx[i]);
+        }
+    }
+    free(paccum);
+}
+
+void
+write_stat_compressed(myfile_t * restrict f, const stat_t * restrict pstat, size_t n)
+{
+    unsigned zerocount = 0;
+    for (size_t i = 0; i < n; i++) {
+        const stat_t s = pstat[i];
+        unsigned max = MAX(s.lower, s.upper);
+        if (max == 0) {
+            zerocount++;
+            if (zerocount == STAT_ZEROCOUNT_MAX) {
+                myfwrite_uchar(f, zerocount);
+                zerocount = 0;
+            }
+        } else {
+            if (zerocount) {
+                myfwrite_uchar(f, zerocount);
+                zerocount = 0;
+            }
+            if (max < (1<<2)) {
+                unsigned v = 0;
+                v |= s.lower;
+                v <<= 2;
+                v |= s.upper;
+                v |= STAT_2_MASK;
+                myfwrite_uchar(f, v);
+            } else if (max < (1<<4)) {
+                unsigned v = 0;
+                v |= s.lower;
+                v <<= 4;
+                v |= s.upper;
+                myfwrite_uchar(f, STAT_4);
+                myfwrite_uchar(f, v);
+            } else if (max < (1<<8)) {
+                stat_8_t ss = { s.lower, s.upper };
+                myfwrite_uchar(f, STAT_8);
+                myfwrite(f, &ss, sizeof(ss), 1);
+            } else if (max < (1<<16)) {
+                stat_16_t ss = { s.lower, s.upper };
+                myfwrite_uchar(f, STAT_16);
+                myfwrite(f, &ss, sizeof(ss), 1);
+            } else {
+                stat_32_t ss = { s.lower, s.upper };
+                myfwrite_uchar(f, STAT_32);
+                myfwrite(f, &ss, sizeof(ss), 1);
+            }
+        }
+    }
+    if (zerocount) {
+        myfwrite_uchar(f, zerocount);
+        zerocount = 0;
+    }
+    myfwrite_uchar(f, STAT_END);
+}
+
+void
+read_stat_compressed(const myfile_t * restrict f, stat_t * restrict pstat, size_t n)
+{
+    size_t i = 0;
+    while (true) {
+        unsigned c = myfread_uchar(f);
+        if (c == STAT_END) {
+            break;
+        }
+        if (c <= STAT_ZEROCOUNT_MAX) {
+            if (c > n - i) {
+                myerror("%s: too much data in the record", f->filename);
+            }
+            for (unsigned j = 0; j < c; j++) {
+                pstat[i++] = STAT_NULL_C;
+            }
+            continue;
+        }
+        if (i == n) {
+            myerror("%s: too much data in the record", f->filename);
+        }
+        stat_t s = STAT_NULL;
+        if (c >= STAT_2_MASK) {
+            s.upper = c & 0x03;
+            s.lower = (c >> 2) & 0x03;
+        } else if (c == STAT_4) {
+            unsigned c2 = myfread_uchar(f);
+            s.upper = c2 & 0x0F;
+            s.lower = (c2 >> 4) & 0x0F;
+        } else if (c == STAT_8) {
+            stat_8_t ss;
+            myfread(f, &ss, sizeof(ss), 1);
+            s.lower = ss.lower;
+            s.upper = ss.upper;
+        } else if (c == STAT_16) {
+            stat_16_t ss;
+            myfread(f, &ss, sizeof(ss), 1);
+            s.lower = ss.lower;
+            s.upper = ss.upper;
+        } else if (c == STAT_32) {
+            stat_32_t ss;
+            myfread(f, &ss, sizeof(ss), 1);
+            s.lower = ss.lower;
+            s.upper = ss.upper;
+        } else {
+            myerror("%s: invalid data", f->filename);
+        }
+        pstat[i++] = s;
+    }
+    if (i != n) {
+        myerror("%s: unexpected end-of-record indicator", f->filename);
+    }
+}
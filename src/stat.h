@@ -58,4 +58,43 @@ typedef struct {
     uint32_t upper;
 } stat_32_t;
 
+//// Per-thread accumulators for curves
+//
+// Each iteration adds at most one to each counter, so 16-bit counters
+// suffice if they are added to the shared 32-bit total at least once
+// in UINT16_MAX iterations.
+
+typedef struct {
+    stat_16_t * restrict yx[NYX];
+    yx_t elements;
+    unsigned pending;           // iterations since the last flush
+    yxstat_t * restrict total;
+} accum_t;
+
+accum_t *
+alloc_accum(const yxbool_t * restrict create, const yx_t * restrict elements, yxstat_t * restrict total);
+
+void
+flush_accum(accum_t * restrict paccum);
+
+void
+free_accum(accum_t * restrict paccum);
+
+inline static void
+accum_iteration(accum_t * restrict paccum)
+{
+    paccum->pending++;
+    if (paccum->pending == UINT16_MAX) {
+        flush_accum(paccum);
+    }
+}
+
+//// Reading and writing
+
+void
+write_stat_compressed(myfile_t * restrict f, const stat_t * restrict pstat, size_t n);
+
+void
+read_stat_compressed(const myfile_t * restrict f, stat_t * restrict pstat, size_t n);
+
 #endif
@@ -10,9 +10,17 @@ main(int argc, char **argv)
     input_t input = INPUT_NULL_C;
     plan_t plan;
     parse_command_line(&input, argc, argv);
-    execution_plan(&input, &plan);
-    process_input(&input, &plan);
-    execute_all(&input, &plan);
+    if (input.server) {
+        serve_all(&input);
+    } else {
+        execution_plan(&input, &plan);
+        process_input(&input, &plan);
+        if (input.calibrate) {
+            calibrate_all(&input, &plan);
+        } else {
+            execute_all(&input, &plan);
+        }
+    }
     free_input(&input);
     return EXIT_SUCCESS;
 }
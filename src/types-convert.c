@@ -201,7 +201,7 @@ main(int argc, char **argv)
     const char *sample_collection_file = argv[4];
 
     db_open(database, true);
-    db_exec("BEGIN", NOBIND);
+    db_exec("BEGIN IMMEDIATE", NOBIND);
     recreate_corpus(corpuscode);
     unsigned nsample = read_wordcount_file(corpuscode, wordcount_file);
     read_sample_collection_file(corpuscode, sample_collection_file, nsample);
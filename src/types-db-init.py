@@ -1,13 +1,44 @@
-import sys
+import optparse
 import TypesDatabase
 
-def db_init(filename=TypesDatabase.DEFAULT_FILENAME):
+TOOL = 'types-db-init'
+
+def get_args():
+    parser = optparse.OptionParser(
+        usage='%prog [options] [DATABASE ...]',
+        description='Create or update the database schema.',
+        version=TypesDatabase.version_string(TOOL),
+    )
+    parser.add_option('--summary', dest='summary', action='store_true',
+                      help='keep view_result and the missing-work views in summary tables')
+    parser.add_option('--no-summary', dest='summary', action='store_false',
+                      help='compute view_result and the missing-work views on each query')
+    parser.add_option('--packed-curves', dest='packed', action='store_true',
+                      help='store the points of each curve as one blob in result_curve_data')
+    parser.add_option('--no-packed-curves', dest='packed', action='store_false',
+                      help='store each point of a curve as a row of result_curve_point')
+    parser.add_option('--curve-grids', dest='grids', action='store_true',
+                      help='keep the curve grids in result_curve_grid, so that curves for new levels can be derived without new permutations')
+    parser.add_option('--no-curve-grids', dest='grids', action='store_false',
+                      help='do not keep the curve grids')
+    parser.add_option('--wal', dest='wal', action='store_true',
+                      help='use a write-ahead log, so that readers and writers do not block each other')
+    parser.add_option('--no-wal', dest='wal', action='store_false',
+                      help='use a rollback journal')
+    (options, args) = parser.parse_args()
+    options.filenames = args if len(args) > 0 else [ TypesDatabase.DEFAULT_FILENAME ]
+    return options
+
+def db_init(filename, summary, packed, grids, wal):
     conn = TypesDatabase.open_db(filename)
-    TypesDatabase.create_if_needed(conn)
+    TypesDatabase.create_if_needed(conn, summary, packed, grids)
     conn.commit()
+    if wal is not None:
+        TypesDatabase.set_wal(conn, wal)
+
+def main():
+    args = get_args()
+    for filename in args.filenames:
+        db_init(filename, args.summary, args.packed, args.grids, args.wal)
 
-if len(sys.argv) > 1:
-    for filename in sys.argv[1:]:
-        db_init(filename)
-else:
-    db_init()
+main()
@@ -6,7 +6,8 @@ def db_init(filename=TypesDatabase.DEFAULT_FILENAME):
     conn = TypesDatabase.open_db(filename)
     TypesDatabase.drop_views(conn)
     TypesDatabase.create_if_needed(conn)
-    TypesDatabase.refresh_result(conn)
+    TypesDatabase.refresh_summary(conn)
+    TypesDatabase.refresh_result(conn, full=True)
     conn.commit()
 
 if len(sys.argv) > 1:
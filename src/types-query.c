@@ -1,7 +1,10 @@
+#include <limits.h>
 #include <stdio.h>
 #include <stdlib.h>
+#include <string.h>
 #include "config.h"
 #include "db2.h"
+#include "malloc.h"
 #include "version.h"
 
 const char * const TOOL = "types-query";
@@ -20,11 +23,21 @@ usage(void)
         "Usage: %s <VERBOSITY> <DATABASE> <CORPUSCODE> <DATASETCODE> <TARGET-FILE>\n"
         "\n"
         "VERBOSITY: 'V' for verbose, 'P' for progress information, '-' for no output\n"
+        "TARGET-FILE: '-' for stdout, e.g. for piping the data to 'types-comp --raw-input -'\n"
         "\n",
         TOOL);
     exit(EXIT_SUCCESS);
 }
 
+static void
+write_section(const myfile_t * restrict f, const unsigned * restrict data, size_t n)
+{
+    myfwrite(f, data, sizeof(unsigned), n);
+    for (size_t i = n; i < INPUT_ALIGN(n); i++) {
+        myfwrite_uint(f, 0);
+    }
+}
+
 int
 main(int argc, char **argv)
 {
@@ -59,25 +72,83 @@ main(int argc, char **argv)
         myerror("%s: corpus %s, data set %s: no data", database, corpuscode, datasetcode);
     }
 
-    myfile_t f = myopen(target_file, true);
+    // Data, with the sample-type pairs in the sparse representation of types-comp
+
+    unsigned *word_count;
+    unsigned *samplecoll;
+    unsigned *sampletype;
+    unsigned *rowsum;
+    unsigned *sparse_start;
+    unsigned *sparse_incidence;
+    MYMALLOC(word_count, unsigned, nsample);
+    MYMALLOC2(samplecoll, unsigned, nsamplecoll, 2);
+    MYMALLOC2(sampletype, unsigned, nsampletype, 3);
+    MYMALLOCZ(rowsum, unsigned, nsample, 0);
+    MYMALLOCZ(sparse_start, unsigned, nsample + 1, 0);
+    MYMALLOC(sparse_incidence, unsigned, nsampletype);
+
+    db_loadarray(word_count, nsample,     1, "SELECT wordcount FROM tmp_sample ORDER BY rowid",           NOBIND);
+    db_loadarray(samplecoll, nsamplecoll, 2, "SELECT sampleid, collectionid FROM tmp_sample_collection",  NOBIND);
+    db_loadarray(sampletype, nsampletype, 3, "SELECT sampleid, typeid, tokencount FROM tmp_sample_token ORDER BY sampleid, typeid", NOBIND);
+
+    for (unsigned i = 0; i < nsampletype; i++) {
+        unsigned sampleid = sampletype[3*i];
+        unsigned typeid   = sampletype[3*i + 1];
+        unsigned v        = sampletype[3*i + 2];
+        if (rowsum[sampleid - 1] + v < rowsum[sampleid - 1]) {
+            myerror("overflow: the sum of elements exceeds %u", UINT_MAX);
+        }
+        rowsum[sampleid - 1] += v;
+        sparse_start[sampleid]++;
+        sparse_incidence[i] = ((typeid - 1) << 1) | (v > 1);
+    }
+    for (unsigned i = 0; i < nsample; i++) {
+        sparse_start[i + 1] += sparse_start[i];
+    }
+
+    // The totals let types-comp estimate its memory usage from the header
+
+    unsigned token_sum = 0;
+    unsigned word_sum = 0;
+    for (unsigned i = 0; i < nsample; i++) {
+        if (token_sum + rowsum[i] < token_sum || word_sum + word_count[i] < word_sum) {
+            myerror("overflow: the sum of elements exceeds %u", UINT_MAX);
+        }
+        token_sum += rowsum[i];
+        word_sum += word_count[i];
+    }
+
+    myfile_t f = strcmp(target_file, "-") == 0 ? myopen_stdout() : myopen(target_file, true);
 
     // Header
 
-    myfwrite_uint(&f, INPUT_MAGIC);
+    myfwrite_uint(&f, INPUT_MAGIC2);
     myfwrite_uint(&f, nsample);
     myfwrite_uint(&f, ncoll);
     myfwrite_uint(&f, ntype);
     myfwrite_uint(&f, nsamplecoll);
     myfwrite_uint(&f, nsampletype);
+    myfwrite_uint(&f, token_sum);
+    myfwrite_uint(&f, word_sum);
+    for (unsigned i = 8; i < INPUT_HEADER; i++) {
+        myfwrite_uint(&f, 0);
+    }
 
-    // Data
-
-    db_storearray(&f, nsample,     1, "SELECT wordcount FROM tmp_sample ORDER BY rowid",           NOBIND);
-    db_storearray(&f, nsamplecoll, 2, "SELECT sampleid, collectionid FROM tmp_sample_collection",  NOBIND);
-    db_storearray(&f, nsampletype, 3, "SELECT sampleid, typeid, tokencount FROM tmp_sample_token", NOBIND);
+    write_section(&f, word_count, nsample);
+    write_section(&f, samplecoll, (size_t)nsamplecoll * 2);
+    write_section(&f, rowsum, nsample);
+    write_section(&f, sparse_start, (size_t)nsample + 1);
+    write_section(&f, sparse_incidence, nsampletype);
 
     myclose(&f);
 
+    free(word_count);
+    free(samplecoll);
+    free(sampletype);
+    free(rowsum);
+    free(sparse_start);
+    free(sparse_incidence);
+
     db_exec("COMMIT", NOBIND);
 
     if (progress) {
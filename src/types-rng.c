@@ -1,3 +1,5 @@
+#include <errno.h>
+#include <limits.h>
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
@@ -21,27 +23,44 @@ usage(void)
         "\n"
         "Generate the initial state for the random number generator.\n"
         "\n"
-        "Usage: %s <RNG-STATE-FILE>\n"
+        "Usage: %s <RNG-STATE-FILE> [<STREAMS>]\n"
+        "\n"
+        "STREAMS is the number of independent generator streams, and the\n"
+        "maximum number of parallel processes (default %u). The results of\n"
+        "types-comp depend on the number of streams.\n"
         "\n",
-        TOOL);
+        TOOL, NGEN);
     exit(EXIT_SUCCESS);
 }
 
+static unsigned
+get_streams(const char * restrict s)
+{
+    char *pend;
+    errno = 0;
+    long long v = strtoll(s, &pend, 10);
+    if (*s == '\0' || *pend != '\0' || errno == ERANGE || v < 1 || v > UINT_MAX) {
+        myerror("STREAMS: expected a positive integer, got: %s", s);
+    }
+    return (unsigned)v;
+}
+
 int
 main(int argc, char **argv)
 {
     if (argc == 1) {
         usage();
     }
-    if (argc != 2) {
+    if (argc != 2 && argc != 3) {
         myerror("wrong number of parameters");
     }
     const char *rng_state_file = argv[1];
+    const unsigned streams = argc == 3 ? get_streams(argv[2]) : NGEN;
 
     // Setup seed
 
     rng_state_t *rng_state;
-    MYMALLOC(rng_state, rng_state_t, NGEN);
+    MYMALLOC(rng_state, rng_state_t, streams);
     uint32_t seed[SEED_LENGTH];
     memcpy(seed, SEED, sizeof(seed));
 
@@ -49,7 +68,7 @@ main(int argc, char **argv)
     
     fprintf(stderr, "%s: ", TOOL);
     sfmt_init_by_array(&rng_state[0], seed, SEED_LENGTH);
-    for (unsigned i = JUMP_FACTOR; i < NGEN; i += JUMP_FACTOR) {
+    for (unsigned i = JUMP_FACTOR; i < streams; i += JUMP_FACTOR) {
         fprintf(stderr, ":");
         rng_state_t tmp = rng_state[i-JUMP_FACTOR];
         SFMT_jump(&tmp, JUMP_MANY);
@@ -61,8 +80,8 @@ main(int argc, char **argv)
     // - 101, 102, 102, ..., 199
 
     #pragma omp parallel for
-    for (unsigned i = 0; i < NGEN; i += JUMP_FACTOR) {
-        for (unsigned j = i+1; j < i+JUMP_FACTOR && j < NGEN; j++) {
+    for (unsigned i = 0; i < streams; i += JUMP_FACTOR) {
+        for (unsigned j = i+1; j < i+JUMP_FACTOR && j < streams; j++) {
             fprintf(stderr, ".");
             rng_state_t tmp = rng_state[j-1];
             SFMT_jump(&tmp, JUMP_ONE);
@@ -72,7 +91,7 @@ main(int argc, char **argv)
     fprintf(stderr, "\n");
 
     myfile_t f = myopen(rng_state_file, true);
-    rng_state_write(&f, rng_state);
+    rng_state_write(&f, rng_state, streams);
     myclose(&f);
     free(rng_state);
 
@@ -1,9 +1,13 @@
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+import glob
+import hashlib
 import optparse
 import os
 import os.path
+import socket
 import subprocess
 import sys
+import time
 import TypesDatabase
 
 TOOL = 'types-run'
@@ -14,10 +18,23 @@ CITER=1000000
 PITER=10000000
 X_DEF=1000
 Y_DEF=1000
+JOBS=1
+KERNELS=('auto', 'dense', 'sparse', 'calibrate')
+POLL=0.1
+ETA_INTERVAL=60
+
+# Cost model: number of elementary operations per second
+# that types-comp can do on one core, roughly.
+OPS_PER_SEC=2e8
+SPARSITY_HEURISTIC=50.0
 
 def msg(msg):
     sys.stderr.write("%s: %s\n" % (TOOL, msg))
 
+def error(text):
+    msg('error: %s' % text)
+    sys.exit(1)
+
 def get_args():
     parser = optparse.OptionParser(
         description='Initialise the database and calculate all statistics.',
@@ -29,6 +46,9 @@ def get_args():
     parser.add_option('--bindir', metavar='DIRECTORY', dest='bindir',
                       help='where to find program files [default: %default]',
                       default=BIN_DIR)
+    parser.add_option('--rng-state', metavar='FILE', dest='rngstate',
+                      help='initial state of the random number generators, generated with types-rng; the number of streams in it limits --shards [default: rng-state in bindir]',
+                      default=None)
     parser.add_option('--tmpdir', metavar='FILE', dest='tmpdir',
                       help='where to store temporary files [default: %default]',
                       default=TMP_DIR)
@@ -50,48 +70,301 @@ def get_args():
     parser.add_option('--piter', metavar='N', dest='piter', type=int,
                       help='number of iterations for permutation testing [default: %default]',
                       default=PITER)
+    parser.add_option('--adaptive', dest='adaptive', action='store_true',
+                      help='permutation testing: stop early once all p-values are known to be below or above the smallest default level; --piter is the maximum',
+                      default=False)
     parser.add_option('--x', metavar='N', dest='x',
                       help='maximum x resolution (number of slots) [default: %default]',
                       default=X_DEF)
     parser.add_option('--y', metavar='N', dest='y',
                       help='maximum y resolution (number of slots) [default: %default]',
                       default=Y_DEF)
+    parser.add_option('--jobs', metavar='N', dest='jobs', type=int,
+                      help='number of programs to run in parallel [default: %default]',
+                      default=JOBS)
+    parser.add_option('--max-memory', metavar='MB', dest='maxmemory', type=int,
+                      help='limit the memory usage of all calculations together to about MB megabytes, by using fewer threads if needed [default: no limit]',
+                      default=None)
+    parser.add_option('--kernel', metavar='K', dest='kernel', choices=KERNELS,
+                      help='which variant of the calculation to use for each data set: ' +
+                      '"auto" decides based on how sparse the data is, "calibrate" times both variants ' +
+                      'with a short run of types-comp [default: %default]',
+                      default=KERNELS[0])
+    parser.add_option('--stream', dest='stream', action='store_true',
+                      help='process data sets one by one: query, calculate, and store each data set before moving on to the next one, keeping at most --jobs data sets in progress',
+                      default=False)
+    parser.add_option('--pipe', dest='pipe', action='store_true',
+                      help='do not use temporary files: pipe the data from types-query to types-comp and the results from types-comp to types-store; one data set is calculated at a time',
+                      default=False)
+    parser.add_option('--shards', metavar='N', dest='shards', type=int,
+                      help='split the calculation for each data set in N parts that can run in parallel [default: %default]',
+                      default=1)
+    parser.add_option('--shard-ids', metavar='LIST', dest='shardids',
+                      help='only calculate these parts, e.g. "1-4,7" (for running on several hosts with a shared tmpdir); the results are left in tmpdir for --store-only',
+                      default=None)
+    parser.add_option('--resume', dest='resume', action='store_true',
+                      help='save checkpoints in tmpdir, and continue calculations that were interrupted from them [default: start from scratch, no checkpoints]',
+                      default=False)
+    parser.add_option('--store-only', dest='storeonly', action='store_true',
+                      help='do not calculate anything; store the results of earlier --shard-ids runs that are in tmpdir',
+                      default=False)
     (options, args) = parser.parse_args()
+    if options.jobs < 1:
+        parser.error('--jobs: the argument must be at least 1')
+    if options.shards < 1:
+        parser.error('--shards: the argument must be at least 1')
+    if options.maxmemory is not None and options.maxmemory < options.jobs:
+        parser.error('--max-memory: the argument must be at least --jobs')
+    if options.adaptive and options.shards > 1:
+        parser.error('cannot specify both --adaptive and --shards')
+    if options.pipe and options.shards > 1:
+        parser.error('cannot specify both --pipe and --shards')
+    if options.pipe and options.storeonly:
+        parser.error('cannot specify both --pipe and --store-only')
+    if options.pipe and options.kernel == 'calibrate':
+        parser.error('cannot specify both --pipe and --kernel calibrate')
+    if options.shardids is None:
+        options.shardids = list(range(1, options.shards + 1))
+        options.store = True
+    else:
+        options.shardids = parse_shard_ids(parser, options.shardids, options.shards)
+        options.store = False
+        if options.storeonly:
+            parser.error('cannot specify both --shard-ids and --store-only')
+    if any(c.isspace() for c in options.tmpdir):
+        parser.error('--tmpdir: the path cannot contain whitespace')
+    if options.resume and options.storeonly:
+        parser.error('cannot specify both --resume and --store-only')
+    if options.rngstate is None:
+        options.rngstate = os.path.join(options.bindir, 'rng-state')
     return options
 
+def parse_shard_ids(parser, s, shards):
+    ids = set()
+    for part in s.split(','):
+        try:
+            if '-' in part:
+                a, b = part.split('-', 1)
+                ids.update(range(int(a), int(b) + 1))
+            else:
+                ids.add(int(part))
+        except ValueError:
+            parser.error('--shard-ids: not a valid list: %s' % s)
+    if len(ids) == 0 or min(ids) < 1 or max(ids) > shards:
+        parser.error('--shard-ids: the parts have to be between 1 and %d' % shards)
+    return sorted(ids)
 
-class Runner:
-    def __init__(self, tool, bin, cmds, args):
-        self.tool = tool
+
+def format_duration(sec):
+    sec = int(sec + 0.5)
+    return '%d:%02d:%02d' % (sec // 3600, sec // 60 % 60, sec % 60)
+
+
+class Job:
+    def __init__(self, bin, args, priority, deps, db, temp, group, cost, stdin, stdout, pipe):
         self.bin = bin
-        self.fullpath = os.path.join(args.bindir, bin)
-        self.cmds = cmds
+        self.args = args
+        self.pipe = pipe
+        self.stdin = stdin
+        self.stdout = stdout
+        self.priority = priority
+        self.deps = deps
+        self.db = db
+        self.temp = temp
+        self.group = group
+        self.cost = cost
+        self.dependents = []
+        self.process = None
+        self.upstream = []
+        self.done = False
+        for d in deps:
+            d.dependents.append(self)
+
+    def ready(self):
+        return all(d.done for d in self.deps)
+
+
+# Runs at most args.jobs processes at a time. A job is ready once all
+# of its dependencies are done; among ready jobs, the smallest priority
+# goes first. Database readers ('r') may run concurrently, a writer ('w')
+# needs exclusive access; if the database is in WAL mode, readers may
+# also run alongside a writer, and only writers exclude each other.
+# Temporary files of a job are removed as soon as
+# all jobs that depend on it are done. If maxgroups is set, jobs of at
+# most maxgroups groups are in progress at any time. The arguments of a
+# job can be a function that is called when the job starts; it may read
+# the output that earlier jobs wrote to their stdout file. The stdin
+# of a job is a string that is written to the process when it starts.
+# A job may also read its stdin from a pipe of other programs, given
+# as (bin, args) pairs; the job is done once all of them are done.
+
+class Scheduler:
+    def __init__(self, tool, args, maxgroups=None, wal=False):
+        self.tool = tool
+        self.wal = wal
+        self.bindir = args.bindir
+        self.maxjobs = args.jobs
+        self.maxgroups = maxgroups
+        self.jobs = []
+        self.groups = defaultdict(list)
+        self.open_groups = set()
+        self.callbacks = {}
 
     def error(self, msg):
-        sys.stderr.write("%s: error: %s\n" % (self.tool, msg))
+        sys.stderr.write("\n%s: error: %s\n" % (self.tool, msg))
         sys.exit(1)
 
+    def add(self, bin, args, priority, deps=(), db=None, temp=(), group=None, cost=0, stdin=None, stdout=None, pipe=()):
+        job = Job(bin, args, priority, list(deps), db, list(temp), group, cost, stdin, stdout, list(pipe))
+        self.jobs.append(job)
+        self.groups[group].append(job)
+        return job
+
+    # The callback is run in this process as soon as all jobs
+    # of the group are done, while the other groups keep going.
+
+    def when_done(self, group, callback):
+        self.callbacks[group] = callback
+
+    def can_start(self, job, running, writer_waiting):
+        if self.maxgroups is not None and job.group not in self.open_groups:
+            if len(self.open_groups) >= self.maxgroups:
+                return False
+        if job.db is None:
+            return True
+        if self.wal:
+            return job.db == 'r' or not any(r.db == 'w' for r in running)
+        if any(r.db == 'w' for r in running):
+            return False
+        if job.db == 'w':
+            return not any(r.db is not None for r in running)
+        return not writer_waiting
+
+    def command(self, bin, args):
+        args = args() if callable(args) else args
+        return [ os.path.join(self.bindir, bin) ] + [ str(i) for i in args ]
+
+    def start(self, job):
+        self.open_groups.add(job.group)
+        assert job.stdin is None or len(job.pipe) == 0
+        stdin = None if job.stdin is None else subprocess.PIPE
+        for bin, args in job.pipe:
+            p = subprocess.Popen(self.command(bin, args), stdin=stdin, stdout=subprocess.PIPE)
+            if stdin is not None:
+                stdin.close()
+            job.upstream.append((bin, p))
+            stdin = p.stdout
+        cmd = self.command(job.bin, job.args)
+        if job.stdout is None:
+            job.process = subprocess.Popen(cmd, stdin=stdin)
+        else:
+            with open(job.stdout, 'w') as f:
+                job.process = subprocess.Popen(cmd, stdin=stdin, stdout=f)
+        if job.stdin is not None:
+            job.process.stdin.write(job.stdin.encode('utf-8'))
+            job.process.stdin.close()
+        elif stdin is not None:
+            stdin.close()
+
+    def finish(self, job):
+        for bin, p in job.upstream + [ (job.bin, job.process) ]:
+            returncode = p.wait()
+            if returncode != 0:
+                if returncode > 0:
+                    self.error("%s returned %d" % (bin, returncode))
+                else:
+                    self.error("%s received signal %d" % (bin, -returncode))
+        job.done = True
+        for d in job.deps + [ job ]:
+            if all(j.done for j in d.dependents):
+                for f in d.temp:
+                    os.remove(f)
+        if all(j.done for j in self.groups[job.group]):
+            self.open_groups.discard(job.group)
+            if job.group in self.callbacks:
+                self.callbacks.pop(job.group)()
+        self.done_cost += job.cost
+        self.report_eta()
+
+    # Running jobs are asked to stop; with --resume, types-comp saves
+    # a checkpoint first. Temporary files are of no use after this.
+
+    def abort(self, running):
+        for job in running:
+            for p in [ p for bin, p in job.upstream ] + [ job.process ]:
+                if p.poll() is None:
+                    p.terminate()
+                    p.wait()
+        for job in self.jobs:
+            for f in job.temp:
+                if os.path.exists(f):
+                    os.remove(f)
+
+    def report_eta(self):
+        now = time.time()
+        if self.done_cost == 0 or now < self.last_eta + ETA_INTERVAL:
+            return
+        self.last_eta = now
+        rate = self.done_cost / (now - self.start_time)
+        remaining = (self.total_cost - self.done_cost) / rate
+        sys.stderr.write('\n%s: %d%% done, %s elapsed, about %s remaining: ' % (
+            self.tool, 100 * self.done_cost / self.total_cost,
+            format_duration(now - self.start_time), format_duration(remaining)
+        ))
+        sys.stderr.flush()
+
     def run(self):
-        sys.stderr.write('%s (%d): ' % (self.bin, len(self.cmds)))
+        pending = sorted(self.jobs, key=lambda j: j.priority)
+        running = []
+        self.total_cost = sum(j.cost for j in self.jobs)
+        self.done_cost = 0
+        self.start_time = time.time()
+        self.last_eta = self.start_time
+        sys.stderr.write('%s: %d jobs, %d in parallel: ' % (self.tool, len(pending), self.maxjobs))
         sys.stderr.flush()
-        for a in self.cmds:
-            cmd = [ self.fullpath ] + [ str(i) for i in a ]
-            # self.msg("run: %s" % ' '.join(cmd))
-            process = subprocess.Popen(cmd)
-            process.wait()
-            if process.returncode != 0:
-                if process.returncode > 0:
-                    self.error("%s returned %d" % (self.bin, process.returncode))
-                else:
-                    self.error("%s received signal %d" % (self.bin, -process.returncode))
+        try:
+            while len(pending) > 0 or len(running) > 0:
+                writer_waiting = False
+                for job in list(pending):
+                    if len(running) >= self.maxjobs:
+                        break
+                    if not job.ready():
+                        continue
+                    if self.can_start(job, running, writer_waiting):
+                        pending.remove(job)
+                        running.append(job)
+                        self.start(job)
+                    elif job.db == 'w':
+                        writer_waiting = True
+                while True:
+                    finished = [ job for job in running if job.process.poll() is not None ]
+                    if len(finished) > 0:
+                        break
+                    time.sleep(POLL)
+                for job in finished:
+                    running.remove(job)
+                    self.finish(job)
+        except BaseException:
+            self.abort(running)
+            raise
         sys.stderr.write('\n')
 
 
+Sizes = namedtuple('Sizes', 'nsample ncoll ntype nnonzero nword ntoken')
+
+
 class Task:
     def __init__(self):
         self.sizes = dict()
         self.pstat = defaultdict(list)
         self.cstat = defaultdict(list)
+        self.pcost = dict()
+        self.ccost = dict()
+        self.digests = dict()
+        self.inputdigests = dict()
+        self.kernel = dict()
+        self.derive = set()
+        self.finished = set()
 
     def add(self, corpuscode, datasetcode, samplecount):
         k = (corpuscode, datasetcode)
@@ -102,21 +375,104 @@ class Task:
 
     def add_p(self, corpuscode, datasetcode, statcode, samplecount):
         self.add(corpuscode, datasetcode, samplecount)
-        self.pstat[(corpuscode, datasetcode)].append(statcode)
+        if statcode not in self.pstat[(corpuscode, datasetcode)]:
+            self.pstat[(corpuscode, datasetcode)].append(statcode)
 
     def add_c(self, corpuscode, datasetcode, statcode, samplecount):
         self.add(corpuscode, datasetcode, samplecount)
-        self.cstat[(corpuscode, datasetcode)].append(statcode)
+        if statcode not in self.cstat[(corpuscode, datasetcode)]:
+            self.cstat[(corpuscode, datasetcode)].append(statcode)
+
+    def estimate(self, conn, args):
+        for k in self.sizes:
+            sizes = get_sizes(conn, *k)
+            if args.kernel in ('dense', 'sparse'):
+                self.kernel[k] = (args.kernel, 'requested')
+            else:
+                self.kernel[k] = (guess_kernel(sizes), 'heuristic')
+            kernel = self.kernel[k][0]
+            self.pcost[k] = estimate_p(args, sizes, self.pstat[k], kernel)
+            self.ccost[k] = estimate_c(args, sizes, self.cstat[k], kernel)
+
+    def cost(self, k):
+        return self.pcost[k] + self.ccost[k]
 
     def prepare(self):
         self.inputs = []
-        l = sorted(iter(self.sizes.items()), key=lambda x:(-x[1],x[0]))
-        for i, p in enumerate(l):
-            k, size = p
+        l = sorted(self.sizes.keys(), key=lambda k:(-self.cost(k),k))
+        for i, k in enumerate(l):
             corpuscode, datasetcode = k
             self.inputs.append((i, corpuscode, datasetcode))
 
 
+# The cost model follows the structure of types-comp. Each iteration
+# generates a random permutation of the samples and then walks through
+# the samples, updating the type and hapax counters of all types in
+# the sample (sparse kernels) or the bit vectors of all types (dense
+# kernels). Permutation testing checks each collection after each
+# sample; curves update each x slot. Statistics that share the same
+# y axis are calculated together.
+
+def get_sizes(conn, corpuscode, datasetcode):
+    r = conn.execute('''
+        SELECT
+            (SELECT COUNT(0) FROM sample WHERE corpuscode = ?),
+            (SELECT COUNT(0) FROM collection WHERE corpuscode = ?),
+            (SELECT COUNT(DISTINCT tokencode) FROM token WHERE corpuscode = ? AND datasetcode = ?),
+            (SELECT COUNT(0) FROM token WHERE corpuscode = ? AND datasetcode = ?),
+            (SELECT COALESCE(SUM(wordcount), 0) FROM sample WHERE corpuscode = ?),
+            (SELECT COALESCE(SUM(tokencount), 0) FROM token WHERE corpuscode = ? AND datasetcode = ?)
+    ''', (corpuscode, corpuscode, corpuscode, datasetcode, corpuscode, datasetcode,
+          corpuscode, corpuscode, datasetcode))
+    return Sizes(*list(r)[0])
+
+def count_alg(stat):
+    ys = set(s.split('-')[0] for s in stat)
+    n = 0
+    if 'type' in ys or 'hapax' in ys:
+        n += 1
+    if 'token' in ys:
+        n += 1
+    return n
+
+# Same rule as the default of types-comp.
+
+def guess_kernel(sizes):
+    if sizes.nsample * sizes.ntype > SPARSITY_HEURISTIC * (sizes.nsample + sizes.nnonzero):
+        return 'sparse'
+    else:
+        return 'dense'
+
+def walk_cost(sizes, kernel):
+    if kernel == 'sparse':
+        return sizes.nsample + sizes.nnonzero
+    else:
+        return sizes.nsample * ((sizes.ntype + 63) // 64)
+
+def estimate_p(args, sizes, stat, kernel):
+    if len(stat) == 0:
+        return 0.0
+    per_iteration = 2 * sizes.nsample + walk_cost(sizes, kernel) + sizes.nsample * sizes.ncoll
+    return float(args.piter) * per_iteration * count_alg(stat)
+
+def estimate_c(args, sizes, stat, kernel):
+    if len(stat) == 0:
+        return 0.0
+    xslots = min(int(args.x), max(sizes.nword, sizes.ntoken) + 1)
+    per_iteration = 2 * sizes.nsample + walk_cost(sizes, kernel) + 2 * xslots
+    return float(args.citer) * per_iteration * count_alg(stat)
+
+# Each types-comp uses all cores, or OMP_NUM_THREADS threads, and
+# at most jobs of them run at the same time.
+
+def estimate_seconds(cost, jobs=1):
+    cpus = os.cpu_count() or 1
+    try:
+        threads = int(os.environ.get('OMP_NUM_THREADS', cpus))
+    except ValueError:
+        threads = cpus
+    return cost / (OPS_PER_SEC * min(jobs * max(threads, 1), cpus))
+
 def find_all(conn, args, task):
     r = conn.execute('''
         SELECT dataset.corpuscode, datasetcode, statcode, samplecount
@@ -130,7 +486,7 @@ def find_all(conn, args, task):
         if args.c:
             task.add_c(corpuscode, datasetcode, statcode, samplecount)
 
-def find_missing(conn, args, task):
+def find_missing(conn, args, task, derivable):
     if args.c:
         r = conn.execute('''
             SELECT corpuscode, datasetcode, statcode, samplecount
@@ -139,7 +495,10 @@ def find_missing(conn, args, task):
             GROUP BY corpuscode, datasetcode, statcode, samplecount
         ''')
         for corpuscode, datasetcode, statcode, samplecount in r:
-            task.add_c(corpuscode, datasetcode, statcode, samplecount)
+            if (corpuscode, datasetcode, statcode) in derivable:
+                task.derive.add((corpuscode, datasetcode))
+            else:
+                task.add_c(corpuscode, datasetcode, statcode, samplecount)
 
     if args.p:
         r = conn.execute('''
@@ -151,104 +510,364 @@ def find_missing(conn, args, task):
         for corpuscode, datasetcode, statcode, samplecount in r:
             task.add_p(corpuscode, datasetcode, statcode, samplecount)
 
+# Curves for levels that were added to defaultlevel are derived from
+# the curve grids that types-store saved earlier, without new
+# permutations, provided that the database keeps curve grids and the
+# grids are up to date.
+
+def find_derivable(conn, args, task):
+    if not TypesDatabase.has_curve_grids(conn):
+        return set()
+    r = conn.execute('''
+        SELECT DISTINCT m.corpuscode, m.datasetcode, m.statcode, d.digest
+        FROM view_missing_curve AS m
+        JOIN result_curve_grid USING (corpuscode, datasetcode, statcode)
+        LEFT JOIN input_digest AS d
+        ON d.corpuscode = m.corpuscode AND d.datasetcode = m.datasetcode
+        AND d.statcode = m.statcode AND d.kind = 'c'
+    ''')
+    derivable = set()
+    for corpuscode, datasetcode, statcode, digest in r:
+        if digest is None or digest == get_digest(conn, args, task, (corpuscode, datasetcode), 'c'):
+            derivable.add((corpuscode, datasetcode, statcode))
+    return derivable
+
+# The digest of a result covers the input data of the data set
+# and the parameters of the calculation. Results without a digest
+# were stored by older versions and are assumed to be up to date.
+# The input data is hashed only if input_digest does not have a
+# clean digest of it, i.e., if the data set is new or its data has
+# changed; the new digest is saved right away.
+
+def get_input_digest(conn, task, k):
+    if k not in task.inputdigests:
+        r = conn.execute('''
+            SELECT input FROM input_digest
+            WHERE corpuscode = ? AND datasetcode = ? AND dirty = 0 AND input IS NOT NULL
+            LIMIT 1
+        ''', k)
+        l = list(r)
+        if len(l) > 0:
+            task.inputdigests[k] = l[0][0]
+        else:
+            base = TypesDatabase.input_digest(conn, *k)
+            conn.execute('''
+                UPDATE input_digest SET input = ?, dirty = 0
+                WHERE corpuscode = ? AND datasetcode = ?
+            ''', (base,) + k)
+            task.inputdigests[k] = base
+    return task.inputdigests[k]
+
+def get_digest(conn, args, task, k, kind):
+    if k + (kind,) not in task.digests:
+        base = get_input_digest(conn, task, k)
+        if kind == 'p':
+            params = 'piter=%d' % args.piter + (' adaptive=%r' % args.adaptive if args.adaptive else '')
+        else:
+            params = 'citer=%d x=%s y=%s' % (args.citer, args.x, args.y)
+        h = hashlib.sha1(('%s %s %s' % (base, kind, params)).encode('ascii'))
+        task.digests[k + (kind,)] = h.hexdigest()
+    return task.digests[k + (kind,)]
+
+def find_changed(conn, args, task):
+    r = conn.execute('''
+        SELECT corpuscode, datasetcode, statcode, kind, digest, samplecount
+        FROM input_digest
+        JOIN defaultstat USING (statcode)
+        JOIN view_corpus USING (corpuscode)
+    ''')
+    for corpuscode, datasetcode, statcode, kind, digest, samplecount in list(r):
+        if digest == get_digest(conn, args, task, (corpuscode, datasetcode), kind):
+            continue
+        if kind == 'p' and args.p:
+            task.add_p(corpuscode, datasetcode, statcode, samplecount)
+        if kind == 'c' and args.c:
+            task.add_c(corpuscode, datasetcode, statcode, samplecount)
+
 def init_and_get_task(args):
     conn = TypesDatabase.open_db(args.db)
     TypesDatabase.create_if_needed(conn)
+    if args.adaptive:
+        r = conn.execute('SELECT MIN(level) FROM defaultlevel')
+        args.adaptive = list(r)[0][0]
+        if args.adaptive is None:
+            error('--adaptive: table defaultlevel is empty, there is no level to test against')
     task = Task()
     if args.recalc:
         find_all(conn, args, task)
     else:
-        find_missing(conn, args, task)
+        derivable = find_derivable(conn, args, task) if args.c and args.store else set()
+        find_missing(conn, args, task, derivable)
+        find_changed(conn, args, task)
+    task.estimate(conn, args)
+    if not args.dryrun:
+        for k in task.sizes:
+            for kind in ('p', 'c'):
+                get_digest(conn, args, task, k, kind)
     conn.commit()
     task.prepare()
     return task
 
+# Input files are private to this run, but several hosts may
+# write output files for different parts to a shared tmpdir.
+
 def get_input_file(args, i):
-    return os.path.join(args.tmpdir, 'input-%d' % (i+1))
+    return os.path.join(args.tmpdir, 'input-%d-%s-%d' % (i+1, socket.gethostname(), os.getpid()))
+
+# Output files and checkpoints are named after the data set and the
+# digest of its input data and the parameters, and not after the
+# order of the data sets in this run, so that a later run with
+# --store-only or --resume finds the files of the same calculation,
+# and never mixes results of different calculations. Each types-comp
+# process adds a suffix per algorithm to the checkpoint prefix.
+
+def get_result_name(task, k, kind):
+    key = '\n'.join(list(k) + [ task.digests[k + (kind,)] ])
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+def get_output_file(args, task, k, kind, shard):
+    return os.path.join(args.tmpdir, 'output-%s-%s-%d-%d' % (kind, get_result_name(task, k, kind), shard, args.shards))
+
+def get_checkpoint_prefix(args, task, k, kind, shard):
+    return os.path.join(args.tmpdir, 'checkpoint-%s-%s-%d-%d' % (kind, get_result_name(task, k, kind), shard, args.shards))
+
+# Saving checkpoints costs time, so types-comp only saves them with
+# --resume. Without --resume, the checkpoints of earlier runs would
+# never be used, and they are removed.
+
+def get_checkpoint_options(args, task, k, kind, shard):
+    checkpoint = get_checkpoint_prefix(args, task, k, kind, shard)
+    if not args.resume:
+        for f in glob.glob(checkpoint + '-*'):
+            os.remove(f)
+        return []
+    return [ '--checkpoint', checkpoint ]
+
+def get_calibration_file(args, i):
+    return os.path.join(args.tmpdir, 'calibrate-%d-%s-%d' % (i+1, socket.gethostname(), os.getpid()))
+
+# With --kernel calibrate, types-comp times both variants on a few
+# parts of the permutation testing (or curves, if there is nothing
+# else to do) and prints the faster one, e.g. "sparse 0.0012 0.0004"
+# (seconds per part for dense and sparse).
+
+def read_calibration(task, k, filename):
+    if k not in task.kernel or task.kernel[k][1] != 'calibrated':
+        with open(filename) as f:
+            kernel, dense, sparse = f.read().split()
+        task.kernel[k] = (kernel, 'calibrated, dense %s s, sparse %s s' % (dense, sparse))
+    return task.kernel[k][0]
 
-def get_output_c_file(args, i):
-    return os.path.join(args.tmpdir, 'output-c-%d' % (i+1))
+# With --max-memory, each of the --jobs programs that may run in
+# parallel gets an equal share.
 
-def get_output_p_file(args, i):
-    return os.path.join(args.tmpdir, 'output-p-%d' % (i+1))
+def get_memory_options(args):
+    if args.maxmemory is None:
+        return []
+    return [ '--max-memory', args.maxmemory // args.jobs ]
 
 def print_tasks(args, task):
+    for corpuscode, datasetcode in sorted(task.derive):
+        print("%s %s: curves for new levels from stored grids" % (corpuscode, datasetcode))
+    total = 0.0
     for i, corpuscode, datasetcode in task.inputs:
         k = (corpuscode, datasetcode)
         pstat = task.pstat[k]
         cstat = task.cstat[k]
         stats = [ 'c-%s' % s for s in cstat ] + [ 'p-%s' % s for s in pstat ]
-        print("%s %s: %s" % (corpuscode, datasetcode, ' '.join(stats)))
+        cost = task.cost(k)
+        total += cost
+        kernel = 'calibrate' if args.kernel == 'calibrate' else task.kernel[k][0]
+        print("%s %s: %s [%s, cost %.3g, about %s]" % (
+            corpuscode, datasetcode, ' '.join(stats), kernel,
+            cost, format_duration(estimate_seconds(cost))
+        ))
+    print("total: cost %.3g, about %s" % (total, format_duration(estimate_seconds(total, args.jobs))))
 
-def run_query(args, task):
-    cmds = []
-    for i, corpuscode, datasetcode in task.inputs:
-        cmd = [ 'P', args.db, corpuscode, datasetcode, get_input_file(args, i) ]
-        cmds.append(cmd)
-    Runner(TOOL, 'types-query', cmds, args).run()
-
-def run_comp(args, task):
-    cmds = []
-    rngstate = os.path.join(args.bindir, 'rng-state')
+def schedule(args, task, scheduler):
+    # The default priorities follow the order of the three phases:
+    # all queries, then all computations, then all stores.
+    # In the streaming mode, each data set is finished before
+    # the next one is started.
+    if args.stream:
+        order = lambda phase, i, *rest: (i, phase) + rest
+    else:
+        order = lambda phase, i, *rest: (phase, i) + rest
+    # Deriving curves from stored grids is quick, and it goes first.
+    for j, k in enumerate(sorted(task.derive)):
+        scheduler.add(
+            'types-store', [ 'P', args.db ] + list(k),
+            (-1, j), db='w', group=k
+        )
     for i, corpuscode, datasetcode in task.inputs:
         k = (corpuscode, datasetcode)
-        stat = task.pstat[k]
-        if len(stat) > 0:
-            cmd = [
-                '--progress',
-                '--rng-state-file', rngstate,
-                '--raw-input', get_input_file(args, i),
-                '--processes', 1,
-                '--id', 1,
-                '--raw-output', get_output_p_file(args, i),
+        passes = [
+            ('--p-%s', 'p', task.pstat[k], [
                 '--iterations', args.piter,
-            ] + [ '--p-%s' % f for f in stat ]
-            cmds.append(cmd)
-    for i, corpuscode, datasetcode in task.inputs:
-        k = (corpuscode, datasetcode)
-        stat = task.cstat[k]
-        if len(stat) > 0:
-            cmd = [
-                '--progress',
-                '--rng-state-file', rngstate,
-                '--raw-input', get_input_file(args, i),
-                '--processes', 1,
-                '--id', 1,
-                '--raw-output', get_output_c_file(args, i),
+            ] + ([ '--adaptive', repr(args.adaptive) ] if args.adaptive else []), 1),
+            ('--%s', 'c', task.cstat[k], [
                 '--iterations', args.citer,
                 '--x', args.x,
-                '--y', args.y
-            ] + [ '--%s' % f for f in stat ]
-            cmds.append(cmd)
-    Runner(TOOL, 'types-comp', cmds, args).run()
-    for i, corpuscode, datasetcode in task.inputs:
-        os.remove(get_input_file(args, i))
-
-def store(args, corpuscode, datasetcode, files):
-    bin = os.path.join(args.bindir, 'types-store')
-    cmd = [ bin, args.db, corpuscode, datasetcode ] + files
-    subprocess.check_call(cmd)
-    for f in files:
-        os.remove(f)
-
-def run_store(args, task):
-    all_files = []
-    cmds = []
-    for i, corpuscode, datasetcode in task.inputs:
-        def add(check, fn):
-            k = (corpuscode, datasetcode)
-            if len(check[k]) > 0:
-                files = [ fn(args, i) ]
-                cmd = [ 'P', args.db, corpuscode, datasetcode ] + files
-                cmds.append(cmd)
-                all_files.extend(files)
-        add(task.cstat, get_output_c_file)
-        add(task.pstat, get_output_p_file)
-    Runner(TOOL, 'types-store', cmds, args).run()
-    for f in all_files:
-        os.remove(f)
-
-def postprocess(args):
+                '--y', args.y,
+            ], 0),
+        ]
+        passes = [ p for p in passes if len(p[2]) > 0 ]
+        if args.pipe:
+            schedule_pipe(args, task, scheduler, i, k, passes)
+            if args.store:
+                scheduler.when_done(k, lambda k=k: finish_dataset(args, task, k))
+            continue
+        infile = get_input_file(args, i)
+        if not args.storeonly:
+            query = scheduler.add(
+                'types-query', [ 'P', args.db, corpuscode, datasetcode, infile ],
+                order(0, i), db='r', temp=[ infile ], group=k
+            )
+            comp_deps = [ query ]
+            if args.kernel == 'calibrate':
+                calfile = get_calibration_file(args, i)
+                if len(task.pstat[k]) > 0:
+                    caloptions = [ '--iterations', args.piter ] + [ '--p-%s' % f for f in task.pstat[k] ]
+                else:
+                    caloptions = [ '--iterations', args.citer, '--x', args.x, '--y', args.y ] + [ '--%s' % f for f in task.cstat[k] ]
+                calibrate = scheduler.add(
+                    'types-comp', [
+                        '--calibrate',
+                        '--rng-state-file', args.rngstate,
+                        '--raw-input', infile,
+                    ] + caloptions,
+                    order(0, i, 1), deps=[ query ], temp=[ calfile ], group=k, stdout=calfile
+                )
+                comp_deps = [ query, calibrate ]
+                kernel = lambda k=k, calfile=calfile: read_calibration(task, k, calfile)
+            else:
+                kernel = lambda k=k: task.kernel[k][0]
+
+        # Permutation testing and curves are calculated by one types-comp
+        # server, which reads the input only once.
+        comps = []
+        if not args.storeonly:
+            for shard in args.shardids:
+                requests = []
+                temp = []
+                for what, kind, stat, options, store_order in passes:
+                    request = get_checkpoint_options(args, task, k, kind, shard) + [
+                        '--processes', args.shards,
+                        '--id', shard,
+                        '--raw-output', get_output_file(args, task, k, kind, shard),
+                    ] + options + [ what % f for f in stat ]
+                    requests.append(' '.join(str(a) for a in request) + '\n')
+                    if args.store:
+                        temp.append(get_output_file(args, task, k, kind, shard))
+                cmd = [
+                    '--server',
+                    '--progress',
+                    '--rng-state-file', args.rngstate,
+                    '--raw-input', infile,
+                ] + get_memory_options(args)
+                comps.append(scheduler.add(
+                    'types-comp', lambda cmd=cmd, kernel=kernel: [ '--' + kernel() ] + cmd,
+                    order(1, i, shard), deps=comp_deps, temp=temp, group=k,
+                    cost=task.cost(k) / args.shards, stdin=''.join(requests), stdout=os.devnull
+                ))
+        if args.store:
+            for what, kind, stat, options, store_order in passes:
+                files = [ get_output_file(args, task, k, kind, shard) for shard in args.shardids ]
+                if args.storeonly:
+                    for f in files:
+                        if not os.path.exists(f):
+                            error('%s %s: missing file %s' % (corpuscode, datasetcode, f))
+                scheduler.add(
+                    'types-store', lambda k=k, files=files: get_store_args(args, task, k, files),
+                    order(3, i, store_order), deps=comps, db='w', group=k,
+                    temp=files if args.storeonly else []
+                )
+        if args.store:
+            scheduler.when_done(k, lambda k=k: finish_dataset(args, task, k))
+
+# With --pipe, each pass is a pipeline of types-query, types-comp, and
+# types-store. The pipeline writes to the database, and hence the
+# pipelines run one at a time; types-comp uses all cores anyway.
+
+# The variant used for each data set is recorded in the log entry of
+# each types-store process. With --kernel calibrate, it is known only
+# once types-comp has started, and the arguments are a function.
+
+def get_store_args(args, task, k, files):
+    corpuscode, datasetcode = k
+    note = [] if args.storeonly else [ '--note', 'kernel %s (%s)' % task.kernel[k] ]
+    return note + [ 'P', args.db, corpuscode, datasetcode ] + files
+
+def schedule_pipe(args, task, scheduler, i, k, passes):
+    corpuscode, datasetcode = k
+    for what, kind, stat, options, store_order in passes:
+        cmd = [
+            '--' + task.kernel[k][0],
+            '--progress',
+            '--rng-state-file', args.rngstate,
+        ] + get_checkpoint_options(args, task, k, kind, 1) + get_memory_options(args) + [
+            '--raw-input', '-',
+            '--raw-output', '-',
+        ] + options + [ what % f for f in stat ]
+        scheduler.add(
+            'types-store', get_store_args(args, task, k, [ '-' ]),
+            (i, store_order), db='w', group=k,
+            cost=task.pcost[k] if kind == 'p' else task.ccost[k],
+            pipe=[
+                ('types-query', [ 'P', args.db, corpuscode, datasetcode, '-' ]),
+                ('types-comp', cmd),
+            ]
+        )
+
+def run_all(args, task):
+    wal = TypesDatabase.is_wal(TypesDatabase.open_db(args.db))
+    scheduler = Scheduler(TOOL, args, args.jobs if args.stream else None, wal)
+    schedule(args, task, scheduler)
+    scheduler.run()
+
+# The digests describe the input data as it was when this run started.
+# If the data changed during the run, the triggers have marked the
+# rows of the data set dirty, and they stay dirty, so that the next
+# run hashes the data again and recalculates. A data set without rows
+# has nothing to mark, and its data is hashed again instead. The write
+# lock is taken first, so that no change slips in between.
+
+def input_changed(conn, task, k):
+    r = conn.execute('''
+        SELECT COUNT(0), MAX(dirty) FROM input_digest
+        WHERE corpuscode = ? AND datasetcode = ? AND input = ?
+    ''', k + (task.inputdigests[k],))
+    count, dirty = list(r)[0]
+    if count == 0:
+        return TypesDatabase.input_digest(conn, *k) != task.inputdigests[k]
+    return dirty != 0
+
+def store_digests(conn, task, k):
+    corpuscode, datasetcode = k
+    dirty = 1 if input_changed(conn, task, k) else 0
+    for kind, stat in [ ('p', task.pstat[k]), ('c', task.cstat[k]) ]:
+        for statcode in stat:
+            conn.execute('''
+                INSERT OR REPLACE INTO input_digest (corpuscode, datasetcode, statcode, kind, digest, input, dirty)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (corpuscode, datasetcode, statcode, kind, task.digests[(corpuscode, datasetcode, kind)],
+                  task.inputdigests[k], dirty))
+
+# The digests of each data set are stored as soon as all of its
+# results are stored, so that an interrupted run, e.g. with --stream,
+# does not calculate the finished data sets again.
+
+def finish_dataset(args, task, k):
+    conn = TypesDatabase.open_db(args.db)
+    conn.execute('BEGIN IMMEDIATE')
+    store_digests(conn, task, k)
+    conn.commit()
+    task.finished.add(k)
+
+def postprocess(args, task):
+    for k in task.sizes:
+        if k not in task.finished:
+            finish_dataset(args, task, k)
     conn = TypesDatabase.open_db(args.db)
     TypesDatabase.refresh_result(conn)
     conn.commit()
@@ -256,17 +875,20 @@ def postprocess(args):
 def main():
     args = get_args()
     task = init_and_get_task(args)
-    if len(task.inputs) == 0:
+    if len(task.inputs) == 0 and len(task.derive) == 0:
         msg('database up to date')
     elif args.dryrun:
         print_tasks(args, task)
     else:
         if not os.path.exists(args.tmpdir):
             os.makedirs(args.tmpdir)
-        run_query(args, task)
-        run_comp(args, task)
-        run_store(args, task)
-        postprocess(args)
-        msg('all done')
+        run_all(args, task)
+        if args.store:
+            postprocess(args, task)
+            msg('all done')
+        else:
+            msg('parts %s done, results left in %s' % (
+                ','.join(str(i) for i in args.shardids), args.tmpdir
+            ))
 
 main()
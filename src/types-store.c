@@ -22,10 +22,15 @@ typedef struct {
     const char *datasetcode;
     char **filenames;
     unsigned nfile;
+    const char *description;
     int64_t logid;
     unsigned nsample;
     unsigned ncoll;
     unsigned ntype;
+    double *levels;
+    unsigned nlevel;
+    bool packed;
+    bool grids;
     bool verbose;
     bool progress;
 } store_t;
@@ -40,9 +45,16 @@ usage(void)
         "\n"
         "This is a low-level tool. See 'types-run' for a user-friendly interface.\n"
         "\n"
-        "Usage: %s <VERBOSITY> <DATABASE> <CORPUSCODE> <DATASETCODE> <SOURCE-FILE> ...\n"
+        "Usage: %s [--note <NOTE>] <VERBOSITY> <DATABASE> <CORPUSCODE> <DATASETCODE> [<SOURCE-FILE> ...]\n"
         "\n"
+        "NOTE: added to the description of the log entry, e.g. the kernel that types-comp used\n"
         "VERBOSITY: 'V' for verbose, 'P' for progress information, '-' for no output\n"
+        "SOURCE-FILE: '-' for stdin, e.g. for piping the results of 'types-comp --raw-output -'\n"
+        "\n"
+        "Curves are calculated for the confidence levels in table 'defaultlevel'.\n"
+        "If the database keeps curve grids (see 'types-db-init --curve-grids'),\n"
+        "the grids are stored, too. Without source files, the curves are derived\n"
+        "again from the stored grids, e.g. after new levels have been added.\n"
         "\n",
         TOOL);
     exit(EXIT_SUCCESS);
@@ -62,18 +74,73 @@ init(store_t * restrict s)
     if (s->nsample == 0 || s->ntype == 0 || s->ncoll == 0) {
         myerror("corpus %s, data set %s: no data", s->corpuscode, s->datasetcode);
     }
+    s->packed = db_getuint(
+        "SELECT COUNT(0) FROM sqlite_master WHERE type = 'table' AND name = 'result_curve_data'",
+        NOBIND
+    ) > 0;
+    s->grids = db_getuint(
+        "SELECT COUNT(0) FROM sqlite_master WHERE type = 'table' AND name = 'result_curve_grid'",
+        NOBIND
+    ) > 0;
 }
 
+static const double default_levels[] = { 0.0001, 0.001, 0.01, 0.10 };
+static const unsigned ndefault_level = sizeof(default_levels)/sizeof(double);
+
 static void
-write_log(store_t * restrict s)
+init_levels(store_t * restrict s)
+{
+    s->nlevel = 0;
+    if (s->database) {
+        s->nlevel = db_getuint("SELECT COUNT(0) FROM defaultlevel", NOBIND);
+    }
+    if (s->nlevel == 0) {
+        s->nlevel = ndefault_level;
+        MYMALLOC(s->levels, double, s->nlevel);
+        for (unsigned i = 0; i < s->nlevel; i++) {
+            s->levels[i] = default_levels[i];
+        }
+    } else {
+        MYMALLOC(s->levels, double, s->nlevel);
+        db_loadarray_double(s->levels, s->nlevel, "SELECT level FROM defaultlevel ORDER BY level", NOBIND);
+    }
+    for (unsigned i = 0; i < s->nlevel; i++) {
+        if (!(s->levels[i] >= 0.0 && s->levels[i] < 1.0)) {
+            myerror("defaultlevel: invalid level %g, expected a number in the range [0, 1)", s->levels[i]);
+        }
+    }
+}
+
+static void
+write_log(store_t * restrict s, const char * restrict description)
 {
     db_exec(
         "INSERT INTO log (corpuscode, datasetcode, timestamp, description) VALUES (?, ?, datetime('now'), ?)",
-        BIND(STRING(s->corpuscode), STRING(s->datasetcode), STRING(TOOL))
+        BIND(STRING(s->corpuscode), STRING(s->datasetcode), STRING(description))
     );
     s->logid = db_last_insert_rowid();
 }
 
+// Each statistic is stored in a transaction of its own, so that the
+// database is locked only while its results are written, not while
+// the input is read; other types-store processes wait for the lock.
+// The log entry is written in the first transaction.
+
+static void
+begin_store(store_t * restrict s)
+{
+    db_exec("BEGIN IMMEDIATE", NOBIND);
+    if (s->logid == 0) {
+        write_log(s, s->description);
+    }
+}
+
+static void
+end_store(void)
+{
+    db_exec("COMMIT", NOBIND);
+}
+
 static unsigned
 read_common_uint(store_t * restrict s)
 {
@@ -199,6 +266,8 @@ read_permtest(store_t * restrict s)
 
     if (s->database) {
 
+        begin_store(s);
+
         // Delete old results
 
         db_exec(
@@ -233,12 +302,10 @@ read_permtest(store_t * restrict s)
         }
         db_close_cache();
 
+        end_store();
     }
 }
 
-static const double levels[] = { 0.0001, 0.001, 0.01, 0.10 };
-static const unsigned nlevel = sizeof(levels)/sizeof(double);
-
 typedef struct {
     unsigned yx;
     unsigned iterations;
@@ -246,6 +313,7 @@ typedef struct {
     unsigned ny;
     unsigned * restrict xthreshold;
     unsigned * restrict ythreshold;
+    stat_t * restrict stat;
 } curve_t;
 
 typedef struct {
@@ -254,8 +322,11 @@ typedef struct {
 } curve_bounds_t;
 
 static curve_bounds_t
-find_curves(const curve_t * restrict curve, const stat_t * restrict stat)
+find_curves(const store_t * restrict s, const curve_t * restrict curve)
 {
+    const double * restrict levels = s->levels;
+    const unsigned nlevel = s->nlevel;
+    const stat_t * restrict stat = curve->stat;
     curve_bounds_t bounds;
     MYMALLOC(bounds.lower, unsigned, size_multiply(curve->nx, nlevel));
     MYMALLOC(bounds.upper, unsigned, size_multiply(curve->nx, nlevel));
@@ -302,13 +373,57 @@ find_curves(const curve_t * restrict curve, const stat_t * restrict stat)
     return bounds;
 }
 
+// With packed curves, the points of a curve are stored as one blob in
+// result_curve_data: the deltas of the x coordinates followed by the
+// deltas of the y coordinates, as 32-bit little-endian integers. The
+// deltas wrap around modulo 2^32, and they are summed in the same way.
+
+static unsigned char *
+put_delta(unsigned char * restrict p, unsigned v, unsigned prev)
+{
+    uint32_t d = (uint32_t)v - (uint32_t)prev;
+    p[0] = d & 0xFF;
+    p[1] = (d >> 8) & 0xFF;
+    p[2] = (d >> 16) & 0xFF;
+    p[3] = (d >> 24) & 0xFF;
+    return p + 4;
+}
+
+static void
+store_packed(int64_t curveid, const unsigned * restrict x, const unsigned * restrict y, unsigned npoint)
+{
+    unsigned char *data;
+    MYMALLOC(data, unsigned char, size_multiply(npoint, 8));
+    unsigned char *p = data;
+    for (unsigned k = 0; k < npoint; k++) {
+        p = put_delta(p, x[k], k > 0 ? x[k-1] : 0);
+    }
+    for (unsigned k = 0; k < npoint; k++) {
+        p = put_delta(p, y[k], k > 0 ? y[k-1] : 0);
+    }
+    db_exec_cache(BIND(INT(curveid), BLOB(data, npoint * 8)));
+    free(data);
+}
+
 static void
 store_curves(store_t * restrict s, const curve_t * restrict curve, unsigned * restrict bounds, const char * restrict side)
 {
-    db_create_cache(
-        "INSERT INTO result_curve_point (curveid, x, y) "
-        "VALUES (?, ?, ?)"
-    );
+    const unsigned nlevel = s->nlevel;
+    if (s->packed) {
+        db_create_cache(
+            "INSERT INTO result_curve_data (curveid, points) "
+            "VALUES (?, ?)"
+        );
+    } else {
+        db_create_cache(
+            "INSERT INTO result_curve_point (curveid, x, y) "
+            "VALUES (?, ?, ?)"
+        );
+    }
+    unsigned *x;
+    unsigned *y;
+    MYMALLOC(x, unsigned, curve->nx);
+    MYMALLOC(y, unsigned, curve->nx);
 
     for (unsigned level = 0; level < nlevel; level++) {
         db_exec(
@@ -317,12 +432,13 @@ store_curves(store_t * restrict s, const curve_t * restrict curve, unsigned * re
             "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
             BIND(
                 STRING(s->corpuscode), STRING(s->datasetcode), STRING(YX[curve->yx].label),
-                DOUBLE(levels[level]), STRING(side), INT(curve->nx), INT(curve->ny),
+                DOUBLE(s->levels[level]), STRING(side), INT(curve->nx), INT(curve->ny),
                 INT(curve->iterations), INT(s->logid)
             )
         );
         int64_t curveid = db_last_insert_rowid();
 
+        unsigned npoint = 0;
         for (unsigned i = 0; i < curve->nx; i++) {
             unsigned v = bounds[i * nlevel + level];
             if (i > 0 && i + 1 < curve->nx) {
@@ -334,13 +450,120 @@ store_curves(store_t * restrict s, const curve_t * restrict curve, unsigned * re
                     continue;
                 }
             }
-            db_exec_cache(BIND(INT(curveid), INT(curve->xthreshold[i]), INT(v)));
+            x[npoint] = curve->xthreshold[i];
+            y[npoint] = v;
+            npoint++;
+        }
+        if (s->packed) {
+            store_packed(curveid, x, y, npoint);
+        } else {
+            for (unsigned k = 0; k < npoint; k++) {
+                db_exec_cache(BIND(INT(curveid), INT(x[k]), INT(y[k])));
+            }
         }
     }
 
+    free(x);
+    free(y);
     db_close_cache();
 }
 
+// With curve grids, the curve grid is stored so that curves for other
+// levels can be derived later without new permutations. The grid is
+// one blob: the thresholds of the x and y slots followed by the cells
+// in the compressed format of the types-comp output files.
+
+static void
+store_grid(store_t * restrict s, const curve_t * restrict curve)
+{
+    myfile_t f = mytmpfile();
+    for (unsigned i = 0; i < curve->nx; i++) {
+        myfwrite_uint(&f, curve->xthreshold[i]);
+    }
+    for (unsigned j = 0; j < curve->ny; j++) {
+        myfwrite_uint(&f, curve->ythreshold[j]);
+    }
+    write_stat_compressed(&f, curve->stat, size_multiply(curve->nx, curve->ny));
+    size_t size = mytell(&f);
+    if (size > INT_MAX) {
+        myerror("curve grid too large: %zu bytes", size);
+    }
+    unsigned char *cells;
+    MYMALLOC(cells, unsigned char, size);
+    myrewind(&f);
+    myfread_exact(&f, cells, 1, size);
+    myclose(&f);
+
+    db_exec(
+        "DELETE FROM result_curve_grid "
+        "WHERE corpuscode = ? AND datasetcode = ? AND statcode = ?",
+        BIND(STRING(s->corpuscode), STRING(s->datasetcode), STRING(YX[curve->yx].label))
+    );
+    db_exec(
+        "INSERT INTO result_curve_grid "
+        "(corpuscode, datasetcode, statcode, xslots, yslots, iterations, cells, logid) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        BIND(
+            STRING(s->corpuscode), STRING(s->datasetcode), STRING(YX[curve->yx].label),
+            INT(curve->nx), INT(curve->ny), INT(curve->iterations),
+            BLOB(cells, (int)size), INT(s->logid)
+        )
+    );
+    free(cells);
+}
+
+static void
+process_curves(store_t * restrict s, const curve_t * restrict curve, bool grid)
+{
+    // Convert raw data to curves
+
+    curve_bounds_t bounds = find_curves(s, curve);
+
+    if (s->database) {
+
+        begin_store(s);
+
+        // Delete old results
+
+        db_exec(
+            s->packed
+            ? "DELETE FROM result_curve_data "
+              "WHERE curveid IN "
+              "(SELECT id FROM result_curve WHERE corpuscode = ? AND datasetcode = ? AND statcode = ?)"
+            : "DELETE FROM result_curve_point "
+              "WHERE curveid IN "
+              "(SELECT id FROM result_curve WHERE corpuscode = ? AND datasetcode = ? AND statcode = ?)",
+            BIND(STRING(s->corpuscode), STRING(s->datasetcode), STRING(YX[curve->yx].label))
+        );
+        db_exec(
+            "DELETE FROM result_curve "
+            "WHERE corpuscode = ? AND datasetcode = ? AND statcode = ?",
+            BIND(STRING(s->corpuscode), STRING(s->datasetcode), STRING(YX[curve->yx].label))
+        );
+
+        // Store curves in database
+
+        store_curves(s, curve, bounds.lower, "lower");
+        store_curves(s, curve, bounds.upper, "upper");
+        if (grid && s->grids) {
+            store_grid(s, curve);
+        }
+
+        end_store();
+    }
+
+    free(bounds.lower);
+    free(bounds.upper);
+}
+
+static void
+free_curve(curve_t * restrict curve)
+{
+    free(curve->xthreshold);
+    free(curve->ythreshold);
+    free(curve->stat);
+}
+
 static void
 read_curves(store_t * restrict s)
 {
@@ -372,42 +595,69 @@ read_curves(store_t * restrict s)
     // Read data
 
     size_t ntotal = size_multiply(curve.nx, curve.ny);
-    stat_t *stat;
-    MYMALLOC(stat, stat_t, ntotal);
-    read_stat_sum(s, stat, ntotal);
-
-    // Convert raw data to curves
+    MYMALLOC(curve.stat, stat_t, ntotal);
+    read_stat_sum(s, curve.stat, ntotal);
 
-    curve_bounds_t bounds = find_curves(&curve, stat);
-
-    if (s->database) {
-
-        // Delete old results
+    process_curves(s, &curve, true);
+    free_curve(&curve);
+}
 
-        db_exec(
-            "DELETE FROM result_curve_point "
-            "WHERE curveid IN "
-            "(SELECT id FROM result_curve WHERE corpuscode = ? AND datasetcode = ? AND statcode = ?)",
-            BIND(STRING(s->corpuscode), STRING(s->datasetcode), STRING(YX[curve.yx].label))
-        );
-        db_exec(
-            "DELETE FROM result_curve "
-            "WHERE corpuscode = ? AND datasetcode = ? AND statcode = ?",
-            BIND(STRING(s->corpuscode), STRING(s->datasetcode), STRING(YX[curve.yx].label))
-        );
+static bool
+load_grid(store_t * restrict s, unsigned yx, curve_t * restrict curve)
+{
+    int64_t gridid;
+    if (!s->grids || !db_getint_or_empty(
+        "SELECT id FROM result_curve_grid "
+        "WHERE corpuscode = ? AND datasetcode = ? AND statcode = ?",
+        BIND(STRING(s->corpuscode), STRING(s->datasetcode), STRING(YX[yx].label)),
+        &gridid
+    )) {
+        return false;
+    }
 
-        // Store curves in database
+    curve->yx         = yx;
+    curve->iterations = db_getuint("SELECT iterations FROM result_curve_grid WHERE id = ?", BIND(INT(gridid)));
+    curve->nx         = db_getuint("SELECT xslots FROM result_curve_grid WHERE id = ?", BIND(INT(gridid)));
+    curve->ny         = db_getuint("SELECT yslots FROM result_curve_grid WHERE id = ?", BIND(INT(gridid)));
 
-        store_curves(s, &curve, bounds.lower, "lower");
-        store_curves(s, &curve, bounds.upper, "upper");
+    if (s->verbose) {
+        myinfo("%9s,%12s,%10u iterations,%5u x%5u slots",
+               "grid", YX[yx].label, curve->iterations, curve->nx, curve->ny);
+    }
+
+    myfile_t f = mytmpfile();
+    db_storeblob(&f, "SELECT cells FROM result_curve_grid WHERE id = ?", BIND(INT(gridid)));
+    myrewind(&f);
+    MYMALLOC(curve->xthreshold, unsigned, curve->nx);
+    MYMALLOC(curve->ythreshold, unsigned, curve->ny);
+    myfread(&f, curve->xthreshold, sizeof(unsigned), curve->nx);
+    myfread(&f, curve->ythreshold, sizeof(unsigned), curve->ny);
+    size_t ntotal = size_multiply(curve->nx, curve->ny);
+    MYMALLOC(curve->stat, stat_t, ntotal);
+    read_stat_compressed(&f, curve->stat, ntotal);
+    myfread_zero_exact(&f);
+    myclose(&f);
+    return true;
+}
 
+static void
+derive_curves(store_t * restrict s)
+{
+    unsigned ngrid = 0;
+    for (unsigned yx = 0; yx < NYX; yx++) {
+        curve_t curve;
+        db_exec("BEGIN", NOBIND);
+        bool found = load_grid(s, yx, &curve);
+        db_exec("COMMIT", NOBIND);
+        if (found) {
+            process_curves(s, &curve, false);
+            free_curve(&curve);
+            ngrid++;
+        }
+    }
+    if (ngrid == 0) {
+        myerror("corpus %s, data set %s: no curve grids stored", s->corpuscode, s->datasetcode);
     }
-
-    free(curve.xthreshold);
-    free(curve.ythreshold);
-    free(stat);
-    free(bounds.lower);
-    free(bounds.upper);
 }
 
 static void
@@ -415,10 +665,14 @@ read_file(store_t * restrict s)
 {
     MYMALLOC(s->files, myfile_t, s->nfile);
     for (unsigned i = 0; i < s->nfile; i++) {
-        s->files[i] = myopen(s->filenames[i], false);
+        if (strcmp(s->filenames[i], "-") == 0) {
+            s->files[i] = myopen_stdin();
+        } else {
+            s->files[i] = myopen(s->filenames[i], false);
+        }
         unsigned magic = myfread_uint(&s->files[i]);
         if (magic != OUTPUT_MAGIC) {
-            if (magic == INPUT_MAGIC) {
+            if (magic == INPUT_MAGIC || magic == INPUT_MAGIC2) {
                 myerror("%s: wrong file format, this is an input file, not an output file",
                         s->filenames[i]);
             } else {
@@ -480,11 +734,18 @@ main(int argc, char **argv)
     if (argc == 1) {
         usage();
     }
-    if (argc < 6) {
+    const char *note = NULL;
+    if (argc > 2 && strcmp(argv[1], "--note") == 0) {
+        note = argv[2];
+        argc -= 2;
+        argv += 2;
+    }
+    if (argc < 5) {
         myerror("wrong number of parameters");
     }
 
     store_t s;
+    char *description = NULL;
     s.verbose = argv[1][0] == 'V';
     s.progress = argv[1][0] == 'P';
     if (strcmp(argv[2], "-") == 0) {
@@ -496,23 +757,57 @@ main(int argc, char **argv)
     s.datasetcode = argv[4];
     s.filenames = argv + 5;
     s.nfile = argc - 5;
+    unsigned nstdin = 0;
+    for (unsigned i = 0; i < s.nfile; i++) {
+        if (strcmp(s.filenames[i], "-") == 0) {
+            nstdin++;
+        }
+    }
+    if (nstdin > 1) {
+        myerror("stdin can be used for only one source file");
+    }
+    if (s.nfile == 0 && !s.database) {
+        myerror("no source files: deriving curves from the stored grids requires a database");
+    }
 
     if (s.verbose) {
-        myinfo("corpus %s, dataset %s: processing %u input files", s.corpuscode, s.datasetcode, s.nfile);
+        if (s.nfile == 0) {
+            myinfo("corpus %s, dataset %s: deriving curves from the stored grids", s.corpuscode, s.datasetcode);
+        } else {
+            myinfo("corpus %s, dataset %s: processing %u input files", s.corpuscode, s.datasetcode, s.nfile);
+        }
     }
     if (s.database) {
         db_open(s.database, true);
         db_exec("BEGIN", NOBIND);
         init(&s);
-        write_log(&s);
+        db_exec("COMMIT", NOBIND);
+        s.description = s.nfile == 0 ? "types-store, curves derived from stored grids" : TOOL;
+        if (note != NULL) {
+            size_t size = strlen(s.description) + strlen(note) + 3;
+            MYMALLOC(description, char, size);
+            snprintf(description, size, "%s, %s", s.description, note);
+            s.description = description;
+        }
+        s.logid = 0;
     } else {
         if (s.verbose) {
             myinfo("not storing in database");
         }
     }
-    read_file(&s);
-    if (s.database) {
-        db_exec("COMMIT", NOBIND);
+    init_levels(&s);
+    if (s.nfile == 0) {
+        derive_curves(&s);
+    } else {
+        read_file(&s);
+    }
+    free(s.levels);
+    if (s.database && s.logid == 0) {
+        begin_store(&s);
+        end_store();
+    }
+    if (description != NULL) {
+        free(description);
     }
     if (s.verbose) {
         myinfo("all done");
@@ -1,5 +1,8 @@
 # coding=utf-8
 
+import base64
+import hashlib
+import itertools
 import json
 import optparse
 import os
@@ -12,25 +15,39 @@ TOOL = 'types-web'
 BIN_DIR = 'bin'
 DEFAULT_SRC = os.path.realpath(os.path.join(sys.path[0], '..', 'ui'))
 DEFAULT_DEST = 'web'
+DATA_DIR = 'data'
+MANIFEST_FILE = 'manifest.json'
+EXPORT_FORMAT = 1
+
+IN_DATASET = 'corpuscode = ? AND datasetcode = ?'
+IN_DATASET_CURVE = 'curveid IN (SELECT id FROM result_curve WHERE corpuscode = ? AND datasetcode = ?)'
+IN_SAMPLE = 'corpuscode = ? AND datasetcode = ? AND samplecode = ?'
+
+# The last field tells how to select the rows of one data set;
+# tables without it are always loaded with the main page.
 
 what = [
-    ('label', ['labelcode'], [], [], 'normal'),
-    ('stat', ['statcode'], [], [], 'normal'),
-    ('defaultstat', ['statcode'], [], [], 'set'),
-    ('corpus', ['corpuscode'], [], [], 'normal'),
-    ('dataset', ['corpuscode', 'datasetcode'], [], [], 'normal'),
-    ('sample', ['corpuscode', 'samplecode'], [], [], 'normal'),
-    ('collection', ['corpuscode', 'collectioncode'], [], [], 'normal'),
-    ('sample_collection', ['corpuscode', 'collectioncode', 'samplecode'], [], [], 'set'),
-    ('token', ['corpuscode', 'datasetcode', 'samplecode', 'tokencode'], [], [], 'normal'),
-    ('tokeninfo', ['corpuscode', 'datasetcode', 'tokencode'], [], [], 'normal'),
-    ('context', ['corpuscode', 'datasetcode', 'samplecode', 'tokencode'], [], [], 'multi'),
-    ('result_p', ['corpuscode', 'datasetcode', 'collectioncode', 'statcode'], ['id', 'logid'], [], 'normal'),
-    ('result_q', ['i'], [], [], 'normal'),
-    ('result_curve', ['corpuscode', 'datasetcode', 'statcode', 'level', 'side'], ['logid'], [], 'normal'),
-    ('result_curve_point', ['curveid'], [], ['x'], 'multi'),
+    ('label', ['labelcode'], [], [], 'normal', None),
+    ('stat', ['statcode'], [], [], 'normal', None),
+    ('defaultstat', ['statcode'], [], [], 'set', None),
+    ('corpus', ['corpuscode'], [], [], 'normal', None),
+    ('dataset', ['corpuscode', 'datasetcode'], [], [], 'normal', None),
+    ('sample', ['corpuscode', 'samplecode'], [], [], 'normal', None),
+    ('collection', ['corpuscode', 'collectioncode'], [], [], 'normal', None),
+    ('sample_collection', ['corpuscode', 'collectioncode', 'samplecode'], [], [], 'set', None),
+    ('token', ['corpuscode', 'datasetcode', 'samplecode', 'tokencode'], [], [], 'normal', IN_DATASET),
+    ('tokeninfo', ['corpuscode', 'datasetcode', 'tokencode'], [], [], 'normal', IN_DATASET),
+    ('context', ['corpuscode', 'datasetcode', 'samplecode', 'tokencode'], [], [], 'multi', IN_DATASET),
+    ('result_p', ['corpuscode', 'datasetcode', 'collectioncode', 'statcode'], ['id', 'logid'], [], 'normal', None),
+    ('result_q', ['i'], [], [], 'normal', None),
+    ('result_curve', ['corpuscode', 'datasetcode', 'statcode', 'level', 'side'], ['logid'], [], 'normal', None),
+    ('result_curve_point', ['curveid'], [], ['x'], 'multi', IN_DATASET_CURVE),
 ]
 
+# With --split, the contexts of each sample are in a file of their own.
+
+what_sample = ('context', ['tokencode'], ['corpuscode', 'datasetcode', 'samplecode'], [], 'multi', IN_SAMPLE)
+
 def msg(msg):
     sys.stderr.write("%s: %s\n" % (TOOL, msg))
 
@@ -48,25 +65,60 @@ def get_args():
     parser.add_option('--destdir', metavar='FILE', dest='destdir',
                       help='HTML targer directory [default: %default]',
                       default=DEFAULT_DEST)
+    parser.add_option('--split', dest='split', action='store_true',
+                      help='write the tokens and curves of each data set, and the contexts of each sample, in separate files that the browser loads when needed',
+                      default=False)
+    parser.add_option('--compact', dest='compact', action='store_true',
+                      help='encode the points of each curve as a base64 string of delta-encoded 32-bit integers',
+                      default=False)
+    parser.add_option('--full', dest='full', action='store_true',
+                      help='rewrite all files, even if they seem to be up to date',
+                      default=False)
     (options, args) = parser.parse_args()
     return options
 
-def dump(data, conn, table, keys, skip, sort, kind):
-    assert table not in data
-    d = {}
-    data[table] = d
+def json_value(v):
+    return json.dumps(v, sort_keys=True, separators=(',', ':'))
+
+def json_key(v):
+    if isinstance(v, float):
+        v = repr(v)
+    return json.dumps(str(v)) + ':'
+
+def encode_curve(points):
+    return base64.b64encode(TypesDatabase.pack_curve(points)).decode('ascii')
 
+def compact(w):
+    table, keys, skip, sort, kind, where = w
+    if table == 'result_curve_point':
+        kind = 'curve'
+    return (table, keys, skip, sort, kind, where)
+
+def table_exists(conn, table):
     r = list(conn.execute('''
         SELECT COUNT(*)
         FROM sqlite_master
         WHERE type='table' AND name=?
     ''', [table]))
-    if r[0][0] == 0:
+    return r[0][0] > 0
+
+# Rows are read in the order of the key columns and written as
+# nested objects as they arrive; an object is closed as soon as
+# its key changes, so the whole table is never held in memory.
+
+def dump(f, conn, table, keys, skip, sort, kind, where, params=()):
+    if table == 'result_curve_point' and TypesDatabase.has_packed_curves(conn):
+        dump_packed(f, conn, kind, where, params)
+        return
+    if not table_exists(conn, table):
+        f.write('{}')
         return
 
-    r = conn.execute(
-        'SELECT * FROM ' + table + ' ORDER BY ' + ','.join(keys + sort)
-    )
+    sql = 'SELECT * FROM ' + table
+    if where is not None and len(params) > 0:
+        sql += ' WHERE ' + where
+    sql += ' ORDER BY ' + ','.join(keys + sort)
+    r = conn.execute(sql, params)
     key_columns = []
     plain_columns = []
     key_map = {}
@@ -92,61 +144,245 @@ def dump(data, conn, table, keys, skip, sort, kind):
     else:
         assert len(plain_columns) > 0
 
+    if kind == 'curve':
+        x = [ i for i,column in plain_columns if column == 'x' ][0]
+        y = [ i for i,column in plain_columns if column == 'y' ][0]
+        f.write('{')
+        first = True
+        for k, rows in itertools.groupby(r, lambda row: row[key_columns[0]]):
+            if not first:
+                f.write(',')
+            first = False
+            f.write(json_key(k))
+            f.write(json_value(encode_curve([ (row[x], row[y]) for row in rows ])))
+        f.write('}')
+        return
+
+    if kind == 'normal' or kind == 'multi':
+        depth = len(keys)
+    elif kind == 'set':
+        depth = max(1, len(keys) - 1)
+    else:
+        assert False, kind
+    is_list = kind != 'normal'
+
+    f.write('{')
+    prev = None
     for row in r:
-        p = d
-        if kind == 'normal':
-            for j,key in enumerate(keys):
-                v = row[key_columns[j]]
-                if v not in p:
-                    p[v] = {}
-                p = p[v]
-            assert len(p) == 0
-            for i,column in plain_columns:
-                v = row[i]
-                if v is not None:
-                    p[column] = v
-        elif kind == 'multi':
-            for j,key in enumerate(keys[:-1]):
-                v = row[key_columns[j]]
-                if v not in p:
-                    p[v] = {}
-                p = p[v]
-            v = row[key_columns[-1]]
-            if v not in p:
-                p[v] = []
-            p = p[v]
-            p2 = {}
-            p.append(p2)
-            p = p2
-        elif kind == 'set':
-            for j,key in enumerate(keys[:-2]):
-                v = row[key_columns[j]]
-                if v not in p:
-                    p[v] = {}
-                p = p[v]
-            if len(key_columns) > 1:
-                v = row[key_columns[-2]]
+        if kind == 'set':
+            if len(keys) > 1:
+                path = tuple(row[c] for c in key_columns[:-1])
             else:
-                v = 'v'
-            if v not in p:
-                p[v] = []
-            p = p[v]
-            v = row[key_columns[-1]]
-            assert v not in p
-            p.append(v)
+                path = ('v',)
+            value = row[key_columns[-1]]
         else:
-            assert False, kind
-
-        if kind != 'set':
+            path = tuple(row[c] for c in key_columns)
+            value = {}
             for i,column in plain_columns:
                 v = row[i]
                 if v is not None:
-                    p[column] = v
+                    value[column] = v
+
+        if prev is None:
+            common = 0
+        else:
+            common = 0
+            while common < depth and prev[common] == path[common]:
+                common += 1
+            if common == depth:
+                assert is_list, (table, path)
+                f.write(',')
+                f.write(json_value(value))
+                continue
+            if is_list:
+                f.write(']')
+            f.write('}' * (depth - 1 - common))
+            f.write(',')
+        for j in range(common, depth):
+            f.write(json_key(path[j]))
+            if j < depth - 1:
+                f.write('{')
+        if is_list:
+            f.write('[')
+        f.write(json_value(value))
+        prev = path
+
+    if prev is not None:
+        if is_list:
+            f.write(']')
+        f.write('}' * (depth - 1))
+    f.write('}')
+
+# Packed curves are read from result_curve_data instead of the view
+# result_curve_point; with --compact, the blobs are already in the
+# right encoding.
+
+def dump_packed(f, conn, kind, where, params):
+    sql = 'SELECT curveid, points FROM result_curve_data'
+    if where is not None and len(params) > 0:
+        sql += ' WHERE ' + where
+    sql += ' ORDER BY curveid'
+    f.write('{')
+    first = True
+    for curveid, points in conn.execute(sql, params):
+        if not first:
+            f.write(',')
+        first = False
+        f.write(json_key(curveid))
+        if kind == 'curve':
+            f.write(json_value(base64.b64encode(points).decode('ascii')))
+        else:
+            f.write(json_value([ { 'x': x, 'y': y } for x, y in TypesDatabase.unpack_curve(points) ]))
+    f.write('}')
+
+def dump_all(f, conn, tables, params=(), extra=()):
+    f.write('{')
+    first = True
+    for w in tables:
+        if not first:
+            f.write(',')
+        first = False
+        f.write(json_key(w[0]))
+        dump(f, conn, *w, params=params)
+    for k, v in extra:
+        f.write(',')
+        f.write(json_key(k))
+        f.write(json_value(v))
+    f.write('}')
+
+def get_shard_file(*codes):
+    h = hashlib.sha1(json_value(list(codes)).encode('utf-8'))
+    return DATA_DIR + '/' + h.hexdigest()[:16] + '.js'
+
+def get_key(*parts):
+    h = hashlib.sha1(json_value([EXPORT_FORMAT] + list(parts)).encode('utf-8'))
+    return h.hexdigest()
+
+def query_key(conn, table, sql, params):
+    if not table_exists(conn, table):
+        return None
+    return list(conn.execute(sql, params))
+
+# The manifest records a key for each data file. The key is computed
+# from row counts, rowids, and log ids, which is much cheaper than
+# reading the rows. A file is rewritten only if its key has changed.
+# Rows that are modified in place with UPDATE may go unnoticed;
+# use --full after such changes.
+
+class Manifest:
+    def __init__(self, d, full):
+        self.d = d
+        self.filename = os.path.join(d, DATA_DIR, MANIFEST_FILE)
+        self.old = {}
+        self.new = {}
+        self.written = 0
+        self.kept = 0
+        if not full and os.path.exists(self.filename):
+            with open(self.filename) as f:
+                self.old = json.load(f)
+
+    def is_current(self, fn, key):
+        self.new[fn] = key
+        if self.old.get(fn) == key and os.path.exists(os.path.join(self.d, fn)):
+            self.kept += 1
+            return True
+        else:
+            self.written += 1
+            return False
+
+    def save(self):
+        for fn in self.old:
+            if fn not in self.new and os.path.exists(os.path.join(self.d, fn)):
+                os.remove(os.path.join(self.d, fn))
+        with open(self.filename + '.tmp', 'w') as f:
+            f.write(json_value(self.new))
+        os.rename(self.filename + '.tmp', self.filename)
+
+def write_call(d, fn, call, codes, write):
+    print(fn)
+    target = os.path.join(d, fn)
+    with open(target + '.tmp', "w") as f:
+        f.write('types.%s(' % call)
+        for code in codes:
+            f.write(json_value(code))
+            f.write(',')
+        write(f)
+        f.write(')')
+    os.rename(target + '.tmp', target)
+
+def write_context(conn, d, manifest, corpuscode, datasetcode):
+    files = {}
+    if not table_exists(conn, 'context'):
+        return files
+    r = conn.execute('''
+        SELECT samplecode, COUNT(*), MIN(rowid), MAX(rowid) FROM context
+        WHERE corpuscode = ? AND datasetcode = ?
+        GROUP BY samplecode
+        ORDER BY samplecode
+    ''', (corpuscode, datasetcode))
+    for samplecode, count, minid, maxid in list(r):
+        codes = (corpuscode, datasetcode, samplecode)
+        fn = get_shard_file(*codes)
+        files[samplecode] = fn
+        if manifest.is_current(fn, get_key(codes, count, minid, maxid)):
+            continue
+        write_call(d, fn, 'context', codes,
+            lambda f: dump(f, conn, *what_sample, params=codes))
+    return files
+
+def get_shard_key(conn, tables, codes, context):
+    return get_key(
+        codes, context, [ w[4] for w in tables ],
+        query_key(conn, 'token', '''
+            SELECT COUNT(*), MAX(rowid), TOTAL(tokencount) FROM token
+            WHERE corpuscode = ? AND datasetcode = ?
+        ''', codes),
+        query_key(conn, 'tokeninfo', '''
+            SELECT tokencode, shortlabel, longlabel FROM tokeninfo
+            WHERE corpuscode = ? AND datasetcode = ?
+            ORDER BY tokencode
+        ''', codes),
+        query_key(conn, 'result_curve', '''
+            SELECT id, logid FROM result_curve
+            WHERE corpuscode = ? AND datasetcode = ?
+            ORDER BY id
+        ''', codes),
+    )
+
+def write_shards(conn, d, all_tables, full):
+    tables = [ w for w in all_tables if w[5] is not None and w[0] != 'context' ]
+    shards = {}
+    datadir = os.path.join(d, DATA_DIR)
+    if not os.path.exists(datadir):
+        os.makedirs(datadir)
+    manifest = Manifest(d, full)
+    r = conn.execute('SELECT corpuscode, datasetcode FROM dataset ORDER BY corpuscode, datasetcode')
+    for corpuscode, datasetcode in list(r):
+        codes = (corpuscode, datasetcode)
+        context = write_context(conn, d, manifest, corpuscode, datasetcode)
+        extra = [ ('context_shard', { corpuscode: { datasetcode: context } }) ]
+        fn = get_shard_file(*codes)
+        shards.setdefault(corpuscode, {})[datasetcode] = fn
+        if manifest.is_current(fn, get_shard_key(conn, tables, codes, context)):
+            continue
+        write_call(d, fn, 'shard', codes,
+            lambda f: dump_all(f, conn, tables, codes, extra))
+    manifest.save()
+    msg('%d data files written, %d up to date' % (manifest.written, manifest.kept))
+    return shards
+
+def copy_if_changed(src, dest, full):
+    if not full and os.path.exists(dest):
+        a = os.stat(src)
+        b = os.stat(dest)
+        if a.st_size == b.st_size and int(a.st_mtime) == int(b.st_mtime):
+            return
+    print(os.path.basename(dest))
+    shutil.copy2(src, dest)
 
 def main():
     args = get_args()
     conn = TypesDatabase.open_db(args.db)
-    data = {}
 
     s = args.srcdir
     d = args.destdir
@@ -157,17 +393,23 @@ def main():
     for fn in os.listdir(s):
         if fn.startswith('.'):
             continue
-        print(fn)
-        shutil.copy2(os.path.join(s, fn), os.path.join(d, fn))
+        copy_if_changed(os.path.join(s, fn), os.path.join(d, fn), args.full)
 
-    for w in what:
-        dump(data, conn, *w)
+    tables = what
+    if args.compact:
+        tables = [ compact(w) for w in tables ]
+    extra = []
+    if args.split:
+        shards = write_shards(conn, d, tables, args.full)
+        tables = [ w for w in tables if w[5] is None ]
+        extra = [ ('shard', shards) ]
     fn = "types-data.js"
     print(fn)
     jsfile = os.path.join(d, fn)
-    with open(jsfile, "w") as f:
+    with open(jsfile + '.tmp', "w") as f:
         f.write('types.data(')
-        f.write(json.dumps(data, sort_keys=True, separators=(',', ':')))
+        dump_all(f, conn, tables, extra=extra)
         f.write(')')
+    os.rename(jsfile + '.tmp', jsfile)
 
 main()
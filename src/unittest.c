@@ -35,16 +35,17 @@ main(int argc, char **argv)
     // rng: sanity checking
 
     myfile_t f = myopen(rngstatefile, false);
-    rng_state_t * restrict rng_state = rng_state_read(&f);
+    unsigned streams;
+    rng_state_t * restrict rng_state = rng_state_read(&f, &streams);
     myclose(&f);
-    unsigned ITER = 2000000 / NGEN;
+    unsigned ITER = 2000000 / streams;
     unsigned TOL = 2000;
     for (unsigned n = 1; n < 15; n++) {
         unsigned w[n];
         for (unsigned i = 0; i < n; i++) {
             w[i] = 0;
         }
-        for (unsigned gen = 0; gen < NGEN; gen++) {
+        for (unsigned gen = 0; gen < streams; gen++) {
             rng_state_t rng = rng_state[gen];
             unsigned v[n];
             for (unsigned i = 0; i < n; i++) {
@@ -61,7 +62,7 @@ main(int argc, char **argv)
             }
             rng_state[gen] = rng;
         }
-        int expected = NGEN*ITER/n;
+        int expected = streams*ITER/n;
         for (unsigned i = 0; i < n; i++) {
             assert(w[i] > expected - TOL);
             assert(w[i] < expected + TOL);
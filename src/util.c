@@ -3,6 +3,9 @@
 #include <assert.h>
 #include <stdint.h>
 #include <stdio.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif
 
 size_t
 size_multiply(size_t a, size_t b)
@@ -46,3 +49,13 @@ split(unsigned total, unsigned n, unsigned i)
         return x;
     }
 }
+
+unsigned
+get_max_threads(void)
+{
+#ifdef _OPENMP
+    return (unsigned)omp_get_max_threads();
+#else
+    return 1;
+#endif
+}
@@ -27,4 +27,9 @@ uint_multiply(unsigned a, unsigned b, unsigned max);
 unsigned
 split(unsigned total, unsigned n, unsigned i);
 
+// Number of threads in parallel regions; 1 without OpenMP.
+
+unsigned
+get_max_threads(void);
+
 #endif
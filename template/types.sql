@@ -0,0 +1,331 @@
+PRAGMA foreign_keys=OFF;
+BEGIN TRANSACTION;
+CREATE TABLE label (
+            labelcode TEXT NOT NULL PRIMARY KEY,
+            labeltext TEXT NOT NULL
+        );
+INSERT INTO label VALUES('type','types');
+INSERT INTO label VALUES('hapax','hapaxes');
+INSERT INTO label VALUES('token','tokens');
+INSERT INTO label VALUES('word','running words');
+CREATE TABLE stat (
+            statcode TEXT NOT NULL PRIMARY KEY,
+            y TEXT NOT NULL REFERENCES label(labelcode),
+            x TEXT NOT NULL REFERENCES label(labelcode)
+        );
+INSERT INTO stat VALUES('type-word','type','word');
+INSERT INTO stat VALUES('type-token','type','token');
+INSERT INTO stat VALUES('hapax-word','hapax','word');
+INSERT INTO stat VALUES('hapax-token','hapax','token');
+INSERT INTO stat VALUES('token-word','token','word');
+CREATE TABLE defaultstat (
+            statcode TEXT NOT NULL PRIMARY KEY REFERENCES stat(statcode)
+        );
+INSERT INTO defaultstat VALUES('type-word');
+INSERT INTO defaultstat VALUES('type-token');
+CREATE TABLE defaultlevel (
+            level REAL NOT NULL PRIMARY KEY
+        );
+INSERT INTO defaultlevel VALUES(0.0001000000000000000047);
+INSERT INTO defaultlevel VALUES(0.00100000000000000002);
+INSERT INTO defaultlevel VALUES(0.0100000000000000002);
+INSERT INTO defaultlevel VALUES(0.1000000000000000055);
+CREATE TABLE corpus (
+            corpuscode TEXT NOT NULL PRIMARY KEY,
+            description TEXT
+        );
+CREATE TABLE dataset (
+            corpuscode TEXT NOT NULL REFERENCES corpus(corpuscode),
+            datasetcode TEXT NOT NULL,
+            description TEXT,
+            PRIMARY KEY (corpuscode, datasetcode)
+        );
+CREATE TABLE sample (
+            corpuscode TEXT NOT NULL REFERENCES corpus(corpuscode),
+            samplecode TEXT NOT NULL,
+            wordcount INTEGER NOT NULL,
+            description TEXT,
+            link TEXT,
+            PRIMARY KEY (corpuscode, samplecode)
+        );
+CREATE TABLE collection (
+            corpuscode TEXT NOT NULL REFERENCES corpus(corpuscode),
+            collectioncode TEXT NOT NULL,
+            groupcode TEXT,
+            description TEXT,
+            PRIMARY KEY (corpuscode, collectioncode)
+        );
+CREATE TABLE sample_collection (
+            corpuscode TEXT NOT NULL,
+            samplecode TEXT NOT NULL,
+            collectioncode TEXT NOT NULL,
+            PRIMARY KEY (corpuscode, samplecode, collectioncode),
+            FOREIGN KEY (corpuscode, samplecode) REFERENCES sample(corpuscode, samplecode),
+            FOREIGN KEY (corpuscode, collectioncode) REFERENCES collection(corpuscode, collectioncode)
+        );
+CREATE TABLE token (
+            corpuscode TEXT NOT NULL,
+            samplecode TEXT NOT NULL,
+            datasetcode TEXT NOT NULL,
+            tokencode TEXT NOT NULL,
+            tokencount INTEGER NOT NULL,
+            PRIMARY KEY (corpuscode, samplecode, datasetcode, tokencode),
+            FOREIGN KEY (corpuscode, datasetcode) REFERENCES dataset(corpuscode, datasetcode),
+            FOREIGN KEY (corpuscode, samplecode) REFERENCES sample(corpuscode, samplecode)
+        );
+CREATE TABLE tokeninfo (
+            corpuscode TEXT NOT NULL,
+            datasetcode TEXT NOT NULL,
+            tokencode TEXT NOT NULL,
+            shortlabel TEXT,
+            longlabel TEXT,
+            PRIMARY KEY (corpuscode, datasetcode, tokencode),
+            FOREIGN KEY (corpuscode, datasetcode) REFERENCES dataset(corpuscode, datasetcode)
+        );
+CREATE TABLE context (
+            corpuscode TEXT NOT NULL,
+            samplecode TEXT NOT NULL,
+            datasetcode TEXT NOT NULL,
+            tokencode TEXT NOT NULL,
+            before TEXT,
+            word TEXT,
+            after TEXT,
+            link TEXT,
+            FOREIGN KEY (corpuscode, datasetcode) REFERENCES dataset(corpuscode, datasetcode),
+            FOREIGN KEY (corpuscode, samplecode) REFERENCES sample(corpuscode, samplecode)
+        );
+CREATE TABLE log (
+            id INTEGER PRIMARY KEY NOT NULL,
+            corpuscode TEXT NOT NULL,
+            datasetcode TEXT NOT NULL,
+            timestamp TEXT,
+            description TEXT,
+            FOREIGN KEY (corpuscode, datasetcode) REFERENCES dataset(corpuscode, datasetcode)
+        );
+CREATE TABLE result_p (
+            id INTEGER PRIMARY KEY NOT NULL,
+            corpuscode TEXT NOT NULL,
+            datasetcode TEXT NOT NULL,
+            collectioncode TEXT NOT NULL,
+            statcode TEXT NOT NULL REFERENCES stat(statcode),
+            x INTEGER NOT NULL,
+            y INTEGER NOT NULL,
+            total INTEGER NOT NULL,
+            below INTEGER NOT NULL,
+            above INTEGER NOT NULL,
+            logid INTEGER NOT NULL REFERENCES log(id),
+            UNIQUE (corpuscode, datasetcode, collectioncode, statcode),
+            FOREIGN KEY (corpuscode, datasetcode) REFERENCES dataset(corpuscode, datasetcode),
+            FOREIGN KEY (corpuscode, collectioncode) REFERENCES collection(corpuscode, collectioncode)
+        );
+CREATE TABLE result_q (
+            i INTEGER PRIMARY KEY NOT NULL,
+            n INTEGER NOT NULL,
+            corpuscode TEXT NOT NULL,
+            datasetcode TEXT NOT NULL,
+            collectioncode TEXT NOT NULL,
+            statcode TEXT NOT NULL REFERENCES stat(statcode),
+            side TEXT NOT NULL,
+            p REAL,
+            q REAL,
+            UNIQUE (corpuscode, datasetcode, collectioncode, statcode, side),
+            FOREIGN KEY (corpuscode, datasetcode) REFERENCES dataset(corpuscode, datasetcode),
+            FOREIGN KEY (corpuscode, collectioncode) REFERENCES collection(corpuscode, collectioncode)
+        );
+CREATE TABLE result_q_pending (
+            p REAL
+        );
+CREATE TABLE result_curve (
+            id INTEGER PRIMARY KEY NOT NULL,
+            corpuscode TEXT NOT NULL,
+            datasetcode TEXT NOT NULL,
+            statcode TEXT NOT NULL REFERENCES stat(statcode),
+            level REAL NOT NULL,
+            side TEXT NOT NULL,
+            xslots INTEGER NOT NULL,
+            yslots INTEGER NOT NULL,
+            iterations INTEGER NOT NULL,
+            logid INTEGER NOT NULL REFERENCES log(id),
+            UNIQUE (corpuscode, datasetcode, statcode, level, side),
+            FOREIGN KEY (corpuscode, datasetcode) REFERENCES dataset(corpuscode, datasetcode)
+        );
+CREATE TABLE input_digest (
+            corpuscode TEXT NOT NULL,
+            datasetcode TEXT NOT NULL,
+            statcode TEXT NOT NULL REFERENCES stat(statcode),
+            kind TEXT NOT NULL,
+            digest TEXT NOT NULL,
+            input TEXT,
+            dirty INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (corpuscode, datasetcode, statcode, kind),
+            FOREIGN KEY (corpuscode, datasetcode) REFERENCES dataset(corpuscode, datasetcode)
+        );
+CREATE TABLE result_curve_point (
+            curveid INTEGER NOT NULL REFERENCES result_curve(id),
+            x INTEGER NOT NULL,
+            y INTEGER NOT NULL,
+            PRIMARY KEY (curveid, x)
+        );
+CREATE VIEW view_corpus AS
+        SELECT corpuscode, COUNT(0) AS samplecount
+        FROM sample
+        GROUP BY corpuscode;
+CREATE VIEW view_result_type_word AS
+        SELECT corpuscode, datasetcode, collectioncode, y AS typecount, x AS wordcount
+        FROM result_p
+        WHERE statcode = 'type-word'
+        ORDER BY corpuscode, datasetcode, collectioncode;
+CREATE VIEW view_result_type_token AS
+        SELECT corpuscode, datasetcode, collectioncode, y AS typecount, x AS tokencount
+        FROM result_p
+        WHERE statcode = 'type-token'
+        ORDER BY corpuscode, datasetcode, collectioncode;
+CREATE VIEW view_result_hapax_word AS
+        SELECT corpuscode, datasetcode, collectioncode, y AS hapaxcount, x AS wordcount
+        FROM result_p
+        WHERE statcode = 'hapax-word'
+        ORDER BY corpuscode, datasetcode, collectioncode;
+CREATE VIEW view_result_hapax_token AS
+        SELECT corpuscode, datasetcode, collectioncode, y AS hapaxcount, x AS tokencount
+        FROM result_p
+        WHERE statcode = 'hapax-token'
+        ORDER BY corpuscode, datasetcode, collectioncode;
+CREATE VIEW view_result_token_word AS
+        SELECT corpuscode, datasetcode, collectioncode, y AS tokencount, x AS wordcount
+        FROM result_p
+        WHERE statcode = 'token-word'
+        ORDER BY corpuscode, datasetcode, collectioncode;
+CREATE VIEW view_result AS
+        SELECT dataset.corpuscode AS corpuscode,
+            dataset.datasetcode AS datasetcode,
+            collection.collectioncode AS collectioncode,
+            COALESCE(yw.wordcount, hw.wordcount, tw.wordcount) AS wordcount,
+            COALESCE(yt.tokencount, ht.tokencount, tw.tokencount) AS tokencount,
+            COALESCE(yw.typecount, yt.typecount) AS typecount,
+            COALESCE(hw.hapaxcount, ht.hapaxcount) AS hapaxcount
+        FROM dataset JOIN collection USING (corpuscode)
+        LEFT JOIN view_result_type_word AS yw USING (datasetcode, collectioncode, corpuscode)
+        LEFT JOIN view_result_type_token AS yt USING (datasetcode, collectioncode, corpuscode)
+        LEFT JOIN view_result_hapax_word AS hw USING (datasetcode, collectioncode, corpuscode)
+        LEFT JOIN view_result_hapax_token AS ht USING (datasetcode, collectioncode, corpuscode)
+        LEFT JOIN view_result_token_word AS tw USING (datasetcode, collectioncode, corpuscode)
+        ORDER BY corpuscode, datasetcode, collectioncode;
+CREATE VIEW view_missing_curve AS
+        SELECT corpuscode, datasetcode, statcode, level, side
+        FROM dataset
+        JOIN defaultlevel
+        JOIN defaultstat
+        JOIN (SELECT 'lower' AS side UNION SELECT 'upper' AS side)
+        EXCEPT
+        SELECT corpuscode, datasetcode, statcode, level, side
+        FROM result_curve;
+CREATE VIEW view_missing_p AS
+        SELECT corpuscode, datasetcode, collectioncode, statcode
+        FROM dataset
+        JOIN collection USING (corpuscode)
+        JOIN defaultstat
+        EXCEPT
+        SELECT corpuscode, datasetcode, collectioncode, statcode
+        FROM result_p;
+CREATE TRIGGER input_sample_insert
+                AFTER INSERT ON sample
+                BEGIN 
+                UPDATE input_digest SET dirty = 1 WHERE corpuscode = NEW.corpuscode AND dirty = 0;
+             END;
+CREATE TRIGGER input_sample_delete
+                AFTER DELETE ON sample
+                BEGIN 
+                UPDATE input_digest SET dirty = 1 WHERE corpuscode = OLD.corpuscode AND dirty = 0;
+             END;
+CREATE TRIGGER input_sample_update
+                AFTER UPDATE ON sample
+                BEGIN 
+                UPDATE input_digest SET dirty = 1 WHERE corpuscode = OLD.corpuscode AND dirty = 0;
+            
+                UPDATE input_digest SET dirty = 1 WHERE corpuscode = NEW.corpuscode AND dirty = 0;
+             END;
+CREATE TRIGGER input_collection_insert
+                AFTER INSERT ON collection
+                BEGIN 
+                UPDATE input_digest SET dirty = 1 WHERE corpuscode = NEW.corpuscode AND dirty = 0;
+             END;
+CREATE TRIGGER input_collection_delete
+                AFTER DELETE ON collection
+                BEGIN 
+                UPDATE input_digest SET dirty = 1 WHERE corpuscode = OLD.corpuscode AND dirty = 0;
+             END;
+CREATE TRIGGER input_collection_update
+                AFTER UPDATE ON collection
+                BEGIN 
+                UPDATE input_digest SET dirty = 1 WHERE corpuscode = OLD.corpuscode AND dirty = 0;
+            
+                UPDATE input_digest SET dirty = 1 WHERE corpuscode = NEW.corpuscode AND dirty = 0;
+             END;
+CREATE TRIGGER input_sample_collection_insert
+                AFTER INSERT ON sample_collection
+                BEGIN 
+                UPDATE input_digest SET dirty = 1 WHERE corpuscode = NEW.corpuscode AND dirty = 0;
+             END;
+CREATE TRIGGER input_sample_collection_delete
+                AFTER DELETE ON sample_collection
+                BEGIN 
+                UPDATE input_digest SET dirty = 1 WHERE corpuscode = OLD.corpuscode AND dirty = 0;
+             END;
+CREATE TRIGGER input_sample_collection_update
+                AFTER UPDATE ON sample_collection
+                BEGIN 
+                UPDATE input_digest SET dirty = 1 WHERE corpuscode = OLD.corpuscode AND dirty = 0;
+            
+                UPDATE input_digest SET dirty = 1 WHERE corpuscode = NEW.corpuscode AND dirty = 0;
+             END;
+CREATE TRIGGER input_token_insert
+                AFTER INSERT ON token
+                BEGIN 
+                UPDATE input_digest SET dirty = 1 WHERE corpuscode = NEW.corpuscode AND datasetcode = NEW.datasetcode AND dirty = 0;
+             END;
+CREATE TRIGGER input_token_delete
+                AFTER DELETE ON token
+                BEGIN 
+                UPDATE input_digest SET dirty = 1 WHERE corpuscode = OLD.corpuscode AND datasetcode = OLD.datasetcode AND dirty = 0;
+             END;
+CREATE TRIGGER input_token_update
+                AFTER UPDATE ON token
+                BEGIN 
+                UPDATE input_digest SET dirty = 1 WHERE corpuscode = OLD.corpuscode AND datasetcode = OLD.datasetcode AND dirty = 0;
+            
+                UPDATE input_digest SET dirty = 1 WHERE corpuscode = NEW.corpuscode AND datasetcode = NEW.datasetcode AND dirty = 0;
+             END;
+CREATE TRIGGER result_q_insert
+            AFTER INSERT ON result_p
+            BEGIN 
+            INSERT INTO result_q_pending (p) VALUES
+                (CAST(NEW.below AS REAL)/CAST(NEW.total AS REAL)),
+                (CAST(NEW.above AS REAL)/CAST(NEW.total AS REAL));
+         END;
+CREATE TRIGGER result_q_delete
+            AFTER DELETE ON result_p
+            BEGIN 
+            INSERT INTO result_q_pending (p) VALUES
+                (CAST(OLD.below AS REAL)/CAST(OLD.total AS REAL)),
+                (CAST(OLD.above AS REAL)/CAST(OLD.total AS REAL));
+         END;
+CREATE TRIGGER result_q_update
+            AFTER UPDATE ON result_p
+            BEGIN 
+            INSERT INTO result_q_pending (p) VALUES
+                (CAST(OLD.below AS REAL)/CAST(OLD.total AS REAL)),
+                (CAST(OLD.above AS REAL)/CAST(OLD.total AS REAL));
+        
+            INSERT INTO result_q_pending (p) VALUES
+                (CAST(NEW.below AS REAL)/CAST(NEW.total AS REAL)),
+                (CAST(NEW.above AS REAL)/CAST(NEW.total AS REAL));
+         END;
+CREATE INDEX context_idx
+        ON context (corpuscode, samplecode, datasetcode, tokencode);
+CREATE INDEX log_dataset_idx
+        ON log (corpuscode, datasetcode);
+CREATE INDEX result_p_log_idx
+        ON result_p (logid);
+CREATE INDEX result_curve_log_idx
+        ON result_curve (logid);
+COMMIT;
@@ -0,0 +1 @@
+types.data({"label":{"hapax":{"labeltext":"hapaxes"},"token":{"labeltext":"tokens"},"type":{"labeltext":"types"},"word":{"labeltext":"running words"}},"stat":{"hapax-token":{"x":"token","y":"hapax"},"hapax-word":{"x":"word","y":"hapax"},"token-word":{"x":"word","y":"token"},"type-token":{"x":"token","y":"type"},"type-word":{"x":"word","y":"type"}},"defaultstat":{"v":["hapax-token","hapax-word","token-word","type-token","type-word"]},"corpus":{"check-a":{"description":"Artificial test data"},"check-b":{"description":"Artificial test data"},"check-c":{"description":"Artificial test data"},"check-d":{"description":"Artificial test data"},"check-e":{"description":"Artificial test data"},"check-f":{"description":"Artificial test data"},"check-g":{"description":"Artificial test data"},"check-h":{"description":"Test data, derived from an old data set"}},"dataset":{"check-a":{"example":{"description":"Artificial test data"}},"check-b":{"example":{"description":"Artificial test data"}},"check-c":{"example":{"description":"Artificial test data"}},"check-d":{"example":{"description":"Artificial test data"}},"check-e":{"example":{"description":"Artificial test data"}},"check-f":{"example":{"description":"Artificial test data"}},"check-g":{"example":{"description":"Artificial test data"}},"check-h":{"example":{"description":"Test data, derived from an old data set"}}},"sample":{"check-a":{"sample-1":{"wordcount":5},"sample-2":{"wordcount":20},"sample-3":{"wordcount":2},"sample-4":{"wordcount":2},"sample-5":{"wordcount":6},"sample-6":{"wordcount":5},"sample-7":{"wordcount":20}},"check-b":{"sample-1":{"wordcount":5},"sample-2":{"wordcount":20},"sample-3":{"wordcount":2},"sample-4":{"wordcount":2},"sample-5":{"wordcount":6},"sample-6":{"wordcount":5},"sample-7":{"wordcount":20}},"check-c":{"sample-1":{"wordcount":5},"sample-2":{"wordcount":20},"sample-3":{"wordcount":2},"sample-4":{"wordcount":2},"sample-5":{"wordcount":6},"sample-6":{"wordcount":5},"sample-7":{"wordcount":20}},"check-d":{"sample-1":{"wordcount":5},"sample-2":{"wordcount":20},"sample-3":{"wordcount":2},"sample-4":{"wordcount":2},"sample-5":{"wordcount":6},"sample-6":{"wordcount":5},"sample-7":{"wordcount":20}},"check-e":{"sample-1":{"wordcount":15},"sample-2":{"wordcount":10},"sample-3":{"wordcount":5},"sample-4":{"wordcount":30}},"check-f":{"sample-1":{"wordcount":15},"sample-2":{"wordcount":10},"sample-3":{"wordcount":5},"sample-4":{"wordcount":30}},"check-g":{"sample-1":{"wordcount":1}},"check-h":{"sample-001":{"wordcount":1},"sample-002":{"wordcount":5},"sample-003":{"wordcount":10},"sample-004":{"wordcount":7},"sample-005":{"wordcount":4},"sample-006":{"wordcount":9},"sample-007":{"wordcount":1},"sample-008":{"wordcount":9},"sample-009":{"wordcount":2},"sample-010":{"wordcount":7},"sample-011":{"wordcount":7},"sample-012":{"wordcount":4},"sample-013":{"wordcount":3},"sample-014":{"wordcount":6},"sample-015":{"wordcount":6},"sample-016":{"wordcount":6},"sample-017":{"wordcount":9},"sample-018":{"wordcount":4},"sample-019":{"wordcount":2},"sample-020":{"wordcount":8},"sample-021":{"wordcount":1},"sample-022":{"wordcount":8},"sample-023":{"wordcount":9},"sample-024":{"wordcount":2},"sample-025":{"wordcount":8},"sample-026":{"wordcount":10},"sample-027":{"wordcount":10},"sample-028":{"wordcount":4},"sample-029":{"wordcount":7},"sample-030":{"wordcount":6},"sample-031":{"wordcount":8},"sample-032":{"wordcount":2},"sample-033":{"wordcount":2},"sample-034":{"wordcount":10},"sample-035":{"wordcount":7},"sample-036":{"wordcount":5},"sample-037":{"wordcount":3},"sample-038":{"wordcount":10},"sample-039":{"wordcount":6},"sample-040":{"wordcount":5},"sample-041":{"wordcount":7},"sample-042":{"wordcount":10},"sample-043":{"wordcount":1},"sample-044":{"wordcount":2},"sample-045":{"wordcount":10},"sample-046":{"wordcount":7},"sample-047":{"wordcount":9},"sample-048":{"wordcount":10},"sample-049":{"wordcount":9},"sample-050":{"wordcount":2},"sample-051":{"wordcount":7},"sample-052":{"wordcount":1},"sample-053":{"wordcount":4},"sample-054":{"wordcount":4},"sample-055":{"wordcount":6},"sample-056":{"wordcount":3},"sample-057":{"wordcount":1},"sample-058":{"wordcount":6},"sample-059":{"wordcount":1},"sample-060":{"wordcount":10},"sample-061":{"wordcount":3},"sample-062":{"wordcount":4},"sample-063":{"wordcount":9},"sample-064":{"wordcount":7},"sample-065":{"wordcount":1},"sample-066":{"wordcount":5},"sample-067":{"wordcount":1},"sample-068":{"wordcount":10},"sample-069":{"wordcount":5},"sample-070":{"wordcount":2},"sample-071":{"wordcount":6},"sample-072":{"wordcount":8},"sample-073":{"wordcount":9},"sample-074":{"wordcount":1},"sample-075":{"wordcount":7},"sample-076":{"wordcount":9},"sample-077":{"wordcount":5},"sample-078":{"wordcount":10},"sample-079":{"wordcount":7},"sample-080":{"wordcount":10},"sample-081":{"wordcount":4},"sample-082":{"wordcount":6},"sample-083":{"wordcount":10},"sample-084":{"wordcount":10},"sample-085":{"wordcount":3},"sample-086":{"wordcount":8},"sample-087":{"wordcount":8},"sample-088":{"wordcount":4},"sample-089":{"wordcount":3},"sample-090":{"wordcount":3},"sample-091":{"wordcount":6},"sample-092":{"wordcount":3},"sample-093":{"wordcount":4},"sample-094":{"wordcount":6},"sample-095":{"wordcount":10},"sample-096":{"wordcount":6},"sample-097":{"wordcount":1},"sample-098":{"wordcount":6},"sample-099":{"wordcount":8},"sample-100":{"wordcount":1}}},"collection":{"check-a":{"collection-1":{}},"check-b":{"collection-1":{},"collection-2":{},"collection-3":{}},"check-c":{"collection-1":{},"collection-2":{},"collection-3":{}},"check-d":{"collection-1":{},"collection-2":{},"collection-3":{}},"check-e":{"collection-01":{},"collection-02":{},"collection-03":{},"collection-04":{},"collection-05":{},"collection-06":{},"collection-07":{},"collection-08":{},"collection-09":{},"collection-10":{},"collection-11":{},"collection-12":{},"collection-13":{},"collection-14":{},"collection-15":{},"collection-16":{}},"check-f":{"collection-01":{},"collection-02":{},"collection-03":{},"collection-04":{},"collection-05":{},"collection-06":{},"collection-07":{},"collection-08":{},"collection-09":{},"collection-10":{},"collection-11":{},"collection-12":{},"collection-13":{},"collection-14":{},"collection-15":{},"collection-16":{}},"check-g":{"collection-1":{},"collection-2":{}},"check-h":{"collection-1":{},"collection-2":{},"collection-3":{},"collection-4":{}}},"sample_collection":{"check-a":{"collection-1":["sample-1","sample-2","sample-3"]},"check-b":{"collection-1":["sample-1","sample-2","sample-3"],"collection-2":["sample-1","sample-2","sample-3"],"collection-3":["sample-4","sample-5","sample-6","sample-7"]},"check-c":{"collection-1":["sample-1","sample-2","sample-3"],"collection-2":["sample-1","sample-2","sample-3"],"collection-3":["sample-4","sample-5","sample-6","sample-7"]},"check-d":{"collection-1":["sample-1","sample-2","sample-3"],"collection-2":["sample-1","sample-2","sample-3"],"collection-3":["sample-4","sample-5","sample-6","sample-7"]},"check-e":{"collection-02":["sample-1"],"collection-03":["sample-2"],"collection-04":["sample-1","sample-2"],"collection-05":["sample-3"],"collection-06":["sample-1","sample-3"],"collection-07":["sample-2","sample-3"],"collection-08":["sample-1","sample-2","sample-3"],"collection-09":["sample-4"],"collection-10":["sample-1","sample-4"],"collection-11":["sample-2","sample-4"],"collection-12":["sample-1","sample-2","sample-4"],"collection-13":["sample-3","sample-4"],"collection-14":["sample-1","sample-3","sample-4"],"collection-15":["sample-2","sample-3","sample-4"],"collection-16":["sample-1","sample-2","sample-3","sample-4"]},"check-f":{"collection-02":["sample-1"],"collection-03":["sample-2"],"collection-04":["sample-1","sample-2"],"collection-05":["sample-3"],"collection-06":["sample-1","sample-3"],"collection-07":["sample-2","sample-3"],"collection-08":["sample-1","sample-2","sample-3"],"collection-09":["sample-4"],"collection-10":["sample-1","sample-4"],"collection-11":["sample-2","sample-4"],"collection-12":["sample-1","sample-2","sample-4"],"collection-13":["sample-3","sample-4"],"collection-14":["sample-1","sample-3","sample-4"],"collection-15":["sample-2","sample-3","sample-4"],"collection-16":["sample-1","sample-2","sample-3","sample-4"]},"check-g":{"collection-2":["sample-1"]},"check-h":{"collection-2":["sample-051","sample-052","sample-053","sample-054","sample-055","sample-056","sample-057","sample-058","sample-059","sample-060","sample-061","sample-062","sample-063","sample-064","sample-065","sample-066","sample-067","sample-068","sample-069","sample-070","sample-071","sample-072","sample-073","sample-074","sample-075","sample-076","sample-077","sample-078","sample-079","sample-080","sample-081","sample-082","sample-083","sample-084","sample-085","sample-086","sample-087","sample-088","sample-089","sample-090","sample-091","sample-092","sample-093","sample-094","sample-095","sample-096","sample-097","sample-098","sample-099","sample-100"],"collection-3":["sample-001","sample-002","sample-003","sample-004","sample-005","sample-006","sample-007","sample-008","sample-009","sample-010","sample-011","sample-012","sample-013","sample-014","sample-015","sample-016","sample-017","sample-018","sample-019","sample-020","sample-021","sample-022","sample-023","sample-024","sample-025","sample-026","sample-027","sample-028","sample-029","sample-030","sample-031","sample-032","sample-033","sample-034","sample-035","sample-036","sample-037","sample-038","sample-039","sample-040","sample-041","sample-042","sample-043","sample-044","sample-045","sample-046","sample-047","sample-048","sample-049","sample-050"],"collection-4":["sample-001","sample-002","sample-003","sample-004","sample-005","sample-006","sample-007","sample-008","sample-009","sample-010","sample-011","sample-012","sample-013","sample-014","sample-015","sample-016","sample-017","sample-018","sample-019","sample-020","sample-021","sample-022","sample-023","sample-024","sample-025","sample-026","sample-027","sample-028","sample-029","sample-030","sample-031","sample-032","sample-033","sample-034","sample-035","sample-036","sample-037","sample-038","sample-039","sample-040","sample-041","sample-042","sample-043","sample-044","sample-045","sample-046","sample-047","sample-048","sample-049","sample-050","sample-051","sample-052","sample-053","sample-054","sample-055","sample-056","sample-057","sample-058","sample-059","sample-060","sample-061","sample-062","sample-063","sample-064","sample-065","sample-066","sample-067","sample-068","sample-069","sample-070","sample-071","sample-072","sample-073","sample-074","sample-075","sample-076","sample-077","sample-078","sample-079","sample-080","sample-081","sample-082","sample-083","sample-084","sample-085","sample-086","sample-087","sample-088","sample-089","sample-090","sample-091","sample-092","sample-093","sample-094","sample-095","sample-096","sample-097","sample-098","sample-099","sample-100"]}},"token":{"check-a":{"example":{"sample-1":{"token-1":{"tokencount":1}},"sample-2":{"token-2":{"tokencount":1}},"sample-3":{"token-3":{"tokencount":1}},"sample-4":{"token-4":{"tokencount":1}},"sample-5":{"token-5":{"tokencount":1},"token-6":{"tokencount":1}},"sample-6":{"token-7":{"tokencount":1}},"sample-7":{"token-8":{"tokencount":1}}}},"check-b":{"example":{"sample-1":{"token-1":{"tokencount":2}},"sample-2":{"token-2":{"tokencount":2}},"sample-3":{"token-3":{"tokencount":2}},"sample-4":{"token-4":{"tokencount":2}},"sample-5":{"token-5":{"tokencount":2},"token-6":{"tokencount":2}},"sample-6":{"token-7":{"tokencount":2}},"sample-7":{"token-8":{"tokencount":2}}}},"check-c":{"example":{"sample-1":{"token-1":{"tokencount":1}},"sample-2":{"token-1":{"tokencount":1},"token-2":{"tokencount":1}},"sample-3":{"token-1":{"tokencount":1},"token-2":{"tokencount":1},"token-3":{"tokencount":1}},"sample-4":{"token-1":{"tokencount":1},"token-2":{"tokencount":1},"token-3":{"tokencount":1},"token-4":{"tokencount":1}},"sample-5":{"token-1":{"tokencount":1},"token-2":{"tokencount":1},"token-3":{"tokencount":1},"token-4":{"tokencount":1},"token-5":{"tokencount":1},"token-6":{"tokencount":1}},"sample-6":{"token-1":{"tokencount":1},"token-2":{"tokencount":1},"token-3":{"tokencount":1},"token-4":{"tokencount":1},"token-5":{"tokencount":1},"token-6":{"tokencount":1},"token-7":{"tokencount":1}},"sample-7":{"token-1":{"tokencount":1},"token-2":{"tokencount":1},"token-3":{"tokencount":1},"token-4":{"tokencount":1},"token-5":{"tokencount":1},"token-6":{"tokencount":1},"token-7":{"tokencount":1},"token-8":{"tokencount":1}}}},"check-d":{"example":{"sample-1":{"token-1":{"tokencount":1}},"sample-2":{"token-2":{"tokencount":1}},"sample-3":{"token-3":{"tokencount":1}},"sample-4":{"token-4":{"tokencount":1}},"sample-5":{"token-1":{"tokencount":1},"token-2":{"tokencount":1},"token-3":{"tokencount":1},"token-4":{"tokencount":1},"token-5":{"tokencount":1},"token-6":{"tokencount":1}},"sample-6":{"token-7":{"tokencount":1}},"sample-7":{"token-8":{"tokencount":1}}}},"check-e":{"example":{"sample-1":{"token-1":{"tokencount":1},"token-2":{"tokencount":1}},"sample-2":{"token-2":{"tokencount":1},"token-3":{"tokencount":1},"token-4":{"tokencount":1}},"sample-3":{"token-4":{"tokencount":1},"token-5":{"tokencount":1}}}},"check-f":{"example":{"sample-1":{"token-1":{"tokencount":1},"token-2":{"tokencount":1}},"sample-2":{"token-2":{"tokencount":7},"token-3":{"tokencount":1},"token-4":{"tokencount":1}},"sample-3":{"token-4":{"tokencount":7},"token-5":{"tokencount":1}}}},"check-g":{"example":{"sample-1":{"token-1":{"tokencount":2}}}},"check-h":{"example":{"sample-001":{"token-005":{"tokencount":2},"token-011":{"tokencount":1},"token-013":{"tokencount":5},"token-016":{"tokencount":5},"token-018":{"tokencount":5},"token-028":{"tokencount":1},"token-030":{"tokencount":7},"token-130":{"tokencount":1}},"sample-002":{"token-007":{"tokencount":2},"token-013":{"tokencount":2},"token-029":{"tokencount":5},"token-031":{"tokencount":3},"token-091":{"tokencount":1},"token-123":{"tokencount":1},"token-136":{"tokencount":1}},"sample-003":{"token-001":{"tokencount":4},"token-009":{"tokencount":4},"token-014":{"tokencount":5},"token-015":{"tokencount":8},"token-020":{"tokencount":3},"token-027":{"tokencount":2},"token-034":{"tokencount":7},"token-035":{"tokencount":5},"token-050":{"tokencount":1},"token-052":{"tokencount":1},"token-088":{"tokencount":1},"token-109":{"tokencount":1}},"sample-004":{"token-010":{"tokencount":2},"token-011":{"tokencount":6},"token-018":{"tokencount":8},"token-021":{"tokencount":1},"token-025":{"tokencount":2},"token-030":{"tokencount":8},"token-031":{"tokencount":8},"token-034":{"tokencount":4},"token-037":{"tokencount":5},"token-040":{"tokencount":3},"token-113":{"tokencount":1}},"sample-005":{"token-003":{"tokencount":2},"token-004":{"tokencount":6},"token-007":{"tokencount":7},"token-010":{"tokencount":6},"token-012":{"tokencount":1},"token-015":{"tokencount":1},"token-019":{"tokencount":8},"token-020":{"tokencount":1},"token-021":{"tokencount":1},"token-026":{"tokencount":6},"token-033":{"tokencount":6},"token-056":{"tokencount":1},"token-084":{"tokencount":1},"token-123":{"tokencount":1},"token-131":{"tokencount":1}},"sample-006":{"token-003":{"tokencount":3},"token-004":{"tokencount":1},"token-006":{"tokencount":8},"token-008":{"tokencount":8},"token-010":{"tokencount":7},"token-011":{"tokencount":1},"token-013":{"tokencount":3},"token-014":{"tokencount":3},"token-015":{"tokencount":5},"token-022":{"tokencount":4},"token-123":{"tokencount":1}},"sample-007":{"token-001":{"tokencount":8},"token-008":{"tokencount":3},"token-010":{"tokencount":4},"token-014":{"tokencount":6},"token-016":{"tokencount":1},"token-021":{"tokencount":3},"token-024":{"tokencount":3},"token-027":{"tokencount":2},"token-029":{"tokencount":6},"token-032":{"tokencount":3},"token-034":{"tokencount":8},"token-040":{"tokencount":3},"token-054":{"tokencount":1},"token-056":{"tokencount":1},"token-061":{"tokencount":1},"token-108":{"tokencount":1}},"sample-008":{"token-004":{"tokencount":5},"token-013":{"tokencount":3},"token-018":{"tokencount":1},"token-021":{"tokencount":4},"token-027":{"tokencount":6},"token-031":{"tokencount":8},"token-032":{"tokencount":7},"token-037":{"tokencount":6},"token-040":{"tokencount":4}},"sample-009":{"token-001":{"tokencount":5},"token-005":{"tokencount":8},"token-007":{"tokencount":1},"token-011":{"tokencount":2},"token-021":{"tokencount":3},"token-035":{"tokencount":7},"token-037":{"tokencount":4}},"sample-010":{"token-001":{"tokencount":3},"token-002":{"tokencount":5},"token-004":{"tokencount":4},"token-005":{"tokencount":8},"token-007":{"tokencount":1},"token-011":{"tokencount":3},"token-013":{"tokencount":6},"token-014":{"tokencount":6},"token-015":{"tokencount":8},"token-024":{"tokencount":5},"token-031":{"tokencount":1},"token-032":{"tokencount":2},"token-035":{"tokencount":3},"token-036":{"tokencount":5},"token-038":{"tokencount":3},"token-079":{"tokencount":1}},"sample-011":{"token-008":{"tokencount":4},"token-020":{"tokencount":2},"token-025":{"tokencount":8},"token-067":{"tokencount":1},"token-098":{"tokencount":1}},"sample-012":{"token-002":{"tokencount":7},"token-011":{"tokencount":6},"token-021":{"tokencount":3},"token-024":{"tokencount":4},"token-030":{"tokencount":2},"token-031":{"tokencount":7},"token-039":{"tokencount":3},"token-048":{"tokencount":1},"token-072":{"tokencount":1},"token-129":{"tokencount":1}},"sample-013":{"token-007":{"tokencount":2},"token-010":{"tokencount":4},"token-026":{"tokencount":6},"token-027":{"tokencount":1},"token-033":{"tokencount":1},"token-039":{"tokencount":8},"token-049":{"tokencount":1},"token-089":{"tokencount":1},"token-126":{"tokencount":1},"token-130":{"tokencount":1}},"sample-014":{"token-001":{"tokencount":1},"token-008":{"tokencount":4},"token-024":{"tokencount":2},"token-040":{"tokencount":2}},"sample-015":{"token-003":{"tokencount":2},"token-016":{"tokencount":5},"token-017":{"tokencount":4},"token-019":{"tokencount":2},"token-022":{"tokencount":1},"token-038":{"tokencount":6},"token-040":{"tokencount":4},"token-048":{"tokencount":1},"token-099":{"tokencount":1}},"sample-016":{"token-001":{"tokencount":3},"token-004":{"tokencount":1},"token-010":{"tokencount":2},"token-012":{"tokencount":2},"token-013":{"tokencount":7},"token-021":{"tokencount":6},"token-024":{"tokencount":7},"token-030":{"tokencount":1},"token-033":{"tokencount":8}},"sample-017":{"token-002":{"tokencount":3},"token-004":{"tokencount":2},"token-005":{"tokencount":4},"token-009":{"tokencount":7},"token-016":{"tokencount":2},"token-018":{"tokencount":3},"token-021":{"tokencount":3},"token-025":{"tokencount":3},"token-029":{"tokencount":3},"token-030":{"tokencount":3},"token-032":{"tokencount":7},"token-038":{"tokencount":1},"token-057":{"tokencount":1},"token-086":{"tokencount":1},"token-100":{"tokencount":1}},"sample-018":{"token-007":{"tokencount":7},"token-012":{"tokencount":3},"token-019":{"tokencount":7},"token-029":{"tokencount":7},"token-037":{"tokencount":4}},"sample-019":{"token-004":{"tokencount":5},"token-005":{"tokencount":1},"token-006":{"tokencount":3},"token-008":{"tokencount":3},"token-009":{"tokencount":6},"token-013":{"tokencount":8},"token-014":{"tokencount":8},"token-015":{"tokencount":2},"token-023":{"tokencount":4},"token-034":{"tokencount":8},"token-035":{"tokencount":6}},"sample-020":{"token-001":{"tokencount":6},"token-004":{"tokencount":6},"token-015":{"tokencount":5},"token-018":{"tokencount":5},"token-020":{"tokencount":2},"token-025":{"tokencount":2},"token-027":{"tokencount":7},"token-031":{"tokencount":8},"token-034":{"tokencount":5},"token-036":{"tokencount":6}},"sample-021":{"token-008":{"tokencount":4},"token-011":{"tokencount":7},"token-015":{"tokencount":7},"token-019":{"tokencount":8},"token-022":{"tokencount":8},"token-025":{"tokencount":1},"token-031":{"tokencount":8},"token-039":{"tokencount":5},"token-040":{"tokencount":5},"token-060":{"tokencount":1},"token-076":{"tokencount":1},"token-115":{"tokencount":1}},"sample-022":{"token-001":{"tokencount":7},"token-005":{"tokencount":4},"token-009":{"tokencount":1},"token-029":{"tokencount":5},"token-037":{"tokencount":6},"token-039":{"tokencount":3}},"sample-023":{"token-002":{"tokencount":3},"token-004":{"tokencount":1},"token-010":{"tokencount":2},"token-012":{"tokencount":1},"token-014":{"tokencount":5},"token-024":{"tokencount":4},"token-025":{"tokencount":7},"token-028":{"tokencount":5},"token-029":{"tokencount":5},"token-069":{"tokencount":1}},"sample-024":{"token-016":{"tokencount":1},"token-019":{"tokencount":7},"token-021":{"tokencount":8},"token-027":{"tokencount":3},"token-028":{"tokencount":7},"token-029":{"tokencount":2},"token-039":{"tokencount":6}},"sample-025":{"token-001":{"tokencount":2},"token-002":{"tokencount":1},"token-003":{"tokencount":7},"token-012":{"tokencount":8},"token-016":{"tokencount":6},"token-019":{"tokencount":6},"token-020":{"tokencount":5},"token-025":{"tokencount":8},"token-029":{"tokencount":4},"token-036":{"tokencount":7},"token-041":{"tokencount":1},"token-092":{"tokencount":1},"token-113":{"tokencount":1}},"sample-026":{"token-004":{"tokencount":2},"token-014":{"tokencount":8},"token-018":{"tokencount":5},"token-023":{"tokencount":8},"token-028":{"tokencount":7},"token-038":{"tokencount":8},"token-059":{"tokencount":1}},"sample-027":{"token-004":{"tokencount":1},"token-012":{"tokencount":1},"token-014":{"tokencount":8},"token-016":{"tokencount":1},"token-023":{"tokencount":3},"token-027":{"tokencount":7},"token-036":{"tokencount":1},"token-039":{"tokencount":1}},"sample-028":{"token-011":{"tokencount":4},"token-015":{"tokencount":5},"token-018":{"tokencount":8},"token-019":{"tokencount":6},"token-030":{"tokencount":3},"token-107":{"tokencount":1}},"sample-029":{"token-001":{"tokencount":1},"token-002":{"tokencount":8},"token-003":{"tokencount":5},"token-006":{"tokencount":2},"token-015":{"tokencount":4},"token-016":{"tokencount":4},"token-019":{"tokencount":7},"token-023":{"tokencount":7},"token-039":{"tokencount":6},"token-077":{"tokencount":1}},"sample-030":{"token-008":{"tokencount":4},"token-011":{"tokencount":3},"token-012":{"tokencount":6},"token-017":{"tokencount":5},"token-019":{"tokencount":1},"token-020":{"tokencount":8},"token-031":{"tokencount":5},"token-038":{"tokencount":7},"token-080":{"tokencount":1},"token-124":{"tokencount":1}},"sample-031":{"token-001":{"tokencount":4},"token-003":{"tokencount":6},"token-010":{"tokencount":1},"token-011":{"tokencount":3},"token-019":{"tokencount":4},"token-020":{"tokencount":2},"token-022":{"tokencount":6},"token-030":{"tokencount":4},"token-036":{"tokencount":3},"token-039":{"tokencount":6},"token-055":{"tokencount":1}},"sample-032":{"token-015":{"tokencount":1},"token-020":{"tokencount":7},"token-023":{"tokencount":4},"token-028":{"tokencount":8},"token-029":{"tokencount":5},"token-037":{"tokencount":7},"token-038":{"tokencount":2},"token-076":{"tokencount":1}},"sample-033":{"token-008":{"tokencount":3},"token-009":{"tokencount":4},"token-014":{"tokencount":1},"token-015":{"tokencount":4},"token-019":{"tokencount":4},"token-025":{"tokencount":6},"token-035":{"tokencount":3}},"sample-034":{"token-001":{"tokencount":6},"token-011":{"tokencount":3},"token-012":{"tokencount":3},"token-015":{"tokencount":6},"token-016":{"tokencount":1},"token-017":{"tokencount":1},"token-019":{"tokencount":7},"token-029":{"tokencount":4},"token-030":{"tokencount":7},"token-091":{"tokencount":1},"token-102":{"tokencount":1},"token-103":{"tokencount":1},"token-105":{"tokencount":1}},"sample-035":{"token-002":{"tokencount":3},"token-007":{"tokencount":6},"token-009":{"tokencount":2},"token-013":{"tokencount":7},"token-015":{"tokencount":2},"token-027":{"tokencount":8},"token-028":{"tokencount":3},"token-036":{"tokencount":6},"token-038":{"tokencount":1},"token-110":{"tokencount":1}},"sample-036":{"token-003":{"tokencount":7},"token-015":{"tokencount":3},"token-025":{"tokencount":7},"token-037":{"tokencount":8},"token-095":{"tokencount":1},"token-132":{"tokencount":1}},"sample-037":{"token-001":{"tokencount":3},"token-011":{"tokencount":5},"token-012":{"tokencount":1},"token-016":{"tokencount":2},"token-030":{"tokencount":5},"token-031":{"tokencount":4},"token-034":{"tokencount":4},"token-040":{"tokencount":1},"token-064":{"tokencount":1},"token-069":{"tokencount":1},"token-110":{"tokencount":1}},"sample-038":{"token-003":{"tokencount":3},"token-007":{"tokencount":1},"token-011":{"tokencount":3},"token-023":{"tokencount":7},"token-025":{"tokencount":4},"token-028":{"tokencount":7},"token-031":{"tokencount":3},"token-035":{"tokencount":5},"token-036":{"tokencount":6},"token-037":{"tokencount":5},"token-060":{"tokencount":1}},"sample-039":{"token-001":{"tokencount":7},"token-004":{"tokencount":2},"token-006":{"tokencount":7},"token-007":{"tokencount":5},"token-009":{"tokencount":5},"token-010":{"tokencount":4},"token-012":{"tokencount":7},"token-019":{"tokencount":4},"token-021":{"tokencount":5},"token-022":{"tokencount":2},"token-035":{"tokencount":6},"token-036":{"tokencount":3},"token-069":{"tokencount":1}},"sample-040":{"token-003":{"tokencount":4},"token-008":{"tokencount":6},"token-012":{"tokencount":4},"token-013":{"tokencount":7},"token-016":{"tokencount":2},"token-024":{"tokencount":2},"token-028":{"tokencount":3},"token-037":{"tokencount":6}},"sample-041":{"token-008":{"tokencount":5},"token-009":{"tokencount":2},"token-010":{"tokencount":8},"token-014":{"tokencount":1},"token-026":{"tokencount":4},"token-036":{"tokencount":3},"token-055":{"tokencount":1},"token-061":{"tokencount":1},"token-120":{"tokencount":1}},"sample-042":{"token-004":{"tokencount":1},"token-007":{"tokencount":4},"token-021":{"tokencount":1},"token-028":{"tokencount":3},"token-095":{"tokencount":1},"token-127":{"tokencount":1}},"sample-043":{"token-005":{"tokencount":1},"token-007":{"tokencount":7},"token-025":{"tokencount":5},"token-029":{"tokencount":3},"token-030":{"tokencount":7},"token-031":{"tokencount":1}},"sample-044":{"token-012":{"tokencount":3},"token-022":{"tokencount":4},"token-030":{"tokencount":1},"token-035":{"tokencount":2},"token-039":{"tokencount":5},"token-040":{"tokencount":6},"token-121":{"tokencount":1}},"sample-045":{"token-004":{"tokencount":7},"token-005":{"tokencount":8},"token-006":{"tokencount":7},"token-009":{"tokencount":8},"token-034":{"tokencount":1},"token-040":{"tokencount":8},"token-049":{"tokencount":1},"token-089":{"tokencount":1}},"sample-046":{"token-001":{"tokencount":3},"token-004":{"tokencount":1},"token-005":{"tokencount":6},"token-006":{"tokencount":6},"token-014":{"tokencount":6},"token-015":{"tokencount":2},"token-020":{"tokencount":1},"token-109":{"tokencount":1},"token-131":{"tokencount":1}},"sample-047":{"token-001":{"tokencount":7},"token-008":{"tokencount":6},"token-012":{"tokencount":7},"token-018":{"tokencount":8},"token-031":{"tokencount":6},"token-038":{"tokencount":7},"token-115":{"tokencount":1}},"sample-048":{"token-005":{"tokencount":3},"token-007":{"tokencount":1},"token-008":{"tokencount":5},"token-011":{"tokencount":6},"token-013":{"tokencount":6},"token-014":{"tokencount":8},"token-017":{"tokencount":3},"token-019":{"tokencount":5},"token-026":{"tokencount":7},"token-033":{"tokencount":4}},"sample-049":{"token-001":{"tokencount":7},"token-006":{"tokencount":7},"token-016":{"tokencount":3},"token-019":{"tokencount":7},"token-024":{"tokencount":7},"token-034":{"tokencount":1},"token-036":{"tokencount":5},"token-077":{"tokencount":1},"token-104":{"tokencount":1}},"sample-050":{"token-003":{"tokencount":8},"token-009":{"tokencount":1},"token-010":{"tokencount":2},"token-013":{"tokencount":4},"token-023":{"tokencount":2},"token-025":{"tokencount":2},"token-032":{"tokencount":8},"token-035":{"tokencount":7},"token-040":{"tokencount":4},"token-088":{"tokencount":1}},"sample-051":{"token-005":{"tokencount":3},"token-007":{"tokencount":7},"token-012":{"tokencount":5},"token-013":{"tokencount":7},"token-020":{"tokencount":8},"token-031":{"tokencount":7},"token-104":{"tokencount":1}},"sample-052":{"token-008":{"tokencount":7},"token-012":{"tokencount":2},"token-022":{"tokencount":5},"token-026":{"tokencount":7},"token-028":{"tokencount":5},"token-029":{"tokencount":3},"token-033":{"tokencount":8},"token-055":{"tokencount":1},"token-101":{"tokencount":1},"token-112":{"tokencount":1},"token-137":{"tokencount":1}},"sample-053":{"token-001":{"tokencount":8},"token-002":{"tokencount":7},"token-005":{"tokencount":8},"token-012":{"tokencount":6},"token-013":{"tokencount":3},"token-019":{"tokencount":1},"token-021":{"tokencount":5},"token-022":{"tokencount":5},"token-029":{"tokencount":1},"token-039":{"tokencount":6},"token-139":{"tokencount":1}},"sample-054":{"token-008":{"tokencount":4},"token-009":{"tokencount":3},"token-010":{"tokencount":7},"token-016":{"tokencount":7},"token-021":{"tokencount":1},"token-024":{"tokencount":8},"token-025":{"tokencount":5},"token-030":{"tokencount":4},"token-037":{"tokencount":3},"token-040":{"tokencount":4},"token-080":{"tokencount":1},"token-087":{"tokencount":1}},"sample-055":{"token-013":{"tokencount":1},"token-023":{"tokencount":3},"token-033":{"tokencount":5},"token-038":{"tokencount":6},"token-120":{"tokencount":1}},"sample-056":{"token-003":{"tokencount":5},"token-006":{"tokencount":7},"token-008":{"tokencount":7},"token-025":{"tokencount":2},"token-027":{"tokencount":8},"token-028":{"tokencount":4},"token-035":{"tokencount":2},"token-039":{"tokencount":1},"token-062":{"tokencount":1},"token-065":{"tokencount":1},"token-107":{"tokencount":1}},"sample-057":{"token-001":{"tokencount":1},"token-008":{"tokencount":7},"token-010":{"tokencount":8},"token-019":{"tokencount":7},"token-102":{"tokencount":1},"token-136":{"tokencount":1}},"sample-058":{"token-018":{"tokencount":7},"token-019":{"tokencount":2},"token-021":{"tokencount":4},"token-027":{"tokencount":4},"token-032":{"tokencount":3},"token-037":{"tokencount":4},"token-040":{"tokencount":7},"token-048":{"tokencount":1}},"sample-059":{"token-006":{"tokencount":5},"token-009":{"tokencount":7},"token-016":{"tokencount":5},"token-022":{"tokencount":7},"token-026":{"tokencount":7},"token-027":{"tokencount":3},"token-028":{"tokencount":5},"token-036":{"tokencount":4},"token-040":{"tokencount":1},"token-085":{"tokencount":1},"token-088":{"tokencount":1}},"sample-060":{"token-002":{"tokencount":4},"token-005":{"tokencount":4},"token-009":{"tokencount":1},"token-018":{"tokencount":4},"token-023":{"tokencount":1},"token-029":{"tokencount":5},"token-123":{"tokencount":1}},"sample-061":{"token-001":{"tokencount":1},"token-003":{"tokencount":2},"token-012":{"tokencount":8},"token-022":{"tokencount":1},"token-024":{"tokencount":4},"token-030":{"tokencount":8},"token-032":{"tokencount":5},"token-034":{"tokencount":1},"token-038":{"tokencount":5},"token-039":{"tokencount":3}},"sample-062":{"token-006":{"tokencount":8},"token-008":{"tokencount":8},"token-009":{"tokencount":6},"token-010":{"tokencount":6},"token-012":{"tokencount":7},"token-022":{"tokencount":6},"token-026":{"tokencount":8},"token-035":{"tokencount":6},"token-039":{"tokencount":2},"token-040":{"tokencount":5}},"sample-063":{"token-009":{"tokencount":1},"token-010":{"tokencount":7},"token-013":{"tokencount":8},"token-018":{"tokencount":4},"token-026":{"tokencount":4},"token-032":{"tokencount":5},"token-035":{"tokencount":4},"token-039":{"tokencount":4},"token-044":{"tokencount":1},"token-075":{"tokencount":1},"token-085":{"tokencount":1}},"sample-064":{"token-002":{"tokencount":5},"token-005":{"tokencount":2},"token-010":{"tokencount":8},"token-033":{"tokencount":2},"token-036":{"tokencount":5},"token-091":{"tokencount":1}},"sample-065":{"token-001":{"tokencount":6},"token-002":{"tokencount":6},"token-003":{"tokencount":7},"token-005":{"tokencount":1},"token-008":{"tokencount":4},"token-011":{"tokencount":5},"token-018":{"tokencount":3},"token-023":{"tokencount":4},"token-029":{"tokencount":6},"token-031":{"tokencount":7},"token-032":{"tokencount":3},"token-035":{"tokencount":4},"token-036":{"tokencount":2},"token-038":{"tokencount":3},"token-129":{"tokencount":1}},"sample-066":{"token-001":{"tokencount":7},"token-002":{"tokencount":2},"token-005":{"tokencount":7},"token-018":{"tokencount":4},"token-022":{"tokencount":4},"token-031":{"tokencount":7},"token-032":{"tokencount":8},"token-033":{"tokencount":5}},"sample-067":{"token-002":{"tokencount":4},"token-004":{"tokencount":6},"token-005":{"tokencount":3},"token-008":{"tokencount":6},"token-010":{"tokencount":1},"token-014":{"tokencount":1},"token-019":{"tokencount":5},"token-031":{"tokencount":1},"token-033":{"tokencount":4},"token-035":{"tokencount":6},"token-087":{"tokencount":1},"token-129":{"tokencount":1}},"sample-068":{"token-005":{"tokencount":2},"token-008":{"tokencount":2},"token-012":{"tokencount":2},"token-019":{"tokencount":1},"token-023":{"tokencount":2},"token-025":{"tokencount":5},"token-033":{"tokencount":6},"token-035":{"tokencount":1},"token-039":{"tokencount":8}},"sample-069":{"token-009":{"tokencount":7},"token-017":{"tokencount":4},"token-019":{"tokencount":2},"token-021":{"tokencount":6},"token-022":{"tokencount":8},"token-027":{"tokencount":1},"token-036":{"tokencount":6},"token-138":{"tokencount":1}},"sample-070":{"token-003":{"tokencount":7},"token-004":{"tokencount":1},"token-005":{"tokencount":8},"token-006":{"tokencount":8},"token-008":{"tokencount":1},"token-018":{"tokencount":8},"token-019":{"tokencount":8},"token-021":{"tokencount":1},"token-025":{"tokencount":8},"token-030":{"tokencount":4},"token-038":{"tokencount":4},"token-063":{"tokencount":1},"token-070":{"tokencount":1}},"sample-071":{"token-002":{"tokencount":2},"token-003":{"tokencount":3},"token-004":{"tokencount":3},"token-008":{"tokencount":3},"token-010":{"tokencount":2},"token-011":{"tokencount":4},"token-013":{"tokencount":5},"token-023":{"tokencount":4},"token-025":{"tokencount":1},"token-031":{"tokencount":5},"token-039":{"tokencount":4},"token-046":{"tokencount":1}},"sample-072":{"token-004":{"tokencount":6},"token-005":{"tokencount":6},"token-017":{"tokencount":4},"token-021":{"tokencount":2},"token-027":{"tokencount":2},"token-030":{"tokencount":8},"token-031":{"tokencount":7},"token-033":{"tokencount":2},"token-034":{"tokencount":1},"token-035":{"tokencount":3},"token-038":{"tokencount":5},"token-094":{"tokencount":1},"token-117":{"tokencount":1},"token-122":{"tokencount":1}},"sample-073":{"token-016":{"tokencount":7},"token-018":{"tokencount":6},"token-020":{"tokencount":8},"token-023":{"tokencount":7},"token-024":{"tokencount":3},"token-027":{"tokencount":4},"token-035":{"tokencount":1},"token-037":{"tokencount":7},"token-039":{"tokencount":8},"token-115":{"tokencount":1}},"sample-074":{"token-003":{"tokencount":1},"token-004":{"tokencount":3},"token-011":{"tokencount":1},"token-017":{"tokencount":7},"token-018":{"tokencount":6},"token-019":{"tokencount":5},"token-021":{"tokencount":1},"token-022":{"tokencount":5},"token-025":{"tokencount":3},"token-031":{"tokencount":7},"token-034":{"tokencount":8},"token-040":{"tokencount":7}},"sample-075":{"token-003":{"tokencount":1},"token-008":{"tokencount":4},"token-017":{"tokencount":1},"token-018":{"tokencount":2},"token-020":{"tokencount":7},"token-025":{"tokencount":4},"token-027":{"tokencount":8},"token-032":{"tokencount":3},"token-051":{"tokencount":1}},"sample-076":{"token-002":{"tokencount":6},"token-004":{"tokencount":7},"token-005":{"tokencount":3},"token-006":{"tokencount":1},"token-009":{"tokencount":1},"token-010":{"tokencount":4},"token-037":{"tokencount":4}},"sample-077":{"token-002":{"tokencount":8},"token-005":{"tokencount":5},"token-011":{"tokencount":3},"token-014":{"tokencount":6},"token-015":{"tokencount":6},"token-018":{"tokencount":6},"token-020":{"tokencount":3},"token-138":{"tokencount":1}},"sample-078":{"token-006":{"tokencount":8},"token-008":{"tokencount":2},"token-015":{"tokencount":3},"token-016":{"tokencount":8},"token-018":{"tokencount":1},"token-024":{"tokencount":7},"token-025":{"tokencount":8},"token-027":{"tokencount":5},"token-035":{"tokencount":6},"token-036":{"tokencount":2}},"sample-079":{"token-004":{"tokencount":5},"token-014":{"tokencount":2},"token-017":{"tokencount":5},"token-018":{"tokencount":1},"token-022":{"tokencount":7},"token-027":{"tokencount":7},"token-030":{"tokencount":1},"token-035":{"tokencount":7},"token-039":{"tokencount":4},"token-045":{"tokencount":1},"token-068":{"tokencount":1},"token-091":{"tokencount":1}},"sample-080":{"token-001":{"tokencount":7},"token-009":{"tokencount":7},"token-015":{"tokencount":1},"token-024":{"tokencount":5},"token-035":{"tokencount":5},"token-036":{"tokencount":1}},"sample-081":{"token-004":{"tokencount":1},"token-017":{"tokencount":6},"token-020":{"tokencount":2},"token-023":{"tokencount":8},"token-032":{"tokencount":1},"token-034":{"tokencount":4},"token-037":{"tokencount":8},"token-069":{"tokencount":1},"token-125":{"tokencount":1}},"sample-082":{"token-005":{"tokencount":5},"token-015":{"tokencount":7},"token-017":{"tokencount":5},"token-019":{"tokencount":5},"token-020":{"tokencount":4},"token-022":{"tokencount":6},"token-027":{"tokencount":7},"token-029":{"tokencount":1},"token-031":{"tokencount":1},"token-034":{"tokencount":6},"token-035":{"tokencount":3},"token-039":{"tokencount":1},"token-075":{"tokencount":1},"token-125":{"tokencount":1}},"sample-083":{"token-004":{"tokencount":1},"token-011":{"tokencount":4},"token-022":{"tokencount":8},"token-028":{"tokencount":5},"token-037":{"tokencount":6},"token-040":{"tokencount":7},"token-043":{"tokencount":1},"token-046":{"tokencount":1},"token-093":{"tokencount":1},"token-106":{"tokencount":1},"token-127":{"tokencount":1}},"sample-084":{"token-002":{"tokencount":2},"token-019":{"tokencount":7},"token-027":{"tokencount":8},"token-038":{"tokencount":8},"token-040":{"tokencount":4},"token-113":{"tokencount":1},"token-137":{"tokencount":1}},"sample-085":{"token-003":{"tokencount":5},"token-011":{"tokencount":8},"token-016":{"tokencount":1},"token-026":{"tokencount":1},"token-031":{"tokencount":2},"token-032":{"tokencount":2},"token-033":{"tokencount":1},"token-061":{"tokencount":1},"token-081":{"tokencount":1},"token-102":{"tokencount":1}},"sample-086":{"token-001":{"tokencount":5},"token-002":{"tokencount":6},"token-005":{"tokencount":7},"token-008":{"tokencount":6},"token-013":{"tokencount":3},"token-016":{"tokencount":5},"token-018":{"tokencount":3},"token-023":{"tokencount":6},"token-026":{"tokencount":6},"token-028":{"tokencount":8},"token-030":{"tokencount":8},"token-034":{"tokencount":8},"token-066":{"tokencount":1},"token-081":{"tokencount":1}},"sample-087":{"token-001":{"tokencount":1},"token-005":{"tokencount":1},"token-012":{"tokencount":6},"token-027":{"tokencount":1},"token-028":{"tokencount":4},"token-029":{"tokencount":1},"token-031":{"tokencount":2},"token-033":{"tokencount":8},"token-036":{"tokencount":7},"token-039":{"tokencount":2},"token-040":{"tokencount":5},"token-054":{"tokencount":1},"token-111":{"tokencount":1},"token-116":{"tokencount":1}},"sample-088":{"token-023":{"tokencount":4},"token-037":{"tokencount":4},"token-063":{"tokencount":1},"token-108":{"tokencount":1}},"sample-089":{"token-007":{"tokencount":7},"token-008":{"tokencount":8},"token-009":{"tokencount":6},"token-010":{"tokencount":3},"token-025":{"tokencount":7},"token-028":{"tokencount":5},"token-032":{"tokencount":2},"token-036":{"tokencount":6},"token-117":{"tokencount":1}},"sample-090":{"token-001":{"tokencount":8},"token-020":{"tokencount":7},"token-026":{"tokencount":1},"token-027":{"tokencount":7},"token-028":{"tokencount":2},"token-036":{"tokencount":2},"token-039":{"tokencount":5}},"sample-091":{"token-011":{"tokencount":6},"token-013":{"tokencount":1},"token-023":{"tokencount":1},"token-026":{"tokencount":1},"token-039":{"tokencount":6},"token-040":{"tokencount":5},"token-113":{"tokencount":1},"token-127":{"tokencount":1}},"sample-092":{"token-003":{"tokencount":2},"token-010":{"tokencount":6},"token-014":{"tokencount":3},"token-015":{"tokencount":4},"token-019":{"tokencount":6},"token-029":{"tokencount":2},"token-030":{"tokencount":8},"token-062":{"tokencount":1},"token-090":{"tokencount":1}},"sample-093":{"token-003":{"tokencount":5},"token-008":{"tokencount":5},"token-014":{"tokencount":2},"token-028":{"tokencount":1},"token-030":{"tokencount":6},"token-037":{"tokencount":4},"token-042":{"tokencount":1},"token-053":{"tokencount":1},"token-101":{"tokencount":1},"token-116":{"tokencount":1}},"sample-094":{"token-001":{"tokencount":7},"token-003":{"tokencount":2},"token-011":{"tokencount":4},"token-013":{"tokencount":4},"token-026":{"tokencount":8},"token-086":{"tokencount":1},"token-129":{"tokencount":1}},"sample-095":{"token-003":{"tokencount":4},"token-030":{"tokencount":7},"token-059":{"tokencount":1},"token-070":{"tokencount":1},"token-108":{"tokencount":1}},"sample-096":{"token-004":{"tokencount":3},"token-005":{"tokencount":7},"token-010":{"tokencount":5},"token-012":{"tokencount":3},"token-017":{"tokencount":4},"token-018":{"tokencount":3},"token-019":{"tokencount":2},"token-023":{"tokencount":4},"token-028":{"tokencount":8},"token-032":{"tokencount":8},"token-035":{"tokencount":3},"token-037":{"tokencount":1},"token-038":{"tokencount":3},"token-093":{"tokencount":1}},"sample-097":{"token-001":{"tokencount":1},"token-003":{"tokencount":7},"token-016":{"tokencount":4},"token-019":{"tokencount":2},"token-031":{"tokencount":2},"token-034":{"tokencount":4},"token-035":{"tokencount":1},"token-036":{"tokencount":1},"token-093":{"tokencount":1},"token-122":{"tokencount":1},"token-130":{"tokencount":1}},"sample-098":{"token-001":{"tokencount":5},"token-002":{"tokencount":4},"token-008":{"tokencount":5},"token-010":{"tokencount":1},"token-011":{"tokencount":4},"token-013":{"tokencount":8},"token-017":{"tokencount":5},"token-018":{"tokencount":6},"token-019":{"tokencount":2},"token-020":{"tokencount":7},"token-031":{"tokencount":7},"token-037":{"tokencount":5},"token-068":{"tokencount":1},"token-135":{"tokencount":1}},"sample-099":{"token-006":{"tokencount":7},"token-022":{"tokencount":3},"token-028":{"tokencount":4},"token-029":{"tokencount":1},"token-030":{"tokencount":6},"token-031":{"tokencount":5},"token-036":{"tokencount":1}},"sample-100":{"token-013":{"tokencount":8},"token-025":{"tokencount":1},"token-031":{"tokencount":2}}}}},"tokeninfo":{},"context":{},"result_p":{"check-a":{"example":{"collection-1":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":3,"y":3},"hapax-word":{"above":9523,"below":7621,"total":10000,"x":27,"y":3},"token-word":{"above":9523,"below":7621,"total":10000,"x":27,"y":3},"type-token":{"above":10000,"below":10000,"total":10000,"x":3,"y":3},"type-word":{"above":9523,"below":7621,"total":10000,"x":27,"y":3}}}},"check-b":{"example":{"collection-1":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":6,"y":0},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":27,"y":0},"token-word":{"above":9523,"below":7621,"total":10000,"x":27,"y":6},"type-token":{"above":10000,"below":10000,"total":10000,"x":6,"y":3},"type-word":{"above":9523,"below":7621,"total":10000,"x":27,"y":3}},"collection-2":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":6,"y":0},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":27,"y":0},"token-word":{"above":9523,"below":7621,"total":10000,"x":27,"y":6},"type-token":{"above":10000,"below":10000,"total":10000,"x":6,"y":3},"type-word":{"above":9523,"below":7621,"total":10000,"x":27,"y":3}},"collection-3":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":10,"y":0},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":33,"y":0},"token-word":{"above":7796,"below":9524,"total":10000,"x":33,"y":10},"type-token":{"above":10000,"below":10000,"total":10000,"x":10,"y":5},"type-word":{"above":7796,"below":9524,"total":10000,"x":33,"y":5}}}},"check-c":{"example":{"collection-1":{"hapax-token":{"above":10000,"below":9680,"total":10000,"x":6,"y":1},"hapax-word":{"above":10000,"below":6276,"total":10000,"x":27,"y":1},"token-word":{"above":10000,"below":1822,"total":10000,"x":27,"y":6},"type-token":{"above":10000,"below":8341,"total":10000,"x":6,"y":3},"type-word":{"above":10000,"below":1258,"total":10000,"x":27,"y":3}},"collection-2":{"hapax-token":{"above":10000,"below":9680,"total":10000,"x":6,"y":1},"hapax-word":{"above":10000,"below":6276,"total":10000,"x":27,"y":1},"token-word":{"above":10000,"below":1822,"total":10000,"x":27,"y":6},"type-token":{"above":10000,"below":8341,"total":10000,"x":6,"y":3},"type-word":{"above":10000,"below":1258,"total":10000,"x":27,"y":3}},"collection-3":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":25,"y":1},"hapax-word":{"above":10000,"below":7150,"total":10000,"x":33,"y":1},"token-word":{"above":1233,"below":10000,"total":10000,"x":33,"y":25},"type-token":{"above":10000,"below":10000,"total":10000,"x":25,"y":8},"type-word":{"above":6869,"below":10000,"total":10000,"x":33,"y":8}}}},"check-d":{"example":{"collection-1":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":3,"y":3},"hapax-word":{"above":9523,"below":6539,"total":10000,"x":27,"y":3},"token-word":{"above":9523,"below":5902,"total":10000,"x":27,"y":3},"type-token":{"above":10000,"below":10000,"total":10000,"x":3,"y":3},"type-word":{"above":9523,"below":5902,"total":10000,"x":27,"y":3}},"collection-2":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":3,"y":3},"hapax-word":{"above":9523,"below":6539,"total":10000,"x":27,"y":3},"token-word":{"above":9523,"below":5902,"total":10000,"x":27,"y":3},"type-token":{"above":10000,"below":10000,"total":10000,"x":3,"y":3},"type-word":{"above":9523,"below":5902,"total":10000,"x":27,"y":3}},"collection-3":{"hapax-token":{"above":6121,"below":10000,"total":10000,"x":9,"y":7},"hapax-word":{"above":2135,"below":10000,"total":10000,"x":33,"y":7},"token-word":{"above":6099,"below":9524,"total":10000,"x":33,"y":9},"type-token":{"above":3998,"below":10000,"total":10000,"x":9,"y":8},"type-word":{"above":1949,"below":10000,"total":10000,"x":33,"y":8}}}},"check-e":{"example":{"collection-01":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"token-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"type-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"type-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0}},"collection-02":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"hapax-word":{"above":7534,"below":9152,"total":10000,"x":15,"y":2},"token-word":{"above":7534,"below":7445,"total":10000,"x":15,"y":2},"type-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"type-word":{"above":7534,"below":7445,"total":10000,"x":15,"y":2}},"collection-03":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":3,"y":3},"hapax-word":{"above":4174,"below":10000,"total":10000,"x":10,"y":3},"token-word":{"above":4174,"below":10000,"total":10000,"x":10,"y":3},"type-token":{"above":10000,"below":10000,"total":10000,"x":3,"y":3},"type-word":{"above":4174,"below":10000,"total":10000,"x":10,"y":3}},"collection-04":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":5,"y":3},"hapax-word":{"above":5876,"below":9158,"total":10000,"x":25,"y":3},"token-word":{"above":4186,"below":10000,"total":10000,"x":25,"y":5},"type-token":{"above":10000,"below":10000,"total":10000,"x":5,"y":4},"type-word":{"above":5028,"below":10000,"total":10000,"x":25,"y":4}},"collection-05":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"hapax-word":{"above":7534,"below":10000,"total":10000,"x":5,"y":2},"token-word":{"above":7534,"below":10000,"total":10000,"x":5,"y":2},"type-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"type-word":{"above":7534,"below":10000,"total":10000,"x":5,"y":2}},"collection-06":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":4,"y":4},"hapax-word":{"above":4218,"below":10000,"total":10000,"x":20,"y":4},"token-word":{"above":5028,"below":8345,"total":10000,"x":20,"y":4},"type-token":{"above":10000,"below":10000,"total":10000,"x":4,"y":4},"type-word":{"above":5028,"below":10000,"total":10000,"x":20,"y":4}},"collection-07":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":5,"y":3},"hapax-word":{"above":4174,"below":10000,"total":10000,"x":15,"y":3},"token-word":{"above":2524,"below":10000,"total":10000,"x":15,"y":5},"type-token":{"above":10000,"below":10000,"total":10000,"x":5,"y":4},"type-word":{"above":3326,"below":10000,"total":10000,"x":15,"y":4}},"collection-08":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":7,"y":3},"hapax-word":{"above":5876,"below":9158,"total":10000,"x":30,"y":3},"token-word":{"above":2546,"below":10000,"total":10000,"x":30,"y":7},"type-token":{"above":10000,"below":10000,"total":10000,"x":7,"y":5},"type-word":{"above":2546,"below":10000,"total":10000,"x":30,"y":5}},"collection-09":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"hapax-word":{"above":10000,"below":2466,"total":10000,"x":30,"y":0},"token-word":{"above":10000,"below":2466,"total":10000,"x":30,"y":0},"type-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"type-word":{"above":10000,"below":2466,"total":10000,"x":30,"y":0}},"collection-10":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"hapax-word":{"above":10000,"below":4972,"total":10000,"x":45,"y":2},"token-word":{"above":10000,"below":3283,"total":10000,"x":45,"y":2},"type-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"type-word":{"above":10000,"below":3283,"total":10000,"x":45,"y":2}},"collection-11":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":3,"y":3},"hapax-word":{"above":8327,"below":9158,"total":10000,"x":40,"y":3},"token-word":{"above":8327,"below":4972,"total":10000,"x":40,"y":3},"type-token":{"above":10000,"below":10000,"total":10000,"x":3,"y":3},"type-word":{"above":8327,"below":4972,"total":10000,"x":40,"y":3}},"collection-12":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":5,"y":3},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":55,"y":3},"token-word":{"above":10000,"below":7454,"total":10000,"x":55,"y":5},"type-token":{"above":10000,"below":10000,"total":10000,"x":5,"y":4},"type-word":{"above":10000,"below":7454,"total":10000,"x":55,"y":4}},"collection-13":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"hapax-word":{"above":10000,"below":4124,"total":10000,"x":35,"y":2},"token-word":{"above":10000,"below":4124,"total":10000,"x":35,"y":2},"type-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"type-word":{"above":10000,"below":4124,"total":10000,"x":35,"y":2}},"collection-14":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":4,"y":4},"hapax-word":{"above":6624,"below":10000,"total":10000,"x":50,"y":4},"token-word":{"above":10000,"below":4135,"total":10000,"x":50,"y":4},"type-token":{"above":10000,"below":10000,"total":10000,"x":4,"y":4},"type-word":{"above":10000,"below":7454,"total":10000,"x":50,"y":4}},"collection-15":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":5,"y":3},"hapax-word":{"above":8327,"below":9158,"total":10000,"x":45,"y":3},"token-word":{"above":6705,"below":7454,"total":10000,"x":45,"y":5},"type-token":{"above":10000,"below":10000,"total":10000,"x":5,"y":4},"type-word":{"above":8327,"below":7454,"total":10000,"x":45,"y":4}},"collection-16":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":7,"y":3},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":60,"y":3},"token-word":{"above":10000,"below":10000,"total":10000,"x":60,"y":7},"type-token":{"above":10000,"below":10000,"total":10000,"x":7,"y":5},"type-word":{"above":10000,"below":10000,"total":10000,"x":60,"y":5}}}},"check-f":{"example":{"collection-01":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"token-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"type-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"type-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0}},"collection-02":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"hapax-word":{"above":6721,"below":10000,"total":10000,"x":15,"y":2},"token-word":{"above":7534,"below":5013,"total":10000,"x":15,"y":2},"type-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"type-word":{"above":7534,"below":7445,"total":10000,"x":15,"y":2}},"collection-03":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":9,"y":2},"hapax-word":{"above":6721,"below":10000,"total":10000,"x":10,"y":2},"token-word":{"above":4174,"below":10000,"total":10000,"x":10,"y":9},"type-token":{"above":10000,"below":10000,"total":10000,"x":9,"y":3},"type-word":{"above":4174,"below":10000,"total":10000,"x":10,"y":3}},"collection-04":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":11,"y":3},"hapax-word":{"above":4218,"below":10000,"total":10000,"x":25,"y":3},"token-word":{"above":4186,"below":8345,"total":10000,"x":25,"y":11},"type-token":{"above":10000,"below":10000,"total":10000,"x":11,"y":4},"type-word":{"above":5028,"below":10000,"total":10000,"x":25,"y":4}},"collection-05":{"hapax-token":{"above":10000,"below":8220,"total":10000,"x":8,"y":1},"hapax-word":{"above":7534,"below":10000,"total":10000,"x":5,"y":1},"token-word":{"above":4987,"below":10000,"total":10000,"x":5,"y":8},"type-token":{"above":10000,"below":10000,"total":10000,"x":8,"y":2},"type-word":{"above":7534,"below":10000,"total":10000,"x":5,"y":2}},"collection-06":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":10,"y":3},"hapax-word":{"above":4218,"below":10000,"total":10000,"x":20,"y":3},"token-word":{"above":5028,"below":8345,"total":10000,"x":20,"y":10},"type-token":{"above":10000,"below":10000,"total":10000,"x":10,"y":4},"type-word":{"above":5028,"below":10000,"total":10000,"x":20,"y":4}},"collection-07":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":17,"y":2},"hapax-word":{"above":6721,"below":10000,"total":10000,"x":15,"y":2},"token-word":{"above":1655,"below":10000,"total":10000,"x":15,"y":17},"type-token":{"above":10000,"below":10000,"total":10000,"x":17,"y":4},"type-word":{"above":3326,"below":10000,"total":10000,"x":15,"y":4}},"collection-08":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":19,"y":3},"hapax-word":{"above":4218,"below":10000,"total":10000,"x":30,"y":3},"token-word":{"above":2546,"below":10000,"total":10000,"x":30,"y":19},"type-token":{"above":10000,"below":10000,"total":10000,"x":19,"y":5},"type-word":{"above":2546,"below":10000,"total":10000,"x":30,"y":5}},"collection-09":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"hapax-word":{"above":10000,"below":2466,"total":10000,"x":30,"y":0},"token-word":{"above":10000,"below":2466,"total":10000,"x":30,"y":0},"type-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"type-word":{"above":10000,"below":2466,"total":10000,"x":30,"y":0}},"collection-10":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"hapax-word":{"above":10000,"below":5782,"total":10000,"x":45,"y":2},"token-word":{"above":10000,"below":1673,"total":10000,"x":45,"y":2},"type-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"type-word":{"above":10000,"below":3283,"total":10000,"x":45,"y":2}},"collection-11":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":9,"y":2},"hapax-word":{"above":10000,"below":5782,"total":10000,"x":40,"y":2},"token-word":{"above":8327,"below":4972,"total":10000,"x":40,"y":9},"type-token":{"above":10000,"below":10000,"total":10000,"x":9,"y":3},"type-word":{"above":8327,"below":4972,"total":10000,"x":40,"y":3}},"collection-12":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":11,"y":3},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":55,"y":3},"token-word":{"above":10000,"below":4965,"total":10000,"x":55,"y":11},"type-token":{"above":10000,"below":10000,"total":10000,"x":11,"y":4},"type-word":{"above":10000,"below":7454,"total":10000,"x":55,"y":4}},"collection-13":{"hapax-token":{"above":10000,"below":8220,"total":10000,"x":8,"y":1},"hapax-word":{"above":10000,"below":3279,"total":10000,"x":35,"y":1},"token-word":{"above":8327,"below":4124,"total":10000,"x":35,"y":8},"type-token":{"above":10000,"below":10000,"total":10000,"x":8,"y":2},"type-word":{"above":10000,"below":4124,"total":10000,"x":35,"y":2}},"collection-14":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":10,"y":3},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":50,"y":3},"token-word":{"above":10000,"below":4135,"total":10000,"x":50,"y":10},"type-token":{"above":10000,"below":10000,"total":10000,"x":10,"y":4},"type-word":{"above":10000,"below":7454,"total":10000,"x":50,"y":4}},"collection-15":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":17,"y":2},"hapax-word":{"above":10000,"below":5782,"total":10000,"x":45,"y":2},"token-word":{"above":5035,"below":7454,"total":10000,"x":45,"y":17},"type-token":{"above":10000,"below":10000,"total":10000,"x":17,"y":4},"type-word":{"above":8327,"below":7454,"total":10000,"x":45,"y":4}},"collection-16":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":19,"y":3},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":60,"y":3},"token-word":{"above":10000,"below":10000,"total":10000,"x":60,"y":19},"type-token":{"above":10000,"below":10000,"total":10000,"x":19,"y":5},"type-word":{"above":10000,"below":10000,"total":10000,"x":60,"y":5}}}},"check-g":{"example":{"collection-1":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"token-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"type-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"type-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0}},"collection-2":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":0},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":1,"y":0},"token-word":{"above":10000,"below":10000,"total":10000,"x":1,"y":2},"type-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":1},"type-word":{"above":10000,"below":10000,"total":10000,"x":1,"y":1}}}},"check-h":{"example":{"collection-1":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"token-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"type-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"type-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0}},"collection-2":{"hapax-token":{"above":9813,"below":585,"total":10000,"x":1871,"y":31},"hapax-word":{"above":9723,"below":826,"total":10000,"x":272,"y":31},"token-word":{"above":1959,"below":8841,"total":10000,"x":272,"y":1871},"type-token":{"above":7832,"below":3494,"total":10000,"x":1871,"y":94},"type-word":{"above":5770,"below":5708,"total":10000,"x":272,"y":94}},"collection-3":{"hapax-token":{"above":9785,"below":667,"total":10000,"x":1818,"y":31},"hapax-word":{"above":9851,"below":480,"total":10000,"x":300,"y":31},"token-word":{"above":8668,"below":2132,"total":10000,"x":300,"y":1818},"type-token":{"above":8843,"below":2154,"total":10000,"x":1818,"y":91},"type-word":{"above":9531,"below":1039,"total":10000,"x":300,"y":91}},"collection-4":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":3689,"y":34},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":572,"y":34},"token-word":{"above":10000,"below":10000,"total":10000,"x":572,"y":3689},"type-token":{"above":10000,"below":10000,"total":10000,"x":3689,"y":123},"type-word":{"above":10000,"below":10000,"total":10000,"x":572,"y":123}}}}},"result_q":{"1":{"collectioncode":"collection-3","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.048,"q":23.04,"side":"below","statcode":"hapax-word"},"2":{"collectioncode":"collection-2","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.0585,"q":14.040000000000001,"side":"below","statcode":"hapax-token"},"3":{"collectioncode":"collection-3","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.0667,"q":10.671999999999999,"side":"below","statcode":"hapax-token"},"4":{"collectioncode":"collection-2","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.0826,"q":9.912,"side":"below","statcode":"hapax-word"},"5":{"collectioncode":"collection-3","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.1039,"q":9.974400000000001,"side":"below","statcode":"type-word"},"6":{"collectioncode":"collection-3","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.1233,"q":9.864,"side":"above","statcode":"token-word"},"7":{"collectioncode":"collection-1","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.1258,"q":8.626285714285714,"side":"below","statcode":"type-word"},"8":{"collectioncode":"collection-2","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.1258,"q":7.548,"side":"below","statcode":"type-word"},"9":{"collectioncode":"collection-07","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.1655,"q":8.826666666666668,"side":"above","statcode":"token-word"},"10":{"collectioncode":"collection-10","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.1673,"q":8.0304,"side":"below","statcode":"token-word"},"11":{"collectioncode":"collection-1","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.1822,"q":7.9505454545454555,"side":"below","statcode":"token-word"},"12":{"collectioncode":"collection-2","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.1822,"q":7.287999999999999,"side":"below","statcode":"token-word"},"13":{"collectioncode":"collection-3","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.1949,"q":7.196307692307692,"side":"above","statcode":"type-word"},"14":{"collectioncode":"collection-2","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.1959,"q":6.716571428571428,"side":"above","statcode":"token-word"},"15":{"collectioncode":"collection-3","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.2132,"q":6.8224,"side":"below","statcode":"token-word"},"16":{"collectioncode":"collection-3","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.2135,"q":6.405,"side":"above","statcode":"hapax-word"},"17":{"collectioncode":"collection-3","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.2154,"q":6.081882352941177,"side":"below","statcode":"type-token"},"18":{"collectioncode":"collection-09","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.2466,"q":6.5760000000000005,"side":"below","statcode":"hapax-word"},"19":{"collectioncode":"collection-09","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.2466,"q":6.229894736842106,"side":"below","statcode":"token-word"},"20":{"collectioncode":"collection-09","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.2466,"q":5.918400000000001,"side":"below","statcode":"type-word"},"21":{"collectioncode":"collection-09","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.2466,"q":5.636571428571429,"side":"below","statcode":"hapax-word"},"22":{"collectioncode":"collection-09","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.2466,"q":5.380363636363637,"side":"below","statcode":"token-word"},"23":{"collectioncode":"collection-09","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.2466,"q":5.146434782608695,"side":"below","statcode":"type-word"},"24":{"collectioncode":"collection-07","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.2524,"q":5.048,"side":"above","statcode":"token-word"},"25":{"collectioncode":"collection-08","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.2546,"q":4.888319999999999,"side":"above","statcode":"token-word"},"26":{"collectioncode":"collection-08","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.2546,"q":4.700307692307692,"side":"above","statcode":"type-word"},"27":{"collectioncode":"collection-08","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.2546,"q":4.526222222222222,"side":"above","statcode":"token-word"},"28":{"collectioncode":"collection-08","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.2546,"q":4.364571428571429,"side":"above","statcode":"type-word"},"29":{"collectioncode":"collection-13","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.3279,"q":5.427310344827586,"side":"below","statcode":"hapax-word"},"30":{"collectioncode":"collection-10","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.3283,"q":5.2528,"side":"below","statcode":"token-word"},"31":{"collectioncode":"collection-10","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.3283,"q":5.083354838709677,"side":"below","statcode":"type-word"},"32":{"collectioncode":"collection-10","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.3283,"q":4.9245,"side":"below","statcode":"type-word"},"33":{"collectioncode":"collection-07","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.3326,"q":4.837818181818181,"side":"above","statcode":"type-word"},"34":{"collectioncode":"collection-07","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.3326,"q":4.695529411764706,"side":"above","statcode":"type-word"},"35":{"collectioncode":"collection-2","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.3494,"q":4.791771428571428,"side":"below","statcode":"type-token"},"36":{"collectioncode":"collection-3","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.3998,"q":5.330666666666667,"side":"above","statcode":"type-token"},"37":{"collectioncode":"collection-13","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4124,"q":5.350054054054054,"side":"below","statcode":"hapax-word"},"38":{"collectioncode":"collection-13","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4124,"q":5.209263157894737,"side":"below","statcode":"token-word"},"39":{"collectioncode":"collection-13","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4124,"q":5.075692307692307,"side":"below","statcode":"type-word"},"40":{"collectioncode":"collection-13","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4124,"q":4.9488,"side":"below","statcode":"token-word"},"41":{"collectioncode":"collection-13","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4124,"q":4.82809756097561,"side":"below","statcode":"type-word"},"42":{"collectioncode":"collection-14","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4135,"q":4.725714285714286,"side":"below","statcode":"token-word"},"43":{"collectioncode":"collection-14","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4135,"q":4.615813953488372,"side":"below","statcode":"token-word"},"44":{"collectioncode":"collection-03","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4174,"q":4.553454545454546,"side":"above","statcode":"hapax-word"},"45":{"collectioncode":"collection-03","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4174,"q":4.452266666666667,"side":"above","statcode":"token-word"},"46":{"collectioncode":"collection-03","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4174,"q":4.355478260869565,"side":"above","statcode":"type-word"},"47":{"collectioncode":"collection-07","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4174,"q":4.262808510638298,"side":"above","statcode":"hapax-word"},"48":{"collectioncode":"collection-03","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4174,"q":4.1739999999999995,"side":"above","statcode":"token-word"},"49":{"collectioncode":"collection-03","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4174,"q":4.088816326530612,"side":"above","statcode":"type-word"},"50":{"collectioncode":"collection-04","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4186,"q":4.01856,"side":"above","statcode":"token-word"},"51":{"collectioncode":"collection-04","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4186,"q":3.9397647058823533,"side":"above","statcode":"token-word"},"52":{"collectioncode":"collection-06","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4218,"q":3.8935384615384616,"side":"above","statcode":"hapax-word"},"53":{"collectioncode":"collection-04","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4218,"q":3.8200754716981136,"side":"above","statcode":"hapax-word"},"54":{"collectioncode":"collection-06","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4218,"q":3.7493333333333334,"side":"above","statcode":"hapax-word"},"55":{"collectioncode":"collection-08","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4218,"q":3.6811636363636366,"side":"above","statcode":"hapax-word"},"56":{"collectioncode":"collection-12","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4965,"q":4.255714285714285,"side":"below","statcode":"token-word"},"57":{"collectioncode":"collection-10","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4972,"q":4.186947368421053,"side":"below","statcode":"hapax-word"},"58":{"collectioncode":"collection-11","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4972,"q":4.114758620689655,"side":"below","statcode":"token-word"},"59":{"collectioncode":"collection-11","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4972,"q":4.045016949152543,"side":"below","statcode":"type-word"},"60":{"collectioncode":"collection-11","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4972,"q":3.9776,"side":"below","statcode":"token-word"},"61":{"collectioncode":"collection-11","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4972,"q":3.912393442622951,"side":"below","statcode":"type-word"},"62":{"collectioncode":"collection-05","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4987,"q":3.860903225806451,"side":"above","statcode":"token-word"},"63":{"collectioncode":"collection-02","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.5013,"q":3.819428571428571,"side":"below","statcode":"token-word"},"64":{"collectioncode":"collection-04","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.5028,"q":3.7710000000000004,"side":"above","statcode":"type-word"},"65":{"collectioncode":"collection-06","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.5028,"q":3.7129846153846158,"side":"above","statcode":"token-word"},"66":{"collectioncode":"collection-06","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.5028,"q":3.656727272727273,"side":"above","statcode":"type-word"},"67":{"collectioncode":"collection-04","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.5028,"q":3.6021492537313433,"side":"above","statcode":"type-word"},"68":{"collectioncode":"collection-06","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.5028,"q":3.5491764705882356,"side":"above","statcode":"token-word"},"69":{"collectioncode":"collection-06","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.5028,"q":3.497739130434783,"side":"above","statcode":"type-word"},"70":{"collectioncode":"collection-15","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.5035,"q":3.452571428571428,"side":"above","statcode":"token-word"},"71":{"collectioncode":"collection-2","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.5708,"q":3.8589295774647887,"side":"below","statcode":"type-word"},"72":{"collectioncode":"collection-2","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.577,"q":3.8466666666666667,"side":"above","statcode":"type-word"},"73":{"collectioncode":"collection-10","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.5782,"q":3.8018630136986307,"side":"below","statcode":"hapax-word"},"74":{"collectioncode":"collection-11","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.5782,"q":3.7504864864864866,"side":"below","statcode":"hapax-word"},"75":{"collectioncode":"collection-15","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.5782,"q":3.70048,"side":"below","statcode":"hapax-word"},"76":{"collectioncode":"collection-04","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.5876,"q":3.7111578947368424,"side":"above","statcode":"hapax-word"},"77":{"collectioncode":"collection-08","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.5876,"q":3.6629610389610385,"side":"above","statcode":"hapax-word"},"78":{"collectioncode":"collection-1","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.5902,"q":3.6319999999999997,"side":"below","statcode":"token-word"},"79":{"collectioncode":"collection-1","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.5902,"q":3.586025316455696,"side":"below","statcode":"type-word"},"80":{"collectioncode":"collection-2","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.5902,"q":3.5412,"side":"below","statcode":"token-word"},"81":{"collectioncode":"collection-2","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.5902,"q":3.497481481481481,"side":"below","statcode":"type-word"},"82":{"collectioncode":"collection-3","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.6099,"q":3.5701463414634147,"side":"above","statcode":"token-word"},"83":{"collectioncode":"collection-3","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.6121,"q":3.539855421686747,"side":"above","statcode":"hapax-token"},"84":{"collectioncode":"collection-1","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.6276,"q":3.5862857142857147,"side":"below","statcode":"hapax-word"},"85":{"collectioncode":"collection-2","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.6276,"q":3.544094117647059,"side":"below","statcode":"hapax-word"},"86":{"collectioncode":"collection-1","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.6539,"q":3.6496744186046515,"side":"below","statcode":"hapax-word"},"87":{"collectioncode":"collection-2","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.6539,"q":3.6077241379310347,"side":"below","statcode":"hapax-word"},"88":{"collectioncode":"collection-14","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.6624,"q":3.6130909090909094,"side":"above","statcode":"hapax-word"},"89":{"collectioncode":"collection-15","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.6705,"q":3.616179775280899,"side":"above","statcode":"token-word"},"90":{"collectioncode":"collection-02","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.6721,"q":3.5845333333333333,"side":"above","statcode":"hapax-word"},"91":{"collectioncode":"collection-03","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.6721,"q":3.5451428571428574,"side":"above","statcode":"hapax-word"},"92":{"collectioncode":"collection-07","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.6721,"q":3.506608695652174,"side":"above","statcode":"hapax-word"},"93":{"collectioncode":"collection-3","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.6869,"q":3.545290322580645,"side":"above","statcode":"type-word"},"94":{"collectioncode":"collection-3","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.715,"q":3.6510638297872338,"side":"below","statcode":"hapax-word"},"95":{"collectioncode":"collection-02","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7445,"q":3.761684210526316,"side":"below","statcode":"token-word"},"96":{"collectioncode":"collection-02","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7445,"q":3.7225,"side":"below","statcode":"type-word"},"97":{"collectioncode":"collection-02","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.7445,"q":3.6841237113402063,"side":"below","statcode":"type-word"},"98":{"collectioncode":"collection-12","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7454,"q":3.650938775510204,"side":"below","statcode":"token-word"},"99":{"collectioncode":"collection-12","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7454,"q":3.614060606060606,"side":"below","statcode":"type-word"},"100":{"collectioncode":"collection-14","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7454,"q":3.5779199999999998,"side":"below","statcode":"type-word"},"101":{"collectioncode":"collection-15","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7454,"q":3.54249504950495,"side":"below","statcode":"token-word"},"102":{"collectioncode":"collection-15","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7454,"q":3.507764705882353,"side":"below","statcode":"type-word"},"103":{"collectioncode":"collection-12","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.7454,"q":3.4737087378640776,"side":"below","statcode":"type-word"},"104":{"collectioncode":"collection-14","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.7454,"q":3.440307692307692,"side":"below","statcode":"type-word"},"105":{"collectioncode":"collection-15","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.7454,"q":3.407542857142857,"side":"below","statcode":"token-word"},"106":{"collectioncode":"collection-15","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.7454,"q":3.375396226415094,"side":"below","statcode":"type-word"},"107":{"collectioncode":"collection-02","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7534,"q":3.379738317757009,"side":"above","statcode":"hapax-word"},"108":{"collectioncode":"collection-02","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7534,"q":3.348444444444444,"side":"above","statcode":"token-word"},"109":{"collectioncode":"collection-02","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7534,"q":3.3177247706422017,"side":"above","statcode":"type-word"},"110":{"collectioncode":"collection-05","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7534,"q":3.2875636363636365,"side":"above","statcode":"hapax-word"},"111":{"collectioncode":"collection-05","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7534,"q":3.2579459459459454,"side":"above","statcode":"token-word"},"112":{"collectioncode":"collection-05","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7534,"q":3.2288571428571426,"side":"above","statcode":"type-word"},"113":{"collectioncode":"collection-02","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.7534,"q":3.200283185840708,"side":"above","statcode":"token-word"},"114":{"collectioncode":"collection-02","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.7534,"q":3.1722105263157894,"side":"above","statcode":"type-word"},"115":{"collectioncode":"collection-05","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.7534,"q":3.1446260869565212,"side":"above","statcode":"hapax-word"},"116":{"collectioncode":"collection-05","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.7534,"q":3.11751724137931,"side":"above","statcode":"type-word"},"117":{"collectioncode":"collection-1","corpuscode":"check-a","datasetcode":"example","n":480,"p":0.7621,"q":3.1265641025641027,"side":"below","statcode":"hapax-word"},"118":{"collectioncode":"collection-1","corpuscode":"check-a","datasetcode":"example","n":480,"p":0.7621,"q":3.1000677966101695,"side":"below","statcode":"token-word"},"119":{"collectioncode":"collection-1","corpuscode":"check-a","datasetcode":"example","n":480,"p":0.7621,"q":3.074016806722689,"side":"below","statcode":"type-word"},"120":{"collectioncode":"collection-1","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.7621,"q":3.0484,"side":"below","statcode":"token-word"},"121":{"collectioncode":"collection-1","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.7621,"q":3.023206611570248,"side":"below","statcode":"type-word"},"122":{"collectioncode":"collection-2","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.7621,"q":2.9984262295081967,"side":"below","statcode":"token-word"},"123":{"collectioncode":"collection-2","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.7621,"q":2.9740487804878053,"side":"below","statcode":"type-word"},"124":{"collectioncode":"collection-3","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.7796,"q":3.017806451612903,"side":"above","statcode":"token-word"},"125":{"collectioncode":"collection-3","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.7796,"q":2.9936639999999994,"side":"above","statcode":"type-word"},"126":{"collectioncode":"collection-2","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.7832,"q":2.9836190476190474,"side":"above","statcode":"type-token"},"127":{"collectioncode":"collection-05","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.822,"q":3.1067716535433068,"side":"below","statcode":"hapax-token"},"128":{"collectioncode":"collection-13","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.822,"q":3.0825,"side":"below","statcode":"hapax-token"},"129":{"collectioncode":"collection-11","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.8327,"q":3.098418604651163,"side":"above","statcode":"hapax-word"},"130":{"collectioncode":"collection-11","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.8327,"q":3.0745846153846155,"side":"above","statcode":"token-word"},"131":{"collectioncode":"collection-11","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.8327,"q":3.051114503816794,"side":"above","statcode":"type-word"},"132":{"collectioncode":"collection-15","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.8327,"q":3.0279999999999996,"side":"above","statcode":"hapax-word"},"133":{"collectioncode":"collection-15","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.8327,"q":3.005233082706767,"side":"above","statcode":"type-word"},"134":{"collectioncode":"collection-11","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.8327,"q":2.9828059701492537,"side":"above","statcode":"token-word"},"135":{"collectioncode":"collection-11","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.8327,"q":2.9607111111111113,"side":"above","statcode":"type-word"},"136":{"collectioncode":"collection-13","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.8327,"q":2.938941176470588,"side":"above","statcode":"token-word"},"137":{"collectioncode":"collection-15","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.8327,"q":2.9174890510948908,"side":"above","statcode":"type-word"},"138":{"collectioncode":"collection-1","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.8341,"q":2.901217391304348,"side":"below","statcode":"type-token"},"139":{"collectioncode":"collection-2","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.8341,"q":2.8803453237410066,"side":"below","statcode":"type-token"},"140":{"collectioncode":"collection-06","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.8345,"q":2.861142857142857,"side":"below","statcode":"token-word"},"141":{"collectioncode":"collection-04","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.8345,"q":2.840851063829787,"side":"below","statcode":"token-word"},"142":{"collectioncode":"collection-06","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.8345,"q":2.820845070422535,"side":"below","statcode":"token-word"},"143":{"collectioncode":"collection-3","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.8668,"q":2.9095384615384616,"side":"above","statcode":"token-word"},"144":{"collectioncode":"collection-2","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.8841,"q":2.947,"side":"below","statcode":"token-word"},"145":{"collectioncode":"collection-3","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.8843,"q":2.927337931034483,"side":"above","statcode":"type-token"},"146":{"collectioncode":"collection-02","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.9152,"q":3.0088767123287674,"side":"below","statcode":"hapax-word"},"147":{"collectioncode":"collection-04","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.9158,"q":2.990367346938775,"side":"below","statcode":"hapax-word"},"148":{"collectioncode":"collection-08","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.9158,"q":2.9701621621621617,"side":"below","statcode":"hapax-word"},"149":{"collectioncode":"collection-11","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.9158,"q":2.9502281879194627,"side":"below","statcode":"hapax-word"},"150":{"collectioncode":"collection-15","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.9158,"q":2.93056,"side":"below","statcode":"hapax-word"},"151":{"collectioncode":"collection-1","corpuscode":"check-a","datasetcode":"example","n":480,"p":0.9523,"q":3.02717880794702,"side":"above","statcode":"hapax-word"},"152":{"collectioncode":"collection-1","corpuscode":"check-a","datasetcode":"example","n":480,"p":0.9523,"q":3.0072631578947373,"side":"above","statcode":"token-word"},"153":{"collectioncode":"collection-1","corpuscode":"check-a","datasetcode":"example","n":480,"p":0.9523,"q":2.9876078431372552,"side":"above","statcode":"type-word"},"154":{"collectioncode":"collection-1","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.9523,"q":2.9682077922077923,"side":"above","statcode":"token-word"},"155":{"collectioncode":"collection-1","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.9523,"q":2.949058064516129,"side":"above","statcode":"type-word"},"156":{"collectioncode":"collection-2","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.9523,"q":2.9301538461538463,"side":"above","statcode":"token-word"},"157":{"collectioncode":"collection-2","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.9523,"q":2.9114904458598727,"side":"above","statcode":"type-word"},"158":{"collectioncode":"collection-1","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.9523,"q":2.8930632911392404,"side":"above","statcode":"hapax-word"},"159":{"collectioncode":"collection-1","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.9523,"q":2.874867924528302,"side":"above","statcode":"token-word"},"160":{"collectioncode":"collection-1","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.9523,"q":2.8569000000000004,"side":"above","statcode":"type-word"},"161":{"collectioncode":"collection-2","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.9523,"q":2.839155279503106,"side":"above","statcode":"hapax-word"},"162":{"collectioncode":"collection-2","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.9523,"q":2.8216296296296295,"side":"above","statcode":"token-word"},"163":{"collectioncode":"collection-2","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.9523,"q":2.804319018404908,"side":"above","statcode":"type-word"},"164":{"collectioncode":"collection-3","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.9524,"q":2.787512195121951,"side":"below","statcode":"token-word"},"165":{"collectioncode":"collection-3","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.9524,"q":2.770618181818182,"side":"below","statcode":"type-word"},"166":{"collectioncode":"collection-3","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.9524,"q":2.7539277108433735,"side":"below","statcode":"token-word"},"167":{"collectioncode":"collection-3","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.9531,"q":2.7394491017964073,"side":"above","statcode":"type-word"},"168":{"collectioncode":"collection-1","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.968,"q":2.765714285714286,"side":"below","statcode":"hapax-token"},"169":{"collectioncode":"collection-2","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.968,"q":2.749349112426035,"side":"below","statcode":"hapax-token"},"170":{"collectioncode":"collection-2","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.9723,"q":2.7453176470588234,"side":"above","statcode":"hapax-word"},"171":{"collectioncode":"collection-3","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.9785,"q":2.7466666666666666,"side":"above","statcode":"hapax-token"},"172":{"collectioncode":"collection-2","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.9813,"q":2.7385116279069766,"side":"above","statcode":"hapax-token"},"173":{"collectioncode":"collection-3","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.9851,"q":2.7332254335260115,"side":"above","statcode":"hapax-word"},"174":{"collectioncode":"collection-1","corpuscode":"check-a","datasetcode":"example","n":480,"p":1.0,"q":2.7586206896551726,"side":"above","statcode":"hapax-token"},"175":{"collectioncode":"collection-1","corpuscode":"check-a","datasetcode":"example","n":480,"p":1.0,"q":2.742857142857143,"side":"below","statcode":"hapax-token"},"176":{"collectioncode":"collection-1","corpuscode":"check-a","datasetcode":"example","n":480,"p":1.0,"q":2.7272727272727275,"side":"above","statcode":"type-token"},"177":{"collectioncode":"collection-1","corpuscode":"check-a","datasetcode":"example","n":480,"p":1.0,"q":2.711864406779661,"side":"below","statcode":"type-token"},"178":{"collectioncode":"collection-1","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.696629213483146,"side":"above","statcode":"hapax-token"},"179":{"collectioncode":"collection-1","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.6815642458100557,"side":"below","statcode":"hapax-token"},"180":{"collectioncode":"collection-1","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.6666666666666665,"side":"above","statcode":"hapax-word"},"181":{"collectioncode":"collection-1","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.6519337016574585,"side":"below","statcode":"hapax-word"},"182":{"collectioncode":"collection-1","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.6373626373626373,"side":"above","statcode":"type-token"},"183":{"collectioncode":"collection-1","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.6229508196721314,"side":"below","statcode":"type-token"},"184":{"collectioncode":"collection-2","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.608695652173913,"side":"above","statcode":"hapax-token"},"185":{"collectioncode":"collection-2","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.5945945945945943,"side":"below","statcode":"hapax-token"},"186":{"collectioncode":"collection-2","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.5806451612903225,"side":"above","statcode":"hapax-word"},"187":{"collectioncode":"collection-2","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.5668449197860963,"side":"below","statcode":"hapax-word"},"188":{"collectioncode":"collection-2","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.5531914893617023,"side":"above","statcode":"type-token"},"189":{"collectioncode":"collection-2","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.5396825396825395,"side":"below","statcode":"type-token"},"190":{"collectioncode":"collection-3","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.5263157894736845,"side":"above","statcode":"hapax-token"},"191":{"collectioncode":"collection-3","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.513089005235602,"side":"below","statcode":"hapax-token"},"192":{"collectioncode":"collection-3","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.5,"side":"above","statcode":"hapax-word"},"193":{"collectioncode":"collection-3","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.4870466321243523,"side":"below","statcode":"hapax-word"},"194":{"collectioncode":"collection-3","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.4742268041237114,"side":"above","statcode":"type-token"},"195":{"collectioncode":"collection-3","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.4615384615384617,"side":"below","statcode":"type-token"},"196":{"collectioncode":"collection-1","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.4489795918367347,"side":"above","statcode":"hapax-token"},"197":{"collectioncode":"collection-1","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.436548223350254,"side":"above","statcode":"hapax-word"},"198":{"collectioncode":"collection-1","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.4242424242424243,"side":"above","statcode":"token-word"},"199":{"collectioncode":"collection-1","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.4120603015075375,"side":"above","statcode":"type-token"},"200":{"collectioncode":"collection-1","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.4,"side":"above","statcode":"type-word"},"201":{"collectioncode":"collection-2","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.388059701492537,"side":"above","statcode":"hapax-token"},"202":{"collectioncode":"collection-2","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.376237623762376,"side":"above","statcode":"hapax-word"},"203":{"collectioncode":"collection-2","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.3645320197044337,"side":"above","statcode":"token-word"},"204":{"collectioncode":"collection-2","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.3529411764705883,"side":"above","statcode":"type-token"},"205":{"collectioncode":"collection-2","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.3414634146341466,"side":"above","statcode":"type-word"},"206":{"collectioncode":"collection-3","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.330097087378641,"side":"above","statcode":"hapax-token"},"207":{"collectioncode":"collection-3","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.318840579710145,"side":"below","statcode":"hapax-token"},"208":{"collectioncode":"collection-3","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.3076923076923075,"side":"above","statcode":"hapax-word"},"209":{"collectioncode":"collection-3","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.2966507177033493,"side":"below","statcode":"token-word"},"210":{"collectioncode":"collection-3","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.2857142857142856,"side":"above","statcode":"type-token"},"211":{"collectioncode":"collection-3","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.2748815165876777,"side":"below","statcode":"type-token"},"212":{"collectioncode":"collection-3","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.2641509433962264,"side":"below","statcode":"type-word"},"213":{"collectioncode":"collection-1","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.2535211267605635,"side":"above","statcode":"hapax-token"},"214":{"collectioncode":"collection-1","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.2429906542056073,"side":"below","statcode":"hapax-token"},"215":{"collectioncode":"collection-1","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.2325581395348837,"side":"above","statcode":"type-token"},"216":{"collectioncode":"collection-1","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.2222222222222223,"side":"below","statcode":"type-token"},"217":{"collectioncode":"collection-2","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.2119815668202767,"side":"above","statcode":"hapax-token"},"218":{"collectioncode":"collection-2","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.2018348623853212,"side":"below","statcode":"hapax-token"},"219":{"collectioncode":"collection-2","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.191780821917808,"side":"above","statcode":"type-token"},"220":{"collectioncode":"collection-2","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.181818181818182,"side":"below","statcode":"type-token"},"221":{"collectioncode":"collection-3","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.1719457013574663,"side":"below","statcode":"hapax-token"},"222":{"collectioncode":"collection-3","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.162162162162162,"side":"below","statcode":"hapax-word"},"223":{"collectioncode":"collection-3","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.1524663677130045,"side":"below","statcode":"type-token"},"224":{"collectioncode":"collection-3","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.142857142857143,"side":"below","statcode":"type-word"},"225":{"collectioncode":"collection-01","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.1333333333333333,"side":"above","statcode":"hapax-token"},"226":{"collectioncode":"collection-01","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.1238938053097347,"side":"below","statcode":"hapax-token"},"227":{"collectioncode":"collection-01","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.1145374449339207,"side":"above","statcode":"hapax-word"},"228":{"collectioncode":"collection-01","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.1052631578947367,"side":"below","statcode":"hapax-word"},"229":{"collectioncode":"collection-01","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.096069868995633,"side":"above","statcode":"token-word"},"230":{"collectioncode":"collection-01","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.0869565217391304,"side":"below","statcode":"token-word"},"231":{"collectioncode":"collection-01","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.0779220779220777,"side":"above","statcode":"type-token"},"232":{"collectioncode":"collection-01","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.0689655172413794,"side":"below","statcode":"type-token"},"233":{"collectioncode":"collection-01","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.060085836909871,"side":"above","statcode":"type-word"},"234":{"collectioncode":"collection-01","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.0512820512820515,"side":"below","statcode":"type-word"},"235":{"collectioncode":"collection-02","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.042553191489362,"side":"above","statcode":"hapax-token"},"236":{"collectioncode":"collection-02","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.0338983050847457,"side":"below","statcode":"hapax-token"},"237":{"collectioncode":"collection-02","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.0253164556962022,"side":"above","statcode":"type-token"},"238":{"collectioncode":"collection-02","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.0168067226890756,"side":"below","statcode":"type-token"},"239":{"collectioncode":"collection-03","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.00836820083682,"side":"above","statcode":"hapax-token"},"240":{"collectioncode":"collection-03","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.0,"side":"below","statcode":"hapax-token"},"241":{"collectioncode":"collection-03","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.991701244813278,"side":"below","statcode":"hapax-word"},"242":{"collectioncode":"collection-03","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.9834710743801653,"side":"below","statcode":"token-word"},"243":{"collectioncode":"collection-03","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.9753086419753088,"side":"above","statcode":"type-token"},"244":{"collectioncode":"collection-03","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.9672131147540985,"side":"below","statcode":"type-token"},"245":{"collectioncode":"collection-03","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.959183673469388,"side":"below","statcode":"type-word"},"246":{"collectioncode":"collection-04","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.9512195121951221,"side":"above","statcode":"hapax-token"},"247":{"collectioncode":"collection-04","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.9433198380566803,"side":"below","statcode":"hapax-token"},"248":{"collectioncode":"collection-04","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.9354838709677418,"side":"below","statcode":"token-word"},"249":{"collectioncode":"collection-04","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.9277108433734937,"side":"above","statcode":"type-token"},"250":{"collectioncode":"collection-04","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.92,"side":"below","statcode":"type-token"},"251":{"collectioncode":"collection-04","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.9123505976095616,"side":"below","statcode":"type-word"},"252":{"collectioncode":"collection-05","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.9047619047619047,"side":"above","statcode":"hapax-token"},"253":{"collectioncode":"collection-05","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.8972332015810276,"side":"below","statcode":"hapax-token"},"254":{"collectioncode":"collection-05","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.889763779527559,"side":"below","statcode":"hapax-word"},"255":{"collectioncode":"collection-05","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.8823529411764706,"side":"below","statcode":"token-word"},"256":{"collectioncode":"collection-05","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.875,"side":"above","statcode":"type-token"},"257":{"collectioncode":"collection-05","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.867704280155642,"side":"below","statcode":"type-token"},"258":{"collectioncode":"collection-05","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.8604651162790697,"side":"below","statcode":"type-word"},"259":{"collectioncode":"collection-06","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.8532818532818534,"side":"above","statcode":"hapax-token"},"260":{"collectioncode":"collection-06","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.8461538461538463,"side":"below","statcode":"hapax-token"},"261":{"collectioncode":"collection-06","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.8390804597701151,"side":"below","statcode":"hapax-word"},"262":{"collectioncode":"collection-06","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.8320610687022902,"side":"above","statcode":"type-token"},"263":{"collectioncode":"collection-06","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.8250950570342204,"side":"below","statcode":"type-token"},"264":{"collectioncode":"collection-06","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.8181818181818181,"side":"below","statcode":"type-word"},"265":{"collectioncode":"collection-07","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.811320754716981,"side":"above","statcode":"hapax-token"},"266":{"collectioncode":"collection-07","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.8045112781954886,"side":"below","statcode":"hapax-token"},"267":{"collectioncode":"collection-07","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.797752808988764,"side":"below","statcode":"hapax-word"},"268":{"collectioncode":"collection-07","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.791044776119403,"side":"below","statcode":"token-word"},"269":{"collectioncode":"collection-07","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7843866171003717,"side":"above","statcode":"type-token"},"270":{"collectioncode":"collection-07","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7777777777777777,"side":"below","statcode":"type-token"},"271":{"collectioncode":"collection-07","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7712177121771218,"side":"below","statcode":"type-word"},"272":{"collectioncode":"collection-08","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7647058823529411,"side":"above","statcode":"hapax-token"},"273":{"collectioncode":"collection-08","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7582417582417582,"side":"below","statcode":"hapax-token"},"274":{"collectioncode":"collection-08","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7518248175182483,"side":"below","statcode":"token-word"},"275":{"collectioncode":"collection-08","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7454545454545456,"side":"above","statcode":"type-token"},"276":{"collectioncode":"collection-08","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7391304347826089,"side":"below","statcode":"type-token"},"277":{"collectioncode":"collection-08","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.732851985559567,"side":"below","statcode":"type-word"},"278":{"collectioncode":"collection-09","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7266187050359711,"side":"above","statcode":"hapax-token"},"279":{"collectioncode":"collection-09","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7204301075268815,"side":"below","statcode":"hapax-token"},"280":{"collectioncode":"collection-09","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7142857142857142,"side":"above","statcode":"hapax-word"},"281":{"collectioncode":"collection-09","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7081850533807827,"side":"above","statcode":"token-word"},"282":{"collectioncode":"collection-09","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.702127659574468,"side":"above","statcode":"type-token"},"283":{"collectioncode":"collection-09","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.696113074204947,"side":"below","statcode":"type-token"},"284":{"collectioncode":"collection-09","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6901408450704225,"side":"above","statcode":"type-word"},"285":{"collectioncode":"collection-10","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6842105263157894,"side":"above","statcode":"hapax-token"},"286":{"collectioncode":"collection-10","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6783216783216783,"side":"below","statcode":"hapax-token"},"287":{"collectioncode":"collection-10","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6724738675958188,"side":"above","statcode":"hapax-word"},"288":{"collectioncode":"collection-10","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6666666666666667,"side":"above","statcode":"token-word"},"289":{"collectioncode":"collection-10","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6608996539792389,"side":"above","statcode":"type-token"},"290":{"collectioncode":"collection-10","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6551724137931036,"side":"below","statcode":"type-token"},"291":{"collectioncode":"collection-10","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6494845360824744,"side":"above","statcode":"type-word"},"292":{"collectioncode":"collection-11","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6438356164383563,"side":"above","statcode":"hapax-token"},"293":{"collectioncode":"collection-11","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6382252559726962,"side":"below","statcode":"hapax-token"},"294":{"collectioncode":"collection-11","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6326530612244896,"side":"above","statcode":"type-token"},"295":{"collectioncode":"collection-11","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6271186440677965,"side":"below","statcode":"type-token"},"296":{"collectioncode":"collection-12","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6216216216216215,"side":"above","statcode":"hapax-token"},"297":{"collectioncode":"collection-12","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6161616161616161,"side":"below","statcode":"hapax-token"},"298":{"collectioncode":"collection-12","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.610738255033557,"side":"above","statcode":"hapax-word"},"299":{"collectioncode":"collection-12","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.605351170568562,"side":"below","statcode":"hapax-word"},"300":{"collectioncode":"collection-12","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6,"side":"above","statcode":"token-word"},"301":{"collectioncode":"collection-12","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5946843853820598,"side":"above","statcode":"type-token"},"302":{"collectioncode":"collection-12","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.589403973509934,"side":"below","statcode":"type-token"},"303":{"collectioncode":"collection-12","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5841584158415842,"side":"above","statcode":"type-word"},"304":{"collectioncode":"collection-13","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5789473684210527,"side":"above","statcode":"hapax-token"},"305":{"collectioncode":"collection-13","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5737704918032789,"side":"below","statcode":"hapax-token"},"306":{"collectioncode":"collection-13","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5686274509803924,"side":"above","statcode":"hapax-word"},"307":{"collectioncode":"collection-13","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5635179153094463,"side":"above","statcode":"token-word"},"308":{"collectioncode":"collection-13","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5584415584415583,"side":"above","statcode":"type-token"},"309":{"collectioncode":"collection-13","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5533980582524272,"side":"below","statcode":"type-token"},"310":{"collectioncode":"collection-13","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5483870967741935,"side":"above","statcode":"type-word"},"311":{"collectioncode":"collection-14","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5434083601286173,"side":"above","statcode":"hapax-token"},"312":{"collectioncode":"collection-14","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5384615384615383,"side":"below","statcode":"hapax-token"},"313":{"collectioncode":"collection-14","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5335463258785942,"side":"below","statcode":"hapax-word"},"314":{"collectioncode":"collection-14","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5286624203821655,"side":"above","statcode":"token-word"},"315":{"collectioncode":"collection-14","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5238095238095237,"side":"above","statcode":"type-token"},"316":{"collectioncode":"collection-14","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.518987341772152,"side":"below","statcode":"type-token"},"317":{"collectioncode":"collection-14","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5141955835962146,"side":"above","statcode":"type-word"},"318":{"collectioncode":"collection-15","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.509433962264151,"side":"above","statcode":"hapax-token"},"319":{"collectioncode":"collection-15","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5047021943573669,"side":"below","statcode":"hapax-token"},"320":{"collectioncode":"collection-15","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5,"side":"above","statcode":"type-token"},"321":{"collectioncode":"collection-15","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.4953271028037385,"side":"below","statcode":"type-token"},"322":{"collectioncode":"collection-16","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.4906832298136647,"side":"above","statcode":"hapax-token"},"323":{"collectioncode":"collection-16","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.4860681114551082,"side":"below","statcode":"hapax-token"},"324":{"collectioncode":"collection-16","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.4814814814814814,"side":"above","statcode":"hapax-word"},"325":{"collectioncode":"collection-16","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.4769230769230768,"side":"below","statcode":"hapax-word"},"326":{"collectioncode":"collection-16","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.4723926380368098,"side":"above","statcode":"token-word"},"327":{"collectioncode":"collection-16","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.4678899082568806,"side":"below","statcode":"token-word"},"328":{"collectioncode":"collection-16","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.4634146341463414,"side":"above","statcode":"type-token"},"329":{"collectioncode":"collection-16","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.458966565349544,"side":"below","statcode":"type-token"},"330":{"collectioncode":"collection-16","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.4545454545454546,"side":"above","statcode":"type-word"},"331":{"collectioncode":"collection-16","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.4501510574018126,"side":"below","statcode":"type-word"},"332":{"collectioncode":"collection-01","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.4457831325301205,"side":"above","statcode":"hapax-token"},"333":{"collectioncode":"collection-01","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.4414414414414416,"side":"below","statcode":"hapax-token"},"334":{"collectioncode":"collection-01","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.437125748502994,"side":"above","statcode":"hapax-word"},"335":{"collectioncode":"collection-01","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.4328358208955225,"side":"below","statcode":"hapax-word"},"336":{"collectioncode":"collection-01","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.4285714285714286,"side":"above","statcode":"token-word"},"337":{"collectioncode":"collection-01","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.42433234421365,"side":"below","statcode":"token-word"},"338":{"collectioncode":"collection-01","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.4201183431952662,"side":"above","statcode":"type-token"},"339":{"collectioncode":"collection-01","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.415929203539823,"side":"below","statcode":"type-token"},"340":{"collectioncode":"collection-01","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.4117647058823528,"side":"above","statcode":"type-word"},"341":{"collectioncode":"collection-01","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.407624633431085,"side":"below","statcode":"type-word"},"342":{"collectioncode":"collection-02","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.4035087719298245,"side":"above","statcode":"hapax-token"},"343":{"collectioncode":"collection-02","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3994169096209912,"side":"below","statcode":"hapax-token"},"344":{"collectioncode":"collection-02","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3953488372093024,"side":"below","statcode":"hapax-word"},"345":{"collectioncode":"collection-02","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.391304347826087,"side":"above","statcode":"type-token"},"346":{"collectioncode":"collection-02","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3872832369942196,"side":"below","statcode":"type-token"},"347":{"collectioncode":"collection-03","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.38328530259366,"side":"above","statcode":"hapax-token"},"348":{"collectioncode":"collection-03","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3793103448275863,"side":"below","statcode":"hapax-token"},"349":{"collectioncode":"collection-03","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3753581661891119,"side":"below","statcode":"hapax-word"},"350":{"collectioncode":"collection-03","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3714285714285714,"side":"below","statcode":"token-word"},"351":{"collectioncode":"collection-03","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3675213675213675,"side":"above","statcode":"type-token"},"352":{"collectioncode":"collection-03","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3636363636363638,"side":"below","statcode":"type-token"},"353":{"collectioncode":"collection-03","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3597733711048157,"side":"below","statcode":"type-word"},"354":{"collectioncode":"collection-04","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3559322033898304,"side":"above","statcode":"hapax-token"},"355":{"collectioncode":"collection-04","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.352112676056338,"side":"below","statcode":"hapax-token"},"356":{"collectioncode":"collection-04","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.348314606741573,"side":"below","statcode":"hapax-word"},"357":{"collectioncode":"collection-04","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3445378151260503,"side":"above","statcode":"type-token"},"358":{"collectioncode":"collection-04","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3407821229050279,"side":"below","statcode":"type-token"},"359":{"collectioncode":"collection-04","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3370473537604457,"side":"below","statcode":"type-word"},"360":{"collectioncode":"collection-05","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3333333333333333,"side":"above","statcode":"hapax-token"},"361":{"collectioncode":"collection-05","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3296398891966759,"side":"below","statcode":"hapax-word"},"362":{"collectioncode":"collection-05","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3259668508287292,"side":"below","statcode":"token-word"},"363":{"collectioncode":"collection-05","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.322314049586777,"side":"above","statcode":"type-token"},"364":{"collectioncode":"collection-05","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3186813186813187,"side":"below","statcode":"type-token"},"365":{"collectioncode":"collection-05","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.315068493150685,"side":"below","statcode":"type-word"},"366":{"collectioncode":"collection-06","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3114754098360657,"side":"above","statcode":"hapax-token"},"367":{"collectioncode":"collection-06","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3079019073569482,"side":"below","statcode":"hapax-token"},"368":{"collectioncode":"collection-06","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3043478260869565,"side":"below","statcode":"hapax-word"},"369":{"collectioncode":"collection-06","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3008130081300813,"side":"above","statcode":"type-token"},"370":{"collectioncode":"collection-06","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2972972972972971,"side":"below","statcode":"type-token"},"371":{"collectioncode":"collection-06","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2938005390835579,"side":"below","statcode":"type-word"},"372":{"collectioncode":"collection-07","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2903225806451613,"side":"above","statcode":"hapax-token"},"373":{"collectioncode":"collection-07","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2868632707774799,"side":"below","statcode":"hapax-token"},"374":{"collectioncode":"collection-07","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2834224598930482,"side":"below","statcode":"hapax-word"},"375":{"collectioncode":"collection-07","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.28,"side":"below","statcode":"token-word"},"376":{"collectioncode":"collection-07","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2765957446808511,"side":"above","statcode":"type-token"},"377":{"collectioncode":"collection-07","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.273209549071618,"side":"below","statcode":"type-token"},"378":{"collectioncode":"collection-07","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2698412698412698,"side":"below","statcode":"type-word"},"379":{"collectioncode":"collection-08","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.266490765171504,"side":"above","statcode":"hapax-token"},"380":{"collectioncode":"collection-08","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2631578947368423,"side":"below","statcode":"hapax-token"},"381":{"collectioncode":"collection-08","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2598425196850394,"side":"below","statcode":"hapax-word"},"382":{"collectioncode":"collection-08","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.256544502617801,"side":"below","statcode":"token-word"},"383":{"collectioncode":"collection-08","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2532637075718014,"side":"above","statcode":"type-token"},"384":{"collectioncode":"collection-08","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.25,"side":"below","statcode":"type-token"},"385":{"collectioncode":"collection-08","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2467532467532467,"side":"below","statcode":"type-word"},"386":{"collectioncode":"collection-09","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2435233160621761,"side":"above","statcode":"hapax-token"},"387":{"collectioncode":"collection-09","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2403100775193798,"side":"below","statcode":"hapax-token"},"388":{"collectioncode":"collection-09","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2371134020618557,"side":"above","statcode":"hapax-word"},"389":{"collectioncode":"collection-09","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2339331619537275,"side":"above","statcode":"token-word"},"390":{"collectioncode":"collection-09","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2307692307692308,"side":"above","statcode":"type-token"},"391":{"collectioncode":"collection-09","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.227621483375959,"side":"below","statcode":"type-token"},"392":{"collectioncode":"collection-09","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2244897959183674,"side":"above","statcode":"type-word"},"393":{"collectioncode":"collection-10","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2213740458015268,"side":"above","statcode":"hapax-token"},"394":{"collectioncode":"collection-10","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.218274111675127,"side":"below","statcode":"hapax-token"},"395":{"collectioncode":"collection-10","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2151898734177216,"side":"above","statcode":"hapax-word"},"396":{"collectioncode":"collection-10","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2121212121212122,"side":"above","statcode":"token-word"},"397":{"collectioncode":"collection-10","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2090680100755669,"side":"above","statcode":"type-token"},"398":{"collectioncode":"collection-10","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2060301507537687,"side":"below","statcode":"type-token"},"399":{"collectioncode":"collection-10","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2030075187969924,"side":"above","statcode":"type-word"},"400":{"collectioncode":"collection-11","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2,"side":"above","statcode":"hapax-token"},"401":{"collectioncode":"collection-11","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1970074812967582,"side":"below","statcode":"hapax-token"},"402":{"collectioncode":"collection-11","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1940298507462686,"side":"above","statcode":"hapax-word"},"403":{"collectioncode":"collection-11","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1910669975186103,"side":"above","statcode":"type-token"},"404":{"collectioncode":"collection-11","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.188118811881188,"side":"below","statcode":"type-token"},"405":{"collectioncode":"collection-12","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1851851851851851,"side":"above","statcode":"hapax-token"},"406":{"collectioncode":"collection-12","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1822660098522169,"side":"below","statcode":"hapax-token"},"407":{"collectioncode":"collection-12","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1793611793611793,"side":"above","statcode":"hapax-word"},"408":{"collectioncode":"collection-12","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1764705882352942,"side":"below","statcode":"hapax-word"},"409":{"collectioncode":"collection-12","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.17359413202934,"side":"above","statcode":"token-word"},"410":{"collectioncode":"collection-12","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1707317073170733,"side":"above","statcode":"type-token"},"411":{"collectioncode":"collection-12","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1678832116788322,"side":"below","statcode":"type-token"},"412":{"collectioncode":"collection-12","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1650485436893205,"side":"above","statcode":"type-word"},"413":{"collectioncode":"collection-13","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.162227602905569,"side":"above","statcode":"hapax-token"},"414":{"collectioncode":"collection-13","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1594202898550725,"side":"above","statcode":"hapax-word"},"415":{"collectioncode":"collection-13","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1566265060240963,"side":"above","statcode":"type-token"},"416":{"collectioncode":"collection-13","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1538461538461537,"side":"below","statcode":"type-token"},"417":{"collectioncode":"collection-13","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1510791366906474,"side":"above","statcode":"type-word"},"418":{"collectioncode":"collection-14","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1483253588516746,"side":"above","statcode":"hapax-token"},"419":{"collectioncode":"collection-14","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1455847255369929,"side":"below","statcode":"hapax-token"},"420":{"collectioncode":"collection-14","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1428571428571428,"side":"above","statcode":"hapax-word"},"421":{"collectioncode":"collection-14","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1401425178147269,"side":"below","statcode":"hapax-word"},"422":{"collectioncode":"collection-14","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1374407582938388,"side":"above","statcode":"token-word"},"423":{"collectioncode":"collection-14","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1347517730496455,"side":"above","statcode":"type-token"},"424":{"collectioncode":"collection-14","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1320754716981132,"side":"below","statcode":"type-token"},"425":{"collectioncode":"collection-14","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1294117647058823,"side":"above","statcode":"type-word"},"426":{"collectioncode":"collection-15","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1267605633802817,"side":"above","statcode":"hapax-token"},"427":{"collectioncode":"collection-15","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.124121779859485,"side":"below","statcode":"hapax-token"},"428":{"collectioncode":"collection-15","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1214953271028036,"side":"above","statcode":"hapax-word"},"429":{"collectioncode":"collection-15","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1188811188811187,"side":"above","statcode":"type-token"},"430":{"collectioncode":"collection-15","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1162790697674418,"side":"below","statcode":"type-token"},"431":{"collectioncode":"collection-16","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1136890951276102,"side":"above","statcode":"hapax-token"},"432":{"collectioncode":"collection-16","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1111111111111112,"side":"below","statcode":"hapax-token"},"433":{"collectioncode":"collection-16","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1085450346420322,"side":"above","statcode":"hapax-word"},"434":{"collectioncode":"collection-16","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1059907834101383,"side":"below","statcode":"hapax-word"},"435":{"collectioncode":"collection-16","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.103448275862069,"side":"above","statcode":"token-word"},"436":{"collectioncode":"collection-16","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1009174311926606,"side":"below","statcode":"token-word"},"437":{"collectioncode":"collection-16","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.0983981693363845,"side":"above","statcode":"type-token"},"438":{"collectioncode":"collection-16","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.095890410958904,"side":"below","statcode":"type-token"},"439":{"collectioncode":"collection-16","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.0933940774487472,"side":"above","statcode":"type-word"},"440":{"collectioncode":"collection-16","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.090909090909091,"side":"below","statcode":"type-word"},"441":{"collectioncode":"collection-1","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.08843537414966,"side":"above","statcode":"hapax-token"},"442":{"collectioncode":"collection-1","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0859728506787332,"side":"below","statcode":"hapax-token"},"443":{"collectioncode":"collection-1","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0835214446952595,"side":"above","statcode":"hapax-word"},"444":{"collectioncode":"collection-1","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.081081081081081,"side":"below","statcode":"hapax-word"},"445":{"collectioncode":"collection-1","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0786516853932584,"side":"above","statcode":"token-word"},"446":{"collectioncode":"collection-1","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0762331838565022,"side":"below","statcode":"token-word"},"447":{"collectioncode":"collection-1","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0738255033557047,"side":"above","statcode":"type-token"},"448":{"collectioncode":"collection-1","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0714285714285714,"side":"below","statcode":"type-token"},"449":{"collectioncode":"collection-1","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0690423162583518,"side":"above","statcode":"type-word"},"450":{"collectioncode":"collection-1","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0666666666666667,"side":"below","statcode":"type-word"},"451":{"collectioncode":"collection-2","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.06430155210643,"side":"above","statcode":"hapax-token"},"452":{"collectioncode":"collection-2","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0619469026548674,"side":"below","statcode":"hapax-token"},"453":{"collectioncode":"collection-2","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0596026490066226,"side":"above","statcode":"hapax-word"},"454":{"collectioncode":"collection-2","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0572687224669604,"side":"below","statcode":"hapax-word"},"455":{"collectioncode":"collection-2","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.054945054945055,"side":"above","statcode":"token-word"},"456":{"collectioncode":"collection-2","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0526315789473684,"side":"below","statcode":"token-word"},"457":{"collectioncode":"collection-2","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.050328227571116,"side":"above","statcode":"type-token"},"458":{"collectioncode":"collection-2","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0480349344978166,"side":"below","statcode":"type-token"},"459":{"collectioncode":"collection-2","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0457516339869282,"side":"above","statcode":"type-word"},"460":{"collectioncode":"collection-2","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0434782608695652,"side":"below","statcode":"type-word"},"461":{"collectioncode":"collection-1","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0412147505422993,"side":"above","statcode":"hapax-token"},"462":{"collectioncode":"collection-1","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0389610389610389,"side":"below","statcode":"hapax-token"},"463":{"collectioncode":"collection-1","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.036717062634989,"side":"above","statcode":"hapax-word"},"464":{"collectioncode":"collection-1","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0344827586206897,"side":"below","statcode":"hapax-word"},"465":{"collectioncode":"collection-1","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.032258064516129,"side":"above","statcode":"token-word"},"466":{"collectioncode":"collection-1","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0300429184549356,"side":"below","statcode":"token-word"},"467":{"collectioncode":"collection-1","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0278372591006424,"side":"above","statcode":"type-token"},"468":{"collectioncode":"collection-1","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0256410256410258,"side":"below","statcode":"type-token"},"469":{"collectioncode":"collection-1","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.023454157782516,"side":"above","statcode":"type-word"},"470":{"collectioncode":"collection-1","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.021276595744681,"side":"below","statcode":"type-word"},"471":{"collectioncode":"collection-4","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.019108280254777,"side":"above","statcode":"hapax-token"},"472":{"collectioncode":"collection-4","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0169491525423728,"side":"below","statcode":"hapax-token"},"473":{"collectioncode":"collection-4","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.014799154334038,"side":"above","statcode":"hapax-word"},"474":{"collectioncode":"collection-4","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0126582278481011,"side":"below","statcode":"hapax-word"},"475":{"collectioncode":"collection-4","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0105263157894737,"side":"above","statcode":"token-word"},"476":{"collectioncode":"collection-4","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0084033613445378,"side":"below","statcode":"token-word"},"477":{"collectioncode":"collection-4","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0062893081761006,"side":"above","statcode":"type-token"},"478":{"collectioncode":"collection-4","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.00418410041841,"side":"below","statcode":"type-token"},"479":{"collectioncode":"collection-4","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0020876826722338,"side":"above","statcode":"type-word"},"480":{"collectioncode":"collection-4","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0,"side":"below","statcode":"type-word"}},"result_curve":{"check-a":{"example":{"hapax-token":{"0.0001":{"lower":{"id":345,"iterations":10000,"xslots":9,"yslots":9},"upper":{"id":349,"iterations":10000,"xslots":9,"yslots":9}},"0.001":{"lower":{"id":346,"iterations":10000,"xslots":9,"yslots":9},"upper":{"id":350,"iterations":10000,"xslots":9,"yslots":9}},"0.01":{"lower":{"id":347,"iterations":10000,"xslots":9,"yslots":9},"upper":{"id":351,"iterations":10000,"xslots":9,"yslots":9}},"0.1":{"lower":{"id":348,"iterations":10000,"xslots":9,"yslots":9},"upper":{"id":352,"iterations":10000,"xslots":9,"yslots":9}}},"hapax-word":{"0.0001":{"lower":{"id":337,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":341,"iterations":10000,"xslots":61,"yslots":9}},"0.001":{"lower":{"id":338,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":342,"iterations":10000,"xslots":61,"yslots":9}},"0.01":{"lower":{"id":339,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":343,"iterations":10000,"xslots":61,"yslots":9}},"0.1":{"lower":{"id":340,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":344,"iterations":10000,"xslots":61,"yslots":9}}},"token-word":{"0.0001":{"lower":{"id":353,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":357,"iterations":10000,"xslots":61,"yslots":9}},"0.001":{"lower":{"id":354,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":358,"iterations":10000,"xslots":61,"yslots":9}},"0.01":{"lower":{"id":355,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":359,"iterations":10000,"xslots":61,"yslots":9}},"0.1":{"lower":{"id":356,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":360,"iterations":10000,"xslots":61,"yslots":9}}},"type-token":{"0.0001":{"lower":{"id":329,"iterations":10000,"xslots":9,"yslots":9},"upper":{"id":333,"iterations":10000,"xslots":9,"yslots":9}},"0.001":{"lower":{"id":330,"iterations":10000,"xslots":9,"yslots":9},"upper":{"id":334,"iterations":10000,"xslots":9,"yslots":9}},"0.01":{"lower":{"id":331,"iterations":10000,"xslots":9,"yslots":9},"upper":{"id":335,"iterations":10000,"xslots":9,"yslots":9}},"0.1":{"lower":{"id":332,"iterations":10000,"xslots":9,"yslots":9},"upper":{"id":336,"iterations":10000,"xslots":9,"yslots":9}}},"type-word":{"0.0001":{"lower":{"id":321,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":325,"iterations":10000,"xslots":61,"yslots":9}},"0.001":{"lower":{"id":322,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":326,"iterations":10000,"xslots":61,"yslots":9}},"0.01":{"lower":{"id":323,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":327,"iterations":10000,"xslots":61,"yslots":9}},"0.1":{"lower":{"id":324,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":328,"iterations":10000,"xslots":61,"yslots":9}}}}},"check-b":{"example":{"hapax-token":{"0.0001":{"lower":{"id":145,"iterations":10000,"xslots":17,"yslots":9},"upper":{"id":149,"iterations":10000,"xslots":17,"yslots":9}},"0.001":{"lower":{"id":146,"iterations":10000,"xslots":17,"yslots":9},"upper":{"id":150,"iterations":10000,"xslots":17,"yslots":9}},"0.01":{"lower":{"id":147,"iterations":10000,"xslots":17,"yslots":9},"upper":{"id":151,"iterations":10000,"xslots":17,"yslots":9}},"0.1":{"lower":{"id":148,"iterations":10000,"xslots":17,"yslots":9},"upper":{"id":152,"iterations":10000,"xslots":17,"yslots":9}}},"hapax-word":{"0.0001":{"lower":{"id":137,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":141,"iterations":10000,"xslots":61,"yslots":9}},"0.001":{"lower":{"id":138,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":142,"iterations":10000,"xslots":61,"yslots":9}},"0.01":{"lower":{"id":139,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":143,"iterations":10000,"xslots":61,"yslots":9}},"0.1":{"lower":{"id":140,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":144,"iterations":10000,"xslots":61,"yslots":9}}},"token-word":{"0.0001":{"lower":{"id":153,"iterations":10000,"xslots":61,"yslots":17},"upper":{"id":157,"iterations":10000,"xslots":61,"yslots":17}},"0.001":{"lower":{"id":154,"iterations":10000,"xslots":61,"yslots":17},"upper":{"id":158,"iterations":10000,"xslots":61,"yslots":17}},"0.01":{"lower":{"id":155,"iterations":10000,"xslots":61,"yslots":17},"upper":{"id":159,"iterations":10000,"xslots":61,"yslots":17}},"0.1":{"lower":{"id":156,"iterations":10000,"xslots":61,"yslots":17},"upper":{"id":160,"iterations":10000,"xslots":61,"yslots":17}}},"type-token":{"0.0001":{"lower":{"id":129,"iterations":10000,"xslots":17,"yslots":9},"upper":{"id":133,"iterations":10000,"xslots":17,"yslots":9}},"0.001":{"lower":{"id":130,"iterations":10000,"xslots":17,"yslots":9},"upper":{"id":134,"iterations":10000,"xslots":17,"yslots":9}},"0.01":{"lower":{"id":131,"iterations":10000,"xslots":17,"yslots":9},"upper":{"id":135,"iterations":10000,"xslots":17,"yslots":9}},"0.1":{"lower":{"id":132,"iterations":10000,"xslots":17,"yslots":9},"upper":{"id":136,"iterations":10000,"xslots":17,"yslots":9}}},"type-word":{"0.0001":{"lower":{"id":121,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":125,"iterations":10000,"xslots":61,"yslots":9}},"0.001":{"lower":{"id":122,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":126,"iterations":10000,"xslots":61,"yslots":9}},"0.01":{"lower":{"id":123,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":127,"iterations":10000,"xslots":61,"yslots":9}},"0.1":{"lower":{"id":124,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":128,"iterations":10000,"xslots":61,"yslots":9}}}}},"check-c":{"example":{"hapax-token":{"0.0001":{"lower":{"id":185,"iterations":10000,"xslots":32,"yslots":9},"upper":{"id":189,"iterations":10000,"xslots":32,"yslots":9}},"0.001":{"lower":{"id":186,"iterations":10000,"xslots":32,"yslots":9},"upper":{"id":190,"iterations":10000,"xslots":32,"yslots":9}},"0.01":{"lower":{"id":187,"iterations":10000,"xslots":32,"yslots":9},"upper":{"id":191,"iterations":10000,"xslots":32,"yslots":9}},"0.1":{"lower":{"id":188,"iterations":10000,"xslots":32,"yslots":9},"upper":{"id":192,"iterations":10000,"xslots":32,"yslots":9}}},"hapax-word":{"0.0001":{"lower":{"id":177,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":181,"iterations":10000,"xslots":61,"yslots":9}},"0.001":{"lower":{"id":178,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":182,"iterations":10000,"xslots":61,"yslots":9}},"0.01":{"lower":{"id":179,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":183,"iterations":10000,"xslots":61,"yslots":9}},"0.1":{"lower":{"id":180,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":184,"iterations":10000,"xslots":61,"yslots":9}}},"token-word":{"0.0001":{"lower":{"id":193,"iterations":10000,"xslots":61,"yslots":32},"upper":{"id":197,"iterations":10000,"xslots":61,"yslots":32}},"0.001":{"lower":{"id":194,"iterations":10000,"xslots":61,"yslots":32},"upper":{"id":198,"iterations":10000,"xslots":61,"yslots":32}},"0.01":{"lower":{"id":195,"iterations":10000,"xslots":61,"yslots":32},"upper":{"id":199,"iterations":10000,"xslots":61,"yslots":32}},"0.1":{"lower":{"id":196,"iterations":10000,"xslots":61,"yslots":32},"upper":{"id":200,"iterations":10000,"xslots":61,"yslots":32}}},"type-token":{"0.0001":{"lower":{"id":169,"iterations":10000,"xslots":32,"yslots":9},"upper":{"id":173,"iterations":10000,"xslots":32,"yslots":9}},"0.001":{"lower":{"id":170,"iterations":10000,"xslots":32,"yslots":9},"upper":{"id":174,"iterations":10000,"xslots":32,"yslots":9}},"0.01":{"lower":{"id":171,"iterations":10000,"xslots":32,"yslots":9},"upper":{"id":175,"iterations":10000,"xslots":32,"yslots":9}},"0.1":{"lower":{"id":172,"iterations":10000,"xslots":32,"yslots":9},"upper":{"id":176,"iterations":10000,"xslots":32,"yslots":9}}},"type-word":{"0.0001":{"lower":{"id":161,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":165,"iterations":10000,"xslots":61,"yslots":9}},"0.001":{"lower":{"id":162,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":166,"iterations":10000,"xslots":61,"yslots":9}},"0.01":{"lower":{"id":163,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":167,"iterations":10000,"xslots":61,"yslots":9}},"0.1":{"lower":{"id":164,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":168,"iterations":10000,"xslots":61,"yslots":9}}}}},"check-d":{"example":{"hapax-token":{"0.0001":{"lower":{"id":225,"iterations":10000,"xslots":13,"yslots":9},"upper":{"id":229,"iterations":10000,"xslots":13,"yslots":9}},"0.001":{"lower":{"id":226,"iterations":10000,"xslots":13,"yslots":9},"upper":{"id":230,"iterations":10000,"xslots":13,"yslots":9}},"0.01":{"lower":{"id":227,"iterations":10000,"xslots":13,"yslots":9},"upper":{"id":231,"iterations":10000,"xslots":13,"yslots":9}},"0.1":{"lower":{"id":228,"iterations":10000,"xslots":13,"yslots":9},"upper":{"id":232,"iterations":10000,"xslots":13,"yslots":9}}},"hapax-word":{"0.0001":{"lower":{"id":217,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":221,"iterations":10000,"xslots":61,"yslots":9}},"0.001":{"lower":{"id":218,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":222,"iterations":10000,"xslots":61,"yslots":9}},"0.01":{"lower":{"id":219,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":223,"iterations":10000,"xslots":61,"yslots":9}},"0.1":{"lower":{"id":220,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":224,"iterations":10000,"xslots":61,"yslots":9}}},"token-word":{"0.0001":{"lower":{"id":233,"iterations":10000,"xslots":61,"yslots":13},"upper":{"id":237,"iterations":10000,"xslots":61,"yslots":13}},"0.001":{"lower":{"id":234,"iterations":10000,"xslots":61,"yslots":13},"upper":{"id":238,"iterations":10000,"xslots":61,"yslots":13}},"0.01":{"lower":{"id":235,"iterations":10000,"xslots":61,"yslots":13},"upper":{"id":239,"iterations":10000,"xslots":61,"yslots":13}},"0.1":{"lower":{"id":236,"iterations":10000,"xslots":61,"yslots":13},"upper":{"id":240,"iterations":10000,"xslots":61,"yslots":13}}},"type-token":{"0.0001":{"lower":{"id":209,"iterations":10000,"xslots":13,"yslots":9},"upper":{"id":213,"iterations":10000,"xslots":13,"yslots":9}},"0.001":{"lower":{"id":210,"iterations":10000,"xslots":13,"yslots":9},"upper":{"id":214,"iterations":10000,"xslots":13,"yslots":9}},"0.01":{"lower":{"id":211,"iterations":10000,"xslots":13,"yslots":9},"upper":{"id":215,"iterations":10000,"xslots":13,"yslots":9}},"0.1":{"lower":{"id":212,"iterations":10000,"xslots":13,"yslots":9},"upper":{"id":216,"iterations":10000,"xslots":13,"yslots":9}}},"type-word":{"0.0001":{"lower":{"id":201,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":205,"iterations":10000,"xslots":61,"yslots":9}},"0.001":{"lower":{"id":202,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":206,"iterations":10000,"xslots":61,"yslots":9}},"0.01":{"lower":{"id":203,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":207,"iterations":10000,"xslots":61,"yslots":9}},"0.1":{"lower":{"id":204,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":208,"iterations":10000,"xslots":61,"yslots":9}}}}},"check-e":{"example":{"hapax-token":{"0.0001":{"lower":{"id":65,"iterations":10000,"xslots":8,"yslots":6},"upper":{"id":69,"iterations":10000,"xslots":8,"yslots":6}},"0.001":{"lower":{"id":66,"iterations":10000,"xslots":8,"yslots":6},"upper":{"id":70,"iterations":10000,"xslots":8,"yslots":6}},"0.01":{"lower":{"id":67,"iterations":10000,"xslots":8,"yslots":6},"upper":{"id":71,"iterations":10000,"xslots":8,"yslots":6}},"0.1":{"lower":{"id":68,"iterations":10000,"xslots":8,"yslots":6},"upper":{"id":72,"iterations":10000,"xslots":8,"yslots":6}}},"hapax-word":{"0.0001":{"lower":{"id":57,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":61,"iterations":10000,"xslots":61,"yslots":6}},"0.001":{"lower":{"id":58,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":62,"iterations":10000,"xslots":61,"yslots":6}},"0.01":{"lower":{"id":59,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":63,"iterations":10000,"xslots":61,"yslots":6}},"0.1":{"lower":{"id":60,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":64,"iterations":10000,"xslots":61,"yslots":6}}},"token-word":{"0.0001":{"lower":{"id":73,"iterations":10000,"xslots":61,"yslots":8},"upper":{"id":77,"iterations":10000,"xslots":61,"yslots":8}},"0.001":{"lower":{"id":74,"iterations":10000,"xslots":61,"yslots":8},"upper":{"id":78,"iterations":10000,"xslots":61,"yslots":8}},"0.01":{"lower":{"id":75,"iterations":10000,"xslots":61,"yslots":8},"upper":{"id":79,"iterations":10000,"xslots":61,"yslots":8}},"0.1":{"lower":{"id":76,"iterations":10000,"xslots":61,"yslots":8},"upper":{"id":80,"iterations":10000,"xslots":61,"yslots":8}}},"type-token":{"0.0001":{"lower":{"id":49,"iterations":10000,"xslots":8,"yslots":6},"upper":{"id":53,"iterations":10000,"xslots":8,"yslots":6}},"0.001":{"lower":{"id":50,"iterations":10000,"xslots":8,"yslots":6},"upper":{"id":54,"iterations":10000,"xslots":8,"yslots":6}},"0.01":{"lower":{"id":51,"iterations":10000,"xslots":8,"yslots":6},"upper":{"id":55,"iterations":10000,"xslots":8,"yslots":6}},"0.1":{"lower":{"id":52,"iterations":10000,"xslots":8,"yslots":6},"upper":{"id":56,"iterations":10000,"xslots":8,"yslots":6}}},"type-word":{"0.0001":{"lower":{"id":41,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":45,"iterations":10000,"xslots":61,"yslots":6}},"0.001":{"lower":{"id":42,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":46,"iterations":10000,"xslots":61,"yslots":6}},"0.01":{"lower":{"id":43,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":47,"iterations":10000,"xslots":61,"yslots":6}},"0.1":{"lower":{"id":44,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":48,"iterations":10000,"xslots":61,"yslots":6}}}}},"check-f":{"example":{"hapax-token":{"0.0001":{"lower":{"id":105,"iterations":10000,"xslots":20,"yslots":6},"upper":{"id":109,"iterations":10000,"xslots":20,"yslots":6}},"0.001":{"lower":{"id":106,"iterations":10000,"xslots":20,"yslots":6},"upper":{"id":110,"iterations":10000,"xslots":20,"yslots":6}},"0.01":{"lower":{"id":107,"iterations":10000,"xslots":20,"yslots":6},"upper":{"id":111,"iterations":10000,"xslots":20,"yslots":6}},"0.1":{"lower":{"id":108,"iterations":10000,"xslots":20,"yslots":6},"upper":{"id":112,"iterations":10000,"xslots":20,"yslots":6}}},"hapax-word":{"0.0001":{"lower":{"id":97,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":101,"iterations":10000,"xslots":61,"yslots":6}},"0.001":{"lower":{"id":98,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":102,"iterations":10000,"xslots":61,"yslots":6}},"0.01":{"lower":{"id":99,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":103,"iterations":10000,"xslots":61,"yslots":6}},"0.1":{"lower":{"id":100,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":104,"iterations":10000,"xslots":61,"yslots":6}}},"token-word":{"0.0001":{"lower":{"id":113,"iterations":10000,"xslots":61,"yslots":20},"upper":{"id":117,"iterations":10000,"xslots":61,"yslots":20}},"0.001":{"lower":{"id":114,"iterations":10000,"xslots":61,"yslots":20},"upper":{"id":118,"iterations":10000,"xslots":61,"yslots":20}},"0.01":{"lower":{"id":115,"iterations":10000,"xslots":61,"yslots":20},"upper":{"id":119,"iterations":10000,"xslots":61,"yslots":20}},"0.1":{"lower":{"id":116,"iterations":10000,"xslots":61,"yslots":20},"upper":{"id":120,"iterations":10000,"xslots":61,"yslots":20}}},"type-token":{"0.0001":{"lower":{"id":89,"iterations":10000,"xslots":20,"yslots":6},"upper":{"id":93,"iterations":10000,"xslots":20,"yslots":6}},"0.001":{"lower":{"id":90,"iterations":10000,"xslots":20,"yslots":6},"upper":{"id":94,"iterations":10000,"xslots":20,"yslots":6}},"0.01":{"lower":{"id":91,"iterations":10000,"xslots":20,"yslots":6},"upper":{"id":95,"iterations":10000,"xslots":20,"yslots":6}},"0.1":{"lower":{"id":92,"iterations":10000,"xslots":20,"yslots":6},"upper":{"id":96,"iterations":10000,"xslots":20,"yslots":6}}},"type-word":{"0.0001":{"lower":{"id":81,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":85,"iterations":10000,"xslots":61,"yslots":6}},"0.001":{"lower":{"id":82,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":86,"iterations":10000,"xslots":61,"yslots":6}},"0.01":{"lower":{"id":83,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":87,"iterations":10000,"xslots":61,"yslots":6}},"0.1":{"lower":{"id":84,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":88,"iterations":10000,"xslots":61,"yslots":6}}}}},"check-g":{"example":{"hapax-token":{"0.0001":{"lower":{"id":305,"iterations":10000,"xslots":3,"yslots":2},"upper":{"id":309,"iterations":10000,"xslots":3,"yslots":2}},"0.001":{"lower":{"id":306,"iterations":10000,"xslots":3,"yslots":2},"upper":{"id":310,"iterations":10000,"xslots":3,"yslots":2}},"0.01":{"lower":{"id":307,"iterations":10000,"xslots":3,"yslots":2},"upper":{"id":311,"iterations":10000,"xslots":3,"yslots":2}},"0.1":{"lower":{"id":308,"iterations":10000,"xslots":3,"yslots":2},"upper":{"id":312,"iterations":10000,"xslots":3,"yslots":2}}},"hapax-word":{"0.0001":{"lower":{"id":297,"iterations":10000,"xslots":2,"yslots":2},"upper":{"id":301,"iterations":10000,"xslots":2,"yslots":2}},"0.001":{"lower":{"id":298,"iterations":10000,"xslots":2,"yslots":2},"upper":{"id":302,"iterations":10000,"xslots":2,"yslots":2}},"0.01":{"lower":{"id":299,"iterations":10000,"xslots":2,"yslots":2},"upper":{"id":303,"iterations":10000,"xslots":2,"yslots":2}},"0.1":{"lower":{"id":300,"iterations":10000,"xslots":2,"yslots":2},"upper":{"id":304,"iterations":10000,"xslots":2,"yslots":2}}},"token-word":{"0.0001":{"lower":{"id":313,"iterations":10000,"xslots":2,"yslots":3},"upper":{"id":317,"iterations":10000,"xslots":2,"yslots":3}},"0.001":{"lower":{"id":314,"iterations":10000,"xslots":2,"yslots":3},"upper":{"id":318,"iterations":10000,"xslots":2,"yslots":3}},"0.01":{"lower":{"id":315,"iterations":10000,"xslots":2,"yslots":3},"upper":{"id":319,"iterations":10000,"xslots":2,"yslots":3}},"0.1":{"lower":{"id":316,"iterations":10000,"xslots":2,"yslots":3},"upper":{"id":320,"iterations":10000,"xslots":2,"yslots":3}}},"type-token":{"0.0001":{"lower":{"id":289,"iterations":10000,"xslots":3,"yslots":2},"upper":{"id":293,"iterations":10000,"xslots":3,"yslots":2}},"0.001":{"lower":{"id":290,"iterations":10000,"xslots":3,"yslots":2},"upper":{"id":294,"iterations":10000,"xslots":3,"yslots":2}},"0.01":{"lower":{"id":291,"iterations":10000,"xslots":3,"yslots":2},"upper":{"id":295,"iterations":10000,"xslots":3,"yslots":2}},"0.1":{"lower":{"id":292,"iterations":10000,"xslots":3,"yslots":2},"upper":{"id":296,"iterations":10000,"xslots":3,"yslots":2}}},"type-word":{"0.0001":{"lower":{"id":281,"iterations":10000,"xslots":2,"yslots":2},"upper":{"id":285,"iterations":10000,"xslots":2,"yslots":2}},"0.001":{"lower":{"id":282,"iterations":10000,"xslots":2,"yslots":2},"upper":{"id":286,"iterations":10000,"xslots":2,"yslots":2}},"0.01":{"lower":{"id":283,"iterations":10000,"xslots":2,"yslots":2},"upper":{"id":287,"iterations":10000,"xslots":2,"yslots":2}},"0.1":{"lower":{"id":284,"iterations":10000,"xslots":2,"yslots":2},"upper":{"id":288,"iterations":10000,"xslots":2,"yslots":2}}}}},"check-h":{"example":{"hapax-token":{"0.0001":{"lower":{"id":25,"iterations":10000,"xslots":3690,"yslots":100},"upper":{"id":29,"iterations":10000,"xslots":3690,"yslots":100}},"0.001":{"lower":{"id":26,"iterations":10000,"xslots":3690,"yslots":100},"upper":{"id":30,"iterations":10000,"xslots":3690,"yslots":100}},"0.01":{"lower":{"id":27,"iterations":10000,"xslots":3690,"yslots":100},"upper":{"id":31,"iterations":10000,"xslots":3690,"yslots":100}},"0.1":{"lower":{"id":28,"iterations":10000,"xslots":3690,"yslots":100},"upper":{"id":32,"iterations":10000,"xslots":3690,"yslots":100}}},"hapax-word":{"0.0001":{"lower":{"id":17,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":21,"iterations":10000,"xslots":573,"yslots":100}},"0.001":{"lower":{"id":18,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":22,"iterations":10000,"xslots":573,"yslots":100}},"0.01":{"lower":{"id":19,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":23,"iterations":10000,"xslots":573,"yslots":100}},"0.1":{"lower":{"id":20,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":24,"iterations":10000,"xslots":573,"yslots":100}}},"token-word":{"0.0001":{"lower":{"id":33,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":37,"iterations":10000,"xslots":573,"yslots":100}},"0.001":{"lower":{"id":34,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":38,"iterations":10000,"xslots":573,"yslots":100}},"0.01":{"lower":{"id":35,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":39,"iterations":10000,"xslots":573,"yslots":100}},"0.1":{"lower":{"id":36,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":40,"iterations":10000,"xslots":573,"yslots":100}}},"type-token":{"0.0001":{"lower":{"id":9,"iterations":10000,"xslots":3690,"yslots":100},"upper":{"id":13,"iterations":10000,"xslots":3690,"yslots":100}},"0.001":{"lower":{"id":10,"iterations":10000,"xslots":3690,"yslots":100},"upper":{"id":14,"iterations":10000,"xslots":3690,"yslots":100}},"0.01":{"lower":{"id":11,"iterations":10000,"xslots":3690,"yslots":100},"upper":{"id":15,"iterations":10000,"xslots":3690,"yslots":100}},"0.1":{"lower":{"id":12,"iterations":10000,"xslots":3690,"yslots":100},"upper":{"id":16,"iterations":10000,"xslots":3690,"yslots":100}}},"type-word":{"0.0001":{"lower":{"id":1,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":5,"iterations":10000,"xslots":573,"yslots":100}},"0.001":{"lower":{"id":2,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":6,"iterations":10000,"xslots":573,"yslots":100}},"0.01":{"lower":{"id":3,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":7,"iterations":10000,"xslots":573,"yslots":100}},"0.1":{"lower":{"id":4,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":8,"iterations":10000,"xslots":573,"yslots":100}}}}}},"result_curve_point":{"1":"AAAAAAoAAAABAAAAAQAAAAQAAAABAAAAAwAAAAEAAAADAAAAAQAAAAEAAAABAAAAAQAAAAMAAAABAAAAAQAAAAEAAAADAAAAAQAAAAIAAAABAAAAAQAAAAEAAAADAAAAAQAAAAEAAAAEAAAAAQAAAAQAAAABAAAAAQAAAAIAAAABAAAAAwAAAAEAAAAFAAAAAQAAAAEAAAACAAAAAQAAAAYAAAABAAAABQAAAAEAAAABAAAAAQAAAAEAAAABAAAADQAAAAEAAAAHAAAAAQAAAAUAAAABAAAACQAAAAEAAAAGAAAAAQAAAAUAAAABAAAACAAAAAEAAAAFAAAAAQAAAAcAAAABAAAADgAAAAEAAAAJAAAAAQAAAAUAAAABAAAAAwAAAAEAAAAJAAAAAQAAABMAAAABAAAADQAAAAEAAAAaAAAAAQAAAAcAAAABAAAACAAAAAEAAAADAAAAAQAAAAMAAAABAAAABgAAAAEAAAAFAAAAAQAAAA4AAAABAAAAAwAAAAEAAAAEAAAAAQAAAAkAAAABAAAACwAAAAEAAAAFAAAAAQAAAAYAAAABAAAAEAAAAAEAAAAKAAAAAQAAAAQAAAABAAAABAAAAAEAAAATAAAAAQAAAAkAAAABAAAAAwAAAAEAAAAHAAAAAQAAAAQAAAABAAAAFAAAAAEAAAAKAAAAAQAAAAgAAAABAAAACgAAAAEAAAAUAAAAAQAAAAUAAAABAAAAAgAAAAEAAAADAAAAAQAAAAUAAAABAAAABwAAAAEAAAAGAAAAAQAAAAUAAAABAAAAAwAAAAEAAAAAAAAAAAAAAAIAAAACAAAAAAAAAAEAAAAAAAAABAAAAAAAAAABAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAwAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAACAAAAAQAAAAAAAAACAAAAAAAAAAIAAAABAAAAAAAAAAIAAAAAAAAAAwAAAAAAAAABAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAADAAAAAAAAAAQAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAADAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAA==","2":"AAAAAAoAAAABAAAAAQAAAAQAAAABAAAAAgAAAAEAAAABAAAAAwAAAAEAAAABAAAAAwAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAMAAAABAAAAAQAAAAEAAAABAAAAAQAAAAMAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAADAAAAAQAAAAUAAAABAAAAAQAAAAMAAAABAAAAAgAAAAEAAAABAAAAAQAAAAUAAAABAAAAAgAAAAEAAAAEAAAAAQAAAAIAAAABAAAABQAAAAEAAAAJAAAAAQAAAAEAAAABAAAABQAAAAEAAAAHAAAAAQAAAAYAAAABAAAABQAAAAEAAAADAAAAAQAAAAgAAAABAAAABQAAAAEAAAAFAAAAAQAAAAMAAAABAAAACgAAAAEAAAAFAAAAAQAAAAcAAAABAAAAAwAAAAEAAAAIAAAAAQAAAAUAAAABAAAABAAAAAEAAAAGAAAAAQAAAAoAAAABAAAABQAAAAEAAAADAAAAAQAAAAsAAAABAAAACwAAAAEAAAADAAAAAQAAAAgAAAABAAAABAAAAAEAAAAEAAAAAQAAAAsAAAABAAAABQAAAAEAAAAJAAAAAQAAAAUAAAABAAAADAAAAAEAAAAEAAAAAQAAAAoAAAABAAAACAAAAAEAAAAPAAAAAQAAAAMAAAABAAAACQAAAAEAAAAHAAAAAQAAAAoAAAABAAAACAAAAAEAAAAJAAAAAQAAAAUAAAABAAAAEAAAAAEAAAAIAAAAAQAAAAkAAAABAAAABgAAAAEAAAAQAAAAAQAAAA0AAAABAAAABAAAAAEAAAAFAAAAAQAAAAwAAAABAAAABgAAAAEAAAAFAAAAAQAAAAUAAAABAAAACAAAAAEAAAABAAAAAAAAAAAAAAACAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAEAAAAAAAAAAEAAAABAAAAAAAAAAIAAAACAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAgAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAA","3":"AAAAAAoAAAABAAAAAQAAAAMAAAABAAAAAgAAAAEAAAABAAAAAQAAAAQAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAMAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAwAAAAEAAAABAAAAAQAAAAMAAAABAAAAAQAAAAIAAAABAAAABAAAAAEAAAADAAAAAQAAAAEAAAABAAAAAwAAAAEAAAAGAAAAAQAAAAMAAAABAAAAAgAAAAEAAAADAAAAAQAAAAkAAAABAAAABAAAAAEAAAAEAAAAAQAAAAIAAAABAAAACgAAAAEAAAAEAAAAAQAAAAQAAAABAAAABQAAAAEAAAAJAAAAAQAAAAQAAAABAAAABQAAAAEAAAAEAAAAAQAAAAoAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAACgAAAAEAAAAGAAAAAQAAAAQAAAABAAAABQAAAAEAAAAOAAAAAQAAAAUAAAABAAAABAAAAAEAAAAFAAAAAQAAAAcAAAABAAAACwAAAAEAAAAFAAAAAQAAAAYAAAABAAAABQAAAAEAAAAPAAAAAQAAAAYAAAABAAAABQAAAAEAAAAHAAAAAQAAAA8AAAABAAAABgAAAAEAAAAHAAAAAQAAAAcAAAABAAAADwAAAAEAAAAGAAAAAQAAAAcAAAABAAAABwAAAAEAAAAPAAAAAQAAAAcAAAABAAAABwAAAAEAAAAIAAAAAQAAABAAAAABAAAACQAAAAEAAAAKAAAAAQAAAAgAAAABAAAADgAAAAEAAAAIAAAAAQAAAAcAAAABAAAABgAAAAEAAAAOAAAAAQAAAAMAAAAAAAAAAAAAAAQAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAAFAAAAAAAAAAIAAAABAAAAAQAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAQAAAAEAAAAAAAAAAgAAAAEAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAA==","4":"AAAAAAoAAAABAAAAAwAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAEAAAAAQAAAAIAAAABAAAAAQAAAAEAAAACAAAAAQAAAAUAAAABAAAAAgAAAAEAAAADAAAAAQAAAAIAAAABAAAABgAAAAEAAAADAAAAAQAAAAMAAAABAAAAAwAAAAEAAAAIAAAAAQAAAAMAAAABAAAABAAAAAEAAAAEAAAAAQAAAAgAAAABAAAABAAAAAEAAAAEAAAAAQAAAAQAAAABAAAACQAAAAEAAAAFAAAAAQAAAAQAAAABAAAABQAAAAEAAAAKAAAAAQAAAAYAAAABAAAABQAAAAEAAAAFAAAAAQAAAAsAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAMAAAAAQAAAAUAAAABAAAABgAAAAEAAAAGAAAAAQAAAAwAAAABAAAABgAAAAEAAAAGAAAAAQAAAAYAAAABAAAADgAAAAEAAAAGAAAAAQAAAAcAAAABAAAABgAAAAEAAAAQAAAAAQAAAAcAAAABAAAABwAAAAEAAAAHAAAAAQAAABAAAAABAAAACAAAAAEAAAAJAAAAAQAAAAgAAAABAAAAEgAAAAEAAAAIAAAAAQAAAAkAAAABAAAACgAAAAEAAAATAAAAAQAAAAoAAAABAAAACgAAAAEAAAAJAAAAAQAAABMAAAABAAAACgAAAAEAAAACAAAAAAAAAAAAAAAHAAAAAAAAAAIAAAAAAAAAAgAAAAEAAAACAAAAAQAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAQAAAAEAAAABAAAAAAAAAAIAAAABAAAAAQAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAQAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAA","5":"AAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAgAAAAEAAAAEAAAAAQAAAAEAAAABAAAAAgAAAAEAAAACAAAAAQAAAAMAAAABAAAABgAAAAEAAAACAAAAAQAAAAMAAAABAAAAAQAAAAoAAAABAAAAAgAAAAEAAAAFAAAAAQAAAAUAAAABAAAAAQAAAAEAAAAEAAAAAQAAAAEAAAABAAAAAwAAAAEAAAAJAAAAAQAAAAYAAAABAAAABQAAAAEAAAAGAAAAAQAAAAQAAAABAAAABQAAAAEAAAADAAAAAQAAAAcAAAABAAAABQAAAAEAAAADAAAAAQAAABEAAAABAAAACAAAAAEAAAADAAAAAQAAAAYAAAABAAAADQAAAAEAAAAFAAAAAQAAAAsAAAABAAAABQAAAAEAAAADAAAAAQAAAAoAAAABAAAAAgAAAAEAAAAEAAAAAQAAACQAAAABAAAADAAAAAEAAAADAAAAAQAAAA8AAAABAAAAFAAAAAEAAAAPAAAAAQAAABYAAAABAAAABgAAAAEAAAAlAAAAAQAAACMAAAABAAAAbgAAABAAAAANAAAAAwAAAAUAAAADAAAAAgAAAAAAAAABAAAAAgAAAAIAAAAAAAAAAQAAAAAAAAADAAAAAQAAAAAAAAADAAAAAAAAAAIAAAAAAAAAAwAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAIAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAMAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAA=","6":"AAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAgAAAAEAAAABAAAABAAAAAEAAAACAAAAAQAAAAEAAAAEAAAAAQAAAAEAAAABAAAAAQAAAAQAAAABAAAABAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAAGAAAAAQAAAAMAAAABAAAAAgAAAAEAAAADAAAAAQAAAAUAAAABAAAABAAAAAEAAAADAAAAAQAAAAUAAAABAAAABAAAAAEAAAACAAAAAQAAAAMAAAABAAAAAwAAAAEAAAAGAAAAAQAAAAkAAAABAAAAAgAAAAEAAAADAAAAAQAAAAQAAAABAAAACgAAAAEAAAADAAAAAQAAAAUAAAABAAAACwAAAAEAAAAGAAAAAQAAAAsAAAABAAAABgAAAAEAAAAEAAAAAQAAABAAAAABAAAAAwAAAAEAAAAIAAAAAQAAAAYAAAABAAAADQAAAAEAAAAHAAAAAQAAAAcAAAABAAAABQAAAAEAAAASAAAAAQAAAA4AAAABAAAACwAAAAEAAAAJAAAAAQAAABoAAAABAAAABgAAAAEAAAASAAAAAQAAAA0AAAABAAAAIgAAAAEAAAAhAAAAAQAAAGQAAAAQAAAACgAAAAQAAAACAAAAAgAAAAIAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAAAAAABAAAAAQAAAAIAAAAAAAAAAQAAAAEAAAAAAAAAAQAAAAIAAAAAAAAAAgAAAAAAAAABAAAAAgAAAAAAAAABAAAAAAAAAAEAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","7":"AAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAADAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAQAAAABAAAAAgAAAAEAAAABAAAAAQAAAAIAAAABAAAABQAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAAFAAAAAQAAAAMAAAABAAAAAwAAAAEAAAACAAAAAQAAAAgAAAABAAAABAAAAAEAAAADAAAAAQAAAAMAAAABAAAABwAAAAEAAAAFAAAAAQAAAAQAAAABAAAABAAAAAEAAAAEAAAAAQAAAAkAAAABAAAABAAAAAEAAAAFAAAAAQAAAAQAAAABAAAACgAAAAEAAAAHAAAAAQAAAAQAAAABAAAABQAAAAEAAAAMAAAAAQAAAAcAAAABAAAABQAAAAEAAAAFAAAAAQAAAA8AAAABAAAABwAAAAEAAAAHAAAAAQAAAAcAAAABAAAADwAAAAEAAAAHAAAAAQAAAAYAAAABAAAACQAAAAEAAAAVAAAAAQAAAAkAAAABAAAACQAAAAEAAAAKAAAAAQAAABgAAAABAAAADAAAAAEAAAAPAAAAAQAAABAAAAABAAAAJwAAAAEAAAATAAAAAQAAAE4AAAAQAAAACAAAAAEAAAACAAAAAgAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAMAAAAAAAAAAQAAAAEAAAABAAAAAAAAAAEAAAACAAAAAAAAAAEAAAABAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","8":"AAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAwAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAMAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAABAAAAAEAAAABAAAAAQAAAAIAAAABAAAAAgAAAAEAAAAFAAAAAQAAAAEAAAABAAAAAwAAAAEAAAACAAAAAQAAAAYAAAABAAAAAgAAAAEAAAADAAAAAQAAAAMAAAABAAAABwAAAAEAAAAEAAAAAQAAAAMAAAABAAAAAwAAAAEAAAAIAAAAAQAAAAQAAAABAAAAAwAAAAEAAAAEAAAAAQAAAAkAAAABAAAABQAAAAEAAAAEAAAAAQAAAAQAAAABAAAABQAAAAEAAAAKAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAsAAAABAAAABgAAAAEAAAAFAAAAAQAAAAUAAAABAAAADQAAAAEAAAAHAAAAAQAAAAUAAAABAAAABwAAAAEAAAAOAAAAAQAAAAcAAAABAAAACAAAAAEAAAAGAAAAAQAAABEAAAABAAAACAAAAAEAAAAJAAAAAQAAAAkAAAABAAAAEwAAAAEAAAAKAAAAAQAAAAsAAAABAAAACgAAAAEAAAAZAAAAAQAAAAwAAAABAAAADQAAAAEAAAAOAAAAAQAAACMAAAABAAAAFAAAAAEAAAArAAAADgAAAAIAAAADAAAAAAAAAAIAAAABAAAAAgAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAACAAAAAAAAAAEAAAABAAAAAQAAAAIAAAAAAAAAAQAAAAEAAAABAAAAAAAAAAEAAAACAAAAAAAAAAEAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","9":"AAAAAEkAAAABAAAACgAAAAEAAAAHAAAAAQAAAAcAAAABAAAADgAAAAEAAAABAAAAAQAAAAgAAAABAAAACAAAAAEAAAAHAAAAAQAAAAgAAAABAAAABAAAAAEAAAAEAAAAAQAAABcAAAABAAAABAAAAAEAAAAGAAAAAQAAAAEAAAABAAAAFQAAAAEAAAAEAAAAAQAAABAAAAABAAAADAAAAAEAAAAOAAAAAQAAAAkAAAABAAAAFAAAAAEAAAAHAAAAAQAAABUAAAABAAAADgAAAAEAAAATAAAAAQAAABEAAAABAAAAIAAAAAEAAAAXAAAAAQAAABMAAAABAAAAFAAAAAEAAAACAAAAAQAAAFQAAAABAAAAFAAAAAEAAAAOAAAAAQAAABkAAAABAAAASgAAAAEAAAA/AAAAAQAAACkAAAABAAAAJgAAAAEAAAA+AAAAAQAAABoAAAABAAAAGAAAAAEAAAABAAAAAQAAAGgAAAABAAAAHQAAAAEAAAAVAAAAAQAAADIAAAABAAAAVwAAAAEAAAA7AAAAAQAAAAoAAAABAAAAOwAAAAEAAAA8AAAAAQAAACYAAAABAAAAPwAAAAEAAABTAAAAAQAAABwAAAABAAAALQAAAAEAAAALAAAAAQAAAHsAAAABAAAALwAAAAEAAAAwAAAAAQAAAD8AAAABAAAALAAAAAEAAAB0AAAAAQAAABMAAAABAAAAIgAAAAEAAABPAAAAAQAAADIAAAABAAAAFwAAAAEAAACWAAAAAQAAAEIAAAABAAAABAAAAAEAAAA5AAAAAQAAACIAAAABAAAAcwAAAAEAAAAXAAAAAQAAAC0AAAABAAAAOQAAAAEAAABjAAAAAQAAADIAAAABAAAARAAAAAEAAAAoAAAAAQAAAJsAAAABAAAANwAAAAEAAAA6AAAAAQAAAEgAAAABAAAAGQAAAAEAAAAnAAAAAQAAABgAAAABAAAAGgAAAAEAAAAPAAAAAAAAAAAAAAACAAAAAAAAAAMAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAA","10":"AAAAAEkAAAABAAAACgAAAAEAAAAGAAAAAQAAAA8AAAABAAAAAwAAAAEAAAAHAAAAAQAAAAQAAAABAAAACAAAAAEAAAAIAAAAAQAAAAUAAAABAAAACAAAAAEAAAAQAAAAAQAAAAYAAAABAAAACAAAAAEAAAABAAAAEgAAAAEAAAAHAAAAAQAAAAgAAAABAAAACQAAAAEAAAATAAAAAQAAAAwAAAABAAAADgAAAAEAAAAHAAAAAQAAABcAAAABAAAACwAAAAEAAAASAAAAAQAAAA8AAAABAAAAIAAAAAEAAAAOAAAAAQAAABwAAAABAAAACAAAAAEAAAALAAAAAQAAADIAAAABAAAAHQAAAAEAAAAeAAAAAQAAAB4AAAABAAAAOwAAAAEAAAAWAAAAAQAAACIAAAABAAAAFAAAAAEAAABNAAAAAQAAAB8AAAABAAAAHwAAAAEAAAAhAAAAAQAAAE4AAAABAAAAHgAAAAEAAAAYAAAAAQAAADIAAAABAAAASAAAAAEAAAAeAAAAAQAAABoAAAABAAAAJAAAAAEAAABLAAAAAQAAABQAAAABAAAAJAAAAAEAAAAsAAAAAQAAAFUAAAABAAAAFwAAAAEAAAArAAAAAQAAAE8AAAABAAAARgAAAAEAAAA8AAAAAQAAACUAAAABAAAAEAAAAAEAAAA6AAAAAQAAADsAAAABAAAAJgAAAAEAAABCAAAAAQAAACEAAAABAAAAUwAAAAEAAAAxAAAAAQAAADIAAAABAAAALwAAAAEAAABYAAAAAQAAADkAAAABAAAAOwAAAAEAAAA9AAAAAQAAAFgAAAABAAAAIwAAAAEAAAA5AAAAAQAAACcAAAABAAAAdgAAAAEAAAA+AAAAAQAAADAAAAABAAAAPwAAAAEAAABxAAAAAQAAACkAAAABAAAALgAAAAEAAABCAAAAAQAAAE4AAAABAAAAKQAAAAEAAAAxAAAAAQAAABsAAAABAAAAMgAAAAEAAAAPAAAAAAAAAAAAAAAFAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAA","11":"AAAAAEkAAAABAAAABQAAAAEAAAAPAAAAAQAAAAIAAAABAAAACAAAAAEAAAADAAAAAQAAAAYAAAABAAAACAAAAAEAAAADAAAAAQAAAAgAAAABAAAACwAAAAEAAAAHAAAAAQAAAAYAAAABAAAABgAAAAEAAAAPAAAAAQAAAAcAAAABAAAABgAAAAEAAAAKAAAAAQAAAA8AAAABAAAACAAAAAEAAAALAAAAAQAAAAkAAAABAAAAFwAAAAEAAAAKAAAAAQAAAA8AAAABAAAADQAAAAEAAAAfAAAAAQAAAAwAAAABAAAADgAAAAEAAAATAAAAAQAAAAwAAAABAAAAKAAAAAEAAAAVAAAAAQAAABMAAAABAAAAEgAAAAEAAAAyAAAAAQAAABsAAAABAAAAFAAAAAEAAAAhAAAAAQAAADcAAAABAAAAIwAAAAEAAAAcAAAAAQAAABwAAAABAAAAQQAAAAEAAAAfAAAAAQAAAB4AAAABAAAAKAAAAAEAAABAAAAAAQAAACEAAAABAAAAHQAAAAEAAAAoAAAAAQAAAEIAAAABAAAAJQAAAAEAAAAjAAAAAQAAACsAAAABAAAATQAAAAEAAAAoAAAAAQAAACQAAAABAAAAJgAAAAEAAABRAAAAAQAAACMAAAABAAAAMwAAAAEAAAAnAAAAAQAAADEAAAABAAAATAAAAAEAAAAqAAAAAQAAAC8AAAABAAAAIgAAAAEAAABhAAAAAQAAACUAAAABAAAAMQAAAAEAAAApAAAAAQAAAGcAAAABAAAALgAAAAEAAAA2AAAAAQAAACwAAAABAAAAbQAAAAEAAAAwAAAAAQAAAC0AAAABAAAAMwAAAAEAAABrAAAAAQAAADcAAAABAAAAMwAAAAEAAAA8AAAAAQAAAG8AAAABAAAASQAAAAEAAAA8AAAAAQAAADcAAAABAAAAcAAAAAEAAAA0AAAAAQAAADQAAAABAAAAMAAAAAEAAABRAAAAAQAAACAAAAAAAAAAAAAAAAYAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAA==","12":"AAAAADcAAAABAAAAAQAAAAEAAAADAAAAAQAAAAwAAAABAAAABAAAAAEAAAAGAAAAAQAAAAQAAAABAAAABwAAAAEAAAAEAAAAAQAAAAUAAAABAAAABAAAAAEAAAALAAAAAQAAAAYAAAABAAAABQAAAAEAAAAGAAAAAQAAAAwAAAABAAAABgAAAAEAAAAHAAAAAQAAAAcAAAABAAAADwAAAAEAAAAIAAAAAQAAAAcAAAABAAAACQAAAAEAAAATAAAAAQAAAAkAAAABAAAACgAAAAEAAAALAAAAAQAAABYAAAABAAAADAAAAAEAAAAMAAAAAQAAAA4AAAABAAAADgAAAAEAAAAeAAAAAQAAAAwAAAABAAAAEgAAAAEAAAARAAAAAQAAACgAAAABAAAAEwAAAAEAAAAVAAAAAQAAABUAAAABAAAAMAAAAAEAAAAXAAAAAQAAABgAAAABAAAAGQAAAAEAAAA6AAAAAQAAABsAAAABAAAAHgAAAAEAAAAfAAAAAQAAADsAAAABAAAAIQAAAAEAAAAhAAAAAQAAACIAAAABAAAAPgAAAAEAAAAlAAAAAQAAACEAAAABAAAAJAAAAAEAAABIAAAAAQAAACUAAAABAAAAIwAAAAEAAAAoAAAAAQAAAEoAAAABAAAAJwAAAAEAAAAmAAAAAQAAACUAAAABAAAAJwAAAAEAAABVAAAAAQAAACcAAAABAAAAKQAAAAEAAAAtAAAAAQAAAFcAAAABAAAAKAAAAAEAAAAuAAAAAQAAAC4AAAABAAAAYQAAAAEAAAAvAAAAAQAAAC4AAAABAAAAMwAAAAEAAABiAAAAAQAAADYAAAABAAAANgAAAAEAAAAzAAAAAQAAAHIAAAABAAAAOAAAAAEAAAA7AAAAAQAAADkAAAABAAAAeQAAAAEAAAA/AAAAAQAAAEAAAAABAAAAQQAAAAEAAACFAAAAAQAAAEwAAAABAAAAPQAAAAEAAABEAAAAAQAAAIMAAAABAAAAQAAAAAEAAAAaAAAAAAAAAAAAAAAFAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAA","13":"AAAAAAgAAAABAAAAAQAAAAEAAAAHAAAAAQAAAAIAAAABAAAAAwAAAAEAAAAJAAAAAQAAAAgAAAABAAAABwAAAAEAAAABAAAABgAAAAEAAAABAAAADQAAAAEAAAAHAAAAAQAAAAYAAAABAAAACwAAAAEAAAABAAAAAQAAAAgAAAABAAAAAwAAAAEAAAANAAAAAQAAAAcAAAABAAAABAAAAAEAAAAIAAAAAQAAABcAAAABAAAADgAAAAEAAAALAAAAAQAAAA0AAAABAAAAAwAAAAEAAAAOAAAAAQAAABAAAAABAAAABQAAAAEAAAAYAAAAAQAAAAgAAAABAAAAAQAAAAEAAAAIAAAAAQAAABQAAAABAAAAIwAAAAEAAAAZAAAAAQAAACwAAAABAAAADAAAAAEAAAAUAAAAAQAAABYAAAABAAAAGAAAAAEAAAAgAAAAAQAAACoAAAABAAAABQAAAAEAAAA1AAAAAQAAAB8AAAABAAAABgAAAAEAAAAnAAAAAQAAAAoAAAABAAAAPgAAAAEAAAAJAAAAAQAAACkAAAABAAAABAAAAAEAAABXAAAAAQAAAD0AAAABAAAAHQAAAAEAAAAnAAAAAQAAAEAAAAABAAAAJAAAAAEAAAAcAAAAAQAAACoAAAABAAAAcQAAAAEAAAAxAAAAAQAAAEAAAAABAAAAbAAAAAEAAABNAAAAAQAAACsAAAABAAAAFwAAAAEAAACSAAAAAQAAACUAAAABAAAAPgAAAAEAAABFAAAAAQAAAJoAAAABAAAAdAAAAAEAAAA7AAAAAQAAAIMAAAABAAAA6AAAAAEAAAC4AAAAAQAAAO0CAAAQAAAAAAAAAAMAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAIAAAAAAAAAAQAAAAEAAAAAAAAAAQAAAAIAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAMAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","14":"AAAAAAkAAAABAAAABAAAAAEAAAAGAAAAAQAAAAEAAAABAAAAAQAAAAoAAAABAAAAAQAAAAUAAAABAAAABQAAAAEAAAAJAAAAAQAAAAIAAAABAAAAAgAAAAEAAAAEAAAAAQAAAA0AAAABAAAABAAAAAEAAAAFAAAAAQAAAAcAAAABAAAACQAAAAEAAAAGAAAAAQAAAAYAAAABAAAABgAAAAEAAAAGAAAAAQAAAAsAAAABAAAACAAAAAEAAAAEAAAAAQAAAAYAAAABAAAAGgAAAAEAAAADAAAAAQAAAAgAAAABAAAADQAAAAEAAAAQAAAAAQAAAA0AAAABAAAACwAAAAEAAAAQAAAAAQAAABEAAAABAAAAEQAAAAEAAAACAAAAAQAAABcAAAABAAAAHwAAAAEAAAAXAAAAAQAAABMAAAABAAAABgAAAAEAAAApAAAAAQAAAA8AAAABAAAAEwAAAAEAAAALAAAAAQAAACYAAAABAAAAJAAAAAEAAAAWAAAAAQAAABoAAAABAAAALAAAAAEAAAAdAAAAAQAAAB0AAAABAAAABgAAAAEAAAAYAAAAAQAAAE8AAAABAAAAIwAAAAEAAAAZAAAAAQAAABEAAAABAAAAXgAAAAEAAAAkAAAAAQAAACoAAAABAAAAIAAAAAEAAABLAAAAAQAAACcAAAABAAAAKAAAAAEAAAAfAAAAAQAAAGkAAAABAAAAJwAAAAEAAAA9AAAAAQAAACkAAAABAAAATQAAAAEAAABCAAAAAQAAADsAAAABAAAAMAAAAAEAAACBAAAAAQAAADsAAAABAAAANQAAAAEAAABoAAAAAQAAAJ0AAAABAAAASQAAAAEAAABmAAAAAQAAAHgAAAABAAAA4wAAAAEAAAClAAAAAQAAAIICAAAQAAAAAAAAAAMAAAAAAAAAAQAAAAAAAAABAAAAAQAAAAAAAAACAAAAAAAAAAEAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","15":"AAAAAA8AAAABAAAAAwAAAAEAAAAEAAAAAQAAAAEAAAACAAAAAQAAAAcAAAABAAAABgAAAAEAAAAFAAAAAQAAAAMAAAABAAAABwAAAAEAAAAIAAAAAQAAAAQAAAABAAAABAAAAAEAAAAGAAAAAQAAAAsAAAABAAAABQAAAAEAAAAGAAAAAQAAAAYAAAABAAAACwAAAAEAAAAGAAAAAQAAAAcAAAABAAAABgAAAAEAAAAJAAAAAQAAAA0AAAABAAAACQAAAAEAAAAIAAAAAQAAAAgAAAABAAAAFQAAAAEAAAAKAAAAAQAAAAoAAAABAAAACgAAAAEAAAAZAAAAAQAAAAoAAAABAAAADwAAAAEAAAAKAAAAAQAAAB8AAAABAAAADwAAAAEAAAANAAAAAQAAABEAAAABAAAAIQAAAAEAAAAVAAAAAQAAABMAAAABAAAAEgAAAAEAAAArAAAAAQAAABUAAAABAAAAEgAAAAEAAAAVAAAAAQAAADMAAAABAAAAGwAAAAEAAAAbAAAAAQAAABoAAAABAAAAMgAAAAEAAAAfAAAAAQAAAB8AAAABAAAAIAAAAAEAAAAkAAAAAQAAAEUAAAABAAAAHwAAAAEAAAAeAAAAAQAAACEAAAABAAAATwAAAAEAAAAqAAAAAQAAACQAAAABAAAAJAAAAAEAAABNAAAAAQAAAC4AAAABAAAAKQAAAAEAAAAoAAAAAQAAAF0AAAABAAAAMwAAAAEAAAAzAAAAAQAAAC4AAAABAAAAZgAAAAEAAAA2AAAAAQAAADsAAAABAAAAOgAAAAEAAAB8AAAAAQAAAEgAAAABAAAARgAAAAEAAABMAAAAAQAAAJoAAAABAAAAVwAAAAEAAABaAAAAAQAAAHEAAAABAAAA9wAAAAEAAACYAAAAAQAAANkBAAAQAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","16":"AAAAABYAAAABAAAAAgAAAAEAAAABAAAABAAAAAEAAAAHAAAAAQAAAAMAAAABAAAABAAAAAEAAAAEAAAAAQAAAAoAAAABAAAABQAAAAEAAAAFAAAAAQAAAAQAAAABAAAACwAAAAEAAAAFAAAAAQAAAAYAAAABAAAABQAAAAEAAAAOAAAAAQAAAAUAAAABAAAABwAAAAEAAAAHAAAAAQAAAA4AAAABAAAACAAAAAEAAAAHAAAAAQAAAAkAAAABAAAACAAAAAEAAAATAAAAAQAAAAkAAAABAAAACgAAAAEAAAALAAAAAQAAABcAAAABAAAADAAAAAEAAAANAAAAAQAAAA0AAAABAAAAHAAAAAEAAAAPAAAAAQAAAA8AAAABAAAAEQAAAAEAAAAkAAAAAQAAABIAAAABAAAAEgAAAAEAAAAWAAAAAQAAACoAAAABAAAAFgAAAAEAAAAYAAAAAQAAABgAAAABAAAAMQAAAAEAAAAaAAAAAQAAAB0AAAABAAAAFwAAAAEAAAA+AAAAAQAAAB4AAAABAAAAHQAAAAEAAAAgAAAAAQAAAD0AAAABAAAAIgAAAAEAAAAhAAAAAQAAAB8AAAABAAAAJgAAAAEAAABHAAAAAQAAACYAAAABAAAAIAAAAAEAAAAoAAAAAQAAAEsAAAABAAAAKAAAAAEAAAApAAAAAQAAACwAAAABAAAAVwAAAAEAAAAtAAAAAQAAACoAAAABAAAAMgAAAAEAAABhAAAAAQAAADEAAAABAAAAMgAAAAEAAAA1AAAAAQAAAHIAAAABAAAANAAAAAEAAAA4AAAAAQAAAD4AAAABAAAAiwAAAAEAAABGAAAAAQAAAEQAAAABAAAASwAAAAEAAACjAAAAAQAAAFIAAAABAAAAWQAAAAEAAABgAAAAAQAAAOQAAAABAAAAkAAAAAEAAAAJAQAADgAAAAAAAAABAAAAAAAAAAEAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","17":"AAAAACAAAAABAAAACwAAAAEAAAAdAAAAAQAAAAUAAAABAAAABgAAAAEAAAAHAAAAAQAAABIAAAABAAAABQAAAAEAAAAGAAAAAQAAAAYAAAABAAAAAQAAAAEAAAAJAAAAAQAAAAsAAAABAAAAAgAAAAEAAAAJAAAAAQAAAAIAAAABAAAABQAAAAEAAAAJAAAAAQAAAAwAAAABAAAAEgAAAAEAAAALAAAAAQAAAAMAAAABAAAAAQAAAAEAAAADAAAAAQAAAAoAAAABAAAAJQAAAAEAAAAEAAAAAQAAAAcAAAABAAAAAwAAAAEAAAAKAAAAAQAAAAYAAAABAAAABAAAAAEAAAAIAAAAAQAAAAgAAAABAAAACAAAAAEAAAAYAAAAAQAAAAoAAAABAAAAAQAAAAMAAAABAAAAAQAAABAAAAABAAAACgAAAAEAAAAEAAAAAQAAAAEAAAABAAAABgAAAAEAAAAIAAAAAQAAAAEAAAAGAAAAAQAAAAcAAAABAAAATQAAAAEAAAAMAAAAAQAAAAQAAAABAAAABAAAAAEAAAABAAAAAAAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAD/////AAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAA/////wEAAAAAAAAA/////wAAAAABAAAAAAAAAAIAAAAAAAAA/v///wAAAAACAAAAAAAAAAEAAAAAAAAA/////wAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAD/////AQAAAAAAAAABAAAA/////wAAAAD/////AAAAAAEAAAAAAAAA/////wAAAAABAAAAAAAAAAEAAAAAAAAA/////wEAAAAAAAAA/////wAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","18":"AAAAABkAAAABAAAACgAAAAEAAAARAAAAAQAAAAcAAAABAAAACgAAAAEAAAAEAAAAAQAAABIAAAABAAAABwAAAAEAAAAIAAAAAQAAAAYAAAABAAAAEQAAAAEAAAAGAAAAAQAAAAgAAAABAAAACQAAAAEAAAAWAAAAAQAAAAoAAAABAAAACQAAAAEAAAALAAAAAQAAACIAAAABAAAAAQAAAAEAAAABAAAAGAAAAAEAAAASAAAAAQAAAAEAAAAEAAAAAQAAAAoAAAABAAAABAAAAAEAAAABAAAAoAAAAAEAAAABAAAAAQAAAAEAAAABAAAAEgAAAAEAAAAFAAAAAQAAAAsAAAABAAAADQAAAAEAAAAVAAAAAQAAAAMAAAABAAAAAwAAAAAAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAP7///8AAAAAAgAAAAAAAAABAAAAAAAAAAEAAAD/////AAAAAAEAAAAAAAAAAQAAAAAAAAD/////AQAAAAAAAAACAAAA/v///wIAAAAAAAAA/v///wAAAAACAAAAAAAAAP7///8AAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAA=","19":"AAAAABEAAAABAAAABwAAAAEAAAANAAAAAQAAAAcAAAABAAAABQAAAAEAAAAGAAAAAQAAABAAAAABAAAABgAAAAEAAAAGAAAAAQAAAAcAAAABAAAADwAAAAEAAAAIAAAAAQAAAAgAAAABAAAABQAAAAEAAAASAAAAAQAAAAoAAAABAAAABQAAAAEAAAAOAAAAAQAAABcAAAABAAAACwAAAAEAAAAMAAAAAQAAABQAAAABAAAAKQAAAAEAAAABAAAAAQAAABgAAAABAAAAAQAAAAEAAAABAAAAMgAAAAEAAAABAAAAAQAAAAIAAAABAAAAIwAAAAEAAAABAAAAAQAAAAgAAAABAAAAAgAAAAEAAAAHAAAAAQAAAFwAAAABAAAAFwAAAAEAAAAIAAAAAAAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAD+////AgAAAAAAAAABAAAAAAAAAP////8BAAAAAAAAAAEAAAAAAAAA/////wAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAD/////AAAAAAEAAAAAAAAA/////wAAAAABAAAAAAAAAAEAAAAAAAAA","20":"AAAAAAoAAAABAAAABAAAAAEAAAAIAAAAAQAAAAQAAAABAAAABAAAAAEAAAAFAAAAAQAAAAwAAAABAAAABQAAAAEAAAAFAAAAAQAAAAYAAAABAAAADAAAAAEAAAAGAAAAAQAAAAcAAAABAAAABgAAAAEAAAANAAAAAQAAAAYAAAABAAAACAAAAAEAAAAHAAAAAQAAABEAAAABAAAACAAAAAEAAAAJAAAAAQAAAAsAAAABAAAAFwAAAAEAAAANAAAAAQAAAAwAAAABAAAAEQAAAAEAAAAuAAAAAQAAAEIAAAABAAAABwAAAAEAAAAMAAAAAQAAAAEAAAAFAAAAAQAAAAEAAABSAAAAAQAAAFIAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAA/////wAAAAABAAAA/////wAAAAABAAAA/////wAAAAD+////AAAAAA==","21":"AAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAIAAAAAQAAAAcAAAABAAAABQAAAAEAAAAOAAAAAQAAAAEAAAABAAAAGQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAADwAAAAEAAAAIAAAAAQAAAAEAAAAJAAAAAQAAAAMAAAABAAAAAwAAAAEAAAABAAAAAQAAAAsAAAABAAAACQAAAAEAAAAEAAAAAQAAAAYAAAABAAAACgAAAAEAAAAEAAAAAQAAAAsAAAABAAAAFgAAAAEAAAALAAAAAQAAAAUAAAABAAAABgAAAAEAAAA6AAAAAQAAABIAAAABAAAAAQAAAAoAAAABAAAAAgAAAAEAAAABAAAABgAAAAEAAAAPAAAAAQAAAAcAAAABAAAABAAAAAEAAAAJAAAAAQAAAAQAAAABAAAAAQAAAAEAAAAIAAAAAQAAAAkAAAABAAAABAAAAAEAAAATAAAAAQAAAAMAAAABAAAAAQAAAAEAAAARAAAAAQAAAAEAAAABAAAADAAAAAEAAAADAAAAAQAAAAwAAAABAAAABwAAAAEAAAADAAAAAQAAAAEAAAARAAAAAQAAAAYAAAABAAAAAwAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAAMAAAAAQAAAAQAAAABAAAAAgAAAAEAAAAHAAAAAQAAAAIAAAABAAAAAgAAAAEAAAAQAAAAAwAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAQAAAAAAAAAAQAAAAAAAAD/////AgAAAP////8CAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAP3///8CAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAA/v///wAAAAACAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAACAAAAAAAAAP7///8AAAAAAgAAAAAAAAABAAAAAAAAAAEAAAD/////AAAAAP////8AAAAAAQAAAP////8AAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAA/////wAAAAABAAAAAAAAAP7///8AAAAAAQAAAAAAAAD+////AAAAAAEAAAAAAAAA/////wAAAAD+////AAAAAAIAAAAAAAAA/v///wAAAAACAAAAAAAAAP7///8AAAAAAgAAAAAAAAD9////AAAAAP////8AAAAAAQAAAAAAAAD//////////wAAAAD+////AAAAAP////8AAAAAAQAAAAAAAAD//////////wAAAAABAAAAAAAAAP////8AAAAA/////wAAAAD+////AAAAAP////8AAAAA/////wAAAAD/////AAAAAP////8AAAAA/f///w==","22":"AAAAAAEAAAACAAAAAQAAAAUAAAABAAAAAgAAAAEAAAAJAAAAAQAAAAYAAAABAAAABgAAAAEAAAABAAAAAQAAAAkAAAABAAAABgAAAAEAAAADAAAAAQAAAAkAAAABAAAADAAAAAEAAAAEAAAAAQAAAAgAAAABAAAABgAAAAEAAAAJAAAAAQAAAAIAAAABAAAAAQAAAAEAAAAFAAAAAQAAAAkAAAABAAAABgAAAAEAAAAaAAAAAQAAAAgAAAABAAAAAwAAAAEAAAAJAAAAAQAAAAIAAAABAAAAAQAAABcAAAABAAAAFgAAAAEAAAAFAAAAAQAAACsAAAABAAAALQAAAAEAAAABAAAAAQAAAAEAAAABAAAANAAAAAEAAAATAAAAAQAAAAgAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAEAAAAAEAAAAbAAAAAQAAAAEAAAABAAAAAQAAABQAAAABAAAACQAAAAEAAAAHAAAAAQAAAAsAAAABAAAACwAAAAEAAAAFAAAAAQAAAAUAAAABAAAABwAAAAEAAAADAAAAAQAAAAUAAAABAAAAEAAAAAMAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAA/////wEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAD+////AgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAP7///8CAAAA/v///wAAAAACAAAAAAAAAP7///8AAAAA/////wAAAAABAAAA/////wEAAAD/////AAAAAAEAAAD/////AAAAAP////8AAAAA/////wEAAAAAAAAA/////wAAAAD+////AAAAAP////8AAAAA/////wAAAAD/////AAAAAP7///8AAAAA/////wAAAAD/////AAAAAP////8AAAAA/////wAAAAD9////","23":"AAAAAAIAAAABAAAAAQAAAAYAAAABAAAABgAAAAEAAAAEAAAAAQAAAAUAAAABAAAACgAAAAEAAAAGAAAAAQAAAAUAAAABAAAABAAAAAEAAAANAAAAAQAAAAUAAAABAAAABQAAAAEAAAAGAAAAAQAAAAwAAAABAAAABgAAAAEAAAAEAAAAAQAAAAcAAAABAAAADwAAAAEAAAAHAAAAAQAAAAcAAAABAAAACgAAAAEAAAAOAAAAAQAAABIAAAABAAAACwAAAAEAAAAOAAAAAQAAABAAAAABAAAALQAAAAEAAAABAAAAAQAAAAEAAABpAAAAAQAAADUAAAABAAAAFAAAAAEAAAANAAAAAQAAAAwAAAABAAAAFQAAAAEAAAAIAAAAAQAAAAgAAAABAAAACAAAAAEAAAAGAAAAAQAAAAoAAAABAAAAAgAAAAEAAAAQAAAAAAAAAAEAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAD/////AQAAAAAAAAD/////AAAAAP7///8AAAAA/////wAAAAD/////AAAAAP////8AAAAA/v///wAAAAD/////AAAAAP////8AAAAA/////wAAAAD/////AAAAAP7///8AAAAA/////w==","24":"AAAAAAYAAAABAAAAAwAAAAEAAAAEAAAAAQAAAAYAAAABAAAADQAAAAEAAAAGAAAAAQAAAAUAAAABAAAABgAAAAEAAAAMAAAAAQAAAAYAAAABAAAABgAAAAEAAAAFAAAAAQAAAA0AAAABAAAABgAAAAEAAAAGAAAAAQAAAAcAAAABAAAADgAAAAEAAAAHAAAAAQAAAAgAAAABAAAABwAAAAEAAAATAAAAAQAAAAsAAAABAAAACwAAAAEAAAANAAAAAQAAAA4AAAABAAAALQAAAAEAAAAxAAAAAQAAACwAAAABAAAAMgAAAAEAAAAuAAAAAQAAABIAAAABAAAADQAAAAEAAAANAAAAAQAAAAsAAAABAAAAFAAAAAEAAAAHAAAAAQAAAAYAAAAOAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAP////8AAAAA/////wAAAAD+////AAAAAP////8AAAAA/////wAAAAD/////AAAAAP////8AAAAA/v///wAAAAD/////AAAAAA==","25":"AAAAANEAAAABAAAARAAAAAEAAABpAAAAAQAAAF0AAAABAAAAAwAAAAEAAAABAAAAOAAAAAEAAABDAAAAAQAAAGkAAAABAAAAEgAAAAEAAAAcAAAAAQAAAAcAAAABAAAAAgAAAAEAAABPAAAAAQAAAAEAAAABAAAAMAAAAAEAAAAyAAAAAQAAADUAAAABAAAANgAAAAEAAAAEAAAAAQAAABEAAAABAAAAEgAAAAEAAAADAAAAAQAAABwAAAABAAAAnQAAAAEAAAAQAAAAAQAAABEAAAABAAAAWgAAAAEAAAAXAAAAAQAAACgAAAABAAAAMAAAAAEAAABTAAAAAQAAALgBAAABAAAAJgAAAAEAAAAbAAAAAQAAAAoAAAABAAAAIQAAAAEAAACvAAAAAQAAAAEAAAABAAAADQAAAAEAAACZAAAAAQAAAAcAAAABAAAAGgAAAAEAAAB5AAAAAQAAAE4AAAABAAAAFAAAAAEAAAAHAAAAAQAAAD4AAAABAAAAEAAAAAEAAAAhAAAAAQAAAAEAAAABAAAAFwAAAAEAAAABAAAAKQAAAAEAAABFAAAAAQAAACoAAAABAAAAzAEAAAEAAAA8AAAAAQAAAEUAAAABAAAADwAAAAAAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAA/////wAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAD+////AAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAA/////wAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAACAAAAAAAAAP7///8AAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAA/////wAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAA/////wAAAAD/////AAAAAAEAAAAAAAAA/////wAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAD/////AAAAAP////8AAAAAAQAAAAAAAAD/////AQAAAAAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAA=","26":"AAAAALAAAAABAAAAPQAAAAEAAABpAAAAAQAAADAAAAABAAAALwAAAAEAAAApAAAAAQAAAHgAAAABAAAARwAAAAEAAAAwAAAAAQAAAD4AAAABAAAARAAAAAEAAAA+AAAAAQAAADIAAAABAAAATQAAAAEAAABqAAAAAQAAAAMAAAABAAAABAAAAAEAAABqAAAAAQAAADsAAAABAAAAUQAAAAEAAAAYAQAAAQAAAAUAAAABAAAABQAAAAEAAABSAAAAAQAAABoAAAABAAAACAAAAAEAAAAGAAAAAQAAABMAAAABAAAAkwAAAAEAAAAJAAAAAQAAAAMAAAABAAAAGQAAAAEAAAABAAAAYwAAAAEAAADFAwAAAQAAAAkAAAABAAAAQAAAAAEAAAAFAAAAAQAAAAEAAAAkAAAAAQAAAAkAAAABAAAAGQAAAAEAAAAEAAAAAQAAAAMAAAABAAAABgAAAAEAAAAwAAAAAQAAAAIAAAABAAAAAgAAAAEAAABqAAAAAQAAAHIAAAABAAAAWgAAAAEAAAAZAAAAAQAAAA8AAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAP7///8AAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAP7///8AAAAAAgAAAAAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAD/////AAAAAAEAAAAAAAAAAQAAAAAAAAD/////AAAAAAEAAAAAAAAA/////wEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAP7///8AAAAAAgAAAAAAAAD+////AgAAAAAAAAD+////AAAAAAIAAAAAAAAA/v///wAAAAACAAAAAAAAAP7///8AAAAAAgAAAAAAAAD+////AAAAAAIAAAAAAAAA/v///wAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","27":"AAAAAHEAAAABAAAALgAAAAEAAABdAAAAAQAAAC4AAAABAAAAKwAAAAEAAAAlAAAAAQAAAG0AAAABAAAAMwAAAAEAAAAjAAAAAQAAADgAAAABAAAAWwAAAAEAAAA5AAAAAQAAACcAAAABAAAAOQAAAAEAAABjAAAAAQAAAFAAAAABAAAAPAAAAAEAAABJAAAAAQAAAJwAAAABAAAAUwAAAAEAAAABAAAAAgAAAAEAAABOAAAAAQAAAAUAAAABAAAAAQAAAAEAAAAGAAAAAQAAAAUAAAABAAAAAwAAAAEAAAACAAAAAQAAAFcAAAABAAAARgEAAAEAAAB9AAAAAQAAAAEAAAABAAAABAAAAAEAAAAGAAAAAQAAAAsAAAABAAAAAQAAAAEAAAABAAAAAQAAAAQAAAABAAAABQAAAAEAAAAWAAAAAQAAAAEAAAAXAQAAAQAAAAMAAAABAAAAAwAAAAEAAAABAAAAKQAAAAEAAAAEAAAAAQAAAA0AAAABAAAAAQAAAAMAAAABAAAAAQAAAAEAAAABAAAAGgEAAAEAAAACAAAAAQAAAAIAAAABAAAAEQAAAAEAAAABAAAADgAAAAEAAAABAAAAAQAAAAQAAAABAAAAEQAAAAEAAABVAAAAAQAAAAEAAAABAAAAAQAAAAgAAAABAAAAPAAAAAEAAAABAAAAAQAAAAEAAAAgAAAAAQAAAKIBAAABAAAAAQAAAAgAAAABAAAAAQAAAAEAAAAFAAAAAQAAAAEAAACRAAAAAQAAACsAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAP////8AAAAAAQAAAAAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAD/////AAAAAAEAAAAAAAAA/////wAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAD/////AAAAAAEAAAAAAAAA/////wAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAD/////AQAAAAAAAAABAAAAAAAAAP////8AAAAAAQAAAP////8AAAAAAQAAAAAAAAD/////AAAAAAEAAAD/////AAAAAAEAAAAAAAAA/////wEAAAAAAAAA/////wAAAAABAAAAAAAAAP////8AAAAAAQAAAP////8AAAAAAQAAAP////8BAAAAAAAAAP////8AAAAAAQAAAAAAAAD/////AQAAAP////8BAAAAAAAAAP////8AAAAAAQAAAP////8AAAAAAQAAAAAAAAD/////AAAAAAEAAAD/////AAAAAAEAAAD/////AQAAAAAAAAD/////AQAAAAAAAAABAAAAAAAAAA==","28":"AAAAAD0AAAABAAAAHQAAAAEAAAA9AAAAAQAAACAAAAABAAAAIgAAAAEAAAAkAAAAAQAAAE0AAAABAAAAJwAAAAEAAAAnAAAAAQAAACkAAAABAAAAVgAAAAEAAAApAAAAAQAAADAAAAABAAAAKgAAAAEAAABcAAAAAQAAADYAAAABAAAAMQAAAAEAAAAxAAAAAQAAAHEAAAABAAAAPAAAAAEAAABAAAAAAQAAAEUAAAABAAAAmQAAAAEAAABTAAAAAQAAAGEAAAABAAAAawAAAAEAAABVAQAAAQAAADsBAAABAAAAGQAAAAEAAAABAAAAAQAAAH0BAAABAAAApwEAAAEAAAABAAAAAQAAAAECAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAA/////wAAAAABAAAAAAAAAP////8AAAAA/v///wIAAAD+////AAAAAA==","29":"AAAAAAkAAAABAAAAAQAAAAoAAAABAAAAAwAAAAEAAAATAAAAAQAAAA8AAAABAAAALgAAAAEAAAAEAAAAAQAAABEAAAABAAAAPwAAAAEAAABaAAAAAQAAAAIAAAABAAAADwAAAAEAAAAZAAAAAQAAAAcAAAABAAAAEwAAAAEAAAAEAAAAAQAAABEAAAABAAAAVQAAAAEAAAAIAAAAAQAAAAwAAAABAAAAEgAAAAEAAAApAAAAAQAAAFYAAAABAAAAMwAAAAEAAAACAAAAAQAAAEAAAAABAAAAFAAAAAEAAAA2AAAAAQAAADYAAAABAAAAFQAAAAEAAABgAAAAAQAAACAAAAABAAAAEgAAAAEAAAAqAAAAAQAAAA8AAAABAAAATQAAAAEAAACIAAAAAQAAADgAAAABAAAAAQAAACAAAAABAAAABwAAAAEAAAArAAAAAQAAACAAAAABAAAA2wAAAAEAAAC0AAAAAQAAABgAAAABAAAAEAAAAAEAAABNAAAAAQAAABUAAAABAAAAIgAAAAEAAAAaAAAAAQAAAEsAAAABAAAAAQAAABQAAAABAAAAMQAAAAEAAAAqAAAAAQAAABIAAAABAAAAKgAAAAEAAAApAAAAAQAAABIAAAABAAAAFwAAAAEAAABYAAAAAQAAAG0AAAABAAAAGwAAAAEAAACwAAAAAQAAAAEAAAADAAAAAQAAAAMAAAABAAAATAAAAAEAAAABAAAAAQAAAC8AAAABAAAAEQAAAAEAAABtAAAAAQAAAJYAAAABAAAARwAAAAEAAAAiAAAAAQAAAAsAAAABAAAAFgAAAAEAAAAXAAAAAQAAAEUAAAABAAAAHwAAAAEAAAAZAAAAAQAAACAAAAABAAAAJAAAAAEAAAAmAAAAAQAAAAMAAAABAAAACQAAABAAAAAAAAAAAQAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAA/v///wAAAAACAAAAAAAAAP7///8AAAAAAgAAAAAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAABAAAAAAAAAAMAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAA/////wAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAP7///8AAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAP////8AAAAAAQAAAAAAAAD/////AAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAD/////AAAAAAEAAAAAAAAA/////wAAAAABAAAAAAAAAAEAAAAAAAAA/////wIAAAAAAAAA/////wAAAAD/////AAAAAAEAAAAAAAAA/////wAAAAABAAAAAAAAAP7///8AAAAAAgAAAAAAAAD/////AAAAAP////8AAAAAAQAAAAAAAAD/////AAAAAP3///8BAAAAAAAAAP////8AAAAAAQAAAAAAAAD/////AAAAAAEAAAAAAAAA/////wAAAAD/////AAAAAP////8AAAAA/v///wAAAAD/////AAAAAP////8AAAAA/////wAAAAABAAAAAAAAAP////8AAAAA/v///wAAAAD/////AAAAAP////8AAAAA/////wAAAAD/////AAAAAP7///8AAAAA/////wAAAAA=","30":"AAAAAAoAAAABAAAACgAAAAEAAAANAAAAAQAAAAgAAAABAAAAEwAAAAEAAAAeAAAAAQAAACsAAAABAAAAIAAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAMAAAABAAAAFwAAAAEAAAACAAAAAQAAAAEAAAABAAAALgAAAAEAAAADAAAAAQAAAAEAAAABAAAAOgAAAAEAAAAaAAAAAQAAAA0AAAABAAAAEQAAAAEAAAAqAAAAAQAAAAEAAAABAAAAAQAAABcAAAABAAAAXQAAAAEAAAARAAAAAQAAAAEAAAABAAAABAAAAAEAAAABAAAADQAAAAEAAAAsAAAAAQAAABEAAAABAAAAAgAAAAEAAAABAAAAMAAAAAEAAAABAAAAAQAAAAUAAAABAAAALgAAAAEAAAACAAAAAQAAAAEAAAABAAAACQAAAAEAAAABAAAALgAAAAEAAAAsAAAAAQAAAEsAAAABAAAAeQAAAAEAAAAzAAAAAQAAAEAAAAABAAAALAAAAAEAAAC9AAAAAQAAAEUAAAABAAAACgAAAAEAAAAGAAAAAQAAAEUAAAABAAAAAQAAAAEAAAALAAAAAQAAABYAAAABAAAAAQAAAAMAAAABAAAABAAAAAEAAADBAAAAAQAAAAwAAAABAAAABwAAAAEAAAAPAAAAAQAAAAMAAAABAAAAAwAAAAEAAAAJAAAAAQAAAAgAAAABAAAAGQAAAAEAAAB8AAAAAQAAAAgAAAABAAAA6AEAAAEAAAC2AAAAAQAAAHYAAAABAAAAoQAAAAEAAAAEAAAAAQAAAAMAAAABAAAAmwAAAAEAAABbAAAAAQAAADQAAAABAAAAQAAAAAEAAABRAAAAAQAAACwAAAABAAAALAAAAAEAAAAoAAAAAQAAACAAAAABAAAAPgAAAAEAAAADAAAAAQAAAAkAAAAQAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAD/////AQAAAAAAAAD/////AAAAAAEAAAAAAAAAAQAAAAAAAAD/////AAAAAAEAAAAAAAAAAgAAAAAAAAD+////AAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAABAAAAAAAAAP////8BAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAP////8AAAAAAQAAAP////8AAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAA/v///wIAAAAAAAAAAQAAAAAAAAD/////AAAAAAEAAAAAAAAAAQAAAAAAAAD/////AAAAAAEAAAAAAAAA/////wEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAA/////wAAAAABAAAAAAAAAAEAAAAAAAAA/////wAAAAABAAAAAAAAAP////8BAAAAAAAAAP////8AAAAAAQAAAAAAAAACAAAAAAAAAP7///8AAAAAAgAAAAAAAAD+////AAAAAAIAAAAAAAAA/v///wAAAAACAAAAAAAAAP7///8AAAAAAgAAAAAAAAD+////AAAAAAIAAAAAAAAA/v///wAAAAD/////AAAAAP////8AAAAA/////wAAAAABAAAAAAAAAP////8AAAAA/v///wAAAAD/////AAAAAP////8AAAAA/////wAAAAD+////AAAAAP////8AAAAA/////wAAAAD/////AAAAAP////8AAAAA/v///wAAAAD/////AAAAAA==","31":"AAAAABkAAAABAAAACQAAAAEAAAAiAAAAAQAAAB8AAAABAAAAHgAAAAEAAAAfAAAAAQAAAFwAAAABAAAAIwAAAAEAAAAtAAAAAQAAACoAAAABAAAAVQAAAAEAAAAjAAAAAQAAAC8AAAABAAAAKwAAAAEAAABRAAAAAQAAACgAAAABAAAAMwAAAAEAAAAoAAAAAQAAAGcAAAABAAAALwAAAAEAAAA3AAAAAQAAAD4AAAABAAAARwAAAAEAAAAIAAAAAQAAAAEAAAABAAAAAQAAAHwAAAABAAAAAQAAAAEAAAABAAAAAQAAAFMAAAABAAAAAQAAAAEAAAABAAAATAAAAAEAAAACAAAAAQAAAAEAAABfAAAAAQAAAFABAAABAAAAHgAAAAEAAAABAAAAAQAAABYCAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAMAAAABAAAAAQAAAAEAAAAIAAAAAQAAABcAAAABAAAAAQAAABAAAAABAAAAWAEAAAEAAAAHAAAAAQAAAAEAAAABAAAAkgAAAAEAAABPAAAAAQAAAFwAAAABAAAAhQAAAAEAAABFAAAAAQAAADwAAAABAAAAMwAAAAEAAAAsAAAAAQAAAEkAAAABAAAAHwAAAAEAAAAOAAAAEAAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAA/v///wIAAAD+////AgAAAAAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAABAAAAAAAAAP////8BAAAAAAAAAAEAAAAAAAAA/////wEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAD/////AAAAAAEAAAD/////AAAAAAEAAAAAAAAA/////wAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAD/////AQAAAAAAAAD/////AAAAAP7///8AAAAAAgAAAAAAAAD+////AAAAAP////8AAAAA/////wAAAAD/////AAAAAP7///8AAAAA/////wAAAAD/////AAAAAP////8AAAAA/////wAAAAD+////AAAAAP////8AAAAA","32":"AAAAAB8AAAABAAAAFAAAAAEAAAABAAAAAQAAAAEAAAAfAAAAAQAAACkAAAABAAAAYQAAAAEAAAA0AAAAAQAAACwAAAABAAAALQAAAAEAAABXAAAAAQAAACsAAAABAAAALAAAAAEAAAApAAAAAQAAAFkAAAABAAAAKwAAAAEAAAAtAAAAAQAAAC4AAAABAAAAYQAAAAEAAAA2AAAAAQAAADYAAAABAAAAOQAAAAEAAAB9AAAAAQAAAEwAAAABAAAAQQAAAAEAAABSAAAAAQAAAGQAAAABAAAAHgEAAAEAAABJAQAAAQAAAAEAAAABAAAABAAAAAEAAAADAAAAAQAAAAIBAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAcAAAABAAAAPwEAAAEAAAAuAQAAAQAAAHwAAAABAAAAXQAAAAEAAABVAAAAAQAAAFAAAAABAAAAhgAAAAEAAAA0AAAAAQAAADUAAAAOAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAD/////AQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAA/////wEAAAAAAAAA/////wAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAD/////AQAAAP////8BAAAAAAAAAP////8AAAAA/////wAAAAD+////AAAAAP////8AAAAA/////wAAAAD/////AAAAAP////8AAAAA/v///wAAAAD/////AAAAAA==","33":"AAAAAB0AAAABAAAADAAAAAEAAAADAAAAAQAAAAgAAAABAAAACgAAAAEAAAAIAAAAAQAAAAIAAAABAAAACAAAAAEAAAAFAAAAAQAAAAsAAAABAAAABQAAAAEAAAAEAAAAAQAAAAYAAAABAAAABAAAAAEAAAAHAAAAAQAAAAYAAAABAAAABQAAAAEAAAAKAAAAAQAAAAIAAAABAAAABwAAAAEAAAAFAAAAAQAAAAYAAAABAAAABQAAAAEAAAAKAAAAAQAAAAMAAAABAAAAAQAAAAEAAAAGAAAAAQAAAAUAAAABAAAACQAAAAEAAAAIAAAAAQAAAAYAAAABAAAAAQAAAAgAAAABAAAABwAAAAEAAAADAAAAAQAAAAUAAAABAAAAAwAAAAEAAAAHAAAAAQAAAAMAAAABAAAABQAAAAEAAAAEAAAAAQAAAAsAAAABAAAAAQAAAAUAAAABAAAABgAAAAEAAAADAAAAAQAAAAcAAAABAAAAAQAAAAkAAAABAAAACgAAAAEAAAAEAAAAAQAAAAIAAAABAAAABgAAAAEAAAAFAAAAAQAAAAMAAAABAAAAAQAAAAEAAAAGAAAAAQAAAAgAAAABAAAAAQAAAAEAAAAGAAAAAQAAAAMAAAABAAAABAAAAAEAAAAGAAAAAQAAAAUAAAABAAAAAwAAAAEAAAADAAAAAQAAAAYAAAABAAAACQAAAAEAAAACAAAAAQAAAAcAAAABAAAAAwAAAAEAAAAEAAAAAQAAAAEAAAAHAAAAAQAAAAYAAAABAAAAAwAAAAEAAAAEAAAAAQAAAAMAAAABAAAAAQAAAAEAAAAFAAAAAQAAAAMAAAABAAAAAwAAAAEAAAADAAAAAQAAAAMAAAABAAAAAwAAAAEAAAAFAAAAAQAAAAUAAAABAAAABAAAAAEAAAAFAAAAAQAAAAEAAAADAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAAAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAAEoAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAACUAAAAAAAAAJQAAACUAAAAAAAAAJgAAACUAAABKAAAA","34":"AAAAABkAAAABAAAACgAAAAEAAAAHAAAAAQAAAAYAAAABAAAABwAAAAEAAAAIAAAAAQAAAAYAAAABAAAABgAAAAEAAAAHAAAAAQAAAAcAAAABAAAABgAAAAEAAAAFAAAAAQAAAAYAAAABAAAABgAAAAEAAAAGAAAAAQAAAAYAAAABAAAABgAAAAEAAAAEAAAAAQAAAAUAAAABAAAABQAAAAEAAAAIAAAAAQAAAAUAAAABAAAABAAAAAEAAAAHAAAAAQAAAAQAAAABAAAABgAAAAEAAAAGAAAAAQAAAAUAAAABAAAAAwAAAAEAAAAIAAAAAQAAAAQAAAABAAAABwAAAAEAAAAEAAAAAQAAAAQAAAABAAAABAAAAAEAAAAGAAAAAQAAAAUAAAABAAAABwAAAAEAAAAFAAAAAQAAAAMAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABAAAAAEAAAAFAAAAAQAAAAYAAAABAAAABAAAAAEAAAAFAAAAAQAAAAcAAAABAAAAAgAAAAEAAAAHAAAAAQAAAAYAAAABAAAAAgAAAAEAAAAHAAAAAQAAAAQAAAABAAAAAwAAAAEAAAAGAAAAAQAAAAQAAAABAAAAAwAAAAEAAAAHAAAAAQAAAAUAAAABAAAAAwAAAAEAAAAEAAAAAQAAAAMAAAABAAAABgAAAAEAAAADAAAAAQAAAAQAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAAAwAAAAEAAAADAAAAAQAAAAUAAAABAAAAAwAAAAEAAAAEAAAAAQAAAAUAAAABAAAABAAAAAEAAAADAAAAAQAAAAUAAAABAAAAAwAAAAEAAAAEAAAAAQAAAAMAAAABAAAAAwAAAAEAAAAFAAAAAQAAAAQAAAABAAAAAgAAAAEAAAAFAAAAAQAAAAUAAAABAAAAAwAAAAEAAAADAAAAAQAAAAIAAAABAAAABAAAAAEAAAABAAAAAQAAAAMAAAABAAAAAgAAAAEAAAABAAAAAAAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAABKAAAA","35":"AAAAABQAAAABAAAACAAAAAEAAAAIAAAAAQAAAAYAAAABAAAABwAAAAEAAAAGAAAAAQAAAAYAAAABAAAABgAAAAEAAAAGAAAAAQAAAAYAAAABAAAABgAAAAEAAAAGAAAAAQAAAAUAAAABAAAABgAAAAEAAAAFAAAAAQAAAAUAAAABAAAABgAAAAEAAAAGAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAYAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABgAAAAEAAAAEAAAAAQAAAAYAAAABAAAABgAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAGAAAAAQAAAAQAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABAAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAEAAAAAQAAAAUAAAABAAAABQAAAAEAAAAEAAAAAQAAAAUAAAABAAAABQAAAAEAAAAEAAAAAQAAAAYAAAABAAAABQAAAAEAAAAEAAAAAQAAAAUAAAABAAAABAAAAAEAAAAFAAAAAQAAAAUAAAABAAAABAAAAAEAAAAEAAAAAQAAAAQAAAABAAAABQAAAAEAAAAEAAAAAQAAAAUAAAABAAAABAAAAAEAAAAEAAAAAQAAAAQAAAABAAAABQAAAAEAAAAEAAAAAQAAAAUAAAABAAAABAAAAAEAAAADAAAAAQAAAAUAAAABAAAABQAAAAEAAAAEAAAAAQAAAAMAAAABAAAABQAAAAEAAAAEAAAAAQAAAAQAAAABAAAABAAAAAEAAAAEAAAAAQAAAAQAAAABAAAAAwAAAAEAAAAFAAAAAQAAAAMAAAABAAAABAAAAAEAAAADAAAAAQAAAAQAAAABAAAABAAAAAEAAAACAAAAAQAAAAQAAAABAAAAAwAAAAEAAAACAAAAAQAAAAEAAAAAAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAJQAAAA==","36":"AAAAAA8AAAABAAAABwAAAAEAAAAGAAAAAQAAAAUAAAABAAAABgAAAAEAAAAGAAAAAQAAAAUAAAABAAAABgAAAAEAAAAFAAAAAQAAAAYAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABgAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAGAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAQAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAQAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABAAAAAEAAAAFAAAAAQAAAAUAAAABAAAABAAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAQAAAABAAAABQAAAAEAAAAFAAAAAQAAAAQAAAABAAAABQAAAAEAAAAFAAAAAQAAAAQAAAABAAAABQAAAAEAAAAEAAAAAQAAAAUAAAABAAAABAAAAAEAAAAFAAAAAQAAAAUAAAABAAAABAAAAAEAAAAEAAAAAQAAAAUAAAABAAAABAAAAAEAAAAFAAAAAQAAAAQAAAABAAAABAAAAAEAAAAFAAAAAQAAAAUAAAABAAAABAAAAAEAAAAEAAAAAQAAAAUAAAABAAAABAAAAAEAAAAEAAAAAQAAAAUAAAABAAAABAAAAAEAAAAEAAAAAQAAAAQAAAABAAAABQAAAAEAAAAEAAAAAQAAAAQAAAABAAAABAAAAAEAAAAEAAAAAQAAAAQAAAABAAAAAwAAAAEAAAAEAAAAAQAAAAQAAAABAAAAAQAAAAAAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAA=","37":"AAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAACAAAAAQAAAAMAAAABAAAABQAAAAEAAAACAAAAAQAAAAMAAAABAAAAAwAAAAEAAAAFAAAAAQAAAAQAAAABAAAABAAAAAEAAAACAAAAAQAAAAQAAAABAAAABAAAAAEAAAACAAAAAQAAAAUAAAABAAAABgAAAAEAAAAEAAAAAQAAAAQAAAABAAAABAAAAAEAAAAEAAAAAQAAAAMAAAABAAAAAwAAAAEAAAAFAAAAAQAAAAUAAAABAAAAAwAAAAEAAAAGAAAAAQAAAAYAAAABAAAABwAAAAEAAAAFAAAAAQAAAAQAAAABAAAAAwAAAAEAAAADAAAAAQAAAAIAAAABAAAABwAAAAEAAAAGAAAAAQAAAAEAAAABAAAAAQAAAAgAAAABAAAABgAAAAEAAAAEAAAAAQAAAAMAAAABAAAAAwAAAAEAAAAGAAAAAQAAAAUAAAABAAAAAwAAAAEAAAAJAAAAAQAAAAcAAAABAAAABgAAAAEAAAAEAAAAAQAAAAMAAAABAAAAAQAAAAEAAAAIAAAAAQAAAAcAAAABAAAABAAAAAEAAAAHAAAAAQAAAAMAAAABAAAACAAAAAEAAAAEAAAAAQAAAAYAAAABAAAABAAAAAEAAAAGAAAAAQAAAAIAAAABAAAACAAAAAEAAAADAAAAAQAAAAMAAAABAAAABgAAAAEAAAALAAAAAQAAAAIAAAABAAAACAAAAAEAAAAGAAAAAQAAAAQAAAABAAAABQAAAAEAAAAEAAAAAQAAAAkAAAABAAAAAgAAAAEAAAAFAAAAAQAAAAcAAAABAAAACAAAAAEAAAADAAAAAQAAAAYAAAABAAAACAAAAAEAAAAFAAAAAQAAAAYAAAABAAAACwAAAAEAAAAGAAAAAQAAAAYAAAABAAAABwAAAAEAAAAHAAAAAQAAAAcAAAABAAAACAAAAAEAAAAKAAAAAQAAABsAAABLAAAASgAAACUAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAASwAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAAA==","38":"AAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAACAAAAAQAAAAQAAAABAAAABAAAAAEAAAACAAAAAQAAAAQAAAABAAAAAwAAAAEAAAAFAAAAAQAAAAIAAAABAAAABQAAAAEAAAADAAAAAQAAAAMAAAABAAAABAAAAAEAAAAFAAAAAQAAAAMAAAABAAAAAgAAAAEAAAAHAAAAAQAAAAUAAAABAAAAAwAAAAEAAAAEAAAAAQAAAAQAAAABAAAAAwAAAAEAAAAFAAAAAQAAAAMAAAABAAAABAAAAAEAAAAEAAAAAQAAAAYAAAABAAAAAwAAAAEAAAAFAAAAAQAAAAYAAAABAAAABQAAAAEAAAAEAAAAAQAAAAMAAAABAAAABQAAAAEAAAACAAAAAQAAAAYAAAABAAAABQAAAAEAAAAEAAAAAQAAAAUAAAABAAAABQAAAAEAAAAEAAAAAQAAAAQAAAABAAAAAgAAAAEAAAAFAAAAAQAAAAcAAAABAAAAAwAAAAEAAAAFAAAAAQAAAAUAAAABAAAABgAAAAEAAAADAAAAAQAAAAUAAAABAAAABgAAAAEAAAAHAAAAAQAAAAQAAAABAAAABQAAAAEAAAADAAAAAQAAAAUAAAABAAAABQAAAAEAAAAGAAAAAQAAAAYAAAABAAAABgAAAAEAAAADAAAAAQAAAAYAAAABAAAABAAAAAEAAAAGAAAAAQAAAAYAAAABAAAABAAAAAEAAAAFAAAAAQAAAAcAAAABAAAABAAAAAEAAAAFAAAAAQAAAAcAAAABAAAABQAAAAEAAAAFAAAAAQAAAAcAAAABAAAABAAAAAEAAAAEAAAAAQAAAAcAAAABAAAABgAAAAEAAAAEAAAAAQAAAAcAAAABAAAABAAAAAEAAAAIAAAAAQAAAAcAAAABAAAABgAAAAEAAAAIAAAAAQAAAAYAAAABAAAABgAAAAEAAAAFAAAAAQAAAAoAAAABAAAABQAAAAEAAAAJAAAAAQAAAAgAAAABAAAAGQAAAEsAAABKAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAA=","39":"AAAAAAEAAAABAAAAAgAAAAEAAAADAAAAAQAAAAMAAAABAAAABAAAAAEAAAADAAAAAQAAAAQAAAABAAAAAwAAAAEAAAAEAAAAAQAAAAMAAAABAAAABAAAAAEAAAAEAAAAAQAAAAQAAAABAAAABAAAAAEAAAAEAAAAAQAAAAUAAAABAAAAAwAAAAEAAAAFAAAAAQAAAAQAAAABAAAAAwAAAAEAAAAEAAAAAQAAAAUAAAABAAAABAAAAAEAAAAFAAAAAQAAAAMAAAABAAAABQAAAAEAAAAEAAAAAQAAAAUAAAABAAAABAAAAAEAAAAEAAAAAQAAAAQAAAABAAAABQAAAAEAAAAEAAAAAQAAAAUAAAABAAAABQAAAAEAAAAEAAAAAQAAAAQAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABAAAAAEAAAAFAAAAAQAAAAQAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAEAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAQAAAABAAAABAAAAAEAAAAFAAAAAQAAAAUAAAABAAAABgAAAAEAAAAEAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABAAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAGAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABgAAAAEAAAAFAAAAAQAAAAUAAAABAAAABgAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAGAAAAAQAAAAUAAAABAAAABgAAAAEAAAAFAAAAAQAAAAUAAAABAAAABwAAAAEAAAAFAAAAAQAAAAUAAAABAAAABwAAAAEAAAAFAAAAAQAAAAYAAAABAAAABgAAAAEAAAAGAAAAAQAAAAYAAAABAAAABwAAAAEAAAAFAAAAAQAAAAcAAAABAAAACAAAAAEAAAAIAAAAAQAAABQAAABLAAAAJQAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAAA==","40":"AAAAAAEAAAABAAAABAAAAAEAAAADAAAAAQAAAAQAAAABAAAABAAAAAEAAAAEAAAAAQAAAAQAAAABAAAABAAAAAEAAAAEAAAAAQAAAAUAAAABAAAABAAAAAEAAAAEAAAAAQAAAAQAAAABAAAABAAAAAEAAAAFAAAAAQAAAAQAAAABAAAABQAAAAEAAAAEAAAAAQAAAAQAAAABAAAABQAAAAEAAAAFAAAAAQAAAAQAAAABAAAABAAAAAEAAAAFAAAAAQAAAAQAAAABAAAABQAAAAEAAAAEAAAAAQAAAAUAAAABAAAABAAAAAEAAAAFAAAAAQAAAAQAAAABAAAABQAAAAEAAAAEAAAAAQAAAAUAAAABAAAABQAAAAEAAAAEAAAAAQAAAAUAAAABAAAABQAAAAEAAAAEAAAAAQAAAAUAAAABAAAABQAAAAEAAAAEAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAQAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAQAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABAAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAQAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAUAAAABAAAABQAAAAEAAAAGAAAAAQAAAAUAAAABAAAABQAAAAEAAAAFAAAAAQAAAAYAAAABAAAABQAAAAEAAAAFAAAAAQAAAAYAAAABAAAABQAAAAEAAAAFAAAAAQAAAAYAAAABAAAABQAAAAEAAAAGAAAAAQAAAAYAAAABAAAABQAAAAEAAAAHAAAAAQAAAAYAAAABAAAADwAAAEsAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJgAAAAAAAAAlAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAmAAAAAAAAACUAAAAAAAAAJQAAAAAAAAAlAAAAAAAAACYAAAAAAAAAJQAAAAAAAAA=","41":"AAAAAC0AAAABAAAACQAAAAEAAAAEAAAAAAAAAAAAAAACAAAAAAAAAAIAAAAAAAAA","42":"AAAAAC0AAAABAAAACQAAAAEAAAAEAAAAAAAAAAAAAAACAAAAAAAAAAIAAAAAAAAA","43":"AAAAAC0AAAABAAAACQAAAAEAAAAEAAAAAAAAAAAAAAACAAAAAAAAAAIAAAAAAAAA","44":"AAAAACgAAAABAAAACQAAAAEAAAAEAAAAAQAAAAQAAAAAAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","45":"AAAAAAQAAAABAAAACQAAAAEAAAAtAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","46":"AAAAAAQAAAABAAAACQAAAAEAAAAtAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","47":"AAAAAAQAAAABAAAACQAAAAEAAAAtAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","48":"AAAAAAQAAAABAAAADgAAAAEAAAAoAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","49":"AAAAAAMAAAABAAAAAQAAAAEAAAABAAAAAAAAAAAAAAACAAAAAAAAAAIAAAAAAAAA","50":"AAAAAAMAAAABAAAAAQAAAAEAAAABAAAAAAAAAAAAAAACAAAAAAAAAAIAAAAAAAAA","51":"AAAAAAMAAAABAAAAAQAAAAEAAAABAAAAAAAAAAAAAAACAAAAAAAAAAIAAAAAAAAA","52":"AAAAAAMAAAABAAAAAQAAAAEAAAABAAAAAAAAAAAAAAACAAAAAAAAAAIAAAAAAAAA","53":"AAAAAAEAAAABAAAAAQAAAAEAAAADAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","54":"AAAAAAEAAAABAAAAAQAAAAEAAAADAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","55":"AAAAAAEAAAABAAAAAQAAAAEAAAADAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","56":"AAAAAAEAAAABAAAAAQAAAAEAAAADAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","57":"AAAAAC0AAAABAAAACQAAAAEAAAAEAAAAAAAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","58":"AAAAAC0AAAABAAAACQAAAAEAAAAEAAAAAAAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","59":"AAAAAC0AAAABAAAACQAAAAEAAAAEAAAAAAAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","60":"AAAAACgAAAABAAAABAAAAAEAAAAOAAAAAAAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","61":"AAAAAAQAAAABAAAADgAAAAEAAAAKAAAAAQAAABIAAAABAAAACgAAAAMAAAAAAAAAAQAAAAAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAA=","62":"AAAAAAQAAAABAAAADgAAAAEAAAAKAAAAAQAAABIAAAABAAAACgAAAAMAAAAAAAAAAQAAAAAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAA=","63":"AAAAAAQAAAABAAAADgAAAAEAAAAKAAAAAQAAABIAAAABAAAACgAAAAMAAAAAAAAAAQAAAAAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAA=","64":"AAAAAAQAAAABAAAAGQAAAAEAAAADAAAAAQAAAA4AAAABAAAACgAAAAMAAAAAAAAAAQAAAAAAAAD/////AAAAAAEAAAAAAAAAAQAAAAAAAAA=","65":"AAAAAAMAAAABAAAAAQAAAAEAAAABAAAAAAAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","66":"AAAAAAMAAAABAAAAAQAAAAEAAAABAAAAAAAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","67":"AAAAAAMAAAABAAAAAQAAAAEAAAABAAAAAAAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","68":"AAAAAAMAAAABAAAAAQAAAAEAAAABAAAAAAAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","69":"AAAAAAEAAAABAAAAAQAAAAEAAAADAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","70":"AAAAAAEAAAABAAAAAQAAAAEAAAADAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","71":"AAAAAAEAAAABAAAAAQAAAAEAAAADAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","72":"AAAAAAEAAAABAAAAAQAAAAEAAAADAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","73":"AAAAAC0AAAABAAAACQAAAAEAAAAEAAAAAAAAAAAAAAACAAAAAAAAAAIAAAAAAAAA","74":"AAAAAC0AAAABAAAACQAAAAEAAAAEAAAAAAAAAAAAAAACAAAAAAAAAAIAAAAAAAAA","75":"AAAAAC0AAAABAAAACQAAAAEAAAAEAAAAAAAAAAAAAAACAAAAAAAAAAIAAAAAAAAA","76":"AAAAACgAAAABAAAACQAAAAEAAAAEAAAAAQAAAAQAAAAAAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","77":"AAAAAAQAAAABAAAACQAAAAEAAAAtAAAAAwAAAAAAAAACAAAAAAAAAAIAAAAAAAAA","78":"AAAAAAQAAAABAAAACQAAAAEAAAAtAAAAAwAAAAAAAAACAAAAAAAAAAIAAAAAAAAA","79":"AAAAAAQAAAABAAAACQAAAAEAAAAtAAAAAwAAAAAAAAACAAAAAAAAAAIAAAAAAAAA","80":"AAAAAAQAAAABAAAABAAAAAEAAAAJAAAAAQAAACgAAAADAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAA==","81":"AAAAAC0AAAABAAAACQAAAAEAAAAEAAAAAAAAAAAAAAACAAAAAAAAAAIAAAAAAAAA","82":"AAAAAC0AAAABAAAACQAAAAEAAAAEAAAAAAAAAAAAAAACAAAAAAAAAAIAAAAAAAAA","83":"AAAAAC0AAAABAAAACQAAAAEAAAAEAAAAAAAAAAAAAAACAAAAAAAAAAIAAAAAAAAA","84":"AAAAACgAAAABAAAACQAAAAEAAAAEAAAAAQAAAAQAAAAAAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","85":"AAAAAAQAAAABAAAACQAAAAEAAAAtAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","86":"AAAAAAQAAAABAAAACQAAAAEAAAAtAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","87":"AAAAAAQAAAABAAAACQAAAAEAAAAtAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","88":"AAAAAAQAAAABAAAADgAAAAEAAAAoAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","89":"AAAAAAkAAAABAAAABwAAAAEAAAABAAAAAAAAAAAAAAACAAAAAAAAAAIAAAAAAAAA","90":"AAAAAAkAAAABAAAABwAAAAEAAAABAAAAAAAAAAAAAAACAAAAAAAAAAIAAAAAAAAA","91":"AAAAAAkAAAABAAAABwAAAAEAAAABAAAAAAAAAAAAAAACAAAAAAAAAAIAAAAAAAAA","92":"AAAAAAkAAAABAAAABwAAAAEAAAABAAAAAAAAAAAAAAACAAAAAAAAAAIAAAAAAAAA","93":"AAAAAAEAAAABAAAABwAAAAEAAAAJAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","94":"AAAAAAEAAAABAAAABwAAAAEAAAAJAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","95":"AAAAAAEAAAABAAAABwAAAAEAAAAJAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","96":"AAAAAAEAAAABAAAABwAAAAEAAAAJAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","97":"AAAAAC0AAAABAAAACQAAAAEAAAAEAAAAAAAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","98":"AAAAAC0AAAABAAAACQAAAAEAAAAEAAAAAAAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","99":"AAAAAC0AAAABAAAACQAAAAEAAAAEAAAAAAAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","100":"AAAAACgAAAABAAAACQAAAAEAAAAJAAAAAAAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","101":"AAAAAA4AAAABAAAADwAAAAEAAAANAAAAAQAAAA8AAAADAAAAAAAAAAEAAAAAAAAA/////wAAAAABAAAAAAAAAA==","102":"AAAAAA4AAAABAAAADwAAAAEAAAANAAAAAQAAAA8AAAADAAAAAAAAAAEAAAAAAAAA/////wAAAAABAAAAAAAAAA==","103":"AAAAAA4AAAABAAAADwAAAAEAAAANAAAAAQAAAA8AAAADAAAAAAAAAAEAAAAAAAAA/////wAAAAABAAAAAAAAAA==","104":"AAAAAA4AAAABAAAADwAAAAEAAAANAAAAAQAAAA8AAAADAAAAAAAAAAEAAAAAAAAA/////wAAAAABAAAAAAAAAA==","105":"AAAAAAkAAAABAAAABwAAAAEAAAABAAAAAAAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","106":"AAAAAAkAAAABAAAABwAAAAEAAAABAAAAAAAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","107":"AAAAAAkAAAABAAAABwAAAAEAAAABAAAAAAAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","108":"AAAAAAkAAAABAAAABwAAAAEAAAABAAAAAAAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","109":"AAAAAAEAAAABAAAAEQAAAAMAAAAAAAAAAQAAAAAAAAA=","110":"AAAAAAEAAAABAAAAEQAAAAMAAAAAAAAAAQAAAAAAAAA=","111":"AAAAAAEAAAABAAAAEQAAAAMAAAAAAAAAAQAAAAAAAAA=","112":"AAAAAAEAAAABAAAAEQAAAAMAAAAAAAAAAQAAAAAAAAA=","113":"AAAAAC0AAAABAAAACQAAAAEAAAAEAAAAAAAAAAAAAAACAAAAAAAAAAgAAAAAAAAA","114":"AAAAAC0AAAABAAAACQAAAAEAAAAEAAAAAAAAAAAAAAACAAAAAAAAAAgAAAAAAAAA","115":"AAAAAC0AAAABAAAACQAAAAEAAAAEAAAAAAAAAAAAAAACAAAAAAAAAAgAAAAAAAAA","116":"AAAAACgAAAABAAAACQAAAAEAAAAEAAAAAQAAAAQAAAAAAAAAAAAAAAIAAAAAAAAABwAAAAAAAAABAAAAAAAAAA==","117":"AAAAAAQAAAABAAAACQAAAAEAAAAtAAAACQAAAAAAAAAIAAAAAAAAAAIAAAAAAAAA","118":"AAAAAAQAAAABAAAACQAAAAEAAAAtAAAACQAAAAAAAAAIAAAAAAAAAAIAAAAAAAAA","119":"AAAAAAQAAAABAAAACQAAAAEAAAAtAAAACQAAAAAAAAAIAAAAAAAAAAIAAAAAAAAA","120":"AAAAAAQAAAABAAAABAAAAAEAAAAJAAAAAQAAACgAAAAJAAAAAAAAAAEAAAAAAAAABwAAAAAAAAACAAAAAAAAAA==","121":"AAAAABQAAAABAAAAEwAAAAEAAAAFAAAAAQAAAAQAAAABAAAABAAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","122":"AAAAABQAAAABAAAAEwAAAAEAAAAFAAAAAQAAAAQAAAABAAAABAAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","123":"AAAAABQAAAABAAAAEwAAAAEAAAAEAAAAAQAAAAUAAAABAAAAAQAAAAEAAAAEAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","124":"AAAAABQAAAABAAAABAAAAAEAAAAQAAAAAQAAAAQAAAABAAAABAAAAAEAAAACAAAAAQAAAAQAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","125":"AAAAAAEAAAABAAAAAQAAAAEAAAAEAAAAAQAAAAQAAAABAAAABQAAAAEAAAATAAAAAQAAABQAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","126":"AAAAAAEAAAABAAAAAQAAAAEAAAAEAAAAAQAAAAQAAAABAAAABQAAAAEAAAATAAAAAQAAABQAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","127":"AAAAAAEAAAABAAAABAAAAAEAAAABAAAAAQAAAAUAAAABAAAABAAAAAEAAAATAAAAAQAAABQAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","128":"AAAAAAQAAAABAAAAAgAAAAEAAAAEAAAAAQAAAAQAAAABAAAAEAAAAAEAAAAEAAAAAQAAABQAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","129":"AAAAAAQAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","130":"AAAAAAQAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","131":"AAAAAAQAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","132":"AAAAAAQAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","133":"AAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAQAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","134":"AAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAQAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","135":"AAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAQAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","136":"AAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAQAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","137":"AAAAADwAAAAAAAAAAAAAAA==","138":"AAAAADwAAAAAAAAAAAAAAA==","139":"AAAAADwAAAAAAAAAAAAAAA==","140":"AAAAADwAAAAAAAAAAAAAAA==","141":"AAAAADwAAAACAAAAAAAAAA==","142":"AAAAADwAAAACAAAAAAAAAA==","143":"AAAAABIAAAABAAAAAQAAABQAAAABAAAAAQAAABIAAAACAAAAAAAAAP////8BAAAAAAAAAP////8BAAAAAAAAAA==","144":"AAAAAAsAAAABAAAADAAAAAEAAAAKAAAAAQAAAAwAAAABAAAACwAAAAIAAAAAAAAA/////wAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAA=","145":"AAAAABAAAAAAAAAAAAAAAA==","146":"AAAAABAAAAAAAAAAAAAAAA==","147":"AAAAABAAAAAAAAAAAAAAAA==","148":"AAAAABAAAAAAAAAAAAAAAA==","149":"AAAAABAAAAACAAAAAAAAAA==","150":"AAAAABAAAAACAAAAAAAAAA==","151":"AAAAABAAAAACAAAAAAAAAA==","152":"AAAAABAAAAACAAAAAAAAAA==","153":"AAAAABQAAAABAAAAEwAAAAEAAAAFAAAAAQAAAAQAAAABAAAABAAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAIAAAAAAAAAAgAAAAAAAAACAAAAAAAAAAIAAAAAAAAAAgAAAAAAAAACAAAAAAAAAA==","154":"AAAAABQAAAABAAAAEwAAAAEAAAAFAAAAAQAAAAQAAAABAAAABAAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAIAAAAAAAAAAgAAAAAAAAACAAAAAAAAAAIAAAAAAAAAAgAAAAAAAAACAAAAAAAAAA==","155":"AAAAABQAAAABAAAAEwAAAAEAAAAEAAAAAQAAAAUAAAABAAAAAQAAAAEAAAAEAAAAAQAAAAEAAAAAAAAAAAAAAAIAAAAAAAAAAgAAAAAAAAACAAAAAAAAAAIAAAAAAAAAAgAAAAAAAAACAAAAAAAAAA==","156":"AAAAABQAAAABAAAABAAAAAEAAAAQAAAAAQAAAAQAAAABAAAABAAAAAEAAAACAAAAAQAAAAQAAAAAAAAAAAAAAAIAAAAAAAAAAgAAAAAAAAACAAAAAAAAAAIAAAAAAAAAAgAAAAAAAAACAAAAAAAAAA==","157":"AAAAAAEAAAABAAAAAQAAAAEAAAAEAAAAAQAAAAQAAAABAAAABQAAAAEAAAATAAAAAQAAABQAAAAEAAAAAAAAAAIAAAAAAAAAAgAAAAAAAAACAAAAAAAAAAIAAAAAAAAAAgAAAAAAAAACAAAAAAAAAA==","158":"AAAAAAEAAAABAAAAAQAAAAEAAAAEAAAAAQAAAAQAAAABAAAABQAAAAEAAAATAAAAAQAAABQAAAAEAAAAAAAAAAIAAAAAAAAAAgAAAAAAAAACAAAAAAAAAAIAAAAAAAAAAgAAAAAAAAACAAAAAAAAAA==","159":"AAAAAAEAAAABAAAABAAAAAEAAAABAAAAAQAAAAUAAAABAAAABAAAAAEAAAATAAAAAQAAABQAAAAEAAAAAAAAAAIAAAAAAAAAAgAAAAAAAAACAAAAAAAAAAIAAAAAAAAAAgAAAAAAAAACAAAAAAAAAA==","160":"AAAAAAQAAAABAAAAAgAAAAEAAAAEAAAAAQAAAAQAAAABAAAAEAAAAAEAAAAEAAAAAQAAABQAAAAEAAAAAAAAAAIAAAAAAAAAAgAAAAAAAAACAAAAAAAAAAIAAAAAAAAAAgAAAAAAAAACAAAAAAAAAA==","161":"AAAAABQAAAABAAAABAAAAAEAAAATAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAFAAAAAQAAAAQAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAA==","162":"AAAAABQAAAABAAAABAAAAAEAAAATAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAFAAAAAQAAAAQAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAA==","163":"AAAAABQAAAABAAAABAAAAAEAAAAOAAAAAQAAAAQAAAABAAAAAQAAAAEAAAAHAAAAAQAAAAQAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAgAAAAAAAAABAAAAAAAAAA==","164":"AAAAABQAAAABAAAABAAAAAEAAAABAAAAAQAAAAYAAAABAAAACwAAAAEAAAANAAAAAAAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAA","165":"AAAAADwAAAAIAAAAAAAAAA==","166":"AAAAADwAAAAIAAAAAAAAAA==","167":"AAAAADwAAAAIAAAAAAAAAA==","168":"AAAAADwAAAAIAAAAAAAAAA==","169":"AAAAAAgAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAADAAAAAQAAAAUAAAABAAAABgAAAAAAAAAAAAAAAQAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAA=","170":"AAAAAAgAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAADAAAAAQAAAAUAAAABAAAABgAAAAAAAAAAAAAAAQAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAA=","171":"AAAAAAgAAAABAAAAAQAAAAEAAAACAAAAAQAAAAMAAAABAAAABgAAAAEAAAAGAAAAAAAAAAAAAAABAAAAAQAAAAEAAAAAAAAAAQAAAAAAAAACAAAAAAAAAAEAAAAAAAAA","172":"AAAAAAgAAAABAAAAAQAAAAEAAAADAAAAAQAAAAYAAAABAAAACQAAAAAAAAAAAAAAAwAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAQAAAAAAAAA=","173":"AAAAAB8AAAAIAAAAAAAAAA==","174":"AAAAAB8AAAAIAAAAAAAAAA==","175":"AAAAAB8AAAAIAAAAAAAAAA==","176":"AAAAAB8AAAAIAAAAAAAAAA==","177":"AAAAADwAAAAAAAAAAAAAAA==","178":"AAAAADwAAAAAAAAAAAAAAA==","179":"AAAAADwAAAAAAAAAAAAAAA==","180":"AAAAADwAAAAAAAAAAAAAAA==","181":"AAAAACgAAAABAAAABAAAAAEAAAAFAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAEAAAACAAAAAAAAAD/////AAAAAP////8AAAAA/////wAAAAD/////AAAAAP7///8AAAAA","182":"AAAAACgAAAABAAAABAAAAAEAAAAFAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAEAAAACAAAAAAAAAD/////AAAAAP////8AAAAA/////wAAAAD/////AAAAAP7///8AAAAA","183":"AAAAACgAAAABAAAABAAAAAEAAAAFAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAEAAAACAAAAAAAAAD/////AAAAAP////8AAAAA/////wAAAAD/////AAAAAP7///8AAAAA","184":"AAAAABkAAAABAAAABAAAAAEAAAALAAAAAQAAAAQAAAABAAAABQAAAAEAAAAGAAAACAAAAAAAAAD/////AAAAAP////8AAAAA/////wAAAAD/////AAAAAP7///8AAAAA","185":"AAAAAB8AAAAAAAAAAAAAAA==","186":"AAAAAB8AAAAAAAAAAAAAAA==","187":"AAAAAB8AAAAAAAAAAAAAAA==","188":"AAAAAB8AAAAAAAAAAAAAAA==","189":"AAAAAA8AAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAADAAAAAQAAAAUAAAAIAAAAAAAAAP//////////AAAAAP////8AAAAA/////wAAAAD+////AAAAAA==","190":"AAAAAA8AAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAADAAAAAQAAAAUAAAAIAAAAAAAAAP//////////AAAAAP////8AAAAA/////wAAAAD+////AAAAAA==","191":"AAAAAA8AAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAADAAAAAQAAAAUAAAAIAAAAAAAAAP//////////AAAAAP////8AAAAA/////wAAAAD+////AAAAAA==","192":"AAAAAAwAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAAFAAAAAQAAAAYAAAAIAAAAAAAAAP////8AAAAA//////////8AAAAA/////wAAAAD+////AAAAAA==","193":"AAAAABQAAAABAAAABAAAAAEAAAAOAAAAAQAAAAQAAAABAAAAAQAAAAEAAAADAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAMAAAAAAAAAAwAAAAAAAAADAAAAAAAAAAQAAAAAAAAAAwAAAAAAAAAEAAAAAAAAAA==","194":"AAAAABQAAAABAAAABAAAAAEAAAAOAAAAAQAAAAQAAAABAAAAAQAAAAEAAAADAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAMAAAAAAAAAAwAAAAAAAAADAAAAAAAAAAQAAAAAAAAAAwAAAAAAAAAEAAAAAAAAAA==","195":"AAAAABQAAAABAAAABAAAAAEAAAAOAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAAAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAwAAAAAAAAABAAAAAgAAAAAAAAADAAAAAAAAAAEAAAACAAAAAAAAAAQAAAAAAAAA","196":"AAAAABQAAAABAAAABAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAYAAAABAAAAAwAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAIAAAAAAAAAAgAAAAEAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAEAAAABAAAAAQAAAAAAAAABAAAAAAAAAAEAAAABAAAAAQAAAAIAAAAAAAAAAQAAAAAAAAACAAAAAAAAAA==","197":"AAAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAwAAAAEAAAABAAAAAQAAAAQAAAABAAAADgAAAAEAAAAEAAAAAQAAABQAAAAIAAAAAAAAAAQAAAAAAAAAAwAAAAAAAAAEAAAAAAAAAAMAAAAAAAAAAwAAAAAAAAADAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","198":"AAAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAwAAAAEAAAABAAAAAQAAAAQAAAABAAAADgAAAAEAAAAEAAAAAQAAABQAAAAIAAAAAAAAAAQAAAAAAAAAAwAAAAAAAAAEAAAAAAAAAAMAAAAAAAAAAwAAAAAAAAADAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","199":"AAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAA4AAAABAAAABAAAAAEAAAAUAAAACAAAAAAAAAAEAAAAAAAAAAIAAAABAAAAAAAAAAMAAAAAAAAAAgAAAAEAAAAAAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAwAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","200":"AAAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAABAAAAAEAAAAHAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAQAAAABAAAAFAAAAAgAAAAAAAAAAgAAAAAAAAABAAAAAgAAAAEAAAABAAAAAQAAAAAAAAABAAAAAAAAAAIAAAAAAAAAAgAAAAAAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAQAAAAIAAAAAAAAAAgAAAAAAAAA=","201":"AAAAABQAAAABAAAAEwAAAAEAAAAFAAAAAQAAAAQAAAABAAAABAAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","202":"AAAAABQAAAABAAAAEwAAAAEAAAAFAAAAAQAAAAQAAAABAAAABAAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","203":"AAAAABQAAAABAAAAEwAAAAEAAAAEAAAAAQAAAAUAAAABAAAAAQAAAAEAAAAEAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","204":"AAAAABQAAAABAAAABAAAAAEAAAAQAAAAAQAAAAQAAAABAAAABAAAAAEAAAACAAAAAQAAAAQAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","205":"AAAAAAQAAAABAAAABQAAAAEAAAAxAAAABgAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","206":"AAAAAAQAAAABAAAABQAAAAEAAAAxAAAABgAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","207":"AAAAAAQAAAABAAAABwAAAAEAAAAvAAAABgAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","208":"AAAAAAcAAAABAAAAEQAAAAEAAAAiAAAABgAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","209":"AAAAAAYAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAA==","210":"AAAAAAYAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAA==","211":"AAAAAAYAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAA==","212":"AAAAAAYAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAA==","213":"AAAAAAEAAAABAAAACgAAAAYAAAABAAAAAQAAAAAAAAA=","214":"AAAAAAEAAAABAAAACgAAAAYAAAABAAAAAQAAAAAAAAA=","215":"AAAAAAEAAAABAAAAAQAAAAkAAAAGAAAAAQAAAAAAAAABAAAAAAAAAA==","216":"AAAAAAEAAAABAAAAAgAAAAEAAAAHAAAABgAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","217":"AAAAACMAAAABAAAAEwAAAAEAAAAEAAAAAAAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","218":"AAAAACMAAAABAAAAEwAAAAEAAAAEAAAAAAAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","219":"AAAAACEAAAABAAAABgAAAAEAAAABAAAADQAAAAEAAAAEAAAAAAAAAAAAAAABAAAAAAAAAAEAAAD/////AAAAAAEAAAAAAAAA","220":"AAAAABQAAAABAAAADwAAAAEAAAAIAAAAAQAAAAIAAAABAAAACwAAAAAAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAA/////wAAAAA=","221":"AAAAAAQAAAABAAAABQAAAAEAAAAxAAAABgAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","222":"AAAAAAQAAAABAAAABQAAAAEAAAAxAAAABgAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","223":"AAAAAAQAAAABAAAAEwAAAAEAAAAPAAAAAQAAAAMAAAABAAAADwAAAAYAAAAAAAAAAQAAAAAAAAABAAAAAAAAAP////8AAAAAAQAAAAAAAAA=","224":"AAAAAAkAAAABAAAABgAAAAEAAAAEAAAAAQAAABAAAAABAAAAAQAAAAEAAAAFAAAAAQAAAAYAAAABAAAABgAAAAYAAAAAAAAAAQAAAAAAAAD/////AAAAAAEAAAAAAAAA/////wEAAAD/////AAAAAAEAAAAAAAAAAQAAAAAAAAA=","225":"AAAAAAoAAAABAAAAAQAAAAAAAAAAAAAAAQAAAAEAAAA=","226":"AAAAAAoAAAABAAAAAQAAAAAAAAAAAAAAAQAAAAEAAAA=","227":"AAAAAAkAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAA==","228":"AAAAAAcAAAABAAAAAgAAAAEAAAABAAAAAAAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","229":"AAAAAAEAAAABAAAACgAAAAYAAAABAAAAAQAAAAAAAAA=","230":"AAAAAAEAAAABAAAACgAAAAYAAAABAAAAAQAAAAAAAAA=","231":"AAAAAAEAAAABAAAAAQAAAAkAAAAGAAAAAQAAAAAAAAABAAAAAAAAAA==","232":"AAAAAAEAAAABAAAAAgAAAAEAAAAHAAAABgAAAAAAAAABAAAAAAAAAAEAAAAAAAAA","233":"AAAAABQAAAABAAAAEwAAAAEAAAAFAAAAAQAAAAQAAAABAAAABAAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","234":"AAAAABQAAAABAAAAEwAAAAEAAAAFAAAAAQAAAAQAAAABAAAABAAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","235":"AAAAABQAAAABAAAAEwAAAAEAAAAEAAAAAQAAAAUAAAABAAAAAQAAAAEAAAAEAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","236":"AAAAABQAAAABAAAABAAAAAEAAAAQAAAAAQAAAAQAAAABAAAABAAAAAEAAAACAAAAAQAAAAQAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","237":"AAAAAAEAAAABAAAAAQAAAAEAAAAEAAAAAQAAAAQAAAABAAAABQAAAAEAAAATAAAAAQAAABQAAAAGAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","238":"AAAAAAEAAAABAAAAAQAAAAEAAAAEAAAAAQAAAAQAAAABAAAABQAAAAEAAAATAAAAAQAAABQAAAAGAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","239":"AAAAAAEAAAABAAAABAAAAAEAAAABAAAAAQAAAAUAAAABAAAABAAAAAEAAAATAAAAAQAAABQAAAAGAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","240":"AAAAAAQAAAABAAAAAgAAAAEAAAAEAAAAAQAAAAQAAAABAAAAEAAAAAEAAAAEAAAAAQAAABQAAAAGAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","281":"AAAAAAEAAAAAAAAAAAAAAA==","282":"AAAAAAEAAAAAAAAAAAAAAA==","283":"AAAAAAEAAAAAAAAAAAAAAA==","284":"AAAAAAEAAAAAAAAAAAAAAA==","285":"AAAAAAEAAAABAAAAAAAAAA==","286":"AAAAAAEAAAABAAAAAAAAAA==","287":"AAAAAAEAAAABAAAAAAAAAA==","288":"AAAAAAEAAAABAAAAAAAAAA==","289":"AAAAAAIAAAAAAAAAAAAAAA==","290":"AAAAAAIAAAAAAAAAAAAAAA==","291":"AAAAAAIAAAAAAAAAAAAAAA==","292":"AAAAAAIAAAAAAAAAAAAAAA==","293":"AAAAAAIAAAABAAAAAAAAAA==","294":"AAAAAAIAAAABAAAAAAAAAA==","295":"AAAAAAIAAAABAAAAAAAAAA==","296":"AAAAAAIAAAABAAAAAAAAAA==","297":"AAAAAAEAAAAAAAAAAAAAAA==","298":"AAAAAAEAAAAAAAAAAAAAAA==","299":"AAAAAAEAAAAAAAAAAAAAAA==","300":"AAAAAAEAAAAAAAAAAAAAAA==","301":"AAAAAAEAAAABAAAAAAAAAA==","302":"AAAAAAEAAAABAAAAAAAAAA==","303":"AAAAAAEAAAABAAAAAAAAAA==","304":"AAAAAAEAAAABAAAAAAAAAA==","305":"AAAAAAIAAAAAAAAAAAAAAA==","306":"AAAAAAIAAAAAAAAAAAAAAA==","307":"AAAAAAIAAAAAAAAAAAAAAA==","308":"AAAAAAIAAAAAAAAAAAAAAA==","309":"AAAAAAIAAAABAAAAAAAAAA==","310":"AAAAAAIAAAABAAAAAAAAAA==","311":"AAAAAAIAAAABAAAAAAAAAA==","312":"AAAAAAIAAAABAAAAAAAAAA==","313":"AAAAAAEAAAAAAAAAAAAAAA==","314":"AAAAAAEAAAAAAAAAAAAAAA==","315":"AAAAAAEAAAAAAAAAAAAAAA==","316":"AAAAAAEAAAAAAAAAAAAAAA==","317":"AAAAAAEAAAACAAAAAAAAAA==","318":"AAAAAAEAAAACAAAAAAAAAA==","319":"AAAAAAEAAAACAAAAAAAAAA==","320":"AAAAAAEAAAACAAAAAAAAAA==","321":"AAAAABQAAAABAAAAEwAAAAEAAAAFAAAAAQAAAAQAAAABAAAABAAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","322":"AAAAABQAAAABAAAAEwAAAAEAAAAFAAAAAQAAAAQAAAABAAAABAAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","323":"AAAAABQAAAABAAAAEwAAAAEAAAAEAAAAAQAAAAUAAAABAAAAAQAAAAEAAAAEAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","324":"AAAAABQAAAABAAAABAAAAAEAAAAQAAAAAQAAAAQAAAABAAAABAAAAAEAAAACAAAAAQAAAAQAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","325":"AAAAAAEAAAABAAAAAQAAAAEAAAAEAAAAAQAAAAQAAAABAAAABQAAAAEAAAATAAAAAQAAABQAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","326":"AAAAAAEAAAABAAAAAQAAAAEAAAAEAAAAAQAAAAQAAAABAAAABQAAAAEAAAATAAAAAQAAABQAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","327":"AAAAAAEAAAABAAAABAAAAAEAAAABAAAAAQAAAAUAAAABAAAABAAAAAEAAAATAAAAAQAAABQAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","328":"AAAAAAQAAAABAAAAAgAAAAEAAAAEAAAAAQAAAAQAAAABAAAAEAAAAAEAAAAEAAAAAQAAABQAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","329":"AAAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAA==","330":"AAAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAA==","331":"AAAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAA==","332":"AAAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAA==","333":"AAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAAAAAA==","334":"AAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAAAAAA==","335":"AAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAAAAAA==","336":"AAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAAAAAA==","337":"AAAAABQAAAABAAAAEwAAAAEAAAAFAAAAAQAAAAQAAAABAAAABAAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","338":"AAAAABQAAAABAAAAEwAAAAEAAAAFAAAAAQAAAAQAAAABAAAABAAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","339":"AAAAABQAAAABAAAAEwAAAAEAAAAEAAAAAQAAAAUAAAABAAAAAQAAAAEAAAAEAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","340":"AAAAABQAAAABAAAABAAAAAEAAAAQAAAAAQAAAAQAAAABAAAABAAAAAEAAAACAAAAAQAAAAQAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","341":"AAAAAAEAAAABAAAAAQAAAAEAAAAEAAAAAQAAAAQAAAABAAAABQAAAAEAAAATAAAAAQAAABQAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","342":"AAAAAAEAAAABAAAAAQAAAAEAAAAEAAAAAQAAAAQAAAABAAAABQAAAAEAAAATAAAAAQAAABQAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","343":"AAAAAAEAAAABAAAABAAAAAEAAAABAAAAAQAAAAUAAAABAAAABAAAAAEAAAATAAAAAQAAABQAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","344":"AAAAAAQAAAABAAAAAgAAAAEAAAAEAAAAAQAAAAQAAAABAAAAEAAAAAEAAAAEAAAAAQAAABQAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","345":"AAAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAA==","346":"AAAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAA==","347":"AAAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAA==","348":"AAAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAA==","349":"AAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAAAAAA==","350":"AAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAAAAAA==","351":"AAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAAAAAA==","352":"AAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAAAAAA==","353":"AAAAABQAAAABAAAAEwAAAAEAAAAFAAAAAQAAAAQAAAABAAAABAAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","354":"AAAAABQAAAABAAAAEwAAAAEAAAAFAAAAAQAAAAQAAAABAAAABAAAAAEAAAABAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","355":"AAAAABQAAAABAAAAEwAAAAEAAAAEAAAAAQAAAAUAAAABAAAAAQAAAAEAAAAEAAAAAQAAAAEAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","356":"AAAAABQAAAABAAAABAAAAAEAAAAQAAAAAQAAAAQAAAABAAAABAAAAAEAAAACAAAAAQAAAAQAAAAAAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","357":"AAAAAAEAAAABAAAAAQAAAAEAAAAEAAAAAQAAAAQAAAABAAAABQAAAAEAAAATAAAAAQAAABQAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","358":"AAAAAAEAAAABAAAAAQAAAAEAAAAEAAAAAQAAAAQAAAABAAAABQAAAAEAAAATAAAAAQAAABQAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","359":"AAAAAAEAAAABAAAABAAAAAEAAAABAAAAAQAAAAUAAAABAAAABAAAAAEAAAATAAAAAQAAABQAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA==","360":"AAAAAAQAAAABAAAAAgAAAAEAAAAEAAAAAQAAAAQAAAABAAAAEAAAAAEAAAAEAAAAAQAAABQAAAACAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAA=="}})
\ No newline at end of file
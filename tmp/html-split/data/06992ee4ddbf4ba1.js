@@ -0,0 +1 @@
+types.shard("check-e","example",{"token":{"check-e":{"example":{"sample-1":{"token-1":{"tokencount":1},"token-2":{"tokencount":1}},"sample-2":{"token-2":{"tokencount":1},"token-3":{"tokencount":1},"token-4":{"tokencount":1}},"sample-3":{"token-4":{"tokencount":1},"token-5":{"tokencount":1}}}}},"tokeninfo":{},"result_curve_point":{"971":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":4},{"x":60,"y":4}],"972":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":4},{"x":60,"y":4}],"973":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":4},{"x":60,"y":4}],"975":[{"x":0,"y":0},{"x":40,"y":0},{"x":41,"y":2},{"x":50,"y":2},{"x":51,"y":3},{"x":55,"y":3},{"x":56,"y":4},{"x":60,"y":4}],"976":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":14,"y":4},{"x":15,"y":5},{"x":60,"y":5}],"977":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":14,"y":4},{"x":15,"y":5},{"x":60,"y":5}],"978":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":14,"y":4},{"x":15,"y":5},{"x":60,"y":5}],"980":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":19,"y":4},{"x":20,"y":5},{"x":60,"y":5}],"981":[{"x":0,"y":0},{"x":3,"y":0},{"x":4,"y":2},{"x":5,"y":2},{"x":6,"y":4},{"x":7,"y":4}],"982":[{"x":0,"y":0},{"x":3,"y":0},{"x":4,"y":2},{"x":5,"y":2},{"x":6,"y":4},{"x":7,"y":4}],"983":[{"x":0,"y":0},{"x":3,"y":0},{"x":4,"y":2},{"x":5,"y":2},{"x":6,"y":4},{"x":7,"y":4}],"985":[{"x":0,"y":0},{"x":3,"y":0},{"x":4,"y":2},{"x":5,"y":2},{"x":6,"y":4},{"x":7,"y":4}],"986":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":4},{"x":4,"y":5},{"x":7,"y":5}],"987":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":4},{"x":4,"y":5},{"x":7,"y":5}],"988":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":4},{"x":4,"y":5},{"x":7,"y":5}],"990":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":4},{"x":4,"y":5},{"x":7,"y":5}],"991":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":1},{"x":55,"y":1},{"x":56,"y":2},{"x":60,"y":2}],"992":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":1},{"x":55,"y":1},{"x":56,"y":2},{"x":60,"y":2}],"993":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":1},{"x":55,"y":1},{"x":56,"y":2},{"x":60,"y":2}],"995":[{"x":0,"y":0},{"x":40,"y":0},{"x":41,"y":1},{"x":45,"y":1},{"x":46,"y":2},{"x":60,"y":2}],"996":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":19,"y":4},{"x":20,"y":5},{"x":30,"y":5},{"x":31,"y":4},{"x":49,"y":4},{"x":50,"y":5},{"x":60,"y":5}],"997":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":19,"y":4},{"x":20,"y":5},{"x":30,"y":5},{"x":31,"y":4},{"x":49,"y":4},{"x":50,"y":5},{"x":60,"y":5}],"998":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":19,"y":4},{"x":20,"y":5},{"x":30,"y":5},{"x":31,"y":4},{"x":49,"y":4},{"x":50,"y":5},{"x":60,"y":5}],"1000":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":30,"y":4},{"x":31,"y":3},{"x":34,"y":3},{"x":35,"y":4},{"x":49,"y":4},{"x":50,"y":5},{"x":60,"y":5}],"1001":[{"x":0,"y":0},{"x":3,"y":0},{"x":4,"y":1},{"x":5,"y":1},{"x":6,"y":2},{"x":7,"y":2}],"1002":[{"x":0,"y":0},{"x":3,"y":0},{"x":4,"y":1},{"x":5,"y":1},{"x":6,"y":2},{"x":7,"y":2}],"1003":[{"x":0,"y":0},{"x":3,"y":0},{"x":4,"y":1},{"x":5,"y":1},{"x":6,"y":2},{"x":7,"y":2}],"1005":[{"x":0,"y":0},{"x":3,"y":0},{"x":4,"y":1},{"x":5,"y":1},{"x":6,"y":2},{"x":7,"y":2}],"1006":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":4},{"x":4,"y":5},{"x":7,"y":5}],"1007":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":4},{"x":4,"y":5},{"x":7,"y":5}],"1008":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":4},{"x":4,"y":5},{"x":7,"y":5}],"1010":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":4},{"x":4,"y":5},{"x":7,"y":5}],"1011":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":4},{"x":60,"y":4}],"1012":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":4},{"x":60,"y":4}],"1013":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":4},{"x":60,"y":4}],"1015":[{"x":0,"y":0},{"x":40,"y":0},{"x":41,"y":2},{"x":50,"y":2},{"x":51,"y":3},{"x":55,"y":3},{"x":56,"y":4},{"x":60,"y":4}],"1016":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":5},{"x":14,"y":5},{"x":15,"y":7},{"x":60,"y":7}],"1017":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":5},{"x":14,"y":5},{"x":15,"y":7},{"x":60,"y":7}],"1018":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":5},{"x":14,"y":5},{"x":15,"y":7},{"x":60,"y":7}],"1020":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":9,"y":4},{"x":10,"y":5},{"x":19,"y":5},{"x":20,"y":7},{"x":60,"y":7}]},"context_shard":{"check-e":{"example":{}}}})
\ No newline at end of file
@@ -0,0 +1 @@
+types.shard("check-g","example",{"token":{"check-g":{"example":{"sample-1":{"token-1":{"tokencount":2}}}}},"tokeninfo":{},"result_curve_point":{"1071":[{"x":0,"y":0},{"x":1,"y":0}],"1072":[{"x":0,"y":0},{"x":1,"y":0}],"1073":[{"x":0,"y":0},{"x":1,"y":0}],"1075":[{"x":0,"y":0},{"x":1,"y":0}],"1076":[{"x":0,"y":1},{"x":1,"y":1}],"1077":[{"x":0,"y":1},{"x":1,"y":1}],"1078":[{"x":0,"y":1},{"x":1,"y":1}],"1080":[{"x":0,"y":1},{"x":1,"y":1}],"1081":[{"x":0,"y":0},{"x":2,"y":0}],"1082":[{"x":0,"y":0},{"x":2,"y":0}],"1083":[{"x":0,"y":0},{"x":2,"y":0}],"1085":[{"x":0,"y":0},{"x":2,"y":0}],"1086":[{"x":0,"y":1},{"x":2,"y":1}],"1087":[{"x":0,"y":1},{"x":2,"y":1}],"1088":[{"x":0,"y":1},{"x":2,"y":1}],"1090":[{"x":0,"y":1},{"x":2,"y":1}],"1091":[{"x":0,"y":0},{"x":1,"y":0}],"1092":[{"x":0,"y":0},{"x":1,"y":0}],"1093":[{"x":0,"y":0},{"x":1,"y":0}],"1095":[{"x":0,"y":0},{"x":1,"y":0}],"1096":[{"x":0,"y":1},{"x":1,"y":1}],"1097":[{"x":0,"y":1},{"x":1,"y":1}],"1098":[{"x":0,"y":1},{"x":1,"y":1}],"1100":[{"x":0,"y":1},{"x":1,"y":1}],"1101":[{"x":0,"y":0},{"x":2,"y":0}],"1102":[{"x":0,"y":0},{"x":2,"y":0}],"1103":[{"x":0,"y":0},{"x":2,"y":0}],"1105":[{"x":0,"y":0},{"x":2,"y":0}],"1106":[{"x":0,"y":1},{"x":2,"y":1}],"1107":[{"x":0,"y":1},{"x":2,"y":1}],"1108":[{"x":0,"y":1},{"x":2,"y":1}],"1110":[{"x":0,"y":1},{"x":2,"y":1}],"1111":[{"x":0,"y":0},{"x":1,"y":0}],"1112":[{"x":0,"y":0},{"x":1,"y":0}],"1113":[{"x":0,"y":0},{"x":1,"y":0}],"1115":[{"x":0,"y":0},{"x":1,"y":0}],"1116":[{"x":0,"y":2},{"x":1,"y":2}],"1117":[{"x":0,"y":2},{"x":1,"y":2}],"1118":[{"x":0,"y":2},{"x":1,"y":2}],"1120":[{"x":0,"y":2},{"x":1,"y":2}]},"context_shard":{"check-g":{"example":{}}}})
\ No newline at end of file
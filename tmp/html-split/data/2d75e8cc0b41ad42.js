@@ -0,0 +1 @@
+types.shard("check-d","example",{"token":{"check-d":{"example":{"sample-1":{"token-1":{"tokencount":1}},"sample-2":{"token-2":{"tokencount":1}},"sample-3":{"token-3":{"tokencount":1}},"sample-4":{"token-4":{"tokencount":1}},"sample-5":{"token-1":{"tokencount":1},"token-2":{"tokencount":1},"token-3":{"tokencount":1},"token-4":{"tokencount":1},"token-5":{"tokencount":1},"token-6":{"tokencount":1}},"sample-6":{"token-7":{"tokencount":1}},"sample-7":{"token-8":{"tokencount":1}}}}},"tokeninfo":{},"result_curve_point":{"921":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"922":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"923":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":45,"y":2},{"x":46,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":53,"y":4},{"x":54,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"925":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":42,"y":2},{"x":43,"y":3},{"x":47,"y":3},{"x":48,"y":4},{"x":52,"y":4},{"x":53,"y":5},{"x":55,"y":5},{"x":56,"y":6},{"x":60,"y":6}],"926":[{"x":0,"y":6},{"x":4,"y":6},{"x":5,"y":7},{"x":10,"y":7},{"x":11,"y":8},{"x":60,"y":8}],"927":[{"x":0,"y":6},{"x":4,"y":6},{"x":5,"y":7},{"x":10,"y":7},{"x":11,"y":8},{"x":60,"y":8}],"928":[{"x":0,"y":6},{"x":4,"y":6},{"x":5,"y":7},{"x":12,"y":7},{"x":13,"y":8},{"x":60,"y":8}],"930":[{"x":0,"y":6},{"x":7,"y":6},{"x":8,"y":7},{"x":25,"y":7},{"x":26,"y":8},{"x":60,"y":8}],"931":[{"x":0,"y":0},{"x":6,"y":0},{"x":7,"y":1},{"x":8,"y":2},{"x":9,"y":3},{"x":10,"y":4},{"x":11,"y":5},{"x":12,"y":6}],"932":[{"x":0,"y":0},{"x":6,"y":0},{"x":7,"y":1},{"x":8,"y":2},{"x":9,"y":3},{"x":10,"y":4},{"x":11,"y":5},{"x":12,"y":6}],"933":[{"x":0,"y":0},{"x":6,"y":0},{"x":7,"y":1},{"x":8,"y":2},{"x":9,"y":3},{"x":10,"y":4},{"x":11,"y":5},{"x":12,"y":6}],"935":[{"x":0,"y":0},{"x":6,"y":0},{"x":7,"y":1},{"x":8,"y":2},{"x":9,"y":3},{"x":10,"y":4},{"x":11,"y":5},{"x":12,"y":6}],"936":[{"x":0,"y":6},{"x":1,"y":7},{"x":2,"y":8},{"x":12,"y":8}],"937":[{"x":0,"y":6},{"x":1,"y":7},{"x":2,"y":8},{"x":12,"y":8}],"938":[{"x":0,"y":6},{"x":1,"y":7},{"x":2,"y":7},{"x":3,"y":8},{"x":12,"y":8}],"940":[{"x":0,"y":6},{"x":1,"y":6},{"x":2,"y":7},{"x":4,"y":7},{"x":5,"y":8},{"x":12,"y":8}],"941":[{"x":0,"y":0},{"x":35,"y":0},{"x":36,"y":1},{"x":55,"y":1},{"x":56,"y":2},{"x":60,"y":2}],"942":[{"x":0,"y":0},{"x":35,"y":0},{"x":36,"y":1},{"x":55,"y":1},{"x":56,"y":2},{"x":60,"y":2}],"943":[{"x":0,"y":0},{"x":33,"y":0},{"x":34,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":42,"y":1},{"x":55,"y":1},{"x":56,"y":2},{"x":60,"y":2}],"945":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":36,"y":1},{"x":37,"y":2},{"x":45,"y":2},{"x":46,"y":3},{"x":48,"y":3},{"x":49,"y":2},{"x":60,"y":2}],"946":[{"x":0,"y":6},{"x":4,"y":6},{"x":5,"y":7},{"x":10,"y":7},{"x":11,"y":8},{"x":60,"y":8}],"947":[{"x":0,"y":6},{"x":4,"y":6},{"x":5,"y":7},{"x":10,"y":7},{"x":11,"y":8},{"x":60,"y":8}],"948":[{"x":0,"y":6},{"x":4,"y":6},{"x":5,"y":7},{"x":24,"y":7},{"x":25,"y":8},{"x":40,"y":8},{"x":41,"y":7},{"x":44,"y":7},{"x":45,"y":8},{"x":60,"y":8}],"950":[{"x":0,"y":6},{"x":9,"y":6},{"x":10,"y":7},{"x":16,"y":7},{"x":17,"y":6},{"x":21,"y":6},{"x":22,"y":7},{"x":38,"y":7},{"x":39,"y":6},{"x":40,"y":7},{"x":41,"y":6},{"x":46,"y":6},{"x":47,"y":7},{"x":53,"y":7},{"x":54,"y":8},{"x":60,"y":8}],"951":[{"x":0,"y":0},{"x":10,"y":0},{"x":11,"y":1},{"x":12,"y":2}],"952":[{"x":0,"y":0},{"x":10,"y":0},{"x":11,"y":1},{"x":12,"y":2}],"953":[{"x":0,"y":0},{"x":9,"y":0},{"x":10,"y":1},{"x":11,"y":1},{"x":12,"y":2}],"955":[{"x":0,"y":0},{"x":7,"y":0},{"x":8,"y":1},{"x":10,"y":1},{"x":11,"y":2},{"x":12,"y":2}],"956":[{"x":0,"y":6},{"x":1,"y":7},{"x":2,"y":8},{"x":12,"y":8}],"957":[{"x":0,"y":6},{"x":1,"y":7},{"x":2,"y":8},{"x":12,"y":8}],"958":[{"x":0,"y":6},{"x":1,"y":7},{"x":2,"y":7},{"x":3,"y":8},{"x":12,"y":8}],"960":[{"x":0,"y":6},{"x":1,"y":6},{"x":2,"y":7},{"x":4,"y":7},{"x":5,"y":8},{"x":12,"y":8}],"961":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"962":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"963":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":45,"y":2},{"x":46,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":53,"y":4},{"x":54,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"965":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":42,"y":2},{"x":43,"y":3},{"x":47,"y":3},{"x":48,"y":4},{"x":52,"y":4},{"x":53,"y":5},{"x":55,"y":5},{"x":56,"y":6},{"x":60,"y":6}],"966":[{"x":0,"y":6},{"x":1,"y":6},{"x":2,"y":7},{"x":3,"y":7},{"x":4,"y":8},{"x":8,"y":8},{"x":9,"y":9},{"x":13,"y":9},{"x":14,"y":10},{"x":19,"y":10},{"x":20,"y":11},{"x":39,"y":11},{"x":40,"y":12},{"x":60,"y":12}],"967":[{"x":0,"y":6},{"x":1,"y":6},{"x":2,"y":7},{"x":3,"y":7},{"x":4,"y":8},{"x":8,"y":8},{"x":9,"y":9},{"x":13,"y":9},{"x":14,"y":10},{"x":19,"y":10},{"x":20,"y":11},{"x":39,"y":11},{"x":40,"y":12},{"x":60,"y":12}],"968":[{"x":0,"y":6},{"x":1,"y":6},{"x":2,"y":7},{"x":6,"y":7},{"x":7,"y":8},{"x":8,"y":8},{"x":9,"y":9},{"x":14,"y":9},{"x":15,"y":10},{"x":19,"y":10},{"x":20,"y":11},{"x":39,"y":11},{"x":40,"y":12},{"x":60,"y":12}],"970":[{"x":0,"y":6},{"x":4,"y":6},{"x":5,"y":7},{"x":7,"y":7},{"x":8,"y":8},{"x":12,"y":8},{"x":13,"y":9},{"x":17,"y":9},{"x":18,"y":10},{"x":34,"y":10},{"x":35,"y":11},{"x":39,"y":11},{"x":40,"y":12},{"x":60,"y":12}]},"context_shard":{"check-d":{"example":{}}}})
\ No newline at end of file
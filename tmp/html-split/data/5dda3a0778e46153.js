@@ -0,0 +1 @@
+types.shard("check-a","example",{"token":{"check-a":{"example":{"sample-1":{"token-1":{"tokencount":1}},"sample-2":{"token-2":{"tokencount":1}},"sample-3":{"token-3":{"tokencount":1}},"sample-4":{"token-4":{"tokencount":1}},"sample-5":{"token-5":{"tokencount":1},"token-6":{"tokencount":1}},"sample-6":{"token-7":{"tokencount":1}},"sample-7":{"token-8":{"tokencount":1}}}}},"tokeninfo":{},"result_curve_point":{"771":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"772":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"773":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":45,"y":2},{"x":46,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":53,"y":4},{"x":54,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"775":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":42,"y":2},{"x":43,"y":3},{"x":47,"y":3},{"x":48,"y":4},{"x":52,"y":4},{"x":53,"y":5},{"x":55,"y":5},{"x":56,"y":6},{"x":60,"y":6}],"776":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":13,"y":5},{"x":14,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"777":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":13,"y":5},{"x":14,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"778":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":6,"y":3},{"x":7,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":14,"y":5},{"x":15,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"780":[{"x":0,"y":2},{"x":4,"y":2},{"x":5,"y":3},{"x":7,"y":3},{"x":8,"y":4},{"x":12,"y":4},{"x":13,"y":5},{"x":17,"y":5},{"x":18,"y":6},{"x":34,"y":6},{"x":35,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"781":[{"x":0,"y":0},{"x":2,"y":0},{"x":3,"y":1},{"x":4,"y":2},{"x":5,"y":3},{"x":6,"y":4},{"x":7,"y":5},{"x":8,"y":6}],"782":[{"x":0,"y":0},{"x":2,"y":0},{"x":3,"y":1},{"x":4,"y":2},{"x":5,"y":3},{"x":6,"y":4},{"x":7,"y":5},{"x":8,"y":6}],"783":[{"x":0,"y":0},{"x":2,"y":0},{"x":3,"y":1},{"x":4,"y":2},{"x":5,"y":3},{"x":6,"y":4},{"x":7,"y":5},{"x":8,"y":6}],"785":[{"x":0,"y":0},{"x":2,"y":0},{"x":3,"y":1},{"x":4,"y":2},{"x":5,"y":3},{"x":6,"y":4},{"x":7,"y":5},{"x":8,"y":6}],"786":[{"x":0,"y":2},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":5},{"x":4,"y":6},{"x":5,"y":7},{"x":6,"y":8},{"x":8,"y":8}],"787":[{"x":0,"y":2},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":5},{"x":4,"y":6},{"x":5,"y":7},{"x":6,"y":8},{"x":8,"y":8}],"788":[{"x":0,"y":2},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":5},{"x":4,"y":6},{"x":5,"y":7},{"x":6,"y":8},{"x":8,"y":8}],"790":[{"x":0,"y":2},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":5},{"x":4,"y":6},{"x":5,"y":7},{"x":6,"y":8},{"x":8,"y":8}],"791":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"792":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"793":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":45,"y":2},{"x":46,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":53,"y":4},{"x":54,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"795":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":42,"y":2},{"x":43,"y":3},{"x":47,"y":3},{"x":48,"y":4},{"x":52,"y":4},{"x":53,"y":5},{"x":55,"y":5},{"x":56,"y":6},{"x":60,"y":6}],"796":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":13,"y":5},{"x":14,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"797":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":13,"y":5},{"x":14,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"798":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":6,"y":3},{"x":7,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":14,"y":5},{"x":15,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"800":[{"x":0,"y":2},{"x":4,"y":2},{"x":5,"y":3},{"x":7,"y":3},{"x":8,"y":4},{"x":12,"y":4},{"x":13,"y":5},{"x":17,"y":5},{"x":18,"y":6},{"x":34,"y":6},{"x":35,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"801":[{"x":0,"y":0},{"x":2,"y":0},{"x":3,"y":1},{"x":4,"y":2},{"x":5,"y":3},{"x":6,"y":4},{"x":7,"y":5},{"x":8,"y":6}],"802":[{"x":0,"y":0},{"x":2,"y":0},{"x":3,"y":1},{"x":4,"y":2},{"x":5,"y":3},{"x":6,"y":4},{"x":7,"y":5},{"x":8,"y":6}],"803":[{"x":0,"y":0},{"x":2,"y":0},{"x":3,"y":1},{"x":4,"y":2},{"x":5,"y":3},{"x":6,"y":4},{"x":7,"y":5},{"x":8,"y":6}],"805":[{"x":0,"y":0},{"x":2,"y":0},{"x":3,"y":1},{"x":4,"y":2},{"x":5,"y":3},{"x":6,"y":4},{"x":7,"y":5},{"x":8,"y":6}],"806":[{"x":0,"y":2},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":5},{"x":4,"y":6},{"x":5,"y":7},{"x":6,"y":8},{"x":8,"y":8}],"807":[{"x":0,"y":2},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":5},{"x":4,"y":6},{"x":5,"y":7},{"x":6,"y":8},{"x":8,"y":8}],"808":[{"x":0,"y":2},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":5},{"x":4,"y":6},{"x":5,"y":7},{"x":6,"y":8},{"x":8,"y":8}],"810":[{"x":0,"y":2},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":5},{"x":4,"y":6},{"x":5,"y":7},{"x":6,"y":8},{"x":8,"y":8}],"811":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"812":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"813":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":45,"y":2},{"x":46,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":53,"y":4},{"x":54,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"815":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":42,"y":2},{"x":43,"y":3},{"x":47,"y":3},{"x":48,"y":4},{"x":52,"y":4},{"x":53,"y":5},{"x":55,"y":5},{"x":56,"y":6},{"x":60,"y":6}],"816":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":13,"y":5},{"x":14,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"817":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":13,"y":5},{"x":14,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"818":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":6,"y":3},{"x":7,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":14,"y":5},{"x":15,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"820":[{"x":0,"y":2},{"x":4,"y":2},{"x":5,"y":3},{"x":7,"y":3},{"x":8,"y":4},{"x":12,"y":4},{"x":13,"y":5},{"x":17,"y":5},{"x":18,"y":6},{"x":34,"y":6},{"x":35,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}]},"context_shard":{"check-a":{"example":{}}}})
\ No newline at end of file
@@ -0,0 +1 @@
+types.shard("check-b","example",{"token":{"check-b":{"example":{"sample-1":{"token-1":{"tokencount":2}},"sample-2":{"token-2":{"tokencount":2}},"sample-3":{"token-3":{"tokencount":2}},"sample-4":{"token-4":{"tokencount":2}},"sample-5":{"token-5":{"tokencount":2},"token-6":{"tokencount":2}},"sample-6":{"token-7":{"tokencount":2}},"sample-7":{"token-8":{"tokencount":2}}}}},"tokeninfo":{},"result_curve_point":{"821":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"822":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"823":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":45,"y":2},{"x":46,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":53,"y":4},{"x":54,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"825":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":42,"y":2},{"x":43,"y":3},{"x":47,"y":3},{"x":48,"y":4},{"x":52,"y":4},{"x":53,"y":5},{"x":55,"y":5},{"x":56,"y":6},{"x":60,"y":6}],"826":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":13,"y":5},{"x":14,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"827":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":13,"y":5},{"x":14,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"828":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":6,"y":3},{"x":7,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":14,"y":5},{"x":15,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"830":[{"x":0,"y":2},{"x":4,"y":2},{"x":5,"y":3},{"x":7,"y":3},{"x":8,"y":4},{"x":12,"y":4},{"x":13,"y":5},{"x":17,"y":5},{"x":18,"y":6},{"x":34,"y":6},{"x":35,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"831":[{"x":0,"y":0},{"x":4,"y":0},{"x":5,"y":1},{"x":6,"y":1},{"x":7,"y":2},{"x":8,"y":2},{"x":9,"y":3},{"x":10,"y":3},{"x":11,"y":4},{"x":12,"y":4},{"x":13,"y":5},{"x":14,"y":5},{"x":15,"y":6},{"x":16,"y":6}],"832":[{"x":0,"y":0},{"x":4,"y":0},{"x":5,"y":1},{"x":6,"y":1},{"x":7,"y":2},{"x":8,"y":2},{"x":9,"y":3},{"x":10,"y":3},{"x":11,"y":4},{"x":12,"y":4},{"x":13,"y":5},{"x":14,"y":5},{"x":15,"y":6},{"x":16,"y":6}],"833":[{"x":0,"y":0},{"x":4,"y":0},{"x":5,"y":1},{"x":6,"y":1},{"x":7,"y":2},{"x":8,"y":2},{"x":9,"y":3},{"x":10,"y":3},{"x":11,"y":4},{"x":12,"y":4},{"x":13,"y":5},{"x":14,"y":5},{"x":15,"y":6},{"x":16,"y":6}],"835":[{"x":0,"y":0},{"x":4,"y":0},{"x":5,"y":1},{"x":6,"y":1},{"x":7,"y":2},{"x":8,"y":2},{"x":9,"y":3},{"x":10,"y":3},{"x":11,"y":4},{"x":12,"y":4},{"x":13,"y":5},{"x":14,"y":5},{"x":15,"y":6},{"x":16,"y":6}],"836":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":5,"y":4},{"x":6,"y":5},{"x":7,"y":5},{"x":8,"y":6},{"x":9,"y":6},{"x":10,"y":7},{"x":11,"y":7},{"x":12,"y":8},{"x":16,"y":8}],"837":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":5,"y":4},{"x":6,"y":5},{"x":7,"y":5},{"x":8,"y":6},{"x":9,"y":6},{"x":10,"y":7},{"x":11,"y":7},{"x":12,"y":8},{"x":16,"y":8}],"838":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":5,"y":4},{"x":6,"y":5},{"x":7,"y":5},{"x":8,"y":6},{"x":9,"y":6},{"x":10,"y":7},{"x":11,"y":7},{"x":12,"y":8},{"x":16,"y":8}],"840":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":5,"y":4},{"x":6,"y":5},{"x":7,"y":5},{"x":8,"y":6},{"x":9,"y":6},{"x":10,"y":7},{"x":11,"y":7},{"x":12,"y":8},{"x":16,"y":8}],"841":[{"x":0,"y":0},{"x":60,"y":0}],"842":[{"x":0,"y":0},{"x":60,"y":0}],"843":[{"x":0,"y":0},{"x":60,"y":0}],"845":[{"x":0,"y":0},{"x":60,"y":0}],"846":[{"x":0,"y":2},{"x":60,"y":2}],"847":[{"x":0,"y":2},{"x":60,"y":2}],"848":[{"x":0,"y":2},{"x":18,"y":2},{"x":19,"y":1},{"x":20,"y":2},{"x":40,"y":2},{"x":41,"y":1},{"x":42,"y":2},{"x":60,"y":2}],"850":[{"x":0,"y":2},{"x":11,"y":2},{"x":12,"y":1},{"x":24,"y":1},{"x":25,"y":2},{"x":35,"y":2},{"x":36,"y":1},{"x":48,"y":1},{"x":49,"y":2},{"x":60,"y":2}],"851":[{"x":0,"y":0},{"x":16,"y":0}],"852":[{"x":0,"y":0},{"x":16,"y":0}],"853":[{"x":0,"y":0},{"x":16,"y":0}],"855":[{"x":0,"y":0},{"x":16,"y":0}],"856":[{"x":0,"y":2},{"x":16,"y":2}],"857":[{"x":0,"y":2},{"x":16,"y":2}],"858":[{"x":0,"y":2},{"x":16,"y":2}],"860":[{"x":0,"y":2},{"x":16,"y":2}],"861":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":2},{"x":40,"y":2},{"x":41,"y":4},{"x":46,"y":4},{"x":47,"y":6},{"x":51,"y":6},{"x":52,"y":8},{"x":56,"y":8},{"x":57,"y":10},{"x":58,"y":10},{"x":59,"y":12},{"x":60,"y":12}],"862":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":2},{"x":40,"y":2},{"x":41,"y":4},{"x":46,"y":4},{"x":47,"y":6},{"x":51,"y":6},{"x":52,"y":8},{"x":56,"y":8},{"x":57,"y":10},{"x":58,"y":10},{"x":59,"y":12},{"x":60,"y":12}],"863":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":2},{"x":40,"y":2},{"x":41,"y":4},{"x":45,"y":4},{"x":46,"y":6},{"x":51,"y":6},{"x":52,"y":8},{"x":53,"y":8},{"x":54,"y":10},{"x":58,"y":10},{"x":59,"y":12},{"x":60,"y":12}],"865":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":2},{"x":25,"y":2},{"x":26,"y":4},{"x":42,"y":4},{"x":43,"y":6},{"x":47,"y":6},{"x":48,"y":8},{"x":52,"y":8},{"x":53,"y":10},{"x":55,"y":10},{"x":56,"y":12},{"x":60,"y":12}],"866":[{"x":0,"y":4},{"x":1,"y":4},{"x":2,"y":6},{"x":3,"y":6},{"x":4,"y":8},{"x":8,"y":8},{"x":9,"y":10},{"x":13,"y":10},{"x":14,"y":12},{"x":19,"y":12},{"x":20,"y":14},{"x":39,"y":14},{"x":40,"y":16},{"x":60,"y":16}],"867":[{"x":0,"y":4},{"x":1,"y":4},{"x":2,"y":6},{"x":3,"y":6},{"x":4,"y":8},{"x":8,"y":8},{"x":9,"y":10},{"x":13,"y":10},{"x":14,"y":12},{"x":19,"y":12},{"x":20,"y":14},{"x":39,"y":14},{"x":40,"y":16},{"x":60,"y":16}],"868":[{"x":0,"y":4},{"x":1,"y":4},{"x":2,"y":6},{"x":6,"y":6},{"x":7,"y":8},{"x":8,"y":8},{"x":9,"y":10},{"x":14,"y":10},{"x":15,"y":12},{"x":19,"y":12},{"x":20,"y":14},{"x":39,"y":14},{"x":40,"y":16},{"x":60,"y":16}],"870":[{"x":0,"y":4},{"x":4,"y":4},{"x":5,"y":6},{"x":7,"y":6},{"x":8,"y":8},{"x":12,"y":8},{"x":13,"y":10},{"x":17,"y":10},{"x":18,"y":12},{"x":34,"y":12},{"x":35,"y":14},{"x":39,"y":14},{"x":40,"y":16},{"x":60,"y":16}]},"context_shard":{"check-b":{"example":{}}}})
\ No newline at end of file
@@ -0,0 +1 @@
+types.shard("check-f","example",{"token":{"check-f":{"example":{"sample-1":{"token-1":{"tokencount":1},"token-2":{"tokencount":1}},"sample-2":{"token-2":{"tokencount":7},"token-3":{"tokencount":1},"token-4":{"tokencount":1}},"sample-3":{"token-4":{"tokencount":7},"token-5":{"tokencount":1}}}}},"tokeninfo":{},"result_curve_point":{"1021":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":4},{"x":60,"y":4}],"1022":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":4},{"x":60,"y":4}],"1023":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":4},{"x":60,"y":4}],"1025":[{"x":0,"y":0},{"x":40,"y":0},{"x":41,"y":2},{"x":50,"y":2},{"x":51,"y":3},{"x":55,"y":3},{"x":56,"y":4},{"x":60,"y":4}],"1026":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":14,"y":4},{"x":15,"y":5},{"x":60,"y":5}],"1027":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":14,"y":4},{"x":15,"y":5},{"x":60,"y":5}],"1028":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":14,"y":4},{"x":15,"y":5},{"x":60,"y":5}],"1030":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":19,"y":4},{"x":20,"y":5},{"x":60,"y":5}],"1031":[{"x":0,"y":0},{"x":9,"y":0},{"x":10,"y":2},{"x":17,"y":2},{"x":18,"y":4},{"x":19,"y":4}],"1032":[{"x":0,"y":0},{"x":9,"y":0},{"x":10,"y":2},{"x":17,"y":2},{"x":18,"y":4},{"x":19,"y":4}],"1033":[{"x":0,"y":0},{"x":9,"y":0},{"x":10,"y":2},{"x":17,"y":2},{"x":18,"y":4},{"x":19,"y":4}],"1035":[{"x":0,"y":0},{"x":9,"y":0},{"x":10,"y":2},{"x":17,"y":2},{"x":18,"y":4},{"x":19,"y":4}],"1036":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":9,"y":4},{"x":10,"y":5},{"x":19,"y":5}],"1037":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":9,"y":4},{"x":10,"y":5},{"x":19,"y":5}],"1038":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":9,"y":4},{"x":10,"y":5},{"x":19,"y":5}],"1040":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":9,"y":4},{"x":10,"y":5},{"x":19,"y":5}],"1041":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":1},{"x":55,"y":1},{"x":56,"y":2},{"x":60,"y":2}],"1042":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":1},{"x":55,"y":1},{"x":56,"y":2},{"x":60,"y":2}],"1043":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":1},{"x":55,"y":1},{"x":56,"y":2},{"x":60,"y":2}],"1045":[{"x":0,"y":0},{"x":40,"y":0},{"x":41,"y":1},{"x":50,"y":1},{"x":51,"y":2},{"x":60,"y":2}],"1046":[{"x":0,"y":3},{"x":14,"y":3},{"x":15,"y":4},{"x":30,"y":4},{"x":31,"y":3},{"x":44,"y":3},{"x":45,"y":4},{"x":60,"y":4}],"1047":[{"x":0,"y":3},{"x":14,"y":3},{"x":15,"y":4},{"x":30,"y":4},{"x":31,"y":3},{"x":44,"y":3},{"x":45,"y":4},{"x":60,"y":4}],"1048":[{"x":0,"y":3},{"x":14,"y":3},{"x":15,"y":4},{"x":30,"y":4},{"x":31,"y":3},{"x":44,"y":3},{"x":45,"y":4},{"x":60,"y":4}],"1050":[{"x":0,"y":3},{"x":14,"y":3},{"x":15,"y":4},{"x":30,"y":4},{"x":31,"y":3},{"x":44,"y":3},{"x":45,"y":4},{"x":60,"y":4}],"1051":[{"x":0,"y":0},{"x":9,"y":0},{"x":10,"y":1},{"x":17,"y":1},{"x":18,"y":2},{"x":19,"y":2}],"1052":[{"x":0,"y":0},{"x":9,"y":0},{"x":10,"y":1},{"x":17,"y":1},{"x":18,"y":2},{"x":19,"y":2}],"1053":[{"x":0,"y":0},{"x":9,"y":0},{"x":10,"y":1},{"x":17,"y":1},{"x":18,"y":2},{"x":19,"y":2}],"1055":[{"x":0,"y":0},{"x":9,"y":0},{"x":10,"y":1},{"x":17,"y":1},{"x":18,"y":2},{"x":19,"y":2}],"1056":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":19,"y":4}],"1057":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":19,"y":4}],"1058":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":19,"y":4}],"1060":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":19,"y":4}],"1061":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":10},{"x":60,"y":10}],"1062":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":10},{"x":60,"y":10}],"1063":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":10},{"x":60,"y":10}],"1065":[{"x":0,"y":0},{"x":40,"y":0},{"x":41,"y":2},{"x":50,"y":2},{"x":51,"y":9},{"x":55,"y":9},{"x":56,"y":10},{"x":60,"y":10}],"1066":[{"x":0,"y":9},{"x":4,"y":9},{"x":5,"y":17},{"x":14,"y":17},{"x":15,"y":19},{"x":60,"y":19}],"1067":[{"x":0,"y":9},{"x":4,"y":9},{"x":5,"y":17},{"x":14,"y":17},{"x":15,"y":19},{"x":60,"y":19}],"1068":[{"x":0,"y":9},{"x":4,"y":9},{"x":5,"y":17},{"x":14,"y":17},{"x":15,"y":19},{"x":60,"y":19}],"1070":[{"x":0,"y":9},{"x":4,"y":9},{"x":5,"y":10},{"x":9,"y":10},{"x":10,"y":17},{"x":19,"y":17},{"x":20,"y":19},{"x":60,"y":19}]},"context_shard":{"check-f":{"example":{}}}})
\ No newline at end of file
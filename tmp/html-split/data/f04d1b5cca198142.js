@@ -0,0 +1 @@
+types.shard("check-c","example",{"token":{"check-c":{"example":{"sample-1":{"token-1":{"tokencount":1}},"sample-2":{"token-1":{"tokencount":1},"token-2":{"tokencount":1}},"sample-3":{"token-1":{"tokencount":1},"token-2":{"tokencount":1},"token-3":{"tokencount":1}},"sample-4":{"token-1":{"tokencount":1},"token-2":{"tokencount":1},"token-3":{"tokencount":1},"token-4":{"tokencount":1}},"sample-5":{"token-1":{"tokencount":1},"token-2":{"tokencount":1},"token-3":{"tokencount":1},"token-4":{"tokencount":1},"token-5":{"tokencount":1},"token-6":{"tokencount":1}},"sample-6":{"token-1":{"tokencount":1},"token-2":{"tokencount":1},"token-3":{"tokencount":1},"token-4":{"tokencount":1},"token-5":{"tokencount":1},"token-6":{"tokencount":1},"token-7":{"tokencount":1}},"sample-7":{"token-1":{"tokencount":1},"token-2":{"tokencount":1},"token-3":{"tokencount":1},"token-4":{"tokencount":1},"token-5":{"tokencount":1},"token-6":{"tokencount":1},"token-7":{"tokencount":1},"token-8":{"tokencount":1}}}}},"tokeninfo":{},"result_curve_point":{"871":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":45,"y":2},{"x":46,"y":3},{"x":47,"y":3},{"x":48,"y":4},{"x":49,"y":4},{"x":50,"y":6},{"x":55,"y":6},{"x":56,"y":7},{"x":60,"y":7}],"872":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":45,"y":2},{"x":46,"y":3},{"x":47,"y":3},{"x":48,"y":4},{"x":49,"y":4},{"x":50,"y":6},{"x":55,"y":6},{"x":56,"y":7},{"x":60,"y":7}],"873":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":40,"y":2},{"x":41,"y":3},{"x":45,"y":3},{"x":46,"y":4},{"x":47,"y":4},{"x":48,"y":6},{"x":55,"y":6},{"x":56,"y":7},{"x":60,"y":7}],"875":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":2},{"x":25,"y":2},{"x":26,"y":3},{"x":27,"y":3},{"x":28,"y":4},{"x":34,"y":4},{"x":35,"y":6},{"x":46,"y":6},{"x":47,"y":7},{"x":60,"y":7}],"876":[{"x":0,"y":8},{"x":60,"y":8}],"877":[{"x":0,"y":8},{"x":60,"y":8}],"878":[{"x":0,"y":8},{"x":60,"y":8}],"880":[{"x":0,"y":8},{"x":60,"y":8}],"881":[{"x":0,"y":0},{"x":8,"y":0},{"x":9,"y":1},{"x":10,"y":2},{"x":11,"y":2},{"x":12,"y":3},{"x":14,"y":3},{"x":15,"y":4},{"x":18,"y":4},{"x":19,"y":6},{"x":24,"y":6},{"x":25,"y":7},{"x":31,"y":7}],"882":[{"x":0,"y":0},{"x":8,"y":0},{"x":9,"y":1},{"x":10,"y":2},{"x":11,"y":2},{"x":12,"y":3},{"x":14,"y":3},{"x":15,"y":4},{"x":18,"y":4},{"x":19,"y":6},{"x":24,"y":6},{"x":25,"y":7},{"x":31,"y":7}],"883":[{"x":0,"y":0},{"x":8,"y":0},{"x":9,"y":1},{"x":10,"y":2},{"x":11,"y":3},{"x":13,"y":3},{"x":14,"y":4},{"x":17,"y":4},{"x":18,"y":6},{"x":24,"y":6},{"x":25,"y":7},{"x":31,"y":7}],"885":[{"x":0,"y":0},{"x":8,"y":0},{"x":9,"y":3},{"x":10,"y":3},{"x":11,"y":4},{"x":14,"y":4},{"x":15,"y":6},{"x":21,"y":6},{"x":22,"y":7},{"x":31,"y":7}],"886":[{"x":0,"y":8},{"x":31,"y":8}],"887":[{"x":0,"y":8},{"x":31,"y":8}],"888":[{"x":0,"y":8},{"x":31,"y":8}],"890":[{"x":0,"y":8},{"x":31,"y":8}],"891":[{"x":0,"y":0},{"x":60,"y":0}],"892":[{"x":0,"y":0},{"x":60,"y":0}],"893":[{"x":0,"y":0},{"x":60,"y":0}],"895":[{"x":0,"y":0},{"x":60,"y":0}],"896":[{"x":0,"y":8},{"x":40,"y":8},{"x":41,"y":7},{"x":45,"y":7},{"x":46,"y":6},{"x":51,"y":6},{"x":52,"y":5},{"x":53,"y":5},{"x":54,"y":4},{"x":55,"y":4},{"x":56,"y":2},{"x":60,"y":2}],"897":[{"x":0,"y":8},{"x":40,"y":8},{"x":41,"y":7},{"x":45,"y":7},{"x":46,"y":6},{"x":51,"y":6},{"x":52,"y":5},{"x":53,"y":5},{"x":54,"y":4},{"x":55,"y":4},{"x":56,"y":2},{"x":60,"y":2}],"898":[{"x":0,"y":8},{"x":40,"y":8},{"x":41,"y":7},{"x":45,"y":7},{"x":46,"y":6},{"x":51,"y":6},{"x":52,"y":5},{"x":53,"y":5},{"x":54,"y":4},{"x":55,"y":4},{"x":56,"y":2},{"x":60,"y":2}],"900":[{"x":0,"y":8},{"x":25,"y":8},{"x":26,"y":7},{"x":30,"y":7},{"x":31,"y":6},{"x":42,"y":6},{"x":43,"y":5},{"x":47,"y":5},{"x":48,"y":4},{"x":53,"y":4},{"x":54,"y":2},{"x":60,"y":2}],"901":[{"x":0,"y":0},{"x":31,"y":0}],"902":[{"x":0,"y":0},{"x":31,"y":0}],"903":[{"x":0,"y":0},{"x":31,"y":0}],"905":[{"x":0,"y":0},{"x":31,"y":0}],"906":[{"x":0,"y":8},{"x":15,"y":8},{"x":16,"y":7},{"x":17,"y":6},{"x":18,"y":6},{"x":19,"y":5},{"x":21,"y":5},{"x":22,"y":4},{"x":25,"y":4},{"x":26,"y":2},{"x":31,"y":2}],"907":[{"x":0,"y":8},{"x":15,"y":8},{"x":16,"y":7},{"x":17,"y":6},{"x":18,"y":6},{"x":19,"y":5},{"x":21,"y":5},{"x":22,"y":4},{"x":25,"y":4},{"x":26,"y":2},{"x":31,"y":2}],"908":[{"x":0,"y":8},{"x":15,"y":8},{"x":16,"y":7},{"x":17,"y":6},{"x":18,"y":6},{"x":19,"y":5},{"x":21,"y":5},{"x":22,"y":4},{"x":25,"y":4},{"x":26,"y":2},{"x":31,"y":2}],"910":[{"x":0,"y":8},{"x":12,"y":8},{"x":13,"y":7},{"x":14,"y":7},{"x":15,"y":6},{"x":16,"y":5},{"x":18,"y":5},{"x":19,"y":4},{"x":24,"y":4},{"x":25,"y":2},{"x":31,"y":2}],"911":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":40,"y":2},{"x":41,"y":3},{"x":45,"y":3},{"x":46,"y":6},{"x":47,"y":6},{"x":48,"y":9},{"x":51,"y":9},{"x":52,"y":12},{"x":53,"y":12},{"x":54,"y":16},{"x":56,"y":16},{"x":57,"y":19},{"x":58,"y":19},{"x":59,"y":23},{"x":60,"y":23}],"912":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":40,"y":2},{"x":41,"y":3},{"x":45,"y":3},{"x":46,"y":6},{"x":47,"y":6},{"x":48,"y":9},{"x":51,"y":9},{"x":52,"y":12},{"x":53,"y":12},{"x":54,"y":16},{"x":56,"y":16},{"x":57,"y":19},{"x":58,"y":19},{"x":59,"y":23},{"x":60,"y":23}],"913":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":40,"y":2},{"x":41,"y":5},{"x":42,"y":5},{"x":43,"y":6},{"x":45,"y":6},{"x":46,"y":7},{"x":47,"y":7},{"x":48,"y":10},{"x":50,"y":10},{"x":51,"y":11},{"x":52,"y":13},{"x":53,"y":13},{"x":54,"y":16},{"x":55,"y":16},{"x":56,"y":17},{"x":57,"y":19},{"x":58,"y":19},{"x":59,"y":23},{"x":60,"y":23}],"915":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":2},{"x":25,"y":2},{"x":26,"y":4},{"x":27,"y":5},{"x":28,"y":6},{"x":29,"y":6},{"x":30,"y":7},{"x":31,"y":7},{"x":32,"y":8},{"x":33,"y":8},{"x":34,"y":9},{"x":40,"y":9},{"x":41,"y":10},{"x":44,"y":10},{"x":45,"y":11},{"x":46,"y":12},{"x":47,"y":13},{"x":48,"y":14},{"x":49,"y":14},{"x":50,"y":15},{"x":51,"y":15},{"x":52,"y":16},{"x":53,"y":17},{"x":54,"y":18},{"x":55,"y":20},{"x":56,"y":20},{"x":57,"y":21},{"x":58,"y":21},{"x":59,"y":23},{"x":60,"y":23}],"916":[{"x":0,"y":8},{"x":1,"y":8},{"x":2,"y":12},{"x":3,"y":12},{"x":4,"y":15},{"x":6,"y":15},{"x":7,"y":19},{"x":8,"y":19},{"x":9,"y":22},{"x":12,"y":22},{"x":13,"y":25},{"x":14,"y":25},{"x":15,"y":28},{"x":19,"y":28},{"x":20,"y":29},{"x":34,"y":29},{"x":35,"y":30},{"x":39,"y":30},{"x":40,"y":31},{"x":60,"y":31}],"917":[{"x":0,"y":8},{"x":1,"y":8},{"x":2,"y":12},{"x":3,"y":12},{"x":4,"y":15},{"x":6,"y":15},{"x":7,"y":19},{"x":8,"y":19},{"x":9,"y":22},{"x":12,"y":22},{"x":13,"y":25},{"x":14,"y":25},{"x":15,"y":28},{"x":19,"y":28},{"x":20,"y":29},{"x":34,"y":29},{"x":35,"y":30},{"x":39,"y":30},{"x":40,"y":31},{"x":60,"y":31}],"918":[{"x":0,"y":8},{"x":1,"y":8},{"x":2,"y":12},{"x":3,"y":12},{"x":4,"y":14},{"x":5,"y":15},{"x":6,"y":15},{"x":7,"y":18},{"x":8,"y":18},{"x":9,"y":20},{"x":10,"y":21},{"x":12,"y":21},{"x":13,"y":24},{"x":14,"y":24},{"x":15,"y":25},{"x":17,"y":25},{"x":18,"y":26},{"x":19,"y":26},{"x":20,"y":29},{"x":34,"y":29},{"x":35,"y":30},{"x":39,"y":30},{"x":40,"y":31},{"x":60,"y":31}],"920":[{"x":0,"y":8},{"x":1,"y":8},{"x":2,"y":10},{"x":4,"y":10},{"x":5,"y":11},{"x":6,"y":13},{"x":7,"y":14},{"x":8,"y":15},{"x":9,"y":16},{"x":10,"y":16},{"x":11,"y":17},{"x":12,"y":17},{"x":13,"y":19},{"x":14,"y":19},{"x":15,"y":21},{"x":19,"y":21},{"x":20,"y":23},{"x":27,"y":23},{"x":28,"y":24},{"x":30,"y":24},{"x":31,"y":25},{"x":32,"y":25},{"x":33,"y":26},{"x":34,"y":27},{"x":35,"y":29},{"x":39,"y":29},{"x":40,"y":31},{"x":60,"y":31}]},"context_shard":{"check-c":{"example":{}}}})
\ No newline at end of file
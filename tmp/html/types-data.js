@@ -0,0 +1 @@
+types.data({"label":{"hapax":{"labeltext":"hapaxes"},"token":{"labeltext":"tokens"},"type":{"labeltext":"types"},"word":{"labeltext":"running words"}},"stat":{"hapax-token":{"x":"token","y":"hapax"},"hapax-word":{"x":"word","y":"hapax"},"token-word":{"x":"word","y":"token"},"type-token":{"x":"token","y":"type"},"type-word":{"x":"word","y":"type"}},"defaultstat":{"v":["hapax-token","hapax-word","token-word","type-token","type-word"]},"corpus":{"check-a":{"description":"Artificial test data"},"check-b":{"description":"Artificial test data"},"check-c":{"description":"Artificial test data"},"check-d":{"description":"Artificial test data"},"check-e":{"description":"Artificial test data"},"check-f":{"description":"Artificial test data"},"check-g":{"description":"Artificial test data"},"check-h":{"description":"Test data, derived from an old data set"}},"dataset":{"check-a":{"example":{"description":"Artificial test data"}},"check-b":{"example":{"description":"Artificial test data"}},"check-c":{"example":{"description":"Artificial test data"}},"check-d":{"example":{"description":"Artificial test data"}},"check-e":{"example":{"description":"Artificial test data"}},"check-f":{"example":{"description":"Artificial test data"}},"check-g":{"example":{"description":"Artificial test data"}},"check-h":{"example":{"description":"Test data, derived from an old data set"}}},"sample":{"check-a":{"sample-1":{"wordcount":5},"sample-2":{"wordcount":20},"sample-3":{"wordcount":2},"sample-4":{"wordcount":2},"sample-5":{"wordcount":6},"sample-6":{"wordcount":5},"sample-7":{"wordcount":20}},"check-b":{"sample-1":{"wordcount":5},"sample-2":{"wordcount":20},"sample-3":{"wordcount":2},"sample-4":{"wordcount":2},"sample-5":{"wordcount":6},"sample-6":{"wordcount":5},"sample-7":{"wordcount":20}},"check-c":{"sample-1":{"wordcount":5},"sample-2":{"wordcount":20},"sample-3":{"wordcount":2},"sample-4":{"wordcount":2},"sample-5":{"wordcount":6},"sample-6":{"wordcount":5},"sample-7":{"wordcount":20}},"check-d":{"sample-1":{"wordcount":5},"sample-2":{"wordcount":20},"sample-3":{"wordcount":2},"sample-4":{"wordcount":2},"sample-5":{"wordcount":6},"sample-6":{"wordcount":5},"sample-7":{"wordcount":20}},"check-e":{"sample-1":{"wordcount":15},"sample-2":{"wordcount":10},"sample-3":{"wordcount":5},"sample-4":{"wordcount":30}},"check-f":{"sample-1":{"wordcount":15},"sample-2":{"wordcount":10},"sample-3":{"wordcount":5},"sample-4":{"wordcount":30}},"check-g":{"sample-1":{"wordcount":1}},"check-h":{"sample-001":{"wordcount":1},"sample-002":{"wordcount":5},"sample-003":{"wordcount":10},"sample-004":{"wordcount":7},"sample-005":{"wordcount":4},"sample-006":{"wordcount":9},"sample-007":{"wordcount":1},"sample-008":{"wordcount":9},"sample-009":{"wordcount":2},"sample-010":{"wordcount":7},"sample-011":{"wordcount":7},"sample-012":{"wordcount":4},"sample-013":{"wordcount":3},"sample-014":{"wordcount":6},"sample-015":{"wordcount":6},"sample-016":{"wordcount":6},"sample-017":{"wordcount":9},"sample-018":{"wordcount":4},"sample-019":{"wordcount":2},"sample-020":{"wordcount":8},"sample-021":{"wordcount":1},"sample-022":{"wordcount":8},"sample-023":{"wordcount":9},"sample-024":{"wordcount":2},"sample-025":{"wordcount":8},"sample-026":{"wordcount":10},"sample-027":{"wordcount":10},"sample-028":{"wordcount":4},"sample-029":{"wordcount":7},"sample-030":{"wordcount":6},"sample-031":{"wordcount":8},"sample-032":{"wordcount":2},"sample-033":{"wordcount":2},"sample-034":{"wordcount":10},"sample-035":{"wordcount":7},"sample-036":{"wordcount":5},"sample-037":{"wordcount":3},"sample-038":{"wordcount":10},"sample-039":{"wordcount":6},"sample-040":{"wordcount":5},"sample-041":{"wordcount":7},"sample-042":{"wordcount":10},"sample-043":{"wordcount":1},"sample-044":{"wordcount":2},"sample-045":{"wordcount":10},"sample-046":{"wordcount":7},"sample-047":{"wordcount":9},"sample-048":{"wordcount":10},"sample-049":{"wordcount":9},"sample-050":{"wordcount":2},"sample-051":{"wordcount":7},"sample-052":{"wordcount":1},"sample-053":{"wordcount":4},"sample-054":{"wordcount":4},"sample-055":{"wordcount":6},"sample-056":{"wordcount":3},"sample-057":{"wordcount":1},"sample-058":{"wordcount":6},"sample-059":{"wordcount":1},"sample-060":{"wordcount":10},"sample-061":{"wordcount":3},"sample-062":{"wordcount":4},"sample-063":{"wordcount":9},"sample-064":{"wordcount":7},"sample-065":{"wordcount":1},"sample-066":{"wordcount":5},"sample-067":{"wordcount":1},"sample-068":{"wordcount":10},"sample-069":{"wordcount":5},"sample-070":{"wordcount":2},"sample-071":{"wordcount":6},"sample-072":{"wordcount":8},"sample-073":{"wordcount":9},"sample-074":{"wordcount":1},"sample-075":{"wordcount":7},"sample-076":{"wordcount":9},"sample-077":{"wordcount":5},"sample-078":{"wordcount":10},"sample-079":{"wordcount":7},"sample-080":{"wordcount":10},"sample-081":{"wordcount":4},"sample-082":{"wordcount":6},"sample-083":{"wordcount":10},"sample-084":{"wordcount":10},"sample-085":{"wordcount":3},"sample-086":{"wordcount":8},"sample-087":{"wordcount":8},"sample-088":{"wordcount":4},"sample-089":{"wordcount":3},"sample-090":{"wordcount":3},"sample-091":{"wordcount":6},"sample-092":{"wordcount":3},"sample-093":{"wordcount":4},"sample-094":{"wordcount":6},"sample-095":{"wordcount":10},"sample-096":{"wordcount":6},"sample-097":{"wordcount":1},"sample-098":{"wordcount":6},"sample-099":{"wordcount":8},"sample-100":{"wordcount":1}}},"collection":{"check-a":{"collection-1":{}},"check-b":{"collection-1":{},"collection-2":{},"collection-3":{}},"check-c":{"collection-1":{},"collection-2":{},"collection-3":{}},"check-d":{"collection-1":{},"collection-2":{},"collection-3":{}},"check-e":{"collection-01":{},"collection-02":{},"collection-03":{},"collection-04":{},"collection-05":{},"collection-06":{},"collection-07":{},"collection-08":{},"collection-09":{},"collection-10":{},"collection-11":{},"collection-12":{},"collection-13":{},"collection-14":{},"collection-15":{},"collection-16":{}},"check-f":{"collection-01":{},"collection-02":{},"collection-03":{},"collection-04":{},"collection-05":{},"collection-06":{},"collection-07":{},"collection-08":{},"collection-09":{},"collection-10":{},"collection-11":{},"collection-12":{},"collection-13":{},"collection-14":{},"collection-15":{},"collection-16":{}},"check-g":{"collection-1":{},"collection-2":{}},"check-h":{"collection-1":{},"collection-2":{},"collection-3":{},"collection-4":{}}},"sample_collection":{"check-a":{"collection-1":["sample-1","sample-2","sample-3"]},"check-b":{"collection-1":["sample-1","sample-2","sample-3"],"collection-2":["sample-1","sample-2","sample-3"],"collection-3":["sample-4","sample-5","sample-6","sample-7"]},"check-c":{"collection-1":["sample-1","sample-2","sample-3"],"collection-2":["sample-1","sample-2","sample-3"],"collection-3":["sample-4","sample-5","sample-6","sample-7"]},"check-d":{"collection-1":["sample-1","sample-2","sample-3"],"collection-2":["sample-1","sample-2","sample-3"],"collection-3":["sample-4","sample-5","sample-6","sample-7"]},"check-e":{"collection-02":["sample-1"],"collection-03":["sample-2"],"collection-04":["sample-1","sample-2"],"collection-05":["sample-3"],"collection-06":["sample-1","sample-3"],"collection-07":["sample-2","sample-3"],"collection-08":["sample-1","sample-2","sample-3"],"collection-09":["sample-4"],"collection-10":["sample-1","sample-4"],"collection-11":["sample-2","sample-4"],"collection-12":["sample-1","sample-2","sample-4"],"collection-13":["sample-3","sample-4"],"collection-14":["sample-1","sample-3","sample-4"],"collection-15":["sample-2","sample-3","sample-4"],"collection-16":["sample-1","sample-2","sample-3","sample-4"]},"check-f":{"collection-02":["sample-1"],"collection-03":["sample-2"],"collection-04":["sample-1","sample-2"],"collection-05":["sample-3"],"collection-06":["sample-1","sample-3"],"collection-07":["sample-2","sample-3"],"collection-08":["sample-1","sample-2","sample-3"],"collection-09":["sample-4"],"collection-10":["sample-1","sample-4"],"collection-11":["sample-2","sample-4"],"collection-12":["sample-1","sample-2","sample-4"],"collection-13":["sample-3","sample-4"],"collection-14":["sample-1","sample-3","sample-4"],"collection-15":["sample-2","sample-3","sample-4"],"collection-16":["sample-1","sample-2","sample-3","sample-4"]},"check-g":{"collection-2":["sample-1"]},"check-h":{"collection-2":["sample-051","sample-052","sample-053","sample-054","sample-055","sample-056","sample-057","sample-058","sample-059","sample-060","sample-061","sample-062","sample-063","sample-064","sample-065","sample-066","sample-067","sample-068","sample-069","sample-070","sample-071","sample-072","sample-073","sample-074","sample-075","sample-076","sample-077","sample-078","sample-079","sample-080","sample-081","sample-082","sample-083","sample-084","sample-085","sample-086","sample-087","sample-088","sample-089","sample-090","sample-091","sample-092","sample-093","sample-094","sample-095","sample-096","sample-097","sample-098","sample-099","sample-100"],"collection-3":["sample-001","sample-002","sample-003","sample-004","sample-005","sample-006","sample-007","sample-008","sample-009","sample-010","sample-011","sample-012","sample-013","sample-014","sample-015","sample-016","sample-017","sample-018","sample-019","sample-020","sample-021","sample-022","sample-023","sample-024","sample-025","sample-026","sample-027","sample-028","sample-029","sample-030","sample-031","sample-032","sample-033","sample-034","sample-035","sample-036","sample-037","sample-038","sample-039","sample-040","sample-041","sample-042","sample-043","sample-044","sample-045","sample-046","sample-047","sample-048","sample-049","sample-050"],"collection-4":["sample-001","sample-002","sample-003","sample-004","sample-005","sample-006","sample-007","sample-008","sample-009","sample-010","sample-011","sample-012","sample-013","sample-014","sample-015","sample-016","sample-017","sample-018","sample-019","sample-020","sample-021","sample-022","sample-023","sample-024","sample-025","sample-026","sample-027","sample-028","sample-029","sample-030","sample-031","sample-032","sample-033","sample-034","sample-035","sample-036","sample-037","sample-038","sample-039","sample-040","sample-041","sample-042","sample-043","sample-044","sample-045","sample-046","sample-047","sample-048","sample-049","sample-050","sample-051","sample-052","sample-053","sample-054","sample-055","sample-056","sample-057","sample-058","sample-059","sample-060","sample-061","sample-062","sample-063","sample-064","sample-065","sample-066","sample-067","sample-068","sample-069","sample-070","sample-071","sample-072","sample-073","sample-074","sample-075","sample-076","sample-077","sample-078","sample-079","sample-080","sample-081","sample-082","sample-083","sample-084","sample-085","sample-086","sample-087","sample-088","sample-089","sample-090","sample-091","sample-092","sample-093","sample-094","sample-095","sample-096","sample-097","sample-098","sample-099","sample-100"]}},"token":{"check-a":{"example":{"sample-1":{"token-1":{"tokencount":1}},"sample-2":{"token-2":{"tokencount":1}},"sample-3":{"token-3":{"tokencount":1}},"sample-4":{"token-4":{"tokencount":1}},"sample-5":{"token-5":{"tokencount":1},"token-6":{"tokencount":1}},"sample-6":{"token-7":{"tokencount":1}},"sample-7":{"token-8":{"tokencount":1}}}},"check-b":{"example":{"sample-1":{"token-1":{"tokencount":2}},"sample-2":{"token-2":{"tokencount":2}},"sample-3":{"token-3":{"tokencount":2}},"sample-4":{"token-4":{"tokencount":2}},"sample-5":{"token-5":{"tokencount":2},"token-6":{"tokencount":2}},"sample-6":{"token-7":{"tokencount":2}},"sample-7":{"token-8":{"tokencount":2}}}},"check-c":{"example":{"sample-1":{"token-1":{"tokencount":1}},"sample-2":{"token-1":{"tokencount":1},"token-2":{"tokencount":1}},"sample-3":{"token-1":{"tokencount":1},"token-2":{"tokencount":1},"token-3":{"tokencount":1}},"sample-4":{"token-1":{"tokencount":1},"token-2":{"tokencount":1},"token-3":{"tokencount":1},"token-4":{"tokencount":1}},"sample-5":{"token-1":{"tokencount":1},"token-2":{"tokencount":1},"token-3":{"tokencount":1},"token-4":{"tokencount":1},"token-5":{"tokencount":1},"token-6":{"tokencount":1}},"sample-6":{"token-1":{"tokencount":1},"token-2":{"tokencount":1},"token-3":{"tokencount":1},"token-4":{"tokencount":1},"token-5":{"tokencount":1},"token-6":{"tokencount":1},"token-7":{"tokencount":1}},"sample-7":{"token-1":{"tokencount":1},"token-2":{"tokencount":1},"token-3":{"tokencount":1},"token-4":{"tokencount":1},"token-5":{"tokencount":1},"token-6":{"tokencount":1},"token-7":{"tokencount":1},"token-8":{"tokencount":1}}}},"check-d":{"example":{"sample-1":{"token-1":{"tokencount":1}},"sample-2":{"token-2":{"tokencount":1}},"sample-3":{"token-3":{"tokencount":1}},"sample-4":{"token-4":{"tokencount":1}},"sample-5":{"token-1":{"tokencount":1},"token-2":{"tokencount":1},"token-3":{"tokencount":1},"token-4":{"tokencount":1},"token-5":{"tokencount":1},"token-6":{"tokencount":1}},"sample-6":{"token-7":{"tokencount":1}},"sample-7":{"token-8":{"tokencount":1}}}},"check-e":{"example":{"sample-1":{"token-1":{"tokencount":1},"token-2":{"tokencount":1}},"sample-2":{"token-2":{"tokencount":1},"token-3":{"tokencount":1},"token-4":{"tokencount":1}},"sample-3":{"token-4":{"tokencount":1},"token-5":{"tokencount":1}}}},"check-f":{"example":{"sample-1":{"token-1":{"tokencount":1},"token-2":{"tokencount":1}},"sample-2":{"token-2":{"tokencount":7},"token-3":{"tokencount":1},"token-4":{"tokencount":1}},"sample-3":{"token-4":{"tokencount":7},"token-5":{"tokencount":1}}}},"check-g":{"example":{"sample-1":{"token-1":{"tokencount":2}}}},"check-h":{"example":{"sample-001":{"token-005":{"tokencount":2},"token-011":{"tokencount":1},"token-013":{"tokencount":5},"token-016":{"tokencount":5},"token-018":{"tokencount":5},"token-028":{"tokencount":1},"token-030":{"tokencount":7},"token-130":{"tokencount":1}},"sample-002":{"token-007":{"tokencount":2},"token-013":{"tokencount":2},"token-029":{"tokencount":5},"token-031":{"tokencount":3},"token-091":{"tokencount":1},"token-123":{"tokencount":1},"token-136":{"tokencount":1}},"sample-003":{"token-001":{"tokencount":4},"token-009":{"tokencount":4},"token-014":{"tokencount":5},"token-015":{"tokencount":8},"token-020":{"tokencount":3},"token-027":{"tokencount":2},"token-034":{"tokencount":7},"token-035":{"tokencount":5},"token-050":{"tokencount":1},"token-052":{"tokencount":1},"token-088":{"tokencount":1},"token-109":{"tokencount":1}},"sample-004":{"token-010":{"tokencount":2},"token-011":{"tokencount":6},"token-018":{"tokencount":8},"token-021":{"tokencount":1},"token-025":{"tokencount":2},"token-030":{"tokencount":8},"token-031":{"tokencount":8},"token-034":{"tokencount":4},"token-037":{"tokencount":5},"token-040":{"tokencount":3},"token-113":{"tokencount":1}},"sample-005":{"token-003":{"tokencount":2},"token-004":{"tokencount":6},"token-007":{"tokencount":7},"token-010":{"tokencount":6},"token-012":{"tokencount":1},"token-015":{"tokencount":1},"token-019":{"tokencount":8},"token-020":{"tokencount":1},"token-021":{"tokencount":1},"token-026":{"tokencount":6},"token-033":{"tokencount":6},"token-056":{"tokencount":1},"token-084":{"tokencount":1},"token-123":{"tokencount":1},"token-131":{"tokencount":1}},"sample-006":{"token-003":{"tokencount":3},"token-004":{"tokencount":1},"token-006":{"tokencount":8},"token-008":{"tokencount":8},"token-010":{"tokencount":7},"token-011":{"tokencount":1},"token-013":{"tokencount":3},"token-014":{"tokencount":3},"token-015":{"tokencount":5},"token-022":{"tokencount":4},"token-123":{"tokencount":1}},"sample-007":{"token-001":{"tokencount":8},"token-008":{"tokencount":3},"token-010":{"tokencount":4},"token-014":{"tokencount":6},"token-016":{"tokencount":1},"token-021":{"tokencount":3},"token-024":{"tokencount":3},"token-027":{"tokencount":2},"token-029":{"tokencount":6},"token-032":{"tokencount":3},"token-034":{"tokencount":8},"token-040":{"tokencount":3},"token-054":{"tokencount":1},"token-056":{"tokencount":1},"token-061":{"tokencount":1},"token-108":{"tokencount":1}},"sample-008":{"token-004":{"tokencount":5},"token-013":{"tokencount":3},"token-018":{"tokencount":1},"token-021":{"tokencount":4},"token-027":{"tokencount":6},"token-031":{"tokencount":8},"token-032":{"tokencount":7},"token-037":{"tokencount":6},"token-040":{"tokencount":4}},"sample-009":{"token-001":{"tokencount":5},"token-005":{"tokencount":8},"token-007":{"tokencount":1},"token-011":{"tokencount":2},"token-021":{"tokencount":3},"token-035":{"tokencount":7},"token-037":{"tokencount":4}},"sample-010":{"token-001":{"tokencount":3},"token-002":{"tokencount":5},"token-004":{"tokencount":4},"token-005":{"tokencount":8},"token-007":{"tokencount":1},"token-011":{"tokencount":3},"token-013":{"tokencount":6},"token-014":{"tokencount":6},"token-015":{"tokencount":8},"token-024":{"tokencount":5},"token-031":{"tokencount":1},"token-032":{"tokencount":2},"token-035":{"tokencount":3},"token-036":{"tokencount":5},"token-038":{"tokencount":3},"token-079":{"tokencount":1}},"sample-011":{"token-008":{"tokencount":4},"token-020":{"tokencount":2},"token-025":{"tokencount":8},"token-067":{"tokencount":1},"token-098":{"tokencount":1}},"sample-012":{"token-002":{"tokencount":7},"token-011":{"tokencount":6},"token-021":{"tokencount":3},"token-024":{"tokencount":4},"token-030":{"tokencount":2},"token-031":{"tokencount":7},"token-039":{"tokencount":3},"token-048":{"tokencount":1},"token-072":{"tokencount":1},"token-129":{"tokencount":1}},"sample-013":{"token-007":{"tokencount":2},"token-010":{"tokencount":4},"token-026":{"tokencount":6},"token-027":{"tokencount":1},"token-033":{"tokencount":1},"token-039":{"tokencount":8},"token-049":{"tokencount":1},"token-089":{"tokencount":1},"token-126":{"tokencount":1},"token-130":{"tokencount":1}},"sample-014":{"token-001":{"tokencount":1},"token-008":{"tokencount":4},"token-024":{"tokencount":2},"token-040":{"tokencount":2}},"sample-015":{"token-003":{"tokencount":2},"token-016":{"tokencount":5},"token-017":{"tokencount":4},"token-019":{"tokencount":2},"token-022":{"tokencount":1},"token-038":{"tokencount":6},"token-040":{"tokencount":4},"token-048":{"tokencount":1},"token-099":{"tokencount":1}},"sample-016":{"token-001":{"tokencount":3},"token-004":{"tokencount":1},"token-010":{"tokencount":2},"token-012":{"tokencount":2},"token-013":{"tokencount":7},"token-021":{"tokencount":6},"token-024":{"tokencount":7},"token-030":{"tokencount":1},"token-033":{"tokencount":8}},"sample-017":{"token-002":{"tokencount":3},"token-004":{"tokencount":2},"token-005":{"tokencount":4},"token-009":{"tokencount":7},"token-016":{"tokencount":2},"token-018":{"tokencount":3},"token-021":{"tokencount":3},"token-025":{"tokencount":3},"token-029":{"tokencount":3},"token-030":{"tokencount":3},"token-032":{"tokencount":7},"token-038":{"tokencount":1},"token-057":{"tokencount":1},"token-086":{"tokencount":1},"token-100":{"tokencount":1}},"sample-018":{"token-007":{"tokencount":7},"token-012":{"tokencount":3},"token-019":{"tokencount":7},"token-029":{"tokencount":7},"token-037":{"tokencount":4}},"sample-019":{"token-004":{"tokencount":5},"token-005":{"tokencount":1},"token-006":{"tokencount":3},"token-008":{"tokencount":3},"token-009":{"tokencount":6},"token-013":{"tokencount":8},"token-014":{"tokencount":8},"token-015":{"tokencount":2},"token-023":{"tokencount":4},"token-034":{"tokencount":8},"token-035":{"tokencount":6}},"sample-020":{"token-001":{"tokencount":6},"token-004":{"tokencount":6},"token-015":{"tokencount":5},"token-018":{"tokencount":5},"token-020":{"tokencount":2},"token-025":{"tokencount":2},"token-027":{"tokencount":7},"token-031":{"tokencount":8},"token-034":{"tokencount":5},"token-036":{"tokencount":6}},"sample-021":{"token-008":{"tokencount":4},"token-011":{"tokencount":7},"token-015":{"tokencount":7},"token-019":{"tokencount":8},"token-022":{"tokencount":8},"token-025":{"tokencount":1},"token-031":{"tokencount":8},"token-039":{"tokencount":5},"token-040":{"tokencount":5},"token-060":{"tokencount":1},"token-076":{"tokencount":1},"token-115":{"tokencount":1}},"sample-022":{"token-001":{"tokencount":7},"token-005":{"tokencount":4},"token-009":{"tokencount":1},"token-029":{"tokencount":5},"token-037":{"tokencount":6},"token-039":{"tokencount":3}},"sample-023":{"token-002":{"tokencount":3},"token-004":{"tokencount":1},"token-010":{"tokencount":2},"token-012":{"tokencount":1},"token-014":{"tokencount":5},"token-024":{"tokencount":4},"token-025":{"tokencount":7},"token-028":{"tokencount":5},"token-029":{"tokencount":5},"token-069":{"tokencount":1}},"sample-024":{"token-016":{"tokencount":1},"token-019":{"tokencount":7},"token-021":{"tokencount":8},"token-027":{"tokencount":3},"token-028":{"tokencount":7},"token-029":{"tokencount":2},"token-039":{"tokencount":6}},"sample-025":{"token-001":{"tokencount":2},"token-002":{"tokencount":1},"token-003":{"tokencount":7},"token-012":{"tokencount":8},"token-016":{"tokencount":6},"token-019":{"tokencount":6},"token-020":{"tokencount":5},"token-025":{"tokencount":8},"token-029":{"tokencount":4},"token-036":{"tokencount":7},"token-041":{"tokencount":1},"token-092":{"tokencount":1},"token-113":{"tokencount":1}},"sample-026":{"token-004":{"tokencount":2},"token-014":{"tokencount":8},"token-018":{"tokencount":5},"token-023":{"tokencount":8},"token-028":{"tokencount":7},"token-038":{"tokencount":8},"token-059":{"tokencount":1}},"sample-027":{"token-004":{"tokencount":1},"token-012":{"tokencount":1},"token-014":{"tokencount":8},"token-016":{"tokencount":1},"token-023":{"tokencount":3},"token-027":{"tokencount":7},"token-036":{"tokencount":1},"token-039":{"tokencount":1}},"sample-028":{"token-011":{"tokencount":4},"token-015":{"tokencount":5},"token-018":{"tokencount":8},"token-019":{"tokencount":6},"token-030":{"tokencount":3},"token-107":{"tokencount":1}},"sample-029":{"token-001":{"tokencount":1},"token-002":{"tokencount":8},"token-003":{"tokencount":5},"token-006":{"tokencount":2},"token-015":{"tokencount":4},"token-016":{"tokencount":4},"token-019":{"tokencount":7},"token-023":{"tokencount":7},"token-039":{"tokencount":6},"token-077":{"tokencount":1}},"sample-030":{"token-008":{"tokencount":4},"token-011":{"tokencount":3},"token-012":{"tokencount":6},"token-017":{"tokencount":5},"token-019":{"tokencount":1},"token-020":{"tokencount":8},"token-031":{"tokencount":5},"token-038":{"tokencount":7},"token-080":{"tokencount":1},"token-124":{"tokencount":1}},"sample-031":{"token-001":{"tokencount":4},"token-003":{"tokencount":6},"token-010":{"tokencount":1},"token-011":{"tokencount":3},"token-019":{"tokencount":4},"token-020":{"tokencount":2},"token-022":{"tokencount":6},"token-030":{"tokencount":4},"token-036":{"tokencount":3},"token-039":{"tokencount":6},"token-055":{"tokencount":1}},"sample-032":{"token-015":{"tokencount":1},"token-020":{"tokencount":7},"token-023":{"tokencount":4},"token-028":{"tokencount":8},"token-029":{"tokencount":5},"token-037":{"tokencount":7},"token-038":{"tokencount":2},"token-076":{"tokencount":1}},"sample-033":{"token-008":{"tokencount":3},"token-009":{"tokencount":4},"token-014":{"tokencount":1},"token-015":{"tokencount":4},"token-019":{"tokencount":4},"token-025":{"tokencount":6},"token-035":{"tokencount":3}},"sample-034":{"token-001":{"tokencount":6},"token-011":{"tokencount":3},"token-012":{"tokencount":3},"token-015":{"tokencount":6},"token-016":{"tokencount":1},"token-017":{"tokencount":1},"token-019":{"tokencount":7},"token-029":{"tokencount":4},"token-030":{"tokencount":7},"token-091":{"tokencount":1},"token-102":{"tokencount":1},"token-103":{"tokencount":1},"token-105":{"tokencount":1}},"sample-035":{"token-002":{"tokencount":3},"token-007":{"tokencount":6},"token-009":{"tokencount":2},"token-013":{"tokencount":7},"token-015":{"tokencount":2},"token-027":{"tokencount":8},"token-028":{"tokencount":3},"token-036":{"tokencount":6},"token-038":{"tokencount":1},"token-110":{"tokencount":1}},"sample-036":{"token-003":{"tokencount":7},"token-015":{"tokencount":3},"token-025":{"tokencount":7},"token-037":{"tokencount":8},"token-095":{"tokencount":1},"token-132":{"tokencount":1}},"sample-037":{"token-001":{"tokencount":3},"token-011":{"tokencount":5},"token-012":{"tokencount":1},"token-016":{"tokencount":2},"token-030":{"tokencount":5},"token-031":{"tokencount":4},"token-034":{"tokencount":4},"token-040":{"tokencount":1},"token-064":{"tokencount":1},"token-069":{"tokencount":1},"token-110":{"tokencount":1}},"sample-038":{"token-003":{"tokencount":3},"token-007":{"tokencount":1},"token-011":{"tokencount":3},"token-023":{"tokencount":7},"token-025":{"tokencount":4},"token-028":{"tokencount":7},"token-031":{"tokencount":3},"token-035":{"tokencount":5},"token-036":{"tokencount":6},"token-037":{"tokencount":5},"token-060":{"tokencount":1}},"sample-039":{"token-001":{"tokencount":7},"token-004":{"tokencount":2},"token-006":{"tokencount":7},"token-007":{"tokencount":5},"token-009":{"tokencount":5},"token-010":{"tokencount":4},"token-012":{"tokencount":7},"token-019":{"tokencount":4},"token-021":{"tokencount":5},"token-022":{"tokencount":2},"token-035":{"tokencount":6},"token-036":{"tokencount":3},"token-069":{"tokencount":1}},"sample-040":{"token-003":{"tokencount":4},"token-008":{"tokencount":6},"token-012":{"tokencount":4},"token-013":{"tokencount":7},"token-016":{"tokencount":2},"token-024":{"tokencount":2},"token-028":{"tokencount":3},"token-037":{"tokencount":6}},"sample-041":{"token-008":{"tokencount":5},"token-009":{"tokencount":2},"token-010":{"tokencount":8},"token-014":{"tokencount":1},"token-026":{"tokencount":4},"token-036":{"tokencount":3},"token-055":{"tokencount":1},"token-061":{"tokencount":1},"token-120":{"tokencount":1}},"sample-042":{"token-004":{"tokencount":1},"token-007":{"tokencount":4},"token-021":{"tokencount":1},"token-028":{"tokencount":3},"token-095":{"tokencount":1},"token-127":{"tokencount":1}},"sample-043":{"token-005":{"tokencount":1},"token-007":{"tokencount":7},"token-025":{"tokencount":5},"token-029":{"tokencount":3},"token-030":{"tokencount":7},"token-031":{"tokencount":1}},"sample-044":{"token-012":{"tokencount":3},"token-022":{"tokencount":4},"token-030":{"tokencount":1},"token-035":{"tokencount":2},"token-039":{"tokencount":5},"token-040":{"tokencount":6},"token-121":{"tokencount":1}},"sample-045":{"token-004":{"tokencount":7},"token-005":{"tokencount":8},"token-006":{"tokencount":7},"token-009":{"tokencount":8},"token-034":{"tokencount":1},"token-040":{"tokencount":8},"token-049":{"tokencount":1},"token-089":{"tokencount":1}},"sample-046":{"token-001":{"tokencount":3},"token-004":{"tokencount":1},"token-005":{"tokencount":6},"token-006":{"tokencount":6},"token-014":{"tokencount":6},"token-015":{"tokencount":2},"token-020":{"tokencount":1},"token-109":{"tokencount":1},"token-131":{"tokencount":1}},"sample-047":{"token-001":{"tokencount":7},"token-008":{"tokencount":6},"token-012":{"tokencount":7},"token-018":{"tokencount":8},"token-031":{"tokencount":6},"token-038":{"tokencount":7},"token-115":{"tokencount":1}},"sample-048":{"token-005":{"tokencount":3},"token-007":{"tokencount":1},"token-008":{"tokencount":5},"token-011":{"tokencount":6},"token-013":{"tokencount":6},"token-014":{"tokencount":8},"token-017":{"tokencount":3},"token-019":{"tokencount":5},"token-026":{"tokencount":7},"token-033":{"tokencount":4}},"sample-049":{"token-001":{"tokencount":7},"token-006":{"tokencount":7},"token-016":{"tokencount":3},"token-019":{"tokencount":7},"token-024":{"tokencount":7},"token-034":{"tokencount":1},"token-036":{"tokencount":5},"token-077":{"tokencount":1},"token-104":{"tokencount":1}},"sample-050":{"token-003":{"tokencount":8},"token-009":{"tokencount":1},"token-010":{"tokencount":2},"token-013":{"tokencount":4},"token-023":{"tokencount":2},"token-025":{"tokencount":2},"token-032":{"tokencount":8},"token-035":{"tokencount":7},"token-040":{"tokencount":4},"token-088":{"tokencount":1}},"sample-051":{"token-005":{"tokencount":3},"token-007":{"tokencount":7},"token-012":{"tokencount":5},"token-013":{"tokencount":7},"token-020":{"tokencount":8},"token-031":{"tokencount":7},"token-104":{"tokencount":1}},"sample-052":{"token-008":{"tokencount":7},"token-012":{"tokencount":2},"token-022":{"tokencount":5},"token-026":{"tokencount":7},"token-028":{"tokencount":5},"token-029":{"tokencount":3},"token-033":{"tokencount":8},"token-055":{"tokencount":1},"token-101":{"tokencount":1},"token-112":{"tokencount":1},"token-137":{"tokencount":1}},"sample-053":{"token-001":{"tokencount":8},"token-002":{"tokencount":7},"token-005":{"tokencount":8},"token-012":{"tokencount":6},"token-013":{"tokencount":3},"token-019":{"tokencount":1},"token-021":{"tokencount":5},"token-022":{"tokencount":5},"token-029":{"tokencount":1},"token-039":{"tokencount":6},"token-139":{"tokencount":1}},"sample-054":{"token-008":{"tokencount":4},"token-009":{"tokencount":3},"token-010":{"tokencount":7},"token-016":{"tokencount":7},"token-021":{"tokencount":1},"token-024":{"tokencount":8},"token-025":{"tokencount":5},"token-030":{"tokencount":4},"token-037":{"tokencount":3},"token-040":{"tokencount":4},"token-080":{"tokencount":1},"token-087":{"tokencount":1}},"sample-055":{"token-013":{"tokencount":1},"token-023":{"tokencount":3},"token-033":{"tokencount":5},"token-038":{"tokencount":6},"token-120":{"tokencount":1}},"sample-056":{"token-003":{"tokencount":5},"token-006":{"tokencount":7},"token-008":{"tokencount":7},"token-025":{"tokencount":2},"token-027":{"tokencount":8},"token-028":{"tokencount":4},"token-035":{"tokencount":2},"token-039":{"tokencount":1},"token-062":{"tokencount":1},"token-065":{"tokencount":1},"token-107":{"tokencount":1}},"sample-057":{"token-001":{"tokencount":1},"token-008":{"tokencount":7},"token-010":{"tokencount":8},"token-019":{"tokencount":7},"token-102":{"tokencount":1},"token-136":{"tokencount":1}},"sample-058":{"token-018":{"tokencount":7},"token-019":{"tokencount":2},"token-021":{"tokencount":4},"token-027":{"tokencount":4},"token-032":{"tokencount":3},"token-037":{"tokencount":4},"token-040":{"tokencount":7},"token-048":{"tokencount":1}},"sample-059":{"token-006":{"tokencount":5},"token-009":{"tokencount":7},"token-016":{"tokencount":5},"token-022":{"tokencount":7},"token-026":{"tokencount":7},"token-027":{"tokencount":3},"token-028":{"tokencount":5},"token-036":{"tokencount":4},"token-040":{"tokencount":1},"token-085":{"tokencount":1},"token-088":{"tokencount":1}},"sample-060":{"token-002":{"tokencount":4},"token-005":{"tokencount":4},"token-009":{"tokencount":1},"token-018":{"tokencount":4},"token-023":{"tokencount":1},"token-029":{"tokencount":5},"token-123":{"tokencount":1}},"sample-061":{"token-001":{"tokencount":1},"token-003":{"tokencount":2},"token-012":{"tokencount":8},"token-022":{"tokencount":1},"token-024":{"tokencount":4},"token-030":{"tokencount":8},"token-032":{"tokencount":5},"token-034":{"tokencount":1},"token-038":{"tokencount":5},"token-039":{"tokencount":3}},"sample-062":{"token-006":{"tokencount":8},"token-008":{"tokencount":8},"token-009":{"tokencount":6},"token-010":{"tokencount":6},"token-012":{"tokencount":7},"token-022":{"tokencount":6},"token-026":{"tokencount":8},"token-035":{"tokencount":6},"token-039":{"tokencount":2},"token-040":{"tokencount":5}},"sample-063":{"token-009":{"tokencount":1},"token-010":{"tokencount":7},"token-013":{"tokencount":8},"token-018":{"tokencount":4},"token-026":{"tokencount":4},"token-032":{"tokencount":5},"token-035":{"tokencount":4},"token-039":{"tokencount":4},"token-044":{"tokencount":1},"token-075":{"tokencount":1},"token-085":{"tokencount":1}},"sample-064":{"token-002":{"tokencount":5},"token-005":{"tokencount":2},"token-010":{"tokencount":8},"token-033":{"tokencount":2},"token-036":{"tokencount":5},"token-091":{"tokencount":1}},"sample-065":{"token-001":{"tokencount":6},"token-002":{"tokencount":6},"token-003":{"tokencount":7},"token-005":{"tokencount":1},"token-008":{"tokencount":4},"token-011":{"tokencount":5},"token-018":{"tokencount":3},"token-023":{"tokencount":4},"token-029":{"tokencount":6},"token-031":{"tokencount":7},"token-032":{"tokencount":3},"token-035":{"tokencount":4},"token-036":{"tokencount":2},"token-038":{"tokencount":3},"token-129":{"tokencount":1}},"sample-066":{"token-001":{"tokencount":7},"token-002":{"tokencount":2},"token-005":{"tokencount":7},"token-018":{"tokencount":4},"token-022":{"tokencount":4},"token-031":{"tokencount":7},"token-032":{"tokencount":8},"token-033":{"tokencount":5}},"sample-067":{"token-002":{"tokencount":4},"token-004":{"tokencount":6},"token-005":{"tokencount":3},"token-008":{"tokencount":6},"token-010":{"tokencount":1},"token-014":{"tokencount":1},"token-019":{"tokencount":5},"token-031":{"tokencount":1},"token-033":{"tokencount":4},"token-035":{"tokencount":6},"token-087":{"tokencount":1},"token-129":{"tokencount":1}},"sample-068":{"token-005":{"tokencount":2},"token-008":{"tokencount":2},"token-012":{"tokencount":2},"token-019":{"tokencount":1},"token-023":{"tokencount":2},"token-025":{"tokencount":5},"token-033":{"tokencount":6},"token-035":{"tokencount":1},"token-039":{"tokencount":8}},"sample-069":{"token-009":{"tokencount":7},"token-017":{"tokencount":4},"token-019":{"tokencount":2},"token-021":{"tokencount":6},"token-022":{"tokencount":8},"token-027":{"tokencount":1},"token-036":{"tokencount":6},"token-138":{"tokencount":1}},"sample-070":{"token-003":{"tokencount":7},"token-004":{"tokencount":1},"token-005":{"tokencount":8},"token-006":{"tokencount":8},"token-008":{"tokencount":1},"token-018":{"tokencount":8},"token-019":{"tokencount":8},"token-021":{"tokencount":1},"token-025":{"tokencount":8},"token-030":{"tokencount":4},"token-038":{"tokencount":4},"token-063":{"tokencount":1},"token-070":{"tokencount":1}},"sample-071":{"token-002":{"tokencount":2},"token-003":{"tokencount":3},"token-004":{"tokencount":3},"token-008":{"tokencount":3},"token-010":{"tokencount":2},"token-011":{"tokencount":4},"token-013":{"tokencount":5},"token-023":{"tokencount":4},"token-025":{"tokencount":1},"token-031":{"tokencount":5},"token-039":{"tokencount":4},"token-046":{"tokencount":1}},"sample-072":{"token-004":{"tokencount":6},"token-005":{"tokencount":6},"token-017":{"tokencount":4},"token-021":{"tokencount":2},"token-027":{"tokencount":2},"token-030":{"tokencount":8},"token-031":{"tokencount":7},"token-033":{"tokencount":2},"token-034":{"tokencount":1},"token-035":{"tokencount":3},"token-038":{"tokencount":5},"token-094":{"tokencount":1},"token-117":{"tokencount":1},"token-122":{"tokencount":1}},"sample-073":{"token-016":{"tokencount":7},"token-018":{"tokencount":6},"token-020":{"tokencount":8},"token-023":{"tokencount":7},"token-024":{"tokencount":3},"token-027":{"tokencount":4},"token-035":{"tokencount":1},"token-037":{"tokencount":7},"token-039":{"tokencount":8},"token-115":{"tokencount":1}},"sample-074":{"token-003":{"tokencount":1},"token-004":{"tokencount":3},"token-011":{"tokencount":1},"token-017":{"tokencount":7},"token-018":{"tokencount":6},"token-019":{"tokencount":5},"token-021":{"tokencount":1},"token-022":{"tokencount":5},"token-025":{"tokencount":3},"token-031":{"tokencount":7},"token-034":{"tokencount":8},"token-040":{"tokencount":7}},"sample-075":{"token-003":{"tokencount":1},"token-008":{"tokencount":4},"token-017":{"tokencount":1},"token-018":{"tokencount":2},"token-020":{"tokencount":7},"token-025":{"tokencount":4},"token-027":{"tokencount":8},"token-032":{"tokencount":3},"token-051":{"tokencount":1}},"sample-076":{"token-002":{"tokencount":6},"token-004":{"tokencount":7},"token-005":{"tokencount":3},"token-006":{"tokencount":1},"token-009":{"tokencount":1},"token-010":{"tokencount":4},"token-037":{"tokencount":4}},"sample-077":{"token-002":{"tokencount":8},"token-005":{"tokencount":5},"token-011":{"tokencount":3},"token-014":{"tokencount":6},"token-015":{"tokencount":6},"token-018":{"tokencount":6},"token-020":{"tokencount":3},"token-138":{"tokencount":1}},"sample-078":{"token-006":{"tokencount":8},"token-008":{"tokencount":2},"token-015":{"tokencount":3},"token-016":{"tokencount":8},"token-018":{"tokencount":1},"token-024":{"tokencount":7},"token-025":{"tokencount":8},"token-027":{"tokencount":5},"token-035":{"tokencount":6},"token-036":{"tokencount":2}},"sample-079":{"token-004":{"tokencount":5},"token-014":{"tokencount":2},"token-017":{"tokencount":5},"token-018":{"tokencount":1},"token-022":{"tokencount":7},"token-027":{"tokencount":7},"token-030":{"tokencount":1},"token-035":{"tokencount":7},"token-039":{"tokencount":4},"token-045":{"tokencount":1},"token-068":{"tokencount":1},"token-091":{"tokencount":1}},"sample-080":{"token-001":{"tokencount":7},"token-009":{"tokencount":7},"token-015":{"tokencount":1},"token-024":{"tokencount":5},"token-035":{"tokencount":5},"token-036":{"tokencount":1}},"sample-081":{"token-004":{"tokencount":1},"token-017":{"tokencount":6},"token-020":{"tokencount":2},"token-023":{"tokencount":8},"token-032":{"tokencount":1},"token-034":{"tokencount":4},"token-037":{"tokencount":8},"token-069":{"tokencount":1},"token-125":{"tokencount":1}},"sample-082":{"token-005":{"tokencount":5},"token-015":{"tokencount":7},"token-017":{"tokencount":5},"token-019":{"tokencount":5},"token-020":{"tokencount":4},"token-022":{"tokencount":6},"token-027":{"tokencount":7},"token-029":{"tokencount":1},"token-031":{"tokencount":1},"token-034":{"tokencount":6},"token-035":{"tokencount":3},"token-039":{"tokencount":1},"token-075":{"tokencount":1},"token-125":{"tokencount":1}},"sample-083":{"token-004":{"tokencount":1},"token-011":{"tokencount":4},"token-022":{"tokencount":8},"token-028":{"tokencount":5},"token-037":{"tokencount":6},"token-040":{"tokencount":7},"token-043":{"tokencount":1},"token-046":{"tokencount":1},"token-093":{"tokencount":1},"token-106":{"tokencount":1},"token-127":{"tokencount":1}},"sample-084":{"token-002":{"tokencount":2},"token-019":{"tokencount":7},"token-027":{"tokencount":8},"token-038":{"tokencount":8},"token-040":{"tokencount":4},"token-113":{"tokencount":1},"token-137":{"tokencount":1}},"sample-085":{"token-003":{"tokencount":5},"token-011":{"tokencount":8},"token-016":{"tokencount":1},"token-026":{"tokencount":1},"token-031":{"tokencount":2},"token-032":{"tokencount":2},"token-033":{"tokencount":1},"token-061":{"tokencount":1},"token-081":{"tokencount":1},"token-102":{"tokencount":1}},"sample-086":{"token-001":{"tokencount":5},"token-002":{"tokencount":6},"token-005":{"tokencount":7},"token-008":{"tokencount":6},"token-013":{"tokencount":3},"token-016":{"tokencount":5},"token-018":{"tokencount":3},"token-023":{"tokencount":6},"token-026":{"tokencount":6},"token-028":{"tokencount":8},"token-030":{"tokencount":8},"token-034":{"tokencount":8},"token-066":{"tokencount":1},"token-081":{"tokencount":1}},"sample-087":{"token-001":{"tokencount":1},"token-005":{"tokencount":1},"token-012":{"tokencount":6},"token-027":{"tokencount":1},"token-028":{"tokencount":4},"token-029":{"tokencount":1},"token-031":{"tokencount":2},"token-033":{"tokencount":8},"token-036":{"tokencount":7},"token-039":{"tokencount":2},"token-040":{"tokencount":5},"token-054":{"tokencount":1},"token-111":{"tokencount":1},"token-116":{"tokencount":1}},"sample-088":{"token-023":{"tokencount":4},"token-037":{"tokencount":4},"token-063":{"tokencount":1},"token-108":{"tokencount":1}},"sample-089":{"token-007":{"tokencount":7},"token-008":{"tokencount":8},"token-009":{"tokencount":6},"token-010":{"tokencount":3},"token-025":{"tokencount":7},"token-028":{"tokencount":5},"token-032":{"tokencount":2},"token-036":{"tokencount":6},"token-117":{"tokencount":1}},"sample-090":{"token-001":{"tokencount":8},"token-020":{"tokencount":7},"token-026":{"tokencount":1},"token-027":{"tokencount":7},"token-028":{"tokencount":2},"token-036":{"tokencount":2},"token-039":{"tokencount":5}},"sample-091":{"token-011":{"tokencount":6},"token-013":{"tokencount":1},"token-023":{"tokencount":1},"token-026":{"tokencount":1},"token-039":{"tokencount":6},"token-040":{"tokencount":5},"token-113":{"tokencount":1},"token-127":{"tokencount":1}},"sample-092":{"token-003":{"tokencount":2},"token-010":{"tokencount":6},"token-014":{"tokencount":3},"token-015":{"tokencount":4},"token-019":{"tokencount":6},"token-029":{"tokencount":2},"token-030":{"tokencount":8},"token-062":{"tokencount":1},"token-090":{"tokencount":1}},"sample-093":{"token-003":{"tokencount":5},"token-008":{"tokencount":5},"token-014":{"tokencount":2},"token-028":{"tokencount":1},"token-030":{"tokencount":6},"token-037":{"tokencount":4},"token-042":{"tokencount":1},"token-053":{"tokencount":1},"token-101":{"tokencount":1},"token-116":{"tokencount":1}},"sample-094":{"token-001":{"tokencount":7},"token-003":{"tokencount":2},"token-011":{"tokencount":4},"token-013":{"tokencount":4},"token-026":{"tokencount":8},"token-086":{"tokencount":1},"token-129":{"tokencount":1}},"sample-095":{"token-003":{"tokencount":4},"token-030":{"tokencount":7},"token-059":{"tokencount":1},"token-070":{"tokencount":1},"token-108":{"tokencount":1}},"sample-096":{"token-004":{"tokencount":3},"token-005":{"tokencount":7},"token-010":{"tokencount":5},"token-012":{"tokencount":3},"token-017":{"tokencount":4},"token-018":{"tokencount":3},"token-019":{"tokencount":2},"token-023":{"tokencount":4},"token-028":{"tokencount":8},"token-032":{"tokencount":8},"token-035":{"tokencount":3},"token-037":{"tokencount":1},"token-038":{"tokencount":3},"token-093":{"tokencount":1}},"sample-097":{"token-001":{"tokencount":1},"token-003":{"tokencount":7},"token-016":{"tokencount":4},"token-019":{"tokencount":2},"token-031":{"tokencount":2},"token-034":{"tokencount":4},"token-035":{"tokencount":1},"token-036":{"tokencount":1},"token-093":{"tokencount":1},"token-122":{"tokencount":1},"token-130":{"tokencount":1}},"sample-098":{"token-001":{"tokencount":5},"token-002":{"tokencount":4},"token-008":{"tokencount":5},"token-010":{"tokencount":1},"token-011":{"tokencount":4},"token-013":{"tokencount":8},"token-017":{"tokencount":5},"token-018":{"tokencount":6},"token-019":{"tokencount":2},"token-020":{"tokencount":7},"token-031":{"tokencount":7},"token-037":{"tokencount":5},"token-068":{"tokencount":1},"token-135":{"tokencount":1}},"sample-099":{"token-006":{"tokencount":7},"token-022":{"tokencount":3},"token-028":{"tokencount":4},"token-029":{"tokencount":1},"token-030":{"tokencount":6},"token-031":{"tokencount":5},"token-036":{"tokencount":1}},"sample-100":{"token-013":{"tokencount":8},"token-025":{"tokencount":1},"token-031":{"tokencount":2}}}}},"tokeninfo":{},"context":{},"result_p":{"check-a":{"example":{"collection-1":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":3,"y":3},"hapax-word":{"above":9523,"below":7621,"total":10000,"x":27,"y":3},"token-word":{"above":9523,"below":7621,"total":10000,"x":27,"y":3},"type-token":{"above":10000,"below":10000,"total":10000,"x":3,"y":3},"type-word":{"above":9523,"below":7621,"total":10000,"x":27,"y":3}}}},"check-b":{"example":{"collection-1":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":6,"y":0},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":27,"y":0},"token-word":{"above":9523,"below":7621,"total":10000,"x":27,"y":6},"type-token":{"above":10000,"below":10000,"total":10000,"x":6,"y":3},"type-word":{"above":9523,"below":7621,"total":10000,"x":27,"y":3}},"collection-2":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":6,"y":0},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":27,"y":0},"token-word":{"above":9523,"below":7621,"total":10000,"x":27,"y":6},"type-token":{"above":10000,"below":10000,"total":10000,"x":6,"y":3},"type-word":{"above":9523,"below":7621,"total":10000,"x":27,"y":3}},"collection-3":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":10,"y":0},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":33,"y":0},"token-word":{"above":7796,"below":9524,"total":10000,"x":33,"y":10},"type-token":{"above":10000,"below":10000,"total":10000,"x":10,"y":5},"type-word":{"above":7796,"below":9524,"total":10000,"x":33,"y":5}}}},"check-c":{"example":{"collection-1":{"hapax-token":{"above":10000,"below":9680,"total":10000,"x":6,"y":1},"hapax-word":{"above":10000,"below":6276,"total":10000,"x":27,"y":1},"token-word":{"above":10000,"below":1822,"total":10000,"x":27,"y":6},"type-token":{"above":10000,"below":8341,"total":10000,"x":6,"y":3},"type-word":{"above":10000,"below":1258,"total":10000,"x":27,"y":3}},"collection-2":{"hapax-token":{"above":10000,"below":9680,"total":10000,"x":6,"y":1},"hapax-word":{"above":10000,"below":6276,"total":10000,"x":27,"y":1},"token-word":{"above":10000,"below":1822,"total":10000,"x":27,"y":6},"type-token":{"above":10000,"below":8341,"total":10000,"x":6,"y":3},"type-word":{"above":10000,"below":1258,"total":10000,"x":27,"y":3}},"collection-3":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":25,"y":1},"hapax-word":{"above":10000,"below":7150,"total":10000,"x":33,"y":1},"token-word":{"above":1233,"below":10000,"total":10000,"x":33,"y":25},"type-token":{"above":10000,"below":10000,"total":10000,"x":25,"y":8},"type-word":{"above":6869,"below":10000,"total":10000,"x":33,"y":8}}}},"check-d":{"example":{"collection-1":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":3,"y":3},"hapax-word":{"above":9523,"below":6539,"total":10000,"x":27,"y":3},"token-word":{"above":9523,"below":5902,"total":10000,"x":27,"y":3},"type-token":{"above":10000,"below":10000,"total":10000,"x":3,"y":3},"type-word":{"above":9523,"below":5902,"total":10000,"x":27,"y":3}},"collection-2":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":3,"y":3},"hapax-word":{"above":9523,"below":6539,"total":10000,"x":27,"y":3},"token-word":{"above":9523,"below":5902,"total":10000,"x":27,"y":3},"type-token":{"above":10000,"below":10000,"total":10000,"x":3,"y":3},"type-word":{"above":9523,"below":5902,"total":10000,"x":27,"y":3}},"collection-3":{"hapax-token":{"above":6121,"below":10000,"total":10000,"x":9,"y":7},"hapax-word":{"above":2135,"below":10000,"total":10000,"x":33,"y":7},"token-word":{"above":6099,"below":9524,"total":10000,"x":33,"y":9},"type-token":{"above":3998,"below":10000,"total":10000,"x":9,"y":8},"type-word":{"above":1949,"below":10000,"total":10000,"x":33,"y":8}}}},"check-e":{"example":{"collection-01":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"token-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"type-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"type-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0}},"collection-02":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"hapax-word":{"above":7534,"below":9152,"total":10000,"x":15,"y":2},"token-word":{"above":7534,"below":7445,"total":10000,"x":15,"y":2},"type-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"type-word":{"above":7534,"below":7445,"total":10000,"x":15,"y":2}},"collection-03":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":3,"y":3},"hapax-word":{"above":4174,"below":10000,"total":10000,"x":10,"y":3},"token-word":{"above":4174,"below":10000,"total":10000,"x":10,"y":3},"type-token":{"above":10000,"below":10000,"total":10000,"x":3,"y":3},"type-word":{"above":4174,"below":10000,"total":10000,"x":10,"y":3}},"collection-04":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":5,"y":3},"hapax-word":{"above":5876,"below":9158,"total":10000,"x":25,"y":3},"token-word":{"above":4186,"below":10000,"total":10000,"x":25,"y":5},"type-token":{"above":10000,"below":10000,"total":10000,"x":5,"y":4},"type-word":{"above":5028,"below":10000,"total":10000,"x":25,"y":4}},"collection-05":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"hapax-word":{"above":7534,"below":10000,"total":10000,"x":5,"y":2},"token-word":{"above":7534,"below":10000,"total":10000,"x":5,"y":2},"type-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"type-word":{"above":7534,"below":10000,"total":10000,"x":5,"y":2}},"collection-06":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":4,"y":4},"hapax-word":{"above":4218,"below":10000,"total":10000,"x":20,"y":4},"token-word":{"above":5028,"below":8345,"total":10000,"x":20,"y":4},"type-token":{"above":10000,"below":10000,"total":10000,"x":4,"y":4},"type-word":{"above":5028,"below":10000,"total":10000,"x":20,"y":4}},"collection-07":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":5,"y":3},"hapax-word":{"above":4174,"below":10000,"total":10000,"x":15,"y":3},"token-word":{"above":2524,"below":10000,"total":10000,"x":15,"y":5},"type-token":{"above":10000,"below":10000,"total":10000,"x":5,"y":4},"type-word":{"above":3326,"below":10000,"total":10000,"x":15,"y":4}},"collection-08":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":7,"y":3},"hapax-word":{"above":5876,"below":9158,"total":10000,"x":30,"y":3},"token-word":{"above":2546,"below":10000,"total":10000,"x":30,"y":7},"type-token":{"above":10000,"below":10000,"total":10000,"x":7,"y":5},"type-word":{"above":2546,"below":10000,"total":10000,"x":30,"y":5}},"collection-09":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"hapax-word":{"above":10000,"below":2466,"total":10000,"x":30,"y":0},"token-word":{"above":10000,"below":2466,"total":10000,"x":30,"y":0},"type-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"type-word":{"above":10000,"below":2466,"total":10000,"x":30,"y":0}},"collection-10":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"hapax-word":{"above":10000,"below":4972,"total":10000,"x":45,"y":2},"token-word":{"above":10000,"below":3283,"total":10000,"x":45,"y":2},"type-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"type-word":{"above":10000,"below":3283,"total":10000,"x":45,"y":2}},"collection-11":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":3,"y":3},"hapax-word":{"above":8327,"below":9158,"total":10000,"x":40,"y":3},"token-word":{"above":8327,"below":4972,"total":10000,"x":40,"y":3},"type-token":{"above":10000,"below":10000,"total":10000,"x":3,"y":3},"type-word":{"above":8327,"below":4972,"total":10000,"x":40,"y":3}},"collection-12":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":5,"y":3},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":55,"y":3},"token-word":{"above":10000,"below":7454,"total":10000,"x":55,"y":5},"type-token":{"above":10000,"below":10000,"total":10000,"x":5,"y":4},"type-word":{"above":10000,"below":7454,"total":10000,"x":55,"y":4}},"collection-13":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"hapax-word":{"above":10000,"below":4124,"total":10000,"x":35,"y":2},"token-word":{"above":10000,"below":4124,"total":10000,"x":35,"y":2},"type-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"type-word":{"above":10000,"below":4124,"total":10000,"x":35,"y":2}},"collection-14":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":4,"y":4},"hapax-word":{"above":6624,"below":10000,"total":10000,"x":50,"y":4},"token-word":{"above":10000,"below":4135,"total":10000,"x":50,"y":4},"type-token":{"above":10000,"below":10000,"total":10000,"x":4,"y":4},"type-word":{"above":10000,"below":7454,"total":10000,"x":50,"y":4}},"collection-15":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":5,"y":3},"hapax-word":{"above":8327,"below":9158,"total":10000,"x":45,"y":3},"token-word":{"above":6705,"below":7454,"total":10000,"x":45,"y":5},"type-token":{"above":10000,"below":10000,"total":10000,"x":5,"y":4},"type-word":{"above":8327,"below":7454,"total":10000,"x":45,"y":4}},"collection-16":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":7,"y":3},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":60,"y":3},"token-word":{"above":10000,"below":10000,"total":10000,"x":60,"y":7},"type-token":{"above":10000,"below":10000,"total":10000,"x":7,"y":5},"type-word":{"above":10000,"below":10000,"total":10000,"x":60,"y":5}}}},"check-f":{"example":{"collection-01":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"token-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"type-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"type-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0}},"collection-02":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"hapax-word":{"above":6721,"below":10000,"total":10000,"x":15,"y":2},"token-word":{"above":7534,"below":5013,"total":10000,"x":15,"y":2},"type-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"type-word":{"above":7534,"below":7445,"total":10000,"x":15,"y":2}},"collection-03":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":9,"y":2},"hapax-word":{"above":6721,"below":10000,"total":10000,"x":10,"y":2},"token-word":{"above":4174,"below":10000,"total":10000,"x":10,"y":9},"type-token":{"above":10000,"below":10000,"total":10000,"x":9,"y":3},"type-word":{"above":4174,"below":10000,"total":10000,"x":10,"y":3}},"collection-04":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":11,"y":3},"hapax-word":{"above":4218,"below":10000,"total":10000,"x":25,"y":3},"token-word":{"above":4186,"below":8345,"total":10000,"x":25,"y":11},"type-token":{"above":10000,"below":10000,"total":10000,"x":11,"y":4},"type-word":{"above":5028,"below":10000,"total":10000,"x":25,"y":4}},"collection-05":{"hapax-token":{"above":10000,"below":8220,"total":10000,"x":8,"y":1},"hapax-word":{"above":7534,"below":10000,"total":10000,"x":5,"y":1},"token-word":{"above":4987,"below":10000,"total":10000,"x":5,"y":8},"type-token":{"above":10000,"below":10000,"total":10000,"x":8,"y":2},"type-word":{"above":7534,"below":10000,"total":10000,"x":5,"y":2}},"collection-06":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":10,"y":3},"hapax-word":{"above":4218,"below":10000,"total":10000,"x":20,"y":3},"token-word":{"above":5028,"below":8345,"total":10000,"x":20,"y":10},"type-token":{"above":10000,"below":10000,"total":10000,"x":10,"y":4},"type-word":{"above":5028,"below":10000,"total":10000,"x":20,"y":4}},"collection-07":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":17,"y":2},"hapax-word":{"above":6721,"below":10000,"total":10000,"x":15,"y":2},"token-word":{"above":1655,"below":10000,"total":10000,"x":15,"y":17},"type-token":{"above":10000,"below":10000,"total":10000,"x":17,"y":4},"type-word":{"above":3326,"below":10000,"total":10000,"x":15,"y":4}},"collection-08":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":19,"y":3},"hapax-word":{"above":4218,"below":10000,"total":10000,"x":30,"y":3},"token-word":{"above":2546,"below":10000,"total":10000,"x":30,"y":19},"type-token":{"above":10000,"below":10000,"total":10000,"x":19,"y":5},"type-word":{"above":2546,"below":10000,"total":10000,"x":30,"y":5}},"collection-09":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"hapax-word":{"above":10000,"below":2466,"total":10000,"x":30,"y":0},"token-word":{"above":10000,"below":2466,"total":10000,"x":30,"y":0},"type-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"type-word":{"above":10000,"below":2466,"total":10000,"x":30,"y":0}},"collection-10":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"hapax-word":{"above":10000,"below":5782,"total":10000,"x":45,"y":2},"token-word":{"above":10000,"below":1673,"total":10000,"x":45,"y":2},"type-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":2},"type-word":{"above":10000,"below":3283,"total":10000,"x":45,"y":2}},"collection-11":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":9,"y":2},"hapax-word":{"above":10000,"below":5782,"total":10000,"x":40,"y":2},"token-word":{"above":8327,"below":4972,"total":10000,"x":40,"y":9},"type-token":{"above":10000,"below":10000,"total":10000,"x":9,"y":3},"type-word":{"above":8327,"below":4972,"total":10000,"x":40,"y":3}},"collection-12":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":11,"y":3},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":55,"y":3},"token-word":{"above":10000,"below":4965,"total":10000,"x":55,"y":11},"type-token":{"above":10000,"below":10000,"total":10000,"x":11,"y":4},"type-word":{"above":10000,"below":7454,"total":10000,"x":55,"y":4}},"collection-13":{"hapax-token":{"above":10000,"below":8220,"total":10000,"x":8,"y":1},"hapax-word":{"above":10000,"below":3279,"total":10000,"x":35,"y":1},"token-word":{"above":8327,"below":4124,"total":10000,"x":35,"y":8},"type-token":{"above":10000,"below":10000,"total":10000,"x":8,"y":2},"type-word":{"above":10000,"below":4124,"total":10000,"x":35,"y":2}},"collection-14":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":10,"y":3},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":50,"y":3},"token-word":{"above":10000,"below":4135,"total":10000,"x":50,"y":10},"type-token":{"above":10000,"below":10000,"total":10000,"x":10,"y":4},"type-word":{"above":10000,"below":7454,"total":10000,"x":50,"y":4}},"collection-15":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":17,"y":2},"hapax-word":{"above":10000,"below":5782,"total":10000,"x":45,"y":2},"token-word":{"above":5035,"below":7454,"total":10000,"x":45,"y":17},"type-token":{"above":10000,"below":10000,"total":10000,"x":17,"y":4},"type-word":{"above":8327,"below":7454,"total":10000,"x":45,"y":4}},"collection-16":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":19,"y":3},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":60,"y":3},"token-word":{"above":10000,"below":10000,"total":10000,"x":60,"y":19},"type-token":{"above":10000,"below":10000,"total":10000,"x":19,"y":5},"type-word":{"above":10000,"below":10000,"total":10000,"x":60,"y":5}}}},"check-g":{"example":{"collection-1":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"token-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"type-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"type-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0}},"collection-2":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":0},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":1,"y":0},"token-word":{"above":10000,"below":10000,"total":10000,"x":1,"y":2},"type-token":{"above":10000,"below":10000,"total":10000,"x":2,"y":1},"type-word":{"above":10000,"below":10000,"total":10000,"x":1,"y":1}}}},"check-h":{"example":{"collection-1":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"token-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"type-token":{"above":10000,"below":10000,"total":10000,"x":0,"y":0},"type-word":{"above":10000,"below":10000,"total":10000,"x":0,"y":0}},"collection-2":{"hapax-token":{"above":9813,"below":585,"total":10000,"x":1871,"y":31},"hapax-word":{"above":9723,"below":826,"total":10000,"x":272,"y":31},"token-word":{"above":1959,"below":8841,"total":10000,"x":272,"y":1871},"type-token":{"above":7832,"below":3494,"total":10000,"x":1871,"y":94},"type-word":{"above":5770,"below":5709,"total":10000,"x":272,"y":94}},"collection-3":{"hapax-token":{"above":9785,"below":667,"total":10000,"x":1818,"y":31},"hapax-word":{"above":9851,"below":480,"total":10000,"x":300,"y":31},"token-word":{"above":8668,"below":2132,"total":10000,"x":300,"y":1818},"type-token":{"above":8843,"below":2154,"total":10000,"x":1818,"y":91},"type-word":{"above":9531,"below":1039,"total":10000,"x":300,"y":91}},"collection-4":{"hapax-token":{"above":10000,"below":10000,"total":10000,"x":3689,"y":34},"hapax-word":{"above":10000,"below":10000,"total":10000,"x":572,"y":34},"token-word":{"above":10000,"below":10000,"total":10000,"x":572,"y":3689},"type-token":{"above":10000,"below":10000,"total":10000,"x":3689,"y":123},"type-word":{"above":10000,"below":10000,"total":10000,"x":572,"y":123}}}}},"result_q":{"1":{"collectioncode":"collection-3","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.048,"q":23.04,"side":"below","statcode":"hapax-word"},"2":{"collectioncode":"collection-2","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.0585,"q":14.040000000000001,"side":"below","statcode":"hapax-token"},"3":{"collectioncode":"collection-3","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.0667,"q":10.671999999999999,"side":"below","statcode":"hapax-token"},"4":{"collectioncode":"collection-2","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.0826,"q":9.912,"side":"below","statcode":"hapax-word"},"5":{"collectioncode":"collection-3","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.1039,"q":9.974400000000001,"side":"below","statcode":"type-word"},"6":{"collectioncode":"collection-3","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.1233,"q":9.864,"side":"above","statcode":"token-word"},"7":{"collectioncode":"collection-1","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.1258,"q":8.626285714285714,"side":"below","statcode":"type-word"},"8":{"collectioncode":"collection-2","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.1258,"q":7.548,"side":"below","statcode":"type-word"},"9":{"collectioncode":"collection-07","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.1655,"q":8.826666666666668,"side":"above","statcode":"token-word"},"10":{"collectioncode":"collection-10","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.1673,"q":8.0304,"side":"below","statcode":"token-word"},"11":{"collectioncode":"collection-1","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.1822,"q":7.9505454545454555,"side":"below","statcode":"token-word"},"12":{"collectioncode":"collection-2","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.1822,"q":7.287999999999999,"side":"below","statcode":"token-word"},"13":{"collectioncode":"collection-3","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.1949,"q":7.196307692307692,"side":"above","statcode":"type-word"},"14":{"collectioncode":"collection-2","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.1959,"q":6.716571428571428,"side":"above","statcode":"token-word"},"15":{"collectioncode":"collection-3","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.2132,"q":6.8224,"side":"below","statcode":"token-word"},"16":{"collectioncode":"collection-3","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.2135,"q":6.405,"side":"above","statcode":"hapax-word"},"17":{"collectioncode":"collection-3","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.2154,"q":6.081882352941177,"side":"below","statcode":"type-token"},"18":{"collectioncode":"collection-09","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.2466,"q":6.5760000000000005,"side":"below","statcode":"hapax-word"},"19":{"collectioncode":"collection-09","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.2466,"q":6.229894736842106,"side":"below","statcode":"token-word"},"20":{"collectioncode":"collection-09","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.2466,"q":5.918400000000001,"side":"below","statcode":"type-word"},"21":{"collectioncode":"collection-09","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.2466,"q":5.636571428571429,"side":"below","statcode":"hapax-word"},"22":{"collectioncode":"collection-09","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.2466,"q":5.380363636363637,"side":"below","statcode":"token-word"},"23":{"collectioncode":"collection-09","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.2466,"q":5.146434782608695,"side":"below","statcode":"type-word"},"24":{"collectioncode":"collection-07","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.2524,"q":5.048,"side":"above","statcode":"token-word"},"25":{"collectioncode":"collection-08","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.2546,"q":4.888319999999999,"side":"above","statcode":"token-word"},"26":{"collectioncode":"collection-08","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.2546,"q":4.700307692307692,"side":"above","statcode":"type-word"},"27":{"collectioncode":"collection-08","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.2546,"q":4.526222222222222,"side":"above","statcode":"token-word"},"28":{"collectioncode":"collection-08","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.2546,"q":4.364571428571429,"side":"above","statcode":"type-word"},"29":{"collectioncode":"collection-13","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.3279,"q":5.427310344827586,"side":"below","statcode":"hapax-word"},"30":{"collectioncode":"collection-10","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.3283,"q":5.2528,"side":"below","statcode":"token-word"},"31":{"collectioncode":"collection-10","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.3283,"q":5.083354838709677,"side":"below","statcode":"type-word"},"32":{"collectioncode":"collection-10","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.3283,"q":4.9245,"side":"below","statcode":"type-word"},"33":{"collectioncode":"collection-07","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.3326,"q":4.837818181818181,"side":"above","statcode":"type-word"},"34":{"collectioncode":"collection-07","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.3326,"q":4.695529411764706,"side":"above","statcode":"type-word"},"35":{"collectioncode":"collection-2","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.3494,"q":4.791771428571428,"side":"below","statcode":"type-token"},"36":{"collectioncode":"collection-3","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.3998,"q":5.330666666666667,"side":"above","statcode":"type-token"},"37":{"collectioncode":"collection-13","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4124,"q":5.350054054054054,"side":"below","statcode":"hapax-word"},"38":{"collectioncode":"collection-13","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4124,"q":5.209263157894737,"side":"below","statcode":"token-word"},"39":{"collectioncode":"collection-13","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4124,"q":5.075692307692307,"side":"below","statcode":"type-word"},"40":{"collectioncode":"collection-13","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4124,"q":4.9488,"side":"below","statcode":"token-word"},"41":{"collectioncode":"collection-13","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4124,"q":4.82809756097561,"side":"below","statcode":"type-word"},"42":{"collectioncode":"collection-14","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4135,"q":4.725714285714286,"side":"below","statcode":"token-word"},"43":{"collectioncode":"collection-14","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4135,"q":4.615813953488372,"side":"below","statcode":"token-word"},"44":{"collectioncode":"collection-03","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4174,"q":4.553454545454546,"side":"above","statcode":"hapax-word"},"45":{"collectioncode":"collection-03","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4174,"q":4.452266666666667,"side":"above","statcode":"token-word"},"46":{"collectioncode":"collection-03","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4174,"q":4.355478260869565,"side":"above","statcode":"type-word"},"47":{"collectioncode":"collection-07","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4174,"q":4.262808510638298,"side":"above","statcode":"hapax-word"},"48":{"collectioncode":"collection-03","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4174,"q":4.1739999999999995,"side":"above","statcode":"token-word"},"49":{"collectioncode":"collection-03","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4174,"q":4.088816326530612,"side":"above","statcode":"type-word"},"50":{"collectioncode":"collection-04","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4186,"q":4.01856,"side":"above","statcode":"token-word"},"51":{"collectioncode":"collection-04","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4186,"q":3.9397647058823533,"side":"above","statcode":"token-word"},"52":{"collectioncode":"collection-06","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4218,"q":3.8935384615384616,"side":"above","statcode":"hapax-word"},"53":{"collectioncode":"collection-04","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4218,"q":3.8200754716981136,"side":"above","statcode":"hapax-word"},"54":{"collectioncode":"collection-06","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4218,"q":3.7493333333333334,"side":"above","statcode":"hapax-word"},"55":{"collectioncode":"collection-08","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4218,"q":3.6811636363636366,"side":"above","statcode":"hapax-word"},"56":{"collectioncode":"collection-12","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4965,"q":4.255714285714285,"side":"below","statcode":"token-word"},"57":{"collectioncode":"collection-10","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4972,"q":4.186947368421053,"side":"below","statcode":"hapax-word"},"58":{"collectioncode":"collection-11","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4972,"q":4.114758620689655,"side":"below","statcode":"token-word"},"59":{"collectioncode":"collection-11","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.4972,"q":4.045016949152543,"side":"below","statcode":"type-word"},"60":{"collectioncode":"collection-11","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4972,"q":3.9776,"side":"below","statcode":"token-word"},"61":{"collectioncode":"collection-11","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4972,"q":3.912393442622951,"side":"below","statcode":"type-word"},"62":{"collectioncode":"collection-05","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.4987,"q":3.860903225806451,"side":"above","statcode":"token-word"},"63":{"collectioncode":"collection-02","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.5013,"q":3.819428571428571,"side":"below","statcode":"token-word"},"64":{"collectioncode":"collection-04","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.5028,"q":3.7710000000000004,"side":"above","statcode":"type-word"},"65":{"collectioncode":"collection-06","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.5028,"q":3.7129846153846158,"side":"above","statcode":"token-word"},"66":{"collectioncode":"collection-06","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.5028,"q":3.656727272727273,"side":"above","statcode":"type-word"},"67":{"collectioncode":"collection-04","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.5028,"q":3.6021492537313433,"side":"above","statcode":"type-word"},"68":{"collectioncode":"collection-06","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.5028,"q":3.5491764705882356,"side":"above","statcode":"token-word"},"69":{"collectioncode":"collection-06","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.5028,"q":3.497739130434783,"side":"above","statcode":"type-word"},"70":{"collectioncode":"collection-15","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.5035,"q":3.452571428571428,"side":"above","statcode":"token-word"},"71":{"collectioncode":"collection-2","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.5709,"q":3.8596056338028166,"side":"below","statcode":"type-word"},"72":{"collectioncode":"collection-2","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.577,"q":3.8466666666666667,"side":"above","statcode":"type-word"},"73":{"collectioncode":"collection-10","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.5782,"q":3.8018630136986307,"side":"below","statcode":"hapax-word"},"74":{"collectioncode":"collection-11","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.5782,"q":3.7504864864864866,"side":"below","statcode":"hapax-word"},"75":{"collectioncode":"collection-15","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.5782,"q":3.70048,"side":"below","statcode":"hapax-word"},"76":{"collectioncode":"collection-04","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.5876,"q":3.7111578947368424,"side":"above","statcode":"hapax-word"},"77":{"collectioncode":"collection-08","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.5876,"q":3.6629610389610385,"side":"above","statcode":"hapax-word"},"78":{"collectioncode":"collection-1","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.5902,"q":3.6319999999999997,"side":"below","statcode":"token-word"},"79":{"collectioncode":"collection-1","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.5902,"q":3.586025316455696,"side":"below","statcode":"type-word"},"80":{"collectioncode":"collection-2","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.5902,"q":3.5412,"side":"below","statcode":"token-word"},"81":{"collectioncode":"collection-2","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.5902,"q":3.497481481481481,"side":"below","statcode":"type-word"},"82":{"collectioncode":"collection-3","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.6099,"q":3.5701463414634147,"side":"above","statcode":"token-word"},"83":{"collectioncode":"collection-3","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.6121,"q":3.539855421686747,"side":"above","statcode":"hapax-token"},"84":{"collectioncode":"collection-1","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.6276,"q":3.5862857142857147,"side":"below","statcode":"hapax-word"},"85":{"collectioncode":"collection-2","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.6276,"q":3.544094117647059,"side":"below","statcode":"hapax-word"},"86":{"collectioncode":"collection-1","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.6539,"q":3.6496744186046515,"side":"below","statcode":"hapax-word"},"87":{"collectioncode":"collection-2","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.6539,"q":3.6077241379310347,"side":"below","statcode":"hapax-word"},"88":{"collectioncode":"collection-14","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.6624,"q":3.6130909090909094,"side":"above","statcode":"hapax-word"},"89":{"collectioncode":"collection-15","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.6705,"q":3.616179775280899,"side":"above","statcode":"token-word"},"90":{"collectioncode":"collection-02","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.6721,"q":3.5845333333333333,"side":"above","statcode":"hapax-word"},"91":{"collectioncode":"collection-03","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.6721,"q":3.5451428571428574,"side":"above","statcode":"hapax-word"},"92":{"collectioncode":"collection-07","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.6721,"q":3.506608695652174,"side":"above","statcode":"hapax-word"},"93":{"collectioncode":"collection-3","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.6869,"q":3.545290322580645,"side":"above","statcode":"type-word"},"94":{"collectioncode":"collection-3","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.715,"q":3.6510638297872338,"side":"below","statcode":"hapax-word"},"95":{"collectioncode":"collection-02","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7445,"q":3.761684210526316,"side":"below","statcode":"token-word"},"96":{"collectioncode":"collection-02","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7445,"q":3.7225,"side":"below","statcode":"type-word"},"97":{"collectioncode":"collection-02","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.7445,"q":3.6841237113402063,"side":"below","statcode":"type-word"},"98":{"collectioncode":"collection-12","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7454,"q":3.650938775510204,"side":"below","statcode":"token-word"},"99":{"collectioncode":"collection-12","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7454,"q":3.614060606060606,"side":"below","statcode":"type-word"},"100":{"collectioncode":"collection-14","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7454,"q":3.5779199999999998,"side":"below","statcode":"type-word"},"101":{"collectioncode":"collection-15","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7454,"q":3.54249504950495,"side":"below","statcode":"token-word"},"102":{"collectioncode":"collection-15","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7454,"q":3.507764705882353,"side":"below","statcode":"type-word"},"103":{"collectioncode":"collection-12","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.7454,"q":3.4737087378640776,"side":"below","statcode":"type-word"},"104":{"collectioncode":"collection-14","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.7454,"q":3.440307692307692,"side":"below","statcode":"type-word"},"105":{"collectioncode":"collection-15","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.7454,"q":3.407542857142857,"side":"below","statcode":"token-word"},"106":{"collectioncode":"collection-15","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.7454,"q":3.375396226415094,"side":"below","statcode":"type-word"},"107":{"collectioncode":"collection-02","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7534,"q":3.379738317757009,"side":"above","statcode":"hapax-word"},"108":{"collectioncode":"collection-02","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7534,"q":3.348444444444444,"side":"above","statcode":"token-word"},"109":{"collectioncode":"collection-02","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7534,"q":3.3177247706422017,"side":"above","statcode":"type-word"},"110":{"collectioncode":"collection-05","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7534,"q":3.2875636363636365,"side":"above","statcode":"hapax-word"},"111":{"collectioncode":"collection-05","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7534,"q":3.2579459459459454,"side":"above","statcode":"token-word"},"112":{"collectioncode":"collection-05","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.7534,"q":3.2288571428571426,"side":"above","statcode":"type-word"},"113":{"collectioncode":"collection-02","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.7534,"q":3.200283185840708,"side":"above","statcode":"token-word"},"114":{"collectioncode":"collection-02","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.7534,"q":3.1722105263157894,"side":"above","statcode":"type-word"},"115":{"collectioncode":"collection-05","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.7534,"q":3.1446260869565212,"side":"above","statcode":"hapax-word"},"116":{"collectioncode":"collection-05","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.7534,"q":3.11751724137931,"side":"above","statcode":"type-word"},"117":{"collectioncode":"collection-1","corpuscode":"check-a","datasetcode":"example","n":480,"p":0.7621,"q":3.1265641025641027,"side":"below","statcode":"hapax-word"},"118":{"collectioncode":"collection-1","corpuscode":"check-a","datasetcode":"example","n":480,"p":0.7621,"q":3.1000677966101695,"side":"below","statcode":"token-word"},"119":{"collectioncode":"collection-1","corpuscode":"check-a","datasetcode":"example","n":480,"p":0.7621,"q":3.074016806722689,"side":"below","statcode":"type-word"},"120":{"collectioncode":"collection-1","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.7621,"q":3.0484,"side":"below","statcode":"token-word"},"121":{"collectioncode":"collection-1","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.7621,"q":3.023206611570248,"side":"below","statcode":"type-word"},"122":{"collectioncode":"collection-2","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.7621,"q":2.9984262295081967,"side":"below","statcode":"token-word"},"123":{"collectioncode":"collection-2","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.7621,"q":2.9740487804878053,"side":"below","statcode":"type-word"},"124":{"collectioncode":"collection-3","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.7796,"q":3.017806451612903,"side":"above","statcode":"token-word"},"125":{"collectioncode":"collection-3","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.7796,"q":2.9936639999999994,"side":"above","statcode":"type-word"},"126":{"collectioncode":"collection-2","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.7832,"q":2.9836190476190474,"side":"above","statcode":"type-token"},"127":{"collectioncode":"collection-05","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.822,"q":3.1067716535433068,"side":"below","statcode":"hapax-token"},"128":{"collectioncode":"collection-13","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.822,"q":3.0825,"side":"below","statcode":"hapax-token"},"129":{"collectioncode":"collection-11","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.8327,"q":3.098418604651163,"side":"above","statcode":"hapax-word"},"130":{"collectioncode":"collection-11","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.8327,"q":3.0745846153846155,"side":"above","statcode":"token-word"},"131":{"collectioncode":"collection-11","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.8327,"q":3.051114503816794,"side":"above","statcode":"type-word"},"132":{"collectioncode":"collection-15","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.8327,"q":3.0279999999999996,"side":"above","statcode":"hapax-word"},"133":{"collectioncode":"collection-15","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.8327,"q":3.005233082706767,"side":"above","statcode":"type-word"},"134":{"collectioncode":"collection-11","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.8327,"q":2.9828059701492537,"side":"above","statcode":"token-word"},"135":{"collectioncode":"collection-11","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.8327,"q":2.9607111111111113,"side":"above","statcode":"type-word"},"136":{"collectioncode":"collection-13","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.8327,"q":2.938941176470588,"side":"above","statcode":"token-word"},"137":{"collectioncode":"collection-15","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.8327,"q":2.9174890510948908,"side":"above","statcode":"type-word"},"138":{"collectioncode":"collection-1","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.8341,"q":2.901217391304348,"side":"below","statcode":"type-token"},"139":{"collectioncode":"collection-2","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.8341,"q":2.8803453237410066,"side":"below","statcode":"type-token"},"140":{"collectioncode":"collection-06","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.8345,"q":2.861142857142857,"side":"below","statcode":"token-word"},"141":{"collectioncode":"collection-04","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.8345,"q":2.840851063829787,"side":"below","statcode":"token-word"},"142":{"collectioncode":"collection-06","corpuscode":"check-f","datasetcode":"example","n":480,"p":0.8345,"q":2.820845070422535,"side":"below","statcode":"token-word"},"143":{"collectioncode":"collection-3","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.8668,"q":2.9095384615384616,"side":"above","statcode":"token-word"},"144":{"collectioncode":"collection-2","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.8841,"q":2.947,"side":"below","statcode":"token-word"},"145":{"collectioncode":"collection-3","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.8843,"q":2.927337931034483,"side":"above","statcode":"type-token"},"146":{"collectioncode":"collection-02","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.9152,"q":3.0088767123287674,"side":"below","statcode":"hapax-word"},"147":{"collectioncode":"collection-04","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.9158,"q":2.990367346938775,"side":"below","statcode":"hapax-word"},"148":{"collectioncode":"collection-08","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.9158,"q":2.9701621621621617,"side":"below","statcode":"hapax-word"},"149":{"collectioncode":"collection-11","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.9158,"q":2.9502281879194627,"side":"below","statcode":"hapax-word"},"150":{"collectioncode":"collection-15","corpuscode":"check-e","datasetcode":"example","n":480,"p":0.9158,"q":2.93056,"side":"below","statcode":"hapax-word"},"151":{"collectioncode":"collection-1","corpuscode":"check-a","datasetcode":"example","n":480,"p":0.9523,"q":3.02717880794702,"side":"above","statcode":"hapax-word"},"152":{"collectioncode":"collection-1","corpuscode":"check-a","datasetcode":"example","n":480,"p":0.9523,"q":3.0072631578947373,"side":"above","statcode":"token-word"},"153":{"collectioncode":"collection-1","corpuscode":"check-a","datasetcode":"example","n":480,"p":0.9523,"q":2.9876078431372552,"side":"above","statcode":"type-word"},"154":{"collectioncode":"collection-1","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.9523,"q":2.9682077922077923,"side":"above","statcode":"token-word"},"155":{"collectioncode":"collection-1","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.9523,"q":2.949058064516129,"side":"above","statcode":"type-word"},"156":{"collectioncode":"collection-2","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.9523,"q":2.9301538461538463,"side":"above","statcode":"token-word"},"157":{"collectioncode":"collection-2","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.9523,"q":2.9114904458598727,"side":"above","statcode":"type-word"},"158":{"collectioncode":"collection-1","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.9523,"q":2.8930632911392404,"side":"above","statcode":"hapax-word"},"159":{"collectioncode":"collection-1","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.9523,"q":2.874867924528302,"side":"above","statcode":"token-word"},"160":{"collectioncode":"collection-1","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.9523,"q":2.8569000000000004,"side":"above","statcode":"type-word"},"161":{"collectioncode":"collection-2","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.9523,"q":2.839155279503106,"side":"above","statcode":"hapax-word"},"162":{"collectioncode":"collection-2","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.9523,"q":2.8216296296296295,"side":"above","statcode":"token-word"},"163":{"collectioncode":"collection-2","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.9523,"q":2.804319018404908,"side":"above","statcode":"type-word"},"164":{"collectioncode":"collection-3","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.9524,"q":2.787512195121951,"side":"below","statcode":"token-word"},"165":{"collectioncode":"collection-3","corpuscode":"check-b","datasetcode":"example","n":480,"p":0.9524,"q":2.770618181818182,"side":"below","statcode":"type-word"},"166":{"collectioncode":"collection-3","corpuscode":"check-d","datasetcode":"example","n":480,"p":0.9524,"q":2.7539277108433735,"side":"below","statcode":"token-word"},"167":{"collectioncode":"collection-3","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.9531,"q":2.7394491017964073,"side":"above","statcode":"type-word"},"168":{"collectioncode":"collection-1","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.968,"q":2.765714285714286,"side":"below","statcode":"hapax-token"},"169":{"collectioncode":"collection-2","corpuscode":"check-c","datasetcode":"example","n":480,"p":0.968,"q":2.749349112426035,"side":"below","statcode":"hapax-token"},"170":{"collectioncode":"collection-2","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.9723,"q":2.7453176470588234,"side":"above","statcode":"hapax-word"},"171":{"collectioncode":"collection-3","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.9785,"q":2.7466666666666666,"side":"above","statcode":"hapax-token"},"172":{"collectioncode":"collection-2","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.9813,"q":2.7385116279069766,"side":"above","statcode":"hapax-token"},"173":{"collectioncode":"collection-3","corpuscode":"check-h","datasetcode":"example","n":480,"p":0.9851,"q":2.7332254335260115,"side":"above","statcode":"hapax-word"},"174":{"collectioncode":"collection-1","corpuscode":"check-a","datasetcode":"example","n":480,"p":1.0,"q":2.7586206896551726,"side":"above","statcode":"hapax-token"},"175":{"collectioncode":"collection-1","corpuscode":"check-a","datasetcode":"example","n":480,"p":1.0,"q":2.742857142857143,"side":"below","statcode":"hapax-token"},"176":{"collectioncode":"collection-1","corpuscode":"check-a","datasetcode":"example","n":480,"p":1.0,"q":2.7272727272727275,"side":"above","statcode":"type-token"},"177":{"collectioncode":"collection-1","corpuscode":"check-a","datasetcode":"example","n":480,"p":1.0,"q":2.711864406779661,"side":"below","statcode":"type-token"},"178":{"collectioncode":"collection-1","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.696629213483146,"side":"above","statcode":"hapax-token"},"179":{"collectioncode":"collection-1","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.6815642458100557,"side":"below","statcode":"hapax-token"},"180":{"collectioncode":"collection-1","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.6666666666666665,"side":"above","statcode":"hapax-word"},"181":{"collectioncode":"collection-1","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.6519337016574585,"side":"below","statcode":"hapax-word"},"182":{"collectioncode":"collection-1","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.6373626373626373,"side":"above","statcode":"type-token"},"183":{"collectioncode":"collection-1","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.6229508196721314,"side":"below","statcode":"type-token"},"184":{"collectioncode":"collection-2","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.608695652173913,"side":"above","statcode":"hapax-token"},"185":{"collectioncode":"collection-2","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.5945945945945943,"side":"below","statcode":"hapax-token"},"186":{"collectioncode":"collection-2","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.5806451612903225,"side":"above","statcode":"hapax-word"},"187":{"collectioncode":"collection-2","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.5668449197860963,"side":"below","statcode":"hapax-word"},"188":{"collectioncode":"collection-2","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.5531914893617023,"side":"above","statcode":"type-token"},"189":{"collectioncode":"collection-2","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.5396825396825395,"side":"below","statcode":"type-token"},"190":{"collectioncode":"collection-3","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.5263157894736845,"side":"above","statcode":"hapax-token"},"191":{"collectioncode":"collection-3","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.513089005235602,"side":"below","statcode":"hapax-token"},"192":{"collectioncode":"collection-3","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.5,"side":"above","statcode":"hapax-word"},"193":{"collectioncode":"collection-3","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.4870466321243523,"side":"below","statcode":"hapax-word"},"194":{"collectioncode":"collection-3","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.4742268041237114,"side":"above","statcode":"type-token"},"195":{"collectioncode":"collection-3","corpuscode":"check-b","datasetcode":"example","n":480,"p":1.0,"q":2.4615384615384617,"side":"below","statcode":"type-token"},"196":{"collectioncode":"collection-1","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.4489795918367347,"side":"above","statcode":"hapax-token"},"197":{"collectioncode":"collection-1","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.436548223350254,"side":"above","statcode":"hapax-word"},"198":{"collectioncode":"collection-1","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.4242424242424243,"side":"above","statcode":"token-word"},"199":{"collectioncode":"collection-1","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.4120603015075375,"side":"above","statcode":"type-token"},"200":{"collectioncode":"collection-1","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.4,"side":"above","statcode":"type-word"},"201":{"collectioncode":"collection-2","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.388059701492537,"side":"above","statcode":"hapax-token"},"202":{"collectioncode":"collection-2","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.376237623762376,"side":"above","statcode":"hapax-word"},"203":{"collectioncode":"collection-2","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.3645320197044337,"side":"above","statcode":"token-word"},"204":{"collectioncode":"collection-2","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.3529411764705883,"side":"above","statcode":"type-token"},"205":{"collectioncode":"collection-2","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.3414634146341466,"side":"above","statcode":"type-word"},"206":{"collectioncode":"collection-3","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.330097087378641,"side":"above","statcode":"hapax-token"},"207":{"collectioncode":"collection-3","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.318840579710145,"side":"below","statcode":"hapax-token"},"208":{"collectioncode":"collection-3","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.3076923076923075,"side":"above","statcode":"hapax-word"},"209":{"collectioncode":"collection-3","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.2966507177033493,"side":"below","statcode":"token-word"},"210":{"collectioncode":"collection-3","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.2857142857142856,"side":"above","statcode":"type-token"},"211":{"collectioncode":"collection-3","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.2748815165876777,"side":"below","statcode":"type-token"},"212":{"collectioncode":"collection-3","corpuscode":"check-c","datasetcode":"example","n":480,"p":1.0,"q":2.2641509433962264,"side":"below","statcode":"type-word"},"213":{"collectioncode":"collection-1","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.2535211267605635,"side":"above","statcode":"hapax-token"},"214":{"collectioncode":"collection-1","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.2429906542056073,"side":"below","statcode":"hapax-token"},"215":{"collectioncode":"collection-1","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.2325581395348837,"side":"above","statcode":"type-token"},"216":{"collectioncode":"collection-1","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.2222222222222223,"side":"below","statcode":"type-token"},"217":{"collectioncode":"collection-2","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.2119815668202767,"side":"above","statcode":"hapax-token"},"218":{"collectioncode":"collection-2","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.2018348623853212,"side":"below","statcode":"hapax-token"},"219":{"collectioncode":"collection-2","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.191780821917808,"side":"above","statcode":"type-token"},"220":{"collectioncode":"collection-2","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.181818181818182,"side":"below","statcode":"type-token"},"221":{"collectioncode":"collection-3","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.1719457013574663,"side":"below","statcode":"hapax-token"},"222":{"collectioncode":"collection-3","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.162162162162162,"side":"below","statcode":"hapax-word"},"223":{"collectioncode":"collection-3","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.1524663677130045,"side":"below","statcode":"type-token"},"224":{"collectioncode":"collection-3","corpuscode":"check-d","datasetcode":"example","n":480,"p":1.0,"q":2.142857142857143,"side":"below","statcode":"type-word"},"225":{"collectioncode":"collection-01","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.1333333333333333,"side":"above","statcode":"hapax-token"},"226":{"collectioncode":"collection-01","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.1238938053097347,"side":"below","statcode":"hapax-token"},"227":{"collectioncode":"collection-01","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.1145374449339207,"side":"above","statcode":"hapax-word"},"228":{"collectioncode":"collection-01","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.1052631578947367,"side":"below","statcode":"hapax-word"},"229":{"collectioncode":"collection-01","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.096069868995633,"side":"above","statcode":"token-word"},"230":{"collectioncode":"collection-01","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.0869565217391304,"side":"below","statcode":"token-word"},"231":{"collectioncode":"collection-01","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.0779220779220777,"side":"above","statcode":"type-token"},"232":{"collectioncode":"collection-01","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.0689655172413794,"side":"below","statcode":"type-token"},"233":{"collectioncode":"collection-01","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.060085836909871,"side":"above","statcode":"type-word"},"234":{"collectioncode":"collection-01","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.0512820512820515,"side":"below","statcode":"type-word"},"235":{"collectioncode":"collection-02","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.042553191489362,"side":"above","statcode":"hapax-token"},"236":{"collectioncode":"collection-02","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.0338983050847457,"side":"below","statcode":"hapax-token"},"237":{"collectioncode":"collection-02","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.0253164556962022,"side":"above","statcode":"type-token"},"238":{"collectioncode":"collection-02","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.0168067226890756,"side":"below","statcode":"type-token"},"239":{"collectioncode":"collection-03","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.00836820083682,"side":"above","statcode":"hapax-token"},"240":{"collectioncode":"collection-03","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":2.0,"side":"below","statcode":"hapax-token"},"241":{"collectioncode":"collection-03","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.991701244813278,"side":"below","statcode":"hapax-word"},"242":{"collectioncode":"collection-03","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.9834710743801653,"side":"below","statcode":"token-word"},"243":{"collectioncode":"collection-03","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.9753086419753088,"side":"above","statcode":"type-token"},"244":{"collectioncode":"collection-03","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.9672131147540985,"side":"below","statcode":"type-token"},"245":{"collectioncode":"collection-03","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.959183673469388,"side":"below","statcode":"type-word"},"246":{"collectioncode":"collection-04","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.9512195121951221,"side":"above","statcode":"hapax-token"},"247":{"collectioncode":"collection-04","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.9433198380566803,"side":"below","statcode":"hapax-token"},"248":{"collectioncode":"collection-04","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.9354838709677418,"side":"below","statcode":"token-word"},"249":{"collectioncode":"collection-04","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.9277108433734937,"side":"above","statcode":"type-token"},"250":{"collectioncode":"collection-04","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.92,"side":"below","statcode":"type-token"},"251":{"collectioncode":"collection-04","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.9123505976095616,"side":"below","statcode":"type-word"},"252":{"collectioncode":"collection-05","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.9047619047619047,"side":"above","statcode":"hapax-token"},"253":{"collectioncode":"collection-05","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.8972332015810276,"side":"below","statcode":"hapax-token"},"254":{"collectioncode":"collection-05","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.889763779527559,"side":"below","statcode":"hapax-word"},"255":{"collectioncode":"collection-05","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.8823529411764706,"side":"below","statcode":"token-word"},"256":{"collectioncode":"collection-05","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.875,"side":"above","statcode":"type-token"},"257":{"collectioncode":"collection-05","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.867704280155642,"side":"below","statcode":"type-token"},"258":{"collectioncode":"collection-05","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.8604651162790697,"side":"below","statcode":"type-word"},"259":{"collectioncode":"collection-06","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.8532818532818534,"side":"above","statcode":"hapax-token"},"260":{"collectioncode":"collection-06","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.8461538461538463,"side":"below","statcode":"hapax-token"},"261":{"collectioncode":"collection-06","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.8390804597701151,"side":"below","statcode":"hapax-word"},"262":{"collectioncode":"collection-06","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.8320610687022902,"side":"above","statcode":"type-token"},"263":{"collectioncode":"collection-06","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.8250950570342204,"side":"below","statcode":"type-token"},"264":{"collectioncode":"collection-06","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.8181818181818181,"side":"below","statcode":"type-word"},"265":{"collectioncode":"collection-07","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.811320754716981,"side":"above","statcode":"hapax-token"},"266":{"collectioncode":"collection-07","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.8045112781954886,"side":"below","statcode":"hapax-token"},"267":{"collectioncode":"collection-07","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.797752808988764,"side":"below","statcode":"hapax-word"},"268":{"collectioncode":"collection-07","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.791044776119403,"side":"below","statcode":"token-word"},"269":{"collectioncode":"collection-07","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7843866171003717,"side":"above","statcode":"type-token"},"270":{"collectioncode":"collection-07","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7777777777777777,"side":"below","statcode":"type-token"},"271":{"collectioncode":"collection-07","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7712177121771218,"side":"below","statcode":"type-word"},"272":{"collectioncode":"collection-08","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7647058823529411,"side":"above","statcode":"hapax-token"},"273":{"collectioncode":"collection-08","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7582417582417582,"side":"below","statcode":"hapax-token"},"274":{"collectioncode":"collection-08","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7518248175182483,"side":"below","statcode":"token-word"},"275":{"collectioncode":"collection-08","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7454545454545456,"side":"above","statcode":"type-token"},"276":{"collectioncode":"collection-08","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7391304347826089,"side":"below","statcode":"type-token"},"277":{"collectioncode":"collection-08","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.732851985559567,"side":"below","statcode":"type-word"},"278":{"collectioncode":"collection-09","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7266187050359711,"side":"above","statcode":"hapax-token"},"279":{"collectioncode":"collection-09","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7204301075268815,"side":"below","statcode":"hapax-token"},"280":{"collectioncode":"collection-09","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7142857142857142,"side":"above","statcode":"hapax-word"},"281":{"collectioncode":"collection-09","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.7081850533807827,"side":"above","statcode":"token-word"},"282":{"collectioncode":"collection-09","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.702127659574468,"side":"above","statcode":"type-token"},"283":{"collectioncode":"collection-09","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.696113074204947,"side":"below","statcode":"type-token"},"284":{"collectioncode":"collection-09","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6901408450704225,"side":"above","statcode":"type-word"},"285":{"collectioncode":"collection-10","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6842105263157894,"side":"above","statcode":"hapax-token"},"286":{"collectioncode":"collection-10","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6783216783216783,"side":"below","statcode":"hapax-token"},"287":{"collectioncode":"collection-10","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6724738675958188,"side":"above","statcode":"hapax-word"},"288":{"collectioncode":"collection-10","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6666666666666667,"side":"above","statcode":"token-word"},"289":{"collectioncode":"collection-10","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6608996539792389,"side":"above","statcode":"type-token"},"290":{"collectioncode":"collection-10","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6551724137931036,"side":"below","statcode":"type-token"},"291":{"collectioncode":"collection-10","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6494845360824744,"side":"above","statcode":"type-word"},"292":{"collectioncode":"collection-11","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6438356164383563,"side":"above","statcode":"hapax-token"},"293":{"collectioncode":"collection-11","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6382252559726962,"side":"below","statcode":"hapax-token"},"294":{"collectioncode":"collection-11","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6326530612244896,"side":"above","statcode":"type-token"},"295":{"collectioncode":"collection-11","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6271186440677965,"side":"below","statcode":"type-token"},"296":{"collectioncode":"collection-12","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6216216216216215,"side":"above","statcode":"hapax-token"},"297":{"collectioncode":"collection-12","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6161616161616161,"side":"below","statcode":"hapax-token"},"298":{"collectioncode":"collection-12","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.610738255033557,"side":"above","statcode":"hapax-word"},"299":{"collectioncode":"collection-12","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.605351170568562,"side":"below","statcode":"hapax-word"},"300":{"collectioncode":"collection-12","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.6,"side":"above","statcode":"token-word"},"301":{"collectioncode":"collection-12","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5946843853820598,"side":"above","statcode":"type-token"},"302":{"collectioncode":"collection-12","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.589403973509934,"side":"below","statcode":"type-token"},"303":{"collectioncode":"collection-12","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5841584158415842,"side":"above","statcode":"type-word"},"304":{"collectioncode":"collection-13","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5789473684210527,"side":"above","statcode":"hapax-token"},"305":{"collectioncode":"collection-13","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5737704918032789,"side":"below","statcode":"hapax-token"},"306":{"collectioncode":"collection-13","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5686274509803924,"side":"above","statcode":"hapax-word"},"307":{"collectioncode":"collection-13","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5635179153094463,"side":"above","statcode":"token-word"},"308":{"collectioncode":"collection-13","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5584415584415583,"side":"above","statcode":"type-token"},"309":{"collectioncode":"collection-13","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5533980582524272,"side":"below","statcode":"type-token"},"310":{"collectioncode":"collection-13","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5483870967741935,"side":"above","statcode":"type-word"},"311":{"collectioncode":"collection-14","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5434083601286173,"side":"above","statcode":"hapax-token"},"312":{"collectioncode":"collection-14","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5384615384615383,"side":"below","statcode":"hapax-token"},"313":{"collectioncode":"collection-14","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5335463258785942,"side":"below","statcode":"hapax-word"},"314":{"collectioncode":"collection-14","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5286624203821655,"side":"above","statcode":"token-word"},"315":{"collectioncode":"collection-14","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5238095238095237,"side":"above","statcode":"type-token"},"316":{"collectioncode":"collection-14","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.518987341772152,"side":"below","statcode":"type-token"},"317":{"collectioncode":"collection-14","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5141955835962146,"side":"above","statcode":"type-word"},"318":{"collectioncode":"collection-15","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.509433962264151,"side":"above","statcode":"hapax-token"},"319":{"collectioncode":"collection-15","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5047021943573669,"side":"below","statcode":"hapax-token"},"320":{"collectioncode":"collection-15","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.5,"side":"above","statcode":"type-token"},"321":{"collectioncode":"collection-15","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.4953271028037385,"side":"below","statcode":"type-token"},"322":{"collectioncode":"collection-16","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.4906832298136647,"side":"above","statcode":"hapax-token"},"323":{"collectioncode":"collection-16","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.4860681114551082,"side":"below","statcode":"hapax-token"},"324":{"collectioncode":"collection-16","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.4814814814814814,"side":"above","statcode":"hapax-word"},"325":{"collectioncode":"collection-16","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.4769230769230768,"side":"below","statcode":"hapax-word"},"326":{"collectioncode":"collection-16","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.4723926380368098,"side":"above","statcode":"token-word"},"327":{"collectioncode":"collection-16","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.4678899082568806,"side":"below","statcode":"token-word"},"328":{"collectioncode":"collection-16","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.4634146341463414,"side":"above","statcode":"type-token"},"329":{"collectioncode":"collection-16","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.458966565349544,"side":"below","statcode":"type-token"},"330":{"collectioncode":"collection-16","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.4545454545454546,"side":"above","statcode":"type-word"},"331":{"collectioncode":"collection-16","corpuscode":"check-e","datasetcode":"example","n":480,"p":1.0,"q":1.4501510574018126,"side":"below","statcode":"type-word"},"332":{"collectioncode":"collection-01","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.4457831325301205,"side":"above","statcode":"hapax-token"},"333":{"collectioncode":"collection-01","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.4414414414414416,"side":"below","statcode":"hapax-token"},"334":{"collectioncode":"collection-01","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.437125748502994,"side":"above","statcode":"hapax-word"},"335":{"collectioncode":"collection-01","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.4328358208955225,"side":"below","statcode":"hapax-word"},"336":{"collectioncode":"collection-01","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.4285714285714286,"side":"above","statcode":"token-word"},"337":{"collectioncode":"collection-01","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.42433234421365,"side":"below","statcode":"token-word"},"338":{"collectioncode":"collection-01","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.4201183431952662,"side":"above","statcode":"type-token"},"339":{"collectioncode":"collection-01","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.415929203539823,"side":"below","statcode":"type-token"},"340":{"collectioncode":"collection-01","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.4117647058823528,"side":"above","statcode":"type-word"},"341":{"collectioncode":"collection-01","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.407624633431085,"side":"below","statcode":"type-word"},"342":{"collectioncode":"collection-02","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.4035087719298245,"side":"above","statcode":"hapax-token"},"343":{"collectioncode":"collection-02","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3994169096209912,"side":"below","statcode":"hapax-token"},"344":{"collectioncode":"collection-02","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3953488372093024,"side":"below","statcode":"hapax-word"},"345":{"collectioncode":"collection-02","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.391304347826087,"side":"above","statcode":"type-token"},"346":{"collectioncode":"collection-02","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3872832369942196,"side":"below","statcode":"type-token"},"347":{"collectioncode":"collection-03","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.38328530259366,"side":"above","statcode":"hapax-token"},"348":{"collectioncode":"collection-03","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3793103448275863,"side":"below","statcode":"hapax-token"},"349":{"collectioncode":"collection-03","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3753581661891119,"side":"below","statcode":"hapax-word"},"350":{"collectioncode":"collection-03","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3714285714285714,"side":"below","statcode":"token-word"},"351":{"collectioncode":"collection-03","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3675213675213675,"side":"above","statcode":"type-token"},"352":{"collectioncode":"collection-03","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3636363636363638,"side":"below","statcode":"type-token"},"353":{"collectioncode":"collection-03","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3597733711048157,"side":"below","statcode":"type-word"},"354":{"collectioncode":"collection-04","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3559322033898304,"side":"above","statcode":"hapax-token"},"355":{"collectioncode":"collection-04","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.352112676056338,"side":"below","statcode":"hapax-token"},"356":{"collectioncode":"collection-04","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.348314606741573,"side":"below","statcode":"hapax-word"},"357":{"collectioncode":"collection-04","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3445378151260503,"side":"above","statcode":"type-token"},"358":{"collectioncode":"collection-04","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3407821229050279,"side":"below","statcode":"type-token"},"359":{"collectioncode":"collection-04","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3370473537604457,"side":"below","statcode":"type-word"},"360":{"collectioncode":"collection-05","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3333333333333333,"side":"above","statcode":"hapax-token"},"361":{"collectioncode":"collection-05","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3296398891966759,"side":"below","statcode":"hapax-word"},"362":{"collectioncode":"collection-05","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3259668508287292,"side":"below","statcode":"token-word"},"363":{"collectioncode":"collection-05","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.322314049586777,"side":"above","statcode":"type-token"},"364":{"collectioncode":"collection-05","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3186813186813187,"side":"below","statcode":"type-token"},"365":{"collectioncode":"collection-05","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.315068493150685,"side":"below","statcode":"type-word"},"366":{"collectioncode":"collection-06","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3114754098360657,"side":"above","statcode":"hapax-token"},"367":{"collectioncode":"collection-06","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3079019073569482,"side":"below","statcode":"hapax-token"},"368":{"collectioncode":"collection-06","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3043478260869565,"side":"below","statcode":"hapax-word"},"369":{"collectioncode":"collection-06","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.3008130081300813,"side":"above","statcode":"type-token"},"370":{"collectioncode":"collection-06","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2972972972972971,"side":"below","statcode":"type-token"},"371":{"collectioncode":"collection-06","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2938005390835579,"side":"below","statcode":"type-word"},"372":{"collectioncode":"collection-07","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2903225806451613,"side":"above","statcode":"hapax-token"},"373":{"collectioncode":"collection-07","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2868632707774799,"side":"below","statcode":"hapax-token"},"374":{"collectioncode":"collection-07","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2834224598930482,"side":"below","statcode":"hapax-word"},"375":{"collectioncode":"collection-07","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.28,"side":"below","statcode":"token-word"},"376":{"collectioncode":"collection-07","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2765957446808511,"side":"above","statcode":"type-token"},"377":{"collectioncode":"collection-07","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.273209549071618,"side":"below","statcode":"type-token"},"378":{"collectioncode":"collection-07","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2698412698412698,"side":"below","statcode":"type-word"},"379":{"collectioncode":"collection-08","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.266490765171504,"side":"above","statcode":"hapax-token"},"380":{"collectioncode":"collection-08","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2631578947368423,"side":"below","statcode":"hapax-token"},"381":{"collectioncode":"collection-08","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2598425196850394,"side":"below","statcode":"hapax-word"},"382":{"collectioncode":"collection-08","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.256544502617801,"side":"below","statcode":"token-word"},"383":{"collectioncode":"collection-08","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2532637075718014,"side":"above","statcode":"type-token"},"384":{"collectioncode":"collection-08","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.25,"side":"below","statcode":"type-token"},"385":{"collectioncode":"collection-08","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2467532467532467,"side":"below","statcode":"type-word"},"386":{"collectioncode":"collection-09","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2435233160621761,"side":"above","statcode":"hapax-token"},"387":{"collectioncode":"collection-09","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2403100775193798,"side":"below","statcode":"hapax-token"},"388":{"collectioncode":"collection-09","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2371134020618557,"side":"above","statcode":"hapax-word"},"389":{"collectioncode":"collection-09","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2339331619537275,"side":"above","statcode":"token-word"},"390":{"collectioncode":"collection-09","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2307692307692308,"side":"above","statcode":"type-token"},"391":{"collectioncode":"collection-09","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.227621483375959,"side":"below","statcode":"type-token"},"392":{"collectioncode":"collection-09","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2244897959183674,"side":"above","statcode":"type-word"},"393":{"collectioncode":"collection-10","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2213740458015268,"side":"above","statcode":"hapax-token"},"394":{"collectioncode":"collection-10","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.218274111675127,"side":"below","statcode":"hapax-token"},"395":{"collectioncode":"collection-10","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2151898734177216,"side":"above","statcode":"hapax-word"},"396":{"collectioncode":"collection-10","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2121212121212122,"side":"above","statcode":"token-word"},"397":{"collectioncode":"collection-10","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2090680100755669,"side":"above","statcode":"type-token"},"398":{"collectioncode":"collection-10","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2060301507537687,"side":"below","statcode":"type-token"},"399":{"collectioncode":"collection-10","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2030075187969924,"side":"above","statcode":"type-word"},"400":{"collectioncode":"collection-11","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.2,"side":"above","statcode":"hapax-token"},"401":{"collectioncode":"collection-11","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1970074812967582,"side":"below","statcode":"hapax-token"},"402":{"collectioncode":"collection-11","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1940298507462686,"side":"above","statcode":"hapax-word"},"403":{"collectioncode":"collection-11","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1910669975186103,"side":"above","statcode":"type-token"},"404":{"collectioncode":"collection-11","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.188118811881188,"side":"below","statcode":"type-token"},"405":{"collectioncode":"collection-12","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1851851851851851,"side":"above","statcode":"hapax-token"},"406":{"collectioncode":"collection-12","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1822660098522169,"side":"below","statcode":"hapax-token"},"407":{"collectioncode":"collection-12","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1793611793611793,"side":"above","statcode":"hapax-word"},"408":{"collectioncode":"collection-12","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1764705882352942,"side":"below","statcode":"hapax-word"},"409":{"collectioncode":"collection-12","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.17359413202934,"side":"above","statcode":"token-word"},"410":{"collectioncode":"collection-12","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1707317073170733,"side":"above","statcode":"type-token"},"411":{"collectioncode":"collection-12","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1678832116788322,"side":"below","statcode":"type-token"},"412":{"collectioncode":"collection-12","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1650485436893205,"side":"above","statcode":"type-word"},"413":{"collectioncode":"collection-13","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.162227602905569,"side":"above","statcode":"hapax-token"},"414":{"collectioncode":"collection-13","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1594202898550725,"side":"above","statcode":"hapax-word"},"415":{"collectioncode":"collection-13","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1566265060240963,"side":"above","statcode":"type-token"},"416":{"collectioncode":"collection-13","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1538461538461537,"side":"below","statcode":"type-token"},"417":{"collectioncode":"collection-13","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1510791366906474,"side":"above","statcode":"type-word"},"418":{"collectioncode":"collection-14","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1483253588516746,"side":"above","statcode":"hapax-token"},"419":{"collectioncode":"collection-14","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1455847255369929,"side":"below","statcode":"hapax-token"},"420":{"collectioncode":"collection-14","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1428571428571428,"side":"above","statcode":"hapax-word"},"421":{"collectioncode":"collection-14","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1401425178147269,"side":"below","statcode":"hapax-word"},"422":{"collectioncode":"collection-14","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1374407582938388,"side":"above","statcode":"token-word"},"423":{"collectioncode":"collection-14","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1347517730496455,"side":"above","statcode":"type-token"},"424":{"collectioncode":"collection-14","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1320754716981132,"side":"below","statcode":"type-token"},"425":{"collectioncode":"collection-14","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1294117647058823,"side":"above","statcode":"type-word"},"426":{"collectioncode":"collection-15","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1267605633802817,"side":"above","statcode":"hapax-token"},"427":{"collectioncode":"collection-15","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.124121779859485,"side":"below","statcode":"hapax-token"},"428":{"collectioncode":"collection-15","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1214953271028036,"side":"above","statcode":"hapax-word"},"429":{"collectioncode":"collection-15","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1188811188811187,"side":"above","statcode":"type-token"},"430":{"collectioncode":"collection-15","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1162790697674418,"side":"below","statcode":"type-token"},"431":{"collectioncode":"collection-16","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1136890951276102,"side":"above","statcode":"hapax-token"},"432":{"collectioncode":"collection-16","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1111111111111112,"side":"below","statcode":"hapax-token"},"433":{"collectioncode":"collection-16","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1085450346420322,"side":"above","statcode":"hapax-word"},"434":{"collectioncode":"collection-16","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1059907834101383,"side":"below","statcode":"hapax-word"},"435":{"collectioncode":"collection-16","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.103448275862069,"side":"above","statcode":"token-word"},"436":{"collectioncode":"collection-16","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.1009174311926606,"side":"below","statcode":"token-word"},"437":{"collectioncode":"collection-16","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.0983981693363845,"side":"above","statcode":"type-token"},"438":{"collectioncode":"collection-16","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.095890410958904,"side":"below","statcode":"type-token"},"439":{"collectioncode":"collection-16","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.0933940774487472,"side":"above","statcode":"type-word"},"440":{"collectioncode":"collection-16","corpuscode":"check-f","datasetcode":"example","n":480,"p":1.0,"q":1.090909090909091,"side":"below","statcode":"type-word"},"441":{"collectioncode":"collection-1","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.08843537414966,"side":"above","statcode":"hapax-token"},"442":{"collectioncode":"collection-1","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0859728506787332,"side":"below","statcode":"hapax-token"},"443":{"collectioncode":"collection-1","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0835214446952595,"side":"above","statcode":"hapax-word"},"444":{"collectioncode":"collection-1","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.081081081081081,"side":"below","statcode":"hapax-word"},"445":{"collectioncode":"collection-1","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0786516853932584,"side":"above","statcode":"token-word"},"446":{"collectioncode":"collection-1","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0762331838565022,"side":"below","statcode":"token-word"},"447":{"collectioncode":"collection-1","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0738255033557047,"side":"above","statcode":"type-token"},"448":{"collectioncode":"collection-1","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0714285714285714,"side":"below","statcode":"type-token"},"449":{"collectioncode":"collection-1","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0690423162583518,"side":"above","statcode":"type-word"},"450":{"collectioncode":"collection-1","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0666666666666667,"side":"below","statcode":"type-word"},"451":{"collectioncode":"collection-2","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.06430155210643,"side":"above","statcode":"hapax-token"},"452":{"collectioncode":"collection-2","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0619469026548674,"side":"below","statcode":"hapax-token"},"453":{"collectioncode":"collection-2","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0596026490066226,"side":"above","statcode":"hapax-word"},"454":{"collectioncode":"collection-2","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0572687224669604,"side":"below","statcode":"hapax-word"},"455":{"collectioncode":"collection-2","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.054945054945055,"side":"above","statcode":"token-word"},"456":{"collectioncode":"collection-2","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0526315789473684,"side":"below","statcode":"token-word"},"457":{"collectioncode":"collection-2","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.050328227571116,"side":"above","statcode":"type-token"},"458":{"collectioncode":"collection-2","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0480349344978166,"side":"below","statcode":"type-token"},"459":{"collectioncode":"collection-2","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0457516339869282,"side":"above","statcode":"type-word"},"460":{"collectioncode":"collection-2","corpuscode":"check-g","datasetcode":"example","n":480,"p":1.0,"q":1.0434782608695652,"side":"below","statcode":"type-word"},"461":{"collectioncode":"collection-1","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0412147505422993,"side":"above","statcode":"hapax-token"},"462":{"collectioncode":"collection-1","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0389610389610389,"side":"below","statcode":"hapax-token"},"463":{"collectioncode":"collection-1","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.036717062634989,"side":"above","statcode":"hapax-word"},"464":{"collectioncode":"collection-1","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0344827586206897,"side":"below","statcode":"hapax-word"},"465":{"collectioncode":"collection-1","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.032258064516129,"side":"above","statcode":"token-word"},"466":{"collectioncode":"collection-1","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0300429184549356,"side":"below","statcode":"token-word"},"467":{"collectioncode":"collection-1","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0278372591006424,"side":"above","statcode":"type-token"},"468":{"collectioncode":"collection-1","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0256410256410258,"side":"below","statcode":"type-token"},"469":{"collectioncode":"collection-1","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.023454157782516,"side":"above","statcode":"type-word"},"470":{"collectioncode":"collection-1","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.021276595744681,"side":"below","statcode":"type-word"},"471":{"collectioncode":"collection-4","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.019108280254777,"side":"above","statcode":"hapax-token"},"472":{"collectioncode":"collection-4","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0169491525423728,"side":"below","statcode":"hapax-token"},"473":{"collectioncode":"collection-4","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.014799154334038,"side":"above","statcode":"hapax-word"},"474":{"collectioncode":"collection-4","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0126582278481011,"side":"below","statcode":"hapax-word"},"475":{"collectioncode":"collection-4","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0105263157894737,"side":"above","statcode":"token-word"},"476":{"collectioncode":"collection-4","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0084033613445378,"side":"below","statcode":"token-word"},"477":{"collectioncode":"collection-4","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0062893081761006,"side":"above","statcode":"type-token"},"478":{"collectioncode":"collection-4","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.00418410041841,"side":"below","statcode":"type-token"},"479":{"collectioncode":"collection-4","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0020876826722338,"side":"above","statcode":"type-word"},"480":{"collectioncode":"collection-4","corpuscode":"check-h","datasetcode":"example","n":480,"p":1.0,"q":1.0,"side":"below","statcode":"type-word"}},"result_curve":{"check-a":{"example":{"hapax-token":{"0.0001":{"lower":{"id":801,"iterations":10000,"xslots":9,"yslots":9},"upper":{"id":806,"iterations":10000,"xslots":9,"yslots":9}},"0.001":{"lower":{"id":802,"iterations":10000,"xslots":9,"yslots":9},"upper":{"id":807,"iterations":10000,"xslots":9,"yslots":9}},"0.01":{"lower":{"id":803,"iterations":10000,"xslots":9,"yslots":9},"upper":{"id":808,"iterations":10000,"xslots":9,"yslots":9}},"0.1":{"lower":{"id":805,"iterations":10000,"xslots":9,"yslots":9},"upper":{"id":810,"iterations":10000,"xslots":9,"yslots":9}}},"hapax-word":{"0.0001":{"lower":{"id":791,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":796,"iterations":10000,"xslots":61,"yslots":9}},"0.001":{"lower":{"id":792,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":797,"iterations":10000,"xslots":61,"yslots":9}},"0.01":{"lower":{"id":793,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":798,"iterations":10000,"xslots":61,"yslots":9}},"0.1":{"lower":{"id":795,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":800,"iterations":10000,"xslots":61,"yslots":9}}},"token-word":{"0.0001":{"lower":{"id":811,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":816,"iterations":10000,"xslots":61,"yslots":9}},"0.001":{"lower":{"id":812,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":817,"iterations":10000,"xslots":61,"yslots":9}},"0.01":{"lower":{"id":813,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":818,"iterations":10000,"xslots":61,"yslots":9}},"0.1":{"lower":{"id":815,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":820,"iterations":10000,"xslots":61,"yslots":9}}},"type-token":{"0.0001":{"lower":{"id":781,"iterations":10000,"xslots":9,"yslots":9},"upper":{"id":786,"iterations":10000,"xslots":9,"yslots":9}},"0.001":{"lower":{"id":782,"iterations":10000,"xslots":9,"yslots":9},"upper":{"id":787,"iterations":10000,"xslots":9,"yslots":9}},"0.01":{"lower":{"id":783,"iterations":10000,"xslots":9,"yslots":9},"upper":{"id":788,"iterations":10000,"xslots":9,"yslots":9}},"0.1":{"lower":{"id":785,"iterations":10000,"xslots":9,"yslots":9},"upper":{"id":790,"iterations":10000,"xslots":9,"yslots":9}}},"type-word":{"0.0001":{"lower":{"id":771,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":776,"iterations":10000,"xslots":61,"yslots":9}},"0.001":{"lower":{"id":772,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":777,"iterations":10000,"xslots":61,"yslots":9}},"0.01":{"lower":{"id":773,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":778,"iterations":10000,"xslots":61,"yslots":9}},"0.1":{"lower":{"id":775,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":780,"iterations":10000,"xslots":61,"yslots":9}}}}},"check-b":{"example":{"hapax-token":{"0.0001":{"lower":{"id":851,"iterations":10000,"xslots":17,"yslots":9},"upper":{"id":856,"iterations":10000,"xslots":17,"yslots":9}},"0.001":{"lower":{"id":852,"iterations":10000,"xslots":17,"yslots":9},"upper":{"id":857,"iterations":10000,"xslots":17,"yslots":9}},"0.01":{"lower":{"id":853,"iterations":10000,"xslots":17,"yslots":9},"upper":{"id":858,"iterations":10000,"xslots":17,"yslots":9}},"0.1":{"lower":{"id":855,"iterations":10000,"xslots":17,"yslots":9},"upper":{"id":860,"iterations":10000,"xslots":17,"yslots":9}}},"hapax-word":{"0.0001":{"lower":{"id":841,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":846,"iterations":10000,"xslots":61,"yslots":9}},"0.001":{"lower":{"id":842,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":847,"iterations":10000,"xslots":61,"yslots":9}},"0.01":{"lower":{"id":843,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":848,"iterations":10000,"xslots":61,"yslots":9}},"0.1":{"lower":{"id":845,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":850,"iterations":10000,"xslots":61,"yslots":9}}},"token-word":{"0.0001":{"lower":{"id":861,"iterations":10000,"xslots":61,"yslots":17},"upper":{"id":866,"iterations":10000,"xslots":61,"yslots":17}},"0.001":{"lower":{"id":862,"iterations":10000,"xslots":61,"yslots":17},"upper":{"id":867,"iterations":10000,"xslots":61,"yslots":17}},"0.01":{"lower":{"id":863,"iterations":10000,"xslots":61,"yslots":17},"upper":{"id":868,"iterations":10000,"xslots":61,"yslots":17}},"0.1":{"lower":{"id":865,"iterations":10000,"xslots":61,"yslots":17},"upper":{"id":870,"iterations":10000,"xslots":61,"yslots":17}}},"type-token":{"0.0001":{"lower":{"id":831,"iterations":10000,"xslots":17,"yslots":9},"upper":{"id":836,"iterations":10000,"xslots":17,"yslots":9}},"0.001":{"lower":{"id":832,"iterations":10000,"xslots":17,"yslots":9},"upper":{"id":837,"iterations":10000,"xslots":17,"yslots":9}},"0.01":{"lower":{"id":833,"iterations":10000,"xslots":17,"yslots":9},"upper":{"id":838,"iterations":10000,"xslots":17,"yslots":9}},"0.1":{"lower":{"id":835,"iterations":10000,"xslots":17,"yslots":9},"upper":{"id":840,"iterations":10000,"xslots":17,"yslots":9}}},"type-word":{"0.0001":{"lower":{"id":821,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":826,"iterations":10000,"xslots":61,"yslots":9}},"0.001":{"lower":{"id":822,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":827,"iterations":10000,"xslots":61,"yslots":9}},"0.01":{"lower":{"id":823,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":828,"iterations":10000,"xslots":61,"yslots":9}},"0.1":{"lower":{"id":825,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":830,"iterations":10000,"xslots":61,"yslots":9}}}}},"check-c":{"example":{"hapax-token":{"0.0001":{"lower":{"id":901,"iterations":10000,"xslots":32,"yslots":9},"upper":{"id":906,"iterations":10000,"xslots":32,"yslots":9}},"0.001":{"lower":{"id":902,"iterations":10000,"xslots":32,"yslots":9},"upper":{"id":907,"iterations":10000,"xslots":32,"yslots":9}},"0.01":{"lower":{"id":903,"iterations":10000,"xslots":32,"yslots":9},"upper":{"id":908,"iterations":10000,"xslots":32,"yslots":9}},"0.1":{"lower":{"id":905,"iterations":10000,"xslots":32,"yslots":9},"upper":{"id":910,"iterations":10000,"xslots":32,"yslots":9}}},"hapax-word":{"0.0001":{"lower":{"id":891,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":896,"iterations":10000,"xslots":61,"yslots":9}},"0.001":{"lower":{"id":892,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":897,"iterations":10000,"xslots":61,"yslots":9}},"0.01":{"lower":{"id":893,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":898,"iterations":10000,"xslots":61,"yslots":9}},"0.1":{"lower":{"id":895,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":900,"iterations":10000,"xslots":61,"yslots":9}}},"token-word":{"0.0001":{"lower":{"id":911,"iterations":10000,"xslots":61,"yslots":32},"upper":{"id":916,"iterations":10000,"xslots":61,"yslots":32}},"0.001":{"lower":{"id":912,"iterations":10000,"xslots":61,"yslots":32},"upper":{"id":917,"iterations":10000,"xslots":61,"yslots":32}},"0.01":{"lower":{"id":913,"iterations":10000,"xslots":61,"yslots":32},"upper":{"id":918,"iterations":10000,"xslots":61,"yslots":32}},"0.1":{"lower":{"id":915,"iterations":10000,"xslots":61,"yslots":32},"upper":{"id":920,"iterations":10000,"xslots":61,"yslots":32}}},"type-token":{"0.0001":{"lower":{"id":881,"iterations":10000,"xslots":32,"yslots":9},"upper":{"id":886,"iterations":10000,"xslots":32,"yslots":9}},"0.001":{"lower":{"id":882,"iterations":10000,"xslots":32,"yslots":9},"upper":{"id":887,"iterations":10000,"xslots":32,"yslots":9}},"0.01":{"lower":{"id":883,"iterations":10000,"xslots":32,"yslots":9},"upper":{"id":888,"iterations":10000,"xslots":32,"yslots":9}},"0.1":{"lower":{"id":885,"iterations":10000,"xslots":32,"yslots":9},"upper":{"id":890,"iterations":10000,"xslots":32,"yslots":9}}},"type-word":{"0.0001":{"lower":{"id":871,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":876,"iterations":10000,"xslots":61,"yslots":9}},"0.001":{"lower":{"id":872,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":877,"iterations":10000,"xslots":61,"yslots":9}},"0.01":{"lower":{"id":873,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":878,"iterations":10000,"xslots":61,"yslots":9}},"0.1":{"lower":{"id":875,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":880,"iterations":10000,"xslots":61,"yslots":9}}}}},"check-d":{"example":{"hapax-token":{"0.0001":{"lower":{"id":951,"iterations":10000,"xslots":13,"yslots":9},"upper":{"id":956,"iterations":10000,"xslots":13,"yslots":9}},"0.001":{"lower":{"id":952,"iterations":10000,"xslots":13,"yslots":9},"upper":{"id":957,"iterations":10000,"xslots":13,"yslots":9}},"0.01":{"lower":{"id":953,"iterations":10000,"xslots":13,"yslots":9},"upper":{"id":958,"iterations":10000,"xslots":13,"yslots":9}},"0.1":{"lower":{"id":955,"iterations":10000,"xslots":13,"yslots":9},"upper":{"id":960,"iterations":10000,"xslots":13,"yslots":9}}},"hapax-word":{"0.0001":{"lower":{"id":941,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":946,"iterations":10000,"xslots":61,"yslots":9}},"0.001":{"lower":{"id":942,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":947,"iterations":10000,"xslots":61,"yslots":9}},"0.01":{"lower":{"id":943,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":948,"iterations":10000,"xslots":61,"yslots":9}},"0.1":{"lower":{"id":945,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":950,"iterations":10000,"xslots":61,"yslots":9}}},"token-word":{"0.0001":{"lower":{"id":961,"iterations":10000,"xslots":61,"yslots":13},"upper":{"id":966,"iterations":10000,"xslots":61,"yslots":13}},"0.001":{"lower":{"id":962,"iterations":10000,"xslots":61,"yslots":13},"upper":{"id":967,"iterations":10000,"xslots":61,"yslots":13}},"0.01":{"lower":{"id":963,"iterations":10000,"xslots":61,"yslots":13},"upper":{"id":968,"iterations":10000,"xslots":61,"yslots":13}},"0.1":{"lower":{"id":965,"iterations":10000,"xslots":61,"yslots":13},"upper":{"id":970,"iterations":10000,"xslots":61,"yslots":13}}},"type-token":{"0.0001":{"lower":{"id":931,"iterations":10000,"xslots":13,"yslots":9},"upper":{"id":936,"iterations":10000,"xslots":13,"yslots":9}},"0.001":{"lower":{"id":932,"iterations":10000,"xslots":13,"yslots":9},"upper":{"id":937,"iterations":10000,"xslots":13,"yslots":9}},"0.01":{"lower":{"id":933,"iterations":10000,"xslots":13,"yslots":9},"upper":{"id":938,"iterations":10000,"xslots":13,"yslots":9}},"0.1":{"lower":{"id":935,"iterations":10000,"xslots":13,"yslots":9},"upper":{"id":940,"iterations":10000,"xslots":13,"yslots":9}}},"type-word":{"0.0001":{"lower":{"id":921,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":926,"iterations":10000,"xslots":61,"yslots":9}},"0.001":{"lower":{"id":922,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":927,"iterations":10000,"xslots":61,"yslots":9}},"0.01":{"lower":{"id":923,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":928,"iterations":10000,"xslots":61,"yslots":9}},"0.1":{"lower":{"id":925,"iterations":10000,"xslots":61,"yslots":9},"upper":{"id":930,"iterations":10000,"xslots":61,"yslots":9}}}}},"check-e":{"example":{"hapax-token":{"0.0001":{"lower":{"id":1001,"iterations":10000,"xslots":8,"yslots":6},"upper":{"id":1006,"iterations":10000,"xslots":8,"yslots":6}},"0.001":{"lower":{"id":1002,"iterations":10000,"xslots":8,"yslots":6},"upper":{"id":1007,"iterations":10000,"xslots":8,"yslots":6}},"0.01":{"lower":{"id":1003,"iterations":10000,"xslots":8,"yslots":6},"upper":{"id":1008,"iterations":10000,"xslots":8,"yslots":6}},"0.1":{"lower":{"id":1005,"iterations":10000,"xslots":8,"yslots":6},"upper":{"id":1010,"iterations":10000,"xslots":8,"yslots":6}}},"hapax-word":{"0.0001":{"lower":{"id":991,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":996,"iterations":10000,"xslots":61,"yslots":6}},"0.001":{"lower":{"id":992,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":997,"iterations":10000,"xslots":61,"yslots":6}},"0.01":{"lower":{"id":993,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":998,"iterations":10000,"xslots":61,"yslots":6}},"0.1":{"lower":{"id":995,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":1000,"iterations":10000,"xslots":61,"yslots":6}}},"token-word":{"0.0001":{"lower":{"id":1011,"iterations":10000,"xslots":61,"yslots":8},"upper":{"id":1016,"iterations":10000,"xslots":61,"yslots":8}},"0.001":{"lower":{"id":1012,"iterations":10000,"xslots":61,"yslots":8},"upper":{"id":1017,"iterations":10000,"xslots":61,"yslots":8}},"0.01":{"lower":{"id":1013,"iterations":10000,"xslots":61,"yslots":8},"upper":{"id":1018,"iterations":10000,"xslots":61,"yslots":8}},"0.1":{"lower":{"id":1015,"iterations":10000,"xslots":61,"yslots":8},"upper":{"id":1020,"iterations":10000,"xslots":61,"yslots":8}}},"type-token":{"0.0001":{"lower":{"id":981,"iterations":10000,"xslots":8,"yslots":6},"upper":{"id":986,"iterations":10000,"xslots":8,"yslots":6}},"0.001":{"lower":{"id":982,"iterations":10000,"xslots":8,"yslots":6},"upper":{"id":987,"iterations":10000,"xslots":8,"yslots":6}},"0.01":{"lower":{"id":983,"iterations":10000,"xslots":8,"yslots":6},"upper":{"id":988,"iterations":10000,"xslots":8,"yslots":6}},"0.1":{"lower":{"id":985,"iterations":10000,"xslots":8,"yslots":6},"upper":{"id":990,"iterations":10000,"xslots":8,"yslots":6}}},"type-word":{"0.0001":{"lower":{"id":971,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":976,"iterations":10000,"xslots":61,"yslots":6}},"0.001":{"lower":{"id":972,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":977,"iterations":10000,"xslots":61,"yslots":6}},"0.01":{"lower":{"id":973,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":978,"iterations":10000,"xslots":61,"yslots":6}},"0.1":{"lower":{"id":975,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":980,"iterations":10000,"xslots":61,"yslots":6}}}}},"check-f":{"example":{"hapax-token":{"0.0001":{"lower":{"id":1051,"iterations":10000,"xslots":20,"yslots":6},"upper":{"id":1056,"iterations":10000,"xslots":20,"yslots":6}},"0.001":{"lower":{"id":1052,"iterations":10000,"xslots":20,"yslots":6},"upper":{"id":1057,"iterations":10000,"xslots":20,"yslots":6}},"0.01":{"lower":{"id":1053,"iterations":10000,"xslots":20,"yslots":6},"upper":{"id":1058,"iterations":10000,"xslots":20,"yslots":6}},"0.1":{"lower":{"id":1055,"iterations":10000,"xslots":20,"yslots":6},"upper":{"id":1060,"iterations":10000,"xslots":20,"yslots":6}}},"hapax-word":{"0.0001":{"lower":{"id":1041,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":1046,"iterations":10000,"xslots":61,"yslots":6}},"0.001":{"lower":{"id":1042,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":1047,"iterations":10000,"xslots":61,"yslots":6}},"0.01":{"lower":{"id":1043,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":1048,"iterations":10000,"xslots":61,"yslots":6}},"0.1":{"lower":{"id":1045,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":1050,"iterations":10000,"xslots":61,"yslots":6}}},"token-word":{"0.0001":{"lower":{"id":1061,"iterations":10000,"xslots":61,"yslots":20},"upper":{"id":1066,"iterations":10000,"xslots":61,"yslots":20}},"0.001":{"lower":{"id":1062,"iterations":10000,"xslots":61,"yslots":20},"upper":{"id":1067,"iterations":10000,"xslots":61,"yslots":20}},"0.01":{"lower":{"id":1063,"iterations":10000,"xslots":61,"yslots":20},"upper":{"id":1068,"iterations":10000,"xslots":61,"yslots":20}},"0.1":{"lower":{"id":1065,"iterations":10000,"xslots":61,"yslots":20},"upper":{"id":1070,"iterations":10000,"xslots":61,"yslots":20}}},"type-token":{"0.0001":{"lower":{"id":1031,"iterations":10000,"xslots":20,"yslots":6},"upper":{"id":1036,"iterations":10000,"xslots":20,"yslots":6}},"0.001":{"lower":{"id":1032,"iterations":10000,"xslots":20,"yslots":6},"upper":{"id":1037,"iterations":10000,"xslots":20,"yslots":6}},"0.01":{"lower":{"id":1033,"iterations":10000,"xslots":20,"yslots":6},"upper":{"id":1038,"iterations":10000,"xslots":20,"yslots":6}},"0.1":{"lower":{"id":1035,"iterations":10000,"xslots":20,"yslots":6},"upper":{"id":1040,"iterations":10000,"xslots":20,"yslots":6}}},"type-word":{"0.0001":{"lower":{"id":1021,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":1026,"iterations":10000,"xslots":61,"yslots":6}},"0.001":{"lower":{"id":1022,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":1027,"iterations":10000,"xslots":61,"yslots":6}},"0.01":{"lower":{"id":1023,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":1028,"iterations":10000,"xslots":61,"yslots":6}},"0.1":{"lower":{"id":1025,"iterations":10000,"xslots":61,"yslots":6},"upper":{"id":1030,"iterations":10000,"xslots":61,"yslots":6}}}}},"check-g":{"example":{"hapax-token":{"0.0001":{"lower":{"id":1101,"iterations":10000,"xslots":3,"yslots":2},"upper":{"id":1106,"iterations":10000,"xslots":3,"yslots":2}},"0.001":{"lower":{"id":1102,"iterations":10000,"xslots":3,"yslots":2},"upper":{"id":1107,"iterations":10000,"xslots":3,"yslots":2}},"0.01":{"lower":{"id":1103,"iterations":10000,"xslots":3,"yslots":2},"upper":{"id":1108,"iterations":10000,"xslots":3,"yslots":2}},"0.1":{"lower":{"id":1105,"iterations":10000,"xslots":3,"yslots":2},"upper":{"id":1110,"iterations":10000,"xslots":3,"yslots":2}}},"hapax-word":{"0.0001":{"lower":{"id":1091,"iterations":10000,"xslots":2,"yslots":2},"upper":{"id":1096,"iterations":10000,"xslots":2,"yslots":2}},"0.001":{"lower":{"id":1092,"iterations":10000,"xslots":2,"yslots":2},"upper":{"id":1097,"iterations":10000,"xslots":2,"yslots":2}},"0.01":{"lower":{"id":1093,"iterations":10000,"xslots":2,"yslots":2},"upper":{"id":1098,"iterations":10000,"xslots":2,"yslots":2}},"0.1":{"lower":{"id":1095,"iterations":10000,"xslots":2,"yslots":2},"upper":{"id":1100,"iterations":10000,"xslots":2,"yslots":2}}},"token-word":{"0.0001":{"lower":{"id":1111,"iterations":10000,"xslots":2,"yslots":3},"upper":{"id":1116,"iterations":10000,"xslots":2,"yslots":3}},"0.001":{"lower":{"id":1112,"iterations":10000,"xslots":2,"yslots":3},"upper":{"id":1117,"iterations":10000,"xslots":2,"yslots":3}},"0.01":{"lower":{"id":1113,"iterations":10000,"xslots":2,"yslots":3},"upper":{"id":1118,"iterations":10000,"xslots":2,"yslots":3}},"0.1":{"lower":{"id":1115,"iterations":10000,"xslots":2,"yslots":3},"upper":{"id":1120,"iterations":10000,"xslots":2,"yslots":3}}},"type-token":{"0.0001":{"lower":{"id":1081,"iterations":10000,"xslots":3,"yslots":2},"upper":{"id":1086,"iterations":10000,"xslots":3,"yslots":2}},"0.001":{"lower":{"id":1082,"iterations":10000,"xslots":3,"yslots":2},"upper":{"id":1087,"iterations":10000,"xslots":3,"yslots":2}},"0.01":{"lower":{"id":1083,"iterations":10000,"xslots":3,"yslots":2},"upper":{"id":1088,"iterations":10000,"xslots":3,"yslots":2}},"0.1":{"lower":{"id":1085,"iterations":10000,"xslots":3,"yslots":2},"upper":{"id":1090,"iterations":10000,"xslots":3,"yslots":2}}},"type-word":{"0.0001":{"lower":{"id":1071,"iterations":10000,"xslots":2,"yslots":2},"upper":{"id":1076,"iterations":10000,"xslots":2,"yslots":2}},"0.001":{"lower":{"id":1072,"iterations":10000,"xslots":2,"yslots":2},"upper":{"id":1077,"iterations":10000,"xslots":2,"yslots":2}},"0.01":{"lower":{"id":1073,"iterations":10000,"xslots":2,"yslots":2},"upper":{"id":1078,"iterations":10000,"xslots":2,"yslots":2}},"0.1":{"lower":{"id":1075,"iterations":10000,"xslots":2,"yslots":2},"upper":{"id":1080,"iterations":10000,"xslots":2,"yslots":2}}}}},"check-h":{"example":{"hapax-token":{"0.0001":{"lower":{"id":751,"iterations":10000,"xslots":3690,"yslots":100},"upper":{"id":756,"iterations":10000,"xslots":3690,"yslots":100}},"0.001":{"lower":{"id":752,"iterations":10000,"xslots":3690,"yslots":100},"upper":{"id":757,"iterations":10000,"xslots":3690,"yslots":100}},"0.01":{"lower":{"id":753,"iterations":10000,"xslots":3690,"yslots":100},"upper":{"id":758,"iterations":10000,"xslots":3690,"yslots":100}},"0.1":{"lower":{"id":755,"iterations":10000,"xslots":3690,"yslots":100},"upper":{"id":760,"iterations":10000,"xslots":3690,"yslots":100}}},"hapax-word":{"0.0001":{"lower":{"id":741,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":746,"iterations":10000,"xslots":573,"yslots":100}},"0.001":{"lower":{"id":742,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":747,"iterations":10000,"xslots":573,"yslots":100}},"0.01":{"lower":{"id":743,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":748,"iterations":10000,"xslots":573,"yslots":100}},"0.1":{"lower":{"id":745,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":750,"iterations":10000,"xslots":573,"yslots":100}}},"token-word":{"0.0001":{"lower":{"id":761,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":766,"iterations":10000,"xslots":573,"yslots":100}},"0.001":{"lower":{"id":762,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":767,"iterations":10000,"xslots":573,"yslots":100}},"0.01":{"lower":{"id":763,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":768,"iterations":10000,"xslots":573,"yslots":100}},"0.1":{"lower":{"id":765,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":770,"iterations":10000,"xslots":573,"yslots":100}}},"type-token":{"0.0001":{"lower":{"id":731,"iterations":10000,"xslots":3690,"yslots":100},"upper":{"id":736,"iterations":10000,"xslots":3690,"yslots":100}},"0.001":{"lower":{"id":732,"iterations":10000,"xslots":3690,"yslots":100},"upper":{"id":737,"iterations":10000,"xslots":3690,"yslots":100}},"0.01":{"lower":{"id":733,"iterations":10000,"xslots":3690,"yslots":100},"upper":{"id":738,"iterations":10000,"xslots":3690,"yslots":100}},"0.1":{"lower":{"id":735,"iterations":10000,"xslots":3690,"yslots":100},"upper":{"id":740,"iterations":10000,"xslots":3690,"yslots":100}}},"type-word":{"0.0001":{"lower":{"id":721,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":726,"iterations":10000,"xslots":573,"yslots":100}},"0.001":{"lower":{"id":722,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":727,"iterations":10000,"xslots":573,"yslots":100}},"0.01":{"lower":{"id":723,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":728,"iterations":10000,"xslots":573,"yslots":100}},"0.1":{"lower":{"id":725,"iterations":10000,"xslots":573,"yslots":100},"upper":{"id":730,"iterations":10000,"xslots":573,"yslots":100}}}}}},"result_curve_point":{"721":[{"x":0,"y":0},{"x":10,"y":0},{"x":11,"y":2},{"x":12,"y":4},{"x":16,"y":4},{"x":17,"y":5},{"x":20,"y":5},{"x":21,"y":9},{"x":24,"y":9},{"x":25,"y":10},{"x":26,"y":11},{"x":27,"y":11},{"x":28,"y":12},{"x":31,"y":12},{"x":32,"y":14},{"x":33,"y":14},{"x":34,"y":17},{"x":37,"y":17},{"x":38,"y":19},{"x":40,"y":19},{"x":41,"y":20},{"x":42,"y":20},{"x":43,"y":22},{"x":46,"y":22},{"x":47,"y":24},{"x":48,"y":25},{"x":52,"y":25},{"x":53,"y":27},{"x":57,"y":27},{"x":58,"y":29},{"x":59,"y":30},{"x":61,"y":30},{"x":62,"y":32},{"x":65,"y":32},{"x":66,"y":35},{"x":71,"y":35},{"x":72,"y":36},{"x":73,"y":37},{"x":75,"y":37},{"x":76,"y":39},{"x":82,"y":39},{"x":83,"y":40},{"x":88,"y":40},{"x":89,"y":41},{"x":90,"y":41},{"x":91,"y":42},{"x":92,"y":42},{"x":93,"y":43},{"x":106,"y":43},{"x":107,"y":45},{"x":114,"y":45},{"x":115,"y":47},{"x":120,"y":47},{"x":121,"y":48},{"x":130,"y":48},{"x":131,"y":51},{"x":137,"y":51},{"x":138,"y":52},{"x":143,"y":52},{"x":144,"y":53},{"x":152,"y":53},{"x":153,"y":55},{"x":158,"y":55},{"x":159,"y":57},{"x":166,"y":57},{"x":167,"y":58},{"x":181,"y":58},{"x":182,"y":60},{"x":191,"y":60},{"x":192,"y":62},{"x":197,"y":62},{"x":198,"y":63},{"x":201,"y":63},{"x":202,"y":65},{"x":211,"y":65},{"x":212,"y":68},{"x":231,"y":68},{"x":232,"y":72},{"x":245,"y":72},{"x":246,"y":73},{"x":272,"y":73},{"x":273,"y":75},{"x":280,"y":75},{"x":281,"y":76},{"x":289,"y":76},{"x":290,"y":78},{"x":293,"y":78},{"x":294,"y":81},{"x":297,"y":81},{"x":298,"y":82},{"x":304,"y":82},{"x":305,"y":83},{"x":310,"y":83},{"x":311,"y":84},{"x":325,"y":84},{"x":326,"y":86},{"x":329,"y":86},{"x":330,"y":87},{"x":334,"y":87},{"x":335,"y":88},{"x":344,"y":88},{"x":345,"y":89},{"x":356,"y":89},{"x":357,"y":91},{"x":362,"y":91},{"x":363,"y":92},{"x":369,"y":92},{"x":370,"y":93},{"x":386,"y":93},{"x":387,"y":94},{"x":397,"y":94},{"x":398,"y":96},{"x":402,"y":96},{"x":403,"y":97},{"x":407,"y":97},{"x":408,"y":98},{"x":427,"y":98},{"x":428,"y":99},{"x":437,"y":99},{"x":438,"y":101},{"x":441,"y":101},{"x":442,"y":102},{"x":449,"y":102},{"x":450,"y":103},{"x":454,"y":103},{"x":455,"y":104},{"x":475,"y":104},{"x":476,"y":106},{"x":486,"y":106},{"x":487,"y":107},{"x":495,"y":107},{"x":496,"y":108},{"x":506,"y":108},{"x":507,"y":109},{"x":527,"y":109},{"x":528,"y":111},{"x":533,"y":111},{"x":534,"y":112},{"x":536,"y":112},{"x":537,"y":113},{"x":540,"y":113},{"x":541,"y":114},{"x":546,"y":114},{"x":547,"y":116},{"x":554,"y":116},{"x":555,"y":117},{"x":561,"y":117},{"x":562,"y":118},{"x":567,"y":118},{"x":568,"y":119},{"x":571,"y":119},{"x":572,"y":121}],"722":[{"x":0,"y":0},{"x":10,"y":0},{"x":11,"y":2},{"x":12,"y":4},{"x":16,"y":4},{"x":17,"y":5},{"x":19,"y":5},{"x":20,"y":6},{"x":21,"y":10},{"x":24,"y":10},{"x":25,"y":11},{"x":26,"y":12},{"x":29,"y":12},{"x":30,"y":14},{"x":31,"y":16},{"x":32,"y":16},{"x":33,"y":17},{"x":35,"y":17},{"x":36,"y":19},{"x":37,"y":19},{"x":38,"y":20},{"x":39,"y":22},{"x":42,"y":22},{"x":43,"y":24},{"x":44,"y":24},{"x":45,"y":25},{"x":46,"y":25},{"x":47,"y":27},{"x":50,"y":27},{"x":51,"y":29},{"x":53,"y":29},{"x":54,"y":30},{"x":55,"y":30},{"x":56,"y":31},{"x":57,"y":31},{"x":58,"y":32},{"x":60,"y":32},{"x":61,"y":34},{"x":62,"y":35},{"x":63,"y":35},{"x":64,"y":36},{"x":67,"y":36},{"x":68,"y":37},{"x":73,"y":37},{"x":74,"y":39},{"x":75,"y":40},{"x":78,"y":40},{"x":79,"y":41},{"x":81,"y":41},{"x":82,"y":42},{"x":83,"y":42},{"x":84,"y":43},{"x":89,"y":43},{"x":90,"y":45},{"x":92,"y":45},{"x":93,"y":46},{"x":97,"y":46},{"x":98,"y":47},{"x":100,"y":47},{"x":101,"y":48},{"x":106,"y":48},{"x":107,"y":50},{"x":116,"y":50},{"x":117,"y":51},{"x":118,"y":51},{"x":119,"y":52},{"x":124,"y":52},{"x":125,"y":53},{"x":132,"y":53},{"x":133,"y":55},{"x":139,"y":55},{"x":140,"y":56},{"x":145,"y":56},{"x":146,"y":57},{"x":149,"y":57},{"x":150,"y":58},{"x":158,"y":58},{"x":159,"y":60},{"x":164,"y":60},{"x":165,"y":61},{"x":170,"y":61},{"x":171,"y":62},{"x":174,"y":62},{"x":175,"y":63},{"x":185,"y":63},{"x":186,"y":65},{"x":191,"y":65},{"x":192,"y":66},{"x":199,"y":66},{"x":200,"y":67},{"x":203,"y":67},{"x":204,"y":68},{"x":212,"y":68},{"x":213,"y":70},{"x":218,"y":70},{"x":219,"y":71},{"x":223,"y":71},{"x":224,"y":72},{"x":230,"y":72},{"x":231,"y":73},{"x":241,"y":73},{"x":242,"y":75},{"x":247,"y":75},{"x":248,"y":76},{"x":251,"y":76},{"x":252,"y":77},{"x":263,"y":77},{"x":264,"y":78},{"x":275,"y":78},{"x":276,"y":80},{"x":279,"y":80},{"x":280,"y":81},{"x":288,"y":81},{"x":289,"y":82},{"x":293,"y":82},{"x":294,"y":83},{"x":298,"y":83},{"x":299,"y":84},{"x":310,"y":84},{"x":311,"y":86},{"x":316,"y":86},{"x":317,"y":87},{"x":326,"y":87},{"x":327,"y":88},{"x":332,"y":88},{"x":333,"y":89},{"x":345,"y":89},{"x":346,"y":91},{"x":350,"y":91},{"x":351,"y":92},{"x":361,"y":92},{"x":362,"y":93},{"x":370,"y":93},{"x":371,"y":94},{"x":386,"y":94},{"x":387,"y":96},{"x":390,"y":96},{"x":391,"y":97},{"x":400,"y":97},{"x":401,"y":98},{"x":408,"y":98},{"x":409,"y":99},{"x":419,"y":99},{"x":420,"y":101},{"x":428,"y":101},{"x":429,"y":102},{"x":438,"y":102},{"x":439,"y":103},{"x":444,"y":103},{"x":445,"y":104},{"x":461,"y":104},{"x":462,"y":106},{"x":470,"y":106},{"x":471,"y":107},{"x":480,"y":107},{"x":481,"y":108},{"x":487,"y":108},{"x":488,"y":109},{"x":504,"y":109},{"x":505,"y":111},{"x":518,"y":111},{"x":519,"y":112},{"x":523,"y":112},{"x":524,"y":113},{"x":529,"y":113},{"x":530,"y":114},{"x":542,"y":114},{"x":543,"y":116},{"x":549,"y":116},{"x":550,"y":117},{"x":555,"y":117},{"x":556,"y":118},{"x":561,"y":118},{"x":562,"y":119},{"x":570,"y":119},{"x":571,"y":121},{"x":572,"y":121}],"723":[{"x":0,"y":0},{"x":10,"y":0},{"x":11,"y":4},{"x":12,"y":5},{"x":15,"y":5},{"x":16,"y":6},{"x":18,"y":6},{"x":19,"y":7},{"x":20,"y":7},{"x":21,"y":12},{"x":25,"y":12},{"x":26,"y":14},{"x":27,"y":15},{"x":28,"y":16},{"x":29,"y":17},{"x":30,"y":17},{"x":31,"y":19},{"x":32,"y":19},{"x":33,"y":20},{"x":34,"y":21},{"x":35,"y":22},{"x":37,"y":22},{"x":38,"y":24},{"x":39,"y":25},{"x":40,"y":26},{"x":41,"y":26},{"x":42,"y":27},{"x":44,"y":27},{"x":45,"y":29},{"x":46,"y":29},{"x":47,"y":30},{"x":48,"y":30},{"x":49,"y":31},{"x":50,"y":32},{"x":53,"y":32},{"x":54,"y":34},{"x":55,"y":34},{"x":56,"y":35},{"x":57,"y":35},{"x":58,"y":36},{"x":59,"y":36},{"x":60,"y":37},{"x":63,"y":37},{"x":64,"y":39},{"x":65,"y":39},{"x":66,"y":40},{"x":69,"y":40},{"x":70,"y":41},{"x":71,"y":42},{"x":73,"y":42},{"x":74,"y":43},{"x":78,"y":43},{"x":79,"y":45},{"x":82,"y":45},{"x":83,"y":46},{"x":84,"y":46},{"x":85,"y":47},{"x":88,"y":47},{"x":89,"y":48},{"x":95,"y":48},{"x":96,"y":50},{"x":99,"y":50},{"x":100,"y":51},{"x":102,"y":51},{"x":103,"y":52},{"x":106,"y":52},{"x":107,"y":53},{"x":116,"y":53},{"x":117,"y":55},{"x":121,"y":55},{"x":122,"y":56},{"x":126,"y":56},{"x":127,"y":57},{"x":129,"y":57},{"x":130,"y":58},{"x":140,"y":58},{"x":141,"y":60},{"x":145,"y":60},{"x":146,"y":61},{"x":150,"y":61},{"x":151,"y":62},{"x":156,"y":62},{"x":157,"y":63},{"x":166,"y":63},{"x":167,"y":65},{"x":171,"y":65},{"x":172,"y":66},{"x":177,"y":66},{"x":178,"y":67},{"x":182,"y":67},{"x":183,"y":68},{"x":193,"y":68},{"x":194,"y":70},{"x":199,"y":70},{"x":200,"y":71},{"x":205,"y":71},{"x":206,"y":72},{"x":211,"y":72},{"x":212,"y":73},{"x":222,"y":73},{"x":223,"y":75},{"x":229,"y":75},{"x":230,"y":76},{"x":234,"y":76},{"x":235,"y":77},{"x":240,"y":77},{"x":241,"y":78},{"x":255,"y":78},{"x":256,"y":80},{"x":261,"y":80},{"x":262,"y":81},{"x":266,"y":81},{"x":267,"y":82},{"x":272,"y":82},{"x":273,"y":83},{"x":280,"y":83},{"x":281,"y":84},{"x":292,"y":84},{"x":293,"y":86},{"x":298,"y":86},{"x":299,"y":87},{"x":305,"y":87},{"x":306,"y":88},{"x":311,"y":88},{"x":312,"y":89},{"x":327,"y":89},{"x":328,"y":91},{"x":334,"y":91},{"x":335,"y":92},{"x":340,"y":92},{"x":341,"y":93},{"x":348,"y":93},{"x":349,"y":94},{"x":364,"y":94},{"x":365,"y":96},{"x":371,"y":96},{"x":372,"y":97},{"x":379,"y":97},{"x":380,"y":98},{"x":387,"y":98},{"x":388,"y":99},{"x":403,"y":99},{"x":404,"y":101},{"x":410,"y":101},{"x":411,"y":102},{"x":418,"y":102},{"x":419,"y":103},{"x":426,"y":103},{"x":427,"y":104},{"x":442,"y":104},{"x":443,"y":106},{"x":450,"y":106},{"x":451,"y":107},{"x":458,"y":107},{"x":459,"y":108},{"x":467,"y":108},{"x":468,"y":109},{"x":484,"y":109},{"x":485,"y":111},{"x":494,"y":111},{"x":495,"y":112},{"x":505,"y":112},{"x":506,"y":113},{"x":514,"y":113},{"x":515,"y":114},{"x":529,"y":114},{"x":530,"y":116},{"x":538,"y":116},{"x":539,"y":117},{"x":546,"y":117},{"x":547,"y":118},{"x":553,"y":118},{"x":554,"y":119},{"x":568,"y":119},{"x":569,"y":121},{"x":572,"y":121}],"725":[{"x":0,"y":0},{"x":10,"y":0},{"x":11,"y":7},{"x":14,"y":7},{"x":15,"y":9},{"x":16,"y":9},{"x":17,"y":11},{"x":18,"y":12},{"x":19,"y":14},{"x":20,"y":15},{"x":21,"y":16},{"x":22,"y":16},{"x":23,"y":17},{"x":24,"y":17},{"x":25,"y":19},{"x":26,"y":20},{"x":27,"y":21},{"x":28,"y":22},{"x":29,"y":22},{"x":30,"y":24},{"x":31,"y":25},{"x":32,"y":26},{"x":33,"y":27},{"x":35,"y":27},{"x":36,"y":29},{"x":37,"y":29},{"x":38,"y":30},{"x":39,"y":31},{"x":40,"y":32},{"x":42,"y":32},{"x":43,"y":34},{"x":44,"y":34},{"x":45,"y":35},{"x":46,"y":35},{"x":47,"y":36},{"x":48,"y":36},{"x":49,"y":37},{"x":51,"y":37},{"x":52,"y":39},{"x":53,"y":39},{"x":54,"y":40},{"x":55,"y":40},{"x":56,"y":41},{"x":57,"y":41},{"x":58,"y":42},{"x":59,"y":42},{"x":60,"y":43},{"x":64,"y":43},{"x":65,"y":45},{"x":67,"y":45},{"x":68,"y":46},{"x":69,"y":46},{"x":70,"y":47},{"x":72,"y":47},{"x":73,"y":48},{"x":78,"y":48},{"x":79,"y":50},{"x":81,"y":50},{"x":82,"y":51},{"x":85,"y":51},{"x":86,"y":52},{"x":88,"y":52},{"x":89,"y":53},{"x":95,"y":53},{"x":96,"y":55},{"x":99,"y":55},{"x":100,"y":56},{"x":103,"y":56},{"x":104,"y":57},{"x":107,"y":57},{"x":108,"y":58},{"x":116,"y":58},{"x":117,"y":60},{"x":120,"y":60},{"x":121,"y":61},{"x":125,"y":61},{"x":126,"y":62},{"x":130,"y":62},{"x":131,"y":63},{"x":139,"y":63},{"x":140,"y":65},{"x":144,"y":65},{"x":145,"y":66},{"x":149,"y":66},{"x":150,"y":67},{"x":154,"y":67},{"x":155,"y":68},{"x":164,"y":68},{"x":165,"y":70},{"x":170,"y":70},{"x":171,"y":71},{"x":175,"y":71},{"x":176,"y":72},{"x":181,"y":72},{"x":182,"y":73},{"x":192,"y":73},{"x":193,"y":75},{"x":199,"y":75},{"x":200,"y":76},{"x":205,"y":76},{"x":206,"y":77},{"x":211,"y":77},{"x":212,"y":78},{"x":223,"y":78},{"x":224,"y":80},{"x":229,"y":80},{"x":230,"y":81},{"x":235,"y":81},{"x":236,"y":82},{"x":241,"y":82},{"x":242,"y":83},{"x":247,"y":83},{"x":248,"y":84},{"x":260,"y":84},{"x":261,"y":86},{"x":266,"y":86},{"x":267,"y":87},{"x":273,"y":87},{"x":274,"y":88},{"x":280,"y":88},{"x":281,"y":89},{"x":293,"y":89},{"x":294,"y":91},{"x":300,"y":91},{"x":301,"y":92},{"x":307,"y":92},{"x":308,"y":93},{"x":314,"y":93},{"x":315,"y":94},{"x":329,"y":94},{"x":330,"y":96},{"x":336,"y":96},{"x":337,"y":97},{"x":344,"y":97},{"x":345,"y":98},{"x":351,"y":98},{"x":352,"y":99},{"x":368,"y":99},{"x":369,"y":101},{"x":376,"y":101},{"x":377,"y":102},{"x":384,"y":102},{"x":385,"y":103},{"x":392,"y":103},{"x":393,"y":104},{"x":409,"y":104},{"x":410,"y":106},{"x":418,"y":106},{"x":419,"y":107},{"x":428,"y":107},{"x":429,"y":108},{"x":437,"y":108},{"x":438,"y":109},{"x":456,"y":109},{"x":457,"y":111},{"x":465,"y":111},{"x":466,"y":112},{"x":475,"y":112},{"x":476,"y":113},{"x":486,"y":113},{"x":487,"y":114},{"x":506,"y":114},{"x":507,"y":116},{"x":517,"y":116},{"x":518,"y":117},{"x":528,"y":117},{"x":529,"y":118},{"x":538,"y":118},{"x":539,"y":119},{"x":558,"y":119},{"x":559,"y":121},{"x":569,"y":121},{"x":570,"y":122},{"x":572,"y":122}],"726":[{"x":0,"y":16},{"x":1,"y":29},{"x":2,"y":32},{"x":3,"y":37},{"x":4,"y":40},{"x":5,"y":42},{"x":6,"y":42},{"x":7,"y":43},{"x":8,"y":45},{"x":9,"y":47},{"x":10,"y":47},{"x":11,"y":48},{"x":13,"y":48},{"x":14,"y":51},{"x":15,"y":52},{"x":17,"y":52},{"x":18,"y":55},{"x":22,"y":55},{"x":23,"y":57},{"x":24,"y":57},{"x":25,"y":60},{"x":27,"y":60},{"x":28,"y":61},{"x":30,"y":61},{"x":31,"y":63},{"x":34,"y":63},{"x":35,"y":65},{"x":41,"y":65},{"x":42,"y":66},{"x":44,"y":66},{"x":45,"y":67},{"x":48,"y":67},{"x":49,"y":68},{"x":50,"y":70},{"x":60,"y":70},{"x":61,"y":71},{"x":63,"y":71},{"x":64,"y":73},{"x":69,"y":73},{"x":70,"y":75},{"x":75,"y":75},{"x":76,"y":76},{"x":77,"y":76},{"x":78,"y":77},{"x":82,"y":77},{"x":83,"y":78},{"x":84,"y":78},{"x":85,"y":80},{"x":88,"y":80},{"x":89,"y":81},{"x":98,"y":81},{"x":99,"y":83},{"x":105,"y":83},{"x":106,"y":84},{"x":111,"y":84},{"x":112,"y":86},{"x":118,"y":86},{"x":119,"y":87},{"x":123,"y":87},{"x":124,"y":88},{"x":129,"y":88},{"x":130,"y":89},{"x":133,"y":89},{"x":134,"y":91},{"x":141,"y":91},{"x":142,"y":92},{"x":147,"y":92},{"x":148,"y":93},{"x":151,"y":93},{"x":152,"y":96},{"x":169,"y":96},{"x":170,"y":97},{"x":178,"y":97},{"x":179,"y":98},{"x":182,"y":98},{"x":183,"y":99},{"x":189,"y":99},{"x":190,"y":101},{"x":203,"y":101},{"x":204,"y":102},{"x":209,"y":102},{"x":210,"y":103},{"x":221,"y":103},{"x":222,"y":104},{"x":227,"y":104},{"x":228,"y":106},{"x":231,"y":106},{"x":232,"y":107},{"x":242,"y":107},{"x":243,"y":108},{"x":245,"y":108},{"x":246,"y":109},{"x":250,"y":109},{"x":251,"y":111},{"x":287,"y":111},{"x":288,"y":112},{"x":300,"y":112},{"x":301,"y":113},{"x":304,"y":113},{"x":305,"y":114},{"x":320,"y":114},{"x":321,"y":116},{"x":341,"y":116},{"x":342,"y":117},{"x":357,"y":117},{"x":358,"y":118},{"x":380,"y":118},{"x":381,"y":119},{"x":387,"y":119},{"x":388,"y":121},{"x":425,"y":121},{"x":426,"y":122},{"x":461,"y":122},{"x":462,"y":123},{"x":572,"y":123}],"727":[{"x":0,"y":16},{"x":1,"y":26},{"x":2,"y":30},{"x":3,"y":32},{"x":4,"y":34},{"x":5,"y":36},{"x":6,"y":37},{"x":7,"y":39},{"x":8,"y":40},{"x":9,"y":41},{"x":10,"y":42},{"x":11,"y":43},{"x":12,"y":45},{"x":13,"y":46},{"x":14,"y":46},{"x":15,"y":47},{"x":16,"y":48},{"x":17,"y":50},{"x":19,"y":50},{"x":20,"y":51},{"x":21,"y":52},{"x":23,"y":52},{"x":24,"y":53},{"x":25,"y":55},{"x":29,"y":55},{"x":30,"y":57},{"x":32,"y":57},{"x":33,"y":58},{"x":34,"y":60},{"x":38,"y":60},{"x":39,"y":61},{"x":40,"y":61},{"x":41,"y":62},{"x":42,"y":63},{"x":46,"y":63},{"x":47,"y":65},{"x":51,"y":65},{"x":52,"y":66},{"x":53,"y":66},{"x":54,"y":67},{"x":55,"y":67},{"x":56,"y":68},{"x":58,"y":68},{"x":59,"y":70},{"x":65,"y":70},{"x":66,"y":71},{"x":69,"y":71},{"x":70,"y":72},{"x":72,"y":72},{"x":73,"y":73},{"x":76,"y":73},{"x":77,"y":75},{"x":82,"y":75},{"x":83,"y":76},{"x":87,"y":76},{"x":88,"y":77},{"x":91,"y":77},{"x":92,"y":78},{"x":97,"y":78},{"x":98,"y":80},{"x":102,"y":80},{"x":103,"y":81},{"x":105,"y":81},{"x":106,"y":82},{"x":109,"y":82},{"x":110,"y":83},{"x":113,"y":83},{"x":114,"y":84},{"x":120,"y":84},{"x":121,"y":86},{"x":130,"y":86},{"x":131,"y":87},{"x":133,"y":87},{"x":134,"y":88},{"x":137,"y":88},{"x":138,"y":89},{"x":142,"y":89},{"x":143,"y":91},{"x":153,"y":91},{"x":154,"y":92},{"x":157,"y":92},{"x":158,"y":93},{"x":163,"y":93},{"x":164,"y":94},{"x":175,"y":94},{"x":176,"y":96},{"x":182,"y":96},{"x":183,"y":97},{"x":194,"y":97},{"x":195,"y":98},{"x":201,"y":98},{"x":202,"y":99},{"x":206,"y":99},{"x":207,"y":101},{"x":223,"y":101},{"x":224,"y":102},{"x":227,"y":102},{"x":228,"y":103},{"x":236,"y":103},{"x":237,"y":104},{"x":243,"y":104},{"x":244,"y":106},{"x":257,"y":106},{"x":258,"y":107},{"x":265,"y":107},{"x":266,"y":108},{"x":273,"y":108},{"x":274,"y":109},{"x":279,"y":109},{"x":280,"y":111},{"x":298,"y":111},{"x":299,"y":112},{"x":313,"y":112},{"x":314,"y":113},{"x":325,"y":113},{"x":326,"y":114},{"x":335,"y":114},{"x":336,"y":116},{"x":362,"y":116},{"x":363,"y":117},{"x":369,"y":117},{"x":370,"y":118},{"x":388,"y":118},{"x":389,"y":119},{"x":402,"y":119},{"x":403,"y":121},{"x":437,"y":121},{"x":438,"y":122},{"x":471,"y":122},{"x":472,"y":123},{"x":572,"y":123}],"728":[{"x":0,"y":16},{"x":1,"y":24},{"x":2,"y":25},{"x":3,"y":27},{"x":4,"y":29},{"x":5,"y":30},{"x":6,"y":31},{"x":7,"y":32},{"x":8,"y":34},{"x":9,"y":35},{"x":10,"y":36},{"x":11,"y":39},{"x":12,"y":39},{"x":13,"y":40},{"x":14,"y":41},{"x":15,"y":42},{"x":16,"y":42},{"x":17,"y":43},{"x":18,"y":45},{"x":20,"y":45},{"x":21,"y":46},{"x":22,"y":47},{"x":23,"y":48},{"x":24,"y":48},{"x":25,"y":50},{"x":27,"y":50},{"x":28,"y":51},{"x":29,"y":51},{"x":30,"y":52},{"x":31,"y":52},{"x":32,"y":53},{"x":33,"y":55},{"x":36,"y":55},{"x":37,"y":56},{"x":39,"y":56},{"x":40,"y":57},{"x":41,"y":57},{"x":42,"y":58},{"x":43,"y":58},{"x":44,"y":60},{"x":48,"y":60},{"x":49,"y":61},{"x":51,"y":61},{"x":52,"y":62},{"x":53,"y":62},{"x":54,"y":63},{"x":56,"y":63},{"x":57,"y":65},{"x":62,"y":65},{"x":63,"y":66},{"x":65,"y":66},{"x":66,"y":67},{"x":68,"y":67},{"x":69,"y":68},{"x":71,"y":68},{"x":72,"y":70},{"x":77,"y":70},{"x":78,"y":71},{"x":81,"y":71},{"x":82,"y":72},{"x":85,"y":72},{"x":86,"y":73},{"x":88,"y":73},{"x":89,"y":75},{"x":97,"y":75},{"x":98,"y":76},{"x":102,"y":76},{"x":103,"y":77},{"x":106,"y":77},{"x":107,"y":78},{"x":110,"y":78},{"x":111,"y":80},{"x":118,"y":80},{"x":119,"y":81},{"x":124,"y":81},{"x":125,"y":82},{"x":129,"y":82},{"x":130,"y":83},{"x":134,"y":83},{"x":135,"y":84},{"x":139,"y":84},{"x":140,"y":86},{"x":149,"y":86},{"x":150,"y":87},{"x":154,"y":87},{"x":155,"y":88},{"x":160,"y":88},{"x":161,"y":89},{"x":165,"y":89},{"x":166,"y":91},{"x":176,"y":91},{"x":177,"y":92},{"x":184,"y":92},{"x":185,"y":93},{"x":189,"y":93},{"x":190,"y":94},{"x":195,"y":94},{"x":196,"y":96},{"x":208,"y":96},{"x":209,"y":97},{"x":216,"y":97},{"x":217,"y":98},{"x":222,"y":98},{"x":223,"y":99},{"x":228,"y":99},{"x":229,"y":101},{"x":244,"y":101},{"x":245,"y":102},{"x":252,"y":102},{"x":253,"y":103},{"x":260,"y":103},{"x":261,"y":104},{"x":268,"y":104},{"x":269,"y":106},{"x":284,"y":106},{"x":285,"y":107},{"x":292,"y":107},{"x":293,"y":108},{"x":299,"y":108},{"x":300,"y":109},{"x":309,"y":109},{"x":310,"y":111},{"x":331,"y":111},{"x":332,"y":112},{"x":341,"y":112},{"x":342,"y":113},{"x":351,"y":113},{"x":352,"y":114},{"x":362,"y":114},{"x":363,"y":116},{"x":387,"y":116},{"x":388,"y":117},{"x":400,"y":117},{"x":401,"y":118},{"x":416,"y":118},{"x":417,"y":119},{"x":433,"y":119},{"x":434,"y":121},{"x":473,"y":121},{"x":474,"y":122},{"x":493,"y":122},{"x":494,"y":123},{"x":572,"y":123}],"730":[{"x":0,"y":14},{"x":1,"y":16},{"x":2,"y":19},{"x":3,"y":19},{"x":4,"y":21},{"x":5,"y":22},{"x":6,"y":24},{"x":7,"y":25},{"x":8,"y":26},{"x":9,"y":27},{"x":10,"y":29},{"x":11,"y":30},{"x":12,"y":31},{"x":13,"y":32},{"x":14,"y":34},{"x":15,"y":34},{"x":16,"y":35},{"x":17,"y":36},{"x":18,"y":37},{"x":19,"y":39},{"x":21,"y":39},{"x":22,"y":40},{"x":23,"y":41},{"x":24,"y":42},{"x":25,"y":42},{"x":26,"y":43},{"x":27,"y":45},{"x":30,"y":45},{"x":31,"y":46},{"x":32,"y":47},{"x":33,"y":47},{"x":34,"y":48},{"x":35,"y":48},{"x":36,"y":50},{"x":39,"y":50},{"x":40,"y":51},{"x":41,"y":51},{"x":42,"y":52},{"x":43,"y":52},{"x":44,"y":53},{"x":45,"y":53},{"x":46,"y":55},{"x":50,"y":55},{"x":51,"y":56},{"x":52,"y":56},{"x":53,"y":57},{"x":55,"y":57},{"x":56,"y":58},{"x":58,"y":58},{"x":59,"y":60},{"x":64,"y":60},{"x":65,"y":61},{"x":66,"y":61},{"x":67,"y":62},{"x":70,"y":62},{"x":71,"y":63},{"x":73,"y":63},{"x":74,"y":65},{"x":80,"y":65},{"x":81,"y":66},{"x":83,"y":66},{"x":84,"y":67},{"x":87,"y":67},{"x":88,"y":68},{"x":91,"y":68},{"x":92,"y":70},{"x":99,"y":70},{"x":100,"y":71},{"x":104,"y":71},{"x":105,"y":72},{"x":108,"y":72},{"x":109,"y":73},{"x":112,"y":73},{"x":113,"y":75},{"x":121,"y":75},{"x":122,"y":76},{"x":126,"y":76},{"x":127,"y":77},{"x":130,"y":77},{"x":131,"y":78},{"x":135,"y":78},{"x":136,"y":80},{"x":145,"y":80},{"x":146,"y":81},{"x":151,"y":81},{"x":152,"y":82},{"x":156,"y":82},{"x":157,"y":83},{"x":161,"y":83},{"x":162,"y":84},{"x":167,"y":84},{"x":168,"y":86},{"x":178,"y":86},{"x":179,"y":87},{"x":184,"y":87},{"x":185,"y":88},{"x":190,"y":88},{"x":191,"y":89},{"x":196,"y":89},{"x":197,"y":91},{"x":208,"y":91},{"x":209,"y":92},{"x":215,"y":92},{"x":216,"y":93},{"x":221,"y":93},{"x":222,"y":94},{"x":227,"y":94},{"x":228,"y":96},{"x":241,"y":96},{"x":242,"y":97},{"x":249,"y":97},{"x":250,"y":98},{"x":255,"y":98},{"x":256,"y":99},{"x":263,"y":99},{"x":264,"y":101},{"x":278,"y":101},{"x":279,"y":102},{"x":286,"y":102},{"x":287,"y":103},{"x":295,"y":103},{"x":296,"y":104},{"x":302,"y":104},{"x":303,"y":106},{"x":320,"y":106},{"x":321,"y":107},{"x":329,"y":107},{"x":330,"y":108},{"x":339,"y":108},{"x":340,"y":109},{"x":349,"y":109},{"x":350,"y":111},{"x":369,"y":111},{"x":370,"y":112},{"x":380,"y":112},{"x":381,"y":113},{"x":392,"y":113},{"x":393,"y":114},{"x":403,"y":114},{"x":404,"y":116},{"x":429,"y":116},{"x":430,"y":117},{"x":442,"y":117},{"x":443,"y":118},{"x":456,"y":118},{"x":457,"y":119},{"x":471,"y":119},{"x":472,"y":121},{"x":507,"y":121},{"x":508,"y":122},{"x":528,"y":122},{"x":529,"y":123},{"x":572,"y":123}],"731":[{"x":0,"y":0},{"x":73,"y":0},{"x":74,"y":2},{"x":84,"y":2},{"x":85,"y":5},{"x":92,"y":5},{"x":93,"y":6},{"x":100,"y":6},{"x":101,"y":7},{"x":115,"y":7},{"x":116,"y":9},{"x":117,"y":9},{"x":118,"y":10},{"x":126,"y":10},{"x":127,"y":11},{"x":135,"y":11},{"x":136,"y":12},{"x":143,"y":12},{"x":144,"y":14},{"x":152,"y":14},{"x":153,"y":15},{"x":157,"y":15},{"x":158,"y":16},{"x":162,"y":16},{"x":163,"y":17},{"x":186,"y":17},{"x":187,"y":19},{"x":191,"y":19},{"x":192,"y":20},{"x":198,"y":20},{"x":199,"y":21},{"x":200,"y":21},{"x":201,"y":22},{"x":222,"y":22},{"x":223,"y":24},{"x":227,"y":24},{"x":228,"y":25},{"x":244,"y":25},{"x":245,"y":26},{"x":257,"y":26},{"x":258,"y":27},{"x":272,"y":27},{"x":273,"y":29},{"x":282,"y":29},{"x":283,"y":30},{"x":303,"y":30},{"x":304,"y":31},{"x":311,"y":31},{"x":312,"y":32},{"x":333,"y":32},{"x":334,"y":34},{"x":348,"y":34},{"x":349,"y":35},{"x":368,"y":35},{"x":369,"y":36},{"x":386,"y":36},{"x":387,"y":37},{"x":419,"y":37},{"x":420,"y":39},{"x":443,"y":39},{"x":444,"y":40},{"x":463,"y":40},{"x":464,"y":41},{"x":484,"y":41},{"x":485,"y":42},{"x":487,"y":42},{"x":488,"y":43},{"x":572,"y":43},{"x":573,"y":45},{"x":593,"y":45},{"x":594,"y":46},{"x":608,"y":46},{"x":609,"y":47},{"x":634,"y":47},{"x":635,"y":48},{"x":709,"y":48},{"x":710,"y":50},{"x":773,"y":50},{"x":774,"y":51},{"x":815,"y":51},{"x":816,"y":52},{"x":854,"y":52},{"x":855,"y":53},{"x":917,"y":53},{"x":918,"y":55},{"x":944,"y":55},{"x":945,"y":56},{"x":969,"y":56},{"x":970,"y":57},{"x":971,"y":57},{"x":972,"y":58},{"x":1076,"y":58},{"x":1077,"y":60},{"x":1106,"y":60},{"x":1107,"y":61},{"x":1128,"y":61},{"x":1129,"y":62},{"x":1179,"y":62},{"x":1180,"y":63},{"x":1267,"y":63},{"x":1268,"y":65},{"x":1327,"y":65},{"x":1328,"y":66},{"x":1338,"y":66},{"x":1339,"y":68},{"x":1398,"y":68},{"x":1399,"y":70},{"x":1459,"y":70},{"x":1460,"y":71},{"x":1498,"y":71},{"x":1499,"y":72},{"x":1562,"y":72},{"x":1563,"y":73},{"x":1646,"y":73},{"x":1647,"y":75},{"x":1675,"y":75},{"x":1676,"y":76},{"x":1721,"y":76},{"x":1722,"y":77},{"x":1733,"y":77},{"x":1734,"y":78},{"x":1857,"y":78},{"x":1858,"y":80},{"x":1905,"y":80},{"x":1906,"y":81},{"x":1954,"y":81},{"x":1955,"y":82},{"x":2018,"y":82},{"x":2019,"y":83},{"x":2063,"y":83},{"x":2064,"y":84},{"x":2180,"y":84},{"x":2181,"y":87},{"x":2200,"y":87},{"x":2201,"y":88},{"x":2235,"y":88},{"x":2236,"y":89},{"x":2315,"y":89},{"x":2316,"y":91},{"x":2366,"y":91},{"x":2367,"y":92},{"x":2390,"y":92},{"x":2391,"y":93},{"x":2541,"y":93},{"x":2542,"y":94},{"x":2608,"y":94},{"x":2609,"y":96},{"x":2613,"y":96},{"x":2614,"y":97},{"x":2671,"y":97},{"x":2672,"y":98},{"x":2706,"y":98},{"x":2707,"y":99},{"x":2822,"y":99},{"x":2823,"y":101},{"x":2846,"y":101},{"x":2847,"y":102},{"x":2892,"y":102},{"x":2893,"y":103},{"x":2950,"y":103},{"x":2951,"y":104},{"x":3050,"y":104},{"x":3051,"y":106},{"x":3101,"y":106},{"x":3102,"y":107},{"x":3170,"y":107},{"x":3171,"y":108},{"x":3211,"y":108},{"x":3212,"y":109},{"x":3367,"y":109},{"x":3368,"y":111},{"x":3423,"y":111},{"x":3424,"y":113},{"x":3482,"y":113},{"x":3483,"y":114},{"x":3555,"y":114},{"x":3556,"y":116},{"x":3581,"y":116},{"x":3582,"y":117},{"x":3621,"y":117},{"x":3622,"y":118},{"x":3646,"y":118},{"x":3647,"y":119},{"x":3673,"y":119},{"x":3674,"y":121},{"x":3689,"y":121}],"732":[{"x":0,"y":0},{"x":73,"y":0},{"x":74,"y":5},{"x":84,"y":5},{"x":85,"y":6},{"x":91,"y":6},{"x":92,"y":7},{"x":107,"y":7},{"x":108,"y":9},{"x":111,"y":9},{"x":112,"y":10},{"x":119,"y":10},{"x":120,"y":11},{"x":124,"y":11},{"x":125,"y":12},{"x":133,"y":12},{"x":134,"y":14},{"x":142,"y":14},{"x":143,"y":15},{"x":148,"y":15},{"x":149,"y":16},{"x":157,"y":16},{"x":158,"y":17},{"x":174,"y":17},{"x":175,"y":19},{"x":181,"y":19},{"x":182,"y":20},{"x":190,"y":20},{"x":191,"y":21},{"x":192,"y":22},{"x":210,"y":22},{"x":211,"y":24},{"x":218,"y":24},{"x":219,"y":25},{"x":227,"y":25},{"x":228,"y":26},{"x":237,"y":26},{"x":238,"y":27},{"x":257,"y":27},{"x":258,"y":29},{"x":270,"y":29},{"x":271,"y":30},{"x":285,"y":30},{"x":286,"y":31},{"x":293,"y":31},{"x":294,"y":32},{"x":317,"y":32},{"x":318,"y":34},{"x":329,"y":34},{"x":330,"y":35},{"x":348,"y":35},{"x":349,"y":36},{"x":364,"y":36},{"x":365,"y":37},{"x":397,"y":37},{"x":398,"y":39},{"x":412,"y":39},{"x":413,"y":40},{"x":441,"y":40},{"x":442,"y":41},{"x":450,"y":41},{"x":451,"y":42},{"x":462,"y":42},{"x":463,"y":43},{"x":513,"y":43},{"x":514,"y":45},{"x":543,"y":45},{"x":544,"y":46},{"x":574,"y":46},{"x":575,"y":47},{"x":605,"y":47},{"x":606,"y":48},{"x":665,"y":48},{"x":666,"y":50},{"x":688,"y":50},{"x":689,"y":51},{"x":723,"y":51},{"x":724,"y":52},{"x":744,"y":52},{"x":745,"y":53},{"x":822,"y":53},{"x":823,"y":55},{"x":854,"y":55},{"x":855,"y":56},{"x":886,"y":56},{"x":887,"y":57},{"x":920,"y":57},{"x":921,"y":58},{"x":999,"y":58},{"x":1000,"y":60},{"x":1030,"y":60},{"x":1031,"y":61},{"x":1055,"y":61},{"x":1056,"y":62},{"x":1106,"y":62},{"x":1107,"y":63},{"x":1179,"y":63},{"x":1180,"y":65},{"x":1210,"y":65},{"x":1211,"y":66},{"x":1237,"y":66},{"x":1238,"y":67},{"x":1274,"y":67},{"x":1275,"y":68},{"x":1350,"y":68},{"x":1351,"y":70},{"x":1371,"y":70},{"x":1372,"y":71},{"x":1408,"y":71},{"x":1409,"y":72},{"x":1453,"y":72},{"x":1454,"y":73},{"x":1539,"y":73},{"x":1540,"y":75},{"x":1563,"y":75},{"x":1564,"y":76},{"x":1607,"y":76},{"x":1608,"y":77},{"x":1687,"y":77},{"x":1688,"y":78},{"x":1758,"y":78},{"x":1759,"y":80},{"x":1819,"y":80},{"x":1820,"y":81},{"x":1857,"y":81},{"x":1858,"y":82},{"x":1874,"y":82},{"x":1875,"y":83},{"x":1933,"y":83},{"x":1934,"y":84},{"x":1993,"y":84},{"x":1994,"y":86},{"x":2032,"y":86},{"x":2033,"y":87},{"x":2099,"y":87},{"x":2100,"y":88},{"x":2133,"y":88},{"x":2134,"y":89},{"x":2217,"y":89},{"x":2218,"y":91},{"x":2267,"y":91},{"x":2268,"y":92},{"x":2318,"y":92},{"x":2319,"y":93},{"x":2366,"y":93},{"x":2367,"y":94},{"x":2455,"y":94},{"x":2456,"y":96},{"x":2513,"y":96},{"x":2514,"y":97},{"x":2573,"y":97},{"x":2574,"y":98},{"x":2635,"y":98},{"x":2636,"y":99},{"x":2724,"y":99},{"x":2725,"y":101},{"x":2760,"y":101},{"x":2761,"y":102},{"x":2818,"y":102},{"x":2819,"y":103},{"x":2858,"y":103},{"x":2859,"y":104},{"x":2977,"y":104},{"x":2978,"y":106},{"x":3040,"y":106},{"x":3041,"y":107},{"x":3089,"y":107},{"x":3090,"y":108},{"x":3153,"y":108},{"x":3154,"y":109},{"x":3267,"y":109},{"x":3268,"y":111},{"x":3309,"y":111},{"x":3310,"y":112},{"x":3356,"y":112},{"x":3357,"y":113},{"x":3423,"y":113},{"x":3424,"y":114},{"x":3502,"y":114},{"x":3503,"y":116},{"x":3544,"y":116},{"x":3545,"y":117},{"x":3594,"y":117},{"x":3595,"y":118},{"x":3622,"y":118},{"x":3623,"y":119},{"x":3673,"y":119},{"x":3674,"y":121},{"x":3689,"y":121}],"733":[{"x":0,"y":0},{"x":73,"y":0},{"x":74,"y":6},{"x":79,"y":6},{"x":80,"y":7},{"x":95,"y":7},{"x":96,"y":9},{"x":98,"y":9},{"x":99,"y":10},{"x":107,"y":10},{"x":108,"y":11},{"x":111,"y":11},{"x":112,"y":12},{"x":118,"y":12},{"x":119,"y":14},{"x":127,"y":14},{"x":128,"y":15},{"x":131,"y":15},{"x":132,"y":16},{"x":140,"y":16},{"x":141,"y":17},{"x":152,"y":17},{"x":153,"y":19},{"x":160,"y":19},{"x":161,"y":20},{"x":167,"y":20},{"x":168,"y":21},{"x":174,"y":21},{"x":175,"y":22},{"x":190,"y":22},{"x":191,"y":24},{"x":198,"y":24},{"x":199,"y":25},{"x":205,"y":25},{"x":206,"y":26},{"x":216,"y":26},{"x":217,"y":27},{"x":232,"y":27},{"x":233,"y":29},{"x":241,"y":29},{"x":242,"y":30},{"x":253,"y":30},{"x":254,"y":31},{"x":263,"y":31},{"x":264,"y":32},{"x":287,"y":32},{"x":288,"y":34},{"x":298,"y":34},{"x":299,"y":35},{"x":314,"y":35},{"x":315,"y":36},{"x":328,"y":36},{"x":329,"y":37},{"x":360,"y":37},{"x":361,"y":39},{"x":373,"y":39},{"x":374,"y":40},{"x":388,"y":40},{"x":389,"y":41},{"x":408,"y":41},{"x":409,"y":42},{"x":421,"y":42},{"x":422,"y":43},{"x":462,"y":43},{"x":463,"y":45},{"x":484,"y":45},{"x":485,"y":46},{"x":504,"y":46},{"x":505,"y":47},{"x":523,"y":47},{"x":524,"y":48},{"x":574,"y":48},{"x":575,"y":50},{"x":602,"y":50},{"x":603,"y":51},{"x":623,"y":51},{"x":624,"y":52},{"x":657,"y":52},{"x":658,"y":53},{"x":713,"y":53},{"x":714,"y":55},{"x":749,"y":55},{"x":750,"y":56},{"x":778,"y":56},{"x":779,"y":57},{"x":807,"y":57},{"x":808,"y":58},{"x":873,"y":58},{"x":874,"y":60},{"x":905,"y":60},{"x":906,"y":61},{"x":936,"y":61},{"x":937,"y":62},{"x":977,"y":62},{"x":978,"y":63},{"x":1042,"y":63},{"x":1043,"y":65},{"x":1076,"y":65},{"x":1077,"y":66},{"x":1106,"y":66},{"x":1107,"y":67},{"x":1147,"y":67},{"x":1148,"y":68},{"x":1214,"y":68},{"x":1215,"y":70},{"x":1252,"y":70},{"x":1253,"y":71},{"x":1288,"y":71},{"x":1289,"y":72},{"x":1332,"y":72},{"x":1333,"y":73},{"x":1410,"y":73},{"x":1411,"y":75},{"x":1451,"y":75},{"x":1452,"y":76},{"x":1488,"y":76},{"x":1489,"y":77},{"x":1527,"y":77},{"x":1528,"y":78},{"x":1609,"y":78},{"x":1610,"y":80},{"x":1645,"y":80},{"x":1646,"y":81},{"x":1697,"y":81},{"x":1698,"y":82},{"x":1737,"y":82},{"x":1738,"y":83},{"x":1787,"y":83},{"x":1788,"y":84},{"x":1864,"y":84},{"x":1865,"y":86},{"x":1907,"y":86},{"x":1908,"y":87},{"x":1955,"y":87},{"x":1956,"y":88},{"x":1990,"y":88},{"x":1991,"y":89},{"x":2088,"y":89},{"x":2089,"y":91},{"x":2126,"y":91},{"x":2127,"y":92},{"x":2176,"y":92},{"x":2177,"y":93},{"x":2218,"y":93},{"x":2219,"y":94},{"x":2322,"y":94},{"x":2323,"y":96},{"x":2369,"y":96},{"x":2370,"y":97},{"x":2424,"y":97},{"x":2425,"y":98},{"x":2469,"y":98},{"x":2470,"y":99},{"x":2579,"y":99},{"x":2580,"y":101},{"x":2628,"y":101},{"x":2629,"y":102},{"x":2674,"y":102},{"x":2675,"y":103},{"x":2726,"y":103},{"x":2727,"y":104},{"x":2834,"y":104},{"x":2835,"y":106},{"x":2890,"y":106},{"x":2891,"y":107},{"x":2942,"y":107},{"x":2943,"y":108},{"x":3003,"y":108},{"x":3004,"y":109},{"x":3115,"y":109},{"x":3116,"y":111},{"x":3189,"y":111},{"x":3190,"y":112},{"x":3250,"y":112},{"x":3251,"y":113},{"x":3306,"y":113},{"x":3307,"y":114},{"x":3419,"y":114},{"x":3420,"y":116},{"x":3472,"y":116},{"x":3473,"y":117},{"x":3525,"y":117},{"x":3526,"y":118},{"x":3574,"y":118},{"x":3575,"y":119},{"x":3656,"y":119},{"x":3657,"y":121},{"x":3689,"y":121}],"735":[{"x":0,"y":0},{"x":55,"y":0},{"x":56,"y":5},{"x":57,"y":5},{"x":58,"y":6},{"x":61,"y":6},{"x":62,"y":7},{"x":74,"y":7},{"x":75,"y":9},{"x":79,"y":9},{"x":80,"y":10},{"x":86,"y":10},{"x":87,"y":11},{"x":91,"y":11},{"x":92,"y":12},{"x":99,"y":12},{"x":100,"y":14},{"x":104,"y":14},{"x":105,"y":15},{"x":110,"y":15},{"x":111,"y":16},{"x":115,"y":16},{"x":116,"y":17},{"x":127,"y":17},{"x":128,"y":19},{"x":134,"y":19},{"x":135,"y":20},{"x":140,"y":20},{"x":141,"y":21},{"x":147,"y":21},{"x":148,"y":22},{"x":160,"y":22},{"x":161,"y":24},{"x":167,"y":24},{"x":168,"y":25},{"x":175,"y":25},{"x":176,"y":26},{"x":183,"y":26},{"x":184,"y":27},{"x":199,"y":27},{"x":200,"y":29},{"x":208,"y":29},{"x":209,"y":30},{"x":216,"y":30},{"x":217,"y":31},{"x":226,"y":31},{"x":227,"y":32},{"x":246,"y":32},{"x":247,"y":34},{"x":256,"y":34},{"x":257,"y":35},{"x":267,"y":35},{"x":268,"y":36},{"x":279,"y":36},{"x":280,"y":37},{"x":302,"y":37},{"x":303,"y":39},{"x":315,"y":39},{"x":316,"y":40},{"x":328,"y":40},{"x":329,"y":41},{"x":343,"y":41},{"x":344,"y":42},{"x":358,"y":42},{"x":359,"y":43},{"x":389,"y":43},{"x":390,"y":45},{"x":402,"y":45},{"x":403,"y":46},{"x":421,"y":46},{"x":422,"y":47},{"x":439,"y":47},{"x":440,"y":48},{"x":480,"y":48},{"x":481,"y":50},{"x":500,"y":50},{"x":501,"y":51},{"x":522,"y":51},{"x":523,"y":52},{"x":544,"y":52},{"x":545,"y":53},{"x":593,"y":53},{"x":594,"y":55},{"x":617,"y":55},{"x":618,"y":56},{"x":642,"y":56},{"x":643,"y":57},{"x":668,"y":57},{"x":669,"y":58},{"x":727,"y":58},{"x":728,"y":60},{"x":755,"y":60},{"x":756,"y":61},{"x":786,"y":61},{"x":787,"y":62},{"x":818,"y":62},{"x":819,"y":63},{"x":878,"y":63},{"x":879,"y":65},{"x":912,"y":65},{"x":913,"y":66},{"x":946,"y":66},{"x":947,"y":67},{"x":981,"y":67},{"x":982,"y":68},{"x":1044,"y":68},{"x":1045,"y":70},{"x":1082,"y":70},{"x":1083,"y":71},{"x":1116,"y":71},{"x":1117,"y":72},{"x":1153,"y":72},{"x":1154,"y":73},{"x":1226,"y":73},{"x":1227,"y":75},{"x":1264,"y":75},{"x":1265,"y":76},{"x":1300,"y":76},{"x":1301,"y":77},{"x":1341,"y":77},{"x":1342,"y":78},{"x":1416,"y":78},{"x":1417,"y":80},{"x":1456,"y":80},{"x":1457,"y":81},{"x":1495,"y":81},{"x":1496,"y":82},{"x":1533,"y":82},{"x":1534,"y":83},{"x":1573,"y":83},{"x":1574,"y":84},{"x":1659,"y":84},{"x":1660,"y":86},{"x":1699,"y":86},{"x":1700,"y":87},{"x":1741,"y":87},{"x":1742,"y":88},{"x":1787,"y":88},{"x":1788,"y":89},{"x":1875,"y":89},{"x":1876,"y":91},{"x":1916,"y":91},{"x":1917,"y":92},{"x":1963,"y":92},{"x":1964,"y":93},{"x":2010,"y":93},{"x":2011,"y":94},{"x":2108,"y":94},{"x":2109,"y":96},{"x":2156,"y":96},{"x":2157,"y":97},{"x":2203,"y":97},{"x":2204,"y":98},{"x":2255,"y":98},{"x":2256,"y":99},{"x":2354,"y":99},{"x":2355,"y":101},{"x":2409,"y":101},{"x":2410,"y":102},{"x":2464,"y":102},{"x":2465,"y":103},{"x":2516,"y":103},{"x":2517,"y":104},{"x":2631,"y":104},{"x":2632,"y":106},{"x":2688,"y":106},{"x":2689,"y":107},{"x":2748,"y":107},{"x":2749,"y":108},{"x":2806,"y":108},{"x":2807,"y":109},{"x":2928,"y":109},{"x":2929,"y":111},{"x":2992,"y":111},{"x":2993,"y":112},{"x":3057,"y":112},{"x":3058,"y":113},{"x":3123,"y":113},{"x":3124,"y":114},{"x":3257,"y":114},{"x":3258,"y":116},{"x":3334,"y":116},{"x":3335,"y":117},{"x":3396,"y":117},{"x":3397,"y":118},{"x":3465,"y":118},{"x":3466,"y":119},{"x":3597,"y":119},{"x":3598,"y":121},{"x":3662,"y":121},{"x":3663,"y":122},{"x":3689,"y":122}],"736":[{"x":0,"y":16},{"x":8,"y":16},{"x":9,"y":19},{"x":10,"y":19},{"x":11,"y":21},{"x":18,"y":21},{"x":19,"y":22},{"x":21,"y":22},{"x":22,"y":24},{"x":25,"y":24},{"x":26,"y":25},{"x":35,"y":25},{"x":36,"y":27},{"x":44,"y":27},{"x":45,"y":29},{"x":52,"y":29},{"x":53,"y":30},{"x":54,"y":31},{"x":60,"y":31},{"x":61,"y":32},{"x":62,"y":34},{"x":75,"y":34},{"x":76,"y":36},{"x":83,"y":36},{"x":84,"y":37},{"x":90,"y":37},{"x":91,"y":39},{"x":102,"y":39},{"x":103,"y":40},{"x":104,"y":40},{"x":105,"y":41},{"x":113,"y":41},{"x":114,"y":42},{"x":117,"y":42},{"x":118,"y":43},{"x":131,"y":43},{"x":132,"y":45},{"x":139,"y":45},{"x":140,"y":46},{"x":144,"y":46},{"x":145,"y":48},{"x":153,"y":48},{"x":154,"y":50},{"x":177,"y":50},{"x":178,"y":51},{"x":192,"y":51},{"x":193,"y":52},{"x":204,"y":52},{"x":205,"y":53},{"x":218,"y":53},{"x":219,"y":55},{"x":222,"y":55},{"x":223,"y":56},{"x":237,"y":56},{"x":238,"y":57},{"x":254,"y":57},{"x":255,"y":58},{"x":260,"y":58},{"x":261,"y":60},{"x":285,"y":60},{"x":286,"y":61},{"x":294,"y":61},{"x":295,"y":62},{"x":296,"y":62},{"x":297,"y":63},{"x":305,"y":63},{"x":306,"y":65},{"x":326,"y":65},{"x":327,"y":66},{"x":362,"y":66},{"x":363,"y":68},{"x":388,"y":68},{"x":389,"y":70},{"x":433,"y":70},{"x":434,"y":71},{"x":446,"y":71},{"x":447,"y":72},{"x":467,"y":72},{"x":468,"y":73},{"x":490,"y":73},{"x":491,"y":75},{"x":515,"y":75},{"x":516,"y":76},{"x":548,"y":76},{"x":549,"y":77},{"x":591,"y":77},{"x":592,"y":78},{"x":597,"y":78},{"x":598,"y":80},{"x":651,"y":80},{"x":652,"y":81},{"x":683,"y":81},{"x":684,"y":82},{"x":690,"y":82},{"x":691,"y":83},{"x":730,"y":83},{"x":731,"y":84},{"x":741,"y":84},{"x":742,"y":86},{"x":804,"y":86},{"x":805,"y":87},{"x":814,"y":87},{"x":815,"y":88},{"x":856,"y":88},{"x":857,"y":89},{"x":861,"y":89},{"x":862,"y":91},{"x":949,"y":91},{"x":950,"y":92},{"x":1011,"y":92},{"x":1012,"y":93},{"x":1041,"y":93},{"x":1042,"y":94},{"x":1081,"y":94},{"x":1082,"y":96},{"x":1146,"y":96},{"x":1147,"y":97},{"x":1183,"y":97},{"x":1184,"y":98},{"x":1212,"y":98},{"x":1213,"y":99},{"x":1255,"y":99},{"x":1256,"y":101},{"x":1369,"y":101},{"x":1370,"y":102},{"x":1419,"y":102},{"x":1420,"y":103},{"x":1484,"y":103},{"x":1485,"y":106},{"x":1593,"y":106},{"x":1594,"y":107},{"x":1671,"y":107},{"x":1672,"y":108},{"x":1715,"y":108},{"x":1716,"y":109},{"x":1739,"y":109},{"x":1740,"y":111},{"x":1886,"y":111},{"x":1887,"y":112},{"x":1924,"y":112},{"x":1925,"y":113},{"x":1987,"y":113},{"x":1988,"y":114},{"x":2057,"y":114},{"x":2058,"y":116},{"x":2212,"y":116},{"x":2213,"y":117},{"x":2329,"y":117},{"x":2330,"y":118},{"x":2389,"y":118},{"x":2390,"y":119},{"x":2521,"y":119},{"x":2522,"y":121},{"x":2754,"y":121},{"x":2755,"y":122},{"x":2939,"y":122},{"x":2940,"y":123},{"x":3689,"y":123}],"737":[{"x":0,"y":16},{"x":9,"y":16},{"x":10,"y":19},{"x":14,"y":19},{"x":15,"y":20},{"x":21,"y":20},{"x":22,"y":21},{"x":23,"y":22},{"x":24,"y":22},{"x":25,"y":24},{"x":35,"y":24},{"x":36,"y":25},{"x":37,"y":26},{"x":42,"y":26},{"x":43,"y":27},{"x":48,"y":27},{"x":49,"y":29},{"x":58,"y":29},{"x":59,"y":30},{"x":61,"y":30},{"x":62,"y":31},{"x":64,"y":31},{"x":65,"y":32},{"x":69,"y":32},{"x":70,"y":34},{"x":83,"y":34},{"x":84,"y":35},{"x":88,"y":35},{"x":89,"y":36},{"x":94,"y":36},{"x":95,"y":37},{"x":102,"y":37},{"x":103,"y":39},{"x":112,"y":39},{"x":113,"y":40},{"x":119,"y":40},{"x":120,"y":41},{"x":126,"y":41},{"x":127,"y":42},{"x":133,"y":42},{"x":134,"y":43},{"x":140,"y":43},{"x":141,"y":45},{"x":152,"y":45},{"x":153,"y":46},{"x":161,"y":46},{"x":162,"y":47},{"x":166,"y":47},{"x":167,"y":48},{"x":173,"y":48},{"x":174,"y":50},{"x":200,"y":50},{"x":201,"y":51},{"x":204,"y":51},{"x":205,"y":52},{"x":213,"y":52},{"x":214,"y":53},{"x":227,"y":53},{"x":228,"y":55},{"x":244,"y":55},{"x":245,"y":56},{"x":258,"y":56},{"x":259,"y":57},{"x":270,"y":57},{"x":271,"y":58},{"x":287,"y":58},{"x":288,"y":60},{"x":305,"y":60},{"x":306,"y":61},{"x":323,"y":61},{"x":324,"y":62},{"x":326,"y":62},{"x":327,"y":63},{"x":350,"y":63},{"x":351,"y":65},{"x":382,"y":65},{"x":383,"y":66},{"x":406,"y":66},{"x":407,"y":67},{"x":426,"y":67},{"x":427,"y":68},{"x":433,"y":68},{"x":434,"y":70},{"x":475,"y":70},{"x":476,"y":71},{"x":491,"y":71},{"x":492,"y":72},{"x":511,"y":72},{"x":512,"y":73},{"x":523,"y":73},{"x":524,"y":75},{"x":562,"y":75},{"x":563,"y":76},{"x":599,"y":76},{"x":600,"y":77},{"x":622,"y":77},{"x":623,"y":78},{"x":649,"y":78},{"x":650,"y":80},{"x":694,"y":80},{"x":695,"y":81},{"x":724,"y":81},{"x":725,"y":82},{"x":754,"y":82},{"x":755,"y":83},{"x":761,"y":83},{"x":762,"y":84},{"x":786,"y":84},{"x":787,"y":86},{"x":866,"y":86},{"x":867,"y":87},{"x":902,"y":87},{"x":903,"y":88},{"x":928,"y":88},{"x":929,"y":89},{"x":946,"y":89},{"x":947,"y":91},{"x":1041,"y":91},{"x":1042,"y":92},{"x":1078,"y":92},{"x":1079,"y":93},{"x":1121,"y":93},{"x":1122,"y":94},{"x":1154,"y":94},{"x":1155,"y":96},{"x":1230,"y":96},{"x":1231,"y":97},{"x":1270,"y":97},{"x":1271,"y":98},{"x":1311,"y":98},{"x":1312,"y":99},{"x":1343,"y":99},{"x":1344,"y":101},{"x":1449,"y":101},{"x":1450,"y":102},{"x":1489,"y":102},{"x":1490,"y":103},{"x":1551,"y":103},{"x":1552,"y":104},{"x":1593,"y":104},{"x":1594,"y":106},{"x":1671,"y":106},{"x":1672,"y":107},{"x":1738,"y":107},{"x":1739,"y":108},{"x":1798,"y":108},{"x":1799,"y":109},{"x":1847,"y":109},{"x":1848,"y":111},{"x":1977,"y":111},{"x":1978,"y":112},{"x":2037,"y":112},{"x":2038,"y":113},{"x":2091,"y":113},{"x":2092,"y":114},{"x":2196,"y":114},{"x":2197,"y":116},{"x":2354,"y":116},{"x":2355,"y":117},{"x":2428,"y":117},{"x":2429,"y":118},{"x":2531,"y":118},{"x":2532,"y":119},{"x":2652,"y":119},{"x":2653,"y":121},{"x":2880,"y":121},{"x":2881,"y":122},{"x":3046,"y":122},{"x":3047,"y":123},{"x":3689,"y":123}],"738":[{"x":0,"y":16},{"x":15,"y":16},{"x":16,"y":17},{"x":19,"y":17},{"x":20,"y":19},{"x":24,"y":19},{"x":25,"y":20},{"x":26,"y":21},{"x":28,"y":21},{"x":29,"y":22},{"x":36,"y":22},{"x":37,"y":24},{"x":43,"y":24},{"x":44,"y":25},{"x":49,"y":25},{"x":50,"y":26},{"x":53,"y":26},{"x":54,"y":27},{"x":61,"y":27},{"x":62,"y":29},{"x":70,"y":29},{"x":71,"y":30},{"x":75,"y":30},{"x":76,"y":31},{"x":80,"y":31},{"x":81,"y":32},{"x":87,"y":32},{"x":88,"y":34},{"x":99,"y":34},{"x":100,"y":35},{"x":105,"y":35},{"x":106,"y":36},{"x":112,"y":36},{"x":113,"y":37},{"x":119,"y":37},{"x":120,"y":39},{"x":131,"y":39},{"x":132,"y":40},{"x":138,"y":40},{"x":139,"y":41},{"x":146,"y":41},{"x":147,"y":42},{"x":153,"y":42},{"x":154,"y":43},{"x":163,"y":43},{"x":164,"y":45},{"x":177,"y":45},{"x":178,"y":46},{"x":187,"y":46},{"x":188,"y":47},{"x":196,"y":47},{"x":197,"y":48},{"x":205,"y":48},{"x":206,"y":50},{"x":227,"y":50},{"x":228,"y":51},{"x":238,"y":51},{"x":239,"y":52},{"x":249,"y":52},{"x":250,"y":53},{"x":260,"y":53},{"x":261,"y":55},{"x":286,"y":55},{"x":287,"y":56},{"x":297,"y":56},{"x":298,"y":57},{"x":313,"y":57},{"x":314,"y":58},{"x":324,"y":58},{"x":325,"y":60},{"x":356,"y":60},{"x":357,"y":61},{"x":372,"y":61},{"x":373,"y":62},{"x":386,"y":62},{"x":387,"y":63},{"x":404,"y":63},{"x":405,"y":65},{"x":438,"y":65},{"x":439,"y":66},{"x":460,"y":66},{"x":461,"y":67},{"x":480,"y":67},{"x":481,"y":68},{"x":499,"y":68},{"x":500,"y":70},{"x":543,"y":70},{"x":544,"y":71},{"x":565,"y":71},{"x":566,"y":72},{"x":584,"y":72},{"x":585,"y":73},{"x":606,"y":73},{"x":607,"y":75},{"x":658,"y":75},{"x":659,"y":76},{"x":686,"y":76},{"x":687,"y":77},{"x":714,"y":77},{"x":715,"y":78},{"x":741,"y":78},{"x":742,"y":80},{"x":792,"y":80},{"x":793,"y":81},{"x":824,"y":81},{"x":825,"y":82},{"x":856,"y":82},{"x":857,"y":83},{"x":889,"y":83},{"x":890,"y":84},{"x":926,"y":84},{"x":927,"y":86},{"x":996,"y":86},{"x":997,"y":87},{"x":1028,"y":87},{"x":1029,"y":88},{"x":1059,"y":88},{"x":1060,"y":89},{"x":1093,"y":89},{"x":1094,"y":91},{"x":1173,"y":91},{"x":1174,"y":92},{"x":1216,"y":92},{"x":1217,"y":93},{"x":1253,"y":93},{"x":1254,"y":94},{"x":1290,"y":94},{"x":1291,"y":96},{"x":1368,"y":96},{"x":1369,"y":97},{"x":1415,"y":97},{"x":1416,"y":98},{"x":1457,"y":98},{"x":1458,"y":99},{"x":1498,"y":99},{"x":1499,"y":101},{"x":1592,"y":101},{"x":1593,"y":102},{"x":1644,"y":102},{"x":1645,"y":103},{"x":1696,"y":103},{"x":1697,"y":104},{"x":1743,"y":104},{"x":1744,"y":106},{"x":1846,"y":106},{"x":1847,"y":107},{"x":1901,"y":107},{"x":1902,"y":108},{"x":1961,"y":108},{"x":1962,"y":109},{"x":2020,"y":109},{"x":2021,"y":111},{"x":2145,"y":111},{"x":2146,"y":112},{"x":2218,"y":112},{"x":2219,"y":113},{"x":2289,"y":113},{"x":2290,"y":114},{"x":2366,"y":114},{"x":2367,"y":116},{"x":2521,"y":116},{"x":2522,"y":117},{"x":2609,"y":117},{"x":2610,"y":118},{"x":2700,"y":118},{"x":2701,"y":119},{"x":2814,"y":119},{"x":2815,"y":121},{"x":3062,"y":121},{"x":3063,"y":122},{"x":3215,"y":122},{"x":3216,"y":123},{"x":3689,"y":123}],"740":[{"x":0,"y":14},{"x":22,"y":14},{"x":23,"y":15},{"x":25,"y":15},{"x":26,"y":16},{"x":27,"y":17},{"x":31,"y":17},{"x":32,"y":19},{"x":39,"y":19},{"x":40,"y":20},{"x":43,"y":20},{"x":44,"y":21},{"x":48,"y":21},{"x":49,"y":22},{"x":53,"y":22},{"x":54,"y":24},{"x":64,"y":24},{"x":65,"y":25},{"x":70,"y":25},{"x":71,"y":26},{"x":76,"y":26},{"x":77,"y":27},{"x":81,"y":27},{"x":82,"y":29},{"x":93,"y":29},{"x":94,"y":30},{"x":99,"y":30},{"x":100,"y":31},{"x":106,"y":31},{"x":107,"y":32},{"x":112,"y":32},{"x":113,"y":34},{"x":127,"y":34},{"x":128,"y":35},{"x":133,"y":35},{"x":134,"y":36},{"x":141,"y":36},{"x":142,"y":37},{"x":149,"y":37},{"x":150,"y":39},{"x":164,"y":39},{"x":165,"y":40},{"x":173,"y":40},{"x":174,"y":41},{"x":181,"y":41},{"x":182,"y":42},{"x":191,"y":42},{"x":192,"y":43},{"x":200,"y":43},{"x":201,"y":45},{"x":220,"y":45},{"x":221,"y":46},{"x":230,"y":46},{"x":231,"y":47},{"x":241,"y":47},{"x":242,"y":48},{"x":253,"y":48},{"x":254,"y":50},{"x":277,"y":50},{"x":278,"y":51},{"x":290,"y":51},{"x":291,"y":52},{"x":304,"y":52},{"x":305,"y":53},{"x":318,"y":53},{"x":319,"y":55},{"x":347,"y":55},{"x":348,"y":56},{"x":363,"y":56},{"x":364,"y":57},{"x":379,"y":57},{"x":380,"y":58},{"x":397,"y":58},{"x":398,"y":60},{"x":434,"y":60},{"x":435,"y":61},{"x":453,"y":61},{"x":454,"y":62},{"x":472,"y":62},{"x":473,"y":63},{"x":495,"y":63},{"x":496,"y":65},{"x":538,"y":65},{"x":539,"y":66},{"x":561,"y":66},{"x":562,"y":67},{"x":586,"y":67},{"x":587,"y":68},{"x":611,"y":68},{"x":612,"y":70},{"x":661,"y":70},{"x":662,"y":71},{"x":688,"y":71},{"x":689,"y":72},{"x":718,"y":72},{"x":719,"y":73},{"x":742,"y":73},{"x":743,"y":75},{"x":805,"y":75},{"x":806,"y":76},{"x":836,"y":76},{"x":837,"y":77},{"x":866,"y":77},{"x":867,"y":78},{"x":899,"y":78},{"x":900,"y":80},{"x":961,"y":80},{"x":962,"y":81},{"x":996,"y":81},{"x":997,"y":82},{"x":1030,"y":82},{"x":1031,"y":83},{"x":1062,"y":83},{"x":1063,"y":84},{"x":1101,"y":84},{"x":1102,"y":86},{"x":1173,"y":86},{"x":1174,"y":87},{"x":1212,"y":87},{"x":1213,"y":88},{"x":1245,"y":88},{"x":1246,"y":89},{"x":1286,"y":89},{"x":1287,"y":91},{"x":1362,"y":91},{"x":1363,"y":92},{"x":1403,"y":92},{"x":1404,"y":93},{"x":1445,"y":93},{"x":1446,"y":94},{"x":1490,"y":94},{"x":1491,"y":96},{"x":1578,"y":96},{"x":1579,"y":97},{"x":1624,"y":97},{"x":1625,"y":98},{"x":1667,"y":98},{"x":1668,"y":99},{"x":1718,"y":99},{"x":1719,"y":101},{"x":1816,"y":101},{"x":1817,"y":102},{"x":1866,"y":102},{"x":1867,"y":103},{"x":1917,"y":103},{"x":1918,"y":104},{"x":1971,"y":104},{"x":1972,"y":106},{"x":2086,"y":106},{"x":2087,"y":107},{"x":2139,"y":107},{"x":2140,"y":108},{"x":2196,"y":108},{"x":2197,"y":109},{"x":2259,"y":109},{"x":2260,"y":111},{"x":2399,"y":111},{"x":2400,"y":112},{"x":2470,"y":112},{"x":2471,"y":113},{"x":2539,"y":113},{"x":2540,"y":114},{"x":2615,"y":114},{"x":2616,"y":116},{"x":2779,"y":116},{"x":2780,"y":117},{"x":2862,"y":117},{"x":2863,"y":118},{"x":2952,"y":118},{"x":2953,"y":119},{"x":3049,"y":119},{"x":3050,"y":121},{"x":3278,"y":121},{"x":3279,"y":122},{"x":3423,"y":122},{"x":3424,"y":123},{"x":3689,"y":123}],"741":[{"x":0,"y":0},{"x":32,"y":0},{"x":33,"y":1},{"x":44,"y":1},{"x":45,"y":2},{"x":74,"y":2},{"x":75,"y":4},{"x":80,"y":4},{"x":81,"y":5},{"x":87,"y":5},{"x":88,"y":6},{"x":95,"y":6},{"x":96,"y":7},{"x":114,"y":7},{"x":115,"y":9},{"x":120,"y":9},{"x":121,"y":10},{"x":127,"y":10},{"x":128,"y":11},{"x":134,"y":11},{"x":135,"y":12},{"x":136,"y":12},{"x":137,"y":11},{"x":146,"y":11},{"x":147,"y":12},{"x":158,"y":12},{"x":159,"y":14},{"x":161,"y":14},{"x":162,"y":15},{"x":171,"y":15},{"x":172,"y":16},{"x":174,"y":16},{"x":175,"y":15},{"x":180,"y":15},{"x":181,"y":16},{"x":190,"y":16},{"x":191,"y":17},{"x":203,"y":17},{"x":204,"y":19},{"x":222,"y":19},{"x":223,"y":20},{"x":234,"y":20},{"x":235,"y":21},{"x":238,"y":21},{"x":239,"y":22},{"x":240,"y":21},{"x":241,"y":22},{"x":244,"y":22},{"x":245,"y":21},{"x":255,"y":21},{"x":256,"y":22},{"x":293,"y":22},{"x":294,"y":24},{"x":298,"y":24},{"x":299,"y":22},{"x":306,"y":22},{"x":307,"y":24},{"x":310,"y":24},{"x":311,"y":25},{"x":321,"y":25},{"x":322,"y":24},{"x":328,"y":24},{"x":329,"y":25},{"x":333,"y":25},{"x":334,"y":24},{"x":342,"y":24},{"x":343,"y":25},{"x":351,"y":25},{"x":352,"y":26},{"x":360,"y":26},{"x":361,"y":25},{"x":385,"y":25},{"x":386,"y":26},{"x":396,"y":26},{"x":397,"y":25},{"x":398,"y":26},{"x":401,"y":26},{"x":402,"y":27},{"x":403,"y":26},{"x":419,"y":26},{"x":420,"y":25},{"x":430,"y":25},{"x":431,"y":26},{"x":435,"y":26},{"x":436,"y":25},{"x":437,"y":25},{"x":438,"y":26},{"x":444,"y":26},{"x":445,"y":27},{"x":453,"y":27},{"x":454,"y":26},{"x":455,"y":27},{"x":461,"y":27},{"x":462,"y":26},{"x":469,"y":26},{"x":470,"y":27},{"x":547,"y":27},{"x":548,"y":29},{"x":560,"y":29},{"x":561,"y":30},{"x":565,"y":30},{"x":566,"y":31},{"x":570,"y":31},{"x":571,"y":32},{"x":572,"y":32}],"742":[{"x":0,"y":0},{"x":25,"y":0},{"x":26,"y":1},{"x":36,"y":1},{"x":37,"y":2},{"x":54,"y":2},{"x":55,"y":4},{"x":62,"y":4},{"x":63,"y":5},{"x":73,"y":5},{"x":74,"y":6},{"x":78,"y":6},{"x":79,"y":7},{"x":97,"y":7},{"x":98,"y":9},{"x":105,"y":9},{"x":106,"y":10},{"x":114,"y":10},{"x":115,"y":11},{"x":121,"y":11},{"x":122,"y":12},{"x":139,"y":12},{"x":140,"y":14},{"x":146,"y":14},{"x":147,"y":15},{"x":155,"y":15},{"x":156,"y":16},{"x":165,"y":16},{"x":166,"y":17},{"x":188,"y":17},{"x":189,"y":19},{"x":199,"y":19},{"x":200,"y":20},{"x":209,"y":20},{"x":210,"y":21},{"x":221,"y":21},{"x":222,"y":22},{"x":256,"y":22},{"x":257,"y":24},{"x":258,"y":22},{"x":259,"y":22},{"x":260,"y":24},{"x":284,"y":24},{"x":285,"y":25},{"x":303,"y":25},{"x":304,"y":26},{"x":305,"y":25},{"x":309,"y":25},{"x":310,"y":26},{"x":320,"y":26},{"x":321,"y":27},{"x":325,"y":27},{"x":326,"y":26},{"x":327,"y":27},{"x":487,"y":27},{"x":488,"y":29},{"x":489,"y":27},{"x":490,"y":29},{"x":491,"y":29},{"x":492,"y":27},{"x":510,"y":27},{"x":511,"y":29},{"x":516,"y":29},{"x":517,"y":27},{"x":528,"y":27},{"x":529,"y":29},{"x":542,"y":29},{"x":543,"y":30},{"x":564,"y":30},{"x":565,"y":31},{"x":568,"y":31},{"x":569,"y":32},{"x":572,"y":32}],"743":[{"x":0,"y":0},{"x":17,"y":0},{"x":18,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":39,"y":2},{"x":40,"y":4},{"x":47,"y":4},{"x":48,"y":5},{"x":53,"y":5},{"x":54,"y":6},{"x":60,"y":6},{"x":61,"y":7},{"x":77,"y":7},{"x":78,"y":9},{"x":84,"y":9},{"x":85,"y":10},{"x":91,"y":10},{"x":92,"y":11},{"x":99,"y":11},{"x":100,"y":12},{"x":115,"y":12},{"x":116,"y":14},{"x":124,"y":14},{"x":125,"y":15},{"x":133,"y":15},{"x":134,"y":16},{"x":139,"y":16},{"x":140,"y":17},{"x":158,"y":17},{"x":159,"y":19},{"x":169,"y":19},{"x":170,"y":20},{"x":175,"y":20},{"x":176,"y":21},{"x":190,"y":21},{"x":191,"y":22},{"x":214,"y":22},{"x":215,"y":24},{"x":226,"y":24},{"x":227,"y":25},{"x":239,"y":25},{"x":240,"y":26},{"x":260,"y":26},{"x":261,"y":27},{"x":302,"y":27},{"x":303,"y":29},{"x":304,"y":27},{"x":305,"y":29},{"x":329,"y":29},{"x":330,"y":30},{"x":331,"y":30},{"x":332,"y":29},{"x":333,"y":30},{"x":383,"y":30},{"x":384,"y":31},{"x":385,"y":31},{"x":386,"y":30},{"x":388,"y":30},{"x":389,"y":31},{"x":424,"y":31},{"x":425,"y":30},{"x":426,"y":30},{"x":427,"y":31},{"x":435,"y":31},{"x":436,"y":30},{"x":438,"y":30},{"x":439,"y":31},{"x":446,"y":31},{"x":447,"y":30},{"x":539,"y":30},{"x":540,"y":31},{"x":563,"y":31},{"x":564,"y":32},{"x":572,"y":32}],"745":[{"x":0,"y":0},{"x":10,"y":0},{"x":11,"y":1},{"x":15,"y":1},{"x":16,"y":2},{"x":24,"y":2},{"x":25,"y":4},{"x":29,"y":4},{"x":30,"y":5},{"x":34,"y":5},{"x":35,"y":6},{"x":40,"y":6},{"x":41,"y":7},{"x":53,"y":7},{"x":54,"y":9},{"x":59,"y":9},{"x":60,"y":10},{"x":65,"y":10},{"x":66,"y":11},{"x":72,"y":11},{"x":73,"y":12},{"x":85,"y":12},{"x":86,"y":14},{"x":92,"y":14},{"x":93,"y":15},{"x":100,"y":15},{"x":101,"y":16},{"x":107,"y":16},{"x":108,"y":17},{"x":121,"y":17},{"x":122,"y":19},{"x":128,"y":19},{"x":129,"y":20},{"x":137,"y":20},{"x":138,"y":21},{"x":145,"y":21},{"x":146,"y":22},{"x":163,"y":22},{"x":164,"y":24},{"x":172,"y":24},{"x":173,"y":25},{"x":182,"y":25},{"x":183,"y":26},{"x":194,"y":26},{"x":195,"y":27},{"x":218,"y":27},{"x":219,"y":29},{"x":232,"y":29},{"x":233,"y":30},{"x":245,"y":30},{"x":246,"y":31},{"x":263,"y":31},{"x":264,"y":32},{"x":310,"y":32},{"x":311,"y":34},{"x":377,"y":34},{"x":378,"y":35},{"x":385,"y":35},{"x":386,"y":34},{"x":398,"y":34},{"x":399,"y":35},{"x":400,"y":34},{"x":405,"y":34},{"x":406,"y":35},{"x":407,"y":34},{"x":489,"y":34},{"x":490,"y":32},{"x":572,"y":32}],"746":[{"x":0,"y":16},{"x":1,"y":19},{"x":2,"y":19},{"x":3,"y":21},{"x":4,"y":21},{"x":5,"y":22},{"x":6,"y":22},{"x":7,"y":24},{"x":15,"y":24},{"x":16,"y":26},{"x":23,"y":26},{"x":24,"y":27},{"x":29,"y":27},{"x":30,"y":29},{"x":44,"y":29},{"x":45,"y":30},{"x":46,"y":30},{"x":47,"y":34},{"x":72,"y":34},{"x":73,"y":35},{"x":74,"y":35},{"x":75,"y":34},{"x":76,"y":36},{"x":77,"y":35},{"x":78,"y":37},{"x":80,"y":37},{"x":81,"y":39},{"x":96,"y":39},{"x":97,"y":40},{"x":105,"y":40},{"x":106,"y":41},{"x":107,"y":42},{"x":116,"y":42},{"x":117,"y":43},{"x":120,"y":43},{"x":121,"y":45},{"x":124,"y":45},{"x":125,"y":46},{"x":126,"y":43},{"x":127,"y":45},{"x":138,"y":45},{"x":139,"y":46},{"x":148,"y":46},{"x":149,"y":47},{"x":153,"y":47},{"x":154,"y":48},{"x":160,"y":48},{"x":161,"y":50},{"x":171,"y":50},{"x":172,"y":48},{"x":176,"y":48},{"x":177,"y":50},{"x":188,"y":50},{"x":189,"y":51},{"x":211,"y":51},{"x":212,"y":53},{"x":223,"y":53},{"x":224,"y":55},{"x":229,"y":55},{"x":230,"y":53},{"x":236,"y":53},{"x":237,"y":55},{"x":295,"y":55},{"x":296,"y":56},{"x":314,"y":56},{"x":315,"y":57},{"x":316,"y":56},{"x":326,"y":56},{"x":327,"y":55},{"x":329,"y":55},{"x":330,"y":56},{"x":331,"y":55},{"x":337,"y":55},{"x":338,"y":56},{"x":353,"y":56},{"x":354,"y":57},{"x":361,"y":57},{"x":362,"y":58},{"x":366,"y":58},{"x":367,"y":57},{"x":376,"y":57},{"x":377,"y":58},{"x":381,"y":58},{"x":382,"y":56},{"x":383,"y":56},{"x":384,"y":57},{"x":392,"y":57},{"x":393,"y":55},{"x":402,"y":55},{"x":403,"y":56},{"x":407,"y":56},{"x":408,"y":55},{"x":427,"y":55},{"x":428,"y":53},{"x":431,"y":53},{"x":432,"y":55},{"x":433,"y":55},{"x":434,"y":53},{"x":451,"y":53},{"x":452,"y":55},{"x":453,"y":55},{"x":454,"y":53},{"x":466,"y":53},{"x":467,"y":55},{"x":470,"y":55},{"x":471,"y":52},{"x":483,"y":52},{"x":484,"y":51},{"x":491,"y":51},{"x":492,"y":52},{"x":495,"y":52},{"x":496,"y":51},{"x":497,"y":50},{"x":514,"y":50},{"x":515,"y":48},{"x":521,"y":48},{"x":522,"y":47},{"x":525,"y":47},{"x":526,"y":48},{"x":528,"y":48},{"x":529,"y":47},{"x":530,"y":46},{"x":531,"y":46},{"x":532,"y":47},{"x":533,"y":47},{"x":534,"y":46},{"x":536,"y":46},{"x":537,"y":45},{"x":549,"y":45},{"x":550,"y":43},{"x":554,"y":43},{"x":555,"y":42},{"x":557,"y":42},{"x":558,"y":41},{"x":565,"y":41},{"x":566,"y":40},{"x":568,"y":40},{"x":569,"y":39},{"x":571,"y":39},{"x":572,"y":36}],"747":[{"x":0,"y":16},{"x":1,"y":19},{"x":3,"y":19},{"x":4,"y":21},{"x":9,"y":21},{"x":10,"y":22},{"x":12,"y":22},{"x":13,"y":24},{"x":22,"y":24},{"x":23,"y":25},{"x":29,"y":25},{"x":30,"y":26},{"x":36,"y":26},{"x":37,"y":27},{"x":38,"y":27},{"x":39,"y":29},{"x":48,"y":29},{"x":49,"y":30},{"x":55,"y":30},{"x":56,"y":31},{"x":59,"y":31},{"x":60,"y":32},{"x":69,"y":32},{"x":70,"y":34},{"x":82,"y":34},{"x":83,"y":35},{"x":87,"y":35},{"x":88,"y":36},{"x":96,"y":36},{"x":97,"y":37},{"x":103,"y":37},{"x":104,"y":39},{"x":113,"y":39},{"x":114,"y":40},{"x":116,"y":40},{"x":117,"y":41},{"x":118,"y":40},{"x":119,"y":41},{"x":124,"y":41},{"x":125,"y":42},{"x":134,"y":42},{"x":135,"y":43},{"x":141,"y":43},{"x":142,"y":45},{"x":168,"y":45},{"x":169,"y":46},{"x":177,"y":46},{"x":178,"y":47},{"x":181,"y":47},{"x":182,"y":48},{"x":191,"y":48},{"x":192,"y":50},{"x":194,"y":50},{"x":195,"y":48},{"x":196,"y":50},{"x":219,"y":50},{"x":220,"y":51},{"x":242,"y":51},{"x":243,"y":52},{"x":248,"y":52},{"x":249,"y":53},{"x":292,"y":53},{"x":293,"y":55},{"x":338,"y":55},{"x":339,"y":53},{"x":340,"y":55},{"x":341,"y":53},{"x":342,"y":53},{"x":343,"y":55},{"x":395,"y":55},{"x":396,"y":53},{"x":415,"y":53},{"x":416,"y":52},{"x":424,"y":52},{"x":425,"y":53},{"x":426,"y":52},{"x":427,"y":53},{"x":428,"y":52},{"x":429,"y":52},{"x":430,"y":53},{"x":431,"y":52},{"x":447,"y":52},{"x":448,"y":51},{"x":475,"y":51},{"x":476,"y":50},{"x":477,"y":51},{"x":478,"y":51},{"x":479,"y":50},{"x":499,"y":50},{"x":500,"y":48},{"x":509,"y":48},{"x":510,"y":47},{"x":517,"y":47},{"x":518,"y":46},{"x":529,"y":46},{"x":530,"y":45},{"x":541,"y":45},{"x":542,"y":43},{"x":547,"y":43},{"x":548,"y":42},{"x":553,"y":42},{"x":554,"y":41},{"x":561,"y":41},{"x":562,"y":40},{"x":565,"y":40},{"x":566,"y":39},{"x":571,"y":39},{"x":572,"y":36}],"748":[{"x":0,"y":16},{"x":2,"y":16},{"x":3,"y":17},{"x":4,"y":19},{"x":10,"y":19},{"x":11,"y":20},{"x":17,"y":20},{"x":18,"y":21},{"x":22,"y":21},{"x":23,"y":22},{"x":28,"y":22},{"x":29,"y":24},{"x":39,"y":24},{"x":40,"y":25},{"x":46,"y":25},{"x":47,"y":26},{"x":52,"y":26},{"x":53,"y":27},{"x":57,"y":27},{"x":58,"y":29},{"x":71,"y":29},{"x":72,"y":30},{"x":77,"y":30},{"x":78,"y":31},{"x":83,"y":31},{"x":84,"y":32},{"x":90,"y":32},{"x":91,"y":34},{"x":103,"y":34},{"x":104,"y":35},{"x":110,"y":35},{"x":111,"y":36},{"x":115,"y":36},{"x":116,"y":37},{"x":123,"y":37},{"x":124,"y":39},{"x":139,"y":39},{"x":140,"y":40},{"x":147,"y":40},{"x":148,"y":41},{"x":155,"y":41},{"x":156,"y":42},{"x":166,"y":42},{"x":167,"y":43},{"x":181,"y":43},{"x":182,"y":45},{"x":200,"y":45},{"x":201,"y":46},{"x":212,"y":46},{"x":213,"y":47},{"x":227,"y":47},{"x":228,"y":48},{"x":244,"y":48},{"x":245,"y":50},{"x":290,"y":50},{"x":291,"y":51},{"x":292,"y":51},{"x":293,"y":50},{"x":294,"y":51},{"x":399,"y":51},{"x":400,"y":50},{"x":453,"y":50},{"x":454,"y":48},{"x":474,"y":48},{"x":475,"y":47},{"x":488,"y":47},{"x":489,"y":46},{"x":501,"y":46},{"x":502,"y":45},{"x":523,"y":45},{"x":524,"y":43},{"x":532,"y":43},{"x":533,"y":42},{"x":541,"y":42},{"x":542,"y":41},{"x":550,"y":41},{"x":551,"y":40},{"x":557,"y":40},{"x":558,"y":39},{"x":568,"y":39},{"x":569,"y":37},{"x":571,"y":37},{"x":572,"y":36}],"750":[{"x":0,"y":14},{"x":6,"y":14},{"x":7,"y":15},{"x":10,"y":15},{"x":11,"y":16},{"x":15,"y":16},{"x":16,"y":17},{"x":22,"y":17},{"x":23,"y":19},{"x":36,"y":19},{"x":37,"y":20},{"x":43,"y":20},{"x":44,"y":21},{"x":49,"y":21},{"x":50,"y":22},{"x":56,"y":22},{"x":57,"y":24},{"x":69,"y":24},{"x":70,"y":25},{"x":76,"y":25},{"x":77,"y":26},{"x":83,"y":26},{"x":84,"y":27},{"x":89,"y":27},{"x":90,"y":29},{"x":103,"y":29},{"x":104,"y":30},{"x":110,"y":30},{"x":111,"y":31},{"x":117,"y":31},{"x":118,"y":32},{"x":125,"y":32},{"x":126,"y":34},{"x":140,"y":34},{"x":141,"y":35},{"x":148,"y":35},{"x":149,"y":36},{"x":157,"y":36},{"x":158,"y":37},{"x":165,"y":37},{"x":166,"y":39},{"x":185,"y":39},{"x":186,"y":40},{"x":197,"y":40},{"x":198,"y":41},{"x":209,"y":41},{"x":210,"y":42},{"x":223,"y":42},{"x":224,"y":43},{"x":238,"y":43},{"x":239,"y":45},{"x":284,"y":45},{"x":285,"y":46},{"x":334,"y":46},{"x":335,"y":47},{"x":379,"y":47},{"x":380,"y":46},{"x":430,"y":46},{"x":431,"y":45},{"x":477,"y":45},{"x":478,"y":43},{"x":496,"y":43},{"x":497,"y":42},{"x":510,"y":42},{"x":511,"y":41},{"x":524,"y":41},{"x":525,"y":40},{"x":536,"y":40},{"x":537,"y":39},{"x":557,"y":39},{"x":558,"y":37},{"x":565,"y":37},{"x":566,"y":36},{"x":572,"y":36}],"751":[{"x":0,"y":0},{"x":209,"y":0},{"x":210,"y":1},{"x":278,"y":1},{"x":279,"y":2},{"x":384,"y":2},{"x":385,"y":4},{"x":478,"y":4},{"x":479,"y":5},{"x":482,"y":5},{"x":483,"y":6},{"x":484,"y":5},{"x":540,"y":5},{"x":541,"y":6},{"x":608,"y":6},{"x":609,"y":7},{"x":714,"y":7},{"x":715,"y":9},{"x":733,"y":9},{"x":734,"y":7},{"x":762,"y":7},{"x":763,"y":9},{"x":770,"y":9},{"x":771,"y":10},{"x":773,"y":10},{"x":774,"y":11},{"x":853,"y":11},{"x":854,"y":12},{"x":855,"y":12},{"x":856,"y":11},{"x":904,"y":11},{"x":905,"y":12},{"x":955,"y":12},{"x":956,"y":14},{"x":1009,"y":14},{"x":1010,"y":15},{"x":1064,"y":15},{"x":1065,"y":16},{"x":1069,"y":16},{"x":1070,"y":15},{"x":1087,"y":15},{"x":1088,"y":16},{"x":1106,"y":16},{"x":1107,"y":17},{"x":1110,"y":17},{"x":1111,"y":16},{"x":1139,"y":16},{"x":1140,"y":17},{"x":1297,"y":17},{"x":1298,"y":19},{"x":1314,"y":19},{"x":1315,"y":17},{"x":1332,"y":17},{"x":1333,"y":19},{"x":1423,"y":19},{"x":1424,"y":20},{"x":1447,"y":20},{"x":1448,"y":21},{"x":1488,"y":21},{"x":1489,"y":20},{"x":1537,"y":20},{"x":1538,"y":21},{"x":1621,"y":21},{"x":1622,"y":22},{"x":2062,"y":22},{"x":2063,"y":24},{"x":2101,"y":24},{"x":2102,"y":25},{"x":2129,"y":25},{"x":2130,"y":24},{"x":2140,"y":24},{"x":2141,"y":25},{"x":2174,"y":25},{"x":2175,"y":26},{"x":2350,"y":26},{"x":2351,"y":27},{"x":2352,"y":27},{"x":2353,"y":26},{"x":2366,"y":26},{"x":2367,"y":25},{"x":2520,"y":25},{"x":2521,"y":26},{"x":2528,"y":26},{"x":2529,"y":25},{"x":2555,"y":25},{"x":2556,"y":26},{"x":2677,"y":26},{"x":2678,"y":25},{"x":2756,"y":25},{"x":2757,"y":26},{"x":2777,"y":26},{"x":2778,"y":27},{"x":2785,"y":27},{"x":2786,"y":26},{"x":2848,"y":26},{"x":2849,"y":27},{"x":2865,"y":27},{"x":2866,"y":26},{"x":2899,"y":26},{"x":2900,"y":25},{"x":2901,"y":25},{"x":2902,"y":26},{"x":2925,"y":26},{"x":2926,"y":25},{"x":2927,"y":26},{"x":2968,"y":26},{"x":2969,"y":27},{"x":3038,"y":27},{"x":3039,"y":26},{"x":3081,"y":26},{"x":3082,"y":27},{"x":3542,"y":27},{"x":3543,"y":29},{"x":3603,"y":29},{"x":3604,"y":30},{"x":3673,"y":30},{"x":3674,"y":32},{"x":3689,"y":32}],"752":[{"x":0,"y":0},{"x":176,"y":0},{"x":177,"y":1},{"x":238,"y":1},{"x":239,"y":2},{"x":344,"y":2},{"x":345,"y":4},{"x":393,"y":4},{"x":394,"y":5},{"x":441,"y":5},{"x":442,"y":6},{"x":483,"y":6},{"x":484,"y":7},{"x":604,"y":7},{"x":605,"y":9},{"x":676,"y":9},{"x":677,"y":10},{"x":725,"y":10},{"x":726,"y":11},{"x":788,"y":11},{"x":789,"y":12},{"x":857,"y":12},{"x":858,"y":14},{"x":920,"y":14},{"x":921,"y":15},{"x":971,"y":15},{"x":972,"y":16},{"x":1049,"y":16},{"x":1050,"y":17},{"x":1156,"y":17},{"x":1157,"y":19},{"x":1160,"y":19},{"x":1161,"y":17},{"x":1165,"y":17},{"x":1166,"y":19},{"x":1272,"y":19},{"x":1273,"y":20},{"x":1332,"y":20},{"x":1333,"y":21},{"x":1414,"y":21},{"x":1415,"y":22},{"x":1695,"y":22},{"x":1696,"y":24},{"x":1701,"y":24},{"x":1702,"y":22},{"x":1707,"y":22},{"x":1708,"y":24},{"x":1790,"y":24},{"x":1791,"y":25},{"x":1817,"y":25},{"x":1818,"y":24},{"x":1826,"y":24},{"x":1827,"y":25},{"x":1833,"y":25},{"x":1834,"y":24},{"x":1853,"y":24},{"x":1854,"y":25},{"x":2001,"y":25},{"x":2002,"y":26},{"x":2011,"y":26},{"x":2012,"y":25},{"x":2015,"y":25},{"x":2016,"y":26},{"x":2041,"y":26},{"x":2042,"y":25},{"x":2043,"y":26},{"x":2142,"y":26},{"x":2143,"y":27},{"x":3108,"y":27},{"x":3109,"y":29},{"x":3118,"y":29},{"x":3119,"y":27},{"x":3183,"y":27},{"x":3184,"y":29},{"x":3189,"y":29},{"x":3190,"y":27},{"x":3191,"y":29},{"x":3227,"y":29},{"x":3228,"y":27},{"x":3237,"y":27},{"x":3238,"y":29},{"x":3263,"y":29},{"x":3264,"y":27},{"x":3268,"y":27},{"x":3269,"y":29},{"x":3272,"y":29},{"x":3273,"y":27},{"x":3279,"y":27},{"x":3280,"y":29},{"x":3328,"y":29},{"x":3329,"y":27},{"x":3331,"y":27},{"x":3332,"y":29},{"x":3334,"y":29},{"x":3335,"y":27},{"x":3441,"y":27},{"x":3442,"y":29},{"x":3556,"y":29},{"x":3557,"y":30},{"x":3647,"y":30},{"x":3648,"y":31},{"x":3673,"y":31},{"x":3674,"y":32},{"x":3689,"y":32}],"753":[{"x":0,"y":0},{"x":113,"y":0},{"x":114,"y":1},{"x":160,"y":1},{"x":161,"y":2},{"x":254,"y":2},{"x":255,"y":4},{"x":301,"y":4},{"x":302,"y":5},{"x":345,"y":5},{"x":346,"y":6},{"x":383,"y":6},{"x":384,"y":7},{"x":493,"y":7},{"x":494,"y":9},{"x":545,"y":9},{"x":546,"y":10},{"x":581,"y":10},{"x":582,"y":11},{"x":638,"y":11},{"x":639,"y":12},{"x":730,"y":12},{"x":731,"y":14},{"x":788,"y":14},{"x":789,"y":15},{"x":828,"y":15},{"x":829,"y":16},{"x":886,"y":16},{"x":887,"y":17},{"x":986,"y":17},{"x":987,"y":19},{"x":1067,"y":19},{"x":1068,"y":20},{"x":1128,"y":20},{"x":1129,"y":21},{"x":1202,"y":21},{"x":1203,"y":22},{"x":1359,"y":22},{"x":1360,"y":24},{"x":1443,"y":24},{"x":1444,"y":25},{"x":1445,"y":24},{"x":1447,"y":24},{"x":1448,"y":25},{"x":1526,"y":25},{"x":1527,"y":26},{"x":1532,"y":26},{"x":1533,"y":25},{"x":1534,"y":25},{"x":1535,"y":26},{"x":1541,"y":26},{"x":1542,"y":25},{"x":1547,"y":25},{"x":1548,"y":26},{"x":1551,"y":26},{"x":1552,"y":25},{"x":1554,"y":25},{"x":1555,"y":26},{"x":1642,"y":26},{"x":1643,"y":27},{"x":1969,"y":27},{"x":1970,"y":29},{"x":2095,"y":29},{"x":2096,"y":30},{"x":2097,"y":30},{"x":2098,"y":29},{"x":2102,"y":29},{"x":2103,"y":30},{"x":2109,"y":30},{"x":2110,"y":29},{"x":2121,"y":29},{"x":2122,"y":30},{"x":2123,"y":30},{"x":2124,"y":29},{"x":2125,"y":29},{"x":2126,"y":30},{"x":2130,"y":30},{"x":2131,"y":29},{"x":2136,"y":29},{"x":2137,"y":30},{"x":2159,"y":30},{"x":2160,"y":29},{"x":2161,"y":30},{"x":2440,"y":30},{"x":2441,"y":31},{"x":2444,"y":31},{"x":2445,"y":30},{"x":2448,"y":30},{"x":2449,"y":31},{"x":2450,"y":30},{"x":2491,"y":30},{"x":2492,"y":31},{"x":2496,"y":31},{"x":2497,"y":30},{"x":2510,"y":30},{"x":2511,"y":31},{"x":2512,"y":30},{"x":2515,"y":30},{"x":2516,"y":31},{"x":2517,"y":31},{"x":2518,"y":30},{"x":2519,"y":31},{"x":2801,"y":31},{"x":2802,"y":30},{"x":2804,"y":30},{"x":2805,"y":31},{"x":2807,"y":31},{"x":2808,"y":30},{"x":2825,"y":30},{"x":2826,"y":31},{"x":2827,"y":30},{"x":2841,"y":30},{"x":2842,"y":31},{"x":2843,"y":30},{"x":2844,"y":31},{"x":2848,"y":31},{"x":2849,"y":30},{"x":2866,"y":30},{"x":2867,"y":31},{"x":2952,"y":31},{"x":2953,"y":30},{"x":2954,"y":31},{"x":2955,"y":30},{"x":2956,"y":31},{"x":2964,"y":31},{"x":2965,"y":30},{"x":3025,"y":30},{"x":3026,"y":31},{"x":3027,"y":30},{"x":3028,"y":30},{"x":3029,"y":31},{"x":3061,"y":31},{"x":3062,"y":30},{"x":3480,"y":30},{"x":3481,"y":31},{"x":3482,"y":30},{"x":3490,"y":30},{"x":3491,"y":31},{"x":3492,"y":30},{"x":3493,"y":31},{"x":3498,"y":31},{"x":3499,"y":30},{"x":3500,"y":31},{"x":3645,"y":31},{"x":3646,"y":32},{"x":3689,"y":32}],"755":[{"x":0,"y":0},{"x":61,"y":0},{"x":62,"y":1},{"x":91,"y":1},{"x":92,"y":2},{"x":153,"y":2},{"x":154,"y":4},{"x":186,"y":4},{"x":187,"y":5},{"x":221,"y":5},{"x":222,"y":6},{"x":258,"y":6},{"x":259,"y":7},{"x":336,"y":7},{"x":337,"y":9},{"x":376,"y":9},{"x":377,"y":10},{"x":416,"y":10},{"x":417,"y":11},{"x":458,"y":11},{"x":459,"y":12},{"x":545,"y":12},{"x":546,"y":14},{"x":587,"y":14},{"x":588,"y":15},{"x":636,"y":15},{"x":637,"y":16},{"x":679,"y":16},{"x":680,"y":17},{"x":772,"y":17},{"x":773,"y":19},{"x":827,"y":19},{"x":828,"y":20},{"x":877,"y":20},{"x":878,"y":21},{"x":927,"y":21},{"x":928,"y":22},{"x":1041,"y":22},{"x":1042,"y":24},{"x":1102,"y":24},{"x":1103,"y":25},{"x":1167,"y":25},{"x":1168,"y":26},{"x":1237,"y":26},{"x":1238,"y":27},{"x":1391,"y":27},{"x":1392,"y":29},{"x":1475,"y":29},{"x":1476,"y":30},{"x":1573,"y":30},{"x":1574,"y":31},{"x":1681,"y":31},{"x":1682,"y":32},{"x":2023,"y":32},{"x":2024,"y":34},{"x":2339,"y":34},{"x":2340,"y":35},{"x":2365,"y":35},{"x":2366,"y":34},{"x":2367,"y":34},{"x":2368,"y":35},{"x":2749,"y":35},{"x":2750,"y":34},{"x":3173,"y":34},{"x":3174,"y":32},{"x":3175,"y":34},{"x":3176,"y":32},{"x":3689,"y":32}],"756":[{"x":0,"y":16},{"x":9,"y":16},{"x":10,"y":17},{"x":11,"y":19},{"x":21,"y":19},{"x":22,"y":20},{"x":25,"y":20},{"x":26,"y":21},{"x":45,"y":21},{"x":46,"y":22},{"x":61,"y":22},{"x":62,"y":24},{"x":108,"y":24},{"x":109,"y":25},{"x":113,"y":25},{"x":114,"y":26},{"x":131,"y":26},{"x":132,"y":27},{"x":195,"y":27},{"x":196,"y":29},{"x":286,"y":29},{"x":287,"y":30},{"x":289,"y":30},{"x":290,"y":31},{"x":305,"y":31},{"x":306,"y":32},{"x":331,"y":32},{"x":332,"y":34},{"x":339,"y":34},{"x":340,"y":32},{"x":359,"y":32},{"x":360,"y":34},{"x":364,"y":34},{"x":365,"y":32},{"x":382,"y":32},{"x":383,"y":34},{"x":468,"y":34},{"x":469,"y":35},{"x":477,"y":35},{"x":478,"y":34},{"x":490,"y":34},{"x":491,"y":35},{"x":509,"y":35},{"x":510,"y":36},{"x":551,"y":36},{"x":552,"y":39},{"x":638,"y":39},{"x":639,"y":40},{"x":690,"y":40},{"x":691,"y":41},{"x":693,"y":41},{"x":694,"y":42},{"x":758,"y":42},{"x":759,"y":43},{"x":779,"y":43},{"x":780,"y":45},{"x":834,"y":45},{"x":835,"y":46},{"x":889,"y":46},{"x":890,"y":45},{"x":911,"y":45},{"x":912,"y":46},{"x":1008,"y":46},{"x":1009,"y":47},{"x":1041,"y":47},{"x":1042,"y":48},{"x":1060,"y":48},{"x":1061,"y":50},{"x":1103,"y":50},{"x":1104,"y":48},{"x":1119,"y":48},{"x":1120,"y":50},{"x":1197,"y":50},{"x":1198,"y":51},{"x":1334,"y":51},{"x":1335,"y":52},{"x":1391,"y":52},{"x":1392,"y":53},{"x":1393,"y":52},{"x":1425,"y":52},{"x":1426,"y":53},{"x":1433,"y":53},{"x":1434,"y":52},{"x":1477,"y":52},{"x":1478,"y":53},{"x":1510,"y":53},{"x":1511,"y":55},{"x":1730,"y":55},{"x":1731,"y":56},{"x":1911,"y":56},{"x":1912,"y":55},{"x":1936,"y":55},{"x":1937,"y":56},{"x":1953,"y":56},{"x":1954,"y":55},{"x":2031,"y":55},{"x":2032,"y":56},{"x":2053,"y":56},{"x":2054,"y":55},{"x":2088,"y":55},{"x":2089,"y":56},{"x":2115,"y":56},{"x":2116,"y":57},{"x":2191,"y":57},{"x":2192,"y":56},{"x":2193,"y":58},{"x":2213,"y":58},{"x":2214,"y":57},{"x":2263,"y":57},{"x":2264,"y":56},{"x":2306,"y":56},{"x":2307,"y":57},{"x":2325,"y":57},{"x":2326,"y":56},{"x":2368,"y":56},{"x":2369,"y":57},{"x":2410,"y":57},{"x":2411,"y":55},{"x":2429,"y":55},{"x":2430,"y":57},{"x":2453,"y":57},{"x":2454,"y":56},{"x":2542,"y":56},{"x":2543,"y":55},{"x":2652,"y":55},{"x":2653,"y":56},{"x":2680,"y":56},{"x":2681,"y":55},{"x":2857,"y":55},{"x":2858,"y":52},{"x":2859,"y":53},{"x":2862,"y":53},{"x":2863,"y":52},{"x":2866,"y":52},{"x":2867,"y":53},{"x":2943,"y":53},{"x":2944,"y":52},{"x":2945,"y":52},{"x":2946,"y":53},{"x":2993,"y":53},{"x":2994,"y":52},{"x":3011,"y":52},{"x":3012,"y":51},{"x":3121,"y":51},{"x":3122,"y":50},{"x":3272,"y":50},{"x":3273,"y":48},{"x":3344,"y":48},{"x":3345,"y":47},{"x":3379,"y":47},{"x":3380,"y":46},{"x":3391,"y":46},{"x":3392,"y":45},{"x":3414,"y":45},{"x":3415,"y":46},{"x":3438,"y":46},{"x":3439,"y":45},{"x":3508,"y":45},{"x":3509,"y":43},{"x":3540,"y":43},{"x":3541,"y":42},{"x":3566,"y":42},{"x":3567,"y":41},{"x":3599,"y":41},{"x":3600,"y":40},{"x":3636,"y":40},{"x":3637,"y":39},{"x":3675,"y":39},{"x":3676,"y":37},{"x":3679,"y":37},{"x":3680,"y":36},{"x":3689,"y":36}],"757":[{"x":0,"y":16},{"x":10,"y":16},{"x":11,"y":17},{"x":21,"y":17},{"x":22,"y":19},{"x":35,"y":19},{"x":36,"y":20},{"x":44,"y":20},{"x":45,"y":21},{"x":64,"y":21},{"x":65,"y":22},{"x":95,"y":22},{"x":96,"y":24},{"x":139,"y":24},{"x":140,"y":25},{"x":172,"y":25},{"x":173,"y":26},{"x":174,"y":26},{"x":175,"y":25},{"x":176,"y":26},{"x":178,"y":26},{"x":179,"y":25},{"x":182,"y":25},{"x":183,"y":26},{"x":206,"y":26},{"x":207,"y":27},{"x":209,"y":27},{"x":210,"y":26},{"x":211,"y":26},{"x":212,"y":27},{"x":258,"y":27},{"x":259,"y":29},{"x":262,"y":29},{"x":263,"y":27},{"x":264,"y":27},{"x":265,"y":29},{"x":323,"y":29},{"x":324,"y":30},{"x":350,"y":30},{"x":351,"y":31},{"x":364,"y":31},{"x":365,"y":30},{"x":382,"y":30},{"x":383,"y":31},{"x":425,"y":31},{"x":426,"y":32},{"x":427,"y":32},{"x":428,"y":31},{"x":429,"y":32},{"x":452,"y":32},{"x":453,"y":34},{"x":546,"y":34},{"x":547,"y":35},{"x":564,"y":35},{"x":565,"y":36},{"x":566,"y":36},{"x":567,"y":35},{"x":571,"y":35},{"x":572,"y":36},{"x":573,"y":35},{"x":586,"y":35},{"x":587,"y":36},{"x":631,"y":36},{"x":632,"y":37},{"x":649,"y":37},{"x":650,"y":39},{"x":652,"y":39},{"x":653,"y":37},{"x":654,"y":39},{"x":702,"y":39},{"x":703,"y":40},{"x":704,"y":40},{"x":705,"y":39},{"x":710,"y":39},{"x":711,"y":40},{"x":757,"y":40},{"x":758,"y":41},{"x":760,"y":41},{"x":761,"y":40},{"x":762,"y":40},{"x":763,"y":41},{"x":772,"y":41},{"x":773,"y":40},{"x":774,"y":41},{"x":820,"y":41},{"x":821,"y":42},{"x":865,"y":42},{"x":866,"y":43},{"x":941,"y":43},{"x":942,"y":45},{"x":1063,"y":45},{"x":1064,"y":46},{"x":1115,"y":46},{"x":1116,"y":47},{"x":1180,"y":47},{"x":1181,"y":48},{"x":1225,"y":48},{"x":1226,"y":50},{"x":1415,"y":50},{"x":1416,"y":51},{"x":1485,"y":51},{"x":1486,"y":52},{"x":1496,"y":52},{"x":1497,"y":51},{"x":1503,"y":51},{"x":1504,"y":52},{"x":1573,"y":52},{"x":1574,"y":53},{"x":1575,"y":53},{"x":1576,"y":52},{"x":1587,"y":52},{"x":1588,"y":53},{"x":1610,"y":53},{"x":1611,"y":52},{"x":1612,"y":53},{"x":1615,"y":53},{"x":1616,"y":52},{"x":1620,"y":52},{"x":1621,"y":53},{"x":1814,"y":53},{"x":1815,"y":55},{"x":1827,"y":55},{"x":1828,"y":53},{"x":1835,"y":53},{"x":1836,"y":55},{"x":1851,"y":55},{"x":1852,"y":53},{"x":1855,"y":53},{"x":1856,"y":55},{"x":1859,"y":55},{"x":1860,"y":53},{"x":1869,"y":53},{"x":1870,"y":55},{"x":1878,"y":55},{"x":1879,"y":53},{"x":1904,"y":53},{"x":1905,"y":55},{"x":2029,"y":55},{"x":2030,"y":53},{"x":2038,"y":53},{"x":2039,"y":55},{"x":2527,"y":55},{"x":2528,"y":53},{"x":2710,"y":53},{"x":2711,"y":52},{"x":2829,"y":52},{"x":2830,"y":51},{"x":2991,"y":51},{"x":2992,"y":50},{"x":2996,"y":50},{"x":2997,"y":51},{"x":3000,"y":51},{"x":3001,"y":50},{"x":3156,"y":50},{"x":3157,"y":48},{"x":3248,"y":48},{"x":3249,"y":47},{"x":3301,"y":47},{"x":3302,"y":46},{"x":3366,"y":46},{"x":3367,"y":45},{"x":3448,"y":45},{"x":3449,"y":43},{"x":3493,"y":43},{"x":3494,"y":42},{"x":3538,"y":42},{"x":3539,"y":41},{"x":3579,"y":41},{"x":3580,"y":40},{"x":3612,"y":40},{"x":3613,"y":39},{"x":3675,"y":39},{"x":3676,"y":37},{"x":3679,"y":37},{"x":3680,"y":36},{"x":3689,"y":36}],"758":[{"x":0,"y":16},{"x":25,"y":16},{"x":26,"y":17},{"x":35,"y":17},{"x":36,"y":19},{"x":70,"y":19},{"x":71,"y":20},{"x":102,"y":20},{"x":103,"y":21},{"x":133,"y":21},{"x":134,"y":22},{"x":165,"y":22},{"x":166,"y":24},{"x":258,"y":24},{"x":259,"y":25},{"x":294,"y":25},{"x":295,"y":26},{"x":340,"y":26},{"x":341,"y":27},{"x":383,"y":27},{"x":384,"y":29},{"x":469,"y":29},{"x":470,"y":30},{"x":505,"y":30},{"x":506,"y":31},{"x":553,"y":31},{"x":554,"y":32},{"x":597,"y":32},{"x":598,"y":34},{"x":679,"y":34},{"x":680,"y":35},{"x":720,"y":35},{"x":721,"y":36},{"x":772,"y":36},{"x":773,"y":37},{"x":813,"y":37},{"x":814,"y":39},{"x":917,"y":39},{"x":918,"y":40},{"x":965,"y":40},{"x":966,"y":41},{"x":1021,"y":41},{"x":1022,"y":42},{"x":1084,"y":42},{"x":1085,"y":43},{"x":1156,"y":43},{"x":1157,"y":45},{"x":1165,"y":45},{"x":1166,"y":43},{"x":1167,"y":45},{"x":1168,"y":43},{"x":1169,"y":45},{"x":1293,"y":45},{"x":1294,"y":46},{"x":1295,"y":46},{"x":1296,"y":45},{"x":1297,"y":45},{"x":1298,"y":46},{"x":1381,"y":46},{"x":1382,"y":47},{"x":1383,"y":47},{"x":1384,"y":46},{"x":1385,"y":47},{"x":1461,"y":47},{"x":1462,"y":48},{"x":1464,"y":48},{"x":1465,"y":47},{"x":1466,"y":48},{"x":1561,"y":48},{"x":1562,"y":50},{"x":1898,"y":50},{"x":1899,"y":51},{"x":1929,"y":51},{"x":1930,"y":50},{"x":1931,"y":50},{"x":1932,"y":51},{"x":2466,"y":51},{"x":2467,"y":50},{"x":2468,"y":50},{"x":2469,"y":51},{"x":2470,"y":50},{"x":2472,"y":50},{"x":2473,"y":51},{"x":2474,"y":51},{"x":2475,"y":50},{"x":2478,"y":50},{"x":2479,"y":51},{"x":2480,"y":51},{"x":2481,"y":50},{"x":2489,"y":50},{"x":2490,"y":51},{"x":2513,"y":51},{"x":2514,"y":50},{"x":2515,"y":51},{"x":2531,"y":51},{"x":2532,"y":50},{"x":2876,"y":50},{"x":2877,"y":48},{"x":2884,"y":48},{"x":2885,"y":50},{"x":2886,"y":50},{"x":2887,"y":48},{"x":3033,"y":48},{"x":3034,"y":47},{"x":3113,"y":47},{"x":3114,"y":46},{"x":3206,"y":46},{"x":3207,"y":45},{"x":3340,"y":45},{"x":3341,"y":43},{"x":3410,"y":43},{"x":3411,"y":42},{"x":3471,"y":42},{"x":3472,"y":41},{"x":3523,"y":41},{"x":3524,"y":40},{"x":3568,"y":40},{"x":3569,"y":39},{"x":3642,"y":39},{"x":3643,"y":37},{"x":3674,"y":37},{"x":3675,"y":36},{"x":3689,"y":36}],"760":[{"x":0,"y":14},{"x":31,"y":14},{"x":32,"y":15},{"x":52,"y":15},{"x":53,"y":16},{"x":54,"y":16},{"x":55,"y":15},{"x":56,"y":16},{"x":87,"y":16},{"x":88,"y":17},{"x":129,"y":17},{"x":130,"y":19},{"x":227,"y":19},{"x":228,"y":20},{"x":280,"y":20},{"x":281,"y":21},{"x":325,"y":21},{"x":326,"y":22},{"x":371,"y":22},{"x":372,"y":24},{"x":459,"y":24},{"x":460,"y":25},{"x":503,"y":25},{"x":504,"y":26},{"x":548,"y":26},{"x":549,"y":27},{"x":590,"y":27},{"x":591,"y":29},{"x":680,"y":29},{"x":681,"y":30},{"x":724,"y":30},{"x":725,"y":31},{"x":770,"y":31},{"x":771,"y":32},{"x":817,"y":32},{"x":818,"y":34},{"x":915,"y":34},{"x":916,"y":35},{"x":970,"y":35},{"x":971,"y":36},{"x":1025,"y":36},{"x":1026,"y":37},{"x":1083,"y":37},{"x":1084,"y":39},{"x":1209,"y":39},{"x":1210,"y":40},{"x":1286,"y":40},{"x":1287,"y":41},{"x":1352,"y":41},{"x":1353,"y":42},{"x":1435,"y":42},{"x":1436,"y":43},{"x":1536,"y":43},{"x":1537,"y":45},{"x":1823,"y":45},{"x":1824,"y":46},{"x":2153,"y":46},{"x":2154,"y":47},{"x":2155,"y":46},{"x":2156,"y":47},{"x":2160,"y":47},{"x":2161,"y":46},{"x":2164,"y":46},{"x":2165,"y":47},{"x":2423,"y":47},{"x":2424,"y":46},{"x":2425,"y":46},{"x":2426,"y":47},{"x":2427,"y":47},{"x":2428,"y":46},{"x":2429,"y":47},{"x":2430,"y":46},{"x":2431,"y":47},{"x":2438,"y":47},{"x":2439,"y":46},{"x":2758,"y":46},{"x":2759,"y":45},{"x":3061,"y":45},{"x":3062,"y":43},{"x":3186,"y":43},{"x":3187,"y":42},{"x":3280,"y":42},{"x":3281,"y":41},{"x":3366,"y":41},{"x":3367,"y":40},{"x":3447,"y":40},{"x":3448,"y":39},{"x":3582,"y":39},{"x":3583,"y":37},{"x":3635,"y":37},{"x":3636,"y":36},{"x":3689,"y":36}],"761":[{"x":0,"y":0},{"x":29,"y":0},{"x":30,"y":37},{"x":42,"y":37},{"x":43,"y":75},{"x":46,"y":75},{"x":47,"y":112},{"x":55,"y":112},{"x":56,"y":149},{"x":66,"y":149},{"x":67,"y":186},{"x":75,"y":186},{"x":76,"y":224},{"x":78,"y":224},{"x":79,"y":261},{"x":87,"y":261},{"x":88,"y":298},{"x":93,"y":298},{"x":94,"y":335},{"x":105,"y":335},{"x":106,"y":373},{"x":111,"y":373},{"x":112,"y":410},{"x":116,"y":410},{"x":117,"y":447},{"x":123,"y":447},{"x":124,"y":484},{"x":128,"y":484},{"x":129,"y":522},{"x":136,"y":522},{"x":137,"y":559},{"x":143,"y":559},{"x":144,"y":596},{"x":149,"y":596},{"x":150,"y":633},{"x":160,"y":633},{"x":161,"y":671},{"x":163,"y":671},{"x":164,"y":708},{"x":171,"y":708},{"x":172,"y":745},{"x":177,"y":745},{"x":178,"y":783},{"x":184,"y":783},{"x":185,"y":820},{"x":190,"y":820},{"x":191,"y":857},{"x":201,"y":857},{"x":202,"y":894},{"x":205,"y":894},{"x":206,"y":932},{"x":207,"y":932},{"x":208,"y":969},{"x":214,"y":969},{"x":215,"y":1006},{"x":220,"y":1006},{"x":221,"y":1043},{"x":230,"y":1043},{"x":231,"y":1081},{"x":239,"y":1081},{"x":240,"y":1118},{"x":246,"y":1118},{"x":247,"y":1155},{"x":248,"y":1192},{"x":256,"y":1192},{"x":257,"y":1230},{"x":264,"y":1230},{"x":265,"y":1267},{"x":268,"y":1267},{"x":269,"y":1304},{"x":274,"y":1304},{"x":275,"y":1341},{"x":278,"y":1341},{"x":279,"y":1379},{"x":286,"y":1379},{"x":287,"y":1416},{"x":290,"y":1416},{"x":291,"y":1453},{"x":296,"y":1453},{"x":297,"y":1491},{"x":301,"y":1491},{"x":302,"y":1528},{"x":313,"y":1528},{"x":314,"y":1565},{"x":315,"y":1602},{"x":320,"y":1602},{"x":321,"y":1640},{"x":327,"y":1640},{"x":328,"y":1677},{"x":331,"y":1677},{"x":332,"y":1714},{"x":339,"y":1714},{"x":340,"y":1751},{"x":341,"y":1789},{"x":350,"y":1789},{"x":351,"y":1826},{"x":361,"y":1826},{"x":362,"y":1863},{"x":366,"y":1863},{"x":367,"y":1900},{"x":369,"y":1900},{"x":370,"y":1938},{"x":376,"y":1938},{"x":377,"y":1975},{"x":382,"y":1975},{"x":383,"y":2012},{"x":386,"y":2012},{"x":387,"y":2049},{"x":388,"y":2049},{"x":389,"y":2087},{"x":395,"y":2087},{"x":396,"y":2124},{"x":404,"y":2124},{"x":405,"y":2161},{"x":406,"y":2161},{"x":407,"y":2198},{"x":413,"y":2198},{"x":414,"y":2236},{"x":417,"y":2236},{"x":418,"y":2273},{"x":422,"y":2273},{"x":423,"y":2310},{"x":429,"y":2310},{"x":430,"y":2348},{"x":435,"y":2348},{"x":436,"y":2385},{"x":439,"y":2385},{"x":440,"y":2422},{"x":443,"y":2422},{"x":444,"y":2459},{"x":450,"y":2459},{"x":451,"y":2497},{"x":460,"y":2497},{"x":461,"y":2571},{"x":463,"y":2571},{"x":464,"y":2608},{"x":471,"y":2608},{"x":472,"y":2646},{"x":475,"y":2646},{"x":476,"y":2683},{"x":480,"y":2683},{"x":481,"y":2720},{"x":482,"y":2757},{"x":489,"y":2757},{"x":490,"y":2795},{"x":496,"y":2795},{"x":497,"y":2832},{"x":500,"y":2832},{"x":501,"y":2869},{"x":505,"y":2869},{"x":506,"y":2906},{"x":509,"y":2906},{"x":510,"y":2944},{"x":511,"y":2944},{"x":512,"y":2981},{"x":517,"y":2981},{"x":518,"y":3018},{"x":521,"y":3018},{"x":522,"y":3056},{"x":525,"y":3056},{"x":526,"y":3093},{"x":529,"y":3093},{"x":530,"y":3130},{"x":533,"y":3130},{"x":534,"y":3167},{"x":537,"y":3167},{"x":538,"y":3205},{"x":543,"y":3205},{"x":544,"y":3242},{"x":549,"y":3242},{"x":550,"y":3279},{"x":554,"y":3279},{"x":555,"y":3316},{"x":560,"y":3316},{"x":561,"y":3354},{"x":562,"y":3391},{"x":565,"y":3391},{"x":566,"y":3428},{"x":567,"y":3465},{"x":569,"y":3465},{"x":570,"y":3503},{"x":571,"y":3540},{"x":572,"y":3614}],"762":[{"x":0,"y":0},{"x":25,"y":0},{"x":26,"y":37},{"x":36,"y":37},{"x":37,"y":75},{"x":44,"y":75},{"x":45,"y":112},{"x":51,"y":112},{"x":52,"y":149},{"x":59,"y":149},{"x":60,"y":186},{"x":68,"y":186},{"x":69,"y":224},{"x":75,"y":224},{"x":76,"y":261},{"x":82,"y":261},{"x":83,"y":298},{"x":90,"y":298},{"x":91,"y":335},{"x":98,"y":335},{"x":99,"y":373},{"x":105,"y":373},{"x":106,"y":410},{"x":111,"y":410},{"x":112,"y":447},{"x":118,"y":447},{"x":119,"y":484},{"x":125,"y":484},{"x":126,"y":522},{"x":132,"y":522},{"x":133,"y":559},{"x":139,"y":559},{"x":140,"y":596},{"x":146,"y":596},{"x":147,"y":633},{"x":151,"y":633},{"x":152,"y":671},{"x":157,"y":671},{"x":158,"y":708},{"x":163,"y":708},{"x":164,"y":745},{"x":172,"y":745},{"x":173,"y":783},{"x":178,"y":783},{"x":179,"y":820},{"x":183,"y":820},{"x":184,"y":857},{"x":191,"y":857},{"x":192,"y":894},{"x":196,"y":894},{"x":197,"y":932},{"x":203,"y":932},{"x":204,"y":969},{"x":210,"y":969},{"x":211,"y":1006},{"x":216,"y":1006},{"x":217,"y":1043},{"x":220,"y":1043},{"x":221,"y":1081},{"x":229,"y":1081},{"x":230,"y":1118},{"x":234,"y":1118},{"x":235,"y":1155},{"x":242,"y":1155},{"x":243,"y":1192},{"x":247,"y":1192},{"x":248,"y":1230},{"x":252,"y":1230},{"x":253,"y":1267},{"x":257,"y":1267},{"x":258,"y":1304},{"x":264,"y":1304},{"x":265,"y":1341},{"x":270,"y":1341},{"x":271,"y":1379},{"x":278,"y":1379},{"x":279,"y":1416},{"x":284,"y":1416},{"x":285,"y":1453},{"x":288,"y":1453},{"x":289,"y":1491},{"x":294,"y":1491},{"x":295,"y":1528},{"x":300,"y":1528},{"x":301,"y":1565},{"x":306,"y":1565},{"x":307,"y":1602},{"x":311,"y":1602},{"x":312,"y":1640},{"x":317,"y":1640},{"x":318,"y":1677},{"x":324,"y":1677},{"x":325,"y":1714},{"x":329,"y":1714},{"x":330,"y":1751},{"x":335,"y":1751},{"x":336,"y":1789},{"x":343,"y":1789},{"x":344,"y":1826},{"x":346,"y":1826},{"x":347,"y":1863},{"x":354,"y":1863},{"x":355,"y":1900},{"x":361,"y":1900},{"x":362,"y":1938},{"x":364,"y":1938},{"x":365,"y":1975},{"x":372,"y":1975},{"x":373,"y":2012},{"x":377,"y":2012},{"x":378,"y":2049},{"x":381,"y":2049},{"x":382,"y":2087},{"x":388,"y":2087},{"x":389,"y":2124},{"x":393,"y":2124},{"x":394,"y":2161},{"x":397,"y":2161},{"x":398,"y":2198},{"x":405,"y":2198},{"x":406,"y":2236},{"x":411,"y":2236},{"x":412,"y":2273},{"x":415,"y":2273},{"x":416,"y":2310},{"x":420,"y":2310},{"x":421,"y":2348},{"x":424,"y":2348},{"x":425,"y":2385},{"x":431,"y":2385},{"x":432,"y":2422},{"x":435,"y":2422},{"x":436,"y":2459},{"x":440,"y":2459},{"x":441,"y":2497},{"x":446,"y":2497},{"x":447,"y":2534},{"x":452,"y":2534},{"x":453,"y":2571},{"x":458,"y":2571},{"x":459,"y":2608},{"x":462,"y":2608},{"x":463,"y":2646},{"x":466,"y":2646},{"x":467,"y":2683},{"x":472,"y":2683},{"x":473,"y":2720},{"x":476,"y":2720},{"x":477,"y":2757},{"x":481,"y":2757},{"x":482,"y":2795},{"x":487,"y":2795},{"x":488,"y":2832},{"x":492,"y":2832},{"x":493,"y":2869},{"x":496,"y":2869},{"x":497,"y":2906},{"x":502,"y":2906},{"x":503,"y":2944},{"x":506,"y":2944},{"x":507,"y":2981},{"x":511,"y":2981},{"x":512,"y":3018},{"x":515,"y":3018},{"x":516,"y":3056},{"x":519,"y":3056},{"x":520,"y":3093},{"x":525,"y":3093},{"x":526,"y":3130},{"x":530,"y":3130},{"x":531,"y":3167},{"x":533,"y":3167},{"x":534,"y":3205},{"x":539,"y":3205},{"x":540,"y":3242},{"x":545,"y":3242},{"x":546,"y":3279},{"x":549,"y":3279},{"x":550,"y":3316},{"x":553,"y":3316},{"x":554,"y":3354},{"x":556,"y":3354},{"x":557,"y":3391},{"x":561,"y":3391},{"x":562,"y":3428},{"x":563,"y":3428},{"x":564,"y":3465},{"x":567,"y":3465},{"x":568,"y":3503},{"x":570,"y":3503},{"x":571,"y":3540},{"x":572,"y":3614}],"763":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":37},{"x":29,"y":37},{"x":30,"y":75},{"x":38,"y":75},{"x":39,"y":112},{"x":45,"y":112},{"x":46,"y":149},{"x":53,"y":149},{"x":54,"y":186},{"x":60,"y":186},{"x":61,"y":224},{"x":67,"y":224},{"x":68,"y":261},{"x":74,"y":261},{"x":75,"y":298},{"x":81,"y":298},{"x":82,"y":335},{"x":88,"y":335},{"x":89,"y":373},{"x":95,"y":373},{"x":96,"y":410},{"x":102,"y":410},{"x":103,"y":447},{"x":108,"y":447},{"x":109,"y":484},{"x":115,"y":484},{"x":116,"y":522},{"x":121,"y":522},{"x":122,"y":559},{"x":127,"y":559},{"x":128,"y":596},{"x":134,"y":596},{"x":135,"y":633},{"x":141,"y":633},{"x":142,"y":671},{"x":147,"y":671},{"x":148,"y":708},{"x":153,"y":708},{"x":154,"y":745},{"x":159,"y":745},{"x":160,"y":783},{"x":166,"y":783},{"x":167,"y":820},{"x":172,"y":820},{"x":173,"y":857},{"x":178,"y":857},{"x":179,"y":894},{"x":184,"y":894},{"x":185,"y":932},{"x":191,"y":932},{"x":192,"y":969},{"x":196,"y":969},{"x":197,"y":1006},{"x":203,"y":1006},{"x":204,"y":1043},{"x":210,"y":1043},{"x":211,"y":1081},{"x":216,"y":1081},{"x":217,"y":1118},{"x":222,"y":1118},{"x":223,"y":1155},{"x":228,"y":1155},{"x":229,"y":1192},{"x":235,"y":1192},{"x":236,"y":1230},{"x":240,"y":1230},{"x":241,"y":1267},{"x":246,"y":1267},{"x":247,"y":1304},{"x":252,"y":1304},{"x":253,"y":1341},{"x":258,"y":1341},{"x":259,"y":1379},{"x":264,"y":1379},{"x":265,"y":1416},{"x":270,"y":1416},{"x":271,"y":1453},{"x":276,"y":1453},{"x":277,"y":1491},{"x":282,"y":1491},{"x":283,"y":1528},{"x":288,"y":1528},{"x":289,"y":1565},{"x":294,"y":1565},{"x":295,"y":1602},{"x":299,"y":1602},{"x":300,"y":1640},{"x":305,"y":1640},{"x":306,"y":1677},{"x":311,"y":1677},{"x":312,"y":1714},{"x":317,"y":1714},{"x":318,"y":1751},{"x":322,"y":1751},{"x":323,"y":1789},{"x":328,"y":1789},{"x":329,"y":1826},{"x":334,"y":1826},{"x":335,"y":1863},{"x":339,"y":1863},{"x":340,"y":1900},{"x":345,"y":1900},{"x":346,"y":1938},{"x":351,"y":1938},{"x":352,"y":1975},{"x":356,"y":1975},{"x":357,"y":2012},{"x":363,"y":2012},{"x":364,"y":2049},{"x":369,"y":2049},{"x":370,"y":2087},{"x":374,"y":2087},{"x":375,"y":2124},{"x":380,"y":2124},{"x":381,"y":2161},{"x":385,"y":2161},{"x":386,"y":2198},{"x":391,"y":2198},{"x":392,"y":2236},{"x":397,"y":2236},{"x":398,"y":2273},{"x":402,"y":2273},{"x":403,"y":2310},{"x":407,"y":2310},{"x":408,"y":2348},{"x":412,"y":2348},{"x":413,"y":2385},{"x":418,"y":2385},{"x":419,"y":2422},{"x":423,"y":2422},{"x":424,"y":2459},{"x":429,"y":2459},{"x":430,"y":2497},{"x":434,"y":2497},{"x":435,"y":2534},{"x":439,"y":2534},{"x":440,"y":2571},{"x":444,"y":2571},{"x":445,"y":2608},{"x":450,"y":2608},{"x":451,"y":2646},{"x":455,"y":2646},{"x":456,"y":2683},{"x":461,"y":2683},{"x":462,"y":2720},{"x":466,"y":2720},{"x":467,"y":2757},{"x":470,"y":2757},{"x":471,"y":2795},{"x":476,"y":2795},{"x":477,"y":2832},{"x":482,"y":2832},{"x":483,"y":2869},{"x":487,"y":2869},{"x":488,"y":2906},{"x":491,"y":2906},{"x":492,"y":2944},{"x":497,"y":2944},{"x":498,"y":2981},{"x":502,"y":2981},{"x":503,"y":3018},{"x":507,"y":3018},{"x":508,"y":3056},{"x":512,"y":3056},{"x":513,"y":3093},{"x":517,"y":3093},{"x":518,"y":3130},{"x":522,"y":3130},{"x":523,"y":3167},{"x":526,"y":3167},{"x":527,"y":3205},{"x":532,"y":3205},{"x":533,"y":3242},{"x":536,"y":3242},{"x":537,"y":3279},{"x":541,"y":3279},{"x":542,"y":3316},{"x":545,"y":3316},{"x":546,"y":3354},{"x":550,"y":3354},{"x":551,"y":3391},{"x":555,"y":3391},{"x":556,"y":3428},{"x":558,"y":3428},{"x":559,"y":3465},{"x":563,"y":3465},{"x":564,"y":3503},{"x":567,"y":3503},{"x":568,"y":3540},{"x":570,"y":3540},{"x":571,"y":3577},{"x":572,"y":3614}],"765":[{"x":0,"y":0},{"x":15,"y":0},{"x":16,"y":37},{"x":23,"y":37},{"x":24,"y":75},{"x":30,"y":75},{"x":31,"y":112},{"x":36,"y":112},{"x":37,"y":149},{"x":43,"y":149},{"x":44,"y":186},{"x":50,"y":186},{"x":51,"y":224},{"x":56,"y":224},{"x":57,"y":261},{"x":63,"y":261},{"x":64,"y":298},{"x":69,"y":298},{"x":70,"y":335},{"x":76,"y":335},{"x":77,"y":373},{"x":82,"y":373},{"x":83,"y":410},{"x":88,"y":410},{"x":89,"y":447},{"x":94,"y":447},{"x":95,"y":484},{"x":101,"y":484},{"x":102,"y":522},{"x":107,"y":522},{"x":108,"y":559},{"x":113,"y":559},{"x":114,"y":596},{"x":119,"y":596},{"x":120,"y":633},{"x":126,"y":633},{"x":127,"y":671},{"x":132,"y":671},{"x":133,"y":708},{"x":138,"y":708},{"x":139,"y":745},{"x":144,"y":745},{"x":145,"y":783},{"x":150,"y":783},{"x":151,"y":820},{"x":156,"y":820},{"x":157,"y":857},{"x":162,"y":857},{"x":163,"y":894},{"x":168,"y":894},{"x":169,"y":932},{"x":174,"y":932},{"x":175,"y":969},{"x":180,"y":969},{"x":181,"y":1006},{"x":186,"y":1006},{"x":187,"y":1043},{"x":192,"y":1043},{"x":193,"y":1081},{"x":198,"y":1081},{"x":199,"y":1118},{"x":204,"y":1118},{"x":205,"y":1155},{"x":210,"y":1155},{"x":211,"y":1192},{"x":216,"y":1192},{"x":217,"y":1230},{"x":222,"y":1230},{"x":223,"y":1267},{"x":228,"y":1267},{"x":229,"y":1304},{"x":234,"y":1304},{"x":235,"y":1341},{"x":240,"y":1341},{"x":241,"y":1379},{"x":246,"y":1379},{"x":247,"y":1416},{"x":252,"y":1416},{"x":253,"y":1453},{"x":257,"y":1453},{"x":258,"y":1491},{"x":263,"y":1491},{"x":264,"y":1528},{"x":269,"y":1528},{"x":270,"y":1565},{"x":275,"y":1565},{"x":276,"y":1602},{"x":281,"y":1602},{"x":282,"y":1640},{"x":287,"y":1640},{"x":288,"y":1677},{"x":292,"y":1677},{"x":293,"y":1714},{"x":298,"y":1714},{"x":299,"y":1751},{"x":304,"y":1751},{"x":305,"y":1789},{"x":310,"y":1789},{"x":311,"y":1826},{"x":315,"y":1826},{"x":316,"y":1863},{"x":321,"y":1863},{"x":322,"y":1900},{"x":327,"y":1900},{"x":328,"y":1938},{"x":332,"y":1938},{"x":333,"y":1975},{"x":338,"y":1975},{"x":339,"y":2012},{"x":344,"y":2012},{"x":345,"y":2049},{"x":350,"y":2049},{"x":351,"y":2087},{"x":356,"y":2087},{"x":357,"y":2124},{"x":361,"y":2124},{"x":362,"y":2161},{"x":367,"y":2161},{"x":368,"y":2198},{"x":373,"y":2198},{"x":374,"y":2236},{"x":378,"y":2236},{"x":379,"y":2273},{"x":384,"y":2273},{"x":385,"y":2310},{"x":390,"y":2310},{"x":391,"y":2348},{"x":395,"y":2348},{"x":396,"y":2385},{"x":401,"y":2385},{"x":402,"y":2422},{"x":406,"y":2422},{"x":407,"y":2459},{"x":412,"y":2459},{"x":413,"y":2497},{"x":417,"y":2497},{"x":418,"y":2534},{"x":423,"y":2534},{"x":424,"y":2571},{"x":429,"y":2571},{"x":430,"y":2608},{"x":434,"y":2608},{"x":435,"y":2646},{"x":439,"y":2646},{"x":440,"y":2683},{"x":445,"y":2683},{"x":446,"y":2720},{"x":450,"y":2720},{"x":451,"y":2757},{"x":456,"y":2757},{"x":457,"y":2795},{"x":461,"y":2795},{"x":462,"y":2832},{"x":466,"y":2832},{"x":467,"y":2869},{"x":472,"y":2869},{"x":473,"y":2906},{"x":478,"y":2906},{"x":479,"y":2944},{"x":483,"y":2944},{"x":484,"y":2981},{"x":488,"y":2981},{"x":489,"y":3018},{"x":494,"y":3018},{"x":495,"y":3056},{"x":499,"y":3056},{"x":500,"y":3093},{"x":504,"y":3093},{"x":505,"y":3130},{"x":510,"y":3130},{"x":511,"y":3167},{"x":515,"y":3167},{"x":516,"y":3205},{"x":520,"y":3205},{"x":521,"y":3242},{"x":525,"y":3242},{"x":526,"y":3279},{"x":531,"y":3279},{"x":532,"y":3316},{"x":536,"y":3316},{"x":537,"y":3354},{"x":541,"y":3354},{"x":542,"y":3391},{"x":546,"y":3391},{"x":547,"y":3428},{"x":551,"y":3428},{"x":552,"y":3465},{"x":556,"y":3465},{"x":557,"y":3503},{"x":560,"y":3503},{"x":561,"y":3540},{"x":565,"y":3540},{"x":566,"y":3577},{"x":570,"y":3577},{"x":571,"y":3614},{"x":572,"y":3614}],"766":[{"x":0,"y":75},{"x":1,"y":149},{"x":2,"y":186},{"x":3,"y":224},{"x":4,"y":224},{"x":5,"y":261},{"x":7,"y":261},{"x":8,"y":298},{"x":10,"y":298},{"x":11,"y":335},{"x":14,"y":335},{"x":15,"y":373},{"x":20,"y":373},{"x":21,"y":410},{"x":23,"y":410},{"x":24,"y":447},{"x":27,"y":447},{"x":28,"y":484},{"x":31,"y":484},{"x":32,"y":522},{"x":37,"y":522},{"x":38,"y":559},{"x":42,"y":559},{"x":43,"y":596},{"x":47,"y":596},{"x":48,"y":633},{"x":50,"y":633},{"x":51,"y":671},{"x":55,"y":671},{"x":56,"y":708},{"x":60,"y":708},{"x":61,"y":745},{"x":63,"y":745},{"x":64,"y":783},{"x":69,"y":783},{"x":70,"y":820},{"x":76,"y":820},{"x":77,"y":857},{"x":81,"y":857},{"x":82,"y":894},{"x":86,"y":894},{"x":87,"y":932},{"x":91,"y":932},{"x":92,"y":969},{"x":96,"y":969},{"x":97,"y":1006},{"x":100,"y":1006},{"x":101,"y":1043},{"x":104,"y":1043},{"x":105,"y":1081},{"x":110,"y":1081},{"x":111,"y":1118},{"x":116,"y":1118},{"x":117,"y":1155},{"x":120,"y":1155},{"x":121,"y":1230},{"x":127,"y":1230},{"x":128,"y":1267},{"x":134,"y":1267},{"x":135,"y":1304},{"x":142,"y":1304},{"x":143,"y":1341},{"x":148,"y":1341},{"x":149,"y":1379},{"x":153,"y":1379},{"x":154,"y":1416},{"x":157,"y":1416},{"x":158,"y":1453},{"x":161,"y":1453},{"x":162,"y":1491},{"x":164,"y":1491},{"x":165,"y":1528},{"x":172,"y":1528},{"x":173,"y":1565},{"x":179,"y":1565},{"x":180,"y":1602},{"x":181,"y":1602},{"x":182,"y":1640},{"x":183,"y":1677},{"x":191,"y":1677},{"x":192,"y":1714},{"x":198,"y":1714},{"x":199,"y":1751},{"x":203,"y":1751},{"x":204,"y":1789},{"x":207,"y":1789},{"x":208,"y":1826},{"x":211,"y":1826},{"x":212,"y":1863},{"x":218,"y":1863},{"x":219,"y":1900},{"x":224,"y":1900},{"x":225,"y":1938},{"x":228,"y":1938},{"x":229,"y":1975},{"x":238,"y":1975},{"x":239,"y":2012},{"x":246,"y":2012},{"x":247,"y":2049},{"x":253,"y":2049},{"x":254,"y":2087},{"x":258,"y":2087},{"x":259,"y":2124},{"x":262,"y":2124},{"x":263,"y":2161},{"x":264,"y":2161},{"x":265,"y":2198},{"x":273,"y":2198},{"x":274,"y":2236},{"x":281,"y":2236},{"x":282,"y":2273},{"x":286,"y":2273},{"x":287,"y":2310},{"x":294,"y":2310},{"x":295,"y":2348},{"x":298,"y":2348},{"x":299,"y":2385},{"x":307,"y":2385},{"x":308,"y":2422},{"x":312,"y":2422},{"x":313,"y":2459},{"x":319,"y":2459},{"x":320,"y":2497},{"x":324,"y":2497},{"x":325,"y":2534},{"x":331,"y":2534},{"x":332,"y":2571},{"x":334,"y":2571},{"x":335,"y":2608},{"x":343,"y":2608},{"x":344,"y":2646},{"x":347,"y":2646},{"x":348,"y":2683},{"x":351,"y":2683},{"x":352,"y":2720},{"x":358,"y":2720},{"x":359,"y":2757},{"x":370,"y":2757},{"x":371,"y":2795},{"x":373,"y":2795},{"x":374,"y":2832},{"x":382,"y":2832},{"x":383,"y":2869},{"x":389,"y":2869},{"x":390,"y":2906},{"x":394,"y":2906},{"x":395,"y":2944},{"x":400,"y":2944},{"x":401,"y":2981},{"x":405,"y":2981},{"x":406,"y":3018},{"x":415,"y":3018},{"x":416,"y":3056},{"x":418,"y":3056},{"x":419,"y":3093},{"x":424,"y":3093},{"x":425,"y":3130},{"x":432,"y":3130},{"x":433,"y":3167},{"x":441,"y":3167},{"x":442,"y":3205},{"x":445,"y":3205},{"x":446,"y":3242},{"x":452,"y":3242},{"x":453,"y":3279},{"x":461,"y":3279},{"x":462,"y":3316},{"x":467,"y":3316},{"x":468,"y":3354},{"x":474,"y":3354},{"x":475,"y":3391},{"x":486,"y":3391},{"x":487,"y":3428},{"x":493,"y":3428},{"x":494,"y":3465},{"x":500,"y":3465},{"x":501,"y":3503},{"x":508,"y":3503},{"x":509,"y":3540},{"x":516,"y":3540},{"x":517,"y":3577},{"x":524,"y":3577},{"x":525,"y":3614},{"x":533,"y":3614},{"x":534,"y":3652},{"x":544,"y":3652},{"x":545,"y":3689},{"x":572,"y":3689}],"767":[{"x":0,"y":75},{"x":1,"y":149},{"x":2,"y":149},{"x":3,"y":186},{"x":4,"y":186},{"x":5,"y":224},{"x":7,"y":224},{"x":8,"y":261},{"x":10,"y":261},{"x":11,"y":298},{"x":15,"y":298},{"x":16,"y":335},{"x":20,"y":335},{"x":21,"y":373},{"x":23,"y":373},{"x":24,"y":410},{"x":28,"y":410},{"x":29,"y":447},{"x":32,"y":447},{"x":33,"y":484},{"x":38,"y":484},{"x":39,"y":522},{"x":41,"y":522},{"x":42,"y":559},{"x":47,"y":559},{"x":48,"y":596},{"x":51,"y":596},{"x":52,"y":633},{"x":55,"y":633},{"x":56,"y":671},{"x":60,"y":671},{"x":61,"y":708},{"x":66,"y":708},{"x":67,"y":745},{"x":70,"y":745},{"x":71,"y":783},{"x":73,"y":783},{"x":74,"y":820},{"x":81,"y":820},{"x":82,"y":857},{"x":87,"y":857},{"x":88,"y":894},{"x":91,"y":894},{"x":92,"y":932},{"x":96,"y":932},{"x":97,"y":969},{"x":101,"y":969},{"x":102,"y":1006},{"x":105,"y":1006},{"x":106,"y":1043},{"x":111,"y":1043},{"x":112,"y":1081},{"x":115,"y":1081},{"x":116,"y":1118},{"x":120,"y":1118},{"x":121,"y":1155},{"x":125,"y":1155},{"x":126,"y":1192},{"x":132,"y":1192},{"x":133,"y":1230},{"x":136,"y":1230},{"x":137,"y":1267},{"x":142,"y":1267},{"x":143,"y":1304},{"x":149,"y":1304},{"x":150,"y":1341},{"x":155,"y":1341},{"x":156,"y":1379},{"x":160,"y":1379},{"x":161,"y":1416},{"x":164,"y":1416},{"x":165,"y":1453},{"x":170,"y":1453},{"x":171,"y":1491},{"x":173,"y":1491},{"x":174,"y":1528},{"x":180,"y":1528},{"x":181,"y":1565},{"x":186,"y":1565},{"x":187,"y":1602},{"x":191,"y":1602},{"x":192,"y":1640},{"x":197,"y":1640},{"x":198,"y":1677},{"x":203,"y":1677},{"x":204,"y":1714},{"x":208,"y":1714},{"x":209,"y":1751},{"x":213,"y":1751},{"x":214,"y":1789},{"x":216,"y":1789},{"x":217,"y":1826},{"x":222,"y":1826},{"x":223,"y":1863},{"x":230,"y":1863},{"x":231,"y":1900},{"x":234,"y":1900},{"x":235,"y":1938},{"x":240,"y":1938},{"x":241,"y":1975},{"x":246,"y":1975},{"x":247,"y":2012},{"x":253,"y":2012},{"x":254,"y":2049},{"x":257,"y":2049},{"x":258,"y":2087},{"x":263,"y":2087},{"x":264,"y":2124},{"x":270,"y":2124},{"x":271,"y":2161},{"x":278,"y":2161},{"x":279,"y":2198},{"x":283,"y":2198},{"x":284,"y":2236},{"x":289,"y":2236},{"x":290,"y":2273},{"x":293,"y":2273},{"x":294,"y":2310},{"x":299,"y":2310},{"x":300,"y":2348},{"x":305,"y":2348},{"x":306,"y":2385},{"x":312,"y":2385},{"x":313,"y":2422},{"x":319,"y":2422},{"x":320,"y":2459},{"x":326,"y":2459},{"x":327,"y":2497},{"x":330,"y":2497},{"x":331,"y":2534},{"x":337,"y":2534},{"x":338,"y":2571},{"x":342,"y":2571},{"x":343,"y":2608},{"x":349,"y":2608},{"x":350,"y":2646},{"x":356,"y":2646},{"x":357,"y":2683},{"x":361,"y":2683},{"x":362,"y":2720},{"x":367,"y":2720},{"x":368,"y":2757},{"x":375,"y":2757},{"x":376,"y":2795},{"x":380,"y":2795},{"x":381,"y":2832},{"x":386,"y":2832},{"x":387,"y":2869},{"x":394,"y":2869},{"x":395,"y":2906},{"x":400,"y":2906},{"x":401,"y":2944},{"x":406,"y":2944},{"x":407,"y":2981},{"x":414,"y":2981},{"x":415,"y":3018},{"x":419,"y":3018},{"x":420,"y":3056},{"x":424,"y":3056},{"x":425,"y":3093},{"x":432,"y":3093},{"x":433,"y":3130},{"x":439,"y":3130},{"x":440,"y":3167},{"x":444,"y":3167},{"x":445,"y":3205},{"x":452,"y":3205},{"x":453,"y":3242},{"x":457,"y":3242},{"x":458,"y":3279},{"x":466,"y":3279},{"x":467,"y":3316},{"x":474,"y":3316},{"x":475,"y":3354},{"x":481,"y":3354},{"x":482,"y":3391},{"x":490,"y":3391},{"x":491,"y":3428},{"x":497,"y":3428},{"x":498,"y":3465},{"x":504,"y":3465},{"x":505,"y":3503},{"x":510,"y":3503},{"x":511,"y":3540},{"x":521,"y":3540},{"x":522,"y":3577},{"x":527,"y":3577},{"x":528,"y":3614},{"x":537,"y":3614},{"x":538,"y":3652},{"x":546,"y":3652},{"x":547,"y":3689},{"x":572,"y":3689}],"768":[{"x":0,"y":75},{"x":1,"y":112},{"x":2,"y":149},{"x":4,"y":149},{"x":5,"y":186},{"x":8,"y":186},{"x":9,"y":224},{"x":12,"y":224},{"x":13,"y":261},{"x":17,"y":261},{"x":18,"y":298},{"x":21,"y":298},{"x":22,"y":335},{"x":26,"y":335},{"x":27,"y":373},{"x":30,"y":373},{"x":31,"y":410},{"x":35,"y":410},{"x":36,"y":447},{"x":39,"y":447},{"x":40,"y":484},{"x":44,"y":484},{"x":45,"y":522},{"x":49,"y":522},{"x":50,"y":559},{"x":54,"y":559},{"x":55,"y":596},{"x":59,"y":596},{"x":60,"y":633},{"x":64,"y":633},{"x":65,"y":671},{"x":70,"y":671},{"x":71,"y":708},{"x":74,"y":708},{"x":75,"y":745},{"x":80,"y":745},{"x":81,"y":783},{"x":85,"y":783},{"x":86,"y":820},{"x":89,"y":820},{"x":90,"y":857},{"x":94,"y":857},{"x":95,"y":894},{"x":100,"y":894},{"x":101,"y":932},{"x":105,"y":932},{"x":106,"y":969},{"x":111,"y":969},{"x":112,"y":1006},{"x":115,"y":1006},{"x":116,"y":1043},{"x":121,"y":1043},{"x":122,"y":1081},{"x":126,"y":1081},{"x":127,"y":1118},{"x":132,"y":1118},{"x":133,"y":1155},{"x":137,"y":1155},{"x":138,"y":1192},{"x":142,"y":1192},{"x":143,"y":1230},{"x":147,"y":1230},{"x":148,"y":1267},{"x":153,"y":1267},{"x":154,"y":1304},{"x":158,"y":1304},{"x":159,"y":1341},{"x":164,"y":1341},{"x":165,"y":1379},{"x":170,"y":1379},{"x":171,"y":1416},{"x":175,"y":1416},{"x":176,"y":1453},{"x":180,"y":1453},{"x":181,"y":1491},{"x":186,"y":1491},{"x":187,"y":1528},{"x":192,"y":1528},{"x":193,"y":1565},{"x":198,"y":1565},{"x":199,"y":1602},{"x":203,"y":1602},{"x":204,"y":1640},{"x":209,"y":1640},{"x":210,"y":1677},{"x":214,"y":1677},{"x":215,"y":1714},{"x":220,"y":1714},{"x":221,"y":1751},{"x":226,"y":1751},{"x":227,"y":1789},{"x":232,"y":1789},{"x":233,"y":1826},{"x":238,"y":1826},{"x":239,"y":1863},{"x":243,"y":1863},{"x":244,"y":1900},{"x":249,"y":1900},{"x":250,"y":1938},{"x":255,"y":1938},{"x":256,"y":1975},{"x":261,"y":1975},{"x":262,"y":2012},{"x":266,"y":2012},{"x":267,"y":2049},{"x":271,"y":2049},{"x":272,"y":2087},{"x":277,"y":2087},{"x":278,"y":2124},{"x":283,"y":2124},{"x":284,"y":2161},{"x":290,"y":2161},{"x":291,"y":2198},{"x":295,"y":2198},{"x":296,"y":2236},{"x":301,"y":2236},{"x":302,"y":2273},{"x":307,"y":2273},{"x":308,"y":2310},{"x":313,"y":2310},{"x":314,"y":2348},{"x":319,"y":2348},{"x":320,"y":2385},{"x":324,"y":2385},{"x":325,"y":2422},{"x":330,"y":2422},{"x":331,"y":2459},{"x":336,"y":2459},{"x":337,"y":2497},{"x":342,"y":2497},{"x":343,"y":2534},{"x":349,"y":2534},{"x":350,"y":2571},{"x":355,"y":2571},{"x":356,"y":2608},{"x":361,"y":2608},{"x":362,"y":2646},{"x":367,"y":2646},{"x":368,"y":2683},{"x":373,"y":2683},{"x":374,"y":2720},{"x":380,"y":2720},{"x":381,"y":2757},{"x":386,"y":2757},{"x":387,"y":2795},{"x":392,"y":2795},{"x":393,"y":2832},{"x":399,"y":2832},{"x":400,"y":2869},{"x":405,"y":2869},{"x":406,"y":2906},{"x":411,"y":2906},{"x":412,"y":2944},{"x":417,"y":2944},{"x":418,"y":2981},{"x":424,"y":2981},{"x":425,"y":3018},{"x":430,"y":3018},{"x":431,"y":3056},{"x":437,"y":3056},{"x":438,"y":3093},{"x":443,"y":3093},{"x":444,"y":3130},{"x":449,"y":3130},{"x":450,"y":3167},{"x":457,"y":3167},{"x":458,"y":3205},{"x":463,"y":3205},{"x":464,"y":3242},{"x":469,"y":3242},{"x":470,"y":3279},{"x":477,"y":3279},{"x":478,"y":3316},{"x":483,"y":3316},{"x":484,"y":3354},{"x":490,"y":3354},{"x":491,"y":3391},{"x":497,"y":3391},{"x":498,"y":3428},{"x":504,"y":3428},{"x":505,"y":3465},{"x":511,"y":3465},{"x":512,"y":3503},{"x":519,"y":3503},{"x":520,"y":3540},{"x":525,"y":3540},{"x":526,"y":3577},{"x":533,"y":3577},{"x":534,"y":3614},{"x":542,"y":3614},{"x":543,"y":3652},{"x":551,"y":3652},{"x":552,"y":3689},{"x":572,"y":3689}],"770":[{"x":0,"y":75},{"x":1,"y":75},{"x":2,"y":112},{"x":6,"y":112},{"x":7,"y":149},{"x":10,"y":149},{"x":11,"y":186},{"x":15,"y":186},{"x":16,"y":224},{"x":20,"y":224},{"x":21,"y":261},{"x":25,"y":261},{"x":26,"y":298},{"x":30,"y":298},{"x":31,"y":335},{"x":35,"y":335},{"x":36,"y":373},{"x":40,"y":373},{"x":41,"y":410},{"x":46,"y":410},{"x":47,"y":447},{"x":51,"y":447},{"x":52,"y":484},{"x":56,"y":484},{"x":57,"y":522},{"x":61,"y":522},{"x":62,"y":559},{"x":66,"y":559},{"x":67,"y":596},{"x":72,"y":596},{"x":73,"y":633},{"x":77,"y":633},{"x":78,"y":671},{"x":83,"y":671},{"x":84,"y":708},{"x":88,"y":708},{"x":89,"y":745},{"x":93,"y":745},{"x":94,"y":783},{"x":99,"y":783},{"x":100,"y":820},{"x":105,"y":820},{"x":106,"y":857},{"x":110,"y":857},{"x":111,"y":894},{"x":115,"y":894},{"x":116,"y":932},{"x":121,"y":932},{"x":122,"y":969},{"x":126,"y":969},{"x":127,"y":1006},{"x":132,"y":1006},{"x":133,"y":1043},{"x":137,"y":1043},{"x":138,"y":1081},{"x":143,"y":1081},{"x":144,"y":1118},{"x":148,"y":1118},{"x":149,"y":1155},{"x":154,"y":1155},{"x":155,"y":1192},{"x":159,"y":1192},{"x":160,"y":1230},{"x":165,"y":1230},{"x":166,"y":1267},{"x":170,"y":1267},{"x":171,"y":1304},{"x":176,"y":1304},{"x":177,"y":1341},{"x":182,"y":1341},{"x":183,"y":1379},{"x":187,"y":1379},{"x":188,"y":1416},{"x":193,"y":1416},{"x":194,"y":1453},{"x":199,"y":1453},{"x":200,"y":1491},{"x":204,"y":1491},{"x":205,"y":1528},{"x":210,"y":1528},{"x":211,"y":1565},{"x":216,"y":1565},{"x":217,"y":1602},{"x":221,"y":1602},{"x":222,"y":1640},{"x":227,"y":1640},{"x":228,"y":1677},{"x":233,"y":1677},{"x":234,"y":1714},{"x":239,"y":1714},{"x":240,"y":1751},{"x":244,"y":1751},{"x":245,"y":1789},{"x":250,"y":1789},{"x":251,"y":1826},{"x":256,"y":1826},{"x":257,"y":1863},{"x":262,"y":1863},{"x":263,"y":1900},{"x":268,"y":1900},{"x":269,"y":1938},{"x":274,"y":1938},{"x":275,"y":1975},{"x":279,"y":1975},{"x":280,"y":2012},{"x":285,"y":2012},{"x":286,"y":2049},{"x":291,"y":2049},{"x":292,"y":2087},{"x":297,"y":2087},{"x":298,"y":2124},{"x":302,"y":2124},{"x":303,"y":2161},{"x":308,"y":2161},{"x":309,"y":2198},{"x":314,"y":2198},{"x":315,"y":2236},{"x":320,"y":2236},{"x":321,"y":2273},{"x":326,"y":2273},{"x":327,"y":2310},{"x":332,"y":2310},{"x":333,"y":2348},{"x":338,"y":2348},{"x":339,"y":2385},{"x":344,"y":2385},{"x":345,"y":2422},{"x":349,"y":2422},{"x":350,"y":2459},{"x":355,"y":2459},{"x":356,"y":2497},{"x":361,"y":2497},{"x":362,"y":2534},{"x":367,"y":2534},{"x":368,"y":2571},{"x":373,"y":2571},{"x":374,"y":2608},{"x":379,"y":2608},{"x":380,"y":2646},{"x":385,"y":2646},{"x":386,"y":2683},{"x":391,"y":2683},{"x":392,"y":2720},{"x":397,"y":2720},{"x":398,"y":2757},{"x":403,"y":2757},{"x":404,"y":2795},{"x":409,"y":2795},{"x":410,"y":2832},{"x":415,"y":2832},{"x":416,"y":2869},{"x":421,"y":2869},{"x":422,"y":2906},{"x":427,"y":2906},{"x":428,"y":2944},{"x":433,"y":2944},{"x":434,"y":2981},{"x":439,"y":2981},{"x":440,"y":3018},{"x":445,"y":3018},{"x":446,"y":3056},{"x":452,"y":3056},{"x":453,"y":3093},{"x":458,"y":3093},{"x":459,"y":3130},{"x":464,"y":3130},{"x":465,"y":3167},{"x":470,"y":3167},{"x":471,"y":3205},{"x":477,"y":3205},{"x":478,"y":3242},{"x":483,"y":3242},{"x":484,"y":3279},{"x":489,"y":3279},{"x":490,"y":3316},{"x":496,"y":3316},{"x":497,"y":3354},{"x":502,"y":3354},{"x":503,"y":3391},{"x":508,"y":3391},{"x":509,"y":3428},{"x":515,"y":3428},{"x":516,"y":3465},{"x":521,"y":3465},{"x":522,"y":3503},{"x":528,"y":3503},{"x":529,"y":3540},{"x":535,"y":3540},{"x":536,"y":3577},{"x":541,"y":3577},{"x":542,"y":3614},{"x":549,"y":3614},{"x":550,"y":3652},{"x":556,"y":3652},{"x":557,"y":3689},{"x":572,"y":3689}],"771":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"772":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"773":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":45,"y":2},{"x":46,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":53,"y":4},{"x":54,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"775":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":42,"y":2},{"x":43,"y":3},{"x":47,"y":3},{"x":48,"y":4},{"x":52,"y":4},{"x":53,"y":5},{"x":55,"y":5},{"x":56,"y":6},{"x":60,"y":6}],"776":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":13,"y":5},{"x":14,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"777":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":13,"y":5},{"x":14,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"778":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":6,"y":3},{"x":7,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":14,"y":5},{"x":15,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"780":[{"x":0,"y":2},{"x":4,"y":2},{"x":5,"y":3},{"x":7,"y":3},{"x":8,"y":4},{"x":12,"y":4},{"x":13,"y":5},{"x":17,"y":5},{"x":18,"y":6},{"x":34,"y":6},{"x":35,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"781":[{"x":0,"y":0},{"x":2,"y":0},{"x":3,"y":1},{"x":4,"y":2},{"x":5,"y":3},{"x":6,"y":4},{"x":7,"y":5},{"x":8,"y":6}],"782":[{"x":0,"y":0},{"x":2,"y":0},{"x":3,"y":1},{"x":4,"y":2},{"x":5,"y":3},{"x":6,"y":4},{"x":7,"y":5},{"x":8,"y":6}],"783":[{"x":0,"y":0},{"x":2,"y":0},{"x":3,"y":1},{"x":4,"y":2},{"x":5,"y":3},{"x":6,"y":4},{"x":7,"y":5},{"x":8,"y":6}],"785":[{"x":0,"y":0},{"x":2,"y":0},{"x":3,"y":1},{"x":4,"y":2},{"x":5,"y":3},{"x":6,"y":4},{"x":7,"y":5},{"x":8,"y":6}],"786":[{"x":0,"y":2},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":5},{"x":4,"y":6},{"x":5,"y":7},{"x":6,"y":8},{"x":8,"y":8}],"787":[{"x":0,"y":2},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":5},{"x":4,"y":6},{"x":5,"y":7},{"x":6,"y":8},{"x":8,"y":8}],"788":[{"x":0,"y":2},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":5},{"x":4,"y":6},{"x":5,"y":7},{"x":6,"y":8},{"x":8,"y":8}],"790":[{"x":0,"y":2},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":5},{"x":4,"y":6},{"x":5,"y":7},{"x":6,"y":8},{"x":8,"y":8}],"791":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"792":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"793":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":45,"y":2},{"x":46,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":53,"y":4},{"x":54,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"795":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":42,"y":2},{"x":43,"y":3},{"x":47,"y":3},{"x":48,"y":4},{"x":52,"y":4},{"x":53,"y":5},{"x":55,"y":5},{"x":56,"y":6},{"x":60,"y":6}],"796":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":13,"y":5},{"x":14,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"797":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":13,"y":5},{"x":14,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"798":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":6,"y":3},{"x":7,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":14,"y":5},{"x":15,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"800":[{"x":0,"y":2},{"x":4,"y":2},{"x":5,"y":3},{"x":7,"y":3},{"x":8,"y":4},{"x":12,"y":4},{"x":13,"y":5},{"x":17,"y":5},{"x":18,"y":6},{"x":34,"y":6},{"x":35,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"801":[{"x":0,"y":0},{"x":2,"y":0},{"x":3,"y":1},{"x":4,"y":2},{"x":5,"y":3},{"x":6,"y":4},{"x":7,"y":5},{"x":8,"y":6}],"802":[{"x":0,"y":0},{"x":2,"y":0},{"x":3,"y":1},{"x":4,"y":2},{"x":5,"y":3},{"x":6,"y":4},{"x":7,"y":5},{"x":8,"y":6}],"803":[{"x":0,"y":0},{"x":2,"y":0},{"x":3,"y":1},{"x":4,"y":2},{"x":5,"y":3},{"x":6,"y":4},{"x":7,"y":5},{"x":8,"y":6}],"805":[{"x":0,"y":0},{"x":2,"y":0},{"x":3,"y":1},{"x":4,"y":2},{"x":5,"y":3},{"x":6,"y":4},{"x":7,"y":5},{"x":8,"y":6}],"806":[{"x":0,"y":2},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":5},{"x":4,"y":6},{"x":5,"y":7},{"x":6,"y":8},{"x":8,"y":8}],"807":[{"x":0,"y":2},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":5},{"x":4,"y":6},{"x":5,"y":7},{"x":6,"y":8},{"x":8,"y":8}],"808":[{"x":0,"y":2},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":5},{"x":4,"y":6},{"x":5,"y":7},{"x":6,"y":8},{"x":8,"y":8}],"810":[{"x":0,"y":2},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":5},{"x":4,"y":6},{"x":5,"y":7},{"x":6,"y":8},{"x":8,"y":8}],"811":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"812":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"813":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":45,"y":2},{"x":46,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":53,"y":4},{"x":54,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"815":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":42,"y":2},{"x":43,"y":3},{"x":47,"y":3},{"x":48,"y":4},{"x":52,"y":4},{"x":53,"y":5},{"x":55,"y":5},{"x":56,"y":6},{"x":60,"y":6}],"816":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":13,"y":5},{"x":14,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"817":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":13,"y":5},{"x":14,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"818":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":6,"y":3},{"x":7,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":14,"y":5},{"x":15,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"820":[{"x":0,"y":2},{"x":4,"y":2},{"x":5,"y":3},{"x":7,"y":3},{"x":8,"y":4},{"x":12,"y":4},{"x":13,"y":5},{"x":17,"y":5},{"x":18,"y":6},{"x":34,"y":6},{"x":35,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"821":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"822":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"823":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":45,"y":2},{"x":46,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":53,"y":4},{"x":54,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"825":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":42,"y":2},{"x":43,"y":3},{"x":47,"y":3},{"x":48,"y":4},{"x":52,"y":4},{"x":53,"y":5},{"x":55,"y":5},{"x":56,"y":6},{"x":60,"y":6}],"826":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":13,"y":5},{"x":14,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"827":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":13,"y":5},{"x":14,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"828":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":6,"y":3},{"x":7,"y":4},{"x":8,"y":4},{"x":9,"y":5},{"x":14,"y":5},{"x":15,"y":6},{"x":19,"y":6},{"x":20,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"830":[{"x":0,"y":2},{"x":4,"y":2},{"x":5,"y":3},{"x":7,"y":3},{"x":8,"y":4},{"x":12,"y":4},{"x":13,"y":5},{"x":17,"y":5},{"x":18,"y":6},{"x":34,"y":6},{"x":35,"y":7},{"x":39,"y":7},{"x":40,"y":8},{"x":60,"y":8}],"831":[{"x":0,"y":0},{"x":4,"y":0},{"x":5,"y":1},{"x":6,"y":1},{"x":7,"y":2},{"x":8,"y":2},{"x":9,"y":3},{"x":10,"y":3},{"x":11,"y":4},{"x":12,"y":4},{"x":13,"y":5},{"x":14,"y":5},{"x":15,"y":6},{"x":16,"y":6}],"832":[{"x":0,"y":0},{"x":4,"y":0},{"x":5,"y":1},{"x":6,"y":1},{"x":7,"y":2},{"x":8,"y":2},{"x":9,"y":3},{"x":10,"y":3},{"x":11,"y":4},{"x":12,"y":4},{"x":13,"y":5},{"x":14,"y":5},{"x":15,"y":6},{"x":16,"y":6}],"833":[{"x":0,"y":0},{"x":4,"y":0},{"x":5,"y":1},{"x":6,"y":1},{"x":7,"y":2},{"x":8,"y":2},{"x":9,"y":3},{"x":10,"y":3},{"x":11,"y":4},{"x":12,"y":4},{"x":13,"y":5},{"x":14,"y":5},{"x":15,"y":6},{"x":16,"y":6}],"835":[{"x":0,"y":0},{"x":4,"y":0},{"x":5,"y":1},{"x":6,"y":1},{"x":7,"y":2},{"x":8,"y":2},{"x":9,"y":3},{"x":10,"y":3},{"x":11,"y":4},{"x":12,"y":4},{"x":13,"y":5},{"x":14,"y":5},{"x":15,"y":6},{"x":16,"y":6}],"836":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":5,"y":4},{"x":6,"y":5},{"x":7,"y":5},{"x":8,"y":6},{"x":9,"y":6},{"x":10,"y":7},{"x":11,"y":7},{"x":12,"y":8},{"x":16,"y":8}],"837":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":5,"y":4},{"x":6,"y":5},{"x":7,"y":5},{"x":8,"y":6},{"x":9,"y":6},{"x":10,"y":7},{"x":11,"y":7},{"x":12,"y":8},{"x":16,"y":8}],"838":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":5,"y":4},{"x":6,"y":5},{"x":7,"y":5},{"x":8,"y":6},{"x":9,"y":6},{"x":10,"y":7},{"x":11,"y":7},{"x":12,"y":8},{"x":16,"y":8}],"840":[{"x":0,"y":2},{"x":1,"y":2},{"x":2,"y":3},{"x":3,"y":3},{"x":4,"y":4},{"x":5,"y":4},{"x":6,"y":5},{"x":7,"y":5},{"x":8,"y":6},{"x":9,"y":6},{"x":10,"y":7},{"x":11,"y":7},{"x":12,"y":8},{"x":16,"y":8}],"841":[{"x":0,"y":0},{"x":60,"y":0}],"842":[{"x":0,"y":0},{"x":60,"y":0}],"843":[{"x":0,"y":0},{"x":60,"y":0}],"845":[{"x":0,"y":0},{"x":60,"y":0}],"846":[{"x":0,"y":2},{"x":60,"y":2}],"847":[{"x":0,"y":2},{"x":60,"y":2}],"848":[{"x":0,"y":2},{"x":18,"y":2},{"x":19,"y":1},{"x":20,"y":2},{"x":40,"y":2},{"x":41,"y":1},{"x":42,"y":2},{"x":60,"y":2}],"850":[{"x":0,"y":2},{"x":11,"y":2},{"x":12,"y":1},{"x":24,"y":1},{"x":25,"y":2},{"x":35,"y":2},{"x":36,"y":1},{"x":48,"y":1},{"x":49,"y":2},{"x":60,"y":2}],"851":[{"x":0,"y":0},{"x":16,"y":0}],"852":[{"x":0,"y":0},{"x":16,"y":0}],"853":[{"x":0,"y":0},{"x":16,"y":0}],"855":[{"x":0,"y":0},{"x":16,"y":0}],"856":[{"x":0,"y":2},{"x":16,"y":2}],"857":[{"x":0,"y":2},{"x":16,"y":2}],"858":[{"x":0,"y":2},{"x":16,"y":2}],"860":[{"x":0,"y":2},{"x":16,"y":2}],"861":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":2},{"x":40,"y":2},{"x":41,"y":4},{"x":46,"y":4},{"x":47,"y":6},{"x":51,"y":6},{"x":52,"y":8},{"x":56,"y":8},{"x":57,"y":10},{"x":58,"y":10},{"x":59,"y":12},{"x":60,"y":12}],"862":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":2},{"x":40,"y":2},{"x":41,"y":4},{"x":46,"y":4},{"x":47,"y":6},{"x":51,"y":6},{"x":52,"y":8},{"x":56,"y":8},{"x":57,"y":10},{"x":58,"y":10},{"x":59,"y":12},{"x":60,"y":12}],"863":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":2},{"x":40,"y":2},{"x":41,"y":4},{"x":45,"y":4},{"x":46,"y":6},{"x":51,"y":6},{"x":52,"y":8},{"x":53,"y":8},{"x":54,"y":10},{"x":58,"y":10},{"x":59,"y":12},{"x":60,"y":12}],"865":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":2},{"x":25,"y":2},{"x":26,"y":4},{"x":42,"y":4},{"x":43,"y":6},{"x":47,"y":6},{"x":48,"y":8},{"x":52,"y":8},{"x":53,"y":10},{"x":55,"y":10},{"x":56,"y":12},{"x":60,"y":12}],"866":[{"x":0,"y":4},{"x":1,"y":4},{"x":2,"y":6},{"x":3,"y":6},{"x":4,"y":8},{"x":8,"y":8},{"x":9,"y":10},{"x":13,"y":10},{"x":14,"y":12},{"x":19,"y":12},{"x":20,"y":14},{"x":39,"y":14},{"x":40,"y":16},{"x":60,"y":16}],"867":[{"x":0,"y":4},{"x":1,"y":4},{"x":2,"y":6},{"x":3,"y":6},{"x":4,"y":8},{"x":8,"y":8},{"x":9,"y":10},{"x":13,"y":10},{"x":14,"y":12},{"x":19,"y":12},{"x":20,"y":14},{"x":39,"y":14},{"x":40,"y":16},{"x":60,"y":16}],"868":[{"x":0,"y":4},{"x":1,"y":4},{"x":2,"y":6},{"x":6,"y":6},{"x":7,"y":8},{"x":8,"y":8},{"x":9,"y":10},{"x":14,"y":10},{"x":15,"y":12},{"x":19,"y":12},{"x":20,"y":14},{"x":39,"y":14},{"x":40,"y":16},{"x":60,"y":16}],"870":[{"x":0,"y":4},{"x":4,"y":4},{"x":5,"y":6},{"x":7,"y":6},{"x":8,"y":8},{"x":12,"y":8},{"x":13,"y":10},{"x":17,"y":10},{"x":18,"y":12},{"x":34,"y":12},{"x":35,"y":14},{"x":39,"y":14},{"x":40,"y":16},{"x":60,"y":16}],"871":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":45,"y":2},{"x":46,"y":3},{"x":47,"y":3},{"x":48,"y":4},{"x":49,"y":4},{"x":50,"y":6},{"x":55,"y":6},{"x":56,"y":7},{"x":60,"y":7}],"872":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":45,"y":2},{"x":46,"y":3},{"x":47,"y":3},{"x":48,"y":4},{"x":49,"y":4},{"x":50,"y":6},{"x":55,"y":6},{"x":56,"y":7},{"x":60,"y":7}],"873":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":40,"y":2},{"x":41,"y":3},{"x":45,"y":3},{"x":46,"y":4},{"x":47,"y":4},{"x":48,"y":6},{"x":55,"y":6},{"x":56,"y":7},{"x":60,"y":7}],"875":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":2},{"x":25,"y":2},{"x":26,"y":3},{"x":27,"y":3},{"x":28,"y":4},{"x":34,"y":4},{"x":35,"y":6},{"x":46,"y":6},{"x":47,"y":7},{"x":60,"y":7}],"876":[{"x":0,"y":8},{"x":60,"y":8}],"877":[{"x":0,"y":8},{"x":60,"y":8}],"878":[{"x":0,"y":8},{"x":60,"y":8}],"880":[{"x":0,"y":8},{"x":60,"y":8}],"881":[{"x":0,"y":0},{"x":8,"y":0},{"x":9,"y":1},{"x":10,"y":2},{"x":11,"y":2},{"x":12,"y":3},{"x":14,"y":3},{"x":15,"y":4},{"x":18,"y":4},{"x":19,"y":6},{"x":24,"y":6},{"x":25,"y":7},{"x":31,"y":7}],"882":[{"x":0,"y":0},{"x":8,"y":0},{"x":9,"y":1},{"x":10,"y":2},{"x":11,"y":2},{"x":12,"y":3},{"x":14,"y":3},{"x":15,"y":4},{"x":18,"y":4},{"x":19,"y":6},{"x":24,"y":6},{"x":25,"y":7},{"x":31,"y":7}],"883":[{"x":0,"y":0},{"x":8,"y":0},{"x":9,"y":1},{"x":10,"y":2},{"x":11,"y":3},{"x":13,"y":3},{"x":14,"y":4},{"x":17,"y":4},{"x":18,"y":6},{"x":24,"y":6},{"x":25,"y":7},{"x":31,"y":7}],"885":[{"x":0,"y":0},{"x":8,"y":0},{"x":9,"y":3},{"x":10,"y":3},{"x":11,"y":4},{"x":14,"y":4},{"x":15,"y":6},{"x":21,"y":6},{"x":22,"y":7},{"x":31,"y":7}],"886":[{"x":0,"y":8},{"x":31,"y":8}],"887":[{"x":0,"y":8},{"x":31,"y":8}],"888":[{"x":0,"y":8},{"x":31,"y":8}],"890":[{"x":0,"y":8},{"x":31,"y":8}],"891":[{"x":0,"y":0},{"x":60,"y":0}],"892":[{"x":0,"y":0},{"x":60,"y":0}],"893":[{"x":0,"y":0},{"x":60,"y":0}],"895":[{"x":0,"y":0},{"x":60,"y":0}],"896":[{"x":0,"y":8},{"x":40,"y":8},{"x":41,"y":7},{"x":45,"y":7},{"x":46,"y":6},{"x":51,"y":6},{"x":52,"y":5},{"x":53,"y":5},{"x":54,"y":4},{"x":55,"y":4},{"x":56,"y":2},{"x":60,"y":2}],"897":[{"x":0,"y":8},{"x":40,"y":8},{"x":41,"y":7},{"x":45,"y":7},{"x":46,"y":6},{"x":51,"y":6},{"x":52,"y":5},{"x":53,"y":5},{"x":54,"y":4},{"x":55,"y":4},{"x":56,"y":2},{"x":60,"y":2}],"898":[{"x":0,"y":8},{"x":40,"y":8},{"x":41,"y":7},{"x":45,"y":7},{"x":46,"y":6},{"x":51,"y":6},{"x":52,"y":5},{"x":53,"y":5},{"x":54,"y":4},{"x":55,"y":4},{"x":56,"y":2},{"x":60,"y":2}],"900":[{"x":0,"y":8},{"x":25,"y":8},{"x":26,"y":7},{"x":30,"y":7},{"x":31,"y":6},{"x":42,"y":6},{"x":43,"y":5},{"x":47,"y":5},{"x":48,"y":4},{"x":53,"y":4},{"x":54,"y":2},{"x":60,"y":2}],"901":[{"x":0,"y":0},{"x":31,"y":0}],"902":[{"x":0,"y":0},{"x":31,"y":0}],"903":[{"x":0,"y":0},{"x":31,"y":0}],"905":[{"x":0,"y":0},{"x":31,"y":0}],"906":[{"x":0,"y":8},{"x":15,"y":8},{"x":16,"y":7},{"x":17,"y":6},{"x":18,"y":6},{"x":19,"y":5},{"x":21,"y":5},{"x":22,"y":4},{"x":25,"y":4},{"x":26,"y":2},{"x":31,"y":2}],"907":[{"x":0,"y":8},{"x":15,"y":8},{"x":16,"y":7},{"x":17,"y":6},{"x":18,"y":6},{"x":19,"y":5},{"x":21,"y":5},{"x":22,"y":4},{"x":25,"y":4},{"x":26,"y":2},{"x":31,"y":2}],"908":[{"x":0,"y":8},{"x":15,"y":8},{"x":16,"y":7},{"x":17,"y":6},{"x":18,"y":6},{"x":19,"y":5},{"x":21,"y":5},{"x":22,"y":4},{"x":25,"y":4},{"x":26,"y":2},{"x":31,"y":2}],"910":[{"x":0,"y":8},{"x":12,"y":8},{"x":13,"y":7},{"x":14,"y":7},{"x":15,"y":6},{"x":16,"y":5},{"x":18,"y":5},{"x":19,"y":4},{"x":24,"y":4},{"x":25,"y":2},{"x":31,"y":2}],"911":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":40,"y":2},{"x":41,"y":3},{"x":45,"y":3},{"x":46,"y":6},{"x":47,"y":6},{"x":48,"y":9},{"x":51,"y":9},{"x":52,"y":12},{"x":53,"y":12},{"x":54,"y":16},{"x":56,"y":16},{"x":57,"y":19},{"x":58,"y":19},{"x":59,"y":23},{"x":60,"y":23}],"912":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":40,"y":2},{"x":41,"y":3},{"x":45,"y":3},{"x":46,"y":6},{"x":47,"y":6},{"x":48,"y":9},{"x":51,"y":9},{"x":52,"y":12},{"x":53,"y":12},{"x":54,"y":16},{"x":56,"y":16},{"x":57,"y":19},{"x":58,"y":19},{"x":59,"y":23},{"x":60,"y":23}],"913":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":40,"y":2},{"x":41,"y":5},{"x":42,"y":5},{"x":43,"y":6},{"x":45,"y":6},{"x":46,"y":7},{"x":47,"y":7},{"x":48,"y":10},{"x":50,"y":10},{"x":51,"y":11},{"x":52,"y":13},{"x":53,"y":13},{"x":54,"y":16},{"x":55,"y":16},{"x":56,"y":17},{"x":57,"y":19},{"x":58,"y":19},{"x":59,"y":23},{"x":60,"y":23}],"915":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":2},{"x":25,"y":2},{"x":26,"y":4},{"x":27,"y":5},{"x":28,"y":6},{"x":29,"y":6},{"x":30,"y":7},{"x":31,"y":7},{"x":32,"y":8},{"x":33,"y":8},{"x":34,"y":9},{"x":40,"y":9},{"x":41,"y":10},{"x":44,"y":10},{"x":45,"y":11},{"x":46,"y":12},{"x":47,"y":13},{"x":48,"y":14},{"x":49,"y":14},{"x":50,"y":15},{"x":51,"y":15},{"x":52,"y":16},{"x":53,"y":17},{"x":54,"y":18},{"x":55,"y":20},{"x":56,"y":20},{"x":57,"y":21},{"x":58,"y":21},{"x":59,"y":23},{"x":60,"y":23}],"916":[{"x":0,"y":8},{"x":1,"y":8},{"x":2,"y":12},{"x":3,"y":12},{"x":4,"y":15},{"x":6,"y":15},{"x":7,"y":19},{"x":8,"y":19},{"x":9,"y":22},{"x":12,"y":22},{"x":13,"y":25},{"x":14,"y":25},{"x":15,"y":28},{"x":19,"y":28},{"x":20,"y":29},{"x":34,"y":29},{"x":35,"y":30},{"x":39,"y":30},{"x":40,"y":31},{"x":60,"y":31}],"917":[{"x":0,"y":8},{"x":1,"y":8},{"x":2,"y":12},{"x":3,"y":12},{"x":4,"y":15},{"x":6,"y":15},{"x":7,"y":19},{"x":8,"y":19},{"x":9,"y":22},{"x":12,"y":22},{"x":13,"y":25},{"x":14,"y":25},{"x":15,"y":28},{"x":19,"y":28},{"x":20,"y":29},{"x":34,"y":29},{"x":35,"y":30},{"x":39,"y":30},{"x":40,"y":31},{"x":60,"y":31}],"918":[{"x":0,"y":8},{"x":1,"y":8},{"x":2,"y":12},{"x":3,"y":12},{"x":4,"y":14},{"x":5,"y":15},{"x":6,"y":15},{"x":7,"y":18},{"x":8,"y":18},{"x":9,"y":20},{"x":10,"y":21},{"x":12,"y":21},{"x":13,"y":24},{"x":14,"y":24},{"x":15,"y":25},{"x":17,"y":25},{"x":18,"y":26},{"x":19,"y":26},{"x":20,"y":29},{"x":34,"y":29},{"x":35,"y":30},{"x":39,"y":30},{"x":40,"y":31},{"x":60,"y":31}],"920":[{"x":0,"y":8},{"x":1,"y":8},{"x":2,"y":10},{"x":4,"y":10},{"x":5,"y":11},{"x":6,"y":13},{"x":7,"y":14},{"x":8,"y":15},{"x":9,"y":16},{"x":10,"y":16},{"x":11,"y":17},{"x":12,"y":17},{"x":13,"y":19},{"x":14,"y":19},{"x":15,"y":21},{"x":19,"y":21},{"x":20,"y":23},{"x":27,"y":23},{"x":28,"y":24},{"x":30,"y":24},{"x":31,"y":25},{"x":32,"y":25},{"x":33,"y":26},{"x":34,"y":27},{"x":35,"y":29},{"x":39,"y":29},{"x":40,"y":31},{"x":60,"y":31}],"921":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"922":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"923":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":45,"y":2},{"x":46,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":53,"y":4},{"x":54,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"925":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":42,"y":2},{"x":43,"y":3},{"x":47,"y":3},{"x":48,"y":4},{"x":52,"y":4},{"x":53,"y":5},{"x":55,"y":5},{"x":56,"y":6},{"x":60,"y":6}],"926":[{"x":0,"y":6},{"x":4,"y":6},{"x":5,"y":7},{"x":10,"y":7},{"x":11,"y":8},{"x":60,"y":8}],"927":[{"x":0,"y":6},{"x":4,"y":6},{"x":5,"y":7},{"x":10,"y":7},{"x":11,"y":8},{"x":60,"y":8}],"928":[{"x":0,"y":6},{"x":4,"y":6},{"x":5,"y":7},{"x":12,"y":7},{"x":13,"y":8},{"x":60,"y":8}],"930":[{"x":0,"y":6},{"x":7,"y":6},{"x":8,"y":7},{"x":25,"y":7},{"x":26,"y":8},{"x":60,"y":8}],"931":[{"x":0,"y":0},{"x":6,"y":0},{"x":7,"y":1},{"x":8,"y":2},{"x":9,"y":3},{"x":10,"y":4},{"x":11,"y":5},{"x":12,"y":6}],"932":[{"x":0,"y":0},{"x":6,"y":0},{"x":7,"y":1},{"x":8,"y":2},{"x":9,"y":3},{"x":10,"y":4},{"x":11,"y":5},{"x":12,"y":6}],"933":[{"x":0,"y":0},{"x":6,"y":0},{"x":7,"y":1},{"x":8,"y":2},{"x":9,"y":3},{"x":10,"y":4},{"x":11,"y":5},{"x":12,"y":6}],"935":[{"x":0,"y":0},{"x":6,"y":0},{"x":7,"y":1},{"x":8,"y":2},{"x":9,"y":3},{"x":10,"y":4},{"x":11,"y":5},{"x":12,"y":6}],"936":[{"x":0,"y":6},{"x":1,"y":7},{"x":2,"y":8},{"x":12,"y":8}],"937":[{"x":0,"y":6},{"x":1,"y":7},{"x":2,"y":8},{"x":12,"y":8}],"938":[{"x":0,"y":6},{"x":1,"y":7},{"x":2,"y":7},{"x":3,"y":8},{"x":12,"y":8}],"940":[{"x":0,"y":6},{"x":1,"y":6},{"x":2,"y":7},{"x":4,"y":7},{"x":5,"y":8},{"x":12,"y":8}],"941":[{"x":0,"y":0},{"x":35,"y":0},{"x":36,"y":1},{"x":55,"y":1},{"x":56,"y":2},{"x":60,"y":2}],"942":[{"x":0,"y":0},{"x":35,"y":0},{"x":36,"y":1},{"x":55,"y":1},{"x":56,"y":2},{"x":60,"y":2}],"943":[{"x":0,"y":0},{"x":33,"y":0},{"x":34,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":42,"y":1},{"x":55,"y":1},{"x":56,"y":2},{"x":60,"y":2}],"945":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":36,"y":1},{"x":37,"y":2},{"x":45,"y":2},{"x":46,"y":3},{"x":48,"y":3},{"x":49,"y":2},{"x":60,"y":2}],"946":[{"x":0,"y":6},{"x":4,"y":6},{"x":5,"y":7},{"x":10,"y":7},{"x":11,"y":8},{"x":60,"y":8}],"947":[{"x":0,"y":6},{"x":4,"y":6},{"x":5,"y":7},{"x":10,"y":7},{"x":11,"y":8},{"x":60,"y":8}],"948":[{"x":0,"y":6},{"x":4,"y":6},{"x":5,"y":7},{"x":24,"y":7},{"x":25,"y":8},{"x":40,"y":8},{"x":41,"y":7},{"x":44,"y":7},{"x":45,"y":8},{"x":60,"y":8}],"950":[{"x":0,"y":6},{"x":9,"y":6},{"x":10,"y":7},{"x":16,"y":7},{"x":17,"y":6},{"x":21,"y":6},{"x":22,"y":7},{"x":38,"y":7},{"x":39,"y":6},{"x":40,"y":7},{"x":41,"y":6},{"x":46,"y":6},{"x":47,"y":7},{"x":53,"y":7},{"x":54,"y":8},{"x":60,"y":8}],"951":[{"x":0,"y":0},{"x":10,"y":0},{"x":11,"y":1},{"x":12,"y":2}],"952":[{"x":0,"y":0},{"x":10,"y":0},{"x":11,"y":1},{"x":12,"y":2}],"953":[{"x":0,"y":0},{"x":9,"y":0},{"x":10,"y":1},{"x":11,"y":1},{"x":12,"y":2}],"955":[{"x":0,"y":0},{"x":7,"y":0},{"x":8,"y":1},{"x":10,"y":1},{"x":11,"y":2},{"x":12,"y":2}],"956":[{"x":0,"y":6},{"x":1,"y":7},{"x":2,"y":8},{"x":12,"y":8}],"957":[{"x":0,"y":6},{"x":1,"y":7},{"x":2,"y":8},{"x":12,"y":8}],"958":[{"x":0,"y":6},{"x":1,"y":7},{"x":2,"y":7},{"x":3,"y":8},{"x":12,"y":8}],"960":[{"x":0,"y":6},{"x":1,"y":6},{"x":2,"y":7},{"x":4,"y":7},{"x":5,"y":8},{"x":12,"y":8}],"961":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"962":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":46,"y":2},{"x":47,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":56,"y":4},{"x":57,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"963":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":40,"y":1},{"x":41,"y":2},{"x":45,"y":2},{"x":46,"y":3},{"x":51,"y":3},{"x":52,"y":4},{"x":53,"y":4},{"x":54,"y":5},{"x":58,"y":5},{"x":59,"y":6},{"x":60,"y":6}],"965":[{"x":0,"y":0},{"x":20,"y":0},{"x":21,"y":1},{"x":25,"y":1},{"x":26,"y":2},{"x":42,"y":2},{"x":43,"y":3},{"x":47,"y":3},{"x":48,"y":4},{"x":52,"y":4},{"x":53,"y":5},{"x":55,"y":5},{"x":56,"y":6},{"x":60,"y":6}],"966":[{"x":0,"y":6},{"x":1,"y":6},{"x":2,"y":7},{"x":3,"y":7},{"x":4,"y":8},{"x":8,"y":8},{"x":9,"y":9},{"x":13,"y":9},{"x":14,"y":10},{"x":19,"y":10},{"x":20,"y":11},{"x":39,"y":11},{"x":40,"y":12},{"x":60,"y":12}],"967":[{"x":0,"y":6},{"x":1,"y":6},{"x":2,"y":7},{"x":3,"y":7},{"x":4,"y":8},{"x":8,"y":8},{"x":9,"y":9},{"x":13,"y":9},{"x":14,"y":10},{"x":19,"y":10},{"x":20,"y":11},{"x":39,"y":11},{"x":40,"y":12},{"x":60,"y":12}],"968":[{"x":0,"y":6},{"x":1,"y":6},{"x":2,"y":7},{"x":6,"y":7},{"x":7,"y":8},{"x":8,"y":8},{"x":9,"y":9},{"x":14,"y":9},{"x":15,"y":10},{"x":19,"y":10},{"x":20,"y":11},{"x":39,"y":11},{"x":40,"y":12},{"x":60,"y":12}],"970":[{"x":0,"y":6},{"x":4,"y":6},{"x":5,"y":7},{"x":7,"y":7},{"x":8,"y":8},{"x":12,"y":8},{"x":13,"y":9},{"x":17,"y":9},{"x":18,"y":10},{"x":34,"y":10},{"x":35,"y":11},{"x":39,"y":11},{"x":40,"y":12},{"x":60,"y":12}],"971":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":4},{"x":60,"y":4}],"972":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":4},{"x":60,"y":4}],"973":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":4},{"x":60,"y":4}],"975":[{"x":0,"y":0},{"x":40,"y":0},{"x":41,"y":2},{"x":50,"y":2},{"x":51,"y":3},{"x":55,"y":3},{"x":56,"y":4},{"x":60,"y":4}],"976":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":14,"y":4},{"x":15,"y":5},{"x":60,"y":5}],"977":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":14,"y":4},{"x":15,"y":5},{"x":60,"y":5}],"978":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":14,"y":4},{"x":15,"y":5},{"x":60,"y":5}],"980":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":19,"y":4},{"x":20,"y":5},{"x":60,"y":5}],"981":[{"x":0,"y":0},{"x":3,"y":0},{"x":4,"y":2},{"x":5,"y":2},{"x":6,"y":4},{"x":7,"y":4}],"982":[{"x":0,"y":0},{"x":3,"y":0},{"x":4,"y":2},{"x":5,"y":2},{"x":6,"y":4},{"x":7,"y":4}],"983":[{"x":0,"y":0},{"x":3,"y":0},{"x":4,"y":2},{"x":5,"y":2},{"x":6,"y":4},{"x":7,"y":4}],"985":[{"x":0,"y":0},{"x":3,"y":0},{"x":4,"y":2},{"x":5,"y":2},{"x":6,"y":4},{"x":7,"y":4}],"986":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":4},{"x":4,"y":5},{"x":7,"y":5}],"987":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":4},{"x":4,"y":5},{"x":7,"y":5}],"988":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":4},{"x":4,"y":5},{"x":7,"y":5}],"990":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":4},{"x":4,"y":5},{"x":7,"y":5}],"991":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":1},{"x":55,"y":1},{"x":56,"y":2},{"x":60,"y":2}],"992":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":1},{"x":55,"y":1},{"x":56,"y":2},{"x":60,"y":2}],"993":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":1},{"x":55,"y":1},{"x":56,"y":2},{"x":60,"y":2}],"995":[{"x":0,"y":0},{"x":40,"y":0},{"x":41,"y":1},{"x":45,"y":1},{"x":46,"y":2},{"x":60,"y":2}],"996":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":19,"y":4},{"x":20,"y":5},{"x":30,"y":5},{"x":31,"y":4},{"x":49,"y":4},{"x":50,"y":5},{"x":60,"y":5}],"997":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":19,"y":4},{"x":20,"y":5},{"x":30,"y":5},{"x":31,"y":4},{"x":49,"y":4},{"x":50,"y":5},{"x":60,"y":5}],"998":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":19,"y":4},{"x":20,"y":5},{"x":30,"y":5},{"x":31,"y":4},{"x":49,"y":4},{"x":50,"y":5},{"x":60,"y":5}],"1000":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":30,"y":4},{"x":31,"y":3},{"x":34,"y":3},{"x":35,"y":4},{"x":49,"y":4},{"x":50,"y":5},{"x":60,"y":5}],"1001":[{"x":0,"y":0},{"x":3,"y":0},{"x":4,"y":1},{"x":5,"y":1},{"x":6,"y":2},{"x":7,"y":2}],"1002":[{"x":0,"y":0},{"x":3,"y":0},{"x":4,"y":1},{"x":5,"y":1},{"x":6,"y":2},{"x":7,"y":2}],"1003":[{"x":0,"y":0},{"x":3,"y":0},{"x":4,"y":1},{"x":5,"y":1},{"x":6,"y":2},{"x":7,"y":2}],"1005":[{"x":0,"y":0},{"x":3,"y":0},{"x":4,"y":1},{"x":5,"y":1},{"x":6,"y":2},{"x":7,"y":2}],"1006":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":4},{"x":4,"y":5},{"x":7,"y":5}],"1007":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":4},{"x":4,"y":5},{"x":7,"y":5}],"1008":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":4},{"x":4,"y":5},{"x":7,"y":5}],"1010":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":3,"y":4},{"x":4,"y":5},{"x":7,"y":5}],"1011":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":4},{"x":60,"y":4}],"1012":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":4},{"x":60,"y":4}],"1013":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":4},{"x":60,"y":4}],"1015":[{"x":0,"y":0},{"x":40,"y":0},{"x":41,"y":2},{"x":50,"y":2},{"x":51,"y":3},{"x":55,"y":3},{"x":56,"y":4},{"x":60,"y":4}],"1016":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":5},{"x":14,"y":5},{"x":15,"y":7},{"x":60,"y":7}],"1017":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":5},{"x":14,"y":5},{"x":15,"y":7},{"x":60,"y":7}],"1018":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":5},{"x":14,"y":5},{"x":15,"y":7},{"x":60,"y":7}],"1020":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":9,"y":4},{"x":10,"y":5},{"x":19,"y":5},{"x":20,"y":7},{"x":60,"y":7}],"1021":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":4},{"x":60,"y":4}],"1022":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":4},{"x":60,"y":4}],"1023":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":4},{"x":60,"y":4}],"1025":[{"x":0,"y":0},{"x":40,"y":0},{"x":41,"y":2},{"x":50,"y":2},{"x":51,"y":3},{"x":55,"y":3},{"x":56,"y":4},{"x":60,"y":4}],"1026":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":14,"y":4},{"x":15,"y":5},{"x":60,"y":5}],"1027":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":14,"y":4},{"x":15,"y":5},{"x":60,"y":5}],"1028":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":14,"y":4},{"x":15,"y":5},{"x":60,"y":5}],"1030":[{"x":0,"y":3},{"x":4,"y":3},{"x":5,"y":4},{"x":19,"y":4},{"x":20,"y":5},{"x":60,"y":5}],"1031":[{"x":0,"y":0},{"x":9,"y":0},{"x":10,"y":2},{"x":17,"y":2},{"x":18,"y":4},{"x":19,"y":4}],"1032":[{"x":0,"y":0},{"x":9,"y":0},{"x":10,"y":2},{"x":17,"y":2},{"x":18,"y":4},{"x":19,"y":4}],"1033":[{"x":0,"y":0},{"x":9,"y":0},{"x":10,"y":2},{"x":17,"y":2},{"x":18,"y":4},{"x":19,"y":4}],"1035":[{"x":0,"y":0},{"x":9,"y":0},{"x":10,"y":2},{"x":17,"y":2},{"x":18,"y":4},{"x":19,"y":4}],"1036":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":9,"y":4},{"x":10,"y":5},{"x":19,"y":5}],"1037":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":9,"y":4},{"x":10,"y":5},{"x":19,"y":5}],"1038":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":9,"y":4},{"x":10,"y":5},{"x":19,"y":5}],"1040":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":9,"y":4},{"x":10,"y":5},{"x":19,"y":5}],"1041":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":1},{"x":55,"y":1},{"x":56,"y":2},{"x":60,"y":2}],"1042":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":1},{"x":55,"y":1},{"x":56,"y":2},{"x":60,"y":2}],"1043":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":1},{"x":55,"y":1},{"x":56,"y":2},{"x":60,"y":2}],"1045":[{"x":0,"y":0},{"x":40,"y":0},{"x":41,"y":1},{"x":50,"y":1},{"x":51,"y":2},{"x":60,"y":2}],"1046":[{"x":0,"y":3},{"x":14,"y":3},{"x":15,"y":4},{"x":30,"y":4},{"x":31,"y":3},{"x":44,"y":3},{"x":45,"y":4},{"x":60,"y":4}],"1047":[{"x":0,"y":3},{"x":14,"y":3},{"x":15,"y":4},{"x":30,"y":4},{"x":31,"y":3},{"x":44,"y":3},{"x":45,"y":4},{"x":60,"y":4}],"1048":[{"x":0,"y":3},{"x":14,"y":3},{"x":15,"y":4},{"x":30,"y":4},{"x":31,"y":3},{"x":44,"y":3},{"x":45,"y":4},{"x":60,"y":4}],"1050":[{"x":0,"y":3},{"x":14,"y":3},{"x":15,"y":4},{"x":30,"y":4},{"x":31,"y":3},{"x":44,"y":3},{"x":45,"y":4},{"x":60,"y":4}],"1051":[{"x":0,"y":0},{"x":9,"y":0},{"x":10,"y":1},{"x":17,"y":1},{"x":18,"y":2},{"x":19,"y":2}],"1052":[{"x":0,"y":0},{"x":9,"y":0},{"x":10,"y":1},{"x":17,"y":1},{"x":18,"y":2},{"x":19,"y":2}],"1053":[{"x":0,"y":0},{"x":9,"y":0},{"x":10,"y":1},{"x":17,"y":1},{"x":18,"y":2},{"x":19,"y":2}],"1055":[{"x":0,"y":0},{"x":9,"y":0},{"x":10,"y":1},{"x":17,"y":1},{"x":18,"y":2},{"x":19,"y":2}],"1056":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":19,"y":4}],"1057":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":19,"y":4}],"1058":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":19,"y":4}],"1060":[{"x":0,"y":3},{"x":1,"y":3},{"x":2,"y":4},{"x":19,"y":4}],"1061":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":10},{"x":60,"y":10}],"1062":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":10},{"x":60,"y":10}],"1063":[{"x":0,"y":0},{"x":45,"y":0},{"x":46,"y":2},{"x":55,"y":2},{"x":56,"y":10},{"x":60,"y":10}],"1065":[{"x":0,"y":0},{"x":40,"y":0},{"x":41,"y":2},{"x":50,"y":2},{"x":51,"y":9},{"x":55,"y":9},{"x":56,"y":10},{"x":60,"y":10}],"1066":[{"x":0,"y":9},{"x":4,"y":9},{"x":5,"y":17},{"x":14,"y":17},{"x":15,"y":19},{"x":60,"y":19}],"1067":[{"x":0,"y":9},{"x":4,"y":9},{"x":5,"y":17},{"x":14,"y":17},{"x":15,"y":19},{"x":60,"y":19}],"1068":[{"x":0,"y":9},{"x":4,"y":9},{"x":5,"y":17},{"x":14,"y":17},{"x":15,"y":19},{"x":60,"y":19}],"1070":[{"x":0,"y":9},{"x":4,"y":9},{"x":5,"y":10},{"x":9,"y":10},{"x":10,"y":17},{"x":19,"y":17},{"x":20,"y":19},{"x":60,"y":19}],"1071":[{"x":0,"y":0},{"x":1,"y":0}],"1072":[{"x":0,"y":0},{"x":1,"y":0}],"1073":[{"x":0,"y":0},{"x":1,"y":0}],"1075":[{"x":0,"y":0},{"x":1,"y":0}],"1076":[{"x":0,"y":1},{"x":1,"y":1}],"1077":[{"x":0,"y":1},{"x":1,"y":1}],"1078":[{"x":0,"y":1},{"x":1,"y":1}],"1080":[{"x":0,"y":1},{"x":1,"y":1}],"1081":[{"x":0,"y":0},{"x":2,"y":0}],"1082":[{"x":0,"y":0},{"x":2,"y":0}],"1083":[{"x":0,"y":0},{"x":2,"y":0}],"1085":[{"x":0,"y":0},{"x":2,"y":0}],"1086":[{"x":0,"y":1},{"x":2,"y":1}],"1087":[{"x":0,"y":1},{"x":2,"y":1}],"1088":[{"x":0,"y":1},{"x":2,"y":1}],"1090":[{"x":0,"y":1},{"x":2,"y":1}],"1091":[{"x":0,"y":0},{"x":1,"y":0}],"1092":[{"x":0,"y":0},{"x":1,"y":0}],"1093":[{"x":0,"y":0},{"x":1,"y":0}],"1095":[{"x":0,"y":0},{"x":1,"y":0}],"1096":[{"x":0,"y":1},{"x":1,"y":1}],"1097":[{"x":0,"y":1},{"x":1,"y":1}],"1098":[{"x":0,"y":1},{"x":1,"y":1}],"1100":[{"x":0,"y":1},{"x":1,"y":1}],"1101":[{"x":0,"y":0},{"x":2,"y":0}],"1102":[{"x":0,"y":0},{"x":2,"y":0}],"1103":[{"x":0,"y":0},{"x":2,"y":0}],"1105":[{"x":0,"y":0},{"x":2,"y":0}],"1106":[{"x":0,"y":1},{"x":2,"y":1}],"1107":[{"x":0,"y":1},{"x":2,"y":1}],"1108":[{"x":0,"y":1},{"x":2,"y":1}],"1110":[{"x":0,"y":1},{"x":2,"y":1}],"1111":[{"x":0,"y":0},{"x":1,"y":0}],"1112":[{"x":0,"y":0},{"x":1,"y":0}],"1113":[{"x":0,"y":0},{"x":1,"y":0}],"1115":[{"x":0,"y":0},{"x":1,"y":0}],"1116":[{"x":0,"y":2},{"x":1,"y":2}],"1117":[{"x":0,"y":2},{"x":1,"y":2}],"1118":[{"x":0,"y":2},{"x":1,"y":2}],"1120":[{"x":0,"y":2},{"x":1,"y":2}]}})
\ No newline at end of file
@@ -21,7 +21,8 @@ var config = {
     bar_width: 50,
     sbar_width: 25,
     max_aspect: 1.75,
-    min_aspect: 1.0
+    min_aspect: 1.0,
+    context_cache_rows: 100000
 };
 
 //// Auxiliary functions
@@ -86,6 +87,13 @@ var get2obj = function(a, k1, k2) {
     return get0obj(get2(a, k1, k2));
 };
 
+var set2 = function(a, k1, k2, v) {
+    if (!a[k1]) {
+        a[k1] = {};
+    }
+    a[k1][k2] = v;
+};
+
 var set3 = function(a, k1, k2, k3, v) {
     if (!a[k1]) {
         a[k1] = {};
@@ -112,6 +120,42 @@ var push1 = function(a, k, v) {
     }
 };
 
+var merge = function(a, b) {
+    for (var k in b) {
+        if (a[k] && typeof a[k] === "object" && !Array.isArray(a[k])) {
+            merge(a[k], b[k]);
+        } else {
+            a[k] = b[k];
+        }
+    }
+};
+
+// "types-web --compact" writes the points of a curve as a base64
+// string of 32-bit little-endian integers: the differences between
+// consecutive x values, followed by the differences between
+// consecutive y values. The coordinates are unsigned 32-bit values,
+// and the differences wrap around modulo 2^32.
+
+var decode_curve = function(s) {
+    var bytes = atob(s);
+    var view = new DataView(new ArrayBuffer(bytes.length));
+    for (var i = 0; i < bytes.length; ++i) {
+        view.setUint8(i, bytes.charCodeAt(i));
+    }
+    var n = bytes.length / 8;
+    var x = new Uint32Array(n);
+    var y = new Uint32Array(n);
+    var px = 0;
+    var py = 0;
+    for (var j = 0; j < n; ++j) {
+        px = (px + view.getUint32(4 * j, true)) >>> 0;
+        py = (py + view.getUint32(4 * (n + j), true)) >>> 0;
+        x[j] = px;
+        y[j] = py;
+    }
+    return {x: x, y: y};
+};
+
 var sort_numbers = function(a) {
     a.sort(function(a, b) { return a-b; });
 };
@@ -1254,7 +1298,7 @@ View.prototype.set_info = function(model) {
         textmaker(this.info.append("p"), t);
     }
 
-    if (dataset) {
+    if (dataset && dataset.tokencount) {
         t = [];
         t.push("The dataset ");
         t.push(["strong", model.sel.datasetcode]);
@@ -1549,6 +1593,7 @@ Controller.prototype.recalc_sel = function(x, force, home) {
         this.set_sel_raw(old, x);
     }
     model.fix_sel();
+    this.request_data();
     var changes = this.find_changed(old);
     changes.force = force;
     if (!changes.force && !changes.count) {
@@ -1568,6 +1613,31 @@ Controller.prototype.data = function(data) {
     this.recalc_sel(this.parse_hash(), true);
 };
 
+Controller.prototype.request_data = function() {
+    var model = this.model;
+    var sel = model.sel;
+    model.db.request(sel.corpuscode, sel.datasetcode);
+    model.db.request_context(sel.corpuscode, sel.datasetcode, model.get_context_samples());
+};
+
+Controller.prototype.shard = function(corpuscode, datasetcode, data) {
+    this.model.db.add_shard(corpuscode, datasetcode, data);
+    if (this.model.all_set({ corpuscode: corpuscode, datasetcode: datasetcode })) {
+        this.request_data();
+        this.update_sel({ invalid: {
+            curves: true, selection: true,
+            sample_table: true, token_table: true, sample_context: true, token_context: true
+        }});
+    }
+};
+
+Controller.prototype.context = function(corpuscode, datasetcode, samplecode, data) {
+    this.model.db.add_context(corpuscode, datasetcode, samplecode, data);
+    if (this.model.all_set({ corpuscode: corpuscode, datasetcode: datasetcode })) {
+        this.update_sel({ invalid: { sample_context: true, token_context: true }});
+    }
+};
+
 Controller.prototype.ev_point_click = function(d) {
     if (this.model.all_set(d)) {
         this.recalc_sel({ collectioncode: null });
@@ -1666,8 +1736,31 @@ Controller.prototype.ev_hashchange = function() {
 
 //// Model: Database
 
+// With "types-web --split", these tables are missing from the main
+// data file; data.shard tells which file contains the rows of each
+// data set, and the file is loaded when the data set is selected.
+// The contexts of each sample are in separate files, listed in
+// data.context_shard; they are loaded when the user looks at the
+// sample or at a type that occurs in it, and at most
+// config.context_cache_rows contexts are kept in memory.
+
+var shard_tables = ['token', 'tokeninfo', 'context', 'context_shard', 'result_curve_point'];
+
 var Database = function(data) {
     this.data = data;
+    this.loaded = {};
+    this.loading = {};
+    this.context_state = {};
+    this.context_keys = {};
+    this.context_rows = {};
+    this.context_total = 0;
+    this.context_lru = [];
+    this.context_pinned = {};
+    for (var i = 0; i < shard_tables.length; ++i) {
+        if (!data[shard_tables[i]]) {
+            data[shard_tables[i]] = {};
+        }
+    }
     this.setup_group_maps();
     this.setup_corpuscodes();
     this.setup_datasetcodes();
@@ -1676,7 +1769,79 @@ var Database = function(data) {
     this.setup_samples();
     this.setup_collections();
     this.setup_tokens();
-    this.setup_context();
+};
+
+Database.prototype.is_loaded = function(corpuscode, datasetcode) {
+    return !this.data.shard || get2(this.loaded, corpuscode, datasetcode) === true;
+};
+
+Database.prototype.request = function(corpuscode, datasetcode) {
+    var fn = get2(this.data.shard, corpuscode, datasetcode);
+    if (!fn || get2(this.loading, corpuscode, datasetcode)) {
+        return;
+    }
+    set2(this.loading, corpuscode, datasetcode, true);
+    d3.select("body").append("script").attr("src", fn);
+};
+
+Database.prototype.request_context = function(corpuscode, datasetcode, samplecodes) {
+    this.context_pinned = {};
+    for (var i = 0; i < samplecodes.length; ++i) {
+        var fn = get3(this.data.context_shard, corpuscode, datasetcode, samplecodes[i]);
+        if (!fn) {
+            continue;
+        }
+        this.context_pinned[fn] = true;
+        var j = this.context_lru.indexOf(fn);
+        if (j >= 0) {
+            this.context_lru.splice(j, 1);
+        }
+        this.context_lru.push(fn);
+        if (!this.context_state[fn]) {
+            this.context_state[fn] = true;
+            d3.select("body").append("script").attr("src", fn);
+        }
+    }
+};
+
+Database.prototype.add_context = function(corpuscode, datasetcode, samplecode, data) {
+    var fn = get3(this.data.context_shard, corpuscode, datasetcode, samplecode);
+    var rows = 0;
+    for (var tokencode in data) {
+        rows += data[tokencode].length;
+    }
+    set3(this.data.context, corpuscode, datasetcode, samplecode, data);
+    this.context_keys[fn] = [corpuscode, datasetcode, samplecode];
+    this.context_rows[fn] = rows;
+    this.context_total += rows;
+    this.setup_context_sample(corpuscode, datasetcode, samplecode);
+    this.evict_context();
+};
+
+Database.prototype.evict_context = function() {
+    var i = 0;
+    while (this.context_total > config.context_cache_rows && i < this.context_lru.length) {
+        var fn = this.context_lru[i];
+        if (this.context_pinned[fn] || !(fn in this.context_rows)) {
+            ++i;
+            continue;
+        }
+        var k = this.context_keys[fn];
+        delete this.data.context[k[0]][k[1]][k[2]];
+        this.context_total -= this.context_rows[fn];
+        delete this.context_rows[fn];
+        delete this.context_state[fn];
+        this.context_lru.splice(i, 1);
+    }
+};
+
+Database.prototype.add_shard = function(corpuscode, datasetcode, shard) {
+    for (var i = 0; i < shard_tables.length; ++i) {
+        var table = shard_tables[i];
+        merge(this.data[table], get1obj(shard, table));
+    }
+    set2(this.loaded, corpuscode, datasetcode, true);
+    this.setup_dataset(corpuscode, datasetcode);
 };
 
 Database.prototype.setup_group_maps = function() {
@@ -1901,7 +2066,7 @@ Database.prototype.setup_tokens_collection1 = function(corpuscode, datasetcode)
         var xs = {};
         dataset.collection_tokencount[collectioncode] = xt;
         dataset.collection_samplecount[collectioncode] = xs;
-        var sc = this.data.sample_collection[corpuscode][collectioncode];
+        var sc = get2(this.data.sample_collection, corpuscode, collectioncode);
         if (sc) {
             for (var i = 0; i < sc.length; ++i) {
                 var samplecode = sc[i];
@@ -1932,54 +2097,59 @@ Database.prototype.setup_tokens_dataset1 = function(corpuscode, datasetcode) {
 
 Database.prototype.setup_tokens = function() {
     this.sample_data = {};
-    for (var corpuscode in this.data.token) {
+    for (var corpuscode in this.data.dataset) {
         for (var datasetcode in this.data.dataset[corpuscode]) {
-            this.setup_tokens_sample1(corpuscode, datasetcode);
-            this.setup_tokens_sample2(corpuscode, datasetcode);
-            this.setup_tokens_collection1(corpuscode, datasetcode);
-            this.setup_tokens_dataset1(corpuscode, datasetcode);
+            if (this.is_loaded(corpuscode, datasetcode)) {
+                this.setup_dataset(corpuscode, datasetcode);
+            }
         }
     }
 };
 
-Database.prototype.setup_context = function() {
-    for (var corpuscode in this.data.context) {
-        var t1 = this.data.context[corpuscode];
-        for (var datasetcode in t1) {
-            var t2 = t1[datasetcode];
-            for (var samplecode in t2) {
-                var t3 = t2[samplecode];
-                for (var tokencode in t3) {
-                    var t4 = t3[tokencode];
-                    var tokeninfo = get3(this.data.tokeninfo, corpuscode, datasetcode, tokencode);
-                    for (var i = 0; i < t4.length; ++i) {
-                        var context = t4[i];
-                        context.corpuscode = corpuscode;
-                        context.datasetcode = datasetcode;
-                        context.samplecode = samplecode;
-                        context.tokencode = tokencode;
-                        context.fallbackkey = corpuscode + " " + datasetcode + " " + samplecode + " " + tokencode;
-                        context.shortlabel = tokencode;
-                        context.longlabel = tokencode;
-                        if (tokeninfo && tokeninfo.shortlabel) {
-                            context.shortlabel = tokeninfo.shortlabel;
-                        }
-                        if (tokeninfo && tokeninfo.longlabel) {
-                            context.longlabel = tokeninfo.longlabel;
-                        }
-                        if (context.before) {
-                            var words = context.before.split(/\s+/);
-                            words.reverse();
-                            context.before_sort = words.join(" ").trim().toLowerCase();
-                        }
-                        if (context.after) {
-                            context.after_sort = context.after.trim().toLowerCase();
-                        }
-                        if (context.word) {
-                            context.word_sort = context.word.trim().toLowerCase();
-                        }
-                    }
-                }
+Database.prototype.setup_dataset = function(corpuscode, datasetcode) {
+    this.setup_tokens_sample1(corpuscode, datasetcode);
+    this.setup_tokens_sample2(corpuscode, datasetcode);
+    this.setup_tokens_collection1(corpuscode, datasetcode);
+    this.setup_tokens_dataset1(corpuscode, datasetcode);
+    this.setup_context(corpuscode, datasetcode);
+};
+
+Database.prototype.setup_context = function(corpuscode, datasetcode) {
+    for (var samplecode in get2(this.data.context, corpuscode, datasetcode)) {
+        this.setup_context_sample(corpuscode, datasetcode, samplecode);
+    }
+};
+
+Database.prototype.setup_context_sample = function(corpuscode, datasetcode, samplecode) {
+    var t3 = get3(this.data.context, corpuscode, datasetcode, samplecode);
+    for (var tokencode in t3) {
+        var t4 = t3[tokencode];
+        var tokeninfo = get3(this.data.tokeninfo, corpuscode, datasetcode, tokencode);
+        for (var i = 0; i < t4.length; ++i) {
+            var context = t4[i];
+            context.corpuscode = corpuscode;
+            context.datasetcode = datasetcode;
+            context.samplecode = samplecode;
+            context.tokencode = tokencode;
+            context.fallbackkey = corpuscode + " " + datasetcode + " " + samplecode + " " + tokencode;
+            context.shortlabel = tokencode;
+            context.longlabel = tokencode;
+            if (tokeninfo && tokeninfo.shortlabel) {
+                context.shortlabel = tokeninfo.shortlabel;
+            }
+            if (tokeninfo && tokeninfo.longlabel) {
+                context.longlabel = tokeninfo.longlabel;
+            }
+            if (context.before) {
+                var words = context.before.split(/\s+/);
+                words.reverse();
+                context.before_sort = words.join(" ").trim().toLowerCase();
+            }
+            if (context.after) {
+                context.after_sort = context.after.trim().toLowerCase();
+            }
+            if (context.word) {
+                context.word_sort = context.word.trim().toLowerCase();
             }
         }
     }
@@ -1992,7 +2162,7 @@ Database.prototype.get_curves = function(sel) {
         data: []
     };
     var input = get3(this.data.result_curve, sel.corpuscode, sel.datasetcode, sel.statcode);
-    if (!input) {
+    if (!input || !this.is_loaded(sel.corpuscode, sel.datasetcode)) {
         return curves;
     }
     var levels = [];
@@ -2006,11 +2176,25 @@ Database.prototype.get_curves = function(sel) {
     return curves;
 };
 
+Database.prototype.get_curve_points = function(curveid) {
+    var points = this.data.result_curve_point[curveid];
+    if (typeof points === "string") {
+        points = decode_curve(points);
+    } else if (Array.isArray(points)) {
+        points = {
+            x: points.map(function(p) { return p.x; }),
+            y: points.map(function(p) { return p.y; })
+        };
+    }
+    this.data.result_curve_point[curveid] = points;
+    return points;
+};
+
 Database.prototype.get_one_curve = function(curves, input, level) {
     var curve_lower = input[level].lower.id;
     var curve_upper = input[level].upper.id;
-    var data_lower = this.data.result_curve_point[curve_lower];
-    var data_upper = this.data.result_curve_point[curve_upper];
+    var data_lower = this.get_curve_points(curve_lower);
+    var data_upper = this.get_curve_points(curve_upper);
     var i = 0;
     var j = 0;
     var x = 0;
@@ -2018,25 +2202,25 @@ Database.prototype.get_one_curve = function(curves, input, level) {
     var y1 = 0;
     var maxy = 0;
     var data = [];
-    while (i < data_lower.length || j < data_upper.length) {
+    while (i < data_lower.x.length || j < data_upper.x.length) {
         var igood = false;
         var jgood = false;
-        if (i === data_lower.length) {
+        if (i === data_lower.x.length) {
             jgood = true;
-        } else if (i === data_lower.length) {
+        } else if (j === data_upper.x.length) {
             igood = true;
         } else {
-            igood = (data_lower[i].x <= data_upper[j].x);
-            jgood = (data_lower[i].x >= data_upper[j].x);
+            igood = (data_lower.x[i] <= data_upper.x[j]);
+            jgood = (data_lower.x[i] >= data_upper.x[j]);
         }
         if (igood) {
-            x = data_lower[i].x;
-            y0 = data_lower[i].y;
+            x = data_lower.x[i];
+            y0 = data_lower.y[i];
             ++i;
         }
         if (jgood) {
-            x = data_upper[j].x;
-            y1 = data_upper[j].y;
+            x = data_upper.x[j];
+            y1 = data_upper.y[j];
             ++j;
         }
         data.push({x: x, y0: y0, y1: y1});
@@ -2223,8 +2407,8 @@ Model.prototype.get_dataset = function() {
 
 Model.prototype.get_samples = function() {
     var sel = this.sel;
-    if (sel.corpuscode && sel.datasetcode) {
-        var m = this.db.sample_data[sel.corpuscode][sel.datasetcode];
+    var m = get2(this.db.sample_data, sel.corpuscode, sel.datasetcode);
+    if (m) {
         var l;
         if (sel.collectioncode) {
             l = this.db.data.sample_collection[sel.corpuscode][sel.collectioncode];
@@ -2243,7 +2427,7 @@ Model.prototype.get_tokens = function() {
     var sel = this.sel;
     var r = [];
     var dataset = get2(this.db.data.dataset, sel.corpuscode, sel.datasetcode);
-    if (!dataset) {
+    if (!dataset || !dataset.tokencount) {
         return r;
     }
     var c_tokencount = get1(dataset.collection_tokencount, sel.collectioncode);
@@ -2299,6 +2483,22 @@ Model.prototype.get_token_context = function() {
     return r;
 };
 
+Model.prototype.get_context_samples = function() {
+    var sel = this.sel;
+    var r = [];
+    if (sel.pagecode === 'samples' && sel.samplecode) {
+        r.push(sel.samplecode);
+    } else if (sel.pagecode === 'types' && sel.tokencode) {
+        var t = get2(this.db.data.token, sel.corpuscode, sel.datasetcode);
+        for (var samplecode in t) {
+            if (get2(t, samplecode, sel.tokencode)) {
+                r.push(samplecode);
+            }
+        }
+    }
+    return r;
+};
+
 Model.prototype.get_sample_context = function() {
     var sel = this.sel;
     if (!sel.samplecode) {